@@ -0,0 +1,254 @@
+"""Python API of the compiler: compile a program once, call its functions many times.
+
+``main`` is a command-line tool: it logs, and exits on errors. The API runs
+the same stages without side effects, raises on errors, and keeps the
+compiled program loaded in its JIT engine::
+
+    program = compile_source(src)
+    program["gcd"](12, 18)     # any exported function, through ctypes
+    program.run()              # runs main
+
+A function is exported when it returns an ``int``, ``real`` or ``bool``
+and all its parameters are ``int``, ``real`` or ``bool``: its machine code
+is called directly through a ctypes function pointer, so a numeric kernel
+costs one foreign call per invocation.
+
+Compiled with ``batch=True``, a program also applies its exported functions
+element-wise to whole arrays in one call::
+
+    program.map("apply_interest", capitals, rates, out=results)
+
+The arrays are any C-contiguous buffer-protocol objects (NumPy arrays,
+``array.array``, ...) and are used in place, without copies.
+"""
+import array
+import ctypes
+import sys
+from dataclasses import dataclass
+from typing import Dict, List
+
+from . import main as grammo
+from .semantic import ast_nodes as ast
+from .semantic.semantic_analyzer import SemanticAnalyzer
+from .semantic.ast_optimizer import ASTOptimizer
+from .semantic.effects import EffectAnalyzer
+from .codegen.code_generator import CodeGenerator, symbol_name
+from .codegen.batch import batch_name
+from .codegen.optimizer import GrammoOptimizer
+from .codegen.execution import JITExecutor
+from .codegen.target import TargetSpec
+
+# ctypes types of the Grammo scalar types
+CTYPES = {
+    'int': ctypes.c_int32,
+    'real': ctypes.c_double,
+    'bool': ctypes.c_bool,
+}
+
+# Buffer formats accepted for the array elements of each type (struct
+# syntax, native byte order), and the array.array type codes of the results
+ELEMENT_FORMATS = {
+    'int': ('i', 'l'),
+    'real': ('d',),
+    'bool': ('?', 'B', 'b'),
+}
+RESULT_TYPECODES = {'int': 'i', 'real': 'd', 'bool': 'B'}
+ELEMENT_SIZES = {'int': 4, 'real': 8, 'bool': 1}
+
+@dataclass
+class Signature:
+    """The signature of an exported function.
+
+    Attributes:
+        params: Types of the parameters.
+        return_type: Type of the result.
+    """
+    params: List[str]
+    return_type: str
+
+class CompiledProgram:
+    """A compiled program, loaded in its JIT engine.
+
+    The exported functions are indexed by name (``program["gcd"]``), like
+    ``functions``, so that a Grammo function named ``run`` or ``map`` is
+    never hidden by a method; they stay valid as long as the program is alive.
+
+    Attributes:
+        functions: The exported functions, as ctypes function pointers, by name.
+        batches: Their batch wrappers (see ``map``), if compiled with ``batch``.
+        signatures: The signature of each exported function, by name.
+        ir: The optimized LLVM IR.
+    """
+
+    def __init__(self, engine, signatures: Dict[str, Signature], ir: str, batch=False):
+        self._engine = engine
+        self.signatures = signatures
+        self.ir = ir
+        self.functions = {}
+        self.batches = {}
+        for name, sig in signatures.items():
+            c_type = ctypes.CFUNCTYPE(CTYPES[sig.return_type], *(CTYPES[p] for p in sig.params))
+            self.functions[name] = c_type(engine.get_function_address(symbol_name(name)))
+            if batch:
+                c_type = ctypes.CFUNCTYPE(None, *[ctypes.c_void_p] * (len(sig.params) + 1), ctypes.c_int64)
+                self.batches[name] = c_type(engine.get_function_address(batch_name(symbol_name(name))))
+        self._main = ctypes.CFUNCTYPE(None)(engine.get_function_address("main"))
+
+    def __getitem__(self, name):
+        try:
+            return self.functions[name]
+        except KeyError:
+            raise KeyError(f"'{name}' is not an exported function of the program") from None
+
+    def __contains__(self, name):
+        return name in self.functions
+
+    def run(self):
+        """Runs ``main``.
+
+        Globals keep their values from the previous calls: the program is
+        not reloaded.
+        """
+        self._main()
+
+    def map(self, name, *inputs, out=None):
+        """Applies an exported function element-wise to arrays, in one call.
+
+        Args:
+            name (str): The exported function.
+            *inputs: One array per parameter: C-contiguous buffers of int32
+                (``int``), float64 (``real``) or bool/uint8 (``bool``), all of
+                the same length.
+            out: A writable buffer for the results, of the same length
+                (default: a new ``array.array``).
+
+        Returns:
+            The array of the results: ``out``, if given.
+
+        Raises:
+            KeyError: If the function has no batch wrapper.
+            TypeError: If an array has the wrong element type.
+            ValueError: If the number of arrays or their lengths do not match.
+        """
+        wrapper = self.batches[name]
+        sig = self.signatures[name]
+        if len(inputs) != len(sig.params):
+            raise ValueError(f"{name} takes {len(sig.params)} arrays, got {len(inputs)}")
+        buffers = []
+        try:
+            for i, (obj, type_name) in enumerate(zip(inputs, sig.params)):
+                buffers.append(_Buffer(obj, type_name, f"argument {i + 1}"))
+            if out is None:
+                if not buffers:
+                    raise ValueError(f"{name} takes no arguments: the length comes from out")
+                size = ELEMENT_SIZES[sig.return_type] * buffers[0].length
+                out = array.array(RESULT_TYPECODES[sig.return_type], bytes(size))
+            buffers.append(_Buffer(out, sig.return_type, "out", writable=True))
+            length = buffers[0].length
+            if any(b.length != length for b in buffers):
+                raise ValueError(f"The arrays passed to {name} have different lengths")
+            wrapper(*(b.address for b in buffers), length)
+        finally:
+            for b in buffers:
+                b.release()
+        return out
+
+class _PyBuffer(ctypes.Structure):
+    """The C ``Py_buffer`` struct."""
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.c_void_p),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.c_void_p),
+        ("strides", ctypes.c_void_p),
+        ("suboffsets", ctypes.c_void_p),
+        ("internal", ctypes.c_void_p),
+    ]
+
+_PyBUF_WRITABLE = 0x0001
+_PyBUF_FORMAT = 0x0004
+_PyBUF_C_CONTIGUOUS = 0x0038
+
+_get_buffer = ctypes.PYFUNCTYPE(ctypes.c_int, ctypes.py_object, ctypes.POINTER(_PyBuffer), ctypes.c_int)(
+    ("PyObject_GetBuffer", ctypes.pythonapi))
+_release_buffer = ctypes.PYFUNCTYPE(None, ctypes.POINTER(_PyBuffer))(("PyBuffer_Release", ctypes.pythonapi))
+
+class _Buffer:
+    """The memory of a buffer-protocol object, held until released.
+
+    Unlike ``ctypes.c_char.from_buffer``, read-only buffers are accepted:
+    the memory is read in place, never copied.
+
+    Attributes:
+        address: Address of the first element.
+        length: Number of elements.
+    """
+
+    def __init__(self, obj, type_name, label, writable=False):
+        self._view = _PyBuffer()
+        flags = _PyBUF_C_CONTIGUOUS | _PyBUF_FORMAT | (_PyBUF_WRITABLE if writable else 0)
+        _get_buffer(obj, ctypes.byref(self._view), flags)
+        fmt = (self._view.format or b"B").decode("ascii").lstrip("@=" + ("<" if sys.byteorder == "little" else ">"))
+        if fmt not in ELEMENT_FORMATS[type_name] or self._view.itemsize != ELEMENT_SIZES[type_name]:
+            self.release()
+            raise TypeError(f"{label}: expected an array of {type_name} "
+                            f"({ELEMENT_SIZES[type_name]}-byte elements), got format {fmt!r}")
+        self.address = self._view.buf
+        self.length = self._view.len // self._view.itemsize
+
+    def release(self):
+        if self._view is not None:
+            _release_buffer(ctypes.byref(self._view))
+            self._view = None
+
+def exportable(func: ast.FuncDef) -> bool:
+    """Tells whether a function can be called from Python."""
+    return (func.name != 'main' and func.return_type in CTYPES
+            and all(p.type_name in CTYPES for p in func.params))
+
+def compile_source(src, opt_level=3, ssa=False, memoize=False, ast_opt=True, buffered_output=True, target=None,
+                   batch=False):
+    """Compiles a Grammo program and loads it in a JIT engine.
+
+    Args:
+        src (str): The Grammo source text.
+        opt_level (int): The LLVM optimization level (0-3).
+        ssa (bool): Build scalar locals directly in SSA form.
+        memoize (bool): Memoize the pure recursive functions.
+        ast_opt (bool): Fold constants and remove dead code on the AST.
+        buffered_output (bool): Print through the buffered output runtime.
+        target (TargetSpec): The target of the generated code (default: the host CPU).
+        batch (bool): Also compile the batch wrappers of the exported functions (see ``map``).
+
+    Returns:
+        CompiledProgram: The loaded program.
+
+    Raises:
+        lark.exceptions.UnexpectedInput: If the program has a syntax error.
+        SemanticError: If the program is not valid.
+    """
+    target = target or TargetSpec()
+    ast_root = grammo.get_parser().parse(src)
+    SemanticAnalyzer().analyze(ast_root)
+    if ast_opt:
+        ASTOptimizer().optimize(ast_root)
+
+    effects = EffectAnalyzer()
+    effects.analyze(ast_root, memoize=memoize)
+    signatures = {
+        decl.name: Signature([p.type_name for p in decl.params], decl.return_type)
+        for decl in ast_root.decls if isinstance(decl, ast.FuncDef) and exportable(decl)
+    }
+    codegen = CodeGenerator(ssa=ssa, buffered_output=buffered_output, effects=effects, exports=signatures,
+                            batch=batch)
+    module = codegen.visit(ast_root)
+
+    optimizer = GrammoOptimizer(target)
+    mod_ref = optimizer.optimize(optimizer.parse(module), speed_level=opt_level)
+    ir = str(mod_ref)
+    engine = JITExecutor(target).load(mod_ref)
+    return CompiledProgram(engine, signatures, ir, batch=batch)
@@ -0,0 +1,49 @@
+"""Benchmark: start-up of AOT executables against JIT runs.
+
+For every program in test/input, links a standalone executable with
+``python -m src.grammo.main --emit-exe`` and compares the wall-clock time
+of running it with a JIT run from a warm object cache (the fastest JIT
+path) and a JIT run without caches.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_aot [--repeat N]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from .common import SAMPLES_DIR, SAMPLE_INPUTS, PACKAGE_ROOT
+
+def _wall_time(command, stdin, env):
+    start = time.perf_counter()
+    subprocess.run(command, input=stdin.encode(), stdout=subprocess.DEVNULL, check=True, cwd=PACKAGE_ROOT, env=env)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    # Light inputs: the benchmark is about start-up, not the programs
+    inputs = dict(SAMPLE_INPUTS, factorial="10\n", fibonacci="20\n", number_tools="97\n48\n36\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, GRAMMO_CACHE_DIR=tmp)
+        print(f"{'program':<20}{'exe':>10}{'jit warm':>10}{'jit cold':>10}")
+        for name, stdin in inputs.items():
+            path = SAMPLES_DIR / f"{name}.gm"
+            exe = Path(tmp) / name
+            jit = [sys.executable, "-m", "src.grammo.main", str(path)]
+            subprocess.run([*jit, "--emit-exe", str(exe)], stdout=subprocess.DEVNULL, check=True, cwd=PACKAGE_ROOT, env=env)
+            # Fills the object cache for the warm runs
+            _wall_time(jit, stdin, env)
+
+            exe_time = min(_wall_time([str(exe)], stdin, env) for _ in range(args.repeat))
+            warm = min(_wall_time(jit, stdin, env) for _ in range(args.repeat))
+            cold = min(_wall_time([*jit, "--no-cache"], stdin, env) for _ in range(args.repeat))
+            print(f"{name:<20}{exe_time:>9.3f}s{warm:>9.3f}s{cold:>9.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark: calling a compiled function through the Python API.
+
+Compiles a numeric kernel once with ``compile_source`` and calls it many
+times through ctypes, against evaluating it by running the compiler in a
+new process, which is what embedding the command-line tool costs.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_api [--calls N] [--processes N]
+"""
+import argparse
+import subprocess
+import sys
+import time
+from .common import PACKAGE_ROOT
+from ..api import compile_source
+
+KERNEL = """
+func int -> gcd(int: a, int: b) {
+    var int: t;
+    while (b <> 0) {
+        t = b;
+        b = a - (a / b) * b;
+        a = t;
+    }
+    return a;
+}
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1000000, help="Calls through the API")
+    parser.add_argument("--processes", type=int, default=5, help="Compiler processes started")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    program = compile_source(KERNEL + "func void -> main() { return; }")
+    compile_time = time.perf_counter() - start
+
+    gcd = program["gcd"]
+    start = time.perf_counter()
+    for i in range(args.calls):
+        gcd(i, 360)
+    call_time = (time.perf_counter() - start) / args.calls
+
+    source = KERNEL + 'func void -> main() { <<! "" # (gcd(1234, 360)); return; }'
+    start = time.perf_counter()
+    for _ in range(args.processes):
+        subprocess.run([sys.executable, "-m", "src.grammo.main", "/dev/stdin"], input=source.encode(),
+                       stdout=subprocess.DEVNULL, check=True, cwd=PACKAGE_ROOT)
+    process_time = (time.perf_counter() - start) / args.processes
+
+    print(f"compile_source      {compile_time * 1e3:>10.1f} ms")
+    print(f"call through API    {call_time * 1e6:>10.2f} us")
+    print(f"compiler process    {process_time * 1e3:>10.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark: memory per AST node, slotted nodes vs the former dict-based layout.
+
+The former layout is reproduced by generating, for every node class, a plain
+``@dataclass(kw_only=True)`` with the same fields plus ``line``/``column``.
+Both trees are rebuilt from the same parsed AST under tracemalloc, so child
+lists are allocated in both cases while names and literal values are shared.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_ast_memory [--funcs N] [--stmts N]
+"""
+import argparse
+import dataclasses
+import tracemalloc
+from ..main import load_parser
+from ..semantic import ast_nodes as ast
+from ..semantic.ast_builder import ASTBuilder
+from .synthetic import generate_program
+
+def _legacy_classes():
+    """Recreates the dict-based node classes (one int per line and column)."""
+    classes = {}
+    for name in dir(ast):
+        cls = getattr(ast, name)
+        if isinstance(cls, type) and issubclass(cls, ast.Node):
+            spec = [("line", int, dataclasses.field(default=0)), ("column", int, dataclasses.field(default=0))]
+            spec += [(f.name, f.type, dataclasses.field(default=None)) for f in dataclasses.fields(cls) if f.name != "pos"]
+            classes[cls] = dataclasses.make_dataclass(f"Legacy{name}", spec, kw_only=True)
+    return classes
+
+def _rebuild(node, factory, counter):
+    if isinstance(node, list):
+        return [_rebuild(item, factory, counter) for item in node]
+    if not isinstance(node, ast.Node):
+        return node
+    counter[0] += 1
+    values = {f.name: _rebuild(getattr(node, f.name), factory, counter)
+              for f in dataclasses.fields(node) if f.name != "pos"}
+    return factory(node, values)
+
+def _measure(root, factory):
+    counter = [0]
+    tracemalloc.start()
+    rebuilt = _rebuild(root, factory, counter)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rebuilt, size, counter[0]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--funcs", type=int, default=300)
+    parser.add_argument("--stmts", type=int, default=40)
+    args = parser.parse_args()
+
+    root = load_parser(transformer=ASTBuilder()).parse(generate_program(args.funcs, args.stmts))
+    legacy = _legacy_classes()
+
+    _, old_size, nodes = _measure(root, lambda n, v: legacy[type(n)](line=n.line, column=n.column, **v))
+    _, new_size, _ = _measure(root, lambda n, v: type(n)(line=n.line, column=n.column, **v))
+
+    print(f"{nodes} nodes")
+    print(f"{'layout':<16}{'total (MiB)':>14}{'bytes/node':>14}")
+    print(f"{'dict + line/col':<16}{old_size / 2**20:>14.1f}{old_size / nodes:>14.1f}")
+    print(f"{'slots + pos':<16}{new_size / 2**20:>14.1f}{new_size / nodes:>14.1f}")
+    print(f"reduction {1 - new_size / old_size:.0%}")
+
+if __name__ == "__main__":
+    main()
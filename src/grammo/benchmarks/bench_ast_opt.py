@@ -0,0 +1,37 @@
+"""Benchmark: compile time with and without the AST optimizer.
+
+Compiles synthetic programs that use global constants (constant
+expressions and tracing code disabled by a constant flag) at -O0 and -O1,
+and reports the number of AST nodes removed and the time of the AST
+optimization, of code generation, of the handoff to LLVM and of the LLVM
+optimization, with the AST optimizer enabled and disabled.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_ast_opt [--funcs N ...] [--repeat N]
+"""
+import argparse
+from .common import timed_run
+from .synthetic import generate_program
+
+PHASES = ("ast_opt", "codegen", "handoff", "optimize")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--funcs", type=int, nargs="+", default=[250, 1000])
+    parser.add_argument("--stmts", type=int, default=36)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    print(f"{'funcs':>6}{'level':>6}  {'mode':<8}{'removed':>9}" + "".join(f"{p:>10}" for p in PHASES) + f"{'total':>10}")
+    for funcs in args.funcs:
+        source = generate_program(funcs, args.stmts, constants=True)
+        for level in ("-O0", "-O1"):
+            for label, flags in (("off", ["--no-ast-opt"]), ("on", [])):
+                runs = [timed_run(source, args=[level, *flags]) for _ in range(args.repeat)]
+                best = min(runs, key=lambda run: sum(run.get(p, 0) for p in PHASES))
+                times = [best.get(p, 0) for p in PHASES]
+                print(f"{funcs:>6}{level:>6}  {label:<8}{best.get('ast_removed', 0):>9}"
+                      + "".join(f"{t:>9.2f}s" for t in times) + f"{sum(times):>9.2f}s")
+
+if __name__ == "__main__":
+    main()
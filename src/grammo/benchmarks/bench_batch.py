@@ -0,0 +1,58 @@
+"""Benchmark: throughput of an exported function, per element and in batch.
+
+Applies a compiled ``real`` kernel to arrays of growing length, once with a
+Python loop calling the function through ctypes for every element, and once
+with ``CompiledProgram.map``, which calls its batch wrapper: one foreign
+call for the whole array, and a loop LLVM can vectorize.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_batch [--sizes N ...] [--repeat N]
+"""
+import argparse
+import array
+import time
+from ..api import compile_source
+
+KERNEL = """
+func real -> apply_interest(real: capital, real: rate) {
+    return capital * (1.0 + rate / 100.0);
+}
+
+func void -> main() {
+    return;
+}
+"""
+
+def _best(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    program = compile_source(KERNEL, batch=True)
+    kernel = program["apply_interest"]
+    print(f"{'elements':>10}{'per call':>14}{'batch':>14}{'speedup':>10}")
+    for n in args.sizes:
+        capitals = array.array('d', (1000.0 + i for i in range(n)))
+        rates = array.array('d', (i % 7 * 0.5 for i in range(n)))
+        out = array.array('d', bytes(8 * n))
+
+        def per_call():
+            for i in range(n):
+                out[i] = kernel(capitals[i], rates[i])
+
+        per_call_time = _best(per_call, args.repeat)
+        batch_time = _best(lambda: program.map("apply_interest", capitals, rates, out=out), args.repeat)
+        print(f"{n:>10}{n / per_call_time / 1e6:>9.2f} M/s{n / batch_time / 1e6:>9.1f} M/s"
+              f"{per_call_time / batch_time:>9.0f}x")
+
+if __name__ == "__main__":
+    main()
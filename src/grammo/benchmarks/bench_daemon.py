@@ -0,0 +1,87 @@
+"""Benchmark: latency of a compile-and-run request, cold and on the daemon.
+
+Starts a daemon on a temporary socket and runs small sample programs in
+three ways: a cold ``main`` process, the ``client`` CLI (a short-lived
+Python process talking to the daemon) and a request sent from this process
+(the daemon alone, without the start of a client). Each is measured with
+the object cache (the program is already compiled) and without it.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_daemon [--repeat N]
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from .common import SAMPLES_DIR, PACKAGE_ROOT
+from .. import client
+
+PROGRAMS = {
+    "factorial": "10\n",
+    "fibonacci": "20\n",
+    "string_demo": "Bob\n5\n",
+}
+
+def _wait_for_socket(path, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(path)
+                return
+            except (FileNotFoundError, ConnectionRefusedError):
+                time.sleep(0.05)
+    raise RuntimeError("The daemon did not start")
+
+def _run_process(module, argv, stdin):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-m", module, *argv], input=stdin.encode(),
+                   stdout=subprocess.DEVNULL, check=True, cwd=PACKAGE_ROOT)
+    return time.perf_counter() - start
+
+def _run_request(argv, stdin):
+    with tempfile.TemporaryFile() as f, open(os.devnull, "w") as devnull:
+        f.write(stdin.encode())
+        f.seek(0)
+        start = time.perf_counter()
+        status = client.run(argv, fds=(f.fileno(), devnull.fileno(), sys.stderr.fileno()))
+        elapsed = time.perf_counter() - start
+    if status != 0:
+        raise RuntimeError(f"Request failed with status {status}")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per measurement (the median is kept)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["GRAMMO_DAEMON_SOCKET"] = path = str(Path(tmp) / "daemon.sock")
+        daemon = subprocess.Popen([sys.executable, "-m", "src.grammo.daemon"], cwd=PACKAGE_ROOT,
+                                  stderr=subprocess.DEVNULL)
+        try:
+            _wait_for_socket(path)
+            print(f"{'program':<14}{'cache':<7}{'cold':>9}{'client':>9}{'request':>9}")
+            for name, stdin in PROGRAMS.items():
+                for cache_flags in ([], ["--no-cache"]):
+                    argv = [str(SAMPLES_DIR / f"{name}.gm"), *cache_flags]
+                    # Fills the object cache
+                    _run_process("src.grammo.main", argv, stdin)
+                    times = [
+                        [_run_process("src.grammo.main", argv, stdin) for _ in range(args.repeat)],
+                        [_run_process("src.grammo.client", argv, stdin) for _ in range(args.repeat)],
+                        [_run_request(argv, stdin) for _ in range(args.repeat)],
+                    ]
+                    label = "off" if cache_flags else "on"
+                    print(f"{name:<14}{label:<7}" + "".join(f"{statistics.median(t) * 1e3:>7.0f}ms" for t in times))
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Benchmark: handoff of the generated module to LLVM, whole text vs chunks.
+
+Compiles synthetic programs of growing size at -O0 and reports the time
+of code generation, of the handoff (``GrammoOptimizer.parse``) and the
+peak resident set size of the process, parsing the module text in one
+piece (``--chunk-size 0``) or in chunks linked together.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_handoff [--funcs N ...] [--repeat N]
+"""
+import argparse
+from .common import timed_run
+from .synthetic import generate_program
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--funcs", type=int, nargs="+", default=[250, 500, 1000])
+    parser.add_argument("--stmts", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    print(f"{'funcs':>6}  {'mode':<8}{'codegen':>10}{'handoff':>10}{'peak RSS':>12}")
+    for funcs in args.funcs:
+        source = generate_program(funcs, args.stmts)
+        for label, flags in (("text", ["--chunk-size", "0"]), ("chunked", [])):
+            runs = [timed_run(source, args=["-O0", *flags]) for _ in range(args.repeat)]
+            codegen = min(run["codegen"] for run in runs)
+            handoff = min(run["handoff"] for run in runs)
+            rss = min(run.get("maxrss_kb", 0) for run in runs) / 1024
+            print(f"{funcs:>6}  {label:<8}{codegen:>9.2f}s{handoff:>9.2f}s{rss:>9.0f} MiB")
+
+if __name__ == "__main__":
+    main()
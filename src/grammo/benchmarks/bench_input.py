@@ -0,0 +1,51 @@
+"""Benchmark: reading many numbers from stdin.
+
+Feeds N integers and N reals (10^7 numbers in total by default) to a program
+that sums them, and reports the run time per number. The input is generated
+once and piped to the program.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_input [--numbers N] [--repeat N]
+"""
+import argparse
+import random
+from .common import timed_run
+
+PROGRAM = """
+func void -> main() {
+    var int: b_n, b_i, b_v, b_sum;
+    var real: b_r, b_rsum;
+
+    >> # (b_n);
+    for (b_i = 0; b_i < b_n; b_i = b_i + 1) {
+        >> # (b_v);
+        b_sum = b_sum + b_v;
+    }
+    for (b_i = 0; b_i < b_n; b_i = b_i + 1) {
+        >> # (b_r);
+        b_rsum = b_rsum + b_r;
+    }
+    <<! "sum=" # (b_sum) " rsum=" # (b_rsum);
+}
+"""
+
+def generate_input(count, seed=0):
+    """Returns stdin text with count // 2 integers followed by as many reals."""
+    rng = random.Random(seed)
+    half = count // 2
+    ints = " ".join(str(rng.randint(-10**6, 10**6)) for _ in range(half))
+    reals = "\n".join(f"{rng.uniform(-1e4, 1e4):.4f}" for _ in range(half))
+    return f"{half}\n{ints}\n{reals}\n"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--numbers", type=int, default=10**7, help="Total count of numbers read")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    stdin = generate_input(args.numbers)
+    run = min(timed_run(PROGRAM, stdin, ["-O3"])["run"] for _ in range(args.repeat))
+    print(f"{args.numbers} numbers ({len(stdin) / 2**20:.1f} MiB): {run:.3f}s, {run / args.numbers * 1e9:.1f} ns/number")
+
+if __name__ == "__main__":
+    main()
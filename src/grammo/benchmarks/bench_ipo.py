@@ -0,0 +1,28 @@
+"""Benchmark: size and speed of the optimized sample programs.
+
+For every program in test/input, reports the number of instructions of
+the optimized module and the best run time at -O3. Internal linkage and
+the function attributes of the effect analysis let LLVM drop, inline and
+specialize functions across the whole program: run it before and after a
+change to the code generator to compare.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_ipo [--repeat N] [-O N]
+"""
+import argparse
+from .common import SAMPLES_DIR, SAMPLE_INPUTS, timed_run
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is kept)")
+    parser.add_argument("-O", "--opt-level", type=int, default=3, choices=[0, 1, 2, 3])
+    args = parser.parse_args()
+
+    print(f"{'program':<20}{'instructions':>14}{'run':>10}")
+    for name, stdin in SAMPLE_INPUTS.items():
+        runs = [timed_run(SAMPLES_DIR / f"{name}.gm", stdin, args=[f"-O{args.opt_level}"]) for _ in range(args.repeat)]
+        run = min(r["run"] for r in runs)
+        print(f"{name:<20}{runs[0]['instructions']:>14}{run:>9.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark: startup latency of the eager and the lazy JIT.
+
+Runs synthetic programs with thousands of functions of which ``main`` calls
+only a few: the others are called under a condition that is false at run
+time, as for error handling or rarely used options. The eager JIT
+generates, optimizes and compiles every function before ``main`` starts;
+the lazy JIT compiles a function on its first call, so its startup does not
+depend on the code that never runs.
+
+The startup is the time from the analyzed AST to the end of ``main``
+(which does almost no work): code generation, handoff, optimization and
+machine code for the eager JIT, loading the global variables and
+compiling the functions called for the lazy one.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_lazy [--funcs N ...] [--reached N] [--stmts N] [--repeat N]
+"""
+import argparse
+from .common import timed_run
+from .synthetic import generate_program
+
+EAGER_PHASES = ("codegen", "handoff", "optimize", "run")
+LAZY_PHASES = ("load", "run")
+
+def _startup(timings):
+    return sum(timings[p] for p in (LAZY_PHASES if "compiled" in timings else EAGER_PHASES))
+
+def _best(source, args, repeat):
+    return min((timed_run(source, args=args) for _ in range(repeat)), key=_startup)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--funcs", type=int, nargs="+", default=[500, 2000])
+    parser.add_argument("--reached", type=int, default=10, help="Functions called by main")
+    parser.add_argument("--stmts", type=int, default=20, help="Statements per function")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    print(f"{'functions':>10}{'eager':>12}{'lazy':>12}{'compiled':>10}{'speedup':>10}")
+    for n in args.funcs:
+        source = generate_program(n, args.stmts, reached=args.reached)
+        eager = _best(source, (), args.repeat)
+        lazy = _best(source, ("--lazy",), args.repeat)
+        print(f"{n:>10}{_startup(eager) * 1e3:>9.0f} ms{_startup(lazy) * 1e3:>9.0f} ms"
+              f"{lazy['compiled']:>10}{_startup(eager) / _startup(lazy):>9.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark: run time of a naive recursive function with and without memoization.
+
+Runs the doubly recursive Fibonacci function for growing n, compiled with
+and without ``--memoize``: the plain version makes an exponential number of
+calls, the memoized one computes each value once and then finds it in the
+memo table.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_memoize [--n N ...] [--repeat N] [-O N]
+"""
+import argparse
+from .common import timed_run
+
+PROGRAM = """
+func int -> fib(int: n) {
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+
+func void -> main() {
+    var int: n;
+    >> # (n);
+    <<! "fib=" # (fib(n));
+    return;
+}
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, nargs="+", default=[25, 30, 35, 40, 45])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    parser.add_argument("-O", "--opt-level", type=int, default=3, choices=[0, 1, 2, 3])
+    args = parser.parse_args()
+
+    print(f"{'n':>4}{'plain':>10}{'memoized':>10}{'speedup':>10}")
+    for n in args.n:
+        times = []
+        for flags in ([], ["--memoize"]):
+            runs = [timed_run(PROGRAM, f"{n}\n", args=[f"-O{args.opt_level}", *flags]) for _ in range(args.repeat)]
+            times.append(min(r["run"] for r in runs))
+        plain, memoized = times
+        print(f"{n:>4}{plain:>9.3f}s{memoized:>9.3f}s{plain / memoized:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
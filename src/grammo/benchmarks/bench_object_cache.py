@@ -0,0 +1,50 @@
+"""Benchmark: end-to-end run time with a cold and a warm object cache.
+
+For every program in test/input, runs ``python -m src.grammo.main`` in a
+fresh process with an empty object cache, then again with the entry stored
+by the first run, and reports the wall-clock times. The parser cache is warm
+in both cases.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_object_cache [--repeat N]
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from .common import SAMPLES_DIR, SAMPLE_INPUTS, PACKAGE_ROOT
+
+def _wall_time(path, stdin, env):
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "src.grammo.main", str(path)],
+        input=stdin.encode(), stdout=subprocess.DEVNULL, check=True, cwd=PACKAGE_ROOT, env=env,
+    )
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    # Light inputs: the benchmark is about compilation, not the programs
+    inputs = dict(SAMPLE_INPUTS, factorial="10\n", fibonacci="20\n", number_tools="97\n48\n36\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, GRAMMO_CACHE_DIR=tmp)
+        objects = Path(tmp) / "objects"
+        print(f"{'program':<20}{'cold':>10}{'warm':>10}")
+        for name, stdin in inputs.items():
+            path = SAMPLES_DIR / f"{name}.gm"
+            cold = warm = float("inf")
+            for _ in range(args.repeat):
+                shutil.rmtree(objects, ignore_errors=True)
+                cold = min(cold, _wall_time(path, stdin, env))
+                warm = min(warm, _wall_time(path, stdin, env))
+            print(f"{name:<20}{cold:>9.3f}s{warm:>9.3f}s")
+
+if __name__ == "__main__":
+    main()
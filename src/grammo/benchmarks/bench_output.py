@@ -0,0 +1,37 @@
+"""Benchmark: printing many lines, buffered output runtime vs printf per argument.
+
+Each line mixes literals with int, real and bool values, like the tables
+printed by compound_interest.gm. Output goes to /dev/null.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_output [--lines N] [--repeat N]
+"""
+import argparse
+from .common import timed_run
+
+PROGRAM = """
+func void -> main() {{
+    var int: b_i;
+    var real: b_x;
+
+    b_x = 0.5;
+    for (b_i = 0; b_i < {lines}; b_i = b_i + 1) {{
+        <<! "riga " # (b_i) ": x=" # (b_x) " positivo=" # (b_x > 0.0);
+        b_x = b_x + 1.25;
+    }}
+}}
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=10**6, help="Number of printed lines")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    source = PROGRAM.format(lines=args.lines)
+    for label, flags in (("printf", ["--no-output-buffer"]), ("buffered", [])):
+        run = min(timed_run(source, args=["-O3", *flags])["run"] for _ in range(args.repeat))
+        print(f"{label:<10}{run:>8.3f}s{run / args.lines * 1e9:>10.1f} ns/line")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Benchmark: serial vs sharded parallel code generation.
+
+Compiles synthetic programs at -O0 and reports the time of code generation
+plus the handoff to LLVM, serially and with ``-j`` worker processes (each
+generating a shard of the function bodies, linked by the parent).
+
+Usage:
+    python -m src.grammo.benchmarks.bench_parallel_codegen [--funcs N ...] [--jobs N ...] [--repeat N]
+"""
+import argparse
+import os
+from .common import timed_run
+from .synthetic import generate_program
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--funcs", type=int, nargs="+", default=[500, 2000])
+    parser.add_argument("--stmts", type=int, default=20)
+    parser.add_argument("--jobs", type=int, nargs="+", default=sorted({2, os.cpu_count() or 1} - {1}))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    print(f"CPUs: {os.cpu_count()}")
+    print(f"{'funcs':>6}{'jobs':>6}{'codegen+handoff':>18}")
+    for funcs in args.funcs:
+        source = generate_program(funcs, args.stmts)
+        for jobs in [1, *args.jobs]:
+            runs = [timed_run(source, args=["-O0", "-j", str(jobs)]) for _ in range(args.repeat)]
+            best = min(run["codegen"] + run["handoff"] for run in runs)
+            print(f"{funcs:>6}{jobs:>6}{best:>17.2f}s")
+
+if __name__ == "__main__":
+    main()
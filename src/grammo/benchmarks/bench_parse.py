@@ -0,0 +1,44 @@
+"""Benchmark: two-pass (parse tree + ASTBuilder) vs single-pass AST construction.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_parse [--funcs N] [--stmts N]
+"""
+import argparse
+import time
+import tracemalloc
+from ..main import load_parser
+from ..semantic.ast_builder import ASTBuilder
+from .synthetic import generate_program
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--funcs", type=int, default=500)
+    parser.add_argument("--stmts", type=int, default=40)
+    args = parser.parse_args()
+
+    src = generate_program(args.funcs, args.stmts)
+    print(f"Source: {len(src) / 1024:.0f} KiB, {src.count(chr(10))} lines")
+
+    tree_parser = load_parser()
+    inline_parser = load_parser(transformer=ASTBuilder())
+
+    two_pass, t_two, m_two = _measure(lambda: ASTBuilder().transform(tree_parser.parse(src)))
+    one_pass, t_one, m_one = _measure(lambda: inline_parser.parse(src))
+    assert one_pass == two_pass, "single-pass AST differs from the two-pass AST"
+
+    print(f"{'mode':<12}{'time (s)':>12}{'peak (MiB)':>14}")
+    print(f"{'two-pass':<12}{t_two:>12.3f}{m_two / 2**20:>14.1f}")
+    print(f"{'single-pass':<12}{t_one:>12.3f}{m_one / 2**20:>14.1f}")
+    print(f"speedup {t_two / t_one:.2f}x, peak memory {m_one / m_two:.0%} of two-pass")
+
+if __name__ == "__main__":
+    main()
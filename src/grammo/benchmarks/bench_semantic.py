@@ -0,0 +1,35 @@
+"""Benchmark: sequential vs process-pool semantic analysis of function bodies.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_semantic [--funcs N] [--stmts N] [--jobs N ...]
+"""
+import argparse
+import os
+import time
+from ..main import load_parser
+from ..semantic.ast_builder import ASTBuilder
+from ..semantic.semantic_analyzer import SemanticAnalyzer
+from .synthetic import generate_program
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--funcs", type=int, default=4000)
+    parser.add_argument("--stmts", type=int, default=30)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    src = generate_program(args.funcs, args.stmts)
+    root = load_parser(transformer=ASTBuilder()).parse(src)
+    print(f"{args.funcs} functions, {os.cpu_count()} CPUs")
+
+    baseline = None
+    print(f"{'jobs':>6}{'time (s)':>12}{'speedup':>10}")
+    for jobs in sorted(set(args.jobs)):
+        start = time.perf_counter()
+        SemanticAnalyzer().analyze(root, jobs=jobs)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{jobs:>6}{elapsed:>12.3f}{baseline / elapsed:>9.2f}x")
+
+if __name__ == "__main__":
+    main()
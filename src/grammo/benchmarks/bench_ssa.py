@@ -0,0 +1,30 @@
+"""Benchmark: alloca/load/store locals vs direct SSA construction.
+
+For every program in test/input, reports the optimizer time at -O3 and the
+-O0 run time (MCJIT code emission included) with and without --ssa.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_ssa [--repeat N]
+"""
+import argparse
+from .common import SAMPLES_DIR, SAMPLE_INPUTS, timed_run
+
+def _best(path, stdin, args, key, repeat):
+    return min(timed_run(path, stdin, args)[key] for _ in range(repeat))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    print(f"{'program':<20}{'opt -O3 alloca':>16}{'opt -O3 ssa':>14}{'run -O0 alloca':>16}{'run -O0 ssa':>14}")
+    for name, stdin in SAMPLE_INPUTS.items():
+        path = SAMPLES_DIR / f"{name}.gm"
+        opt_mem = _best(path, stdin, ["-O3"], "optimize", args.repeat)
+        opt_ssa = _best(path, stdin, ["-O3", "--ssa"], "optimize", args.repeat)
+        run_mem = _best(path, stdin, ["-O0"], "run", args.repeat)
+        run_ssa = _best(path, stdin, ["-O0", "--ssa"], "run", args.repeat)
+        print(f"{name:<20}{opt_mem * 1e3:>14.2f}ms{opt_ssa * 1e3:>12.2f}ms{run_mem:>15.3f}s{run_ssa:>13.3f}s")
+
+if __name__ == "__main__":
+    main()
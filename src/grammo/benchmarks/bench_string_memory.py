@@ -0,0 +1,48 @@
+"""Benchmark: peak memory of a loop of string concatenations.
+
+Each iteration builds temporaries, overwrites string variables and passes
+strings to a function; with automatic reclamation the peak RSS of the
+process does not depend on the number of iterations.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_string_memory [--max-iters N]
+"""
+import argparse
+from .common import timed_run
+
+PROGRAM = """
+func string -> wrap(string: wr_s, string: wr_side) {{
+    var string: wr_out;
+
+    wr_out = wr_side + wr_s;
+    wr_out = wr_out + wr_side;
+    return wr_out;
+}}
+
+func void -> main() {{
+    var string: b_s, b_t;
+    var int: b_i;
+
+    b_s = "grammo";
+    for (b_i = 0; b_i < {count}; b_i = b_i + 1) {{
+        b_t = b_s + " " + b_s + "!";
+        b_t = wrap(b_t, "*") + wrap("x", b_s);
+    }}
+    <<! b_t;
+}}
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-iters", type=int, default=10**6, help="Largest iteration count")
+    args = parser.parse_args()
+
+    print(f"{'iterations':>12}{'peak RSS':>14}{'run':>10}")
+    count = 10**3
+    while count <= args.max_iters:
+        timings = timed_run(PROGRAM.format(count=count), args=["-O3"])
+        print(f"{count:>12}{timings['maxrss_kb'] / 1024:>11.1f}MiB{timings['run']:>9.3f}s")
+        count *= 10
+
+if __name__ == "__main__":
+    main()
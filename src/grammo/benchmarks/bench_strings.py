@@ -0,0 +1,48 @@
+"""Benchmark: building a string by repeated appends.
+
+Runs ``s = s + chunk`` in a loop for increasing final sizes and reports the
+run time per byte, which stays flat when appends are amortised O(1). The run
+time of the same program with an empty loop (JIT code emission) is
+subtracted.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_strings [--max-mb N] [--repeat N]
+"""
+import argparse
+from .common import timed_run
+
+CHUNK = "0123456789abcdef" * 4
+
+PROGRAM = """
+func void -> main() {{
+    var string: b_s, b_chunk;
+    var int: b_i;
+
+    b_chunk = "{chunk}";
+    for (b_i = 0; b_i < {count}; b_i = b_i + 1) {{
+        b_s = b_s + b_chunk;
+    }}
+    <<! b_s;
+}}
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-mb", type=int, default=64, help="Largest final string size in MiB")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size (best is kept)")
+    args = parser.parse_args()
+
+    def best_run(count):
+        source = PROGRAM.format(chunk=CHUNK, count=count)
+        return min(timed_run(source, args=["-O3"])["run"] for _ in range(args.repeat))
+
+    base = best_run(0)
+    print(f"{'size':>10}{'run':>12}{'ns/byte':>10}")
+    size = 1 << 16
+    while size <= args.max_mb << 20:
+        run = max(best_run(size // len(CHUNK)) - base, 0.0)
+        print(f"{size >> 10:>8}KB{run:>11.4f}s{run / size * 1e9:>10.2f}")
+        size *= 2
+
+if __name__ == "__main__":
+    main()
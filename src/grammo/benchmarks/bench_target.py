@@ -0,0 +1,59 @@
+"""Benchmark: numeric loops compiled for the generic baseline vs the host CPU.
+
+Runs an integer reduction loop (vectorizable by LLVM) and a scalar
+floating-point recurrence at -O3, once for the generic target of the
+triple (``--cpu "" --features ""``) and once for the host CPU (``native``).
+
+Usage:
+    python -m src.grammo.benchmarks.bench_target [--n N] [--repeat N]
+"""
+import argparse
+from .common import timed_run
+
+PROGRAM = """
+func int -> checksum(int: c_n) {{
+    var int: c_i, c_acc;
+
+    c_acc = 0;
+    for (c_i = 0; c_i < c_n; c_i = c_i + 1) {{
+        c_acc = c_acc + c_i * c_i - c_i / 3;
+    }}
+    return c_acc;
+}}
+
+func real -> recurrence(int: r_n) {{
+    var int: r_i;
+    var real: r_x;
+
+    r_x = 0.5;
+    for (r_i = 0; r_i < r_n; r_i = r_i + 1) {{
+        r_x = r_x * 0.999 + 1.0 / (r_i + 1);
+    }}
+    return r_x;
+}}
+
+func void -> main() {{
+    var int: m_k, m_acc;
+
+    m_acc = 0;
+    for (m_k = 0; m_k < 10; m_k = m_k + 1) {{
+        m_acc = m_acc + checksum({n} + m_k);
+    }}
+    <<! "checksum=" # (m_acc);
+    <<! "recurrence=" # (recurrence({n}));
+}}
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=10**8, help="Iterations of each loop")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    source = PROGRAM.format(n=args.n)
+    for label, flags in (("generic", ["--cpu", "", "--features", ""]), ("native", [])):
+        run = min(timed_run(source, args=["-O3", *flags])["run"] for _ in range(args.repeat))
+        print(f"{label:<10}{run:>8.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark: time to result of the JIT, the interpreter and tiered execution.
+
+Runs a program calling a small numeric kernel a growing number of times.
+The JIT pays code generation, optimization and machine code before
+``main`` starts, then runs fast; the interpreter starts at once but runs
+each call slowly; tiered execution interprets the kernel until it is hot,
+then compiles it alone. Short runs favour the interpreter, long runs the
+JIT, and tiered execution stays close to the better of the two.
+
+The time to result goes from the analyzed AST to the end of ``main``.
+
+Usage:
+    python -m src.grammo.benchmarks.bench_tiered [--calls N ...] [--threshold N] [--repeat N]
+"""
+import argparse
+from .common import timed_run
+
+PROGRAM = """
+func int -> collatz_steps(int: n) {
+    var int: steps;
+    steps = 0;
+    while (n > 1) {
+        if (n - n / 2 * 2 == 0) {
+            n = n / 2;
+        }
+        else {
+            n = 3 * n + 1;
+        }
+        steps = steps + 1;
+    }
+    return steps;
+}
+
+func void -> main() {
+    var int: calls, i, total;
+    >> # (calls);
+    total = 0;
+    for (i = 1; i <= calls; i = i + 1) {
+        total = total + collatz_steps(i);
+    }
+    <<! "total=" # (total);
+    return;
+}
+"""
+
+JIT_PHASES = ("codegen", "handoff", "optimize", "run")
+INTERPRETER_PHASES = ("load", "run")
+
+# Never reached: the interpreter alone
+NEVER = 1 << 62
+
+def _elapsed(timings):
+    return sum(timings[p] for p in (INTERPRETER_PHASES if "promoted" in timings else JIT_PHASES))
+
+def _best(calls, args, repeat):
+    return min((timed_run(PROGRAM, f"{calls}\n", args=args) for _ in range(repeat)), key=_elapsed)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, nargs="+", default=[10, 100, 1000, 10000, 100000])
+    parser.add_argument("--threshold", type=int, help="Hot threshold of tiered execution (default: the compiler's)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    tiered_args = ("--tiered",) if args.threshold is None else ("--tiered", "--hot-threshold", str(args.threshold))
+    print(f"{'calls':>8}{'JIT':>12}{'interpreter':>14}{'tiered':>12}{'promoted':>10}")
+    for calls in args.calls:
+        jit = _best(calls, (), args.repeat)
+        interpreted = _best(calls, ("--tiered", "--hot-threshold", str(NEVER)), args.repeat)
+        tiered = _best(calls, tiered_args, args.repeat)
+        print(f"{calls:>8}{_elapsed(jit) * 1e3:>9.1f} ms{_elapsed(interpreted) * 1e3:>11.1f} ms"
+              f"{_elapsed(tiered) * 1e3:>9.1f} ms{tiered['promoted']:>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Shared helpers for the benchmarks: sample programs and timed JIT runs."""
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SAMPLES_DIR = Path(__file__).resolve().parent.parent / "test" / "input"
+PACKAGE_ROOT = Path(__file__).resolve().parents[3]
+
+# stdin for each sample program, sized so that main() does measurable work
+SAMPLE_INPUTS = {
+    "bank_menu": "1\n2\n100\n3\n50\n3\n5000\n9\n0\n",
+    "calculator": "1\n2.5\n3\n1\n4\n1\n0\n0\n",
+    "compound_interest": "1000\n5\n20000\n",
+    "factorial": "5000000\n",
+    "fibonacci": "50000000\n",
+    "number_tools": "1000003\n1000000\n3\n",
+    "stats_mean_minmax": "4\n1.5\n2.5\n-1\n7\n",
+    "string_demo": "Bob\n2000\n",
+}
+
+def timed_run(source, stdin="", args=()):
+    """Compiles and runs a program in a fresh process via jit_runner.
+
+    Args:
+        source (str | Path): Path of a .gm file, or Grammo source text.
+        stdin (str): Data fed to the program's standard input.
+        args: Extra jit_runner command-line arguments.
+
+    Returns:
+        dict: Phase timings in seconds reported by jit_runner (and ``maxrss_kb``
+            where available).
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        if not isinstance(source, Path):
+            path = Path(tmp) / "program.gm"
+            path.write_text(source, encoding="utf-8")
+            source = path
+        timings = Path(tmp) / "timings.json"
+        subprocess.run(
+            [sys.executable, "-m", "src.grammo.benchmarks.jit_runner", str(source), "--timings", str(timings), *args],
+            input=stdin.encode(), stdout=subprocess.DEVNULL, check=True, cwd=PACKAGE_ROOT,
+        )
+        return json.loads(timings.read_text())
@@ -0,0 +1,117 @@
+"""Compiles a Grammo program, runs it, and records the time of each phase.
+
+Used by the benchmarks through common.timed_run; the program's own output
+goes to stdout as usual. Where available, the peak resident set size of the
+process is recorded as well (``maxrss_kb``), and so is the number of nodes
+removed by the AST optimizer (``ast_removed``) and the number of
+instructions of the optimized module (``instructions``). With ``--lazy``
+the base module is loaded in the ``load`` phase and the functions are
+compiled during the ``run`` phase, which records the
+number of functions compiled (``compiled``) and the time spent compiling
+them (``lazy_compile``). With ``--tiered`` the program is interpreted
+during the ``run`` phase, which records the number of functions promoted
+to the JIT (``promoted``) and the time spent compiling them
+(``tiered_compile``).
+
+Usage:
+    python -m src.grammo.benchmarks.jit_runner FILE --timings OUT.json [-O N] [--ssa] [--no-output-buffer] [--cpu NAME] [--features STR] [--chunk-size BYTES] [-j N] [--no-ast-opt] [--memoize] [--lazy] [--tiered] [--hot-threshold N]
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+from ..main import load_parser
+from ..semantic.ast_builder import ASTBuilder
+from ..semantic.semantic_analyzer import SemanticAnalyzer
+from ..semantic.ast_optimizer import ASTOptimizer
+from ..semantic.effects import EffectAnalyzer
+from ..codegen.code_generator import CodeGenerator
+from ..codegen.optimizer import GrammoOptimizer
+from ..codegen.execution import JITExecutor
+from ..codegen.target import TargetSpec, NATIVE
+from ..codegen.handoff import DEFAULT_CHUNK_SIZE
+from ..codegen.parallel import generate_parallel
+from ..codegen.lazy import LazyJIT
+from ..interpreter import Interpreter, HOT_THRESHOLD
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file")
+    parser.add_argument("--timings", required=True, help="Output path of the JSON timings")
+    parser.add_argument("-O", "--opt-level", type=int, default=3, choices=[0, 1, 2, 3])
+    parser.add_argument("--ssa", action="store_true")
+    parser.add_argument("--no-output-buffer", action="store_true")
+    parser.add_argument("--cpu", default=NATIVE)
+    parser.add_argument("--features", default=NATIVE)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="IR text parsed at once (0 = whole module)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Worker processes for the code generation (handoff included)")
+    parser.add_argument("--no-ast-opt", action="store_true")
+    parser.add_argument("--memoize", action="store_true")
+    parser.add_argument("--lazy", action="store_true")
+    parser.add_argument("--tiered", action="store_true")
+    parser.add_argument("--hot-threshold", type=int, default=HOT_THRESHOLD)
+    args = parser.parse_args()
+
+    timings = {}
+    def phase(name, fn, *fn_args, **fn_kwargs):
+        start = time.perf_counter()
+        result = fn(*fn_args, **fn_kwargs)
+        timings[name] = time.perf_counter() - start
+        return result
+
+    target = TargetSpec(args.cpu, args.features)
+    src = Path(args.file).read_text(encoding="utf-8")
+    ast_root = phase("parse", load_parser(transformer=ASTBuilder()).parse, src)
+    phase("semantic", SemanticAnalyzer().analyze, ast_root)
+    if not args.no_ast_opt:
+        timings["ast_removed"] = phase("ast_opt", ASTOptimizer().optimize, ast_root)
+    effects = None
+    if args.memoize:
+        effects = EffectAnalyzer()
+        phase("effects", effects.analyze, ast_root, memoize=True)
+    if args.tiered:
+        interpreter = phase("load", Interpreter, ast_root, threshold=args.hot_threshold, target=target,
+                            opt_level=args.opt_level, ssa=args.ssa, memoize=args.memoize, effects=effects)
+        phase("run", interpreter.run)
+        timings["promoted"] = len(interpreter.promoted)
+        timings["tiered_compile"] = interpreter.compile_time
+        _write(args.timings, timings)
+        return
+    if args.lazy:
+        jit = phase("load", LazyJIT, ast_root, target, opt_level=args.opt_level, ssa=args.ssa,
+                    buffered_output=not args.no_output_buffer, effects=effects)
+        phase("run", jit.run)
+        timings["compiled"] = len(jit.compiled)
+        timings["lazy_compile"] = jit.compile_time
+        _write(args.timings, timings)
+        return
+    optimizer = GrammoOptimizer(target)
+    if args.jobs > 1:
+        mod_ref = phase("codegen", generate_parallel, ast_root, target, args.jobs, ssa=args.ssa,
+                        buffered_output=not args.no_output_buffer, chunk_size=args.chunk_size, effects=effects)
+        timings["handoff"] = 0.0
+    else:
+        module = phase("codegen", CodeGenerator(ssa=args.ssa, buffered_output=not args.no_output_buffer,
+                                                 effects=effects).visit, ast_root)
+        mod_ref = phase("handoff", optimizer.parse, module, chunk_size=args.chunk_size)
+        del module
+    mod_ref = phase("optimize", optimizer.optimize, mod_ref, speed_level=args.opt_level)
+    timings["instructions"] = sum(1 for func in mod_ref.functions for block in func.blocks for _ in block.instructions)
+    phase("run", JITExecutor(target).run, mod_ref)
+    _write(args.timings, timings)
+
+def _write(path, timings):
+    if resource is not None:
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS, in kilobytes elsewhere
+        timings["maxrss_kb"] = maxrss // 1024 if sys.platform == "darwin" else maxrss
+
+    Path(path).write_text(json.dumps(timings))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Generators of synthetic Grammo programs used by the benchmarks."""
+
+def generate_function(index, stmts=20, constants=False, cold_call=None):
+    """Generates a self-contained int function exercising the common statements.
+
+    Args:
+        index (int): Function index, used to derive unique identifiers.
+        stmts (int): Approximate number of statements in the body.
+        constants (bool): Also use the global constants declared by
+            ``generate_program``, in constant expressions and in tracing
+            code disabled by a constant flag.
+        cold_call (int): Index of a function called in a branch taken only
+            for a negative argument.
+
+    Returns:
+        str: The Grammo source of the function.
+    """
+    p = f"f{index}"
+    lines = [
+        f"func int -> {p}(int: {p}_n, real: {p}_x) {{",
+        f"    var int: {p}_i, {p}_acc;",
+        f"    var real: {p}_r;",
+        f"    var bool: {p}_ok;",
+        f"    {p}_acc = 0;",
+        f"    {p}_r = {p}_x;",
+    ]
+    body = [
+        f"    {p}_acc = {p}_acc + {p}_n * 3 - 1;",
+        f"    {p}_r = {p}_r * 1.5 + {p}_acc / 2;",
+        f"    {p}_ok = ({p}_acc > 10) && !({p}_r < 0.0);",
+        f"    if ({p}_ok) {{\n        {p}_acc = {p}_acc - 1;\n    }}\n    elif ({p}_acc == 0) {{\n        {p}_acc = 1;\n    }}\n    else {{\n        {p}_acc = {p}_acc + 2;\n    }}",
+        f"    for ({p}_i = 0; {p}_i < {p}_n; {p}_i = {p}_i + 1) {{\n        {p}_acc = {p}_acc + {p}_i;\n    }}",
+        f"    while ({p}_acc > 1000) {{\n        {p}_acc = {p}_acc - 1000;\n    }}",
+    ]
+    if constants:
+        body += [
+            f"    {p}_acc = {p}_acc + G_SCALE * (4 - 2) - G_SCALE / 2;",
+            f"    if (G_DEBUG) {{\n        <<! \"{p} acc=\" # ({p}_acc) \" r=\" # ({p}_r);\n    }}",
+            f"    while (G_DEBUG && ({p}_acc > 0)) {{\n        {p}_acc = {p}_acc - 1;\n    }}",
+        ]
+    for i in range(stmts):
+        lines.append(body[i % len(body)])
+    if cold_call is not None:
+        lines.append(f"    if ({p}_n < 0) {{\n        {p}_acc = {p}_acc + f{cold_call}({p}_n, {p}_x);\n    }}")
+    lines.append(f"    return {p}_acc;")
+    lines.append("}")
+    return "\n".join(lines)
+
+def generate_program(num_funcs=100, stmts=20, constants=False, reached=None):
+    """Generates a valid Grammo program made of many independent functions.
+
+    ``main`` calls every generated function once and prints the sum.
+    With ``reached``, ``main`` calls only the first functions, and every
+    function calls the next one in a branch that never runs, but that the
+    compiler cannot remove: the others are reachable, so they are compiled,
+    but never called.
+
+    Args:
+        num_funcs (int): Number of functions besides ``main``.
+        stmts (int): Approximate number of statements per function.
+        constants (bool): Declare global constants and use them in the
+            functions (see ``generate_function``).
+        reached (int): Number of functions actually called (default: all).
+
+    Returns:
+        str: The Grammo source of the program.
+    """
+    parts = ["var G_DEBUG = false;\nvar G_SCALE = 3;"] if constants else []
+    reached = num_funcs if reached is None else reached
+    chained = reached < num_funcs
+    parts += [generate_function(i, stmts, constants, i + 1 if chained and i + 1 < num_funcs else None)
+              for i in range(num_funcs)]
+    calls = "\n".join(f"    m_total = m_total + f{i}({i % 7}, 0.5);" for i in range(reached))
+    parts.append(
+        "func void -> main() {\n"
+        "    var int: m_total;\n"
+        "    m_total = 0;\n"
+        f"{calls}\n"
+        '    <<! "total=" # (m_total);\n'
+        "    return;\n"
+        "}"
+    )
+    return "\n\n".join(parts) + "\n"
@@ -0,0 +1,114 @@
+"""On-disk caching helpers for the Grammo Compiler.
+
+Provides the user cache directory, atomic file writes, and the persistent
+cache for the LALR parser tables built by Lark.
+"""
+import os
+import sys
+import hashlib
+import uuid
+from pathlib import Path
+
+import lark
+from lark import Lark
+
+# Options that do not influence the generated parser tables.
+_UNHASHABLE_OPTIONS = ('transformer', 'postlex', 'lexer_callbacks', 'edit_terminals', '_plugins')
+
+def get_cache_dir(*parts):
+    """Returns (and creates) the Grammo cache directory.
+
+    The location can be overridden with the ``GRAMMO_CACHE_DIR`` environment
+    variable; otherwise the platform user cache directory is used.
+
+    Args:
+        *parts: Optional sub-directory components.
+
+    Returns:
+        Path: The cache directory path.
+    """
+    root = os.environ.get("GRAMMO_CACHE_DIR")
+    if root:
+        base = Path(root)
+    elif sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")) / "grammo" / "Cache"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches" / "grammo"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "grammo"
+
+    path = base.joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+def atomic_write_bytes(path, data):
+    """Writes a file atomically: readers see either the old or the new content.
+
+    Args:
+        path (Path): Destination path.
+        data (bytes): File content.
+    """
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+def parser_cache_key(grammar, options):
+    """Computes the cache key of a parser.
+
+    Args:
+        grammar (str): The grammar text.
+        options (dict): The Lark options used to build the parser.
+
+    Returns:
+        str: A hex digest identifying grammar, options, Lark and Python versions.
+    """
+    h = hashlib.sha256()
+    h.update(grammar.encode("utf-8"))
+    for name in sorted(options):
+        if name not in _UNHASHABLE_OPTIONS:
+            h.update(f"\0{name}={options[name]!r}".encode("utf-8"))
+    h.update(f"\0lark={lark.__version__}\0py={sys.version_info[:2]}".encode("utf-8"))
+    return h.hexdigest()
+
+def load_cached_parser(grammar, cache_dir=None, **options):
+    """Builds a Lark LALR parser, reusing the tables stored on disk if possible.
+
+    The serialized parser is stored in the user cache directory under a name
+    derived from ``parser_cache_key``, so a grammar change (or a Lark upgrade)
+    simply selects a new cache entry. Entries are published with an atomic
+    rename, which makes the cache safe to share between processes that start
+    at the same time: each one either loads a complete entry or builds the
+    parser itself.
+
+    Args:
+        grammar (str): The grammar text.
+        cache_dir (Path): Cache directory (default: ``get_cache_dir("parser")``).
+        **options: Options forwarded to ``Lark``.
+
+    Returns:
+        Lark: The parser instance.
+    """
+    try:
+        cache_dir = Path(cache_dir) if cache_dir else get_cache_dir("parser")
+    except OSError:
+        return Lark(grammar, **options)
+
+    path = cache_dir / f"grammo-{parser_cache_key(grammar, options)}.lark"
+    if path.exists():
+        # Lark validates the entry and falls back to a rebuild if it is unusable.
+        return Lark(grammar, cache=str(path), **options)
+
+    tmp = str(path.with_name(f"{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp"))
+    try:
+        parser = Lark(grammar, cache=tmp, **options)
+        if os.path.exists(tmp):
+            os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+    return parser
@@ -0,0 +1,145 @@
+"""Thin client of the compile-and-run daemon.
+
+Takes the same arguments as ``main`` and behaves the same way, but the work
+is done by the warm daemon (see ``daemon``): the client only sends the
+request and its standard input, output and error, and exits with the status
+of the job. If no daemon is listening, the compiler runs in this process.
+
+Only the standard library is imported, so the client starts quickly.
+
+Usage:
+    python -m src.grammo.client FILE [main options]
+"""
+import json
+import os
+import socket
+import struct
+import sys
+import tempfile
+
+# Size of the socket reads
+_RECV_SIZE = 1 << 16
+
+# The struct ucred returned by SO_PEERCRED: pid, uid, gid
+_UCRED = struct.Struct("3i")
+
+# Environment variables sent to the job, besides the GRAMMO_ ones: where the
+# cache is, and the C compiler of --emit-exe and where to look for it
+JOB_ENVIRONMENT = ("HOME", "XDG_CACHE_HOME", "TMPDIR", "PATH", "CC")
+
+def socket_path():
+    """Returns the path of the daemon socket.
+
+    ``GRAMMO_DAEMON_SOCKET`` if set, otherwise a socket in the runtime
+    directory, or in a private per-user directory of the temporary directory.
+    """
+    path = os.environ.get("GRAMMO_DAEMON_SOCKET")
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "grammo-daemon.sock")
+    return os.path.join(tempfile.gettempdir(), f"grammo-{os.getuid()}", "daemon.sock")
+
+def check_private(path):
+    """Checks that a file belongs to the current user and is closed to the others.
+
+    Symbolic links are not followed, so a link is never private.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        PermissionError: If the file is not private.
+    """
+    st = os.lstat(path)
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(f"{path} is not private to the current user")
+
+def peer_uid(sock):
+    """Returns the user id of the process at the other end of a Unix socket."""
+    _, uid, _ = _UCRED.unpack(sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _UCRED.size))
+    return uid
+
+def send_message(sock, message, fds=()):
+    """Sends a JSON message, and the file descriptors ``fds`` with its first bytes."""
+    data = json.dumps(message).encode("utf-8") + b"\n"
+    sent = socket.send_fds(sock, [data], list(fds)) if fds else 0
+    sock.sendall(data[sent:])
+
+def recv_message(sock, maxfds=0):
+    """Receives a JSON message and the file descriptors sent with it.
+
+    Returns:
+        tuple: The message (None if the peer closed the connection first)
+        and the list of received file descriptors.
+    """
+    if maxfds:
+        data, fds, _, _ = socket.recv_fds(sock, _RECV_SIZE, maxfds)
+    else:
+        data, fds = sock.recv(_RECV_SIZE), []
+    while data and not data.endswith(b"\n"):
+        chunk = sock.recv(_RECV_SIZE)
+        if not chunk:
+            break
+        data += chunk
+    message = json.loads(data) if data.endswith(b"\n") else None
+    return message, fds
+
+def run(argv, fds=(0, 1, 2)):
+    """Runs a compiler invocation on the daemon.
+
+    Args:
+        argv (list[str]): The command-line arguments of ``main``.
+        fds (tuple[int]): The standard input, output and error of the job.
+
+    Nothing is sent unless the socket, its directory and the daemon belong
+    to the current user: the job gets the client's descriptors.
+
+    Returns:
+        int: The exit status of the job (128 + the signal number if it was
+        killed by a signal), or None if no daemon is listening.
+    """
+    if not hasattr(socket, "send_fds") or not hasattr(socket, "SO_PEERCRED"):
+        return None
+    path = socket_path()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        check_private(os.path.dirname(os.path.abspath(path)))
+        check_private(path)
+        sock.connect(path)
+        if peer_uid(sock) != os.getuid():
+            raise PermissionError(f"The daemon listening on {path} belongs to another user")
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+    except PermissionError as e:
+        sock.close()
+        print(f"WARNING: Not using the daemon: {e}", file=sys.stderr)
+        return None
+    with sock:
+        env = {name: value for name, value in os.environ.items()
+               if name.startswith("GRAMMO_") or name in JOB_ENVIRONMENT}
+        request = {"argv": list(argv), "cwd": os.getcwd(), "env": env}
+        send_message(sock, request, fds)
+        reply, _ = recv_message(sock)
+    if reply is None:
+        # The daemon went away before the job ended
+        return 1
+    status = reply["status"]
+    return 128 - status if status < 0 else status
+
+def main():
+    """Client entry point."""
+    argv = sys.argv[1:]
+    try:
+        status = run(argv)
+    except KeyboardInterrupt:
+        # Closing the connection makes the daemon kill the job
+        sys.exit(130)
+    if status is None:
+        from .main import main as compile_main
+        compile_main(argv)
+        return
+    sys.exit(status)
+
+if __name__ == "__main__":
+    main()
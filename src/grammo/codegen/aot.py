@@ -0,0 +1,109 @@
+"""Ahead-of-time compilation of Grammo programs to object files and executables."""
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+import llvmlite.binding as llvm
+from .target import TargetSpec
+
+# Name of the Grammo main function in AOT builds
+ENTRY_NAME = "grammo_main"
+
+# C entry point calling the Grammo main function
+C_MAIN_IR = """
+declare void @{entry}()
+
+define i32 @main() {{
+entry:
+  call void @{entry}()
+  ret i32 0
+}}
+"""
+
+class AOTCompiler:
+    """Emits native object files and links standalone executables.
+
+    The Grammo ``void main()`` is renamed to ``grammo_main`` and called by a
+    C ``int main()`` added to the module, so the object can be linked like
+    any C program against the system C library.
+
+    Attributes:
+        target_machine: The target machine used to emit the object code.
+    """
+
+    def __init__(self, target=None):
+        """Initializes the target machine.
+
+        Args:
+            target (TargetSpec): The target of the generated code (default: the host CPU).
+        """
+        target = target or TargetSpec()
+        # Position-independent code links into PIE executables as well
+        self.target_machine = target.create_target_machine(reloc="pic", codemodel="default")
+
+    def add_c_main(self, module_ref):
+        """Renames the Grammo main function and adds the C entry point.
+
+        Args:
+            module_ref (llvmlite.binding.ModuleRef): The optimized module.
+
+        Raises:
+            RuntimeError: If the module has no 'main' function.
+        """
+        try:
+            main = module_ref.get_function("main")
+        except NameError:
+            raise RuntimeError("Could not find 'main' function in the module.")
+        main.name = ENTRY_NAME
+
+        wrapper = llvm.parse_assembly(C_MAIN_IR.format(entry=ENTRY_NAME))
+        wrapper.triple = module_ref.triple
+        wrapper.data_layout = module_ref.data_layout
+        module_ref.link_in(wrapper)
+
+    def emit_object(self, module_ref, path):
+        """Writes the object file of a module with its C entry point.
+
+        Args:
+            module_ref (llvmlite.binding.ModuleRef): The optimized module.
+            path (str | Path): Output path of the object file.
+        """
+        self.add_c_main(module_ref)
+        Path(path).write_bytes(self.target_machine.emit_object(module_ref))
+
+    def emit_executable(self, module_ref, path, cc=None):
+        """Compiles a module and links it into an executable.
+
+        Args:
+            module_ref (llvmlite.binding.ModuleRef): The optimized module.
+            path (str | Path): Output path of the executable.
+            cc (str): C compiler used as linker (default: ``find_c_compiler()``).
+
+        Raises:
+            RuntimeError: If no C compiler is found or linking fails.
+        """
+        cc = cc or self.find_c_compiler()
+        if cc is None:
+            raise RuntimeError("No C compiler found to link the executable (set CC).")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            obj = Path(tmp) / "program.o"
+            self.emit_object(module_ref, obj)
+            result = subprocess.run([cc, str(obj), "-o", str(path)], capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"Linking with {cc} failed:\n{result.stderr.strip()}")
+
+    @staticmethod
+    def find_c_compiler():
+        """Returns the path of the system C compiler, or None.
+
+        The ``CC`` environment variable takes precedence over cc, gcc and clang.
+        """
+        for name in (os.environ.get("CC"), "cc", "gcc", "clang"):
+            if name:
+                path = shutil.which(name)
+                if path:
+                    return path
+        return None
@@ -0,0 +1,76 @@
+"""Batch wrappers: a function applied element-wise to arrays.
+
+The batch wrapper of an exported function ``f(a, b)`` is::
+
+    void f.batch(a* in0, b* in1, r* out, i64 n)    // out[i] = f(in0[i], in1[i])
+
+so a caller holding arrays pays one foreign call for all the elements
+instead of one per element, and once ``f`` is inlined the loop is a plain
+counted loop over contiguous memory, which LLVM can vectorize.
+
+In memory, ``int`` elements are ``i32``, ``real`` elements ``double`` and
+``bool`` elements bytes (zero is false).
+"""
+from llvmlite import ir
+
+I8 = ir.IntType(8)
+I64 = ir.IntType(64)
+
+def batch_name(name):
+    """Name of the batch wrapper of a function."""
+    return f"{name}.batch"
+
+def define_batch_wrapper(func):
+    """Defines the batch wrapper of a function with scalar parameters and result.
+
+    Args:
+        func (ir.Function): The function to apply element-wise.
+
+    Returns:
+        ir.Function: The wrapper, with external linkage.
+    """
+    elements = [_element_type(t) for t in (*func.ftype.args, func.ftype.return_type)]
+    wrapper_ty = ir.FunctionType(ir.VoidType(), [t.as_pointer() for t in elements] + [I64])
+    wrapper = ir.Function(func.module, wrapper_ty, name=batch_name(func.name))
+    wrapper.attributes.add("nounwind")
+    *inputs, out, n = wrapper.args
+    n.name = "n"
+    for i, arg in enumerate(inputs):
+        arg.name = f"in{i}"
+        arg.add_attribute("nocapture")
+        # Not in the llvmlite list of known attributes
+        set.add(arg.attributes, "readonly")
+    out.name = "out"
+    out.add_attribute("nocapture")
+    set.add(out.attributes, "writeonly")
+
+    entry = wrapper.append_basic_block(name="entry")
+    loop = wrapper.append_basic_block(name="loop")
+    done = wrapper.append_basic_block(name="done")
+    builder = ir.IRBuilder(entry)
+    builder.cbranch(builder.icmp_signed('>', n, I64(0)), loop, done)
+
+    builder.position_at_end(loop)
+    i = builder.phi(I64, name="i")
+    i.add_incoming(I64(0), entry)
+    args = []
+    for arg, param_type in zip(inputs, func.ftype.args):
+        value = builder.load(builder.gep(arg, [i], inbounds=True))
+        if param_type == ir.IntType(1):
+            value = builder.icmp_unsigned('!=', value, I8(0))
+        args.append(value)
+    result = builder.call(func, args)
+    if func.ftype.return_type == ir.IntType(1):
+        result = builder.zext(result, I8)
+    builder.store(result, builder.gep(out, [i], inbounds=True))
+    next_i = builder.add(i, I64(1), name="next")
+    i.add_incoming(next_i, loop)
+    builder.cbranch(builder.icmp_signed('<', next_i, n), loop, done)
+
+    builder.position_at_end(done)
+    builder.ret_void()
+    return wrapper
+
+def _element_type(ty):
+    """Type of the array elements holding values of a scalar type."""
+    return I8 if ty == ir.IntType(1) else ty
@@ -1,28 +1,141 @@
 from llvmlite import ir, binding
 from ..semantic import ast_nodes as ast
+from ..semantic.effects import EffectAnalyzer
+from .runtime import StringRuntime, OutputRuntime, InputRuntime, literal_name
+from .batch import define_batch_wrapper
+from .stubs import load_function
+from .memo import memo_body_name, memo_table_name, declare_memo_table, define_memo_wrapper
+
+# Prefix of the symbols of the program's functions and global variables.
+# Grammo identifiers cannot contain a dot, so a program symbol never clashes
+# with the C library or the runtime, whatever the program names it.
+SYMBOL_PREFIX = "g."
+
+def symbol_name(name):
+    """Returns the LLVM symbol of a function or global variable of the program.
+
+    ``main`` keeps its name: it is the entry point of the executables.
+    """
+    return name if name == 'main' else f"{SYMBOL_PREFIX}{name}"
 
 class CodeGenerator:
     """Generates LLVM IR from the Grammo AST.
 
+    The AST must have been validated by the SemanticAnalyzer: code is selected
+    from the ``expr_type`` annotations and int -> real promotions are explicit
+    ``Coercion`` nodes.
+
+    In SSA mode, scalar locals and parameters (int, real, bool) whose address
+    is never needed are kept in SSA registers instead of ``alloca`` slots: the
+    current value of each variable is tracked while the structured control
+    flow is generated, and phi nodes are placed at if merges and loop headers.
+
+    Strings use the length-carrying, reference-counted representation of
+    ``runtime``: a string stored in a variable, passed to a function or
+    returned owns a reference, so ``s = s + x`` can extend ``s`` in place when
+    no one else sees it. Strings built by an expression are released once
+    used, the old value of a variable when it is overwritten, and the string
+    locals and parameters when the function returns.
+
+    The functions and global variables of the program are named by
+    ``symbol_name``, apart from the symbols of the runtime and the C library.
+
+    A program is a closed world rooted at ``main``: the other functions and
+    the global variables get internal linkage, the globals that are never
+    written are constants, and the functions carry the attributes derived
+    from their effects (``nounwind``, plus ``memory(none)``/``memory(read)``
+    and ``willreturn`` where the effect analysis proves them).
+
+    Functions listed in ``exports`` are entry points called from outside,
+    like ``main``: they keep external linkage, and flush the output buffer
+    when they return if they print. With ``batch``, each one also gets a
+    wrapper applying it element-wise to arrays (see ``batch``).
+
+    In lazy mode (see ``lazy``) a module holds the functions generated into
+    it and declares the rest of the program as needed: calls go through the
+    slot of the callee, filled on its first call (see ``stubs``).
+
+    The functions the effect analysis selects for memoization are wrapped
+    by a lookup in a memo table (see ``memo``).
+
+    Each output statement is formatted with a single ``snprintf`` into the
+    buffer of the output runtime, unless ``buffered_output`` is disabled, in
+    which case every argument is printed with its own ``printf`` call.
+
     Attributes:
         module: The LLVM module being generated.
         builder: The LLVM IR builder.
         func_symtab: A symbol table for function-local variables.
         current_func: The current LLVM function being compiled.
+        ssa: Whether scalar locals are built directly in SSA form.
+        ssa_vars: Types of the SSA-promoted variables of the current function.
+        ssa_values: Current SSA value of each promoted variable.
+        strings: The string runtime emitted into the module.
+        string_slots: Slots of the string locals and parameters of the current function.
+        buffered_output: Whether output goes through the output runtime buffer.
+        output: The output runtime emitted into the module.
+        input: The buffered input runtime emitted into the module.
+        shard: Whether literal globals are named after their content.
+        effects: The effect analysis of the program.
+        exports: Names of the functions called from outside the module.
+        batch: Whether the exported functions get a batch wrapper.
+        lazy: In lazy mode, the top-level declarations of the program by name.
+        flush_on_return: Whether the current function flushes the output buffer when it returns.
     """
 
-    def __init__(self):
-        """Initializes the code generator."""
+    # printf conversion and maximum formatted size of the scalar types
+    PRINT_FORMATS = {
+        'int': ("%d", 11),
+        'bool': ("%d", 1),
+        'real': ("%.6f", 320),
+    }
+
+    def __init__(self, ssa=False, buffered_output=True, shard=False, effects=None, exports=(), batch=False,
+                 lazy=None):
+        """Initializes the code generator.
+
+        Args:
+            ssa (bool): Build scalar locals directly in SSA form.
+            buffered_output (bool): Print through the buffered output runtime.
+            shard (bool): The module is one of several generated separately
+                and linked together: literal globals are named after their
+                content, so equal literals of different shards are merged.
+                The functions keep external linkage, so the shards can call
+                each other.
+            effects (EffectAnalyzer): The effect analysis of the program
+                (default: run on the program by ``visit``).
+            exports (Iterable[str]): Functions called from outside the module,
+                besides ``main``.
+            batch (bool): Emit the batch wrappers of the exported functions,
+                which must have scalar parameters and result.
+            lazy (dict): Generate for the lazy JIT: the top-level declarations
+                (functions and global variables) of the program, by name.
+        """
         self.module = ir.Module(name="grammo_module")
         self.module.triple = binding.get_default_triple()
         self.builder = None
         self.func_symtab = {}
         self.current_func = None
+
+        self.ssa = ssa
+        self.ssa_vars = {}
+        self.ssa_values = {}
         
         # Standard library declarations
         self.printf = None
-        self.scanf = None
+        self.fflush = None
         self._declare_stdlib()
+        self.shard = shard
+        self.effects = effects
+        self.exports = set(exports)
+        self.batch = batch
+        self.lazy = lazy
+        self.flush_on_return = False
+        self.strings = StringRuntime(self.module, content_names=shard)
+        self.string_slots = []
+        self.buffered_output = buffered_output
+        self.output = OutputRuntime(self.module)
+        self.input = InputRuntime(self.module, self.strings)
 
         # String constants management
         self.string_counter = 0
@@ -38,32 +151,23 @@ class CodeGenerator:
         }
 
     def _declare_stdlib(self):
-        """Declares standard library functions (printf, scanf, etc.) in the module."""
+        """Declares standard library functions (printf, snprintf, fflush) in the module."""
         # void printf(i8*, ...)
         void_ptr_type = ir.IntType(8).as_pointer()
         printf_ty = ir.FunctionType(ir.IntType(32), [void_ptr_type], var_arg=True)
         self.printf = ir.Function(self.module, printf_ty, name="printf")
         
-        # int scanf(i8*, ...)
-        scanf_ty = ir.FunctionType(ir.IntType(32), [void_ptr_type], var_arg=True)
-        self.scanf = ir.Function(self.module, scanf_ty, name="scanf")
-        
-        # String utils
-        # i64 strlen(i8*)
-        strlen_ty = ir.FunctionType(ir.IntType(64), [void_ptr_type])
-        self.strlen = ir.Function(self.module, strlen_ty, name="strlen")
-        
-        # i8* malloc(i64)
-        malloc_ty = ir.FunctionType(void_ptr_type, [ir.IntType(64)])
-        self.malloc = ir.Function(self.module, malloc_ty, name="malloc")
-        
-        # i8* strcpy(i8*, i8*)
-        strcpy_ty = ir.FunctionType(void_ptr_type, [void_ptr_type, void_ptr_type])
-        self.strcpy = ir.Function(self.module, strcpy_ty, name="strcpy")
-        
-        # i8* strcat(i8*, i8*)
-        strcat_ty = ir.FunctionType(void_ptr_type, [void_ptr_type, void_ptr_type])
-        self.strcat = ir.Function(self.module, strcat_ty, name="strcat")
+        # int fflush(FILE*)
+        fflush_ty = ir.FunctionType(ir.IntType(32), [void_ptr_type])
+        self.fflush = ir.Function(self.module, fflush_ty, name="fflush")
+
+        # int snprintf(i8*, i64, i8*, ...)
+        snprintf_ty = ir.FunctionType(ir.IntType(32), [void_ptr_type, ir.IntType(64), void_ptr_type], var_arg=True)
+        self.snprintf = ir.Function(self.module, snprintf_ty, name="snprintf")
+
+        # C functions do not unwind
+        for func in (self.printf, self.fflush, self.snprintf):
+            func.attributes.add("nounwind")
 
     def _get_llvm_type(self, type_name):
         """Maps Grammo types to LLVM types."""
@@ -79,6 +183,21 @@ class CodeGenerator:
 
     def visit_Program(self, node: ast.Program):
         """Generates code for the program declarations."""
+        self._declare_program(node)
+
+        # 2. Function Bodies
+        for decl in node.decls:
+            if isinstance(decl, ast.FuncDef):
+                self._generate_body(decl)
+        
+        return self.module
+
+    def _declare_program(self, node: ast.Program):
+        """Declares the prototypes of all functions and creates the global variables."""
+        if self.effects is None:
+            self.effects = EffectAnalyzer()
+            self.effects.analyze(node)
+
         # Pass 1: Declare all functions and globals first
         for decl in node.decls:
             if isinstance(decl, ast.FuncDef):
@@ -92,13 +211,6 @@ class CodeGenerator:
                  self._declare_prototype(decl)
              elif isinstance(decl, (ast.VarDecl, ast.VarInit)):
                  self.visit(decl) # Create global vars immediately
-        
-        # 2. Function Bodies
-        for decl in node.decls:
-            if isinstance(decl, ast.FuncDef):
-                self._generate_body(decl)
-        
-        return self.module
 
     def visit_VarDecl(self, node: ast.VarDecl):
         """Generates code for a variable declaration."""
@@ -107,75 +219,192 @@ class CodeGenerator:
         if node.type_name == 'real':
             init_const = ir.Constant(llvm_type, 0.0)
         elif node.type_name == 'string':
-            init_const = ir.Constant(llvm_type, None)
+            init_const = self.strings.literal("")
         else:
             init_const = ir.Constant(llvm_type, 0)
 
         if self.builder is None:
             for name in node.names:
-                gvar = ir.GlobalVariable(self.module, llvm_type, name=name)
-                gvar.initializer = init_const
+                self._global_variable(name, llvm_type, init_const)
         else:
             for name in node.names:
+                if name in self.ssa_vars:
+                    self.ssa_values[name] = init_const
+                    continue
+                if node.type_name == 'string':
+                    # The slot was created in the entry block
+                    self._store_string(self.func_symtab[name], init_const)
+                    continue
                 alloca = self.builder.alloca(llvm_type, name=name)
                 self.func_symtab[name] = alloca
                 self.builder.store(init_const, alloca)
 
     def visit_VarInit(self, node: ast.VarInit):
         """Generates code for a variable initialization."""
-        val = self.visit(node.value)
+        val = self._owned_value(node.value)
+        llvm_type = self._get_llvm_type(node.value.type_name)
         
         if self.builder is None:
-             gvar = ir.GlobalVariable(self.module, val.type, name=node.name)
-             gvar.initializer = val
+            self._global_variable(node.name, llvm_type, val)
+        elif node.name in self.ssa_vars:
+            self.ssa_values[node.name] = val
+        elif node.value.type_name == 'string':
+            self._store_string(self.func_symtab[node.name], val)
         else:
-            alloca = self.builder.alloca(val.type, name=node.name)
+            alloca = self.builder.alloca(llvm_type, name=node.name)
             self.builder.store(val, alloca)
             self.func_symtab[node.name] = alloca
 
-    def _declare_prototype(self, node: ast.FuncDef):
-        """Creates the function prototype and adds it to the module."""
+    def _function_type(self, node: ast.FuncDef):
         ret_type = self._get_llvm_type(node.return_type)
         param_types = [self._get_llvm_type(p.type_name) for p in node.params]
-        func_ty = ir.FunctionType(ret_type, param_types)
+        return ir.FunctionType(ret_type, param_types)
+
+    def _declare_prototype(self, node: ast.FuncDef):
+        """Creates the function prototype and adds it to the module."""
+        func_ty = self._function_type(node)
+        name = symbol_name(node.name)
 
-        if node.name in self.module.globals:
-             return self.module.globals[node.name]
+        if name in self.module.globals:
+             return self.module.globals[name]
              
-        func = ir.Function(self.module, func_ty, name=node.name)
+        func = ir.Function(self.module, func_ty, name=name)
+        functions = [func]
+        if self.effects and node.name in self.effects.memoized:
+            functions.append(ir.Function(self.module, func_ty, name=memo_body_name(name)))
+            declare_memo_table(self.module, func)
+
+        if node.name in self.exports:
+            # Called through the C ABI, where a bool is a zero-extended byte
+            if node.return_type == 'bool':
+                func.return_value.add_attribute("zeroext")
+            for arg, param in zip(func.args, node.params):
+                if param.type_name == 'bool':
+                    arg.add_attribute("zeroext")
+
+        effects = self.effects.functions.get(node.name) if self.effects else None
+        for f in functions:
+            f.attributes.add("nounwind")
+            # main flushes the output buffer when it returns, and lazy
+            # calls may compile the callee
+            if effects is not None and node.name != 'main' and self.lazy is None:
+                if effects.memory == 'none':
+                    f.attributes.add("readnone")
+                elif effects.memory == 'read':
+                    f.attributes.add("readonly")
+                if effects.memory is not None and effects.terminates:
+                    # Not in the llvmlite list of known attributes
+                    set.add(f.attributes, "willreturn")
         return func
 
+    def _global_variable(self, name, llvm_type, init):
+        """Creates a global variable of the program."""
+        gvar = ir.GlobalVariable(self.module, llvm_type, name=symbol_name(name))
+        gvar.initializer = init
+        gvar.linkage = "internal"
+        gvar.global_constant = name not in self.effects.written_globals
+        return gvar
+
     def _generate_body(self, node: ast.FuncDef):
         """Generates the body of the function."""
-        func = self.module.globals.get(node.name)
+        func = self.module.globals.get(symbol_name(node.name))
         if not func:
             raise ValueError(f"Function {node.name} prototype not found during body generation.")
 
+        if node.name != 'main' and node.name not in self.exports and not self.shard:
+            func.linkage = "internal"
+        if self.batch and node.name in self.exports:
+            define_batch_wrapper(func)
+        if self.effects and node.name in self.effects.memoized:
+            body = self.module.globals[memo_body_name(func.name)]
+            define_memo_wrapper(func, body, self.module.globals[memo_table_name(func.name)])
+            if not self.shard:
+                body.linkage = "internal"
+            func = body
         block = func.append_basic_block(name="entry")
         self.builder = ir.IRBuilder(block)
         self.current_func = func
         self.func_symtab = {}
+        self.ssa_vars = self._collect_ssa_vars(node) if self.ssa else {}
+        self.ssa_values = {}
+        # main flushes in any case: it may call functions that print
+        self.flush_on_return = self.buffered_output and (
+            node.name == 'main'
+            or (node.name in self.exports and self.effects is not None and self.effects.functions[node.name].io))
 
         for i, arg in enumerate(func.args):
             arg.name = node.params[i].name
+            if arg.name in self.ssa_vars:
+                self.ssa_values[arg.name] = arg
+                continue
             alloca = self.builder.alloca(arg.type, name=arg.name)
             self.builder.store(arg, alloca)
             self.func_symtab[arg.name] = alloca
 
+        self.string_slots = [self.func_symtab[p.name] for p in node.params if p.type_name == 'string']
+        self._declare_string_locals(node)
+
         self.visit(node.body)
         
         if not self.builder.block.is_terminated:
             if node.return_type == 'void':
-                self.builder.ret_void()
+                self._emit_return()
             else:
                 self.builder.unreachable()
             
         self.builder = None
         self.current_func = None
+        self.ssa_vars = {}
+        self.ssa_values = {}
+        self.string_slots = []
+        self.flush_on_return = False
+
+    def _declare_string_locals(self, node: ast.FuncDef):
+        """Creates the slots of the string locals in the entry block.
+
+        The slots start as the empty string, so every string local can be
+        released on any return path, even if its declaration was not reached.
+        """
+        empty = self.strings.literal("")
+        for n in ast.walk(node.body):
+            if isinstance(n, ast.VarDecl) and n.type_name == 'string':
+                names = n.names
+            elif isinstance(n, ast.VarInit) and n.value.type_name == 'string':
+                names = [n.name]
+            else:
+                continue
+            for name in names:
+                alloca = self.builder.alloca(self.type_map['string'], name=name)
+                self.builder.store(empty, alloca)
+                self.func_symtab[name] = alloca
+                self.string_slots.append(alloca)
+
+    def _collect_ssa_vars(self, node: ast.FuncDef):
+        """Selects the locals of a function that can live in SSA registers.
+
+        Scalar parameters and locals qualify unless they are the target of an
+        input statement, which needs their address.
+        """
+        candidates = {p.name: p.type_name for p in node.params}
+        address_taken = set()
+        for n in ast.walk(node.body):
+            if isinstance(n, ast.VarDecl):
+                candidates.update((name, n.type_name) for name in n.names)
+            elif isinstance(n, ast.VarInit):
+                candidates[n.name] = n.value.type_name
+            elif isinstance(n, ast.InputStmt):
+                for arg in n.args:
+                    if isinstance(arg, ast.UnaryExpr) and arg.operator == '#':
+                        while isinstance(arg, ast.UnaryExpr) and arg.operator == '#':
+                            arg = arg.operand
+                        if isinstance(arg, ast.VarRef):
+                            address_taken.add(arg.name)
+        return {name: self.type_map[type_name] for name, type_name in candidates.items()
+                if type_name in ('int', 'real', 'bool') and name not in address_taken}
 
     def visit_FuncDef(self, node: ast.FuncDef):
         """Legacy visitor method - now handled via split passes in Program."""
-        if node.name not in self.module.globals:
+        if symbol_name(node.name) not in self.module.globals:
             self._declare_prototype(node)
         self._generate_body(node)
 
@@ -190,28 +419,32 @@ class CodeGenerator:
                 break
 
     def visit_AssignStmt(self, node: ast.AssignStmt):
-        val = self.visit(node.value)
-        ptr = self._lookup_var(node.name)
+        appended = self._append_operands(node)
+        if appended:
+            self._append_in_place(node.name, appended)
+            return
 
-        if ptr.type.pointee == ir.DoubleType() and val.type == ir.IntType(32):
-            val = self.builder.sitofp(val, ir.DoubleType())
-            
-        self.builder.store(val, ptr)
+        val = self._owned_value(node.value)
+        if node.name in self.ssa_vars:
+            self.ssa_values[node.name] = val
+            return
+        ptr = self._lookup_var(node.name)
+        if node.value.expr_type == 'string':
+            self._store_string(ptr, val)
+        else:
+            self.builder.store(val, ptr)
 
     def visit_ReturnStmt(self, node: ast.ReturnStmt):
         if node.value:
-            val = self.visit(node.value)
-
-            if self.current_func.function_type.return_type == ir.DoubleType() and val.type == ir.IntType(32):
-                val = self.builder.sitofp(val, ir.DoubleType())
-            self.builder.ret(val)
+            self._emit_return(self._owned_value(node.value))
         else:
-            self.builder.ret_void()
+            self._emit_return()
 
     def visit_IfStmt(self, node: ast.IfStmt):
         # 1. Evaluate Condition
         cond = self.visit(node.condition)
         start_block = self.builder.block
+        start_values = dict(self.ssa_values)
 
         # 2. Create Blocks (but not Merge yet)
         then_block = self.current_func.append_basic_block(name="if_then")
@@ -220,13 +453,16 @@ class CodeGenerator:
         if node.else_block or node.elifs:
             next_block = self.current_func.append_basic_block(name="next_branch")
 
+        # (block, SSA values) of every edge reaching the merge block
         jumps_to_merge = []
+        if not next_block:
+            jumps_to_merge.append((start_block, start_values))
 
         # 3. Populate Then Block
         self.builder.position_at_start(then_block)
         self.visit(node.then_block)
         if not self.builder.block.is_terminated:
-            jumps_to_merge.append(self.builder.block)
+            jumps_to_merge.append((self.builder.block, self.ssa_values))
 
         # 4. Populate Next Block (Elifs / Else)
         elif_branches_to_patch = []
@@ -237,6 +473,7 @@ class CodeGenerator:
             # Elifs
             for i, elif_clause in enumerate(node.elifs):
                 self.builder.position_at_start(curr_bb)
+                self.ssa_values = dict(start_values)
                 elif_cond = self.visit(elif_clause.condition)
                 
                 elif_then_bb = self.current_func.append_basic_block(name=f"elif_{i}_then")
@@ -249,19 +486,21 @@ class CodeGenerator:
                     curr_bb = elif_next_bb
                 else:
                     elif_branches_to_patch.append((self.builder.block, elif_cond, elif_then_bb))
+                    jumps_to_merge.append((self.builder.block, dict(self.ssa_values)))
                 
                 # Elif Body
                 self.builder.position_at_start(elif_then_bb)
                 self.visit(elif_clause.block)
                 if not self.builder.block.is_terminated:
-                    jumps_to_merge.append(self.builder.block)
+                    jumps_to_merge.append((self.builder.block, self.ssa_values))
 
             # Else
             if node.else_block:
                 self.builder.position_at_start(curr_bb)
+                self.ssa_values = dict(start_values)
                 self.visit(node.else_block)
                 if not self.builder.block.is_terminated:
-                    jumps_to_merge.append(self.builder.block)
+                    jumps_to_merge.append((self.builder.block, self.ssa_values))
         
         # 5. Create Merge Block (LAST)
         merge_block = self.current_func.append_basic_block(name="if_merge")
@@ -278,32 +517,40 @@ class CodeGenerator:
             self.builder.position_at_end(blk)
             self.builder.cbranch(e_cond, true_dest, merge_block)
             
-        for blk in jumps_to_merge:
-            self.builder.position_at_end(blk)
-            self.builder.branch(merge_block)
+        # Edges from start_block and from the last elif condition were patched above
+        for blk, _ in jumps_to_merge:
+            if not blk.is_terminated:
+                self.builder.position_at_end(blk)
+                self.builder.branch(merge_block)
 
         # 7. Continue
         self.builder.position_at_start(merge_block)
+        self._ssa_merge(jumps_to_merge, start_values)
 
     def visit_WhileStmt(self, node: ast.WhileStmt):
         cond_block = self.current_func.append_basic_block(name="while_cond")
         body_block = self.current_func.append_basic_block(name="while_body")
         end_block = self.current_func.append_basic_block(name="while_end")
         
+        preheader = self.builder.block
         self.builder.branch(cond_block)
         
         # Condition
         self.builder.position_at_start(cond_block)
+        header_phis = self._ssa_loop_header(preheader, node.body)
         cond = self.visit(node.condition)
         self.builder.cbranch(cond, body_block, end_block)
+        exit_values = dict(self.ssa_values)
         
         # Body
         self.builder.position_at_start(body_block)
         self.visit(node.body)
         if not self.builder.block.is_terminated:
+            self._ssa_loop_latch(header_phis)
             self.builder.branch(cond_block)
             
         self.builder.position_at_start(end_block)
+        self.ssa_values = exit_values
 
     def visit_ForStmt(self, node: ast.ForStmt):
         if node.init:
@@ -313,38 +560,39 @@ class CodeGenerator:
         body_block = self.current_func.append_basic_block(name="for_body")
         end_block = self.current_func.append_basic_block(name="for_end")
         
+        preheader = self.builder.block
         self.builder.branch(cond_block)
         
         # Condition
         self.builder.position_at_start(cond_block)
+        header_phis = self._ssa_loop_header(preheader, node.body, node.update)
         if node.condition:
             cond = self.visit(node.condition)
             self.builder.cbranch(cond, body_block, end_block)
         else:
             self.builder.branch(body_block) # Infinite loop if no cond
+        exit_values = dict(self.ssa_values)
             
         # Body
         self.builder.position_at_start(body_block)
         self.visit(node.body)
         
         # Update
-        if node.update:
+        if node.update and not self.builder.block.is_terminated:
             self.visit(node.update)
             
         if not self.builder.block.is_terminated:
+            self._ssa_loop_latch(header_phis)
             self.builder.branch(cond_block)
             
         self.builder.position_at_start(end_block)
+        self.ssa_values = exit_values
 
     def visit_OutputStmt(self, node: ast.OutputStmt):
-        for arg in node.args:
-            val = self.visit(arg)
-            self._print_val(val)
-        
-        if node.is_newline:
-            self._print_str("\n")
+        self._write(node.args, node.is_newline)
 
     def visit_InputStmt(self, node: ast.InputStmt):
+        prompts = []
         for arg in node.args:
             is_input_target = False
             curr_arg = arg
@@ -354,46 +602,33 @@ class CodeGenerator:
                 curr_arg = curr_arg.operand
 
             if is_input_target:
+                if prompts:
+                    self._write(prompts)
+                    prompts = []
+                # Show the prompt before waiting for the user
+                if self.buffered_output:
+                    self.builder.call(self.output.get('sync'), [])
+                else:
+                    self.builder.call(self.fflush, [ir.Constant(self.fflush.args[0].type, None)])
                 if isinstance(curr_arg, ast.VarRef):
                     ptr = self._lookup_var(curr_arg.name)
-                    val_type = ptr.type.pointee
-                    
-                    fmt = ""
-                    if val_type == ir.IntType(32):
-                        fmt = "%d"
-                    elif val_type == ir.DoubleType():
-                        fmt = "%lf"
-                    elif val_type == ir.IntType(8).as_pointer():
-                        
-                        size_const = ir.Constant(ir.IntType(64), 256)
-                        buf = self.builder.call(self.malloc, [size_const])
-                        
-                        fmt = "%255s" 
-                        fmt_ptr = self._get_global_string_ptr(fmt)
-                        self.builder.call(self.scanf, [fmt_ptr, buf])
-                        
-                        self.builder.store(buf, ptr)
-                        
-                        continue
-                    
-                    if fmt:
-                        fmt_ptr = self._get_global_string_ptr(fmt)
-                        self.builder.call(self.scanf, [fmt_ptr, ptr])
+                    val_type = curr_arg.expr_type
+
+                    if val_type == 'int':
+                        self.builder.call(self.input.get('read_int'), [ptr])
+                    elif val_type == 'real':
+                        self.builder.call(self.input.get('read_real'), [ptr])
+                    elif val_type == 'string':
+                        old = self.builder.load(ptr)
+                        self.builder.store(self.builder.call(self.input.get('read_string'), [old]), ptr)
             else:
-                val = self.visit(curr_arg)
-                self._print_val(val)
+                prompts.append(curr_arg)
+        if prompts:
+            self._write(prompts)
 
     def visit_ProcCallStmt(self, node: ast.ProcCallStmt):
-        func = self.module.globals.get(node.name)
-        args_vals = []
-        for i, arg in enumerate(node.args):
-            val = self.visit(arg)
-            if i < len(func.args):
-                 expected_type = func.args[i].type
-                 if expected_type == ir.DoubleType() and val.type == ir.IntType(32):
-                     val = self.builder.sitofp(val, ir.DoubleType())
-            args_vals.append(val)
-            
+        func = self._callee(node.name)
+        args_vals = [self._owned_value(arg) for arg in node.args]
         self.builder.call(func, args_vals)
 
     # ==========================
@@ -402,34 +637,32 @@ class CodeGenerator:
 
     def visit_Literal(self, node: ast.Literal):
         if node.type_name == 'int':
-            return ir.Constant(ir.IntType(32), int(node.value))
+            return ir.Constant(self.type_map['int'], int(node.value))
         elif node.type_name == 'real':
-            return ir.Constant(ir.DoubleType(), float(node.value))
+            return ir.Constant(self.type_map['real'], float(node.value))
         elif node.type_name == 'bool':
-            return ir.Constant(ir.IntType(1), 1 if node.value else 0)
+            return ir.Constant(self.type_map['bool'], 1 if node.value else 0)
         elif node.type_name == 'string':
-            return self._get_global_string_ptr(node.value)
-        return ir.Constant(ir.IntType(32), 0)
+            return self.strings.literal(node.value)
+        return ir.Constant(self.type_map['int'], 0)
 
     def visit_VarRef(self, node: ast.VarRef):
+        if node.name in self.ssa_vars:
+            return self.ssa_values[node.name]
         ptr = self._lookup_var(node.name)
         return self.builder.load(ptr, name=f"load_{node.name}")
 
     def visit_BinaryExpr(self, node: ast.BinaryExpr):
+        if node.operator in ('&&', '||'):
+            return self._short_circuit(node)
+
         lhs = self.visit(node.left)
         rhs = self.visit(node.right)
         
-        # Type balancing
-        types = [lhs.type, rhs.type]
-        if ir.DoubleType() in types:
-            if lhs.type == ir.IntType(32): lhs = self.builder.sitofp(lhs, ir.DoubleType())
-            if rhs.type == ir.IntType(32): rhs = self.builder.sitofp(rhs, ir.DoubleType())
-            is_float = True
-        else:
-            is_float = False
-            
+        # Operands have the same type: mixed int/real operands are coerced by the analyzer
+        operand_type = node.left.expr_type
         op = node.operator
-        if is_float:
+        if operand_type == 'real':
             if op == '+': return self.builder.fadd(lhs, rhs)
             if op == '-': return self.builder.fsub(lhs, rhs)
             if op == '*': return self.builder.fmul(lhs, rhs)
@@ -442,21 +675,8 @@ class CodeGenerator:
             if op == '>':  return self.builder.fcmp_ordered('>', lhs, rhs)
             if op == '>=': return self.builder.fcmp_ordered('>=', lhs, rhs)
         else:
-            is_lhs_ptr = '*' in str(lhs.type) or isinstance(lhs.type, ir.PointerType)
-            is_rhs_ptr = '*' in str(rhs.type) or isinstance(rhs.type, ir.PointerType)
-            
-            if is_lhs_ptr and is_rhs_ptr:
-                 if op == '+':
-                     # String concatenation
-                     len1 = self.builder.call(self.strlen, [lhs])
-                     len2 = self.builder.call(self.strlen, [rhs])
-                     total_len = self.builder.add(len1, len2)
-                     total_len = self.builder.add(total_len, ir.Constant(ir.IntType(64), 1))
-                     
-                     new_str = self.builder.call(self.malloc, [total_len])
-                     self.builder.call(self.strcpy, [new_str, lhs])
-                     self.builder.call(self.strcat, [new_str, rhs])
-                     return new_str
+            if operand_type == 'string':
+                return self._string_op(node, lhs, rhs)
 
             if op == '+': return self.builder.add(lhs, rhs)
             if op == '-': return self.builder.sub(lhs, rhs)
@@ -469,15 +689,53 @@ class CodeGenerator:
             if op == '<=': return self.builder.icmp_signed('<=', lhs, rhs)
             if op == '>':  return self.builder.icmp_signed('>', lhs, rhs)
             if op == '>=': return self.builder.icmp_signed('>=', lhs, rhs)
-            
-        # Bool ops
-        if op == '&&': return self.builder.and_(lhs, rhs)
-        if op == '||': return self.builder.or_(lhs, rhs)
+
+    def _string_op(self, node: ast.BinaryExpr, lhs, rhs):
+        """Generates string concatenation and comparison, releasing the temporaries."""
+        if node.operator == '+':
+            if self._is_temporary(node.left):
+                # A string built by the expression is owned here: extend it instead of copying
+                result = self.builder.call(self.strings.get('append'), [lhs, rhs])
+            else:
+                result = self.builder.call(self.strings.get('concat'), [lhs, rhs])
+            self._release_temporary(node.right, rhs)
+            return result
+
+        # Strings compare by reference
+        result = self.builder.icmp_unsigned('==' if node.operator == '==' else '!=', lhs, rhs)
+        self._release_temporary(node.left, lhs)
+        self._release_temporary(node.right, rhs)
+        return result
+
+    def _short_circuit(self, node: ast.BinaryExpr):
+        """Generates && / || so that the right operand is evaluated only if needed."""
+        is_and = node.operator == '&&'
+        lhs = self.visit(node.left)
+        lhs_block = self.builder.block
+
+        rhs_block = self.current_func.append_basic_block(name="and_rhs" if is_and else "or_rhs")
+        merge_block = self.current_func.append_basic_block(name="and_merge" if is_and else "or_merge")
+        if is_and:
+            self.builder.cbranch(lhs, rhs_block, merge_block)
+        else:
+            self.builder.cbranch(lhs, merge_block, rhs_block)
+
+        self.builder.position_at_start(rhs_block)
+        rhs = self.visit(node.right)
+        rhs_end_block = self.builder.block
+        self.builder.branch(merge_block)
+
+        # Expressions cannot assign variables, so the SSA values are unchanged
+        self.builder.position_at_start(merge_block)
+        result = self.builder.phi(self.type_map['bool'])
+        result.add_incoming(ir.Constant(self.type_map['bool'], 0 if is_and else 1), lhs_block)
+        result.add_incoming(rhs, rhs_end_block)
+        return result
         
     def visit_UnaryExpr(self, node: ast.UnaryExpr):
         operand = self.visit(node.operand)
         if node.operator == '-':
-            if isinstance(operand.type, ir.FloatType) or isinstance(operand.type, ir.DoubleType):
+            if node.expr_type == 'real':
                 return self.builder.fneg(operand)
             return self.builder.neg(operand)
         elif node.operator == '!':
@@ -486,26 +744,187 @@ class CodeGenerator:
             return operand
 
     def visit_FuncCallExpr(self, node: ast.FuncCallExpr):
-        func = self.module.globals.get(node.name)
-        args_vals = []
-        for i, arg in enumerate(node.args):
-            val = self.visit(arg)
-            if i < len(func.args):
-                 expected_type = func.args[i].type
-                 if expected_type == ir.DoubleType() and val.type == ir.IntType(32):
-                     val = self.builder.sitofp(val, ir.DoubleType())
-            args_vals.append(val)
-            
+        func = self._callee(node.name)
+        args_vals = [self._owned_value(arg) for arg in node.args]
         return self.builder.call(func, args_vals)
 
+    def visit_Coercion(self, node: ast.Coercion):
+        # The only implicit conversion in Grammo is int -> real
+        operand = self.visit(node.operand)
+        return self.builder.sitofp(operand, self.type_map['real'])
+
     # ==========================
     # Helpers
     # ==========================
 
+    def _ssa_merge(self, incoming, fallback):
+        """Sets the SSA values at the start of a merge block.
+
+        Args:
+            incoming: (predecessor block, SSA values) pairs, one per edge.
+            fallback: Values to use if the block is unreachable.
+        """
+        if not self.ssa_vars:
+            return
+        if not incoming:
+            self.ssa_values = dict(fallback)
+            return
+
+        merged = {}
+        names = set().union(*(values.keys() for _, values in incoming))
+        for name, ty in self.ssa_vars.items():
+            if name not in names:
+                continue
+            vals = [values.get(name, ir.Constant(ty, None)) for _, values in incoming]
+            if all(v is vals[0] for v in vals):
+                merged[name] = vals[0]
+                continue
+            phi = self.builder.phi(ty, name=name)
+            for (blk, _), val in zip(incoming, vals):
+                phi.add_incoming(val, blk)
+            merged[name] = phi
+        self.ssa_values = merged
+
+    def _ssa_loop_header(self, preheader, *loop_parts):
+        """Creates the phis of a loop header for the variables assigned in the loop.
+
+        Must be called at the start of the header block.
+
+        Args:
+            preheader: The block that enters the loop.
+            *loop_parts: The AST nodes executed inside the loop (None allowed).
+
+        Returns:
+            dict: name -> phi, to be completed by _ssa_loop_latch.
+        """
+        if not self.ssa_vars:
+            return {}
+        assigned = []
+        for part in loop_parts:
+            if part is None:
+                continue
+            for n in ast.walk(part):
+                if isinstance(n, ast.AssignStmt):
+                    assigned.append(n.name)
+                elif isinstance(n, ast.VarDecl):
+                    assigned.extend(n.names)
+                elif isinstance(n, ast.VarInit):
+                    assigned.append(n.name)
+
+        phis = {}
+        for name in dict.fromkeys(assigned):
+            if name not in self.ssa_vars:
+                continue
+            ty = self.ssa_vars[name]
+            phi = self.builder.phi(ty, name=name)
+            phi.add_incoming(self.ssa_values.get(name, ir.Constant(ty, None)), preheader)
+            self.ssa_values[name] = phi
+            phis[name] = phi
+        return phis
+
+    def _ssa_loop_latch(self, phis):
+        """Adds the back-edge values from the current block to the loop header phis."""
+        for name, phi in phis.items():
+            phi.add_incoming(self.ssa_values.get(name, ir.Constant(phi.type, None)), self.builder.block)
+
+
+    def _owned_value(self, expr):
+        """Generates an expression whose value is about to gain an owner.
+
+        Variables, parameters and return values each own a reference to their
+        string: the value of another variable must be retained, while new
+        strings and literals are used as they are.
+        """
+        val = self.visit(expr)
+        expr = self._strip_hash(expr)
+        if expr.expr_type == 'string' and isinstance(expr, ast.VarRef):
+            self.builder.call(self.strings.get('retain'), [val])
+        return val
+
+    def _is_temporary(self, expr):
+        """Tells whether an expression builds a new string owned by its user."""
+        expr = self._strip_hash(expr)
+        return expr.expr_type == 'string' and isinstance(expr, (ast.BinaryExpr, ast.FuncCallExpr))
+
+    def _release_temporary(self, expr, val):
+        if self._is_temporary(expr):
+            self.builder.call(self.strings.get('release'), [val])
+
+    @staticmethod
+    def _strip_hash(expr):
+        while isinstance(expr, ast.UnaryExpr) and expr.operator == '#':
+            expr = expr.operand
+        return expr
+
+    def _store_string(self, ptr, val):
+        """Stores an owned string into a variable, releasing its old value."""
+        old = self.builder.load(ptr)
+        self.builder.store(val, ptr)
+        self.builder.call(self.strings.get('release'), [old])
+
+    def _emit_return(self, val=None):
+        """Releases the string locals and parameters, then returns val."""
+        for slot in self.string_slots:
+            self.builder.call(self.strings.get('release'), [self.builder.load(slot)])
+        if self.flush_on_return:
+            self.builder.call(self.output.get('flush'), [])
+        if val is None:
+            self.builder.ret_void()
+        else:
+            self.builder.ret(val)
+
+    def _append_operands(self, node: ast.AssignStmt):
+        """Matches ``s = s + x1 + ... + xn`` on a string variable.
+
+        Returns:
+            list: The appended operands x1..xn, or None if the assignment
+            cannot extend ``s`` in place.
+        """
+        operands = []
+        expr = node.value
+        while isinstance(expr, ast.BinaryExpr) and expr.operator == '+' and expr.expr_type == 'string':
+            operands.append(expr.right)
+            expr = expr.left
+        if not (isinstance(expr, ast.VarRef) and expr.name == node.name):
+            return None
+
+        operands.reverse()
+        for operand in operands:
+            for n in ast.walk(operand):
+                # Later operands must see the original value of s, and a call
+                # could reassign a global s while it is being extended
+                if isinstance(n, ast.VarRef) and n.name == node.name and len(operands) > 1:
+                    return None
+                if isinstance(n, ast.FuncCallExpr) and node.name not in self.func_symtab:
+                    return None
+        return operands
+
+    def _append_in_place(self, name, operands):
+        ptr = self._lookup_var(name)
+        val = self.builder.load(ptr, name=f"load_{name}")
+        for operand in operands:
+            x = self.visit(operand)
+            val = self.builder.call(self.strings.get('append'), [val, x])
+            self._release_temporary(operand, x)
+        self.builder.store(val, ptr)
+
+    def _callee(self, name):
+        """Returns the function to call: in lazy mode, loaded from its slot."""
+        if self.lazy is None:
+            return self.module.globals.get(symbol_name(name))
+        return load_function(self.builder, symbol_name(name), self._function_type(self.lazy[name]))
+
     def _lookup_var(self, name):
         if name in self.func_symtab:
             return self.func_symtab[name]
-        return self.module.globals.get(name)
+        gvar = self.module.globals.get(symbol_name(name))
+        if gvar is None and self.lazy is not None:
+            # The global variables are defined once, by the lazy JIT
+            decl = self.lazy[name]
+            type_name = decl.value.type_name if isinstance(decl, ast.VarInit) else decl.type_name
+            gvar = ir.GlobalVariable(self.module, self._get_llvm_type(type_name), name=symbol_name(name))
+            gvar.global_constant = name not in self.effects.written_globals
+        return gvar
 
     def _get_global_string_ptr(self, s):
         if s in self.string_literals:
@@ -518,11 +937,12 @@ class CodeGenerator:
         b.append(0)
         c = ir.Constant(ir.ArrayType(ir.IntType(8), len(b)), b)
         
-        name = f"str_{self.string_counter}"
+        name = literal_name("str", b) if self.shard else f"str_{self.string_counter}"
         self.string_counter += 1
         
         gvar = ir.GlobalVariable(self.module, c.type, name=name)
         gvar.global_constant = True
+        gvar.linkage = "private"
         gvar.initializer = c
         
         self.string_literals[s] = gvar
@@ -531,25 +951,92 @@ class CodeGenerator:
             return self.builder.bitcast(gvar, ir.IntType(8).as_pointer())
         return gvar.bitcast(ir.IntType(8).as_pointer())
 
-    def _print_val(self, val):
-        if val.type == ir.IntType(32):
+    def _write(self, args, newline=False):
+        """Prints the arguments of an output statement (or input prompts)."""
+        if self.buffered_output:
+            self._write_buffered(args, newline)
+            return
+        for arg in args:
+            val = self.visit(arg)
+            self._print_val(val, arg.expr_type)
+            self._release_temporary(arg, val)
+        if newline:
+            self._print_str("\n")
+
+    def _write_buffered(self, args, newline):
+        """Formats output arguments into the output buffer.
+
+        Adjacent arguments are fused into one format string, literals being
+        copied into it, and written with a single snprintf call. A new call
+        is started before an argument that calls a function, since the
+        function may print as well.
+        """
+        fmt, values, lengths, temps = [], [], [], []
+        bound = 0
+
+        def emit(newline):
+            text = "".join(fmt) + ("\n" if newline else "")
+            if not text:
+                return
+            size = ir.Constant(ir.IntType(64), bound + newline)
+            for length in lengths:
+                size = self.builder.add(size, length)
+            dst = self.builder.call(self.output.get('reserve'), [size])
+            size = self.builder.add(size, ir.Constant(ir.IntType(64), 1))
+            n = self.builder.call(self.snprintf, [dst, size, self._get_global_string_ptr(text), *values])
+            has_newline = ir.Constant(ir.IntType(1), '\n' in text)
+            self.builder.call(self.output.get('advance'), [n, has_newline])
+            for arg, val in temps:
+                self._release_temporary(arg, val)
+
+        for arg in args:
+            inner = self._strip_hash(arg)
+            if isinstance(inner, ast.Literal) and inner.type_name == 'string':
+                fmt.append(inner.value.replace('%', '%%'))
+                bound += len(inner.value.encode("utf8"))
+                continue
+
+            if any(isinstance(n, ast.FuncCallExpr) for n in ast.walk(inner)):
+                emit(False)
+                fmt, values, lengths, temps = [], [], [], []
+                bound = 0
+
+            val = self.visit(arg)
+            if inner.expr_type == 'string':
+                length = self.strings.load_length(self.builder, val)
+                fmt.append("%.*s")
+                values += [self.builder.trunc(length, self.type_map['int']), val]
+                lengths.append(length)
+                temps.append((arg, val))
+            else:
+                spec, size = self.PRINT_FORMATS[inner.expr_type]
+                if inner.expr_type == 'bool':
+                    val = self.builder.zext(val, self.type_map['int'])
+                fmt.append(spec)
+                values.append(val)
+                bound += size
+
+        emit(newline)
+
+    def _print_val(self, val, type_name):
+        if type_name == 'int':
             fmt = "%d"
             fmt_ptr = self._get_global_string_ptr(fmt)
             self.builder.call(self.printf, [fmt_ptr, val])
-        elif val.type == ir.DoubleType():
+        elif type_name == 'real':
             fmt = "%.6f"
             fmt_ptr = self._get_global_string_ptr(fmt)
             self.builder.call(self.printf, [fmt_ptr, val])
-        elif val.type == ir.IntType(1):
-             pass 
+        elif type_name == 'bool':
              fmt = "%d" 
              fmt_ptr = self._get_global_string_ptr(fmt)
-             val_zext = self.builder.zext(val, ir.IntType(32))
+             val_zext = self.builder.zext(val, self.type_map['int'])
              self.builder.call(self.printf, [fmt_ptr, val_zext])
-        elif isinstance(val.type, ir.PointerType):
-            fmt = "%s"
+        elif type_name == 'string':
+            fmt = "%.*s"
             fmt_ptr = self._get_global_string_ptr(fmt)
-            self.builder.call(self.printf, [fmt_ptr, val])
+            length = self.builder.trunc(self.strings.load_length(self.builder, val), self.type_map['int'])
+            self.builder.call(self.printf, [fmt_ptr, length, val])
 
     def _print_str(self, s):
         ptr = self._get_global_string_ptr(s)
@@ -1,6 +1,50 @@
 import llvmlite.binding as llvm
 import ctypes
 import ctypes.util
+import sys
+from .target import TargetSpec
+
+# C library functions called by the generated code and its runtime
+LIBC_SYMBOLS = ["printf", "snprintf", "fflush", "malloc", "realloc", "free", "memcpy", "memmove", "strtod", "read", "write", "isatty"]
+
+_libc_registered = False
+
+def load_libc():
+    """Loads the C library of the process.
+
+    Returns:
+        ctypes.CDLL: The C library, or None if it cannot be found.
+    """
+    try:
+        if sys.platform == 'win32':
+            return ctypes.cdll.msvcrt
+        # Robust fallback for MacOS/Linux
+        libc_path = ctypes.util.find_library('c')
+        if libc_path:
+            return ctypes.CDLL(libc_path)
+        return ctypes.CDLL(None)
+    except OSError:
+        return None
+
+def register_libc_symbols():
+    """Registers the C library functions with the JIT, once per process.
+
+    The registration survives a fork: the daemon does it before forking its jobs.
+    """
+    global _libc_registered
+    if _libc_registered:
+        return
+    # Register standard library symbols explicitly
+    # This fixes resolution issues on Windows/some platforms
+    libc = load_libc()
+    if libc:
+        for name in LIBC_SYMBOLS:
+            if hasattr(libc, name):
+                func = getattr(libc, name)
+                addr = ctypes.cast(func, ctypes.c_void_p).value
+                llvm.add_symbol(name, addr)
+
+    _libc_registered = True
 
 class JITExecutor:
     """Executes compiled LLVM modules using MCJIT.
@@ -8,52 +52,75 @@ class JITExecutor:
     Handles initialization of LLVM native targets and finding standard library symbols.
     """
 
-    def __init__(self):
-        """Initializes the JIT executor."""
-        llvm.initialize_native_target()
-        llvm.initialize_native_asmprinter()
+    def __init__(self, target=None):
+        """Initializes the JIT executor.
 
-    def run(self, module_ref):
+        Args:
+            target (TargetSpec): The target of the generated code (default: the host CPU).
+        """
+        self.target = target or TargetSpec()
+
+    def run(self, module_ref, object_cache=None, cache_key=None):
         """Executes the 'main' function in the given LLVM module.
 
+        With an object cache, the machine code emitted for the module is
+        stored under ``cache_key``.
+
         Args:
             module_ref (llvmlite.binding.ModuleRef): The compiled LLVM module.
+            object_cache (ObjectCache): Cache of the emitted object code.
+            cache_key (str): Key of the program in the object cache.
 
         Raises:
             RuntimeError: If the 'main' function cannot be found in the module.
         """
-        target = llvm.Target.from_default_triple()
-        target_machine = target.create_target_machine()
-        
-        # Register standard library symbols explicitly
-        # This fixes resolution issues on Windows/some platforms
-        try:
-            if hasattr(ctypes, 'cdll') and hasattr(ctypes.cdll, 'msvcrt'):
-                libc = ctypes.cdll.msvcrt
-            else:
-                # Robust fallback for MacOS/Linux
-                libc_path = ctypes.util.find_library('c')
-                if libc_path:
-                    libc = ctypes.CDLL(libc_path)
-                else:
-                    libc = ctypes.CDLL(None)
-        except OSError:
-             libc = None
-        
-        if libc:
-            for name in ["printf", "scanf", "malloc", "strlen", "strcpy", "strcat"]:
-                if hasattr(libc, name):
-                    func = getattr(libc, name)
-                    addr = ctypes.cast(func, ctypes.c_void_p).value
-                    llvm.add_symbol(name, addr)
-
-        engine = llvm.create_mcjit_compiler(module_ref, target_machine)
-        engine.finalize_object()
-        
+        engine = self.load(module_ref, object_cache, cache_key)
         func_ptr = engine.get_function_address("main")
         if not func_ptr:
             raise RuntimeError("Could not find 'main' function in the module.")
             
         c_func_type = ctypes.CFUNCTYPE(None)
         c_func = c_func_type(func_ptr)
-        c_func()
\ No newline at end of file
+        c_func()
+
+    def load_object(self, obj):
+        """Loads object code emitted earlier by MCJIT in a new engine.
+
+        Args:
+            obj (bytes): The object code, as stored by the object cache.
+
+        Returns:
+            llvmlite.binding.ExecutionEngine: The engine, or None if the
+            object code does not define ``main``.
+        """
+        register_libc_symbols()
+        # The engine compiles nothing: its empty module is given the object code
+        module_ref = llvm.parse_assembly("")
+        module_ref.triple = self.target.triple
+        # The engine owns its target machine: the shared one must outlive a rejected object
+        engine = llvm.create_mcjit_compiler(module_ref, self.target.create_target_machine())
+        engine.set_object_cache(getbuffer_func=lambda module: obj)
+        engine.finalize_object()
+        if not engine.get_function_address("main"):
+            return None
+        return engine
+
+    def load(self, module_ref, object_cache=None, cache_key=None):
+        """Compiles a module to machine code in a new MCJIT engine.
+
+        The functions of the module stay callable as long as the engine is alive.
+
+        Args:
+            module_ref (llvmlite.binding.ModuleRef): The compiled LLVM module.
+            object_cache (ObjectCache): Cache of the emitted object code.
+            cache_key (str): Key of the program in the object cache.
+
+        Returns:
+            llvmlite.binding.ExecutionEngine: The engine, which owns the module.
+        """
+        register_libc_symbols()
+        engine = llvm.create_mcjit_compiler(module_ref, self.target.target_machine)
+        if object_cache is not None:
+            engine.set_object_cache(**object_cache.engine_hooks(cache_key))
+        engine.finalize_object()
+        return engine
@@ -0,0 +1,119 @@
+"""Handoff of generated ``llvmlite.ir`` modules to LLVM.
+
+``llvm.parse_assembly(str(module))`` serializes the whole module into one
+string, encodes it and parses it, while llvmlite also caches the text of
+every instruction: the module exists several times over at once. Here the
+functions are serialized and parsed in bounded chunks that are linked into
+a base module, and the cached instruction text of each chunk is dropped as
+soon as it has been parsed.
+"""
+import llvmlite.binding as llvm
+from llvmlite import ir
+
+# Approximate size in bytes of the IR text parsed at once
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Linkages that do not resolve references across modules while linking
+_LOCAL_LINKAGES = ("internal", "private")
+
+def declaration(value):
+    """Returns the IR declaration of a global variable or function.
+
+    Args:
+        value (ir.GlobalValue): A global variable or function of a module.
+
+    Returns:
+        str: An ``external`` global or a ``declare`` line.
+    """
+    if isinstance(value, ir.Function):
+        ftype = value.ftype
+        args = ", ".join(str(arg) for arg in ftype.args)
+        if ftype.var_arg:
+            args = f"{args}, ..." if args else "..."
+        return f"declare {ftype.return_type} {value.get_reference()}({args})\n"
+    kind = "constant" if value.global_constant else "global"
+    return f"{value.get_reference()} = external {kind} {value.value_type}\n"
+
+def module_header(module):
+    """Returns the target and type declarations shared by all the chunks."""
+    lines = [f'target triple = "{module.triple}"\n']
+    if module.data_layout:
+        lines.append(f'target datalayout = "{module.data_layout}"\n')
+    lines += [f"{t.get_declaration()}\n" for t in module.get_identified_types().values()]
+    return "".join(lines)
+
+def _clear_text_cache(func):
+    for block in func.blocks:
+        for instr in block.instructions:
+            instr._clear_string_cache()
+
+def to_module_ref(module, chunk_size=DEFAULT_CHUNK_SIZE, shards=()):
+    """Parses a generated module into a ModuleRef, a chunk of functions at a time.
+
+    The base module holds the global variables and the external function
+    declarations; the functions are then defined in the order of ``module``.
+    Internal and private values are linked with external linkage, which is
+    restored afterwards on both modules. The ``shards`` are linked in
+    last, so they can refer to the local values of ``module`` by name.
+
+    Args:
+        module (ir.Module): The generated module.
+        chunk_size (int): Approximate size in bytes of the IR text parsed at
+            once; 0 parses the whole module text in one piece.
+        shards (list[llvmlite.binding.ModuleRef]): Modules to link into the
+            result, which take ownership of them.
+
+    Returns:
+        llvmlite.binding.ModuleRef: The parsed module (not verified).
+    """
+    if not shards and (not chunk_size or module.metadata or module.namedmetadata):
+        return llvm.parse_assembly(str(module))
+
+    values = list(module.globals.values())
+    local = {value.name: value.linkage for value in values if value.linkage in _LOCAL_LINKAGES}
+    for value in values:
+        if value.name in local:
+            value.linkage = ""
+            # Global variables cache their text, linkage included
+            value._clear_string_cache()
+    try:
+        header = module_header(module)
+        declarations = {value.name: declaration(value) for value in values}
+        base = [header, *(str(value) for value in values if not isinstance(value, ir.Function) or value.is_declaration)]
+        # Global variables print without a trailing newline
+        mod_ref = llvm.parse_assembly("\n".join(base))
+
+        def link(funcs, bodies):
+            defined = {func.name for func in funcs}
+            text = [header, *(decl for name, decl in declarations.items() if name not in defined), *bodies]
+            mod_ref.link_in(llvm.parse_assembly("".join(text)))
+            for func in funcs:
+                _clear_text_cache(func)
+
+        funcs, bodies, size = [], [], 0
+        for func in module.functions:
+            if func.is_declaration:
+                continue
+            body = str(func)
+            funcs.append(func)
+            bodies.append(body)
+            size += len(body)
+            if chunk_size and size >= chunk_size:
+                link(funcs, bodies)
+                funcs, bodies, size = [], [], 0
+        if funcs:
+            link(funcs, bodies)
+        for shard in shards:
+            mod_ref.link_in(shard)
+    finally:
+        for value in values:
+            if value.name in local:
+                value.linkage = local[value.name]
+                value._clear_string_cache()
+
+    for name, linkage in local.items():
+        if isinstance(module.globals[name], ir.Function):
+            mod_ref.get_function(name).linkage = linkage
+        else:
+            mod_ref.get_global_variable(name).linkage = linkage
+    return mod_ref
@@ -0,0 +1,144 @@
+"""Lazy JIT: every function is compiled to machine code on its first call.
+
+The eager JIT generates, optimizes and compiles the whole program before
+``main`` starts, so the startup time grows with the size of the program even
+when most functions never run. The lazy JIT loads a base module with the
+global variables of the program, then compiles ``main``. A function is
+generated, optimized on its own and added to the engine when it is first
+called: its callers find it through its slot (see ``stubs``), a table entry
+the resolver fills, so later calls jump straight to its machine code.
+
+Every module defines the globals it creates (literals, runtime functions and
+state, memo tables) unless an earlier module of the engine already did: the
+first definition is kept and the later ones become declarations, so each
+global has a single address, as in a program compiled as a whole.
+"""
+import ctypes
+import os
+import sys
+import time
+import traceback
+
+import llvmlite.binding as llvm
+from llvmlite import ir
+
+from ..semantic import ast_nodes as ast
+from ..semantic.effects import EffectAnalyzer
+from .code_generator import CodeGenerator, symbol_name
+from .execution import register_libc_symbols
+from .optimizer import GrammoOptimizer
+from .stubs import RESOLVER_NAME, pointer_name
+
+_RESOLVER_TYPE = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p)
+
+class LazyJIT:
+    """Runs a program compiling its functions on first call.
+
+    Attributes:
+        compiled: The names of the functions compiled so far, in order.
+        compile_time: Seconds spent generating, optimizing and compiling them.
+    """
+
+    def __init__(self, program, target, opt_level=3, ssa=False, buffered_output=True, effects=None):
+        """Loads the base module of a program.
+
+        Args:
+            program (ast.Program): The analyzed program.
+            target (TargetSpec): The target of the generated code.
+            opt_level (int): The LLVM optimization level of each function (0-3).
+            ssa (bool): Build scalar locals directly in SSA form.
+            buffered_output (bool): Print through the buffered output runtime.
+            effects (EffectAnalyzer): The effect analysis of the program
+                (default: run on the program).
+        """
+        if effects is None:
+            effects = EffectAnalyzer()
+            effects.analyze(program)
+        self.funcs = [decl for decl in program.decls if isinstance(decl, ast.FuncDef)]
+        self.decls = {}
+        for decl in program.decls:
+            for name in decl.names if isinstance(decl, ast.VarDecl) else [decl.name]:
+                self.decls[name] = decl
+        self.options = dict(ssa=ssa, buffered_output=buffered_output, shard=True, effects=effects, lazy=self.decls)
+        self.opt_level = opt_level
+        self.optimizer = GrammoOptimizer(target)
+        self.compiled = []
+        self.compile_time = 0.0
+        self._defined = set()
+
+        register_libc_symbols()
+        # The slots of the functions, null until compiled
+        self._slots = (ctypes.c_void_p * len(self.funcs))()
+        for index, func in enumerate(self.funcs):
+            llvm.add_symbol(pointer_name(symbol_name(func.name)), ctypes.addressof(self._slots) + index * ctypes.sizeof(ctypes.c_void_p))
+        # The resolver is called by the generated code: the callback must stay alive
+        self._resolver = _RESOLVER_TYPE(self._resolve)
+        llvm.add_symbol(RESOLVER_NAME, ctypes.cast(self._resolver, ctypes.c_void_p).value)
+
+        start = time.perf_counter()
+        gen = CodeGenerator(**self.options)
+        for decl in program.decls:
+            if isinstance(decl, (ast.VarDecl, ast.VarInit)):
+                gen.visit(decl)
+        self._publish(gen.module)
+        self.engine = llvm.create_mcjit_compiler(self.optimizer.parse(gen.module), target.target_machine)
+        self.engine.finalize_object()
+        self.compile_time += time.perf_counter() - start
+
+    def run(self):
+        """Compiles and runs ``main``."""
+        main = next(i for i, func in enumerate(self.funcs) if func.name == "main")
+        ctypes.CFUNCTYPE(None)(self._compile(main))()
+
+    def _resolve(self, slot):
+        """The resolver called by the stubs: compiles the function of a slot.
+
+        It runs in the middle of the program, which cannot be unwound: an
+        error is fatal.
+        """
+        try:
+            return self._compile((slot - ctypes.addressof(self._slots)) // ctypes.sizeof(ctypes.c_void_p))
+        except BaseException:
+            traceback.print_exc()
+            sys.stderr.flush()
+            os._exit(70)
+
+    def _compile(self, index):
+        """Compiles the function ``funcs[index]``, once, and returns its address."""
+        if self._slots[index]:
+            return self._slots[index]
+        func = self.funcs[index]
+
+        start = time.perf_counter()
+        gen = CodeGenerator(**self.options)
+        gen._declare_prototype(func)
+        gen._generate_body(func)
+        self._publish(gen.module)
+        mod_ref = self.optimizer.optimize(self.optimizer.parse(gen.module), speed_level=self.opt_level)
+        self.engine.add_module(mod_ref)
+        self.engine.finalize_object()
+        address = self.engine.get_function_address(symbol_name(func.name))
+        self.compile_time += time.perf_counter() - start
+
+        self._slots[index] = address
+        self.compiled.append(func.name)
+        return address
+
+    def _publish(self, module):
+        """Applies the first-definer rule to the globals of a new module.
+
+        The globals already defined in the engine become declarations; the
+        others get external linkage, so the next modules can refer to them.
+        """
+        for value in module.globals.values():
+            if isinstance(value, ir.Function):
+                if value.is_declaration:
+                    continue
+                if value.name in self._defined:
+                    value.blocks = []
+            elif value.initializer is None:
+                continue
+            elif value.name in self._defined:
+                value.initializer = None
+            value.linkage = ""
+            self._defined.add(value.name)
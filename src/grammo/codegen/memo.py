@@ -0,0 +1,103 @@
+"""Memo tables of the functions memoized by the code generator.
+
+A memoized function ``f`` is split in two: ``f.body`` holds the generated
+body, and ``f`` itself looks its arguments up in a table, calling the body
+only on a miss. The recursive calls go through ``f``, so every call of the
+recursion is cached.
+
+The table is a fixed-size, direct-mapped cache: an array of entries::
+
+    { [n x i64] keys, result, i1 valid }
+
+indexed by a hash of the arguments. Each argument is widened to an ``i64``
+key (reals by their bits), and an entry holding other arguments is simply
+overwritten by the new result.
+"""
+from llvmlite import ir
+
+I1 = ir.IntType(1)
+I32 = ir.IntType(32)
+I64 = ir.IntType(64)
+
+# Entries of a memo table: 4096, so a table takes a few tens of KiB
+MEMO_TABLE_BITS = 12
+
+# Multiplicative (Fibonacci) hashing: 2**64 divided by the golden ratio
+_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+
+# Entry field indexes
+KEYS, RESULT, VALID = 0, 1, 2
+
+def memo_body_name(name):
+    """Name of the function holding the body of a memoized function."""
+    return f"{name}.body"
+
+def memo_table_name(name):
+    """Name of the memo table of a memoized function."""
+    return f"{name}.memo"
+
+def declare_memo_table(module, func):
+    """Creates the empty memo table of a function.
+
+    Args:
+        module (ir.Module): The module of the function.
+        func (ir.Function): The prototype of the memoized function.
+
+    Returns:
+        ir.GlobalVariable: The table, with internal linkage.
+    """
+    entry = ir.LiteralStructType([ir.ArrayType(I64, len(func.args)), func.ftype.return_type, I1])
+    table = ir.GlobalVariable(module, ir.ArrayType(entry, 1 << MEMO_TABLE_BITS), name=memo_table_name(func.name))
+    table.initializer = ir.Constant(table.value_type, None)
+    table.linkage = "internal"
+    return table
+
+def define_memo_wrapper(func, body, table):
+    """Defines a memoized function as a lookup in its table.
+
+    Args:
+        func (ir.Function): The prototype of the memoized function.
+        body (ir.Function): The function holding its body.
+        table (ir.GlobalVariable): Its memo table.
+    """
+    builder = ir.IRBuilder(func.append_basic_block(name="entry"))
+    keys = [_key(builder, arg) for arg in func.args]
+    h = ir.Constant(I64, _HASH_MULTIPLIER)
+    for key in keys:
+        h = builder.mul(builder.xor(h, key), ir.Constant(I64, _HASH_MULTIPLIER))
+    # The high bits of the product are the best mixed
+    index = builder.lshr(h, ir.Constant(I64, 64 - MEMO_TABLE_BITS))
+    entry = builder.gep(table, [ir.Constant(I32, 0), index], inbounds=True, name="entry")
+
+    def field(*indexes):
+        return builder.gep(entry, [ir.Constant(I32, 0), *(ir.Constant(I32, i) for i in indexes)], inbounds=True)
+
+    check = func.append_basic_block(name="check")
+    hit = func.append_basic_block(name="hit")
+    miss = func.append_basic_block(name="miss")
+    builder.cbranch(builder.load(field(VALID)), check, miss)
+
+    builder.position_at_end(check)
+    match = ir.Constant(I1, 1)
+    for i, key in enumerate(keys):
+        match = builder.and_(match, builder.icmp_unsigned('==', builder.load(field(KEYS, i)), key))
+    builder.cbranch(match, hit, miss)
+
+    builder.position_at_end(hit)
+    builder.ret(builder.load(field(RESULT)))
+
+    builder.position_at_end(miss)
+    result = builder.call(body, func.args)
+    for i, key in enumerate(keys):
+        builder.store(key, field(KEYS, i))
+    builder.store(result, field(RESULT))
+    builder.store(ir.Constant(I1, 1), field(VALID))
+    builder.ret(result)
+
+def _key(builder, arg):
+    """Widens an argument to its i64 key."""
+    if isinstance(arg.type, ir.DoubleType):
+        return builder.bitcast(arg, I64)
+    if arg.type.width == 1:
+        return builder.zext(arg, I64)
+    return builder.sext(arg, I64)
@@ -0,0 +1,163 @@
+"""Persistent, content-addressed cache of compiled Grammo programs.
+
+Each entry holds the optimized LLVM IR (``<key>.ll``) and the machine code
+emitted by MCJIT (``<key>.o``) for one program. The key covers everything
+that influences the generated code, so a warm run can load the object
+directly and skip parsing, analysis, code generation and optimization.
+"""
+import functools
+import hashlib
+import os
+from pathlib import Path
+
+import llvmlite
+import llvmlite.binding as llvm
+
+from ..cache import get_cache_dir, atomic_write_bytes
+
+# Default bound of the total size of the cache entries
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+@functools.lru_cache(maxsize=None)
+def compiler_version():
+    """Returns a digest of the compiler sources and of the llvmlite/LLVM versions.
+
+    Any change to the compiler therefore invalidates the cached programs.
+
+    Returns:
+        str: A hex digest.
+    """
+    root = Path(__file__).resolve().parent.parent
+    h = hashlib.sha256()
+    h.update(f"llvmlite={llvmlite.__version__}\0llvm={llvm.llvm_version_info}".encode("utf-8"))
+    for path in sorted(root.rglob("*")):
+        rel = path.relative_to(root)
+        if path.suffix not in (".py", ".lark") or rel.parts[0] in ("benchmarks", "test"):
+            continue
+        h.update(f"\0{rel.as_posix()}\0".encode("utf-8"))
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+class ObjectCache:
+    """On-disk cache of optimized IR and object code, with LRU eviction.
+
+    Entries are written atomically, so concurrent runs can share the cache.
+    Loading an entry refreshes its modification time, and the least recently
+    used entries are evicted when the total size exceeds ``max_size``.
+
+    Attributes:
+        cache_dir: Directory of the cache entries.
+        max_size: Bound of the total size of the entries in bytes.
+    """
+
+    def __init__(self, cache_dir=None, max_size=DEFAULT_MAX_SIZE):
+        """Initializes the cache.
+
+        Args:
+            cache_dir (Path): Cache directory (default: ``get_cache_dir("objects")``).
+            max_size (int): Bound of the total size of the entries in bytes.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else get_cache_dir("objects")
+        self.max_size = max_size
+
+    @staticmethod
+    def key(source, opt_level, triple, cpu, features, **options):
+        """Computes the key of a compiled program.
+
+        Args:
+            source (str): The Grammo source text.
+            opt_level (int): The optimization level.
+            triple (str): The target triple.
+            cpu (str): The target CPU name.
+            features (str): The target CPU feature string.
+            **options: Code generation options (e.g. ``ssa``).
+
+        Returns:
+            str: A hex digest.
+        """
+        h = hashlib.sha256()
+        h.update(hashlib.sha256(source.encode("utf-8")).digest())
+        h.update(f"\0O{opt_level}\0{triple}\0{cpu}\0{features}".encode("utf-8"))
+        for name in sorted(options):
+            h.update(f"\0{name}={options[name]!r}".encode("utf-8"))
+        h.update(f"\0{compiler_version()}".encode("utf-8"))
+        return h.hexdigest()
+
+    def _path(self, key, suffix):
+        return self.cache_dir / f"{key}{suffix}"
+
+    def has(self, key):
+        """Tells whether the object code of a program is cached."""
+        return self._path(key, ".o").exists()
+
+    def load_object(self, key):
+        """Returns the cached object code of a program, or None."""
+        return self._read(key, ".o")
+
+    def load_ir(self, key):
+        """Returns the cached optimized IR of a program, or None."""
+        data = self._read(key, ".ll")
+        return data.decode("utf-8") if data is not None else None
+
+    def store_ir(self, key, ir_text):
+        """Stores the optimized IR of a program."""
+        self._write(key, ".ll", ir_text.encode("utf-8"))
+
+    def store_object(self, key, obj):
+        """Stores the object code of a program, then enforces the size bound."""
+        self._write(key, ".o", obj)
+        self.evict()
+
+    def engine_hooks(self, key):
+        """Returns the MCJIT object-cache callbacks for one program.
+
+        Args:
+            key (str): The key of the program compiled by the engine.
+
+        Returns:
+            dict: ``notify_func`` and ``getbuffer_func`` for
+            ``ExecutionEngine.set_object_cache``.
+        """
+        return {
+            "notify_func": lambda module, obj: self.store_object(key, obj),
+            "getbuffer_func": lambda module: self.load_object(key),
+        }
+
+    def evict(self):
+        """Removes the least recently used entries beyond the size bound."""
+        entries = {}
+        try:
+            for path in self.cache_dir.iterdir():
+                if path.suffix in (".o", ".ll"):
+                    st = path.stat()
+                    size, mtime = entries.get(path.stem, (0, 0.0))
+                    entries[path.stem] = (size + st.st_size, max(mtime, st.st_mtime))
+        except OSError:
+            return
+
+        total = sum(size for size, _ in entries.values())
+        for key, (size, _) in sorted(entries.items(), key=lambda item: item[1][1]):
+            if total <= self.max_size:
+                break
+            for suffix in (".o", ".ll"):
+                try:
+                    self._path(key, suffix).unlink()
+                except FileNotFoundError:
+                    pass
+            total -= size
+
+    def _read(self, key, suffix):
+        path = self._path(key, suffix)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def _write(self, key, suffix, data):
+        try:
+            atomic_write_bytes(self._path(key, suffix), data)
+        except OSError:
+            # The cache is an optimization: a read-only or full disk is not an error
+            pass
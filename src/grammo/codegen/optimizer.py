@@ -1,40 +1,57 @@
 import llvmlite.binding as llvm
+from .target import TargetSpec
+from .handoff import to_module_ref, DEFAULT_CHUNK_SIZE
 
 class GrammoOptimizer:
     """Optimizes LLVM modules using the New Pass Manager.
 
     Attributes:
-        None
+        target: The target the module is optimized for.
     """
 
-    def __init__(self):
-        """Initializes the optimizer and native targets."""
-        llvm.initialize_native_target()
-        llvm.initialize_native_asmprinter()
+    def __init__(self, target=None):
+        """Initializes the optimizer and native targets.
+
+        Args:
+            target (TargetSpec): The target of the generated code (default: the host CPU).
+        """
+        self.target = target or TargetSpec()
+
+    def parse(self, module, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Hands a generated module over to LLVM for the target.
+
+        Args:
+            module (llvmlite.ir.Module): The generated module.
+            chunk_size (int): Size of the IR text parsed at once (see ``to_module_ref``).
+
+        Returns:
+            llvmlite.binding.ModuleRef: The verified module reference.
+        """
+        self.target.annotate(module)
+        mod_ref = to_module_ref(module, chunk_size)
+        mod_ref.verify()
+        return mod_ref
 
     def optimize(self, module, speed_level=3, size_level=0):
         """Optimizes the given LLVM module.
 
         Args:
-            module (llvmlite.ir.Module): The module to optimize.
+            module (llvmlite.ir.Module | llvmlite.binding.ModuleRef): The module
+                to optimize; a generated module is parsed first.
             speed_level (int): Optimization level for speed (0-3).
             size_level (int): Optimization level for size (0-2).
 
         Returns:
             llvmlite.binding.ModuleRef: The optimized module reference.
         """
-        mod_ref = llvm.parse_assembly(str(module))
-        mod_ref.verify()
-
-        target = llvm.Target.from_default_triple()
-        target_machine = target.create_target_machine()
+        mod_ref = module if isinstance(module, llvm.ModuleRef) else self.parse(module)
 
         pto = llvm.create_pipeline_tuning_options(
             speed_level=speed_level,
             size_level=size_level
         )
         
-        pass_builder = llvm.create_pass_builder(target_machine, pto)
+        pass_builder = llvm.create_pass_builder(self.target.target_machine, pto)
 
         mpm = pass_builder.getModulePassManager()
         
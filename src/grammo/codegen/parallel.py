@@ -0,0 +1,141 @@
+"""Parallel code generation: function bodies are generated in shards and linked.
+
+Every worker generates a contiguous range of function bodies into its own
+module (a shard), which also holds the prototypes of all the functions and
+the declarations of the global variables, and sends it back as bitcode.
+The parent generates the base module with the global variables and the
+runtime functions used by the shards, and links the shards into it.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import llvmlite.binding as llvm
+from llvmlite import ir
+
+from ..semantic import ast_nodes as ast
+from ..semantic.effects import EffectAnalyzer
+from .code_generator import CodeGenerator
+from .handoff import to_module_ref, DEFAULT_CHUNK_SIZE
+from .runtime import Runtime
+from .target import TargetSpec
+
+# Below this number of functions, a process pool costs more than it saves.
+PARALLEL_MIN_FUNCS = 64
+
+def generate_parallel(program, target, jobs, ssa=False, buffered_output=True, chunk_size=DEFAULT_CHUNK_SIZE,
+                      effects=None):
+    """Generates the code of a program on a process pool.
+
+    The result is semantically identical to ``CodeGenerator.visit`` followed
+    by ``GrammoOptimizer.parse``; only the order of the definitions and the
+    names of the literal globals differ.
+
+    Args:
+        program (ast.Program): The analyzed program.
+        target (TargetSpec): The target of the generated code.
+        jobs (int): Number of worker processes.
+        ssa (bool): Build scalar locals directly in SSA form.
+        buffered_output (bool): Print through the buffered output runtime.
+        chunk_size (int): Size of the IR text parsed at once (see ``to_module_ref``).
+        effects (EffectAnalyzer): The effect analysis of the program
+            (default: run on the program).
+
+    Returns:
+        llvmlite.binding.ModuleRef: The verified, linked module.
+    """
+    funcs = [decl for decl in program.decls if isinstance(decl, ast.FuncDef)]
+    if effects is None:
+        effects = EffectAnalyzer()
+        effects.analyze(program)
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+
+    n_chunks = min(len(funcs), jobs * 4)
+    bounds = [len(funcs) * i // n_chunks for i in range(n_chunks + 1)]
+    options = (target.cpu, target.features, ssa, buffered_output, chunk_size, effects)
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx, initializer=_init_worker,
+                             initargs=(program, funcs, options)) as pool:
+        results = list(pool.map(_generate_func_range, bounds[:-1], bounds[1:]))
+
+    gen = CodeGenerator(ssa=ssa, buffered_output=buffered_output, shard=True, effects=effects)
+    gen._declare_program(program)
+    literals = {}
+    for _, runtime_funcs, shard_literals in results:
+        literals.update(shard_literals)
+        for name in runtime_funcs:
+            for runtime in (gen.strings, gen.output, gen.input):
+                if name.startswith(runtime.prefix):
+                    runtime.get(name[len(runtime.prefix):])
+    target.annotate(gen.module)
+
+    shards = [llvm.parse_bitcode(bitcode) for bitcode, _, _ in results]
+    mod_ref = to_module_ref(gen.module, chunk_size, shards=shards)
+    for gvar in mod_ref.global_variables:
+        # Literals no function refers to are not linked at all
+        if gvar.name in literals:
+            gvar.linkage = literals[gvar.name] or "external"
+    # Shards call each other: the functions are internalized once linked
+    for func in mod_ref.functions:
+        if not func.is_declaration and func.name != "main":
+            func.linkage = "internal"
+    mod_ref.verify()
+    return mod_ref
+
+def _make_shard(module):
+    """Turns a module with some function bodies into a shard.
+
+    The runtime functions and globals, defined once by the base module,
+    become declarations, and so do the global variables of the program.
+    Constants (literals and the globals that are never written) get
+    ``linkonce_odr`` linkage, so the linker keeps one copy of each.
+
+    Returns:
+        tuple: The names of the runtime functions used by the shard and the
+        original linkage of each literal.
+    """
+    runtime_funcs, literals = [], {}
+    for value in module.globals.values():
+        if value.name.startswith(Runtime.prefix):
+            if isinstance(value, ir.Function):
+                if not value.is_declaration:
+                    runtime_funcs.append(value.name)
+                    value.blocks = []
+            else:
+                value.initializer = None
+            value.linkage = ""
+        elif isinstance(value, ir.GlobalVariable):
+            if value.global_constant:
+                literals[value.name] = value.linkage
+                value.linkage = "linkonce_odr"
+            else:
+                value.initializer = None
+                value.linkage = ""
+    return runtime_funcs, literals
+
+# ==========================
+# Process Pool Workers
+# ==========================
+
+_worker_state = None
+
+def _init_worker(program, funcs, options):
+    global _worker_state
+    _worker_state = (program, funcs, options)
+
+def _generate_func_range(start, end):
+    """Generates the shard of funcs[start:end].
+
+    Returns:
+        tuple: The bitcode of the shard, the runtime functions it uses and
+        the original linkage of its literals.
+    """
+    program, funcs, (cpu, features, ssa, buffered_output, chunk_size, effects) = _worker_state
+    gen = CodeGenerator(ssa=ssa, buffered_output=buffered_output, shard=True, effects=effects)
+    gen._declare_program(program)
+    for i in range(start, end):
+        gen._generate_body(funcs[i])
+    runtime_funcs, literals = _make_shard(gen.module)
+
+    TargetSpec(cpu, features).annotate(gen.module)
+    mod_ref = to_module_ref(gen.module, chunk_size)
+    return mod_ref.as_bitcode(), runtime_funcs, literals
@@ -0,0 +1,785 @@
+"""Runtime support functions emitted into the generated LLVM modules.
+
+The runtime is generated as LLVM IR next to the program, so compiled modules
+only depend on the C library.
+
+Grammo strings carry their length: a string value is an ``i8*`` to
+NUL-terminated data (so it can still be handed to the C library) preceded by a
+header of three ``i64`` fields::
+
+    { len, cap, rc } data[cap + 1]
+
+``cap`` is the number of bytes available for characters (terminator
+excluded) and ``rc`` is the reference count; a heap string is freed when its
+count drops to zero. Literals are constant globals with ``cap == 0``: they
+are never written, and their ``rc`` is ignored.
+"""
+import hashlib
+from llvmlite import ir
+
+I8 = ir.IntType(8)
+I32 = ir.IntType(32)
+I64 = ir.IntType(64)
+STR = I8.as_pointer()
+
+# Header field indexes and size in bytes
+LEN, CAP, RC = 0, 1, 2
+HEADER_SIZE = 24
+
+# Capacity of the first heap buffer created by an append
+MIN_CAPACITY = 16
+
+# Initial size of the output buffer, flushed when full
+OUTPUT_BUFFER_SIZE = 1 << 16
+
+# Initial size of the input buffer, grown for longer tokens
+INPUT_BUFFER_SIZE = 1 << 16
+
+def literal_name(kind, data):
+    """Returns a global name derived from the content of a literal.
+
+    Modules generated separately give the same name to the same literal,
+    so the copies can be merged when the modules are linked.
+
+    Args:
+        kind (str): Prefix of the name (e.g. ``gstr``).
+        data (bytes): The encoded literal.
+
+    Returns:
+        str: The global name.
+    """
+    return f"{kind}_{hashlib.sha1(data).hexdigest()[:16]}"
+
+class Runtime:
+    """Base class of the runtime emitters.
+
+    Runtime functions are defined on first use with internal linkage, so the
+    optimizer drops the ones a program does not need.
+
+    Attributes:
+        module: The LLVM module the runtime is emitted into.
+    """
+
+    # Prefix of the names of the emitted functions and globals
+    prefix = "grammo_"
+
+    def __init__(self, module):
+        """Initializes the runtime for a module.
+
+        Args:
+            module (ir.Module): The module being generated.
+        """
+        self.module = module
+        self._funcs = {}
+
+    def get(self, name):
+        """Returns the runtime function ``name``, defining it if needed.
+
+        Args:
+            name (str): The function name, without prefix.
+
+        Returns:
+            ir.Function: The runtime function.
+        """
+        func = self._funcs.get(name)
+        if func is None:
+            func = getattr(self, f"_define_{name}")()
+            self._funcs[name] = func
+        return func
+
+    def _libc(self, name, ret, args, var_arg=False):
+        """Returns the declaration of a C library function.
+
+        Raises:
+            TypeError: If the module has a global of that name that is not
+                a declaration of the same type.
+        """
+        func_ty = ir.FunctionType(ret, args, var_arg=var_arg)
+        existing = self.module.globals.get(name)
+        if existing is not None:
+            if not (isinstance(existing, ir.Function) and existing.is_declaration and existing.ftype == func_ty):
+                raise TypeError(f"Cannot declare the C library function '{name}': "
+                                f"the module already has '{existing.name}' of type {existing.type}")
+            return existing
+        func = ir.Function(self.module, func_ty, name=name)
+        func.attributes.add("nounwind")
+        return func
+
+    def _function(self, name, ret, args, arg_names):
+        func = ir.Function(self.module, ir.FunctionType(ret, args), name=f"{self.prefix}{name}")
+        func.linkage = "internal"
+        func.attributes.add("nounwind")
+        for arg, arg_name in zip(func.args, arg_names):
+            arg.name = arg_name
+        return func, ir.IRBuilder(func.append_basic_block(name="entry"))
+
+    def _global(self, name, ty, init):
+        gvar = ir.GlobalVariable(self.module, ty, name=f"{self.prefix}{name}")
+        gvar.linkage = "internal"
+        gvar.initializer = ir.Constant(ty, init)
+        return gvar
+
+    def _c_string(self, name, value):
+        data = bytearray(value.encode("utf8"))
+        data.append(0)
+        c = ir.Constant(ir.ArrayType(I8, len(data)), data)
+        gvar = ir.GlobalVariable(self.module, c.type, name=f"{self.prefix}{name}")
+        gvar.global_constant = True
+        gvar.linkage = "private"
+        gvar.initializer = c
+        return gvar.gep([I32(0), I32(0)])
+
+    def _memcpy(self, builder, dst, src, n):
+        memcpy = self.module.declare_intrinsic("llvm.memcpy", [STR, STR, I64])
+        builder.call(memcpy, [dst, src, n, ir.Constant(ir.IntType(1), 0)])
+
+class StringRuntime(Runtime):
+    """Emits the string runtime into a module.
+
+    Functions: 'new', 'concat', 'append', 'retain', 'release'.
+    """
+
+    prefix = "grammo_str_"
+
+    def __init__(self, module, content_names=False):
+        """Initializes the runtime for a module.
+
+        Args:
+            module (ir.Module): The module being generated.
+            content_names (bool): Name the literals after their content
+                (see ``literal_name``) instead of numbering them.
+        """
+        super().__init__(module)
+        self.content_names = content_names
+        self._literals = {}
+
+    def literal(self, value):
+        """Returns a constant pointer to the data of a string literal.
+
+        The result is a constant expression, usable both in function bodies
+        and as the initializer of a global variable.
+
+        Args:
+            value (str): The literal text.
+
+        Returns:
+            ir.Constant: The ``i8*`` string value.
+        """
+        ptr = self._literals.get(value)
+        if ptr is not None:
+            return ptr
+
+        data = bytearray(value.encode("utf8"))
+        n = len(data)
+        data.append(0)
+        ty = ir.LiteralStructType([I64, I64, I64, ir.ArrayType(I8, n + 1)])
+        init = ir.Constant(ty, [I64(n), I64(0), I64(0), ir.Constant(ty.elements[3], data)])
+
+        name = literal_name("gstr", data) if self.content_names else f"gstr_{len(self._literals)}"
+        gvar = ir.GlobalVariable(self.module, ty, name=name)
+        gvar.global_constant = True
+        gvar.linkage = "private"
+        gvar.initializer = init
+        ptr = gvar.gep([I32(0), I32(3), I32(0)])
+        self._literals[value] = ptr
+        return ptr
+
+    def load_length(self, builder, s):
+        """Emits the load of the length of a string.
+
+        Args:
+            builder (ir.IRBuilder): The builder positioned where the value is needed.
+            s: The string value.
+
+        Returns:
+            The ``i64`` length.
+        """
+        return builder.load(self.field(builder, s, LEN), name="len")
+
+    def field(self, builder, s, index):
+        """Emits the address of a header field (LEN, CAP or RC) of a string."""
+        # The header sits right before the data
+        fields = builder.bitcast(s, I64.as_pointer())
+        return builder.gep(fields, [I64(index - HEADER_SIZE // 8)])
+
+    # ==========================
+    # Helpers
+    # ==========================
+
+    def _terminate(self, builder, s, length):
+        builder.store(I8(0), builder.gep(s, [length]))
+
+    # ==========================
+    # Runtime functions
+    # ==========================
+
+    def _define_new(self):
+        """i8* new(i64 len, i64 cap): allocates a string with rc = 1.
+
+        The characters are left uninitialized apart from the terminator. The
+        capacity is at least 1, which tells heap strings apart from literals.
+        """
+        func, b = self._function("new", STR, [I64, I64], ["len", "cap"])
+        length, cap = func.args
+        malloc = self._libc("malloc", STR, [I64])
+
+        cap = b.select(b.icmp_unsigned('==', cap, I64(0)), I64(1), cap)
+        size = b.add(cap, I64(HEADER_SIZE + 1))
+        raw = b.call(malloc, [size])
+        hdr = b.bitcast(raw, I64.as_pointer())
+        b.store(length, b.gep(hdr, [I64(LEN)]))
+        b.store(cap, b.gep(hdr, [I64(CAP)]))
+        b.store(I64(1), b.gep(hdr, [I64(RC)]))
+        s = b.gep(raw, [I64(HEADER_SIZE)])
+        self._terminate(b, s, length)
+        b.ret(s)
+        return func
+
+    def _define_concat(self):
+        """i8* concat(i8* a, i8* b): returns a new string a + b."""
+        func, b = self._function("concat", STR, [STR, STR], ["a", "b"])
+        lhs, rhs = func.args
+
+        len_l = self.load_length(b, lhs)
+        len_r = self.load_length(b, rhs)
+        total = b.add(len_l, len_r)
+        s = b.call(self.get("new"), [total, total])
+        self._memcpy(b, s, lhs, len_l)
+        self._memcpy(b, b.gep(s, [len_l]), rhs, len_r)
+        b.ret(s)
+        return func
+
+    def _define_append(self):
+        """i8* append(i8* s, i8* x): returns s + x, reusing s when possible.
+
+        Consumes the caller's reference to s. A uniquely owned heap string is
+        extended in place, growing its buffer geometrically with realloc, so
+        building a string by repeated appends costs amortised O(1) per byte.
+        Shared and literal strings are copied into a new buffer with spare
+        capacity and released.
+        """
+        func, b = self._function("append", STR, [STR, STR], ["s", "x"])
+        s, x = func.args
+        realloc = self._libc("realloc", STR, [STR, I64])
+
+        len_s = self.load_length(b, s)
+        len_x = self.load_length(b, x)
+        cap = b.load(self.field(b, s, CAP), name="cap")
+        rc = b.load(self.field(b, s, RC), name="rc")
+        total = b.add(len_s, len_x)
+
+        grow_bb = func.append_basic_block(name="grow")
+        check_bb = func.append_basic_block(name="check_cap")
+        copy_bb = func.append_basic_block(name="copy")
+        write_bb = func.append_basic_block(name="write")
+
+        unique = b.and_(b.icmp_unsigned('!=', cap, I64(0)), b.icmp_signed('==', rc, I64(1)))
+        b.cbranch(unique, check_bb, copy_bb)
+
+        # Unique: append in place if the buffer is large enough
+        b.position_at_start(check_bb)
+        b.cbranch(b.icmp_unsigned('<=', total, cap), write_bb, grow_bb)
+
+        # Unique but full: double the capacity (x may alias s)
+        b.position_at_start(grow_bb)
+        doubled = b.shl(cap, I64(1))
+        new_cap = b.select(b.icmp_unsigned('>', total, doubled), total, doubled)
+        raw = b.call(realloc, [b.gep(s, [I64(-HEADER_SIZE)]), b.add(new_cap, I64(HEADER_SIZE + 1))])
+        grown = b.gep(raw, [I64(HEADER_SIZE)])
+        b.store(new_cap, self.field(b, grown, CAP))
+        grown_x = b.select(b.icmp_unsigned('==', x, s), grown, x)
+        b.branch(write_bb)
+
+        # Shared or literal: copy into a fresh buffer with room to grow
+        b.position_at_start(copy_bb)
+        doubled = b.shl(total, I64(1))
+        copy_cap = b.select(b.icmp_unsigned('>', doubled, I64(MIN_CAPACITY)), doubled, I64(MIN_CAPACITY))
+        copied = b.call(self.get("new"), [len_s, copy_cap])
+        self._memcpy(b, copied, s, len_s)
+        # s is shared, so x stays valid even if it is s
+        b.call(self.get("release"), [s])
+        b.branch(write_bb)
+
+        b.position_at_start(write_bb)
+        dst = b.phi(STR, name="dst")
+        dst.add_incoming(s, check_bb)
+        dst.add_incoming(grown, grow_bb)
+        dst.add_incoming(copied, copy_bb)
+        src = b.phi(STR, name="src")
+        src.add_incoming(x, check_bb)
+        src.add_incoming(grown_x, grow_bb)
+        src.add_incoming(x, copy_bb)
+        self._memcpy(b, b.gep(dst, [len_s]), src, len_x)
+        b.store(total, self.field(b, dst, LEN))
+        self._terminate(b, dst, total)
+        b.ret(dst)
+        return func
+
+    def _define_retain(self):
+        """void retain(i8* s): records one more owner of a heap string."""
+        func, b = self._function("retain", ir.VoidType(), [STR], ["s"])
+        s, = func.args
+
+        inc_bb = func.append_basic_block(name="inc")
+        done_bb = func.append_basic_block(name="done")
+        cap = b.load(self.field(b, s, CAP), name="cap")
+        b.cbranch(b.icmp_unsigned('!=', cap, I64(0)), inc_bb, done_bb)
+
+        b.position_at_start(inc_bb)
+        rc_ptr = self.field(b, s, RC)
+        b.store(b.add(b.load(rc_ptr), I64(1)), rc_ptr)
+        b.branch(done_bb)
+
+        b.position_at_start(done_bb)
+        b.ret_void()
+        return func
+
+    def _define_release(self):
+        """void release(i8* s): drops one owner of a heap string, freeing it if it was the last."""
+        func, b = self._function("release", ir.VoidType(), [STR], ["s"])
+        s, = func.args
+        free = self._libc("free", ir.VoidType(), [STR])
+
+        dec_bb = func.append_basic_block(name="dec")
+        free_bb = func.append_basic_block(name="free")
+        done_bb = func.append_basic_block(name="done")
+        cap = b.load(self.field(b, s, CAP), name="cap")
+        b.cbranch(b.icmp_unsigned('!=', cap, I64(0)), dec_bb, done_bb)
+
+        b.position_at_start(dec_bb)
+        rc_ptr = self.field(b, s, RC)
+        rc = b.sub(b.load(rc_ptr), I64(1))
+        b.store(rc, rc_ptr)
+        b.cbranch(b.icmp_signed('==', rc, I64(0)), free_bb, done_bb)
+
+        b.position_at_start(free_bb)
+        b.call(free, [b.gep(s, [I64(-HEADER_SIZE)])])
+        b.branch(done_bb)
+
+        b.position_at_start(done_bb)
+        b.ret_void()
+        return func
+
+class OutputRuntime(Runtime):
+    """Emits the buffered output runtime into a module.
+
+    Text is formatted directly into a heap buffer and written to file
+    descriptor 1 when the buffer is full, after a newline if stdout is a
+    terminal, before reading input from a terminal, and when main returns.
+
+    Functions: 'reserve', 'advance', 'flush', 'sync', 'interactive'.
+    """
+
+    prefix = "grammo_out_"
+
+    def __init__(self, module):
+        """Initializes the runtime for a module.
+
+        Args:
+            module (ir.Module): The module being generated.
+        """
+        super().__init__(module)
+        self._buf = None
+
+    def _state(self):
+        """Returns the globals (buf, cap, len, tty) of the output buffer."""
+        if self._buf is None:
+            self._buf = (
+                self._global("buf", STR, None),
+                self._global("cap", I64, 0),
+                self._global("len", I64, 0),
+                # -1 until stdout has been checked with isatty
+                self._global("tty", I32, -1),
+            )
+        return self._buf
+
+    def _define_flush(self):
+        """void flush(): writes out the buffered text."""
+        func, b = self._function("flush", ir.VoidType(), [], [])
+        buf, _, length, _ = self._state()
+        write = self._libc("write", I64, [I32, STR, I64])
+
+        loop_bb = func.append_basic_block(name="loop")
+        body_bb = func.append_basic_block(name="body")
+        done_bb = func.append_basic_block(name="done")
+        entry_bb = b.block
+        start = b.load(buf)
+        total = b.load(length)
+        b.branch(loop_bb)
+
+        b.position_at_start(loop_bb)
+        written = b.phi(I64, name="written")
+        written.add_incoming(I64(0), entry_bb)
+        b.cbranch(b.icmp_signed('<', written, total), body_bb, done_bb)
+
+        b.position_at_start(body_bb)
+        n = b.call(write, [I32(1), b.gep(start, [written]), b.sub(total, written)])
+        written.add_incoming(b.add(written, n), body_bb)
+        # Give up on errors rather than spin
+        b.cbranch(b.icmp_signed('>', n, I64(0)), loop_bb, done_bb)
+
+        b.position_at_start(done_bb)
+        b.store(I64(0), length)
+        b.ret_void()
+        return func
+
+    def _define_interactive(self):
+        """i1 interactive(): tells whether stdout is a terminal."""
+        func, b = self._function("interactive", ir.IntType(1), [], [])
+        _, _, _, tty = self._state()
+        isatty = self._libc("isatty", I32, [I32])
+
+        check_bb = func.append_basic_block(name="check")
+        done_bb = func.append_basic_block(name="done")
+        cached = b.load(tty)
+        b.cbranch(b.icmp_signed('<', cached, I32(0)), check_bb, done_bb)
+
+        b.position_at_start(check_bb)
+        b.store(b.call(isatty, [I32(1)]), tty)
+        b.branch(done_bb)
+
+        b.position_at_start(done_bb)
+        b.ret(b.icmp_signed('>', b.load(tty), I32(0)))
+        return func
+
+    def _define_reserve(self):
+        """i8* reserve(i64 n): returns where to format up to n bytes (plus NUL).
+
+        Flushes the buffer if the text does not fit, and grows it if the text
+        is larger than the whole buffer.
+        """
+        func, b = self._function("reserve", STR, [I64], ["n"])
+        n, = func.args
+        buf, cap, length, _ = self._state()
+        realloc = self._libc("realloc", STR, [STR, I64])
+
+        flush_bb = func.append_basic_block(name="flush")
+        grow_bb = func.append_basic_block(name="grow")
+        done_bb = func.append_basic_block(name="done")
+        needed = b.add(n, I64(1))
+        fits = b.icmp_unsigned('<=', b.add(b.load(length), needed), b.load(cap))
+        b.cbranch(fits, done_bb, flush_bb)
+
+        b.position_at_start(flush_bb)
+        b.call(self.get("flush"), [])
+        b.cbranch(b.icmp_unsigned('<=', needed, b.load(cap)), done_bb, grow_bb)
+
+        b.position_at_start(grow_bb)
+        new_cap = b.select(b.icmp_unsigned('>', needed, I64(OUTPUT_BUFFER_SIZE)), needed, I64(OUTPUT_BUFFER_SIZE))
+        b.store(b.call(realloc, [b.load(buf), new_cap]), buf)
+        b.store(new_cap, cap)
+        b.branch(done_bb)
+
+        b.position_at_start(done_bb)
+        b.ret(b.gep(b.load(buf), [b.load(length)]))
+        return func
+
+    def _define_advance(self):
+        """void advance(i32 n, i1 newline): commits n bytes formatted at the reserved position."""
+        func, b = self._function("advance", ir.VoidType(), [I32, ir.IntType(1)], ["n", "newline"])
+        n, newline = func.args
+        _, _, length, _ = self._state()
+
+        check_bb = func.append_basic_block(name="check_tty")
+        flush_bb = func.append_basic_block(name="flush")
+        done_bb = func.append_basic_block(name="done")
+        # A negative count is a formatting error: nothing was written
+        n = b.sext(n, I64)
+        n = b.select(b.icmp_signed('<', n, I64(0)), I64(0), n)
+        b.store(b.add(b.load(length), n), length)
+        b.cbranch(newline, check_bb, done_bb)
+
+        b.position_at_start(check_bb)
+        b.cbranch(b.call(self.get("interactive"), []), flush_bb, done_bb)
+
+        b.position_at_start(flush_bb)
+        b.call(self.get("flush"), [])
+        b.branch(done_bb)
+
+        b.position_at_start(done_bb)
+        b.ret_void()
+        return func
+
+    def _define_sync(self):
+        """void sync(): flushes the buffer if stdout is a terminal (e.g. before reading input)."""
+        func, b = self._function("sync", ir.VoidType(), [], [])
+
+        flush_bb = func.append_basic_block(name="flush")
+        done_bb = func.append_basic_block(name="done")
+        b.cbranch(b.call(self.get("interactive"), []), flush_bb, done_bb)
+
+        b.position_at_start(flush_bb)
+        b.call(self.get("flush"), [])
+        b.branch(done_bb)
+
+        b.position_at_start(done_bb)
+        b.ret_void()
+        return func
+
+class InputRuntime(Runtime):
+    """Emits the buffered input runtime into a module.
+
+    Standard input is read in blocks with ``read(0)`` into a heap buffer that
+    is kept NUL-terminated after the valid data. Values are whitespace
+    separated tokens, as with scanf: a token is always complete in the
+    buffer before it is parsed (the buffer is compacted, and grown for very
+    long tokens), integers are parsed by the runtime itself and reals with
+    strtod. Like scanf, a failed conversion leaves the target unchanged and
+    the input unconsumed.
+
+    Functions: 'fill', 'token', 'read_int', 'read_real', 'read_string'.
+    """
+
+    prefix = "grammo_in_"
+
+    def __init__(self, module, strings):
+        """Initializes the runtime for a module.
+
+        Args:
+            module (ir.Module): The module being generated.
+            strings (StringRuntime): The string runtime of the module.
+        """
+        super().__init__(module)
+        self.strings = strings
+        self._buf = None
+
+    def _state(self):
+        """Returns the globals (buf, cap, pos, end) of the input buffer."""
+        if self._buf is None:
+            self._buf = (
+                self._global("buf", STR, None),
+                self._global("cap", I64, 0),
+                self._global("pos", I64, 0),
+                self._global("end", I64, 0),
+            )
+        return self._buf
+
+    @staticmethod
+    def _is_space(builder, c):
+        # ' ' or '\t' .. '\r', as isspace() in the C locale
+        ctrl = builder.icmp_unsigned('<=', builder.sub(c, I8(9)), I8(13 - 9))
+        return builder.or_(builder.icmp_unsigned('==', c, I8(32)), ctrl)
+
+    def _define_fill(self):
+        """i1 fill(): moves the unread bytes to the start of the buffer and reads more.
+
+        Returns false at end of input (or on a read error).
+        """
+        func, b = self._function("fill", ir.IntType(1), [], [])
+        buf, cap, pos, end = self._state()
+        malloc = self._libc("malloc", STR, [I64])
+        realloc = self._libc("realloc", STR, [STR, I64])
+        read = self._libc("read", I64, [I32, STR, I64])
+        memmove = self.module.declare_intrinsic("llvm.memmove", [STR, STR, I64])
+
+        alloc_bb = func.append_basic_block(name="alloc")
+        check_bb = func.append_basic_block(name="check_full")
+        grow_bb = func.append_basic_block(name="grow")
+        read_bb = func.append_basic_block(name="read")
+        b.cbranch(b.icmp_unsigned('==', b.load(buf), ir.Constant(STR, None)), alloc_bb, check_bb)
+
+        b.position_at_start(alloc_bb)
+        b.store(b.call(malloc, [I64(INPUT_BUFFER_SIZE + 1)]), buf)
+        b.store(I64(INPUT_BUFFER_SIZE), cap)
+        b.branch(check_bb)
+
+        # A token as large as the whole buffer: double it
+        b.position_at_start(check_bb)
+        pending = b.sub(b.load(end), b.load(pos))
+        b.cbranch(b.icmp_unsigned('==', pending, b.load(cap)), grow_bb, read_bb)
+
+        b.position_at_start(grow_bb)
+        new_cap = b.shl(b.load(cap), I64(1))
+        b.store(b.call(realloc, [b.load(buf), b.add(new_cap, I64(1))]), buf)
+        b.store(new_cap, cap)
+        b.branch(read_bb)
+
+        b.position_at_start(read_bb)
+        data = b.load(buf)
+        b.call(memmove, [data, b.gep(data, [b.load(pos)]), pending, ir.Constant(ir.IntType(1), 0)])
+        n = b.call(read, [I32(0), b.gep(data, [pending]), b.sub(b.load(cap), pending)])
+        got = b.icmp_signed('>', n, I64(0))
+        new_end = b.select(got, b.add(pending, n), pending)
+        b.store(I64(0), pos)
+        b.store(new_end, end)
+        b.store(I8(0), b.gep(data, [new_end]))
+        b.ret(got)
+        return func
+
+    def _define_token(self):
+        """i64 token(): skips whitespace and returns the length of the next token.
+
+        The token starts at ``buf + pos``; 0 means end of input.
+        """
+        func, b = self._function("token", I64, [], [])
+        buf, _, pos, end = self._state()
+
+        skip_bb = func.append_basic_block(name="skip")
+        skip_fill_bb = func.append_basic_block(name="skip_fill")
+        skip_test_bb = func.append_basic_block(name="skip_test")
+        skip_next_bb = func.append_basic_block(name="skip_next")
+        scan_bb = func.append_basic_block(name="scan")
+        scan_test_bb = func.append_basic_block(name="scan_test")
+        scan_next_bb = func.append_basic_block(name="scan_next")
+        scan_fill_bb = func.append_basic_block(name="scan_fill")
+        eof_bb = func.append_basic_block(name="eof")
+        done_bb = func.append_basic_block(name="done")
+        b.branch(skip_bb)
+
+        # Skip the leading whitespace, refilling the buffer as needed
+        b.position_at_start(skip_bb)
+        b.cbranch(b.icmp_unsigned('<', b.load(pos), b.load(end)), skip_test_bb, skip_fill_bb)
+
+        b.position_at_start(skip_fill_bb)
+        b.cbranch(b.call(self.get("fill"), []), skip_bb, eof_bb)
+
+        b.position_at_start(skip_test_bb)
+        c = b.load(b.gep(b.load(buf), [b.load(pos)]))
+        b.cbranch(self._is_space(b, c), skip_next_bb, scan_bb)
+
+        b.position_at_start(skip_next_bb)
+        b.store(b.add(b.load(pos), I64(1)), pos)
+        b.branch(skip_bb)
+
+        # Find the end of the token; if it reaches the end of the data, read
+        # more (fill moves the token to the start of the buffer)
+        b.position_at_start(scan_bb)
+        length = b.phi(I64, name="length")
+        length.add_incoming(I64(1), skip_test_bb)
+        i = b.add(b.load(pos), length)
+        b.cbranch(b.icmp_unsigned('<', i, b.load(end)), scan_test_bb, scan_fill_bb)
+
+        b.position_at_start(scan_test_bb)
+        c = b.load(b.gep(b.load(buf), [i]))
+        b.cbranch(self._is_space(b, c), done_bb, scan_next_bb)
+
+        b.position_at_start(scan_next_bb)
+        length.add_incoming(b.add(length, I64(1)), scan_next_bb)
+        b.branch(scan_bb)
+
+        b.position_at_start(scan_fill_bb)
+        length.add_incoming(length, scan_fill_bb)
+        b.cbranch(b.call(self.get("fill"), []), scan_bb, done_bb)
+
+        b.position_at_start(eof_bb)
+        b.ret(I64(0))
+
+        b.position_at_start(done_bb)
+        b.ret(length)
+        return func
+
+    def _define_read_int(self):
+        """void read_int(i32* target): parses an optionally signed decimal integer."""
+        func, b = self._function("read_int", ir.VoidType(), [I32.as_pointer()], ["target"])
+        target, = func.args
+        buf, _, pos, _ = self._state()
+
+        loop_bb = func.append_basic_block(name="digits")
+        digit_bb = func.append_basic_block(name="digit")
+        end_bb = func.append_basic_block(name="end_digits")
+        store_bb = func.append_basic_block(name="store")
+        fail_bb = func.append_basic_block(name="fail")
+
+        n = b.call(self.get("token"), [])
+        p = b.gep(b.load(buf), [b.load(pos)])
+        first = b.load(p)
+        negative = b.icmp_unsigned('==', first, I8(ord('-')))
+        signed = b.or_(negative, b.icmp_unsigned('==', first, I8(ord('+'))))
+        start = b.zext(signed, I64)
+        entry_bb = b.block
+        b.branch(loop_bb)
+
+        b.position_at_start(loop_bb)
+        i = b.phi(I64, name="i")
+        value = b.phi(I32, name="value")
+        i.add_incoming(start, entry_bb)
+        value.add_incoming(I32(0), entry_bb)
+        in_token = b.icmp_unsigned('<', i, n)
+        c = b.load(b.gep(p, [i]))
+        digit = b.sub(c, I8(ord('0')))
+        is_digit = b.and_(in_token, b.icmp_unsigned('<=', digit, I8(9)))
+        b.cbranch(is_digit, digit_bb, end_bb)
+
+        b.position_at_start(digit_bb)
+        i.add_incoming(b.add(i, I64(1)), digit_bb)
+        value.add_incoming(b.add(b.mul(value, I32(10)), b.zext(digit, I32)), digit_bb)
+        b.branch(loop_bb)
+
+        b.position_at_start(end_bb)
+        b.cbranch(b.icmp_unsigned('>', i, start), store_bb, fail_bb)
+
+        b.position_at_start(store_bb)
+        b.store(b.select(negative, b.neg(value), value), target)
+        b.store(b.add(b.load(pos), i), pos)
+        b.ret_void()
+
+        b.position_at_start(fail_bb)
+        b.ret_void()
+        return func
+
+    def _define_read_real(self):
+        """void read_real(double* target): parses a real number with strtod."""
+        func, b = self._function("read_real", ir.VoidType(), [ir.DoubleType().as_pointer()], ["target"])
+        target, = func.args
+        buf, _, pos, _ = self._state()
+        strtod = self._libc("strtod", ir.DoubleType(), [STR, STR.as_pointer()])
+
+        store_bb = func.append_basic_block(name="store")
+        fail_bb = func.append_basic_block(name="fail")
+
+        # The token is followed by whitespace or by the terminating NUL
+        b.call(self.get("token"), [])
+        p = b.gep(b.load(buf), [b.load(pos)])
+        end_ptr = b.alloca(STR, name="end")
+        value = b.call(strtod, [p, end_ptr])
+        parsed = b.sub(b.ptrtoint(b.load(end_ptr), I64), b.ptrtoint(p, I64))
+        b.cbranch(b.icmp_signed('>', parsed, I64(0)), store_bb, fail_bb)
+
+        b.position_at_start(store_bb)
+        b.store(value, target)
+        b.store(b.add(b.load(pos), parsed), pos)
+        b.ret_void()
+
+        b.position_at_start(fail_bb)
+        b.ret_void()
+        return func
+
+    def _define_read_string(self):
+        """i8* read_string(i8* old): reads a token into a string, replacing old.
+
+        Consumes the caller's reference to old, whose buffer is reused when it
+        is uniquely owned and large enough.
+        """
+        func, b = self._function("read_string", STR, [STR], ["old"])
+        old, = func.args
+        buf, _, pos, _ = self._state()
+        strings = self.strings
+
+        new_bb = func.append_basic_block(name="new")
+        copy_bb = func.append_basic_block(name="copy")
+
+        n = b.call(self.get("token"), [])
+        cap = b.load(strings.field(b, old, CAP), name="cap")
+        rc = b.load(strings.field(b, old, RC), name="rc")
+        reusable = b.and_(
+            b.and_(b.icmp_unsigned('!=', cap, I64(0)), b.icmp_signed('==', rc, I64(1))),
+            b.icmp_unsigned('<=', n, cap),
+        )
+        entry_bb = b.block
+        b.cbranch(reusable, copy_bb, new_bb)
+
+        b.position_at_start(new_bb)
+        b.call(strings.get("release"), [old])
+        fresh = b.call(strings.get("new"), [n, n])
+        b.branch(copy_bb)
+
+        b.position_at_start(copy_bb)
+        s = b.phi(STR, name="s")
+        s.add_incoming(old, entry_bb)
+        s.add_incoming(fresh, new_bb)
+        self._memcpy(b, s, b.gep(b.load(buf), [b.load(pos)]), n)
+        b.store(n, strings.field(b, s, LEN))
+        b.store(I8(0), b.gep(s, [n]))
+        b.store(b.add(b.load(pos), n), pos)
+        b.ret(s)
+        return func
@@ -0,0 +1,58 @@
+"""Call stubs of the lazily compiled functions (see ``lazy``).
+
+In lazy mode the address of each function ``f`` is kept in a slot, the
+external global ``f.ptr``, which is null until ``f`` is compiled. A call
+to ``f`` goes through a stub inlined at the call site: it loads the slot
+and, on the first call only, asks the resolver to compile ``f`` and fill
+the slot::
+
+    p = load f.ptr
+    if (p == null) p = grammo_jit_resolve(&f.ptr)    ; cold
+    call p(args)
+
+Stub functions would do the same with one indirect call, but every one of
+them would need machine code before the program starts.
+"""
+from llvmlite import ir
+
+I8_PTR = ir.IntType(8).as_pointer()
+
+# Symbol of the resolver: i8* resolve(i8** slot), returns the filled slot
+RESOLVER_NAME = "grammo_jit_resolve"
+
+def pointer_name(name):
+    """Name of the slot holding the address of a function, given its symbol."""
+    return f"{name}.ptr"
+
+def load_function(builder, name, func_ty):
+    """Emits the stub loading the address of a function, resolving it on first use.
+
+    Args:
+        builder (ir.IRBuilder): The builder positioned at the call site.
+        name (str): The symbol of the function.
+        func_ty (ir.FunctionType): The type of the function.
+
+    Returns:
+        ir.Value: The function pointer to call.
+    """
+    module = builder.module
+    slot = module.globals.get(pointer_name(name))
+    if slot is None:
+        slot = ir.GlobalVariable(module, func_ty.as_pointer(), name=pointer_name(name))
+    resolver = module.globals.get(RESOLVER_NAME)
+    if resolver is None:
+        resolver = ir.Function(module, ir.FunctionType(I8_PTR, [I8_PTR.as_pointer()]), name=RESOLVER_NAME)
+        resolver.attributes.add("nounwind")
+        resolver.attributes.add("cold")
+
+    address = builder.load(slot, name=f"{name}.addr")
+    entry = builder.block
+    # The resolver runs once per function
+    with builder.if_then(builder.icmp_unsigned('==', address, ir.Constant(address.type, None)), likely=False):
+        resolved = builder.call(resolver, [builder.bitcast(slot, I8_PTR.as_pointer())])
+        resolved = builder.bitcast(resolved, address.type)
+        resolve = builder.block
+    func = builder.phi(address.type, name=name)
+    func.add_incoming(address, entry)
+    func.add_incoming(resolved, resolve)
+    return func
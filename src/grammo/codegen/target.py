@@ -0,0 +1,78 @@
+"""Target selection shared by the optimizer, the JIT executor and the AOT compiler."""
+import llvmlite.binding as llvm
+
+# CPU name or feature string standing for the host CPU
+NATIVE = "native"
+
+class TargetSpec:
+    """The target triple, CPU and CPU features of the generated code.
+
+    An empty CPU name and feature string select the generic baseline of the
+    triple (e.g. x86-64 without AVX); ``native`` selects the host CPU.
+
+    Attributes:
+        triple: The target triple.
+        cpu: The resolved CPU name.
+        features: The resolved feature string (e.g. ``+avx2,-avx512f``).
+    """
+
+    def __init__(self, cpu=NATIVE, features=NATIVE):
+        """Resolves the target of the host.
+
+        Args:
+            cpu (str): CPU name, ``native`` for the host CPU.
+            features (str): Feature string, ``native`` for the host features.
+        """
+        llvm.initialize_native_target()
+        llvm.initialize_native_asmprinter()
+        self.triple = llvm.get_default_triple()
+        self.cpu = llvm.get_host_cpu_name() if cpu == NATIVE else cpu
+        if features == NATIVE:
+            try:
+                features = llvm.get_host_cpu_features().flatten()
+            except RuntimeError:
+                # The host features are not available on every platform
+                features = ""
+        self.features = features
+        self._target_machine = None
+
+    @property
+    def target_machine(self):
+        """The target machine shared by the pass builder and the MCJIT engine."""
+        if self._target_machine is None:
+            self._target_machine = self.create_target_machine()
+        return self._target_machine
+
+    def create_target_machine(self, **options):
+        """Creates a new target machine for this target.
+
+        Args:
+            **options: Options forwarded to ``Target.create_target_machine``
+                (e.g. ``reloc`` and ``codemodel``).
+
+        Returns:
+            llvmlite.binding.TargetMachine: The target machine.
+        """
+        target = llvm.Target.from_triple(self.triple)
+        return target.create_target_machine(cpu=self.cpu, features=self.features, **options)
+
+    def annotate(self, module):
+        """Records the target in a module before it is parsed by LLVM.
+
+        Sets the triple and the data layout of the module and the
+        ``target-cpu``/``target-features`` attributes of its functions, so
+        the emitted IR compiles to the same code with other LLVM tools.
+
+        Args:
+            module (llvmlite.ir.Module): The generated module.
+        """
+        module.triple = self.triple
+        module.data_layout = str(self.target_machine.target_data)
+        attributes = [f'"target-cpu"="{self.cpu}"'] if self.cpu else []
+        if self.features:
+            attributes.append(f'"target-features"="{self.features}"')
+        for func in module.functions:
+            if not func.is_declaration:
+                for attribute in attributes:
+                    # String attributes are not in the llvmlite list of known attributes
+                    set.add(func.attributes, attribute)
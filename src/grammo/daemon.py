@@ -0,0 +1,193 @@
+"""Compile-and-run daemon: keeps the compiler warm between invocations.
+
+Starting the compiler costs more than compiling a small program: importing
+lark and llvmlite, loading the parser tables, initializing the LLVM native
+target and registering the C library symbols with the JIT. The daemon does
+it once, then serves the requests of ``client`` over a Unix socket.
+
+A request carries the command-line arguments of ``main``, the working
+directory, the environment variables the job reads (see
+``client.JOB_ENVIRONMENT``) and the standard input, output and error of the
+client as file descriptors (``SCM_RIGHTS``): the job reads and writes them
+directly, so its output reaches the client as it is produced. Each job
+runs in a process forked from the warm daemon, so every job starts from the
+same state and a crashing program does not take the daemon down. The exit
+status of the job is sent back to the client; if the client goes away
+first, the job is killed.
+
+The socket is only usable by the user running the daemon: it is created
+with mode 0600 in a directory closed to the other users, and connections
+from processes of another user are rejected (``SO_PEERCRED``).
+
+Usage:
+    python -m src.grammo.daemon [--socket PATH]
+"""
+import argparse
+import ctypes
+import logging
+import os
+import select
+import signal
+import socket
+import sys
+
+from . import main as grammo
+from .client import socket_path, check_private, peer_uid, send_message, recv_message
+from .codegen.execution import register_libc_symbols
+from .codegen.target import TargetSpec
+
+def warm_up():
+    """Does the work shared by all the compilations, before the jobs are forked."""
+    # Parsers built without the tables on disk serve --no-cache
+    for use_cache in (True, False):
+        for inline_ast in (True, False):
+            grammo.get_parser(use_cache, inline_ast)
+    # Initializes the native target and resolves the host CPU
+    TargetSpec().target_machine
+    register_libc_symbols()
+
+def serve(path):
+    """Serves requests on a Unix socket until interrupted.
+
+    Args:
+        path (str): Path of the socket.
+
+    Raises:
+        RuntimeError: If another daemon is listening on the socket, or the
+            directory of the socket is not private to the current user.
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        raise RuntimeError("The daemon needs SO_PEERCRED to authenticate its clients")
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    try:
+        check_private(directory)
+    except PermissionError as e:
+        raise RuntimeError(f"{e}: the socket would be reachable by other users") from None
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+        raise RuntimeError(f"A daemon is already listening on {path}")
+    except (FileNotFoundError, ConnectionRefusedError):
+        pass
+    finally:
+        probe.close()
+    if os.path.exists(path):
+        # Left behind by a daemon that did not exit cleanly
+        os.unlink(path)
+
+    warm_up()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # The socket is created with mode 0600, never briefly open to others
+    umask = os.umask(0o177)
+    try:
+        server.bind(path)
+    finally:
+        os.umask(umask)
+    server.listen()
+    # The connection handlers are reaped automatically
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    # Terminating the daemon removes the socket, like an interrupt
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    logging.info(f"Listening on {path}")
+    try:
+        while True:
+            conn, _ = server.accept()
+            uid = peer_uid(conn)
+            if uid != os.getuid():
+                logging.warning(f"Rejected a connection from user {uid}")
+                conn.close()
+                continue
+            if os.fork() == 0:
+                server.close()
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                try:
+                    _handle(conn)
+                finally:
+                    os._exit(0)
+            conn.close()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        os.unlink(path)
+
+def _handle(conn):
+    """Runs the job of a connection and sends its exit status to the client."""
+    request, fds = recv_message(conn, maxfds=3)
+    if request is None or len(fds) != 3:
+        return
+    pid = os.fork()
+    if pid == 0:
+        conn.close()
+        _run_job(request, fds)
+    for fd in fds:
+        os.close(fd)
+
+    try:
+        pidfd = os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        pidfd = None
+    if pidfd is not None:
+        # The client sends nothing else: readable means it hung up
+        readable, _, _ = select.select([conn, pidfd], [], [])
+        os.close(pidfd)
+        if readable == [conn]:
+            os.kill(pid, signal.SIGKILL)
+    _, wait_status = os.waitpid(pid, 0)
+    try:
+        send_message(conn, {"status": os.waitstatus_to_exitcode(wait_status)})
+    except OSError:
+        pass
+
+def _run_job(request, fds):
+    """Runs ``main`` with the descriptors, directory and environment of the client.
+
+    Never returns: the process exits with the status of the job.
+    """
+    status = 1
+    try:
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        sys.stdin = open(0, closefd=False)
+        sys.stdout = open(1, "w", closefd=False)
+        sys.stderr = open(2, "w", closefd=False)
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        # Usage and error messages name the compiler, as with main
+        sys.argv = [grammo.__file__, *request["argv"]]
+        grammo.main(request["argv"])
+        status = 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            status = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # os._exit skips the C library exit handlers, which flush stdio
+        ctypes.CDLL(None).fflush(None)
+        os._exit(status)
+
+def main():
+    """Daemon entry point."""
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s', stream=sys.stderr)
+    parser = argparse.ArgumentParser(description="Grammo compile-and-run daemon")
+    parser.add_argument("--socket", default=None, help="Path of the Unix socket (default: GRAMMO_DAEMON_SOCKET, or a per-user path).")
+    args = parser.parse_args()
+    try:
+        serve(args.socket or socket_path())
+    except RuntimeError as e:
+        logging.error(str(e))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
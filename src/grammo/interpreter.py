@@ -0,0 +1,785 @@
+"""Tiered execution: an AST interpreter that promotes hot functions to the JIT.
+
+For a short program, building the LLVM module, optimizing it and emitting
+machine code costs far more than running it. The interpreter runs the
+analyzed AST instead, with the semantics of ``CodeGenerator``: 32-bit
+integer arithmetic, strings compared by reference, reals printed with
+``%.6f``, and the whitespace-separated input of the runtime. Each function
+is translated once into nested Python closures, which are then called
+without looking at the AST again.
+
+Every function counts its calls and the iterations of its loops (the back
+edges). When the sum reaches the threshold, the function is compiled with
+its callees through the usual code generator, optimizer and JIT, and its
+next calls run the machine code, through ctypes. A loop already running
+keeps being interpreted: only the next call is swapped.
+
+Only functions of scalars are promoted: ``int``, ``real`` and ``bool``
+parameters and result (or ``void``), no input or output and no strings,
+callees included (see ``EffectAnalyzer``). The scalar global variables the
+program writes are copied into the machine code before each call and back
+after it.
+"""
+import ctypes
+import math
+import os
+import sys
+import threading
+import time
+
+from .semantic import ast_nodes as ast
+from .semantic.effects import EffectAnalyzer
+from .codegen.code_generator import CodeGenerator, symbol_name
+from .codegen.optimizer import GrammoOptimizer
+from .codegen.execution import JITExecutor, load_libc
+from .codegen.runtime import OUTPUT_BUFFER_SIZE, INPUT_BUFFER_SIZE
+from .codegen.target import TargetSpec
+
+# Calls plus loop iterations after which a function is compiled: about the
+# interpreted work that costs as much as compiling a small function
+HOT_THRESHOLD = 10000
+
+# ctypes types of the scalar types (None: void)
+_CTYPES = {
+    'int': ctypes.c_int32,
+    'real': ctypes.c_double,
+    'bool': ctypes.c_bool,
+    'void': None,
+}
+
+# Stack of the thread running the program, and the Python frames allowed on
+# it: every Grammo call nests about five Python calls, and a Python call that
+# goes through C takes about 500 bytes of stack
+STACK_SIZE = 1 << 30
+RECURSION_LIMIT = STACK_SIZE // 512
+
+_WHITESPACE = frozenset(b" \t\n\v\f\r")
+_INT_MIN = -(1 << 31)
+_INT_MAX = (1 << 31) - 1
+
+class GrammoRuntimeError(Exception):
+    """An error of the interpreted program, such as an integer division by zero."""
+
+class _String(str):
+    """A Grammo string: a Python string with the identity of a runtime string.
+
+    Strings compare by reference, so every concatenation or input creates
+    a new object, while equal literals are one object.
+    """
+    __slots__ = ()
+
+def _wrap(x):
+    """Wraps an integer to 32 bits, two's complement."""
+    return ((x - _INT_MIN) & 0xFFFFFFFF) + _INT_MIN
+
+def _sdiv(a, b):
+    """Signed 32-bit division, truncated toward zero."""
+    if b == 0:
+        raise GrammoRuntimeError("Integer division by zero")
+    if a == _INT_MIN and b == -1:
+        raise GrammoRuntimeError("Integer overflow in division")
+    q = a // b
+    if q < 0 and q * b != a:
+        q += 1
+    return q
+
+def _fdiv(a, b):
+    """IEEE 754 division: a zero divisor gives an infinity or NaN."""
+    try:
+        return a / b
+    except ZeroDivisionError:
+        if a == 0 or a != a:
+            return math.nan
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+
+def _format_real(x):
+    """Formats a real like printf's ``%.6f``."""
+    if x != x:
+        return "-nan" if math.copysign(1.0, x) < 0 else "nan"
+    return "%.6f" % x
+
+class _Function:
+    """An interpreted function, its counters and its current implementation.
+
+    Attributes:
+        node: The function definition.
+        slots: Index of the frame slot of each parameter and local, by name.
+        calls: Calls made through the interpreter.
+        backedges: Loop iterations run by the interpreter.
+        promotable: Whether the function may still be compiled.
+        invoke: Calls the function: interpreted, then its machine code.
+    """
+    __slots__ = ('node', 'slots', 'calls', 'backedges', 'promotable', 'invoke')
+
+    def __init__(self, node):
+        self.node = node
+        self.slots = {p.name: i for i, p in enumerate(node.params)}
+        for n in ast.walk(node.body):
+            for name in n.names if isinstance(n, ast.VarDecl) else [n.name] if isinstance(n, ast.VarInit) else []:
+                self.slots.setdefault(name, len(self.slots))
+        self.calls = 0
+        self.backedges = 0
+        self.promotable = (node.name != 'main' and node.return_type in _CTYPES
+                           and all(p.type_name in _CTYPES for p in node.params))
+        self.invoke = None
+
+class _Output:
+    """Buffered standard output, flushed like the output runtime."""
+
+    def __init__(self, fd):
+        self.fd = fd
+        self.parts = []
+        self.size = 0
+        self._tty = None
+
+    def write(self, text):
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= OUTPUT_BUFFER_SIZE:
+            self.flush()
+
+    def end_line(self):
+        """Called after text containing a newline: a terminal sees it at once."""
+        if self.interactive():
+            self.flush()
+
+    def sync(self):
+        """Flushes before reading input, if stdout is a terminal."""
+        if self.interactive():
+            self.flush()
+
+    def interactive(self):
+        if self._tty is None:
+            self._tty = os.isatty(self.fd)
+        return self._tty
+
+    def flush(self):
+        data = memoryview("".join(self.parts).encode("utf-8", "surrogateescape"))
+        self.parts, self.size = [], 0
+        while data:
+            try:
+                n = os.write(self.fd, data)
+            except OSError:
+                # Give up on errors rather than spin
+                return
+            data = data[n:]
+
+class _Input:
+    """Buffered standard input, tokenized like the input runtime."""
+
+    def __init__(self, fd):
+        self.fd = fd
+        self.buf = b""
+        self.pos = 0
+        libc = load_libc()
+        self._strtod = libc.strtod
+        self._strtod.restype = ctypes.c_double
+        self._strtod.argtypes = [ctypes.c_char_p, ctypes.POINTER(ctypes.c_char_p)]
+
+    def _fill(self):
+        try:
+            data = os.read(self.fd, INPUT_BUFFER_SIZE)
+        except OSError:
+            data = b""
+        if not data:
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def token(self):
+        """Skips whitespace and returns the next token, without consuming it."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                break
+        end = self.pos
+        while True:
+            while end < len(self.buf) and self.buf[end] not in _WHITESPACE:
+                end += 1
+            if end < len(self.buf):
+                break
+            start = self.pos
+            if not self._fill():
+                break
+            end -= start
+        return self.buf[self.pos:end]
+
+    def read_int(self):
+        """Parses an optionally signed decimal integer; None leaves the input unconsumed."""
+        tok = self.token()
+        start = 1 if tok[:1] in (b"-", b"+") else 0
+        end = start
+        while end < len(tok) and 48 <= tok[end] <= 57:
+            end += 1
+        if end == start:
+            return None
+        self.pos += end
+        value = _wrap(int(tok[start:end]))
+        return _wrap(-value) if tok[:1] == b"-" else value
+
+    def read_real(self):
+        """Parses a real with strtod; None leaves the input unconsumed."""
+        tok = ctypes.create_string_buffer(self.token())
+        end = ctypes.c_char_p()
+        value = self._strtod(tok, ctypes.byref(end))
+        parsed = ctypes.cast(end, ctypes.c_void_p).value - ctypes.addressof(tok)
+        if parsed <= 0:
+            return None
+        self.pos += parsed
+        return value
+
+    def read_string(self):
+        tok = self.token()
+        self.pos += len(tok)
+        return _String(tok.decode("utf-8", "surrogateescape"))
+
+class Interpreter:
+    """Runs an analyzed program on the AST, compiling its hot functions.
+
+    Attributes:
+        functions: The functions of the program, with their counters, by name.
+        promoted: The names of the functions compiled, in order.
+        compile_time: Seconds spent compiling them.
+    """
+
+    def __init__(self, program, threshold=HOT_THRESHOLD, target=None, opt_level=3, ssa=False, memoize=False,
+                 effects=None, stdin_fd=0, stdout_fd=1):
+        """Translates a program for the interpreter.
+
+        Args:
+            program (ast.Program): The analyzed (and possibly optimized) program.
+            threshold (int): Calls plus loop iterations after which a function
+                is compiled; None never compiles.
+            target (TargetSpec): The target of the compiled code (default: the host CPU).
+            opt_level (int): The LLVM optimization level of the compiled code (0-3).
+            ssa (bool): Build scalar locals directly in SSA form.
+            memoize (bool): Memoize the pure recursive functions once compiled.
+            effects (EffectAnalyzer): The effect analysis of the program
+                (default: run at the first promotion).
+            stdin_fd (int): The file descriptor input is read from.
+            stdout_fd (int): The file descriptor output is written to.
+        """
+        self.program = program
+        self.threshold = threshold
+        self.target = target
+        self.opt_level = opt_level
+        self.ssa = ssa
+        self.memoize = memoize
+        self.effects = effects
+        self.promoted = []
+        self.compile_time = 0.0
+        self._engines = []
+        self._literals = {}
+        self._out = _Output(stdout_fd)
+        self._in = _Input(stdin_fd)
+
+        self.globals = []
+        self._global_slots = {}
+        self._global_types = {}
+        for decl in program.decls:
+            if isinstance(decl, ast.VarDecl):
+                for name in decl.names:
+                    self._add_global(name, decl.type_name, self._default(decl.type_name))
+            elif isinstance(decl, ast.VarInit):
+                self._add_global(decl.name, decl.value.type_name, self._literal(decl.value))
+        self.functions = {decl.name: _Function(decl) for decl in program.decls if isinstance(decl, ast.FuncDef)}
+        for fn in self.functions.values():
+            fn.invoke = self._interpreted(fn)
+
+    def _add_global(self, name, type_name, value):
+        self._global_slots[name] = len(self.globals)
+        self._global_types[name] = type_name
+        self.globals.append(value)
+
+    def run(self):
+        """Runs ``main``, then flushes the output.
+
+        The program runs in a thread with a large stack, so that it can
+        recurse as deep as its machine code would.
+
+        Raises:
+            GrammoRuntimeError: If the program fails, or recurses too deep.
+        """
+        errors = []
+
+        def main():
+            try:
+                self.functions['main'].invoke()
+            except BaseException as e:
+                errors.append(e)
+
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, RECURSION_LIMIT))
+        size = threading.stack_size(STACK_SIZE)
+        try:
+            thread = threading.Thread(target=main, name="grammo-interpreter", daemon=True)
+            thread.start()
+        finally:
+            threading.stack_size(size)
+        try:
+            thread.join()
+        finally:
+            sys.setrecursionlimit(limit)
+            self._out.flush()
+        if errors:
+            if isinstance(errors[0], RecursionError):
+                raise GrammoRuntimeError("Stack overflow: recursion too deep") from errors[0]
+            raise errors[0]
+
+    # ==========================
+    # Functions & Promotion
+    # ==========================
+
+    def _interpreted(self, fn):
+        """Returns the interpreted implementation of a function."""
+        body = self._stmt(fn.node.body, fn)
+        n_params = len(fn.node.params)
+        # String locals start out empty, as in the generated code
+        tail = [None] * (len(fn.slots) - n_params)
+        for n in ast.walk(fn.node.body):
+            if isinstance(n, ast.VarDecl) and n.type_name == 'string':
+                for name in n.names:
+                    tail[fn.slots[name] - n_params] = self._string_literal("")
+        threshold = self.threshold
+
+        def invoke(*args):
+            fn.calls += 1
+            if fn.promotable and threshold is not None and fn.calls + fn.backedges >= threshold:
+                if self._promote(fn):
+                    return fn.invoke(*args)
+            result = body([*args, *tail])
+            return result[0] if result is not None else None
+        return invoke
+
+    def _promote(self, fn):
+        """Compiles a hot function and its callees, and swaps in its machine code.
+
+        Returns:
+            bool: Whether the function was compiled.
+        """
+        fn.promotable = False
+        if self.effects is None:
+            self.effects = EffectAnalyzer()
+            self.effects.analyze(self.program, memoize=self.memoize)
+        effects = self.effects.functions[fn.node.name]
+        if effects.io or effects.uses_heap:
+            return False
+
+        start = time.perf_counter()
+        callees, stack = {fn.node.name}, [fn.node.name]
+        while stack:
+            for callee in self.effects.functions[stack.pop()].calls:
+                if callee not in callees:
+                    callees.add(callee)
+                    stack.append(callee)
+        decls = [d for d in self.program.decls if not isinstance(d, ast.FuncDef) or d.name in callees]
+        gen = CodeGenerator(ssa=self.ssa, effects=self.effects, exports=[fn.node.name])
+        module = gen.visit(ast.Program(decls=decls))
+        # The written scalar globals are copied in and out around each call
+        synced = []
+        if effects.reads_globals or effects.writes_globals:
+            synced = [name for name in self.effects.written_globals if self._global_types[name] != 'string']
+        for name in synced:
+            module.globals[symbol_name(name)].linkage = ""
+
+        target = self.target or TargetSpec()
+        optimizer = GrammoOptimizer(target)
+        mod_ref = optimizer.optimize(optimizer.parse(module), speed_level=self.opt_level)
+        engine = JITExecutor(target).load(mod_ref)
+        self._engines.append(engine)
+        c_type = ctypes.CFUNCTYPE(_CTYPES[fn.node.return_type], *(_CTYPES[p.type_name] for p in fn.node.params))
+        native = c_type(engine.get_function_address(symbol_name(fn.node.name)))
+        self.compile_time += time.perf_counter() - start
+        self.promoted.append(fn.node.name)
+
+        if not synced:
+            fn.invoke = native
+            return True
+        cells = [(self._global_slots[name],
+                  _CTYPES[self._global_types[name]].from_address(engine.get_global_value_address(symbol_name(name))))
+                 for name in synced]
+        values = self.globals
+
+        def invoke(*args):
+            for i, cell in cells:
+                cell.value = values[i]
+            result = native(*args)
+            for i, cell in cells:
+                values[i] = cell.value
+            return result
+        fn.invoke = invoke
+        return True
+
+    # ==========================
+    # Statements
+    # ==========================
+
+    def _stmt(self, node, fn):
+        """Translates a statement into a closure ``run(frame)``.
+
+        The closure returns None, or a 1-tuple holding the value of the
+        ``return`` it executed.
+        """
+        return getattr(self, f"_stmt_{node.__class__.__name__}")(node, fn)
+
+    def _stmt_Block(self, node, fn):
+        stmts = [self._stmt(s, fn) for s in node.stmts]
+        if len(stmts) == 1:
+            return stmts[0]
+
+        def run(f):
+            for stmt in stmts:
+                result = stmt(f)
+                if result is not None:
+                    return result
+        return run
+
+    def _stmt_VarDecl(self, node, fn):
+        value = self._default(node.type_name)
+        slots = [fn.slots[name] for name in node.names]
+
+        def run(f):
+            for i in slots:
+                f[i] = value
+        return run
+
+    def _stmt_VarInit(self, node, fn):
+        i, value = fn.slots[node.name], self._literal(node.value)
+
+        def run(f):
+            f[i] = value
+        return run
+
+    def _stmt_AssignStmt(self, node, fn):
+        value = self._expr(node.value, fn)
+        if node.name in fn.slots:
+            i = fn.slots[node.name]
+
+            def run(f):
+                f[i] = value(f)
+        else:
+            i, values = self._global_slots[node.name], self.globals
+
+            def run(f):
+                values[i] = value(f)
+        return run
+
+    def _stmt_ReturnStmt(self, node, fn):
+        if node.value is None:
+            return lambda f: (None,)
+        value = self._expr(node.value, fn)
+        return lambda f: (value(f),)
+
+    def _stmt_ProcCallStmt(self, node, fn):
+        call = self._call(node, fn)
+
+        def run(f):
+            call(f)
+        return run
+
+    def _stmt_IfStmt(self, node, fn):
+        branches = [(self._expr(node.condition, fn), self._stmt(node.then_block, fn))]
+        branches += [(self._expr(e.condition, fn), self._stmt(e.block, fn)) for e in node.elifs]
+        else_block = self._stmt(node.else_block, fn) if node.else_block else None
+        if len(branches) == 1:
+            cond, then_block = branches[0]
+            if else_block is None:
+                def run(f):
+                    if cond(f):
+                        return then_block(f)
+            else:
+                def run(f):
+                    if cond(f):
+                        return then_block(f)
+                    return else_block(f)
+            return run
+
+        def run(f):
+            for cond, block in branches:
+                if cond(f):
+                    return block(f)
+            if else_block is not None:
+                return else_block(f)
+        return run
+
+    def _stmt_WhileStmt(self, node, fn):
+        cond, body = self._expr(node.condition, fn), self._stmt(node.body, fn)
+
+        def run(f):
+            n = 0
+            while cond(f):
+                result = body(f)
+                if result is not None:
+                    fn.backedges += n
+                    return result
+                n += 1
+            fn.backedges += n
+        return run
+
+    def _stmt_ForStmt(self, node, fn):
+        init = self._stmt(node.init, fn) if node.init else None
+        cond = self._expr(node.condition, fn) if node.condition else (lambda f: True)
+        update = self._stmt(node.update, fn) if node.update else (lambda f: None)
+        body = self._stmt(node.body, fn)
+
+        def run(f):
+            if init is not None:
+                init(f)
+            n = 0
+            while cond(f):
+                result = body(f)
+                if result is not None:
+                    fn.backedges += n
+                    return result
+                update(f)
+                n += 1
+            fn.backedges += n
+        return run
+
+    def _stmt_OutputStmt(self, node, fn):
+        write = self._writer(node.args, fn)
+        out = self._out
+        newline = node.is_newline
+        # Literals are known to hold a newline; printed values are checked
+        literal_newline = newline or any(
+            isinstance(a, ast.Literal) and a.type_name == 'string' and '\n' in a.value for a in node.args)
+
+        def run(f):
+            text = write(f)
+            if newline:
+                out.write("\n")
+            if literal_newline or "\n" in text:
+                out.end_line()
+        return run
+
+    def _stmt_InputStmt(self, node, fn):
+        steps, prompts = [], []
+        for arg in node.args:
+            target = CodeGenerator._strip_hash(arg)
+            if target is arg:
+                prompts.append(arg)
+                continue
+            if prompts:
+                steps.append(self._writer(prompts, fn))
+                prompts = []
+            steps.append(self._reader(target, fn))
+        if prompts:
+            steps.append(self._writer(prompts, fn))
+
+        def run(f):
+            for step in steps:
+                step(f)
+        return run
+
+    def _writer(self, args, fn):
+        """Returns a closure printing the arguments and returning the text of the values printed.
+
+        Each argument is written as soon as it is evaluated, so the output
+        of the functions it calls comes after the arguments before it.
+        """
+        out = self._out
+        parts = []
+        for arg in args:
+            inner = CodeGenerator._strip_hash(arg)
+            if isinstance(inner, ast.Literal) and inner.type_name == 'string':
+                parts.append((None, inner.value))
+                continue
+            value = self._expr(inner, fn)
+            if inner.expr_type == 'int':
+                parts.append((value, str))
+            elif inner.expr_type == 'bool':
+                parts.append((value, lambda v: "1" if v else "0"))
+            elif inner.expr_type == 'real':
+                parts.append((value, _format_real))
+            else:
+                parts.append((value, None))
+
+        def write(f):
+            printed = ""
+            for value, fmt in parts:
+                if value is None:
+                    out.write(fmt)
+                    continue
+                text = value(f)
+                if fmt is not None:
+                    text = fmt(text)
+                out.write(text)
+                printed = text
+            return printed
+        return write
+
+    def _reader(self, target, fn):
+        """Returns a closure reading a value into a variable, after showing the prompts."""
+        out, inp = self._out, self._in
+        read = {'int': inp.read_int, 'real': inp.read_real, 'string': inp.read_string}.get(target.expr_type)
+        store = self._store(target.name, fn)
+
+        def run(f):
+            out.sync()
+            if read is not None:
+                value = read()
+                if value is not None:
+                    store(f, value)
+        return run
+
+    def _store(self, name, fn):
+        if name in fn.slots:
+            i = fn.slots[name]
+
+            def store(f, value):
+                f[i] = value
+        else:
+            i, values = self._global_slots[name], self.globals
+
+            def store(f, value):
+                values[i] = value
+        return store
+
+    # ==========================
+    # Expressions
+    # ==========================
+
+    def _expr(self, node, fn):
+        """Translates an expression into a closure ``eval(frame)``."""
+        return getattr(self, f"_expr_{node.__class__.__name__}")(node, fn)
+
+    def _expr_Literal(self, node, fn):
+        value = self._literal(node)
+        return lambda f: value
+
+    def _expr_VarRef(self, node, fn):
+        if node.name in fn.slots:
+            i = fn.slots[node.name]
+            return lambda f: f[i]
+        i, values = self._global_slots[node.name], self.globals
+        return lambda f: values[i]
+
+    def _expr_Coercion(self, node, fn):
+        operand = self._expr(node.operand, fn)
+        return lambda f: float(operand(f))
+
+    def _expr_UnaryExpr(self, node, fn):
+        operand = self._expr(node.operand, fn)
+        if node.operator == '!':
+            return lambda f: not operand(f)
+        if node.operator == '-':
+            if node.expr_type == 'real':
+                return lambda f: -operand(f)
+
+            def neg(f):
+                x = -operand(f)
+                return x if x <= _INT_MAX else _INT_MIN
+            return neg
+        return operand
+
+    def _expr_FuncCallExpr(self, node, fn):
+        return self._call(node, fn)
+
+    def _expr_BinaryExpr(self, node, fn):
+        left, right = self._expr(node.left, fn), self._expr(node.right, fn)
+        op = node.operator
+        if op == '&&':
+            return lambda f: left(f) and right(f)
+        if op == '||':
+            return lambda f: left(f) or right(f)
+
+        operand_type = node.left.expr_type
+        if operand_type == 'string':
+            if op == '+':
+                return lambda f: _String(left(f) + right(f))
+            # Strings compare by reference
+            if op == '==':
+                return lambda f: left(f) is right(f)
+            return lambda f: left(f) is not right(f)
+
+        if op == '==':
+            return lambda f: left(f) == right(f)
+        if op == '<>':
+            if operand_type == 'real':
+                # Ordered comparison: false if either operand is NaN
+                def ne(f):
+                    a, b = left(f), right(f)
+                    return a < b or a > b
+                return ne
+            return lambda f: left(f) != right(f)
+        if op == '<':
+            return lambda f: left(f) < right(f)
+        if op == '<=':
+            return lambda f: left(f) <= right(f)
+        if op == '>':
+            return lambda f: left(f) > right(f)
+        if op == '>=':
+            return lambda f: left(f) >= right(f)
+
+        if operand_type == 'real':
+            if op == '+':
+                return lambda f: left(f) + right(f)
+            if op == '-':
+                return lambda f: left(f) - right(f)
+            if op == '*':
+                return lambda f: left(f) * right(f)
+            return lambda f: _fdiv(left(f), right(f))
+
+        if op == '/':
+            return lambda f: _sdiv(left(f), right(f))
+        if op == '+':
+            def add(f):
+                x = left(f) + right(f)
+                return x if _INT_MIN <= x <= _INT_MAX else _wrap(x)
+            return add
+        if op == '-':
+            def sub(f):
+                x = left(f) - right(f)
+                return x if _INT_MIN <= x <= _INT_MAX else _wrap(x)
+            return sub
+
+        def mul(f):
+            x = left(f) * right(f)
+            return x if _INT_MIN <= x <= _INT_MAX else _wrap(x)
+        return mul
+
+    def _call(self, node, fn):
+        callee = self.functions[node.name]
+        args = [self._expr(arg, fn) for arg in node.args]
+        # The implementation is looked up at each call: it changes on promotion
+        if not args:
+            return lambda f: callee.invoke()
+        if len(args) == 1:
+            a, = args
+            return lambda f: callee.invoke(a(f))
+        if len(args) == 2:
+            a, b = args
+            return lambda f: callee.invoke(a(f), b(f))
+        return lambda f: callee.invoke(*[a(f) for a in args])
+
+    # ==========================
+    # Values
+    # ==========================
+
+    def _literal(self, node: ast.Literal):
+        if node.type_name == 'int':
+            return _wrap(int(node.value))
+        if node.type_name == 'real':
+            return float(node.value)
+        if node.type_name == 'bool':
+            return bool(node.value)
+        return self._string_literal(node.value)
+
+    def _string_literal(self, value):
+        """Returns the object of a string literal: equal literals are the same string."""
+        s = self._literals.get(value)
+        if s is None:
+            s = self._literals[value] = _String(value)
+        return s
+
+    def _default(self, type_name):
+        """The value of a declared, uninitialized variable."""
+        if type_name == 'real':
+            return 0.0
+        if type_name == 'bool':
+            return False
+        if type_name == 'string':
+            return self._string_literal("")
+        return 0
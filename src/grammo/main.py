@@ -2,21 +2,38 @@
 
 Handles command-line arguments, parsing, analysis, code generation, and execution.
 """
+import ctypes
+import os
 import sys
+import time
 import argparse
 import logging
-from pprint import pprint
 from pathlib import Path
 from lark import Lark, UnexpectedInput
+from .cache import load_cached_parser
+from .semantic import ast_nodes as ast
 from .semantic.ast_builder import ASTBuilder
 from .semantic.semantic_analyzer import SemanticAnalyzer, SemanticError
+from .semantic.ast_optimizer import ASTOptimizer
+from .semantic.effects import EffectAnalyzer
 from .codegen.code_generator import CodeGenerator
 from .codegen.optimizer import GrammoOptimizer
 from .codegen.execution import JITExecutor
+from .codegen.lazy import LazyJIT
+from .interpreter import Interpreter, GrammoRuntimeError, HOT_THRESHOLD
+from .codegen.aot import AOTCompiler
+from .codegen.target import TargetSpec, NATIVE
+from .codegen.parallel import generate_parallel, PARALLEL_MIN_FUNCS
+from .codegen.object_cache import ObjectCache
 
-def load_parser():
+def load_parser(use_cache=True, transformer=None):
     """Loads the Lark parser for Grammo grammar.
 
+    Args:
+        use_cache (bool): Reuse the LALR tables stored in the user cache directory.
+        transformer (Transformer): If given, its callbacks run as LALR reductions
+            and ``parse`` returns the transformed result instead of a parse tree.
+
     Returns:
         Lark: The initialized Lark parser instance.
     """
@@ -33,21 +50,122 @@ def load_parser():
     with open(grammar_path, "r", encoding="utf-8") as f:
         grammar = f.read()
 
-    parser = Lark(
-        grammar,
+    options = dict(
         start="start",
         parser="lalr",
         propagate_positions=True,
         maybe_placeholders=False,
+        transformer=transformer,
     )
-    return parser
+    if use_cache:
+        return load_cached_parser(grammar, **options)
+    return Lark(grammar, **options)
+
+_parsers = {}
+
+def get_parser(use_cache=True, inline_ast=True):
+    """Returns a parser shared by all the compilations of the process.
+
+    The daemon loads the parsers once, before forking its jobs.
+
+    Args:
+        use_cache (bool): Reuse the LALR tables stored in the user cache directory.
+        inline_ast (bool): Build the AST during parsing (``ASTBuilder`` as
+            inline transformer) instead of returning a parse tree.
+
+    Returns:
+        Lark: The parser.
+    """
+    key = (use_cache, inline_ast)
+    if key not in _parsers:
+        _parsers[key] = load_parser(use_cache, transformer=ASTBuilder() if inline_ast else None)
+    return _parsers[key]
+
+class _PhaseTimer:
+    """Records the wall-clock time of consecutive compiler phases."""
+
+    def __init__(self):
+        self.timings = {}
+        self._last = time.perf_counter()
+
+    def lap(self, phase):
+        """Ends a phase, started when the previous one ended."""
+        now = time.perf_counter()
+        self.timings[phase] = now - self._last
+        self._last = now
+
+    def report(self):
+        """Logs the time of each phase."""
+        for phase, seconds in self.timings.items():
+            logging.info(f"Timing {phase:<10}{seconds * 1e3:>10.1f} ms")
+
+def _run_cached(target, object_cache, cache_key, output=None):
+    """Runs a program from the object cache, if it is there.
+
+    Args:
+        target (TargetSpec): The target of the generated code.
+        object_cache (ObjectCache): The cache of compiled programs.
+        cache_key (str): Key of the program.
+        output (str): Path where the optimized LLVM IR is requested, if any.
+
+    Returns:
+        bool: False if the program must be compiled.
+    """
+    # Read once: another process may evict the entry at any time
+    obj = object_cache.load_object(cache_key)
+    if obj is None:
+        return False
+    engine = JITExecutor(target).load_object(obj)
+    if engine is None:
+        return False
+    if output:
+        ir_text = object_cache.load_ir(cache_key)
+        if ir_text is None:
+            return False
+        logging.info(f"Writing output to {output}...")
+        with open(output, "w") as f:
+            f.write(ir_text)
+
+    logging.info("Executing compiled program from cache...")
+    ctypes.CFUNCTYPE(None)(engine.get_function_address("main"))()
+    return True
 
-def main():
-    """Main execution entry point."""
+def _compile_aot(target, module_ref, obj_path=None, exe_path=None):
+    """Compiles a program ahead of time instead of running it.
+
+    Without a C compiler the executable cannot be linked: the object file is
+    written next to the requested executable path instead.
+
+    Args:
+        target (TargetSpec): The target of the generated code.
+        module_ref (llvmlite.binding.ModuleRef): The optimized module.
+        obj_path (str): Output path of the object file, if requested.
+        exe_path (str): Output path of the executable, if requested.
+    """
+    compiler = AOTCompiler(target)
+    if exe_path and compiler.find_c_compiler() is None:
+        obj_path = obj_path or f"{exe_path}.o"
+        logging.warning(f"No C compiler found (set CC): skipping the link of {exe_path}.")
+        exe_path = None
+
+    if obj_path:
+        logging.info(f"Writing object file to {obj_path}...")
+        compiler.emit_object(module_ref.clone() if exe_path else module_ref, obj_path)
+    if exe_path:
+        logging.info(f"Linking executable {exe_path}...")
+        compiler.emit_executable(module_ref, exe_path)
+
+def main(argv=None):
+    """Main execution entry point.
+
+    Args:
+        argv (list[str]): The command-line arguments (default: ``sys.argv[1:]``).
+    """
     logging.basicConfig(
         level=logging.INFO,
         format='%(levelname)s: %(message)s',
-        stream=sys.stdout
+        stream=sys.stdout,
+        force=True
     )
 
     parser = argparse.ArgumentParser(description="Grammo Compiler and Executor")
@@ -55,8 +173,23 @@ def main():
     parser.add_argument("-o", "--output", help="Output path for generated LLVM IR Code")
     parser.add_argument("-O", "--opt-level", type=int, default=3, choices=[0, 1, 2, 3], help="Optimization level (0-3)")
     parser.add_argument("-a", "--ast", action="store_true", help="Print the AST structure to console.")
+    parser.add_argument("--no-cache", action="store_true", help="Do not use the on-disk caches (parser tables and compiled programs).")
+    parser.add_argument("--no-ast-opt", action="store_true", help="Do not fold constants and remove dead code on the AST before generating the IR.")
+    parser.add_argument("--memoize", action="store_true", help="Cache the results of the pure recursive functions of scalar values.")
+    parser.add_argument("--ssa", action="store_true", help="Build scalar locals directly in SSA form instead of alloca/load/store.")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Worker processes for the semantic analysis and the code generation of function bodies (0 = all CPUs).")
+    parser.add_argument("--no-output-buffer", action="store_true", help="Print each output argument with its own printf call instead of the buffered output runtime.")
+    parser.add_argument("--emit-obj", metavar="FILE", help="Compile ahead of time to a native object file instead of running the program.")
+    parser.add_argument("--emit-exe", metavar="FILE", help="Compile ahead of time and link a standalone executable with the system C compiler instead of running the program.")
+    parser.add_argument("--cpu", default=NATIVE, help="Target CPU name (default: native, the host CPU; empty for the generic baseline).")
+    parser.add_argument("--features", default=NATIVE, help="Target CPU features, e.g. '+avx2,-avx512f' (default: native, the host features; empty for the baseline).")
+    parser.add_argument("--lazy", action="store_true", help="Compile each function on its first call instead of the whole program before running it (no object cache; not with -o, --emit-obj and --emit-exe).")
+    parser.add_argument("--tiered", action="store_true", help="Interpret the program and compile only its hot functions with the JIT (no object cache; not with --lazy, -o, --emit-obj and --emit-exe).")
+    parser.add_argument("--hot-threshold", type=int, default=HOT_THRESHOLD, help=f"Calls plus loop iterations after which --tiered compiles a function (default: {HOT_THRESHOLD}).")
+    parser.add_argument("--timings", action="store_true", help="Print the time spent in each compiler phase.")
+    parser.add_argument("--two-pass", action="store_true", help="Build a full parse tree before the AST instead of building the AST during parsing.")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     filename = args.file
     path = Path(filename)
@@ -64,42 +197,146 @@ def main():
         logging.error(f"File not found: {filename}")
         sys.exit(1)
 
-    logging.info(f"Parsing {filename}...")
     try:
         src = path.read_text(encoding="utf-8")
-        parser_inst = load_parser()
-        tree = parser_inst.parse(src)
-        logging.info("Parsing successful.")
+        timer = _PhaseTimer()
+
+        target = TargetSpec(args.cpu, args.features)
+        compile_only = args.emit_obj or args.emit_exe
+        lazy = args.lazy and not compile_only and not args.output
+        if args.lazy and not lazy:
+            logging.warning("--lazy is ignored when writing the IR or compiling ahead of time.")
+        tiered = args.tiered and not compile_only and not args.output
+        if args.tiered and not tiered:
+            logging.warning("--tiered is ignored when writing the IR or compiling ahead of time.")
+        if tiered and lazy:
+            logging.warning("--lazy is ignored with --tiered.")
+            lazy = False
+        object_cache = cache_key = None
+        if not args.no_cache and not lazy and not tiered:
+            object_cache = ObjectCache()
+            cache_key = object_cache.key(
+                src, args.opt_level, target.triple, target.cpu, target.features,
+                ssa=args.ssa, buffered_output=not args.no_output_buffer, ast_opt=not args.no_ast_opt, memoize=args.memoize,
+            )
+            if not args.ast and not compile_only and _run_cached(target, object_cache, cache_key, args.output):
+                timer.lap("cached")
+                if args.timings:
+                    timer.report()
+                return
+
+        logging.info(f"Parsing {filename}...")
+        if args.two_pass:
+            parser_inst = get_parser(use_cache=not args.no_cache, inline_ast=False)
+            tree = parser_inst.parse(src)
+            logging.info("Parsing successful.")
 
-        logging.info("Building AST...")
-        builder = ASTBuilder()
-        ast_root = builder.transform(tree)
+            logging.info("Building AST...")
+            builder = ASTBuilder()
+            ast_root = builder.transform(tree)
+        else:
+            # Single pass: ASTBuilder callbacks run as LALR reductions.
+            parser_inst = get_parser(use_cache=not args.no_cache)
+            ast_root = parser_inst.parse(src)
+            logging.info("Parsing and AST construction successful.")
+        timer.lap("parse")
         
         logging.info("Running Semantic Analysis...")
         analyzer = SemanticAnalyzer()
-        analyzer.analyze(ast_root)
+        analyzer.analyze(ast_root, jobs=args.jobs)
         logging.info("Semantic Analysis Successful! No errors found.")
+        timer.lap("semantic")
+
+        if not args.no_ast_opt:
+            removed = ASTOptimizer().optimize(ast_root)
+            logging.info(f"AST optimization removed {removed} nodes.")
+            timer.lap("ast-opt")
         
+        effects = None
+        if args.memoize:
+            effects = EffectAnalyzer()
+            effects.analyze(ast_root, memoize=True)
+            for name, verdict in effects.memo_report.items():
+                logging.info(f"Memoization of {name}: {verdict}.")
+            if not effects.memo_report:
+                logging.info("Memoization: no recursive functions.")
+            timer.lap("effects")
+
         if args.ast:
             logging.info("AST Structure:")
-            pprint(ast_root)
+            print(ast.dump(ast_root))
         
+        if tiered:
+            logging.info("Executing (interpreter, hot functions JIT-compiled)...")
+            sys.stdout.flush()
+            interpreter = Interpreter(ast_root, threshold=args.hot_threshold, target=target,
+                                      opt_level=args.opt_level, ssa=args.ssa, memoize=args.memoize, effects=effects)
+            interpreter.run()
+            timer.lap("run")
+            for name in interpreter.promoted:
+                fn = interpreter.functions[name]
+                logging.info(f"Promoted {name} to the JIT after {fn.calls} calls and {fn.backedges} loop iterations.")
+            if interpreter.promoted:
+                logging.info(f"JIT compilation of the hot functions took {interpreter.compile_time * 1e3:.1f} ms.")
+            if args.timings:
+                timer.report()
+            return
+
+        if lazy:
+            logging.info("Executing (lazy JIT)...")
+            jit = LazyJIT(ast_root, target, opt_level=args.opt_level, ssa=args.ssa,
+                          buffered_output=not args.no_output_buffer, effects=effects)
+            jit.run()
+            timer.lap("run")
+            logging.info(f"Lazy JIT compiled {len(jit.compiled)} of {len(jit.funcs)} functions "
+                         f"in {jit.compile_time * 1e3:.1f} ms.")
+            if args.timings:
+                timer.report()
+            return
+
         logging.info("Generating LLVM IR...")
-        codegen = CodeGenerator()
-        llvm_module = codegen.visit(ast_root)
-        
+        optimizer = GrammoOptimizer(target)
+        jobs = args.jobs or os.cpu_count() or 1
+        n_funcs = sum(isinstance(decl, ast.FuncDef) for decl in ast_root.decls)
+        if jobs > 1 and n_funcs >= PARALLEL_MIN_FUNCS:
+            mod_ref = generate_parallel(ast_root, target, jobs, ssa=args.ssa,
+                                        buffered_output=not args.no_output_buffer, effects=effects)
+            timer.lap("codegen")
+        else:
+            codegen = CodeGenerator(ssa=args.ssa, buffered_output=not args.no_output_buffer, effects=effects)
+            llvm_module = codegen.visit(ast_root)
+            timer.lap("codegen")
+
+            mod_ref = optimizer.parse(llvm_module)
+            # The generated module is no longer needed: release it before optimizing
+            del codegen, llvm_module
+            timer.lap("handoff")
+
         logging.info(f"Optimizing (Level {args.opt_level})...")
-        optimizer = GrammoOptimizer()
-        optimized_mod_ref = optimizer.optimize(llvm_module, speed_level=args.opt_level)
+        optimized_mod_ref = optimizer.optimize(mod_ref, speed_level=args.opt_level)
+        timer.lap("optimize")
         
+        ir_text = str(optimized_mod_ref)
         if args.output:
             logging.info(f"Writing output to {args.output}...")
             with open(args.output, "w") as f:
-                f.write(str(optimized_mod_ref))
+                f.write(ir_text)
+        if args.emit_obj or args.emit_exe:
+            _compile_aot(target, optimized_mod_ref, args.emit_obj, args.emit_exe)
+            timer.lap("aot")
+            if args.timings:
+                timer.report()
+            return
+        if object_cache is not None:
+            # The object code is stored by the JIT once it has been emitted
+            object_cache.store_ir(cache_key, ir_text)
                 
         logging.info("Executing...")
-        executor = JITExecutor()
-        executor.run(optimized_mod_ref)
+        executor = JITExecutor(target)
+        executor.run(optimized_mod_ref, object_cache=object_cache, cache_key=cache_key)
+        timer.lap("run")
+        if args.timings:
+            timer.report()
 
     except UnexpectedInput as e:
         logging.error(f"Syntax Error at line {e.line}, column {e.column}:\n")
@@ -109,6 +346,9 @@ def main():
     except SemanticError as e:
         logging.error(f"Semantic Error:\n{e}")
         sys.exit(1)
+    except GrammoRuntimeError as e:
+        logging.error(f"Runtime Error: {e}")
+        sys.exit(1)
     except Exception as e:
         logging.critical(f"Unexpected Error: {e}")
         import traceback
@@ -5,7 +5,10 @@ from . import ast_nodes as ast
 class ASTBuilder(Transformer):
     """Transform Lark parse tree into a custom AST.
 
-    Methods match the grammar rules in the Lark file.
+    Methods match the grammar rules in the Lark file. The builder only looks at
+    the reduced children (tokens and AST nodes), so it can either transform a
+    complete parse tree or be passed to Lark as an inline transformer, in which
+    case the AST is built directly during the LALR reductions.
     """
     def _extract_pos(self, items):
         """Extracts the line and column from the given items."""
@@ -1,26 +1,54 @@
-from dataclasses import dataclass, field
-from typing import List, Optional, Union, Any
+from dataclasses import dataclass, field, fields, InitVar
+from typing import List, Optional, Union, Any, Iterator
+
+# ==========================================
+# Source Positions
+# ==========================================
+
+# Line and column are packed into a single int (line in the high bits).
+COLUMN_BITS = 24
+COLUMN_MASK = (1 << COLUMN_BITS) - 1
+
+def pack_pos(line: int, column: int) -> int:
+    """Packs a (line, column) source position into a single int."""
+    return (line << COLUMN_BITS) | (column & COLUMN_MASK)
+
+def unpack_pos(pos: int) -> tuple:
+    """Unpacks a position created by pack_pos into (line, column)."""
+    return pos >> COLUMN_BITS, pos & COLUMN_MASK
 
 # ==========================================
 # Abstract Base Class
 # ==========================================
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Node:
     """Base class for all AST nodes.
 
+    Nodes use __slots__ and keep their source position packed in ``pos``;
+    ``line`` and ``column`` are accepted by the constructor and exposed as
+    read-only properties.
+
     Attributes:
         line: The line number where the node starts.
         column: The column number where the node starts.
+        pos: The packed source position.
     """
-    line: int = 0
-    column: int = 0
+    line: InitVar[int] = 0
+    column: InitVar[int] = 0
+    pos: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self, line: int, column: int):
+        self.pos = pack_pos(line, column)
+
+Node.line = property(lambda self: self.pos >> COLUMN_BITS, doc="The line number where the node starts.")
+Node.column = property(lambda self: self.pos & COLUMN_MASK, doc="The column number where the node starts.")
 
 # ==========================================
 # Type Nodes
 # ==========================================
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Type(Node):
     """Represents a type in the AST.
 
@@ -29,7 +57,7 @@ class Type(Node):
     """
     name: str
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PrimitiveType(Type):
     """Represents a primitive type (e.g., int, bool)."""
     pass
@@ -38,12 +66,17 @@ class PrimitiveType(Type):
 # Expressions
 # ==========================================
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Expr(Node):
-    """Base class for expressions."""
-    pass
+    """Base class for expressions.
+
+    Attributes:
+        expr_type: The type resolved by the semantic analyzer ('int', 'real',
+            'bool', 'string'), or None before analysis.
+    """
+    expr_type: Optional[str] = None
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Literal(Expr):
     """Represents a literal value.
 
@@ -54,7 +87,7 @@ class Literal(Expr):
     value: Any
     type_name: str
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class VarRef(Expr):
     """Represents a variable reference.
 
@@ -63,7 +96,7 @@ class VarRef(Expr):
     """
     name: str
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BinaryExpr(Expr):
     """Represents a binary expression.
 
@@ -76,7 +109,7 @@ class BinaryExpr(Expr):
     operator: str
     right: Expr
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UnaryExpr(Expr):
     """Represents a unary expression.
 
@@ -87,7 +120,7 @@ class UnaryExpr(Expr):
     operator: str
     operand: Expr
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FuncCallExpr(Expr):
     """Function call used as an expression (returns a value).
 
@@ -98,16 +131,27 @@ class FuncCallExpr(Expr):
     name: str
     args: List[Expr] = field(default_factory=list)
 
+@dataclass(kw_only=True, slots=True)
+class Coercion(Expr):
+    """Implicit conversion inserted by the semantic analyzer (int -> real).
+
+    The target type is stored in ``expr_type``.
+
+    Attributes:
+        operand: The expression being converted.
+    """
+    operand: Expr
+
 # ==========================================
 # Statements
 # ==========================================
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Stmt(Node):
     """Base class for statements."""
     pass
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class AssignStmt(Stmt):
     """Represents an assignment statement.
 
@@ -118,7 +162,7 @@ class AssignStmt(Stmt):
     name: str
     value: Expr
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ProcCallStmt(Stmt):
     """Procedure call used as a statement (void return).
 
@@ -129,7 +173,7 @@ class ProcCallStmt(Stmt):
     name: str
     args: List[Expr] = field(default_factory=list)
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ReturnStmt(Stmt):
     """Represents a return statement.
 
@@ -138,7 +182,7 @@ class ReturnStmt(Stmt):
     """
     value: Optional[Expr] = None
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Block(Stmt):
     """Represents a block of statements.
 
@@ -147,7 +191,7 @@ class Block(Stmt):
     """
     stmts: List[Stmt] = field(default_factory=list)
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class IfStmt(Stmt):
     """Represents an if statement.
 
@@ -162,7 +206,7 @@ class IfStmt(Stmt):
     elifs: List['ElifClause'] = field(default_factory=list)
     else_block: Optional[Block] = None
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ElifClause(Node):
     """Represents an elif clause in an if statement.
 
@@ -173,7 +217,7 @@ class ElifClause(Node):
     condition: Expr
     block: Block
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class WhileStmt(Stmt):
     """Represents a while statement.
 
@@ -184,7 +228,7 @@ class WhileStmt(Stmt):
     condition: Expr
     body: Block
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ForStmt(Stmt):
     """Represents a for statement.
 
@@ -199,7 +243,7 @@ class ForStmt(Stmt):
     update: Optional[AssignStmt]
     body: Block
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class OutputStmt(Stmt):
     """Represents an output statement (print).
 
@@ -210,7 +254,7 @@ class OutputStmt(Stmt):
     is_newline: bool
     args: List[Expr] = field(default_factory=list)
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class InputStmt(Stmt):
     """Represents an input statement.
 
@@ -223,11 +267,11 @@ class InputStmt(Stmt):
 # Declarations
 # ==========================================
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Declaration(Stmt):
     pass
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class VarDecl(Declaration):
     """Represents a variable declaration: var <type>: <id_list>;
 
@@ -238,7 +282,7 @@ class VarDecl(Declaration):
     type_name: str
     names: List[str]
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class VarInit(Declaration):
     """Represents a variable initialization: var <name> = <const>;
 
@@ -249,7 +293,7 @@ class VarInit(Declaration):
     name: str
     value: Literal
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Param(Node):
     """Represents a function parameter.
 
@@ -260,7 +304,7 @@ class Param(Node):
     name: str
     type_name: str
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FuncDef(Declaration):
     """Represents a function definition.
 
@@ -275,7 +319,7 @@ class FuncDef(Declaration):
     params: List[Param]
     body: Block
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Program(Node):
     """Represents a complete program.
 
@@ -283,3 +327,100 @@ class Program(Node):
         decls: A list of top-level declarations (vars, functions).
     """
     decls: List[Declaration]
+
+# ==========================================
+# Representation
+# ==========================================
+
+def _repr_items(node: Node) -> list:
+    """The (name, value) pairs shown for a node: its position, then its fields."""
+    items = [("line", node.line), ("column", node.column)]
+    items += [(f.name, getattr(node, f.name)) for f in fields(node) if f.repr]
+    return items
+
+def _node_repr(self) -> str:
+    args = ", ".join(f"{name}={value!r}" for name, value in _repr_items(self))
+    return f"{type(self).__qualname__}({args})"
+
+# The position is not a dataclass field: the generated reprs would leave it out
+def _install_repr(cls):
+    cls.__repr__ = _node_repr
+    for sub in cls.__subclasses__():
+        _install_repr(sub)
+
+_install_repr(Node)
+
+def dump(node: Node, width: int = 80) -> str:
+    """Formats a tree for reading, one field per line where the repr is too wide.
+
+    Args:
+        node: The root of the tree.
+        width: The maximum width of a line that is not split further.
+
+    Returns:
+        str: The formatted tree, with the source position of every node.
+    """
+    return _format(node, 0, 0, width)
+
+def _format(value, indent: int, allowance: int, width: int) -> str:
+    """Formats a value starting at column ``indent``, followed by ``allowance`` closing characters."""
+    text = repr(value)
+    if len(text) <= width - indent - allowance:
+        return text
+    if isinstance(value, Node):
+        name = type(value).__name__ + "("
+        inner = indent + len(name)
+        items = _repr_items(value)
+        parts = [f"{key}={_format(item, inner + len(key) + 1, allowance + 1 if i == len(items) - 1 else 1, width)}"
+                 for i, (key, item) in enumerate(items)]
+        return name + (",\n" + " " * inner).join(parts) + ")"
+    if isinstance(value, list) and value:
+        parts = [_format(item, indent + 1, allowance + 1 if i == len(value) - 1 else 1, width)
+                 for i, item in enumerate(value)]
+        return "[" + (",\n" + " " * (indent + 1)).join(parts) + "]"
+    return text
+
+# ==========================================
+# Traversal Helpers
+# ==========================================
+
+# Field types that never hold nodes (Any is the value of a Literal)
+_LEAF_TYPES = (int, str, bool, Any, Optional[str], List[str])
+
+# Names of the fields of each node class that can hold nodes
+_child_fields = {}
+
+def _fields_of(node: Node) -> tuple:
+    cls = type(node)
+    names = _child_fields.get(cls)
+    if names is None:
+        names = _child_fields[cls] = tuple(f.name for f in fields(cls) if f.type not in _LEAF_TYPES)
+    return names
+
+def iter_child_nodes(node: Node) -> Iterator[Node]:
+    """Yields the direct children of a node, in field order."""
+    for name in _fields_of(node):
+        value = getattr(node, name)
+        if isinstance(value, Node):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, Node):
+                    yield item
+
+def walk(node: Node) -> Iterator[Node]:
+    """Yields node and all its descendants (pre-order, depth-first)."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        children = []
+        for name in _fields_of(current):
+            value = getattr(current, name)
+            if isinstance(value, Node):
+                children.append(value)
+            elif isinstance(value, list):
+                children.extend(item for item in value if isinstance(item, Node))
+        if children:
+            children.reverse()
+            stack.extend(children)
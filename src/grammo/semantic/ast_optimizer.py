@@ -0,0 +1,306 @@
+"""AST optimizations run between the semantic analysis and the code generation.
+
+Constant expressions are folded, global variables that are initialized and
+never assigned are replaced by their value, and the code that can never run
+is removed, so none of it reaches the IR: less IR to build, to hand over to
+LLVM and to optimize, which matters most at -O0/-O1.
+"""
+import math
+from . import ast_nodes as ast
+
+INT_MIN = -2 ** 31
+INT_MAX = 2 ** 31 - 1
+
+class ASTOptimizer:
+    """Folds constants and removes dead code from an analyzed AST.
+
+    The AST must have been validated by the SemanticAnalyzer: folding relies
+    on the ``expr_type`` annotations and on the explicit ``Coercion`` nodes.
+    Folded values follow the semantics of the generated code: ints wrap
+    around at 32 bits and divide truncating towards zero, reals are IEEE
+    doubles. Divisions that would trap or have no defined result in LLVM
+    (division by zero, ``INT_MIN / -1``) are left alone.
+
+    Strings compare by reference and equal literals share one constant, so
+    folding ``"a" + "b"`` could change the result of a comparison: string
+    concatenations are only folded in programs that never compare strings.
+
+    Dead code is an ``if``/``elif`` arm or a loop whose condition is
+    statically false, and the statements after one that always returns.
+    The declarations found in dead code are kept in place, since the
+    variables they declare stay visible to the rest of the function.
+
+    Attributes:
+        constants: Value of each global variable that is never assigned.
+        fold_strings: Whether string concatenations are folded.
+        removed: Number of nodes removed by the last run.
+    """
+
+    def __init__(self):
+        self.constants = {}
+        self.fold_strings = True
+        self.removed = 0
+
+    def optimize(self, program: ast.Program) -> int:
+        """Optimizes the program in place.
+
+        Args:
+            program (ast.Program): The analyzed program.
+
+        Returns:
+            int: The number of nodes removed from the AST.
+        """
+        # One pass finds the assigned variables and the string comparisons
+        before, assigned, self.fold_strings = 0, set(), True
+        for n in ast.walk(program):
+            before += 1
+            if isinstance(n, ast.AssignStmt):
+                assigned.add(n.name)
+            elif isinstance(n, ast.InputStmt):
+                for arg in n.args:
+                    if isinstance(arg, ast.UnaryExpr) and arg.operator == '#':
+                        target = _strip_hash(arg)
+                        if isinstance(target, ast.VarRef):
+                            assigned.add(target.name)
+            elif isinstance(n, ast.BinaryExpr) and n.operator in ('==', '<>') and n.left.expr_type == 'string':
+                self.fold_strings = False
+        self.constants = {decl.name: decl.value for decl in program.decls
+                          if isinstance(decl, ast.VarInit) and decl.name not in assigned}
+
+        for decl in program.decls:
+            if isinstance(decl, ast.FuncDef):
+                decl.body.stmts = self._optimize_stmts(decl.body.stmts)
+
+        self.removed = before - _count_nodes(program)
+        return self.removed
+
+    # ==========================
+    # Statements
+    # ==========================
+
+    def _optimize_stmts(self, stmts):
+        """Optimizes a statement list, dropping what follows a statement that always returns."""
+        result = []
+        for i, stmt in enumerate(stmts):
+            replaced = self._optimize_stmt(stmt)
+            result += replaced
+            if any(_always_returns(s) for s in replaced):
+                result += _declarations(stmts[i + 1:])
+                break
+        return result
+
+    def _optimize_stmt(self, stmt):
+        """Optimizes a statement.
+
+        Returns:
+            list: The statements replacing it (none if it is dead code).
+        """
+        if isinstance(stmt, ast.IfStmt):
+            return self._optimize_if(stmt)
+        if isinstance(stmt, ast.WhileStmt):
+            stmt.condition = self.fold(stmt.condition)
+            if _is_bool(stmt.condition, False):
+                return _declarations([stmt.body])
+            stmt.body.stmts = self._optimize_stmts(stmt.body.stmts)
+        elif isinstance(stmt, ast.ForStmt):
+            if stmt.init:
+                stmt.init.value = self.fold(stmt.init.value)
+            if stmt.condition:
+                stmt.condition = self.fold(stmt.condition)
+                if _is_bool(stmt.condition, False):
+                    return ([stmt.init] if stmt.init else []) + _declarations([stmt.body])
+                if _is_bool(stmt.condition, True):
+                    # A missing condition loops forever
+                    stmt.condition = None
+            if stmt.update:
+                stmt.update.value = self.fold(stmt.update.value)
+            stmt.body.stmts = self._optimize_stmts(stmt.body.stmts)
+        elif isinstance(stmt, ast.Block):
+            stmt.stmts = self._optimize_stmts(stmt.stmts)
+        elif isinstance(stmt, (ast.AssignStmt, ast.ReturnStmt)):
+            if stmt.value is not None:
+                stmt.value = self.fold(stmt.value)
+        elif isinstance(stmt, (ast.ProcCallStmt, ast.OutputStmt)):
+            stmt.args = [self.fold(arg) for arg in stmt.args]
+        elif isinstance(stmt, ast.InputStmt):
+            # Input targets are variables: only the prompts are folded
+            stmt.args = [arg if isinstance(arg, ast.UnaryExpr) and arg.operator == '#' else self.fold(arg)
+                         for arg in stmt.args]
+        return [stmt]
+
+    def _optimize_if(self, node: ast.IfStmt):
+        """Removes the arms of an if statement that can never run.
+
+        An arm with a false condition is dropped; an arm with a true
+        condition becomes the else branch and the arms after it are dropped.
+        """
+        arms = [(node.condition, node.then_block, None), *((e.condition, e.block, e) for e in node.elifs)]
+        live, dead = [], []
+        else_block = node.else_block
+        for i, (condition, block, clause) in enumerate(arms):
+            condition = self.fold(condition)
+            if _is_bool(condition, False):
+                dead.append(block)
+                continue
+            if _is_bool(condition, True):
+                dead += [b for _, b, _ in arms[i + 1:]]
+                if else_block:
+                    dead.append(else_block)
+                else_block = block
+                break
+            live.append((condition, block, clause))
+
+        kept = _declarations(dead)
+        if not live:
+            stmts = self._optimize_stmts(else_block.stmts) if else_block else []
+            return kept + stmts
+
+        for _, block, _ in live:
+            block.stmts = self._optimize_stmts(block.stmts)
+        if else_block:
+            else_block.stmts = self._optimize_stmts(else_block.stmts)
+        (node.condition, node.then_block, _), *elifs = live
+        for condition, _, clause in elifs:
+            clause.condition = condition
+        # Only the first live arm can come from the if itself
+        node.elifs = [clause for _, _, clause in elifs]
+        node.else_block = else_block
+        return kept + [node]
+
+    # ==========================
+    # Expressions
+    # ==========================
+
+    def fold(self, expr: ast.Expr) -> ast.Expr:
+        """Folds the constant parts of an expression.
+
+        Returns:
+            ast.Expr: The folded expression (``expr`` itself, updated in place,
+            unless it folds to a new node).
+        """
+        if isinstance(expr, ast.VarRef):
+            value = self.constants.get(expr.name)
+            if value is not None:
+                return _literal(value.value, value.type_name, expr)
+        elif isinstance(expr, ast.Coercion):
+            expr.operand = self.fold(expr.operand)
+            if isinstance(expr.operand, ast.Literal):
+                return _literal(float(expr.operand.value), 'real', expr)
+        elif isinstance(expr, ast.UnaryExpr):
+            expr.operand = self.fold(expr.operand)
+            if isinstance(expr.operand, ast.Literal):
+                value = expr.operand.value
+                if expr.operator == '!':
+                    return _literal(not value, 'bool', expr)
+                if expr.operator == '-' and expr.expr_type == 'real':
+                    return _literal(-value, 'real', expr)
+                if expr.operator == '-' and _is_int(expr.operand):
+                    return _literal(_wrap(-value), 'int', expr)
+        elif isinstance(expr, ast.BinaryExpr):
+            expr.left = self.fold(expr.left)
+            expr.right = self.fold(expr.right)
+            if expr.operator in ('&&', '||'):
+                return self._fold_logic(expr)
+            if isinstance(expr.left, ast.Literal) and isinstance(expr.right, ast.Literal):
+                return self._fold_binary(expr)
+        elif isinstance(expr, ast.FuncCallExpr):
+            expr.args = [self.fold(arg) for arg in expr.args]
+        return expr
+
+    def _fold_logic(self, expr: ast.BinaryExpr):
+        """Folds ``&&``/``||`` with a constant operand, keeping calls that must run."""
+        # The value that decides the result on its own: false for &&, true for ||
+        absorbing = expr.operator == '||'
+        left, right = expr.left, expr.right
+        if isinstance(left, ast.Literal):
+            return _literal(absorbing, 'bool', expr) if left.value == absorbing else right
+        if isinstance(right, ast.Literal):
+            if right.value != absorbing:
+                return left
+            if not any(isinstance(n, ast.FuncCallExpr) for n in ast.walk(left)):
+                return _literal(absorbing, 'bool', expr)
+        return expr
+
+    def _fold_binary(self, expr: ast.BinaryExpr):
+        """Folds a binary expression whose operands are both literals."""
+        op = expr.operator
+        a, b = expr.left.value, expr.right.value
+        operand_type = expr.left.expr_type
+        if operand_type == 'string':
+            if op == '+' and self.fold_strings:
+                return _literal(a + b, 'string', expr)
+            return expr
+
+        if operand_type == 'int':
+            if not (_is_int(expr.left) and _is_int(expr.right)):
+                return expr
+            if op in ('+', '-', '*', '/'):
+                if op == '/':
+                    if b == 0 or (a == INT_MIN and b == -1):
+                        return expr
+                    value = abs(a) // abs(b) * (1 if (a < 0) == (b < 0) else -1)
+                else:
+                    value = a + b if op == '+' else a - b if op == '-' else a * b
+                return _literal(_wrap(value), 'int', expr)
+        elif operand_type == 'real':
+            if op in ('+', '-', '*', '/'):
+                if op == '/' and b == 0:
+                    return expr
+                value = a + b if op == '+' else a - b if op == '-' else a * b if op == '*' else a / b
+                return _literal(value, 'real', expr)
+            if math.isnan(a) or math.isnan(b):
+                # Ordered comparisons (as generated) are false on NaN, '<>' included
+                return _literal(False, 'bool', expr)
+
+        comparisons = {
+            '==': a == b, '<>': a != b,
+            '<': a < b, '<=': a <= b, '>': a > b, '>=': a >= b,
+        } if operand_type != 'bool' else {'==': a == b, '<>': a != b}
+        if op in comparisons:
+            return _literal(comparisons[op], 'bool', expr)
+        return expr
+
+# ==========================
+# Helpers
+# ==========================
+
+def _literal(value, type_name, origin):
+    """Creates a literal at the source position of the node it replaces."""
+    node = ast.Literal(value=value, type_name=type_name, expr_type=type_name)
+    node.pos = origin.pos
+    return node
+
+def _wrap(value):
+    """Wraps an int to the 32-bit two's complement range."""
+    return (value - INT_MIN) % 2 ** 32 + INT_MIN
+
+def _is_int(node):
+    """Tells whether an int literal fits in 32 bits (larger ones are not folded)."""
+    return INT_MIN <= node.value <= INT_MAX
+
+def _is_bool(expr, value):
+    return isinstance(expr, ast.Literal) and expr.type_name == 'bool' and expr.value is value
+
+def _strip_hash(expr):
+    while isinstance(expr, ast.UnaryExpr) and expr.operator == '#':
+        expr = expr.operand
+    return expr
+
+def _always_returns(stmt):
+    """Tells whether a statement returns on every path through it."""
+    if isinstance(stmt, ast.ReturnStmt):
+        return True
+    if isinstance(stmt, ast.Block):
+        return any(_always_returns(s) for s in stmt.stmts)
+    if isinstance(stmt, ast.IfStmt):
+        return (stmt.else_block is not None and _always_returns(stmt.then_block)
+                and _always_returns(stmt.else_block)
+                and all(_always_returns(e.block) for e in stmt.elifs))
+    return False
+
+def _declarations(stmts):
+    """Returns the variable declarations found in dead code."""
+    return [n for stmt in stmts for n in ast.walk(stmt) if isinstance(n, (ast.VarDecl, ast.VarInit))]
+
+def _count_nodes(node):
+    return sum(1 for _ in ast.walk(node))
@@ -0,0 +1,197 @@
+"""Effect analysis of the functions of a program.
+
+A Grammo program is a closed world rooted at ``main``: every call is visible
+in the AST, so the effects of a function are its own plus those of the
+functions it calls. The code generator turns them into LLVM function
+attributes, and the global variables that are never written into constants.
+
+With memoization enabled, the analysis also selects the functions whose
+results can be cached: recursive, pure functions of scalar values.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Set
+from . import ast_nodes as ast
+
+# Types of the parameters and results of memoizable functions
+MEMO_TYPES = ('int', 'real', 'bool')
+
+@dataclass
+class FunctionEffects:
+    """The effects of a function, callees included.
+
+    Attributes:
+        io: Performs input or output.
+        reads_globals: Reads a global variable.
+        writes_globals: Assigns a global variable.
+        uses_heap: Handles strings, which live on the heap and are reference counted.
+        terminates: Always returns: no loops, no recursion and only calls
+            to functions that always return.
+        memo_tables: Updates the memo table of a memoized function.
+        calls: Names of the functions called directly.
+    """
+    io: bool = False
+    reads_globals: bool = False
+    writes_globals: bool = False
+    uses_heap: bool = False
+    terminates: bool = False
+    memo_tables: bool = False
+    calls: Set[str] = field(default_factory=set)
+
+    @property
+    def memory(self) -> Optional[str]:
+        """The memory the function may access: 'none', 'read', or None for any."""
+        if self.io or self.writes_globals or self.uses_heap or self.memo_tables:
+            return None
+        return 'read' if self.reads_globals else 'none'
+
+class EffectAnalyzer:
+    """Computes the effects of the functions of an analyzed program.
+
+    Attributes:
+        functions: The effects of each function, by name.
+        written_globals: Names of the global variables that some function
+            assigns or reads from the input.
+        memoized: Names of the functions to memoize.
+        memo_report: Why each recursive function is memoized or not, by name.
+    """
+
+    def __init__(self):
+        self.functions: Dict[str, FunctionEffects] = {}
+        self.written_globals: Set[str] = set()
+        self.memoized: Set[str] = set()
+        self.memo_report: Dict[str, str] = {}
+
+    def analyze(self, program: ast.Program, memoize=False) -> Dict[str, FunctionEffects]:
+        """Runs the analysis on the program.
+
+        Args:
+            program (ast.Program): The analyzed (and possibly optimized) program.
+            memoize (bool): Select the functions to memoize.
+
+        Returns:
+            dict: The effects of each function, by name.
+        """
+        globals_ = set()
+        for decl in program.decls:
+            if isinstance(decl, ast.VarDecl):
+                globals_.update(decl.names)
+            elif isinstance(decl, ast.VarInit):
+                globals_.add(decl.name)
+
+        funcs = [decl for decl in program.decls if isinstance(decl, ast.FuncDef)]
+        loops = set()
+        for func in funcs:
+            self.functions[func.name], has_loops = self._direct_effects(func, globals_)
+            if has_loops:
+                loops.add(func.name)
+
+        self._propagate(funcs, loops)
+        if memoize:
+            self._select_memoized(funcs)
+            # The callers of a memoized function write its table
+            for name in self.memoized:
+                self.functions[name].memo_tables = True
+            self._propagate(funcs, loops)
+        return self.functions
+
+    def _propagate(self, funcs, loops):
+        """Makes the effects of the callees flow to their callers until nothing changes.
+
+        A function terminates once all its callees are known to: the ones
+        in a call cycle never are.
+        """
+        changed = True
+        while changed:
+            changed = False
+            for func in funcs:
+                effects = self.functions[func.name]
+                callees = [self.functions[name] for name in effects.calls]
+                for flag in ('io', 'reads_globals', 'writes_globals', 'uses_heap', 'memo_tables'):
+                    if not getattr(effects, flag) and any(getattr(c, flag) for c in callees):
+                        setattr(effects, flag, True)
+                        changed = True
+                if (not effects.terminates and func.name not in loops
+                        and all(c.terminates for c in callees)):
+                    effects.terminates = True
+                    changed = True
+
+    def _select_memoized(self, funcs):
+        """Selects the recursive functions whose results can be cached.
+
+        A call can be replaced by its cached result when the function only
+        computes a scalar from scalar arguments: no input or output, no
+        strings and no global variables, whose value could change between
+        two calls (the AST optimizer replaces the constant ones by their
+        value). Only recursive functions are memoized: they are the ones
+        that can repeat a call an exponential number of times.
+        """
+        for func in funcs:
+            if func.name == 'main' or not self._is_recursive(func.name):
+                continue
+            effects = self.functions[func.name]
+            if func.return_type not in MEMO_TYPES or any(p.type_name not in MEMO_TYPES for p in func.params):
+                reason = "parameters or result not int, real or bool"
+            elif effects.io:
+                reason = "performs input or output"
+            elif effects.writes_globals or effects.reads_globals:
+                reason = "uses global variables"
+            elif effects.uses_heap:
+                reason = "handles strings"
+            else:
+                self.memoized.add(func.name)
+                self.memo_report[func.name] = "memoized"
+                continue
+            self.memo_report[func.name] = f"not memoized: {reason}"
+
+    def _is_recursive(self, name):
+        """Tells whether a function is part of a call cycle."""
+        seen, stack = set(), list(self.functions[name].calls)
+        while stack:
+            callee = stack.pop()
+            if callee == name:
+                return True
+            if callee not in seen:
+                seen.add(callee)
+                stack.extend(self.functions[callee].calls)
+        return False
+
+    def _direct_effects(self, func: ast.FuncDef, globals_: Set[str]) -> FunctionEffects:
+        """Collects the effects of the statements of a function, calls excluded.
+
+        Returns:
+            tuple: The effects and whether the function has loops.
+        """
+        effects = FunctionEffects()
+        has_loops = False
+        effects.uses_heap = func.return_type == 'string' or any(p.type_name == 'string' for p in func.params)
+        for n in ast.walk(func.body):
+            if isinstance(n, (ast.FuncCallExpr, ast.ProcCallStmt)):
+                effects.calls.add(n.name)
+            elif isinstance(n, ast.VarRef):
+                if n.name in globals_:
+                    effects.reads_globals = True
+            elif isinstance(n, ast.AssignStmt):
+                if n.name in globals_:
+                    effects.writes_globals = True
+                    self.written_globals.add(n.name)
+            elif isinstance(n, ast.OutputStmt):
+                effects.io = True
+            elif isinstance(n, ast.InputStmt):
+                effects.io = True
+                for arg in n.args:
+                    while isinstance(arg, ast.UnaryExpr) and arg.operator == '#':
+                        arg = arg.operand
+                    if isinstance(arg, ast.VarRef) and arg.name in globals_:
+                        effects.writes_globals = True
+                        self.written_globals.add(arg.name)
+            elif isinstance(n, (ast.WhileStmt, ast.ForStmt)):
+                has_loops = True
+            elif isinstance(n, ast.VarDecl):
+                if n.type_name == 'string':
+                    effects.uses_heap = True
+            elif isinstance(n, ast.VarInit):
+                if n.value.type_name == 'string':
+                    effects.uses_heap = True
+            if isinstance(n, ast.Expr) and n.expr_type == 'string':
+                effects.uses_heap = True
+        return effects, has_loops
@@ -1,7 +1,13 @@
+import os
 import sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from . import ast_nodes as ast
 from .symbol_table import SymbolTable, VarSymbol, FuncSymbol, Symbol
 
+# Below this number of functions, a process pool costs more than it saves.
+PARALLEL_MIN_FUNCS = 64
+
 class SemanticError(Exception):
     """Exception raised for semantic analysis errors."""
     pass
@@ -14,11 +20,19 @@ class SemanticAnalyzer:
     - Type mismatches.
     - Control flow issues (e.g. missing returns).
     - Scope rules.
+
+    While checking, the resolved type of every expression is stored in its
+    ``expr_type`` and implicit int -> real promotions are made explicit by
+    wrapping the promoted expression in an ``ast.Coercion`` node.
     """
 
-    def __init__(self):
-        """Initializes the semantic analyzer with an empty symbol table."""
-        self.symbol_table = SymbolTable()
+    def __init__(self, symbol_table: SymbolTable = None):
+        """Initializes the semantic analyzer.
+
+        Args:
+            symbol_table: The symbol table to use (default: an empty one).
+        """
+        self.symbol_table = symbol_table if symbol_table is not None else SymbolTable()
         self.current_func_ret_type = None
         self.errors = []
 
@@ -32,7 +46,10 @@ class SemanticAnalyzer:
     def visit(self, node):
         method_name = 'visit_' + node.__class__.__name__
         visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
+        result = visitor(node)
+        if isinstance(node, ast.Expr):
+            node.expr_type = result
+        return result
 
     def generic_visit(self, node):
         raise NotImplementedError(f"No visit method for {node.__class__.__name__}")
@@ -41,11 +58,18 @@ class SemanticAnalyzer:
     # Top Level Helper
     # ==========================
 
-    def analyze(self, program_node: ast.Program):
+    def analyze(self, program_node: ast.Program, jobs: int = 1):
         """Runs the semantic analysis on the program.
 
+        Function bodies only read the global scope, so with ``jobs > 1`` they
+        are analyzed by a process pool. Errors found by the workers are
+        collected in ``self.errors`` in source order and the first one is
+        raised, exactly as in a sequential run.
+
         Args:
             program_node (ast.Program): The root AST node.
+            jobs (int): Number of worker processes for the function bodies
+                (0 uses all CPUs).
         """
         # Pass 1: Register all global functions and variables
         for decl in program_node.decls:
@@ -64,9 +88,39 @@ class SemanticAnalyzer:
              self.error("'main' function must take no parameters.")
 
         # Pass 2: Analyze Function Bodies
-        for decl in program_node.decls:
-            if isinstance(decl, ast.FuncDef):
-                self._analyze_func_body(decl)
+        funcs = [decl for decl in program_node.decls if isinstance(decl, ast.FuncDef)]
+        jobs = jobs or os.cpu_count() or 1
+        if jobs > 1 and len(funcs) >= PARALLEL_MIN_FUNCS:
+            annotated = iter(self._analyze_func_bodies_parallel(funcs, jobs))
+            program_node.decls = [next(annotated) if isinstance(decl, ast.FuncDef) else decl
+                                  for decl in program_node.decls]
+        else:
+            for func in funcs:
+                self._analyze_func_body(func)
+
+    def _analyze_func_bodies_parallel(self, funcs, jobs):
+        """Analyzes the function bodies on a process pool.
+
+        Each worker receives a frozen snapshot of the global scope and the
+        function list once (inherited for free when ``fork`` is available);
+        tasks are contiguous index ranges.
+
+        Returns:
+            list: The annotated FuncDef nodes sent back by the workers, in order.
+        """
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+
+        n_chunks = min(len(funcs), jobs * 4)
+        bounds = [len(funcs) * i // n_chunks for i in range(n_chunks + 1)]
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx, initializer=_init_worker,
+                                 initargs=(self.symbol_table.global_symbols(), funcs)) as pool:
+            results = list(pool.map(_analyze_func_range, bounds[:-1], bounds[1:]))
+            self.errors = [msg for _, errors in results for msg in errors]
+
+        if self.errors:
+            raise SemanticError(self.errors[0])
+        return [func for annotated, _ in results for func in annotated]
 
     def _register_func_signature(self, node: ast.FuncDef):
         if self.symbol_table.lookup(node.name):
@@ -142,6 +196,7 @@ class SemanticAnalyzer:
             
         val_node = node.value
         type_name = val_node.type_name
+        val_node.expr_type = type_name
         sym = VarSymbol(name=node.name, type_name=type_name)
         self.symbol_table.insert(sym)
 
@@ -167,6 +222,7 @@ class SemanticAnalyzer:
         
         if not self._check_compatibility(sym.type_name, rhs_type):
             self.error(f"Type mismatch in assignment to '{node.name}': expected {sym.type_name}, got {rhs_type}", node)
+        node.value = self._coerce(node.value, sym.type_name)
 
     def visit_ProcCallStmt(self, node: ast.ProcCallStmt):
         sym = self.symbol_table.lookup(node.name)
@@ -195,6 +251,7 @@ class SemanticAnalyzer:
             got_type = self.visit(node.value)
             if not self._check_compatibility(expected, got_type):
                 self.error(f"Return type mismatch: expected {expected}, got {got_type}", node)
+            node.value = self._coerce(node.value, expected)
 
     def visit_IfStmt(self, node: ast.IfStmt):
         cond_type = self.visit(node.condition)
@@ -232,7 +289,7 @@ class SemanticAnalyzer:
     def visit_OutputStmt(self, node: ast.OutputStmt):
         for arg in node.args:
             if isinstance(arg, ast.UnaryExpr) and arg.operator == '#':
-                 self.visit(arg.operand)
+                 arg.expr_type = self.visit(arg.operand)
             elif isinstance(arg, ast.Expr):
                  self.visit(arg)
             else:
@@ -250,7 +307,8 @@ class SemanticAnalyzer:
                     self.error(f"Input variable '{target.name}' not declared.", node)
                 if not isinstance(sym, VarSymbol):
                     self.error(f"Input target '{target.name}' is not a variable.", node)
-                
+                target.expr_type = arg.expr_type = sym.type_name
+
             elif isinstance(arg, ast.Expr):
                 t = self.visit(arg)
                 if t != 'string':
@@ -280,6 +338,7 @@ class SemanticAnalyzer:
             if l_type == 'int' and r_type == 'int': return 'int'
             if l_type == 'real' and r_type == 'real': return 'real'
             if (l_type == 'int' and r_type == 'real') or (l_type == 'real' and r_type == 'int'):
+                 self._balance_operands(node)
                  return 'real'
             if op == '+' and l_type == 'string' and r_type == 'string':
                  return 'string'
@@ -293,8 +352,10 @@ class SemanticAnalyzer:
         if op in ['==', '<>', '<', '<=', '>', '>=']:
             if op in ['==', '<>']:
                 if self._check_compatibility(l_type, r_type) or self._check_compatibility(r_type, l_type):
+                    self._balance_operands(node)
                     return 'bool'
             if l_type in ['int', 'real'] and r_type in ['int', 'real']:
+                 self._balance_operands(node)
                  return 'bool'
             self.error(f"Invalid types for comparison '{op}': {l_type}, {r_type}", node)
             
@@ -328,6 +389,18 @@ class SemanticAnalyzer:
     # Helpers
     # ==========================
 
+    def _coerce(self, expr: ast.Expr, target: str) -> ast.Expr:
+        """Wraps expr in a Coercion node if it must be promoted to target."""
+        if target == 'real' and expr.expr_type == 'int':
+            return ast.Coercion(operand=expr, expr_type='real', line=expr.line, column=expr.column)
+        return expr
+
+    def _balance_operands(self, node: ast.BinaryExpr):
+        """Promotes the int operand of a mixed int/real binary expression."""
+        if 'real' in (node.left.expr_type, node.right.expr_type):
+            node.left = self._coerce(node.left, 'real')
+            node.right = self._coerce(node.right, 'real')
+
     def _check_compatibility(self, target: str, source: str) -> bool:
         if target == source: return True
         if target == 'real' and source == 'int': return True
@@ -342,3 +415,32 @@ class SemanticAnalyzer:
             got = self.visit(arg)
             if not self._check_compatibility(expected, got):
                 self.error(f"Argument {i+1} mismatch: expected {expected}, got {got}", node)
+            args[i] = self._coerce(arg, expected)
+
+# ==========================
+# Process Pool Workers
+# ==========================
+
+_worker_state = None
+
+def _init_worker(global_symbols, funcs):
+    global _worker_state
+    _worker_state = (global_symbols, funcs)
+
+def _analyze_func_range(start, end):
+    """Analyzes funcs[start:end].
+
+    Returns:
+        tuple: The annotated FuncDef nodes and the error message of each failing function.
+    """
+    global_symbols, funcs = _worker_state
+    errors = []
+    analyzer = SemanticAnalyzer(SymbolTable.from_globals(global_symbols))
+    for i in range(start, end):
+        try:
+            analyzer._analyze_func_body(funcs[i])
+        except SemanticError as e:
+            errors.append(str(e))
+            # The failed body may have left scopes open.
+            analyzer = SemanticAnalyzer(SymbolTable.from_globals(global_symbols))
+    return funcs[start:end], errors
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 
-@dataclass
+@dataclass(frozen=True)
 class Symbol:
     """Base class for all symbols in the symbol table.
 
@@ -12,12 +12,12 @@ class Symbol:
     name: str
     type_name: str
 
-@dataclass
+@dataclass(frozen=True)
 class VarSymbol(Symbol):
     """Represents a variable symbol."""
     pass
 
-@dataclass
+@dataclass(frozen=True)
 class FuncSymbol(Symbol):
     """Represents a function symbol.
 
@@ -31,25 +31,59 @@ class FuncSymbol(Symbol):
 class SymbolTable:
     """Manages symbols and scopes for semantic analysis.
 
-    Supports nested scopes (global -> local -> block).
+    Supports nested scopes (global -> local -> block). All visible symbols
+    live in a single name -> symbol index; each scope keeps an undo log of the
+    bindings it introduced, so ``insert`` and ``lookup`` are O(1) regardless
+    of the nesting depth and ``exit_scope`` only touches the names declared
+    in the scope being closed.
     """
 
     def __init__(self):
         """Initializes the symbol table with a global scope."""
-        # scopes[0] is Global
-        self.scopes: List[Dict[str, Symbol]] = [{}]
+        # name -> (symbol, depth of the scope that declared it)
+        self._index: Dict[str, Tuple[Symbol, int]] = {}
+        # undo_logs[d] holds (symbol, shadowed binding) pairs for scope d; [0] is Global
+        self._undo_logs: List[List[Tuple[Symbol, Optional[Tuple[Symbol, int]]]]] = [[]]
+
+    @property
+    def scopes(self) -> List[Dict[str, Symbol]]:
+        """The symbols declared in each scope, from global to innermost.
+
+        Rebuilt on each access; meant for inspection and debugging.
+        """
+        return [{sym.name: sym for sym, _ in log} for log in self._undo_logs]
+
+    def global_symbols(self) -> Tuple[Symbol, ...]:
+        """Returns a snapshot of the symbols declared in the global scope."""
+        return tuple(sym for sym, _ in self._undo_logs[0])
+
+    @classmethod
+    def from_globals(cls, symbols) -> 'SymbolTable':
+        """Creates a symbol table whose global scope holds the given symbols.
+
+        Args:
+            symbols: Symbols, typically a snapshot taken with global_symbols().
+        """
+        table = cls()
+        for sym in symbols:
+            table.insert(sym)
+        return table
 
     def enter_scope(self):
         """Enters a new nested scope."""
-        self.scopes.append({})
+        self._undo_logs.append([])
 
     def exit_scope(self):
         """Exits the current scope.
 
         Does nothing if attempting to exit the global scope.
         """
-        if len(self.scopes) > 1:
-            self.scopes.pop()
+        if len(self._undo_logs) > 1:
+            for sym, shadowed in reversed(self._undo_logs.pop()):
+                if shadowed is None:
+                    del self._index[sym.name]
+                else:
+                    self._index[sym.name] = shadowed
 
     def insert(self, symbol: Symbol) -> bool:
         """Inserts a symbol into the current scope.
@@ -60,10 +94,12 @@ class SymbolTable:
         Returns:
             bool: True if insertion was successful, False if a collision occurred in the current scope.
         """
-        current = self.scopes[-1]
-        if symbol.name in current:
+        depth = len(self._undo_logs) - 1
+        previous = self._index.get(symbol.name)
+        if previous is not None and previous[1] == depth:
             return False
-        current[symbol.name] = symbol
+        self._undo_logs[depth].append((symbol, previous))
+        self._index[symbol.name] = (symbol, depth)
         return True
 
     def lookup(self, name: str) -> Optional[Symbol]:
@@ -75,10 +111,8 @@ class SymbolTable:
         Returns:
             Optional[Symbol]: The found symbol, or None if not found.
         """
-        for scope in reversed(self.scopes):
-            if name in scope:
-                return scope[name]
-        return None
+        entry = self._index.get(name)
+        return entry[0] if entry is not None else None
 
     def __repr__(self):
-        return f"SymbolTable(depth={len(self.scopes)})"
+        return f"SymbolTable(depth={len(self._undo_logs)})"
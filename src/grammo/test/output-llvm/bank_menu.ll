@@ -1,174 +1,1651 @@
 ; ModuleID = '<string>'
 source_filename = "<string>"
-target triple = "x86_64-pc-windows-msvc"
-
-@G_START_BAL = local_unnamed_addr global double 1.000000e+03
-@str_0 = constant [15 x i8] c"Mini Bank Demo\00"
-@G_TITLE = local_unnamed_addr global ptr @str_0
-@str_1 = local_unnamed_addr constant [2 x i8] c"\0A\00"
-@str_2 = constant [3 x i8] c"%s\00"
-@str_3 = constant [17 x i8] c"1 = Mostra saldo\00"
-@str_4 = constant [13 x i8] c"2 = Deposita\00"
-@str_5 = constant [12 x i8] c"3 = Preleva\00"
-@str_6 = constant [9 x i8] c"0 = Esci\00"
-@str_7 = constant [19 x i8] c"Importo non valido\00"
-@str_8 = constant [20 x i8] c"Fondi insufficienti\00"
-@str_9 = constant [9 x i8] c"Scelta: \00"
-@str_10 = constant [3 x i8] c"%d\00"
-@str_11 = constant [7 x i8] c"Saldo=\00"
-@str_12 = constant [5 x i8] c"%.6f\00"
-@str_13 = constant [19 x i8] c"Importo deposito: \00"
-@str_14 = constant [4 x i8] c"%lf\00"
-@str_15 = constant [13 x i8] c"Nuovo saldo=\00"
-@str_16 = constant [19 x i8] c"Importo prelievo: \00"
-@str_17 = constant [18 x i8] c"Scelta non valida\00"
-@str_18 = constant [13 x i8] c"Arrivederci.\00"
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-i128:128-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-unknown-linux-gnu"
 
-; Function Attrs: nofree nounwind
-declare noundef i32 @printf(ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+@grammo_out_buf = internal unnamed_addr global ptr null
+@grammo_out_cap = internal unnamed_addr global i1 false
+@grammo_out_len = internal unnamed_addr global i64 0
+@grammo_out_tty = internal unnamed_addr global i32 -1
+@str_1 = private unnamed_addr constant [16 x i8] c"Mini Bank Demo\0A\00"
+@str_2 = private unnamed_addr constant [18 x i8] c"1 = Mostra saldo\0A\00"
+@str_3 = private unnamed_addr constant [14 x i8] c"2 = Deposita\0A\00"
+@str_4 = private unnamed_addr constant [13 x i8] c"3 = Preleva\0A\00"
+@str_5 = private unnamed_addr constant [10 x i8] c"0 = Esci\0A\00"
+@str_6 = private unnamed_addr constant [20 x i8] c"Importo non valido\0A\00"
+@str_7 = private unnamed_addr constant [21 x i8] c"Fondi insufficienti\0A\00"
+@str_8 = private unnamed_addr constant [9 x i8] c"Scelta: \00"
+@grammo_in_buf = internal unnamed_addr global ptr null
+@grammo_in_cap = internal unnamed_addr global i64 0
+@grammo_in_pos = internal unnamed_addr global i64 0
+@grammo_in_end = internal unnamed_addr global i64 0
+@str_9 = private constant [12 x i8] c"Saldo=%.6f\0A\00"
+@str_10 = private unnamed_addr constant [19 x i8] c"Importo deposito: \00"
+@str_11 = private constant [18 x i8] c"Nuovo saldo=%.6f\0A\00"
+@str_12 = private unnamed_addr constant [19 x i8] c"Importo prelievo: \00"
+@str_13 = private unnamed_addr constant [19 x i8] c"Scelta non valida\0A\00"
+@str_14 = private unnamed_addr constant [14 x i8] c"Arrivederci.\0A\00"
 
 ; Function Attrs: nofree nounwind
-declare noundef i32 @scanf(ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+declare noundef i32 @snprintf(ptr noalias nocapture noundef writeonly, i64 noundef, ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+
+; Function Attrs: mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite)
+declare noalias noundef ptr @realloc(ptr allocptr nocapture, i64 noundef) local_unnamed_addr #1
 
 ; Function Attrs: nofree nounwind
-define void @show_menu() local_unnamed_addr #0 {
-entry:
-  %putchar = tail call i32 @putchar(i32 10)
-  %load_G_TITLE = load ptr, ptr @G_TITLE, align 8
-  %.6 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr %load_G_TITLE)
-  %putchar1 = tail call i32 @putchar(i32 10)
-  %.12 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_3)
-  %putchar2 = tail call i32 @putchar(i32 10)
-  %.18 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_4)
-  %putchar3 = tail call i32 @putchar(i32 10)
-  %.24 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_5)
-  %putchar4 = tail call i32 @putchar(i32 10)
-  %.30 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_6)
-  %putchar5 = tail call i32 @putchar(i32 10)
-  ret void
-}
+declare noundef i64 @write(i32 noundef, ptr nocapture noundef readonly, i64 noundef) local_unnamed_addr #0
 
-; Function Attrs: mustprogress nofree norecurse nosync nounwind willreturn memory(none)
-define double @deposit(double %dp_bal, double %dp_amt) local_unnamed_addr #1 {
-entry:
-  %.6 = fadd double %dp_bal, %dp_amt
-  ret double %.6
-}
+; Function Attrs: nounwind
+declare i32 @isatty(i32) local_unnamed_addr #2
 
-; Function Attrs: nofree nounwind
-define double @withdraw(double %wd_bal, double %wd_amt) local_unnamed_addr #0 {
-entry:
-  %.6 = fcmp ugt double %wd_amt, 0.000000e+00
-  br i1 %.6, label %next_branch, label %if_then
-
-common.ret:                                       ; preds = %elif_0_next, %elif_0_then, %if_then
-  %common.ret.op = phi double [ %wd_bal, %if_then ], [ %wd_bal, %elif_0_then ], [ %.23, %elif_0_next ]
-  ret double %common.ret.op
-
-if_then:                                          ; preds = %entry
-  %.9 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_7)
-  %putchar1 = tail call i32 @putchar(i32 10)
-  br label %common.ret
-
-next_branch:                                      ; preds = %entry
-  %.14 = fcmp ogt double %wd_amt, %wd_bal
-  br i1 %.14, label %elif_0_then, label %elif_0_next
-
-elif_0_then:                                      ; preds = %next_branch
-  %.18 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_8)
-  %putchar = tail call i32 @putchar(i32 10)
-  br label %common.ret
-
-elif_0_next:                                      ; preds = %next_branch
-  %.23 = fsub double %wd_bal, %wd_amt
-  br label %common.ret
-}
+; Function Attrs: mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite)
+declare noalias noundef ptr @malloc(i64 noundef) local_unnamed_addr #3
 
 ; Function Attrs: nofree nounwind
-define void @main() local_unnamed_addr #0 {
+declare noundef i64 @read(i32 noundef, ptr nocapture noundef, i64 noundef) local_unnamed_addr #0
+
+; Function Attrs: mustprogress nofree nounwind willreturn
+declare double @strtod(ptr readonly, ptr nocapture) local_unnamed_addr #4
+
+; Function Attrs: mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memmove.p0.p0.i64(ptr nocapture writeonly, ptr nocapture readonly, i64, i1 immarg) #5
+
+; Function Attrs: nounwind
+define void @main() local_unnamed_addr #2 {
 entry:
-  %m_amount = alloca double, align 8
-  store double 0.000000e+00, ptr %m_amount, align 8
-  %m_choice = alloca i32, align 4
-  store i32 0, ptr %m_choice, align 4
-  %load_G_START_BAL = load double, ptr @G_START_BAL, align 8
+  %end.i283 = alloca ptr, align 8
+  %end.i = alloca ptr, align 8
+  br label %while_body.outer
+
+while_body.outer:                                 ; preds = %while_body.outer.backedge, %entry
+  %m_balance.0478.ph = phi double [ 1.000000e+03, %entry ], [ %m_balance.0478.ph.be, %while_body.outer.backedge ]
+  %m_choice.0477.ph = phi i32 [ 0, %entry ], [ %m_choice.1, %while_body.outer.backedge ]
+  %m_amount.0476.ph = phi double [ 0.000000e+00, %entry ], [ %m_amount.0476.ph.be, %while_body.outer.backedge ]
   br label %while_body
 
-while_body:                                       ; preds = %if_merge, %entry
-  %m_balance.06 = phi double [ %load_G_START_BAL, %entry ], [ %m_balance.1, %if_merge ]
-  call void @show_menu()
-  %.13 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_9)
-  %.15 = call i32 (ptr, ...) @scanf(ptr nonnull @str_10, ptr nonnull %m_choice)
-  %load_m_choice = load i32, ptr %m_choice, align 4
-  switch i32 %load_m_choice, label %elif_2_next [
+while_body:                                       ; preds = %while_body.backedge, %while_body.outer
+  %m_choice.0477 = phi i32 [ %m_choice.0477.ph, %while_body.outer ], [ %m_choice.1, %while_body.backedge ]
+  %.4.i.i = load i64, ptr @grammo_out_len, align 8
+  %.5.i.i = add i64 %.4.i.i, 2
+  %.6.b.i.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i.i = select i1 %.6.b.i.i, i64 65536, i64 0
+  %.7.not.i.i = icmp ugt i64 %.5.i.i, %.6.i.i
+  %.20.pre1.i.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i.i, label %loop.i.i.i, label %grammo_out_reserve.exit.i
+
+loop.i.i.i:                                       ; preds = %while_body, %body.i.i.i
+  %written.i.i.i = phi i64 [ %.10.i.i.i, %body.i.i.i ], [ 0, %while_body ]
+  %.5.i.i.i = icmp slt i64 %written.i.i.i, %.4.i.i
+  br i1 %.5.i.i.i, label %body.i.i.i, label %grammo_out_flush.exit.i.i
+
+body.i.i.i:                                       ; preds = %loop.i.i.i
+  %.7.i.i.i = getelementptr i8, ptr %.20.pre1.i.i, i64 %written.i.i.i
+  %.8.i.i.i = sub i64 %.4.i.i, %written.i.i.i
+  %.9.i.i.i = tail call i64 @write(i32 1, ptr %.7.i.i.i, i64 %.8.i.i.i)
+  %.10.i.i.i = add i64 %.9.i.i.i, %written.i.i.i
+  %.11.i.i.i = icmp sgt i64 %.9.i.i.i, 0
+  br i1 %.11.i.i.i, label %loop.i.i.i, label %grammo_out_flush.exit.i.i
+
+grammo_out_flush.exit.i.i:                        ; preds = %body.i.i.i, %loop.i.i.i
+  %.10.b.i.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i.i, label %grammo_out_reserve.exit.i, label %grow.i.i
+
+grow.i.i:                                         ; preds = %grammo_out_flush.exit.i.i
+  %.16.i.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i.i, i64 65536)
+  store ptr %.16.i.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit.i
+
+grammo_out_reserve.exit.i:                        ; preds = %grow.i.i, %grammo_out_flush.exit.i.i, %while_body
+  %.7.i.i = phi i64 [ 0, %grow.i.i ], [ 0, %grammo_out_flush.exit.i.i ], [ %.4.i.i, %while_body ]
+  %.20.i.i = phi ptr [ %.16.i.i, %grow.i.i ], [ %.20.pre.i.i, %grammo_out_flush.exit.i.i ], [ %.20.pre1.i.i, %while_body ]
+  %.22.i.i = getelementptr i8, ptr %.20.i.i, i64 %.7.i.i
+  store i16 10, ptr %.22.i.i, align 1
+  %.8.i.i = add nsw i64 %.7.i.i, 1
+  store i64 %.8.i.i, ptr @grammo_out_len, align 8
+  %.2.i.i.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i.i = icmp slt i32 %.2.i.i.i, 0
+  br i1 %.3.i.i.i, label %check.i.i.i, label %grammo_out_interactive.exit.i.i
+
+check.i.i.i:                                      ; preds = %grammo_out_reserve.exit.i
+  %.5.i.i10.i = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i10.i, ptr @grammo_out_tty, align 4
+  %.4.i11.pre.pre.i = load i64, ptr @grammo_out_len, align 8
+  %.20.pre1.i16.pre247.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_interactive.exit.i.i
+
+grammo_out_interactive.exit.i.i:                  ; preds = %check.i.i.i, %grammo_out_reserve.exit.i
+  %.20.pre1.i16.pre247.i = phi ptr [ %.20.pre1.i16.pre247.pre.i, %check.i.i.i ], [ %.20.i.i, %grammo_out_reserve.exit.i ]
+  %.4.i11.pre.i = phi i64 [ %.4.i11.pre.pre.i, %check.i.i.i ], [ %.8.i.i, %grammo_out_reserve.exit.i ]
+  %.8.i.i1.i = phi i32 [ %.5.i.i10.i, %check.i.i.i ], [ %.2.i.i.i, %grammo_out_reserve.exit.i ]
+  %.9.i.i2.i = icmp sgt i32 %.8.i.i1.i, 0
+  br i1 %.9.i.i2.i, label %loop.i.i3.i, label %grammo_out_advance.exit.i
+
+loop.i.i3.i:                                      ; preds = %grammo_out_interactive.exit.i.i, %body.i.i6.i
+  %written.i.i4.i = phi i64 [ %.10.i.i8.i, %body.i.i6.i ], [ 0, %grammo_out_interactive.exit.i.i ]
+  %.5.i3.i.i = icmp slt i64 %written.i.i4.i, %.4.i11.pre.i
+  br i1 %.5.i3.i.i, label %body.i.i6.i, label %grammo_out_flush.exit.i5.i
+
+body.i.i6.i:                                      ; preds = %loop.i.i3.i
+  %.7.i.i7.i = getelementptr i8, ptr %.20.pre1.i16.pre247.i, i64 %written.i.i4.i
+  %.8.i4.i.i = sub i64 %.4.i11.pre.i, %written.i.i4.i
+  %.9.i5.i.i = tail call i64 @write(i32 1, ptr %.7.i.i7.i, i64 %.8.i4.i.i)
+  %.10.i.i8.i = add i64 %.9.i5.i.i, %written.i.i4.i
+  %.11.i.i9.i = icmp sgt i64 %.9.i5.i.i, 0
+  br i1 %.11.i.i9.i, label %loop.i.i3.i, label %grammo_out_flush.exit.i5.i
+
+grammo_out_flush.exit.i5.i:                       ; preds = %body.i.i6.i, %loop.i.i3.i
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i16.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit.i
+
+grammo_out_advance.exit.i:                        ; preds = %grammo_out_flush.exit.i5.i, %grammo_out_interactive.exit.i.i
+  %.20.pre1.i16.i = phi ptr [ %.20.pre1.i16.pre247.i, %grammo_out_interactive.exit.i.i ], [ %.20.pre1.i16.pre.i, %grammo_out_flush.exit.i5.i ]
+  %.4.i11.i = phi i64 [ %.4.i11.pre.i, %grammo_out_interactive.exit.i.i ], [ 0, %grammo_out_flush.exit.i5.i ]
+  %.5.i12.i = add i64 %.4.i11.i, 16
+  %.6.b.i13.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i14.i = select i1 %.6.b.i13.i, i64 65536, i64 0
+  %.7.not.i15.i = icmp ugt i64 %.5.i12.i, %.6.i14.i
+  br i1 %.7.not.i15.i, label %loop.i.i20.i, label %grammo_out_reserve.exit34.i
+
+loop.i.i20.i:                                     ; preds = %grammo_out_advance.exit.i, %body.i.i28.i
+  %written.i.i21.i = phi i64 [ %.10.i.i32.i, %body.i.i28.i ], [ 0, %grammo_out_advance.exit.i ]
+  %.5.i.i22.i = icmp slt i64 %written.i.i21.i, %.4.i11.i
+  br i1 %.5.i.i22.i, label %body.i.i28.i, label %grammo_out_flush.exit.i23.i
+
+body.i.i28.i:                                     ; preds = %loop.i.i20.i
+  %.7.i.i29.i = getelementptr i8, ptr %.20.pre1.i16.i, i64 %written.i.i21.i
+  %.8.i.i30.i = sub i64 %.4.i11.i, %written.i.i21.i
+  %.9.i.i31.i = tail call i64 @write(i32 1, ptr %.7.i.i29.i, i64 %.8.i.i30.i)
+  %.10.i.i32.i = add i64 %.9.i.i31.i, %written.i.i21.i
+  %.11.i.i33.i = icmp sgt i64 %.9.i.i31.i, 0
+  br i1 %.11.i.i33.i, label %loop.i.i20.i, label %grammo_out_flush.exit.i23.i
+
+grammo_out_flush.exit.i23.i:                      ; preds = %body.i.i28.i, %loop.i.i20.i
+  %.10.b.i24.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i25.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i24.i, label %grammo_out_reserve.exit34.i, label %grow.i26.i
+
+grow.i26.i:                                       ; preds = %grammo_out_flush.exit.i23.i
+  %.16.i27.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i25.i, i64 65536)
+  store ptr %.16.i27.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit34.i
+
+grammo_out_reserve.exit34.i:                      ; preds = %grow.i26.i, %grammo_out_flush.exit.i23.i, %grammo_out_advance.exit.i
+  %.7.i35.i = phi i64 [ 0, %grow.i26.i ], [ 0, %grammo_out_flush.exit.i23.i ], [ %.4.i11.i, %grammo_out_advance.exit.i ]
+  %.20.i18.i = phi ptr [ %.16.i27.i, %grow.i26.i ], [ %.20.pre.i25.i, %grammo_out_flush.exit.i23.i ], [ %.20.pre1.i16.i, %grammo_out_advance.exit.i ]
+  %.22.i19.i = getelementptr i8, ptr %.20.i18.i, i64 %.7.i35.i
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(16) %.22.i19.i, ptr noundef nonnull align 1 dereferenceable(16) @str_1, i64 16, i1 false)
+  %.8.i36.i = add nsw i64 %.7.i35.i, 15
+  store i64 %.8.i36.i, ptr @grammo_out_len, align 8
+  %.2.i.i37.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i38.i = icmp slt i32 %.2.i.i37.i, 0
+  br i1 %.3.i.i38.i, label %check.i.i55.i, label %grammo_out_interactive.exit.i39.i
+
+check.i.i55.i:                                    ; preds = %grammo_out_reserve.exit34.i
+  %.5.i.i56.i = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i56.i, ptr @grammo_out_tty, align 4
+  %.4.i58.pre.pre.i = load i64, ptr @grammo_out_len, align 8
+  %.20.pre1.i63.pre250.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_interactive.exit.i39.i
+
+grammo_out_interactive.exit.i39.i:                ; preds = %check.i.i55.i, %grammo_out_reserve.exit34.i
+  %.20.pre1.i63.pre250.i = phi ptr [ %.20.pre1.i63.pre250.pre.i, %check.i.i55.i ], [ %.20.i18.i, %grammo_out_reserve.exit34.i ]
+  %.4.i58.pre.i = phi i64 [ %.4.i58.pre.pre.i, %check.i.i55.i ], [ %.8.i36.i, %grammo_out_reserve.exit34.i ]
+  %.8.i.i40.i = phi i32 [ %.5.i.i56.i, %check.i.i55.i ], [ %.2.i.i37.i, %grammo_out_reserve.exit34.i ]
+  %.9.i.i41.i = icmp sgt i32 %.8.i.i40.i, 0
+  br i1 %.9.i.i41.i, label %loop.i.i45.i, label %grammo_out_advance.exit57.i
+
+loop.i.i45.i:                                     ; preds = %grammo_out_interactive.exit.i39.i, %body.i.i49.i
+  %written.i.i46.i = phi i64 [ %.10.i.i53.i, %body.i.i49.i ], [ 0, %grammo_out_interactive.exit.i39.i ]
+  %.5.i3.i47.i = icmp slt i64 %written.i.i46.i, %.4.i58.pre.i
+  br i1 %.5.i3.i47.i, label %body.i.i49.i, label %grammo_out_flush.exit.i48.i
+
+body.i.i49.i:                                     ; preds = %loop.i.i45.i
+  %.7.i.i50.i = getelementptr i8, ptr %.20.pre1.i63.pre250.i, i64 %written.i.i46.i
+  %.8.i4.i51.i = sub i64 %.4.i58.pre.i, %written.i.i46.i
+  %.9.i5.i52.i = tail call i64 @write(i32 1, ptr %.7.i.i50.i, i64 %.8.i4.i51.i)
+  %.10.i.i53.i = add i64 %.9.i5.i52.i, %written.i.i46.i
+  %.11.i.i54.i = icmp sgt i64 %.9.i5.i52.i, 0
+  br i1 %.11.i.i54.i, label %loop.i.i45.i, label %grammo_out_flush.exit.i48.i
+
+grammo_out_flush.exit.i48.i:                      ; preds = %body.i.i49.i, %loop.i.i45.i
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i63.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit57.i
+
+grammo_out_advance.exit57.i:                      ; preds = %grammo_out_flush.exit.i48.i, %grammo_out_interactive.exit.i39.i
+  %.20.pre1.i63.i = phi ptr [ %.20.pre1.i63.pre250.i, %grammo_out_interactive.exit.i39.i ], [ %.20.pre1.i63.pre.i, %grammo_out_flush.exit.i48.i ]
+  %.4.i58.i = phi i64 [ %.4.i58.pre.i, %grammo_out_interactive.exit.i39.i ], [ 0, %grammo_out_flush.exit.i48.i ]
+  %.5.i59.i = add i64 %.4.i58.i, 18
+  %.6.b.i60.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i61.i = select i1 %.6.b.i60.i, i64 65536, i64 0
+  %.7.not.i62.i = icmp ugt i64 %.5.i59.i, %.6.i61.i
+  br i1 %.7.not.i62.i, label %loop.i.i67.i, label %grammo_out_reserve.exit81.i
+
+loop.i.i67.i:                                     ; preds = %grammo_out_advance.exit57.i, %body.i.i75.i
+  %written.i.i68.i = phi i64 [ %.10.i.i79.i, %body.i.i75.i ], [ 0, %grammo_out_advance.exit57.i ]
+  %.5.i.i69.i = icmp slt i64 %written.i.i68.i, %.4.i58.i
+  br i1 %.5.i.i69.i, label %body.i.i75.i, label %grammo_out_flush.exit.i70.i
+
+body.i.i75.i:                                     ; preds = %loop.i.i67.i
+  %.7.i.i76.i = getelementptr i8, ptr %.20.pre1.i63.i, i64 %written.i.i68.i
+  %.8.i.i77.i = sub i64 %.4.i58.i, %written.i.i68.i
+  %.9.i.i78.i = tail call i64 @write(i32 1, ptr %.7.i.i76.i, i64 %.8.i.i77.i)
+  %.10.i.i79.i = add i64 %.9.i.i78.i, %written.i.i68.i
+  %.11.i.i80.i = icmp sgt i64 %.9.i.i78.i, 0
+  br i1 %.11.i.i80.i, label %loop.i.i67.i, label %grammo_out_flush.exit.i70.i
+
+grammo_out_flush.exit.i70.i:                      ; preds = %body.i.i75.i, %loop.i.i67.i
+  %.10.b.i71.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i72.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i71.i, label %grammo_out_reserve.exit81.i, label %grow.i73.i
+
+grow.i73.i:                                       ; preds = %grammo_out_flush.exit.i70.i
+  %.16.i74.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i72.i, i64 65536)
+  store ptr %.16.i74.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit81.i
+
+grammo_out_reserve.exit81.i:                      ; preds = %grow.i73.i, %grammo_out_flush.exit.i70.i, %grammo_out_advance.exit57.i
+  %.7.i82.i = phi i64 [ 0, %grow.i73.i ], [ 0, %grammo_out_flush.exit.i70.i ], [ %.4.i58.i, %grammo_out_advance.exit57.i ]
+  %.20.i65.i = phi ptr [ %.16.i74.i, %grow.i73.i ], [ %.20.pre.i72.i, %grammo_out_flush.exit.i70.i ], [ %.20.pre1.i63.i, %grammo_out_advance.exit57.i ]
+  %.22.i66.i = getelementptr i8, ptr %.20.i65.i, i64 %.7.i82.i
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(18) %.22.i66.i, ptr noundef nonnull align 16 dereferenceable(18) @str_2, i64 18, i1 false)
+  %.8.i83.i = add nsw i64 %.7.i82.i, 17
+  store i64 %.8.i83.i, ptr @grammo_out_len, align 8
+  %.2.i.i84.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i85.i = icmp slt i32 %.2.i.i84.i, 0
+  br i1 %.3.i.i85.i, label %check.i.i102.i, label %grammo_out_interactive.exit.i86.i
+
+check.i.i102.i:                                   ; preds = %grammo_out_reserve.exit81.i
+  %.5.i.i103.i = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i103.i, ptr @grammo_out_tty, align 4
+  %.4.i105.pre.pre.i = load i64, ptr @grammo_out_len, align 8
+  %.20.pre1.i110.pre253.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_interactive.exit.i86.i
+
+grammo_out_interactive.exit.i86.i:                ; preds = %check.i.i102.i, %grammo_out_reserve.exit81.i
+  %.20.pre1.i110.pre253.i = phi ptr [ %.20.pre1.i110.pre253.pre.i, %check.i.i102.i ], [ %.20.i65.i, %grammo_out_reserve.exit81.i ]
+  %.4.i105.pre.i = phi i64 [ %.4.i105.pre.pre.i, %check.i.i102.i ], [ %.8.i83.i, %grammo_out_reserve.exit81.i ]
+  %.8.i.i87.i = phi i32 [ %.5.i.i103.i, %check.i.i102.i ], [ %.2.i.i84.i, %grammo_out_reserve.exit81.i ]
+  %.9.i.i88.i = icmp sgt i32 %.8.i.i87.i, 0
+  br i1 %.9.i.i88.i, label %loop.i.i92.i, label %grammo_out_advance.exit104.i
+
+loop.i.i92.i:                                     ; preds = %grammo_out_interactive.exit.i86.i, %body.i.i96.i
+  %written.i.i93.i = phi i64 [ %.10.i.i100.i, %body.i.i96.i ], [ 0, %grammo_out_interactive.exit.i86.i ]
+  %.5.i3.i94.i = icmp slt i64 %written.i.i93.i, %.4.i105.pre.i
+  br i1 %.5.i3.i94.i, label %body.i.i96.i, label %grammo_out_flush.exit.i95.i
+
+body.i.i96.i:                                     ; preds = %loop.i.i92.i
+  %.7.i.i97.i = getelementptr i8, ptr %.20.pre1.i110.pre253.i, i64 %written.i.i93.i
+  %.8.i4.i98.i = sub i64 %.4.i105.pre.i, %written.i.i93.i
+  %.9.i5.i99.i = tail call i64 @write(i32 1, ptr %.7.i.i97.i, i64 %.8.i4.i98.i)
+  %.10.i.i100.i = add i64 %.9.i5.i99.i, %written.i.i93.i
+  %.11.i.i101.i = icmp sgt i64 %.9.i5.i99.i, 0
+  br i1 %.11.i.i101.i, label %loop.i.i92.i, label %grammo_out_flush.exit.i95.i
+
+grammo_out_flush.exit.i95.i:                      ; preds = %body.i.i96.i, %loop.i.i92.i
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i110.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit104.i
+
+grammo_out_advance.exit104.i:                     ; preds = %grammo_out_flush.exit.i95.i, %grammo_out_interactive.exit.i86.i
+  %.20.pre1.i110.i = phi ptr [ %.20.pre1.i110.pre253.i, %grammo_out_interactive.exit.i86.i ], [ %.20.pre1.i110.pre.i, %grammo_out_flush.exit.i95.i ]
+  %.4.i105.i = phi i64 [ %.4.i105.pre.i, %grammo_out_interactive.exit.i86.i ], [ 0, %grammo_out_flush.exit.i95.i ]
+  %.5.i106.i = add i64 %.4.i105.i, 14
+  %.6.b.i107.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i108.i = select i1 %.6.b.i107.i, i64 65536, i64 0
+  %.7.not.i109.i = icmp ugt i64 %.5.i106.i, %.6.i108.i
+  br i1 %.7.not.i109.i, label %loop.i.i114.i, label %grammo_out_reserve.exit128.i
+
+loop.i.i114.i:                                    ; preds = %grammo_out_advance.exit104.i, %body.i.i122.i
+  %written.i.i115.i = phi i64 [ %.10.i.i126.i, %body.i.i122.i ], [ 0, %grammo_out_advance.exit104.i ]
+  %.5.i.i116.i = icmp slt i64 %written.i.i115.i, %.4.i105.i
+  br i1 %.5.i.i116.i, label %body.i.i122.i, label %grammo_out_flush.exit.i117.i
+
+body.i.i122.i:                                    ; preds = %loop.i.i114.i
+  %.7.i.i123.i = getelementptr i8, ptr %.20.pre1.i110.i, i64 %written.i.i115.i
+  %.8.i.i124.i = sub i64 %.4.i105.i, %written.i.i115.i
+  %.9.i.i125.i = tail call i64 @write(i32 1, ptr %.7.i.i123.i, i64 %.8.i.i124.i)
+  %.10.i.i126.i = add i64 %.9.i.i125.i, %written.i.i115.i
+  %.11.i.i127.i = icmp sgt i64 %.9.i.i125.i, 0
+  br i1 %.11.i.i127.i, label %loop.i.i114.i, label %grammo_out_flush.exit.i117.i
+
+grammo_out_flush.exit.i117.i:                     ; preds = %body.i.i122.i, %loop.i.i114.i
+  %.10.b.i118.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i119.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i118.i, label %grammo_out_reserve.exit128.i, label %grow.i120.i
+
+grow.i120.i:                                      ; preds = %grammo_out_flush.exit.i117.i
+  %.16.i121.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i119.i, i64 65536)
+  store ptr %.16.i121.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit128.i
+
+grammo_out_reserve.exit128.i:                     ; preds = %grow.i120.i, %grammo_out_flush.exit.i117.i, %grammo_out_advance.exit104.i
+  %.7.i129.i = phi i64 [ 0, %grow.i120.i ], [ 0, %grammo_out_flush.exit.i117.i ], [ %.4.i105.i, %grammo_out_advance.exit104.i ]
+  %.20.i112.i = phi ptr [ %.16.i121.i, %grow.i120.i ], [ %.20.pre.i119.i, %grammo_out_flush.exit.i117.i ], [ %.20.pre1.i110.i, %grammo_out_advance.exit104.i ]
+  %.22.i113.i = getelementptr i8, ptr %.20.i112.i, i64 %.7.i129.i
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(14) %.22.i113.i, ptr noundef nonnull align 1 dereferenceable(14) @str_3, i64 14, i1 false)
+  %.8.i130.i = add nsw i64 %.7.i129.i, 13
+  store i64 %.8.i130.i, ptr @grammo_out_len, align 8
+  %.2.i.i131.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i132.i = icmp slt i32 %.2.i.i131.i, 0
+  br i1 %.3.i.i132.i, label %check.i.i149.i, label %grammo_out_interactive.exit.i133.i
+
+check.i.i149.i:                                   ; preds = %grammo_out_reserve.exit128.i
+  %.5.i.i150.i = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i150.i, ptr @grammo_out_tty, align 4
+  %.4.i152.pre.pre.i = load i64, ptr @grammo_out_len, align 8
+  %.20.pre1.i157.pre256.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_interactive.exit.i133.i
+
+grammo_out_interactive.exit.i133.i:               ; preds = %check.i.i149.i, %grammo_out_reserve.exit128.i
+  %.20.pre1.i157.pre256.i = phi ptr [ %.20.pre1.i157.pre256.pre.i, %check.i.i149.i ], [ %.20.i112.i, %grammo_out_reserve.exit128.i ]
+  %.4.i152.pre.i = phi i64 [ %.4.i152.pre.pre.i, %check.i.i149.i ], [ %.8.i130.i, %grammo_out_reserve.exit128.i ]
+  %.8.i.i134.i = phi i32 [ %.5.i.i150.i, %check.i.i149.i ], [ %.2.i.i131.i, %grammo_out_reserve.exit128.i ]
+  %.9.i.i135.i = icmp sgt i32 %.8.i.i134.i, 0
+  br i1 %.9.i.i135.i, label %loop.i.i139.i, label %grammo_out_advance.exit151.i
+
+loop.i.i139.i:                                    ; preds = %grammo_out_interactive.exit.i133.i, %body.i.i143.i
+  %written.i.i140.i = phi i64 [ %.10.i.i147.i, %body.i.i143.i ], [ 0, %grammo_out_interactive.exit.i133.i ]
+  %.5.i3.i141.i = icmp slt i64 %written.i.i140.i, %.4.i152.pre.i
+  br i1 %.5.i3.i141.i, label %body.i.i143.i, label %grammo_out_flush.exit.i142.i
+
+body.i.i143.i:                                    ; preds = %loop.i.i139.i
+  %.7.i.i144.i = getelementptr i8, ptr %.20.pre1.i157.pre256.i, i64 %written.i.i140.i
+  %.8.i4.i145.i = sub i64 %.4.i152.pre.i, %written.i.i140.i
+  %.9.i5.i146.i = tail call i64 @write(i32 1, ptr %.7.i.i144.i, i64 %.8.i4.i145.i)
+  %.10.i.i147.i = add i64 %.9.i5.i146.i, %written.i.i140.i
+  %.11.i.i148.i = icmp sgt i64 %.9.i5.i146.i, 0
+  br i1 %.11.i.i148.i, label %loop.i.i139.i, label %grammo_out_flush.exit.i142.i
+
+grammo_out_flush.exit.i142.i:                     ; preds = %body.i.i143.i, %loop.i.i139.i
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i157.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit151.i
+
+grammo_out_advance.exit151.i:                     ; preds = %grammo_out_flush.exit.i142.i, %grammo_out_interactive.exit.i133.i
+  %.20.pre1.i157.i = phi ptr [ %.20.pre1.i157.pre256.i, %grammo_out_interactive.exit.i133.i ], [ %.20.pre1.i157.pre.i, %grammo_out_flush.exit.i142.i ]
+  %.4.i152.i = phi i64 [ %.4.i152.pre.i, %grammo_out_interactive.exit.i133.i ], [ 0, %grammo_out_flush.exit.i142.i ]
+  %.5.i153.i = add i64 %.4.i152.i, 13
+  %.6.b.i154.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i155.i = select i1 %.6.b.i154.i, i64 65536, i64 0
+  %.7.not.i156.i = icmp ugt i64 %.5.i153.i, %.6.i155.i
+  br i1 %.7.not.i156.i, label %loop.i.i161.i, label %grammo_out_reserve.exit175.i
+
+loop.i.i161.i:                                    ; preds = %grammo_out_advance.exit151.i, %body.i.i169.i
+  %written.i.i162.i = phi i64 [ %.10.i.i173.i, %body.i.i169.i ], [ 0, %grammo_out_advance.exit151.i ]
+  %.5.i.i163.i = icmp slt i64 %written.i.i162.i, %.4.i152.i
+  br i1 %.5.i.i163.i, label %body.i.i169.i, label %grammo_out_flush.exit.i164.i
+
+body.i.i169.i:                                    ; preds = %loop.i.i161.i
+  %.7.i.i170.i = getelementptr i8, ptr %.20.pre1.i157.i, i64 %written.i.i162.i
+  %.8.i.i171.i = sub i64 %.4.i152.i, %written.i.i162.i
+  %.9.i.i172.i = tail call i64 @write(i32 1, ptr %.7.i.i170.i, i64 %.8.i.i171.i)
+  %.10.i.i173.i = add i64 %.9.i.i172.i, %written.i.i162.i
+  %.11.i.i174.i = icmp sgt i64 %.9.i.i172.i, 0
+  br i1 %.11.i.i174.i, label %loop.i.i161.i, label %grammo_out_flush.exit.i164.i
+
+grammo_out_flush.exit.i164.i:                     ; preds = %body.i.i169.i, %loop.i.i161.i
+  %.10.b.i165.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i166.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i165.i, label %grammo_out_reserve.exit175.i, label %grow.i167.i
+
+grow.i167.i:                                      ; preds = %grammo_out_flush.exit.i164.i
+  %.16.i168.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i166.i, i64 65536)
+  store ptr %.16.i168.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit175.i
+
+grammo_out_reserve.exit175.i:                     ; preds = %grow.i167.i, %grammo_out_flush.exit.i164.i, %grammo_out_advance.exit151.i
+  %.7.i176.i = phi i64 [ 0, %grow.i167.i ], [ 0, %grammo_out_flush.exit.i164.i ], [ %.4.i152.i, %grammo_out_advance.exit151.i ]
+  %.20.i159.i = phi ptr [ %.16.i168.i, %grow.i167.i ], [ %.20.pre.i166.i, %grammo_out_flush.exit.i164.i ], [ %.20.pre1.i157.i, %grammo_out_advance.exit151.i ]
+  %.22.i160.i = getelementptr i8, ptr %.20.i159.i, i64 %.7.i176.i
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(13) %.22.i160.i, ptr noundef nonnull align 1 dereferenceable(13) @str_4, i64 13, i1 false)
+  %.8.i177.i = add nsw i64 %.7.i176.i, 12
+  store i64 %.8.i177.i, ptr @grammo_out_len, align 8
+  %.2.i.i178.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i179.i = icmp slt i32 %.2.i.i178.i, 0
+  br i1 %.3.i.i179.i, label %check.i.i196.i, label %grammo_out_interactive.exit.i180.i
+
+check.i.i196.i:                                   ; preds = %grammo_out_reserve.exit175.i
+  %.5.i.i197.i = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i197.i, ptr @grammo_out_tty, align 4
+  %.4.i199.pre.pre.i = load i64, ptr @grammo_out_len, align 8
+  %.20.pre1.i204.pre259.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_interactive.exit.i180.i
+
+grammo_out_interactive.exit.i180.i:               ; preds = %check.i.i196.i, %grammo_out_reserve.exit175.i
+  %.20.pre1.i204.pre259.i = phi ptr [ %.20.pre1.i204.pre259.pre.i, %check.i.i196.i ], [ %.20.i159.i, %grammo_out_reserve.exit175.i ]
+  %.4.i199.pre.i = phi i64 [ %.4.i199.pre.pre.i, %check.i.i196.i ], [ %.8.i177.i, %grammo_out_reserve.exit175.i ]
+  %.8.i.i181.i = phi i32 [ %.5.i.i197.i, %check.i.i196.i ], [ %.2.i.i178.i, %grammo_out_reserve.exit175.i ]
+  %.9.i.i182.i = icmp sgt i32 %.8.i.i181.i, 0
+  br i1 %.9.i.i182.i, label %loop.i.i186.i, label %grammo_out_advance.exit198.i
+
+loop.i.i186.i:                                    ; preds = %grammo_out_interactive.exit.i180.i, %body.i.i190.i
+  %written.i.i187.i = phi i64 [ %.10.i.i194.i, %body.i.i190.i ], [ 0, %grammo_out_interactive.exit.i180.i ]
+  %.5.i3.i188.i = icmp slt i64 %written.i.i187.i, %.4.i199.pre.i
+  br i1 %.5.i3.i188.i, label %body.i.i190.i, label %grammo_out_flush.exit.i189.i
+
+body.i.i190.i:                                    ; preds = %loop.i.i186.i
+  %.7.i.i191.i = getelementptr i8, ptr %.20.pre1.i204.pre259.i, i64 %written.i.i187.i
+  %.8.i4.i192.i = sub i64 %.4.i199.pre.i, %written.i.i187.i
+  %.9.i5.i193.i = tail call i64 @write(i32 1, ptr %.7.i.i191.i, i64 %.8.i4.i192.i)
+  %.10.i.i194.i = add i64 %.9.i5.i193.i, %written.i.i187.i
+  %.11.i.i195.i = icmp sgt i64 %.9.i5.i193.i, 0
+  br i1 %.11.i.i195.i, label %loop.i.i186.i, label %grammo_out_flush.exit.i189.i
+
+grammo_out_flush.exit.i189.i:                     ; preds = %body.i.i190.i, %loop.i.i186.i
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i204.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit198.i
+
+grammo_out_advance.exit198.i:                     ; preds = %grammo_out_flush.exit.i189.i, %grammo_out_interactive.exit.i180.i
+  %.20.pre1.i204.i = phi ptr [ %.20.pre1.i204.pre259.i, %grammo_out_interactive.exit.i180.i ], [ %.20.pre1.i204.pre.i, %grammo_out_flush.exit.i189.i ]
+  %.4.i199.i = phi i64 [ %.4.i199.pre.i, %grammo_out_interactive.exit.i180.i ], [ 0, %grammo_out_flush.exit.i189.i ]
+  %.5.i200.i = add i64 %.4.i199.i, 10
+  %.6.b.i201.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i202.i = select i1 %.6.b.i201.i, i64 65536, i64 0
+  %.7.not.i203.i = icmp ugt i64 %.5.i200.i, %.6.i202.i
+  br i1 %.7.not.i203.i, label %loop.i.i208.i, label %grammo_out_reserve.exit222.i
+
+loop.i.i208.i:                                    ; preds = %grammo_out_advance.exit198.i, %body.i.i216.i
+  %written.i.i209.i = phi i64 [ %.10.i.i220.i, %body.i.i216.i ], [ 0, %grammo_out_advance.exit198.i ]
+  %.5.i.i210.i = icmp slt i64 %written.i.i209.i, %.4.i199.i
+  br i1 %.5.i.i210.i, label %body.i.i216.i, label %grammo_out_flush.exit.i211.i
+
+body.i.i216.i:                                    ; preds = %loop.i.i208.i
+  %.7.i.i217.i = getelementptr i8, ptr %.20.pre1.i204.i, i64 %written.i.i209.i
+  %.8.i.i218.i = sub i64 %.4.i199.i, %written.i.i209.i
+  %.9.i.i219.i = tail call i64 @write(i32 1, ptr %.7.i.i217.i, i64 %.8.i.i218.i)
+  %.10.i.i220.i = add i64 %.9.i.i219.i, %written.i.i209.i
+  %.11.i.i221.i = icmp sgt i64 %.9.i.i219.i, 0
+  br i1 %.11.i.i221.i, label %loop.i.i208.i, label %grammo_out_flush.exit.i211.i
+
+grammo_out_flush.exit.i211.i:                     ; preds = %body.i.i216.i, %loop.i.i208.i
+  %.10.b.i212.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i213.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i212.i, label %grammo_out_reserve.exit222.i, label %grow.i214.i
+
+grow.i214.i:                                      ; preds = %grammo_out_flush.exit.i211.i
+  %.16.i215.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i213.i, i64 65536)
+  store ptr %.16.i215.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit222.i
+
+grammo_out_reserve.exit222.i:                     ; preds = %grow.i214.i, %grammo_out_flush.exit.i211.i, %grammo_out_advance.exit198.i
+  %.7.i223.i = phi i64 [ 0, %grow.i214.i ], [ 0, %grammo_out_flush.exit.i211.i ], [ %.4.i199.i, %grammo_out_advance.exit198.i ]
+  %.20.i206.i = phi ptr [ %.16.i215.i, %grow.i214.i ], [ %.20.pre.i213.i, %grammo_out_flush.exit.i211.i ], [ %.20.pre1.i204.i, %grammo_out_advance.exit198.i ]
+  %.22.i207.i = getelementptr i8, ptr %.20.i206.i, i64 %.7.i223.i
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(10) %.22.i207.i, ptr noundef nonnull align 1 dereferenceable(10) @str_5, i64 10, i1 false)
+  %.8.i224.i = add nsw i64 %.7.i223.i, 9
+  store i64 %.8.i224.i, ptr @grammo_out_len, align 8
+  %.2.i.i225.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i226.i = icmp slt i32 %.2.i.i225.i, 0
+  br i1 %.3.i.i226.i, label %check.i.i243.i, label %grammo_out_interactive.exit.i227.i
+
+check.i.i243.i:                                   ; preds = %grammo_out_reserve.exit222.i
+  %.5.i.i244.i = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i244.i, ptr @grammo_out_tty, align 4
+  %.4.i.pre.pre = load i64, ptr @grammo_out_len, align 8
+  %.20.pre1.i.pre480.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_interactive.exit.i227.i
+
+grammo_out_interactive.exit.i227.i:               ; preds = %check.i.i243.i, %grammo_out_reserve.exit222.i
+  %.20.pre1.i.pre480 = phi ptr [ %.20.pre1.i.pre480.pre, %check.i.i243.i ], [ %.20.i206.i, %grammo_out_reserve.exit222.i ]
+  %.4.i.pre = phi i64 [ %.4.i.pre.pre, %check.i.i243.i ], [ %.8.i224.i, %grammo_out_reserve.exit222.i ]
+  %.8.i.i228.i = phi i32 [ %.5.i.i244.i, %check.i.i243.i ], [ %.2.i.i225.i, %grammo_out_reserve.exit222.i ]
+  %.9.i.i229.i = icmp sgt i32 %.8.i.i228.i, 0
+  br i1 %.9.i.i229.i, label %loop.i.i233.i, label %g.show_menu.exit
+
+loop.i.i233.i:                                    ; preds = %grammo_out_interactive.exit.i227.i, %body.i.i237.i
+  %written.i.i234.i = phi i64 [ %.10.i.i241.i, %body.i.i237.i ], [ 0, %grammo_out_interactive.exit.i227.i ]
+  %.5.i3.i235.i = icmp slt i64 %written.i.i234.i, %.4.i.pre
+  br i1 %.5.i3.i235.i, label %body.i.i237.i, label %grammo_out_flush.exit.i236.i
+
+body.i.i237.i:                                    ; preds = %loop.i.i233.i
+  %.7.i.i238.i = getelementptr i8, ptr %.20.pre1.i.pre480, i64 %written.i.i234.i
+  %.8.i4.i239.i = sub i64 %.4.i.pre, %written.i.i234.i
+  %.9.i5.i240.i = tail call i64 @write(i32 1, ptr %.7.i.i238.i, i64 %.8.i4.i239.i)
+  %.10.i.i241.i = add i64 %.9.i5.i240.i, %written.i.i234.i
+  %.11.i.i242.i = icmp sgt i64 %.9.i5.i240.i, 0
+  br i1 %.11.i.i242.i, label %loop.i.i233.i, label %grammo_out_flush.exit.i236.i
+
+grammo_out_flush.exit.i236.i:                     ; preds = %body.i.i237.i, %loop.i.i233.i
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %g.show_menu.exit
+
+g.show_menu.exit:                                 ; preds = %grammo_out_interactive.exit.i227.i, %grammo_out_flush.exit.i236.i
+  %.20.pre1.i = phi ptr [ %.20.pre1.i.pre480, %grammo_out_interactive.exit.i227.i ], [ %.20.pre1.i.pre, %grammo_out_flush.exit.i236.i ]
+  %.4.i = phi i64 [ %.4.i.pre, %grammo_out_interactive.exit.i227.i ], [ 0, %grammo_out_flush.exit.i236.i ]
+  %.5.i = add i64 %.4.i, 9
+  %.6.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i = select i1 %.6.b.i, i64 65536, i64 0
+  %.7.not.i = icmp ugt i64 %.5.i, %.6.i
+  br i1 %.7.not.i, label %loop.i.i, label %grammo_out_reserve.exit
+
+loop.i.i:                                         ; preds = %g.show_menu.exit, %body.i.i
+  %written.i.i = phi i64 [ %.10.i.i, %body.i.i ], [ 0, %g.show_menu.exit ]
+  %.5.i.i1 = icmp slt i64 %written.i.i, %.4.i
+  br i1 %.5.i.i1, label %body.i.i, label %grammo_out_flush.exit.i
+
+body.i.i:                                         ; preds = %loop.i.i
+  %.7.i.i2 = getelementptr i8, ptr %.20.pre1.i, i64 %written.i.i
+  %.8.i.i3 = sub i64 %.4.i, %written.i.i
+  %.9.i.i = tail call i64 @write(i32 1, ptr %.7.i.i2, i64 %.8.i.i3)
+  %.10.i.i = add i64 %.9.i.i, %written.i.i
+  %.11.i.i = icmp sgt i64 %.9.i.i, 0
+  br i1 %.11.i.i, label %loop.i.i, label %grammo_out_flush.exit.i
+
+grammo_out_flush.exit.i:                          ; preds = %body.i.i, %loop.i.i
+  %.10.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i, label %grammo_out_reserve.exit, label %grow.i
+
+grow.i:                                           ; preds = %grammo_out_flush.exit.i
+  %.16.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i, i64 65536)
+  store ptr %.16.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit
+
+grammo_out_reserve.exit:                          ; preds = %g.show_menu.exit, %grammo_out_flush.exit.i, %grow.i
+  %.7.i = phi i64 [ 0, %grow.i ], [ 0, %grammo_out_flush.exit.i ], [ %.4.i, %g.show_menu.exit ]
+  %.20.i = phi ptr [ %.16.i, %grow.i ], [ %.20.pre.i, %grammo_out_flush.exit.i ], [ %.20.pre1.i, %g.show_menu.exit ]
+  %.22.i = getelementptr i8, ptr %.20.i, i64 %.7.i
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(9) %.22.i, ptr noundef nonnull align 1 dereferenceable(9) @str_8, i64 9, i1 false)
+  %.8.i = add nsw i64 %.7.i, 8
+  store i64 %.8.i, ptr @grammo_out_len, align 8
+  %.2.i.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i = icmp slt i32 %.2.i.i, 0
+  br i1 %.3.i.i, label %check.i.i, label %grammo_out_interactive.exit.i
+
+check.i.i:                                        ; preds = %grammo_out_reserve.exit
+  %.5.i.i13 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i13, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i
+
+grammo_out_interactive.exit.i:                    ; preds = %check.i.i, %grammo_out_reserve.exit
+  %.8.i.i4 = phi i32 [ %.5.i.i13, %check.i.i ], [ %.2.i.i, %grammo_out_reserve.exit ]
+  %.9.i.i5 = icmp sgt i32 %.8.i.i4, 0
+  br i1 %.9.i.i5, label %flush.i, label %grammo_out_sync.exit
+
+flush.i:                                          ; preds = %grammo_out_interactive.exit.i
+  %.2.i1.i = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i6
+
+loop.i.i6:                                        ; preds = %body.i.i9, %flush.i
+  %written.i.i7 = phi i64 [ 0, %flush.i ], [ %.10.i.i11, %body.i.i9 ]
+  %.5.i3.i = icmp slt i64 %written.i.i7, %.3.i2.i
+  br i1 %.5.i3.i, label %body.i.i9, label %grammo_out_flush.exit.i8
+
+body.i.i9:                                        ; preds = %loop.i.i6
+  %.7.i.i10 = getelementptr i8, ptr %.2.i1.i, i64 %written.i.i7
+  %.8.i4.i = sub i64 %.3.i2.i, %written.i.i7
+  %.9.i5.i = tail call i64 @write(i32 1, ptr %.7.i.i10, i64 %.8.i4.i)
+  %.10.i.i11 = add i64 %.9.i5.i, %written.i.i7
+  %.11.i.i12 = icmp sgt i64 %.9.i5.i, 0
+  br i1 %.11.i.i12, label %loop.i.i6, label %grammo_out_flush.exit.i8
+
+grammo_out_flush.exit.i8:                         ; preds = %body.i.i9, %loop.i.i6
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit
+
+grammo_out_sync.exit:                             ; preds = %grammo_out_interactive.exit.i, %grammo_out_flush.exit.i8
+  %.3.i = tail call fastcc i64 @grammo_in_token()
+  %.4.i14 = load ptr, ptr @grammo_in_buf, align 8
+  %.5.i15 = load i64, ptr @grammo_in_pos, align 8
+  %.6.i16 = getelementptr i8, ptr %.4.i14, i64 %.5.i15
+  %.7.i17 = load i8, ptr %.6.i16, align 1
+  %.8.i18 = icmp eq i8 %.7.i17, 45
+  %.9.i = icmp eq i8 %.7.i17, 43
+  %.10.i = or i1 %.8.i18, %.9.i
+  %.11.i = zext i1 %.10.i to i64
+  %.131.i = icmp ugt i64 %.3.i, %.11.i
+  %.142.i = getelementptr i8, ptr %.6.i16, i64 %.11.i
+  %.153.i = load i8, ptr %.142.i, align 1
+  %.164.i = add i8 %.153.i, -48
+  %.175.i = icmp ult i8 %.164.i, 10
+  %.186.i = and i1 %.175.i, %.131.i
+  br i1 %.186.i, label %digit.i, label %grammo_in_read_int.exit
+
+digit.i:                                          ; preds = %grammo_out_sync.exit, %digit.i
+  %.169.i = phi i8 [ %.16.i22, %digit.i ], [ %.164.i, %grammo_out_sync.exit ]
+  %value8.i = phi i32 [ %.23.i, %digit.i ], [ 0, %grammo_out_sync.exit ]
+  %i7.i = phi i64 [ %.20.i19, %digit.i ], [ %.11.i, %grammo_out_sync.exit ]
+  %.20.i19 = add nuw i64 %i7.i, 1
+  %.21.i20 = mul i32 %value8.i, 10
+  %.22.i21 = zext nneg i8 %.169.i to i32
+  %.23.i = add i32 %.21.i20, %.22.i21
+  %.13.i = icmp ult i64 %.20.i19, %.3.i
+  %.14.i = getelementptr i8, ptr %.6.i16, i64 %.20.i19
+  %.15.i = load i8, ptr %.14.i, align 1
+  %.16.i22 = add i8 %.15.i, -48
+  %.17.i = icmp ult i8 %.16.i22, 10
+  %.18.i = and i1 %.13.i, %.17.i
+  br i1 %.18.i, label %digit.i, label %end_digits.i
+
+end_digits.i:                                     ; preds = %digit.i
+  %.25.not.i = icmp ult i64 %i7.i, %.11.i
+  br i1 %.25.not.i, label %grammo_in_read_int.exit, label %store.i
+
+store.i:                                          ; preds = %end_digits.i
+  %.27.i = sub i32 0, %.23.i
+  %.31.i = add i64 %.20.i19, %.5.i15
+  store i64 %.31.i, ptr @grammo_in_pos, align 8
+  %spec.select = select i1 %.8.i18, i32 %.27.i, i32 %.23.i
+  br label %grammo_in_read_int.exit
+
+grammo_in_read_int.exit:                          ; preds = %store.i, %grammo_out_sync.exit, %end_digits.i
+  %m_choice.1 = phi i32 [ %m_choice.0477, %end_digits.i ], [ %m_choice.0477, %grammo_out_sync.exit ], [ %spec.select, %store.i ]
+  %.4.i429 = load i64, ptr @grammo_out_len, align 8
+  %.6.b.i431 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i432 = select i1 %.6.b.i431, i64 65536, i64 0
+  %.20.pre1.i434 = load ptr, ptr @grammo_out_buf, align 8
+  switch i32 %m_choice.1, label %elif_2_next [
     i32 1, label %if_then
     i32 2, label %elif_0_then
     i32 3, label %elif_1_then
     i32 0, label %while_end
   ]
 
-while_end:                                        ; preds = %while_body
-  %.77 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_18)
-  %putchar = call i32 @putchar(i32 10)
+while_end:                                        ; preds = %grammo_in_read_int.exit
+  %.5.i24 = add i64 %.4.i429, 14
+  %.7.not.i27 = icmp ugt i64 %.5.i24, %.6.i432
+  br i1 %.7.not.i27, label %loop.i.i32, label %grammo_out_reserve.exit46
+
+loop.i.i32:                                       ; preds = %while_end, %body.i.i40
+  %written.i.i33 = phi i64 [ %.10.i.i44, %body.i.i40 ], [ 0, %while_end ]
+  %.5.i.i34 = icmp slt i64 %written.i.i33, %.4.i429
+  br i1 %.5.i.i34, label %body.i.i40, label %grammo_out_flush.exit.i35
+
+body.i.i40:                                       ; preds = %loop.i.i32
+  %.7.i.i41 = getelementptr i8, ptr %.20.pre1.i434, i64 %written.i.i33
+  %.8.i.i42 = sub i64 %.4.i429, %written.i.i33
+  %.9.i.i43 = tail call i64 @write(i32 1, ptr %.7.i.i41, i64 %.8.i.i42)
+  %.10.i.i44 = add i64 %.9.i.i43, %written.i.i33
+  %.11.i.i45 = icmp sgt i64 %.9.i.i43, 0
+  br i1 %.11.i.i45, label %loop.i.i32, label %grammo_out_flush.exit.i35
+
+grammo_out_flush.exit.i35:                        ; preds = %body.i.i40, %loop.i.i32
+  %.10.b.i36 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i37 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i36, label %grammo_out_reserve.exit46, label %grow.i38
+
+grow.i38:                                         ; preds = %grammo_out_flush.exit.i35
+  %.16.i39 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i37, i64 65536)
+  store ptr %.16.i39, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit46
+
+grammo_out_reserve.exit46:                        ; preds = %while_end, %grammo_out_flush.exit.i35, %grow.i38
+  %.7.i47 = phi i64 [ 0, %grow.i38 ], [ 0, %grammo_out_flush.exit.i35 ], [ %.4.i429, %while_end ]
+  %.20.i30 = phi ptr [ %.16.i39, %grow.i38 ], [ %.20.pre.i37, %grammo_out_flush.exit.i35 ], [ %.20.pre1.i434, %while_end ]
+  %.22.i31 = getelementptr i8, ptr %.20.i30, i64 %.7.i47
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(14) %.22.i31, ptr noundef nonnull align 1 dereferenceable(14) @str_14, i64 14, i1 false)
+  %.8.i48 = add nsw i64 %.7.i47, 13
+  store i64 %.8.i48, ptr @grammo_out_len, align 8
+  %.2.i.i49 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i50 = icmp slt i32 %.2.i.i49, 0
+  br i1 %.3.i.i50, label %check.i.i67, label %grammo_out_interactive.exit.i51
+
+check.i.i67:                                      ; preds = %grammo_out_reserve.exit46
+  %.5.i.i68 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i68, ptr @grammo_out_tty, align 4
+  %.2.i.pre485.pre = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i69.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i51
+
+grammo_out_interactive.exit.i51:                  ; preds = %check.i.i67, %grammo_out_reserve.exit46
+  %.3.i69.pre = phi i64 [ %.3.i69.pre.pre, %check.i.i67 ], [ %.8.i48, %grammo_out_reserve.exit46 ]
+  %.2.i.pre485 = phi ptr [ %.2.i.pre485.pre, %check.i.i67 ], [ %.20.i30, %grammo_out_reserve.exit46 ]
+  %.8.i.i52 = phi i32 [ %.5.i.i68, %check.i.i67 ], [ %.2.i.i49, %grammo_out_reserve.exit46 ]
+  %.9.i.i53 = icmp sgt i32 %.8.i.i52, 0
+  br i1 %.9.i.i53, label %loop.i.i57, label %grammo_out_advance.exit
+
+loop.i.i57:                                       ; preds = %grammo_out_interactive.exit.i51, %body.i.i61
+  %written.i.i58 = phi i64 [ %.10.i.i65, %body.i.i61 ], [ 0, %grammo_out_interactive.exit.i51 ]
+  %.5.i3.i59 = icmp slt i64 %written.i.i58, %.3.i69.pre
+  br i1 %.5.i3.i59, label %body.i.i61, label %grammo_out_flush.exit.i60
+
+body.i.i61:                                       ; preds = %loop.i.i57
+  %.7.i.i62 = getelementptr i8, ptr %.2.i.pre485, i64 %written.i.i58
+  %.8.i4.i63 = sub i64 %.3.i69.pre, %written.i.i58
+  %.9.i5.i64 = tail call i64 @write(i32 1, ptr %.7.i.i62, i64 %.8.i4.i63)
+  %.10.i.i65 = add i64 %.9.i5.i64, %written.i.i58
+  %.11.i.i66 = icmp sgt i64 %.9.i5.i64, 0
+  br i1 %.11.i.i66, label %loop.i.i57, label %grammo_out_flush.exit.i60
+
+grammo_out_flush.exit.i60:                        ; preds = %body.i.i61, %loop.i.i57
+  store i64 0, ptr @grammo_out_len, align 8
+  %.2.i.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit
+
+grammo_out_advance.exit:                          ; preds = %grammo_out_interactive.exit.i51, %grammo_out_flush.exit.i60
+  %.3.i69 = phi i64 [ %.3.i69.pre, %grammo_out_interactive.exit.i51 ], [ 0, %grammo_out_flush.exit.i60 ]
+  %.2.i = phi ptr [ %.2.i.pre485, %grammo_out_interactive.exit.i51 ], [ %.2.i.pre, %grammo_out_flush.exit.i60 ]
+  br label %loop.i
+
+loop.i:                                           ; preds = %body.i, %grammo_out_advance.exit
+  %written.i = phi i64 [ 0, %grammo_out_advance.exit ], [ %.10.i74, %body.i ]
+  %.5.i70 = icmp slt i64 %written.i, %.3.i69
+  br i1 %.5.i70, label %body.i, label %grammo_out_flush.exit
+
+body.i:                                           ; preds = %loop.i
+  %.7.i71 = getelementptr i8, ptr %.2.i, i64 %written.i
+  %.8.i72 = sub i64 %.3.i69, %written.i
+  %.9.i73 = tail call i64 @write(i32 1, ptr %.7.i71, i64 %.8.i72)
+  %.10.i74 = add i64 %.9.i73, %written.i
+  %.11.i75 = icmp sgt i64 %.9.i73, 0
+  br i1 %.11.i75, label %loop.i, label %grammo_out_flush.exit
+
+grammo_out_flush.exit:                            ; preds = %loop.i, %body.i
+  store i64 0, ptr @grammo_out_len, align 8
   ret void
 
-if_then:                                          ; preds = %while_body
-  %.19 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_11)
-  %.21 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_12, double %m_balance.06)
-  br label %if_merge
-
-elif_0_then:                                      ; preds = %while_body
-  %.29 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_13)
-  %.31 = call i32 (ptr, ...) @scanf(ptr nonnull @str_14, ptr nonnull %m_amount)
-  %load_m_amount = load double, ptr %m_amount, align 8
-  %.6.i = fadd double %m_balance.06, %load_m_amount
-  %.36 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_15)
-  %.38 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_12, double %.6.i)
-  br label %if_merge
-
-elif_1_then:                                      ; preds = %while_body
-  %.46 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_16)
-  %.48 = call i32 (ptr, ...) @scanf(ptr nonnull @str_14, ptr nonnull %m_amount)
-  %load_m_amount.1 = load double, ptr %m_amount, align 8
-  %.6.i5 = fcmp ugt double %load_m_amount.1, 0.000000e+00
-  br i1 %.6.i5, label %next_branch.i, label %if_then.i
-
-if_then.i:                                        ; preds = %elif_1_then
-  %.9.i = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_7)
-  %putchar1.i = call i32 @putchar(i32 10)
-  br label %withdraw.exit
-
-next_branch.i:                                    ; preds = %elif_1_then
-  %.14.i = fcmp ogt double %load_m_amount.1, %m_balance.06
-  br i1 %.14.i, label %elif_0_then.i, label %elif_0_next.i
+if_then:                                          ; preds = %grammo_in_read_int.exit
+  %.5.i77 = add i64 %.4.i429, 328
+  %.7.not.i80 = icmp ugt i64 %.5.i77, %.6.i432
+  br i1 %.7.not.i80, label %loop.i.i85, label %grammo_out_reserve.exit99
+
+loop.i.i85:                                       ; preds = %if_then, %body.i.i93
+  %written.i.i86 = phi i64 [ %.10.i.i97, %body.i.i93 ], [ 0, %if_then ]
+  %.5.i.i87 = icmp slt i64 %written.i.i86, %.4.i429
+  br i1 %.5.i.i87, label %body.i.i93, label %grammo_out_flush.exit.i88
+
+body.i.i93:                                       ; preds = %loop.i.i85
+  %.7.i.i94 = getelementptr i8, ptr %.20.pre1.i434, i64 %written.i.i86
+  %.8.i.i95 = sub i64 %.4.i429, %written.i.i86
+  %.9.i.i96 = tail call i64 @write(i32 1, ptr %.7.i.i94, i64 %.8.i.i95)
+  %.10.i.i97 = add i64 %.9.i.i96, %written.i.i86
+  %.11.i.i98 = icmp sgt i64 %.9.i.i96, 0
+  br i1 %.11.i.i98, label %loop.i.i85, label %grammo_out_flush.exit.i88
+
+grammo_out_flush.exit.i88:                        ; preds = %body.i.i93, %loop.i.i85
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i89 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i90 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i89, label %grammo_out_reserve.exit99, label %grow.i91
+
+grow.i91:                                         ; preds = %grammo_out_flush.exit.i88
+  %.16.i92 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i90, i64 65536)
+  store ptr %.16.i92, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit99
+
+grammo_out_reserve.exit99:                        ; preds = %if_then, %grammo_out_flush.exit.i88, %grow.i91
+  %.21.i82 = phi i64 [ 0, %grow.i91 ], [ 0, %grammo_out_flush.exit.i88 ], [ %.4.i429, %if_then ]
+  %.20.i83 = phi ptr [ %.16.i92, %grow.i91 ], [ %.20.pre.i90, %grammo_out_flush.exit.i88 ], [ %.20.pre1.i434, %if_then ]
+  %.22.i84 = getelementptr i8, ptr %.20.i83, i64 %.21.i82
+  %.22 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i84, i64 328, ptr nonnull @str_9, double %m_balance.0478.ph)
+  %0 = tail call i32 @llvm.smax.i32(i32 %.22, i32 0)
+  %.6.i100 = zext nneg i32 %0 to i64
+  %.7.i101 = load i64, ptr @grammo_out_len, align 8
+  %.8.i102 = add i64 %.7.i101, %.6.i100
+  store i64 %.8.i102, ptr @grammo_out_len, align 8
+  %.2.i.i103 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i104 = icmp slt i32 %.2.i.i103, 0
+  br i1 %.3.i.i104, label %check.i.i121, label %grammo_out_interactive.exit.i105
+
+check.i.i121:                                     ; preds = %grammo_out_reserve.exit99
+  %.5.i.i122 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i122, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i105
+
+grammo_out_interactive.exit.i105:                 ; preds = %check.i.i121, %grammo_out_reserve.exit99
+  %.8.i.i106 = phi i32 [ %.5.i.i122, %check.i.i121 ], [ %.2.i.i103, %grammo_out_reserve.exit99 ]
+  %.9.i.i107 = icmp sgt i32 %.8.i.i106, 0
+  br i1 %.9.i.i107, label %flush.i108, label %while_body.backedge
+
+flush.i108:                                       ; preds = %grammo_out_interactive.exit.i105
+  %.2.i1.i109 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i110 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i111
+
+loop.i.i111:                                      ; preds = %body.i.i115, %flush.i108
+  %written.i.i112 = phi i64 [ 0, %flush.i108 ], [ %.10.i.i119, %body.i.i115 ]
+  %.5.i3.i113 = icmp slt i64 %written.i.i112, %.3.i2.i110
+  br i1 %.5.i3.i113, label %body.i.i115, label %if_merge.sink.split
+
+body.i.i115:                                      ; preds = %loop.i.i111
+  %.7.i.i116 = getelementptr i8, ptr %.2.i1.i109, i64 %written.i.i112
+  %.8.i4.i117 = sub i64 %.3.i2.i110, %written.i.i112
+  %.9.i5.i118 = tail call i64 @write(i32 1, ptr %.7.i.i116, i64 %.8.i4.i117)
+  %.10.i.i119 = add i64 %.9.i5.i118, %written.i.i112
+  %.11.i.i120 = icmp sgt i64 %.9.i5.i118, 0
+  br i1 %.11.i.i120, label %loop.i.i111, label %if_merge.sink.split
+
+elif_0_then:                                      ; preds = %grammo_in_read_int.exit
+  %.5.i125 = add i64 %.4.i429, 19
+  %.7.not.i128 = icmp ugt i64 %.5.i125, %.6.i432
+  br i1 %.7.not.i128, label %loop.i.i133, label %grammo_out_reserve.exit147
+
+loop.i.i133:                                      ; preds = %elif_0_then, %body.i.i141
+  %written.i.i134 = phi i64 [ %.10.i.i145, %body.i.i141 ], [ 0, %elif_0_then ]
+  %.5.i.i135 = icmp slt i64 %written.i.i134, %.4.i429
+  br i1 %.5.i.i135, label %body.i.i141, label %grammo_out_flush.exit.i136
+
+body.i.i141:                                      ; preds = %loop.i.i133
+  %.7.i.i142 = getelementptr i8, ptr %.20.pre1.i434, i64 %written.i.i134
+  %.8.i.i143 = sub i64 %.4.i429, %written.i.i134
+  %.9.i.i144 = tail call i64 @write(i32 1, ptr %.7.i.i142, i64 %.8.i.i143)
+  %.10.i.i145 = add i64 %.9.i.i144, %written.i.i134
+  %.11.i.i146 = icmp sgt i64 %.9.i.i144, 0
+  br i1 %.11.i.i146, label %loop.i.i133, label %grammo_out_flush.exit.i136
+
+grammo_out_flush.exit.i136:                       ; preds = %body.i.i141, %loop.i.i133
+  %.10.b.i137 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i138 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i137, label %grammo_out_reserve.exit147, label %grow.i139
+
+grow.i139:                                        ; preds = %grammo_out_flush.exit.i136
+  %.16.i140 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i138, i64 65536)
+  store ptr %.16.i140, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit147
+
+grammo_out_reserve.exit147:                       ; preds = %elif_0_then, %grammo_out_flush.exit.i136, %grow.i139
+  %.7.i148 = phi i64 [ 0, %grow.i139 ], [ 0, %grammo_out_flush.exit.i136 ], [ %.4.i429, %elif_0_then ]
+  %.20.i131 = phi ptr [ %.16.i140, %grow.i139 ], [ %.20.pre.i138, %grammo_out_flush.exit.i136 ], [ %.20.pre1.i434, %elif_0_then ]
+  %.22.i132 = getelementptr i8, ptr %.20.i131, i64 %.7.i148
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(19) %.22.i132, ptr noundef nonnull align 16 dereferenceable(19) @str_10, i64 19, i1 false)
+  %.8.i149 = add nsw i64 %.7.i148, 18
+  store i64 %.8.i149, ptr @grammo_out_len, align 8
+  %.2.i.i150 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i151 = icmp slt i32 %.2.i.i150, 0
+  br i1 %.3.i.i151, label %check.i.i168, label %grammo_out_interactive.exit.i152
+
+check.i.i168:                                     ; preds = %grammo_out_reserve.exit147
+  %.5.i.i169 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i169, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i152
+
+grammo_out_interactive.exit.i152:                 ; preds = %check.i.i168, %grammo_out_reserve.exit147
+  %.8.i.i153 = phi i32 [ %.5.i.i169, %check.i.i168 ], [ %.2.i.i150, %grammo_out_reserve.exit147 ]
+  %.9.i.i154 = icmp sgt i32 %.8.i.i153, 0
+  br i1 %.9.i.i154, label %flush.i155, label %grammo_out_sync.exit170
+
+flush.i155:                                       ; preds = %grammo_out_interactive.exit.i152
+  %.2.i1.i156 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i157 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i158
+
+loop.i.i158:                                      ; preds = %body.i.i162, %flush.i155
+  %written.i.i159 = phi i64 [ 0, %flush.i155 ], [ %.10.i.i166, %body.i.i162 ]
+  %.5.i3.i160 = icmp slt i64 %written.i.i159, %.3.i2.i157
+  br i1 %.5.i3.i160, label %body.i.i162, label %grammo_out_flush.exit.i161
+
+body.i.i162:                                      ; preds = %loop.i.i158
+  %.7.i.i163 = getelementptr i8, ptr %.2.i1.i156, i64 %written.i.i159
+  %.8.i4.i164 = sub i64 %.3.i2.i157, %written.i.i159
+  %.9.i5.i165 = tail call i64 @write(i32 1, ptr %.7.i.i163, i64 %.8.i4.i164)
+  %.10.i.i166 = add i64 %.9.i5.i165, %written.i.i159
+  %.11.i.i167 = icmp sgt i64 %.9.i5.i165, 0
+  br i1 %.11.i.i167, label %loop.i.i158, label %grammo_out_flush.exit.i161
+
+grammo_out_flush.exit.i161:                       ; preds = %body.i.i162, %loop.i.i158
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit170
+
+grammo_out_sync.exit170:                          ; preds = %grammo_out_interactive.exit.i152, %grammo_out_flush.exit.i161
+  call void @llvm.lifetime.start.p0(i64 8, ptr nonnull %end.i)
+  %.3.i171 = tail call fastcc i64 @grammo_in_token()
+  %.4.i172 = load ptr, ptr @grammo_in_buf, align 8
+  %.5.i173 = load i64, ptr @grammo_in_pos, align 8
+  %.6.i174 = getelementptr i8, ptr %.4.i172, i64 %.5.i173
+  %.7.i175 = call double @strtod(ptr %.6.i174, ptr nonnull %end.i)
+  %.8.i176 = load ptr, ptr %end.i, align 8
+  %.9.i177 = ptrtoint ptr %.8.i176 to i64
+  %.10.i178 = ptrtoint ptr %.6.i174 to i64
+  %.11.i179 = sub i64 %.9.i177, %.10.i178
+  %.12.i = icmp sgt i64 %.11.i179, 0
+  br i1 %.12.i, label %store.i180, label %grammo_in_read_real.exit
+
+store.i180:                                       ; preds = %grammo_out_sync.exit170
+  %.15.i181 = load i64, ptr @grammo_in_pos, align 8
+  %.16.i182 = add i64 %.15.i181, %.11.i179
+  store i64 %.16.i182, ptr @grammo_in_pos, align 8
+  br label %grammo_in_read_real.exit
+
+grammo_in_read_real.exit:                         ; preds = %grammo_out_sync.exit170, %store.i180
+  %m_amount.2 = phi double [ %.7.i175, %store.i180 ], [ %m_amount.0476.ph, %grammo_out_sync.exit170 ]
+  call void @llvm.lifetime.end.p0(i64 8, ptr nonnull %end.i)
+  %.6.i183 = fadd double %m_balance.0478.ph, %m_amount.2
+  %.4.i184 = load i64, ptr @grammo_out_len, align 8
+  %.5.i185 = add i64 %.4.i184, 334
+  %.6.b.i186 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i187 = select i1 %.6.b.i186, i64 65536, i64 0
+  %.7.not.i188 = icmp ugt i64 %.5.i185, %.6.i187
+  %.20.pre1.i189 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i188, label %loop.i.i193, label %grammo_out_reserve.exit207
+
+loop.i.i193:                                      ; preds = %grammo_in_read_real.exit, %body.i.i201
+  %written.i.i194 = phi i64 [ %.10.i.i205, %body.i.i201 ], [ 0, %grammo_in_read_real.exit ]
+  %.5.i.i195 = icmp slt i64 %written.i.i194, %.4.i184
+  br i1 %.5.i.i195, label %body.i.i201, label %grammo_out_flush.exit.i196
+
+body.i.i201:                                      ; preds = %loop.i.i193
+  %.7.i.i202 = getelementptr i8, ptr %.20.pre1.i189, i64 %written.i.i194
+  %.8.i.i203 = sub i64 %.4.i184, %written.i.i194
+  %.9.i.i204 = tail call i64 @write(i32 1, ptr %.7.i.i202, i64 %.8.i.i203)
+  %.10.i.i205 = add i64 %.9.i.i204, %written.i.i194
+  %.11.i.i206 = icmp sgt i64 %.9.i.i204, 0
+  br i1 %.11.i.i206, label %loop.i.i193, label %grammo_out_flush.exit.i196
+
+grammo_out_flush.exit.i196:                       ; preds = %body.i.i201, %loop.i.i193
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i197 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i198 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i197, label %grammo_out_reserve.exit207, label %grow.i199
+
+grow.i199:                                        ; preds = %grammo_out_flush.exit.i196
+  %.16.i200 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i198, i64 65536)
+  store ptr %.16.i200, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit207
+
+grammo_out_reserve.exit207:                       ; preds = %grammo_in_read_real.exit, %grammo_out_flush.exit.i196, %grow.i199
+  %.21.i190 = phi i64 [ 0, %grow.i199 ], [ 0, %grammo_out_flush.exit.i196 ], [ %.4.i184, %grammo_in_read_real.exit ]
+  %.20.i191 = phi ptr [ %.16.i200, %grow.i199 ], [ %.20.pre.i198, %grammo_out_flush.exit.i196 ], [ %.20.pre1.i189, %grammo_in_read_real.exit ]
+  %.22.i192 = getelementptr i8, ptr %.20.i191, i64 %.21.i190
+  %.38 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i192, i64 334, ptr nonnull @str_11, double %.6.i183)
+  %1 = tail call i32 @llvm.smax.i32(i32 %.38, i32 0)
+  %.6.i208 = zext nneg i32 %1 to i64
+  %.7.i209 = load i64, ptr @grammo_out_len, align 8
+  %.8.i210 = add i64 %.7.i209, %.6.i208
+  store i64 %.8.i210, ptr @grammo_out_len, align 8
+  %.2.i.i211 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i212 = icmp slt i32 %.2.i.i211, 0
+  br i1 %.3.i.i212, label %check.i.i229, label %grammo_out_interactive.exit.i213
+
+check.i.i229:                                     ; preds = %grammo_out_reserve.exit207
+  %.5.i.i230 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i230, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i213
+
+grammo_out_interactive.exit.i213:                 ; preds = %check.i.i229, %grammo_out_reserve.exit207
+  %.8.i.i214 = phi i32 [ %.5.i.i230, %check.i.i229 ], [ %.2.i.i211, %grammo_out_reserve.exit207 ]
+  %.9.i.i215 = icmp sgt i32 %.8.i.i214, 0
+  br i1 %.9.i.i215, label %flush.i216, label %while_body.outer.backedge
+
+while_body.outer.backedge:                        ; preds = %grammo_out_interactive.exit.i213, %grammo_out_interactive.exit.i410, %if_merge.sink.split
+  %m_balance.0478.ph.be = phi double [ %m_balance.1.ph, %if_merge.sink.split ], [ %common.ret.op.i, %grammo_out_interactive.exit.i410 ], [ %.6.i183, %grammo_out_interactive.exit.i213 ]
+  %m_amount.0476.ph.be = phi double [ %m_amount.1.ph, %if_merge.sink.split ], [ %m_amount.3, %grammo_out_interactive.exit.i410 ], [ %m_amount.2, %grammo_out_interactive.exit.i213 ]
+  br label %while_body.outer
+
+flush.i216:                                       ; preds = %grammo_out_interactive.exit.i213
+  %.2.i1.i217 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i218 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i219
+
+loop.i.i219:                                      ; preds = %body.i.i223, %flush.i216
+  %written.i.i220 = phi i64 [ 0, %flush.i216 ], [ %.10.i.i227, %body.i.i223 ]
+  %.5.i3.i221 = icmp slt i64 %written.i.i220, %.3.i2.i218
+  br i1 %.5.i3.i221, label %body.i.i223, label %if_merge.sink.split
+
+body.i.i223:                                      ; preds = %loop.i.i219
+  %.7.i.i224 = getelementptr i8, ptr %.2.i1.i217, i64 %written.i.i220
+  %.8.i4.i225 = sub i64 %.3.i2.i218, %written.i.i220
+  %.9.i5.i226 = tail call i64 @write(i32 1, ptr %.7.i.i224, i64 %.8.i4.i225)
+  %.10.i.i227 = add i64 %.9.i5.i226, %written.i.i220
+  %.11.i.i228 = icmp sgt i64 %.9.i5.i226, 0
+  br i1 %.11.i.i228, label %loop.i.i219, label %if_merge.sink.split
+
+elif_1_then:                                      ; preds = %grammo_in_read_int.exit
+  %.5.i233 = add i64 %.4.i429, 19
+  %.7.not.i236 = icmp ugt i64 %.5.i233, %.6.i432
+  br i1 %.7.not.i236, label %loop.i.i241, label %grammo_out_reserve.exit255
+
+loop.i.i241:                                      ; preds = %elif_1_then, %body.i.i249
+  %written.i.i242 = phi i64 [ %.10.i.i253, %body.i.i249 ], [ 0, %elif_1_then ]
+  %.5.i.i243 = icmp slt i64 %written.i.i242, %.4.i429
+  br i1 %.5.i.i243, label %body.i.i249, label %grammo_out_flush.exit.i244
+
+body.i.i249:                                      ; preds = %loop.i.i241
+  %.7.i.i250 = getelementptr i8, ptr %.20.pre1.i434, i64 %written.i.i242
+  %.8.i.i251 = sub i64 %.4.i429, %written.i.i242
+  %.9.i.i252 = tail call i64 @write(i32 1, ptr %.7.i.i250, i64 %.8.i.i251)
+  %.10.i.i253 = add i64 %.9.i.i252, %written.i.i242
+  %.11.i.i254 = icmp sgt i64 %.9.i.i252, 0
+  br i1 %.11.i.i254, label %loop.i.i241, label %grammo_out_flush.exit.i244
+
+grammo_out_flush.exit.i244:                       ; preds = %body.i.i249, %loop.i.i241
+  %.10.b.i245 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i246 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i245, label %grammo_out_reserve.exit255, label %grow.i247
+
+grow.i247:                                        ; preds = %grammo_out_flush.exit.i244
+  %.16.i248 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i246, i64 65536)
+  store ptr %.16.i248, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit255
+
+grammo_out_reserve.exit255:                       ; preds = %elif_1_then, %grammo_out_flush.exit.i244, %grow.i247
+  %.7.i256 = phi i64 [ 0, %grow.i247 ], [ 0, %grammo_out_flush.exit.i244 ], [ %.4.i429, %elif_1_then ]
+  %.20.i239 = phi ptr [ %.16.i248, %grow.i247 ], [ %.20.pre.i246, %grammo_out_flush.exit.i244 ], [ %.20.pre1.i434, %elif_1_then ]
+  %.22.i240 = getelementptr i8, ptr %.20.i239, i64 %.7.i256
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(19) %.22.i240, ptr noundef nonnull align 16 dereferenceable(19) @str_12, i64 19, i1 false)
+  %.8.i257 = add nsw i64 %.7.i256, 18
+  store i64 %.8.i257, ptr @grammo_out_len, align 8
+  %.2.i.i258 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i259 = icmp slt i32 %.2.i.i258, 0
+  br i1 %.3.i.i259, label %check.i.i276, label %grammo_out_interactive.exit.i260
+
+check.i.i276:                                     ; preds = %grammo_out_reserve.exit255
+  %.5.i.i277 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i277, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i260
+
+grammo_out_interactive.exit.i260:                 ; preds = %check.i.i276, %grammo_out_reserve.exit255
+  %.8.i.i261 = phi i32 [ %.5.i.i277, %check.i.i276 ], [ %.2.i.i258, %grammo_out_reserve.exit255 ]
+  %.9.i.i262 = icmp sgt i32 %.8.i.i261, 0
+  br i1 %.9.i.i262, label %flush.i263, label %grammo_out_sync.exit278
+
+flush.i263:                                       ; preds = %grammo_out_interactive.exit.i260
+  %.2.i1.i264 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i265 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i266
+
+loop.i.i266:                                      ; preds = %body.i.i270, %flush.i263
+  %written.i.i267 = phi i64 [ 0, %flush.i263 ], [ %.10.i.i274, %body.i.i270 ]
+  %.5.i3.i268 = icmp slt i64 %written.i.i267, %.3.i2.i265
+  br i1 %.5.i3.i268, label %body.i.i270, label %grammo_out_flush.exit.i269
+
+body.i.i270:                                      ; preds = %loop.i.i266
+  %.7.i.i271 = getelementptr i8, ptr %.2.i1.i264, i64 %written.i.i267
+  %.8.i4.i272 = sub i64 %.3.i2.i265, %written.i.i267
+  %.9.i5.i273 = tail call i64 @write(i32 1, ptr %.7.i.i271, i64 %.8.i4.i272)
+  %.10.i.i274 = add i64 %.9.i5.i273, %written.i.i267
+  %.11.i.i275 = icmp sgt i64 %.9.i5.i273, 0
+  br i1 %.11.i.i275, label %loop.i.i266, label %grammo_out_flush.exit.i269
+
+grammo_out_flush.exit.i269:                       ; preds = %body.i.i270, %loop.i.i266
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit278
+
+grammo_out_sync.exit278:                          ; preds = %grammo_out_interactive.exit.i260, %grammo_out_flush.exit.i269
+  call void @llvm.lifetime.start.p0(i64 8, ptr nonnull %end.i283)
+  %.3.i279 = tail call fastcc i64 @grammo_in_token()
+  %.4.i280 = load ptr, ptr @grammo_in_buf, align 8
+  %.5.i281 = load i64, ptr @grammo_in_pos, align 8
+  %.6.i282 = getelementptr i8, ptr %.4.i280, i64 %.5.i281
+  %.7.i284 = call double @strtod(ptr %.6.i282, ptr nonnull %end.i283)
+  %.8.i285 = load ptr, ptr %end.i283, align 8
+  %.9.i286 = ptrtoint ptr %.8.i285 to i64
+  %.10.i287 = ptrtoint ptr %.6.i282 to i64
+  %.11.i288 = sub i64 %.9.i286, %.10.i287
+  %.12.i289 = icmp sgt i64 %.11.i288, 0
+  br i1 %.12.i289, label %store.i290, label %grammo_in_read_real.exit293
+
+store.i290:                                       ; preds = %grammo_out_sync.exit278
+  %.15.i291 = load i64, ptr @grammo_in_pos, align 8
+  %.16.i292 = add i64 %.15.i291, %.11.i288
+  store i64 %.16.i292, ptr @grammo_in_pos, align 8
+  br label %grammo_in_read_real.exit293
+
+grammo_in_read_real.exit293:                      ; preds = %grammo_out_sync.exit278, %store.i290
+  %m_amount.3 = phi double [ %.7.i284, %store.i290 ], [ %m_amount.0476.ph, %grammo_out_sync.exit278 ]
+  call void @llvm.lifetime.end.p0(i64 8, ptr nonnull %end.i283)
+  %.6.i294 = fcmp ugt double %m_amount.3, 0.000000e+00
+  br i1 %.6.i294, label %next_branch.i, label %if_then.i
+
+if_then.i:                                        ; preds = %grammo_in_read_real.exit293
+  %.4.i.i295 = load i64, ptr @grammo_out_len, align 8
+  %.5.i.i296 = add i64 %.4.i.i295, 20
+  %.6.b.i.i297 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i.i298 = select i1 %.6.b.i.i297, i64 65536, i64 0
+  %.7.not.i.i299 = icmp ugt i64 %.5.i.i296, %.6.i.i298
+  %.20.pre1.i.i300 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i.i299, label %loop.i.i.i323, label %grammo_out_reserve.exit.i301
+
+loop.i.i.i323:                                    ; preds = %if_then.i, %body.i.i.i331
+  %written.i.i.i324 = phi i64 [ %.10.i.i.i335, %body.i.i.i331 ], [ 0, %if_then.i ]
+  %.5.i.i.i325 = icmp slt i64 %written.i.i.i324, %.4.i.i295
+  br i1 %.5.i.i.i325, label %body.i.i.i331, label %grammo_out_flush.exit.i.i326
+
+body.i.i.i331:                                    ; preds = %loop.i.i.i323
+  %.7.i.i.i332 = getelementptr i8, ptr %.20.pre1.i.i300, i64 %written.i.i.i324
+  %.8.i.i.i333 = sub i64 %.4.i.i295, %written.i.i.i324
+  %.9.i.i.i334 = tail call i64 @write(i32 1, ptr %.7.i.i.i332, i64 %.8.i.i.i333)
+  %.10.i.i.i335 = add i64 %.9.i.i.i334, %written.i.i.i324
+  %.11.i.i.i336 = icmp sgt i64 %.9.i.i.i334, 0
+  br i1 %.11.i.i.i336, label %loop.i.i.i323, label %grammo_out_flush.exit.i.i326
+
+grammo_out_flush.exit.i.i326:                     ; preds = %body.i.i.i331, %loop.i.i.i323
+  %.10.b.i.i327 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i.i328 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i.i327, label %grammo_out_reserve.exit.i301, label %grow.i.i329
+
+grow.i.i329:                                      ; preds = %grammo_out_flush.exit.i.i326
+  %.16.i.i330 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i.i328, i64 65536)
+  store ptr %.16.i.i330, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit.i301
+
+grammo_out_reserve.exit.i301:                     ; preds = %grow.i.i329, %grammo_out_flush.exit.i.i326, %if_then.i
+  %.7.i.i302 = phi i64 [ 0, %grow.i.i329 ], [ 0, %grammo_out_flush.exit.i.i326 ], [ %.4.i.i295, %if_then.i ]
+  %.20.i.i303 = phi ptr [ %.16.i.i330, %grow.i.i329 ], [ %.20.pre.i.i328, %grammo_out_flush.exit.i.i326 ], [ %.20.pre1.i.i300, %if_then.i ]
+  %.22.i.i304 = getelementptr i8, ptr %.20.i.i303, i64 %.7.i.i302
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(20) %.22.i.i304, ptr noundef nonnull align 16 dereferenceable(20) @str_6, i64 20, i1 false)
+  %.8.i.i305 = add nsw i64 %.7.i.i302, 19
+  store i64 %.8.i.i305, ptr @grammo_out_len, align 8
+  %.2.i.i.i306 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i.i307 = icmp slt i32 %.2.i.i.i306, 0
+  br i1 %.3.i.i.i307, label %check.i.i.i321, label %grammo_out_interactive.exit.i.i308
+
+check.i.i.i321:                                   ; preds = %grammo_out_reserve.exit.i301
+  %.5.i.i10.i322 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i10.i322, ptr @grammo_out_tty, align 4
+  %.4.i381.pre482.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i.i308
+
+grammo_out_interactive.exit.i.i308:               ; preds = %check.i.i.i321, %grammo_out_reserve.exit.i301
+  %.4.i381.pre482 = phi i64 [ %.4.i381.pre482.pre, %check.i.i.i321 ], [ %.8.i.i305, %grammo_out_reserve.exit.i301 ]
+  %.8.i.i1.i309 = phi i32 [ %.5.i.i10.i322, %check.i.i.i321 ], [ %.2.i.i.i306, %grammo_out_reserve.exit.i301 ]
+  %.9.i.i2.i310 = icmp sgt i32 %.8.i.i1.i309, 0
+  br i1 %.9.i.i2.i310, label %flush.i.i, label %g.withdraw.exit
+
+flush.i.i:                                        ; preds = %grammo_out_interactive.exit.i.i308
+  %.2.i1.i.i = load ptr, ptr @grammo_out_buf, align 8
+  br label %loop.i.i3.i311
+
+loop.i.i3.i311:                                   ; preds = %body.i.i6.i315, %flush.i.i
+  %written.i.i4.i312 = phi i64 [ 0, %flush.i.i ], [ %.10.i.i8.i319, %body.i.i6.i315 ]
+  %.5.i3.i.i313 = icmp slt i64 %written.i.i4.i312, %.4.i381.pre482
+  br i1 %.5.i3.i.i313, label %body.i.i6.i315, label %grammo_out_flush.exit.i5.i314
+
+body.i.i6.i315:                                   ; preds = %loop.i.i3.i311
+  %.7.i.i7.i316 = getelementptr i8, ptr %.2.i1.i.i, i64 %written.i.i4.i312
+  %.8.i4.i.i317 = sub i64 %.4.i381.pre482, %written.i.i4.i312
+  %.9.i5.i.i318 = tail call i64 @write(i32 1, ptr %.7.i.i7.i316, i64 %.8.i4.i.i317)
+  %.10.i.i8.i319 = add i64 %.9.i5.i.i318, %written.i.i4.i312
+  %.11.i.i9.i320 = icmp sgt i64 %.9.i5.i.i318, 0
+  br i1 %.11.i.i9.i320, label %loop.i.i3.i311, label %grammo_out_flush.exit.i5.i314
+
+grammo_out_flush.exit.i5.i314:                    ; preds = %body.i.i6.i315, %loop.i.i3.i311
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %g.withdraw.exit
+
+next_branch.i:                                    ; preds = %grammo_in_read_real.exit293
+  %.13.i337 = fcmp ogt double %m_amount.3, %m_balance.0478.ph
+  br i1 %.13.i337, label %elif_0_then.i, label %elif_0_next.i
 
 elif_0_then.i:                                    ; preds = %next_branch.i
-  %.18.i = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_8)
-  %putchar.i = call i32 @putchar(i32 10)
-  br label %withdraw.exit
+  %.4.i11.i339 = load i64, ptr @grammo_out_len, align 8
+  %.5.i12.i340 = add i64 %.4.i11.i339, 21
+  %.6.b.i13.i341 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i14.i342 = select i1 %.6.b.i13.i341, i64 65536, i64 0
+  %.7.not.i15.i343 = icmp ugt i64 %.5.i12.i340, %.6.i14.i342
+  %.20.pre1.i16.i344 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i15.i343, label %loop.i.i20.i367, label %grammo_out_reserve.exit34.i345
+
+loop.i.i20.i367:                                  ; preds = %elif_0_then.i, %body.i.i28.i375
+  %written.i.i21.i368 = phi i64 [ %.10.i.i32.i379, %body.i.i28.i375 ], [ 0, %elif_0_then.i ]
+  %.5.i.i22.i369 = icmp slt i64 %written.i.i21.i368, %.4.i11.i339
+  br i1 %.5.i.i22.i369, label %body.i.i28.i375, label %grammo_out_flush.exit.i23.i370
+
+body.i.i28.i375:                                  ; preds = %loop.i.i20.i367
+  %.7.i.i29.i376 = getelementptr i8, ptr %.20.pre1.i16.i344, i64 %written.i.i21.i368
+  %.8.i.i30.i377 = sub i64 %.4.i11.i339, %written.i.i21.i368
+  %.9.i.i31.i378 = tail call i64 @write(i32 1, ptr %.7.i.i29.i376, i64 %.8.i.i30.i377)
+  %.10.i.i32.i379 = add i64 %.9.i.i31.i378, %written.i.i21.i368
+  %.11.i.i33.i380 = icmp sgt i64 %.9.i.i31.i378, 0
+  br i1 %.11.i.i33.i380, label %loop.i.i20.i367, label %grammo_out_flush.exit.i23.i370
+
+grammo_out_flush.exit.i23.i370:                   ; preds = %body.i.i28.i375, %loop.i.i20.i367
+  %.10.b.i24.i371 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i25.i372 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i24.i371, label %grammo_out_reserve.exit34.i345, label %grow.i26.i373
+
+grow.i26.i373:                                    ; preds = %grammo_out_flush.exit.i23.i370
+  %.16.i27.i374 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i25.i372, i64 65536)
+  store ptr %.16.i27.i374, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit34.i345
+
+grammo_out_reserve.exit34.i345:                   ; preds = %grow.i26.i373, %grammo_out_flush.exit.i23.i370, %elif_0_then.i
+  %.7.i35.i346 = phi i64 [ 0, %grow.i26.i373 ], [ 0, %grammo_out_flush.exit.i23.i370 ], [ %.4.i11.i339, %elif_0_then.i ]
+  %.20.i18.i347 = phi ptr [ %.16.i27.i374, %grow.i26.i373 ], [ %.20.pre.i25.i372, %grammo_out_flush.exit.i23.i370 ], [ %.20.pre1.i16.i344, %elif_0_then.i ]
+  %.22.i19.i348 = getelementptr i8, ptr %.20.i18.i347, i64 %.7.i35.i346
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(21) %.22.i19.i348, ptr noundef nonnull align 16 dereferenceable(21) @str_7, i64 21, i1 false)
+  %.8.i36.i349 = add nsw i64 %.7.i35.i346, 20
+  store i64 %.8.i36.i349, ptr @grammo_out_len, align 8
+  %.2.i.i37.i350 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i38.i351 = icmp slt i32 %.2.i.i37.i350, 0
+  br i1 %.3.i.i38.i351, label %check.i.i55.i365, label %grammo_out_interactive.exit.i39.i352
+
+check.i.i55.i365:                                 ; preds = %grammo_out_reserve.exit34.i345
+  %.5.i.i56.i366 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i56.i366, ptr @grammo_out_tty, align 4
+  %.4.i381.pre483.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i39.i352
+
+grammo_out_interactive.exit.i39.i352:             ; preds = %check.i.i55.i365, %grammo_out_reserve.exit34.i345
+  %.4.i381.pre483 = phi i64 [ %.4.i381.pre483.pre, %check.i.i55.i365 ], [ %.8.i36.i349, %grammo_out_reserve.exit34.i345 ]
+  %.8.i.i40.i353 = phi i32 [ %.5.i.i56.i366, %check.i.i55.i365 ], [ %.2.i.i37.i350, %grammo_out_reserve.exit34.i345 ]
+  %.9.i.i41.i354 = icmp sgt i32 %.8.i.i40.i353, 0
+  br i1 %.9.i.i41.i354, label %flush.i42.i, label %g.withdraw.exit
+
+flush.i42.i:                                      ; preds = %grammo_out_interactive.exit.i39.i352
+  %.2.i1.i43.i = load ptr, ptr @grammo_out_buf, align 8
+  br label %loop.i.i45.i355
+
+loop.i.i45.i355:                                  ; preds = %body.i.i49.i359, %flush.i42.i
+  %written.i.i46.i356 = phi i64 [ 0, %flush.i42.i ], [ %.10.i.i53.i363, %body.i.i49.i359 ]
+  %.5.i3.i47.i357 = icmp slt i64 %written.i.i46.i356, %.4.i381.pre483
+  br i1 %.5.i3.i47.i357, label %body.i.i49.i359, label %grammo_out_flush.exit.i48.i358
+
+body.i.i49.i359:                                  ; preds = %loop.i.i45.i355
+  %.7.i.i50.i360 = getelementptr i8, ptr %.2.i1.i43.i, i64 %written.i.i46.i356
+  %.8.i4.i51.i361 = sub i64 %.4.i381.pre483, %written.i.i46.i356
+  %.9.i5.i52.i362 = tail call i64 @write(i32 1, ptr %.7.i.i50.i360, i64 %.8.i4.i51.i361)
+  %.10.i.i53.i363 = add i64 %.9.i5.i52.i362, %written.i.i46.i356
+  %.11.i.i54.i364 = icmp sgt i64 %.9.i5.i52.i362, 0
+  br i1 %.11.i.i54.i364, label %loop.i.i45.i355, label %grammo_out_flush.exit.i48.i358
+
+grammo_out_flush.exit.i48.i358:                   ; preds = %body.i.i49.i359, %loop.i.i45.i355
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %g.withdraw.exit
 
 elif_0_next.i:                                    ; preds = %next_branch.i
-  %.23.i = fsub double %m_balance.06, %load_m_amount.1
-  br label %withdraw.exit
-
-withdraw.exit:                                    ; preds = %if_then.i, %elif_0_then.i, %elif_0_next.i
-  %common.ret.op.i = phi double [ %m_balance.06, %if_then.i ], [ %m_balance.06, %elif_0_then.i ], [ %.23.i, %elif_0_next.i ]
-  %.53 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_15)
-  %.55 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_12, double %common.ret.op.i)
-  br label %if_merge
-
-elif_2_next:                                      ; preds = %while_body
-  %.64 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_17)
-  br label %if_merge
-
-if_merge:                                         ; preds = %elif_2_next, %withdraw.exit, %elif_0_then, %if_then
-  %m_balance.1 = phi double [ %m_balance.06, %if_then ], [ %.6.i, %elif_0_then ], [ %common.ret.op.i, %withdraw.exit ], [ %m_balance.06, %elif_2_next ]
-  %putchar1 = call i32 @putchar(i32 10)
+  %.21.i338 = fsub double %m_balance.0478.ph, %m_amount.3
+  %.4.i381.pre = load i64, ptr @grammo_out_len, align 8
+  br label %g.withdraw.exit
+
+g.withdraw.exit:                                  ; preds = %grammo_out_interactive.exit.i.i308, %grammo_out_flush.exit.i5.i314, %grammo_out_interactive.exit.i39.i352, %grammo_out_flush.exit.i48.i358, %elif_0_next.i
+  %.4.i381 = phi i64 [ %.4.i381.pre, %elif_0_next.i ], [ %.4.i381.pre482, %grammo_out_interactive.exit.i.i308 ], [ 0, %grammo_out_flush.exit.i5.i314 ], [ %.4.i381.pre483, %grammo_out_interactive.exit.i39.i352 ], [ 0, %grammo_out_flush.exit.i48.i358 ]
+  %common.ret.op.i = phi double [ %.21.i338, %elif_0_next.i ], [ %m_balance.0478.ph, %grammo_out_interactive.exit.i.i308 ], [ %m_balance.0478.ph, %grammo_out_flush.exit.i5.i314 ], [ %m_balance.0478.ph, %grammo_out_interactive.exit.i39.i352 ], [ %m_balance.0478.ph, %grammo_out_flush.exit.i48.i358 ]
+  %.5.i382 = add i64 %.4.i381, 334
+  %.6.b.i383 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i384 = select i1 %.6.b.i383, i64 65536, i64 0
+  %.7.not.i385 = icmp ugt i64 %.5.i382, %.6.i384
+  %.20.pre1.i386 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i385, label %loop.i.i390, label %grammo_out_reserve.exit404
+
+loop.i.i390:                                      ; preds = %g.withdraw.exit, %body.i.i398
+  %written.i.i391 = phi i64 [ %.10.i.i402, %body.i.i398 ], [ 0, %g.withdraw.exit ]
+  %.5.i.i392 = icmp slt i64 %written.i.i391, %.4.i381
+  br i1 %.5.i.i392, label %body.i.i398, label %grammo_out_flush.exit.i393
+
+body.i.i398:                                      ; preds = %loop.i.i390
+  %.7.i.i399 = getelementptr i8, ptr %.20.pre1.i386, i64 %written.i.i391
+  %.8.i.i400 = sub i64 %.4.i381, %written.i.i391
+  %.9.i.i401 = tail call i64 @write(i32 1, ptr %.7.i.i399, i64 %.8.i.i400)
+  %.10.i.i402 = add i64 %.9.i.i401, %written.i.i391
+  %.11.i.i403 = icmp sgt i64 %.9.i.i401, 0
+  br i1 %.11.i.i403, label %loop.i.i390, label %grammo_out_flush.exit.i393
+
+grammo_out_flush.exit.i393:                       ; preds = %body.i.i398, %loop.i.i390
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i394 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i395 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i394, label %grammo_out_reserve.exit404, label %grow.i396
+
+grow.i396:                                        ; preds = %grammo_out_flush.exit.i393
+  %.16.i397 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i395, i64 65536)
+  store ptr %.16.i397, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit404
+
+grammo_out_reserve.exit404:                       ; preds = %g.withdraw.exit, %grammo_out_flush.exit.i393, %grow.i396
+  %.21.i387 = phi i64 [ 0, %grow.i396 ], [ 0, %grammo_out_flush.exit.i393 ], [ %.4.i381, %g.withdraw.exit ]
+  %.20.i388 = phi ptr [ %.16.i397, %grow.i396 ], [ %.20.pre.i395, %grammo_out_flush.exit.i393 ], [ %.20.pre1.i386, %g.withdraw.exit ]
+  %.22.i389 = getelementptr i8, ptr %.20.i388, i64 %.21.i387
+  %.54 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i389, i64 334, ptr nonnull @str_11, double %common.ret.op.i)
+  %2 = tail call i32 @llvm.smax.i32(i32 %.54, i32 0)
+  %.6.i405 = zext nneg i32 %2 to i64
+  %.7.i406 = load i64, ptr @grammo_out_len, align 8
+  %.8.i407 = add i64 %.7.i406, %.6.i405
+  store i64 %.8.i407, ptr @grammo_out_len, align 8
+  %.2.i.i408 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i409 = icmp slt i32 %.2.i.i408, 0
+  br i1 %.3.i.i409, label %check.i.i426, label %grammo_out_interactive.exit.i410
+
+check.i.i426:                                     ; preds = %grammo_out_reserve.exit404
+  %.5.i.i427 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i427, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i410
+
+grammo_out_interactive.exit.i410:                 ; preds = %check.i.i426, %grammo_out_reserve.exit404
+  %.8.i.i411 = phi i32 [ %.5.i.i427, %check.i.i426 ], [ %.2.i.i408, %grammo_out_reserve.exit404 ]
+  %.9.i.i412 = icmp sgt i32 %.8.i.i411, 0
+  br i1 %.9.i.i412, label %flush.i413, label %while_body.outer.backedge
+
+flush.i413:                                       ; preds = %grammo_out_interactive.exit.i410
+  %.2.i1.i414 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i415 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i416
+
+loop.i.i416:                                      ; preds = %body.i.i420, %flush.i413
+  %written.i.i417 = phi i64 [ 0, %flush.i413 ], [ %.10.i.i424, %body.i.i420 ]
+  %.5.i3.i418 = icmp slt i64 %written.i.i417, %.3.i2.i415
+  br i1 %.5.i3.i418, label %body.i.i420, label %if_merge.sink.split
+
+body.i.i420:                                      ; preds = %loop.i.i416
+  %.7.i.i421 = getelementptr i8, ptr %.2.i1.i414, i64 %written.i.i417
+  %.8.i4.i422 = sub i64 %.3.i2.i415, %written.i.i417
+  %.9.i5.i423 = tail call i64 @write(i32 1, ptr %.7.i.i421, i64 %.8.i4.i422)
+  %.10.i.i424 = add i64 %.9.i5.i423, %written.i.i417
+  %.11.i.i425 = icmp sgt i64 %.9.i5.i423, 0
+  br i1 %.11.i.i425, label %loop.i.i416, label %if_merge.sink.split
+
+elif_2_next:                                      ; preds = %grammo_in_read_int.exit
+  %.5.i430 = add i64 %.4.i429, 19
+  %.7.not.i433 = icmp ugt i64 %.5.i430, %.6.i432
+  br i1 %.7.not.i433, label %loop.i.i438, label %grammo_out_reserve.exit452
+
+loop.i.i438:                                      ; preds = %elif_2_next, %body.i.i446
+  %written.i.i439 = phi i64 [ %.10.i.i450, %body.i.i446 ], [ 0, %elif_2_next ]
+  %.5.i.i440 = icmp slt i64 %written.i.i439, %.4.i429
+  br i1 %.5.i.i440, label %body.i.i446, label %grammo_out_flush.exit.i441
+
+body.i.i446:                                      ; preds = %loop.i.i438
+  %.7.i.i447 = getelementptr i8, ptr %.20.pre1.i434, i64 %written.i.i439
+  %.8.i.i448 = sub i64 %.4.i429, %written.i.i439
+  %.9.i.i449 = tail call i64 @write(i32 1, ptr %.7.i.i447, i64 %.8.i.i448)
+  %.10.i.i450 = add i64 %.9.i.i449, %written.i.i439
+  %.11.i.i451 = icmp sgt i64 %.9.i.i449, 0
+  br i1 %.11.i.i451, label %loop.i.i438, label %grammo_out_flush.exit.i441
+
+grammo_out_flush.exit.i441:                       ; preds = %body.i.i446, %loop.i.i438
+  %.10.b.i442 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i443 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i442, label %grammo_out_reserve.exit452, label %grow.i444
+
+grow.i444:                                        ; preds = %grammo_out_flush.exit.i441
+  %.16.i445 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i443, i64 65536)
+  store ptr %.16.i445, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit452
+
+grammo_out_reserve.exit452:                       ; preds = %elif_2_next, %grammo_out_flush.exit.i441, %grow.i444
+  %.7.i453 = phi i64 [ 0, %grow.i444 ], [ 0, %grammo_out_flush.exit.i441 ], [ %.4.i429, %elif_2_next ]
+  %.20.i436 = phi ptr [ %.16.i445, %grow.i444 ], [ %.20.pre.i443, %grammo_out_flush.exit.i441 ], [ %.20.pre1.i434, %elif_2_next ]
+  %.22.i437 = getelementptr i8, ptr %.20.i436, i64 %.7.i453
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(19) %.22.i437, ptr noundef nonnull align 16 dereferenceable(19) @str_13, i64 19, i1 false)
+  %.8.i454 = add nsw i64 %.7.i453, 18
+  store i64 %.8.i454, ptr @grammo_out_len, align 8
+  %.2.i.i455 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i456 = icmp slt i32 %.2.i.i455, 0
+  br i1 %.3.i.i456, label %check.i.i473, label %grammo_out_interactive.exit.i457
+
+check.i.i473:                                     ; preds = %grammo_out_reserve.exit452
+  %.5.i.i474 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i474, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i457
+
+grammo_out_interactive.exit.i457:                 ; preds = %check.i.i473, %grammo_out_reserve.exit452
+  %.8.i.i458 = phi i32 [ %.5.i.i474, %check.i.i473 ], [ %.2.i.i455, %grammo_out_reserve.exit452 ]
+  %.9.i.i459 = icmp sgt i32 %.8.i.i458, 0
+  br i1 %.9.i.i459, label %flush.i460, label %while_body.backedge
+
+while_body.backedge:                              ; preds = %grammo_out_interactive.exit.i457, %grammo_out_interactive.exit.i105
   br label %while_body
+
+flush.i460:                                       ; preds = %grammo_out_interactive.exit.i457
+  %.2.i1.i461 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i462 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i463
+
+loop.i.i463:                                      ; preds = %body.i.i467, %flush.i460
+  %written.i.i464 = phi i64 [ 0, %flush.i460 ], [ %.10.i.i471, %body.i.i467 ]
+  %.5.i3.i465 = icmp slt i64 %written.i.i464, %.3.i2.i462
+  br i1 %.5.i3.i465, label %body.i.i467, label %if_merge.sink.split
+
+body.i.i467:                                      ; preds = %loop.i.i463
+  %.7.i.i468 = getelementptr i8, ptr %.2.i1.i461, i64 %written.i.i464
+  %.8.i4.i469 = sub i64 %.3.i2.i462, %written.i.i464
+  %.9.i5.i470 = tail call i64 @write(i32 1, ptr %.7.i.i468, i64 %.8.i4.i469)
+  %.10.i.i471 = add i64 %.9.i5.i470, %written.i.i464
+  %.11.i.i472 = icmp sgt i64 %.9.i5.i470, 0
+  br i1 %.11.i.i472, label %loop.i.i463, label %if_merge.sink.split
+
+if_merge.sink.split:                              ; preds = %loop.i.i416, %body.i.i420, %loop.i.i219, %body.i.i223, %loop.i.i111, %body.i.i115, %loop.i.i463, %body.i.i467
+  %m_amount.1.ph = phi double [ %m_amount.0476.ph, %body.i.i467 ], [ %m_amount.0476.ph, %loop.i.i463 ], [ %m_amount.0476.ph, %body.i.i115 ], [ %m_amount.0476.ph, %loop.i.i111 ], [ %m_amount.2, %body.i.i223 ], [ %m_amount.2, %loop.i.i219 ], [ %m_amount.3, %body.i.i420 ], [ %m_amount.3, %loop.i.i416 ]
+  %m_balance.1.ph = phi double [ %m_balance.0478.ph, %body.i.i467 ], [ %m_balance.0478.ph, %loop.i.i463 ], [ %m_balance.0478.ph, %body.i.i115 ], [ %m_balance.0478.ph, %loop.i.i111 ], [ %.6.i183, %body.i.i223 ], [ %.6.i183, %loop.i.i219 ], [ %common.ret.op.i, %body.i.i420 ], [ %common.ret.op.i, %loop.i.i416 ]
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %while_body.outer.backedge
 }
 
-; Function Attrs: nofree nounwind
-declare noundef i32 @putchar(i32 noundef) local_unnamed_addr #0
+; Function Attrs: nounwind
+define internal fastcc i64 @grammo_in_token() unnamed_addr #2 {
+entry:
+  %.3.pre = load i64, ptr @grammo_in_pos, align 8
+  %.4.pre = load i64, ptr @grammo_in_end, align 8
+  br label %skip.outer
+
+skip.outer:                                       ; preds = %grammo_in_fill.exit, %entry
+  %.4.ph = phi i64 [ %.33.i, %grammo_in_fill.exit ], [ %.4.pre, %entry ]
+  %.3.ph = phi i64 [ 0, %grammo_in_fill.exit ], [ %.3.pre, %entry ]
+  %.9 = load ptr, ptr @grammo_in_buf, align 8
+  br label %skip
+
+skip:                                             ; preds = %skip.outer, %skip_next
+  %.3 = phi i64 [ %.19, %skip_next ], [ %.3.ph, %skip.outer ]
+  %.5 = icmp ult i64 %.3, %.4.ph
+  br i1 %.5, label %skip_test, label %skip_fill
+
+skip_fill:                                        ; preds = %skip
+  %.3.i = icmp eq ptr %.9, null
+  br i1 %.3.i, label %alloc.i, label %entry.check_full_crit_edge.i
+
+entry.check_full_crit_edge.i:                     ; preds = %skip_fill
+  %.12.pre.i = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i
+
+alloc.i:                                          ; preds = %skip_fill
+  %.5.i = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i
+
+check_full.i:                                     ; preds = %alloc.i, %entry.check_full_crit_edge.i
+  %.17.i = phi ptr [ %.9, %entry.check_full_crit_edge.i ], [ %.5.i, %alloc.i ]
+  %.12.i = phi i64 [ %.12.pre.i, %entry.check_full_crit_edge.i ], [ 65536, %alloc.i ]
+  %.11.i = sub i64 %.4.ph, %.3
+  %.13.i = icmp eq i64 %.11.i, %.12.i
+  br i1 %.13.i, label %grow.i, label %grammo_in_fill.exit
+
+grow.i:                                           ; preds = %check_full.i
+  %.16.i = shl i64 %.12.i, 1
+  %.18.i = or disjoint i64 %.16.i, 1
+  %.19.i = tail call ptr @realloc(ptr %.17.i, i64 %.18.i)
+  store ptr %.19.i, ptr @grammo_in_buf, align 8
+  store i64 %.16.i, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit
+
+grammo_in_fill.exit:                              ; preds = %check_full.i, %grow.i
+  %.28.i = phi i64 [ %.16.i, %grow.i ], [ %.12.i, %check_full.i ]
+  %.23.i = phi ptr [ %.19.i, %grow.i ], [ %.17.i, %check_full.i ]
+  %.25.i = getelementptr i8, ptr %.23.i, i64 %.3
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i, ptr align 1 %.25.i, i64 %.11.i, i1 false)
+  %.27.i = getelementptr i8, ptr %.23.i, i64 %.11.i
+  %.29.i = sub i64 %.28.i, %.11.i
+  %.30.i = tail call i64 @read(i32 0, ptr %.27.i, i64 %.29.i)
+  %.31.i = icmp sgt i64 %.30.i, 0
+  %.32.i = tail call i64 @llvm.smax.i64(i64 %.30.i, i64 0)
+  %.33.i = add i64 %.32.i, %.11.i
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i, ptr @grammo_in_end, align 8
+  %.36.i = getelementptr i8, ptr %.23.i, i64 %.33.i
+  store i8 0, ptr %.36.i, align 1
+  br i1 %.31.i, label %skip.outer, label %common.ret
+
+skip_test:                                        ; preds = %skip
+  %.11 = getelementptr i8, ptr %.9, i64 %.3
+  %.12 = load i8, ptr %.11, align 1
+  switch i8 %.12, label %scan.outer [
+    i8 32, label %skip_next
+    i8 13, label %skip_next
+    i8 12, label %skip_next
+    i8 11, label %skip_next
+    i8 10, label %skip_next
+    i8 9, label %skip_next
+  ]
+
+skip_next:                                        ; preds = %skip_test, %skip_test, %skip_test, %skip_test, %skip_test, %skip_test
+  %.19 = add nuw i64 %.3, 1
+  store i64 %.19, ptr @grammo_in_pos, align 8
+  br label %skip
+
+scan:                                             ; preds = %grammo_in_fill.exit28.peel, %grammo_in_fill.exit28
+  %.24 = phi i64 [ %.33.i20, %grammo_in_fill.exit28 ], [ %.33.i20.peel, %grammo_in_fill.exit28.peel ]
+  %.25 = icmp ult i64 %length.ph, %.24
+  %.27 = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.25, label %scan_test, label %scan_fill
+
+scan_test:                                        ; preds = %scan, %scan.outer
+  %.24.lcssa = phi i64 [ %.2444, %scan.outer ], [ %.24, %scan ]
+  %.22.lcssa = phi i64 [ %.2242, %scan.outer ], [ 0, %scan ]
+  %.23.lcssa = phi i64 [ %.23.peel, %scan.outer ], [ %length.ph, %scan ]
+  %.27.lcssa = phi ptr [ %.27.peel, %scan.outer ], [ %.27, %scan ]
+  %.28 = getelementptr i8, ptr %.27.lcssa, i64 %.23.lcssa
+  %.29 = load i8, ptr %.28, align 1
+  switch i8 %.29, label %scan_next [
+    i8 32, label %common.ret
+    i8 13, label %common.ret
+    i8 12, label %common.ret
+    i8 11, label %common.ret
+    i8 10, label %common.ret
+    i8 9, label %common.ret
+  ]
+
+scan_next:                                        ; preds = %scan_test
+  %.35 = add i64 %length.ph, 1
+  br label %scan.outer
+
+scan.outer:                                       ; preds = %skip_test, %scan_next
+  %.2444 = phi i64 [ %.24.lcssa, %scan_next ], [ %.4.ph, %skip_test ]
+  %.2242 = phi i64 [ %.22.lcssa, %scan_next ], [ %.3, %skip_test ]
+  %length.ph = phi i64 [ %.35, %scan_next ], [ 1, %skip_test ]
+  %.23.peel = add i64 %.2242, %length.ph
+  %.25.peel = icmp ult i64 %.23.peel, %.2444
+  %.27.peel = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.25.peel, label %scan_test, label %scan_fill.peel
+
+scan_fill.peel:                                   ; preds = %scan.outer
+  %.3.i2.peel = icmp eq ptr %.27.peel, null
+  br i1 %.3.i2.peel, label %alloc.i26.peel, label %entry.check_full_crit_edge.i3.peel
+
+entry.check_full_crit_edge.i3.peel:               ; preds = %scan_fill.peel
+  %.12.pre.i4.peel = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.peel
+
+alloc.i26.peel:                                   ; preds = %scan_fill.peel
+  %.5.i27.peel = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i27.peel, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.peel
+
+check_full.i5.peel:                               ; preds = %alloc.i26.peel, %entry.check_full_crit_edge.i3.peel
+  %.17.i6.peel = phi ptr [ %.27.peel, %entry.check_full_crit_edge.i3.peel ], [ %.5.i27.peel, %alloc.i26.peel ]
+  %.12.i7.peel = phi i64 [ %.12.pre.i4.peel, %entry.check_full_crit_edge.i3.peel ], [ 65536, %alloc.i26.peel ]
+  %.11.i10.peel = sub i64 %.2444, %.2242
+  %.13.i11.peel = icmp eq i64 %.11.i10.peel, %.12.i7.peel
+  br i1 %.13.i11.peel, label %grow.i22.peel, label %grammo_in_fill.exit28.peel
+
+grow.i22.peel:                                    ; preds = %check_full.i5.peel
+  %.16.i23.peel = shl i64 %.12.i7.peel, 1
+  %.18.i24.peel = or disjoint i64 %.16.i23.peel, 1
+  %.19.i25.peel = tail call ptr @realloc(ptr %.17.i6.peel, i64 %.18.i24.peel)
+  store ptr %.19.i25.peel, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23.peel, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28.peel
+
+grammo_in_fill.exit28.peel:                       ; preds = %grow.i22.peel, %check_full.i5.peel
+  %.28.i12.peel = phi i64 [ %.16.i23.peel, %grow.i22.peel ], [ %.12.i7.peel, %check_full.i5.peel ]
+  %.23.i13.peel = phi ptr [ %.19.i25.peel, %grow.i22.peel ], [ %.17.i6.peel, %check_full.i5.peel ]
+  %.25.i14.peel = getelementptr i8, ptr %.23.i13.peel, i64 %.2242
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i13.peel, ptr align 1 %.25.i14.peel, i64 %.11.i10.peel, i1 false)
+  %.27.i15.peel = getelementptr i8, ptr %.23.i13.peel, i64 %.11.i10.peel
+  %.29.i16.peel = sub i64 %.28.i12.peel, %.11.i10.peel
+  %.30.i17.peel = tail call i64 @read(i32 0, ptr %.27.i15.peel, i64 %.29.i16.peel)
+  %.31.i18.peel = icmp sgt i64 %.30.i17.peel, 0
+  %.32.i19.peel = tail call i64 @llvm.smax.i64(i64 %.30.i17.peel, i64 0)
+  %.33.i20.peel = add i64 %.32.i19.peel, %.11.i10.peel
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20.peel, ptr @grammo_in_end, align 8
+  %.36.i21.peel = getelementptr i8, ptr %.23.i13.peel, i64 %.33.i20.peel
+  store i8 0, ptr %.36.i21.peel, align 1
+  br i1 %.31.i18.peel, label %scan, label %common.ret
+
+scan_fill:                                        ; preds = %scan
+  %.3.i2 = icmp eq ptr %.27, null
+  br i1 %.3.i2, label %alloc.i26, label %entry.check_full_crit_edge.i3
+
+entry.check_full_crit_edge.i3:                    ; preds = %scan_fill
+  %.12.pre.i4 = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i5
+
+alloc.i26:                                        ; preds = %scan_fill
+  %.5.i27 = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i27, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i5
+
+check_full.i5:                                    ; preds = %alloc.i26, %entry.check_full_crit_edge.i3
+  %.17.i6 = phi ptr [ %.27, %entry.check_full_crit_edge.i3 ], [ %.5.i27, %alloc.i26 ]
+  %.12.i7 = phi i64 [ %.12.pre.i4, %entry.check_full_crit_edge.i3 ], [ 65536, %alloc.i26 ]
+  %.13.i11 = icmp eq i64 %.24, %.12.i7
+  br i1 %.13.i11, label %grow.i22, label %grammo_in_fill.exit28
+
+grow.i22:                                         ; preds = %check_full.i5
+  %.16.i23 = shl i64 %.12.i7, 1
+  %.18.i24 = or disjoint i64 %.16.i23, 1
+  %.19.i25 = tail call ptr @realloc(ptr %.17.i6, i64 %.18.i24)
+  store ptr %.19.i25, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28
+
+grammo_in_fill.exit28:                            ; preds = %check_full.i5, %grow.i22
+  %.28.i12 = phi i64 [ %.16.i23, %grow.i22 ], [ %.12.i7, %check_full.i5 ]
+  %.23.i13 = phi ptr [ %.19.i25, %grow.i22 ], [ %.17.i6, %check_full.i5 ]
+  %.27.i15 = getelementptr i8, ptr %.23.i13, i64 %.24
+  %.29.i16 = sub i64 %.28.i12, %.24
+  %.30.i17 = tail call i64 @read(i32 0, ptr %.27.i15, i64 %.29.i16)
+  %.31.i18 = icmp sgt i64 %.30.i17, 0
+  %.32.i19 = tail call i64 @llvm.smax.i64(i64 %.30.i17, i64 0)
+  %.33.i20 = add i64 %.32.i19, %.24
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20, ptr @grammo_in_end, align 8
+  %.36.i21 = getelementptr i8, ptr %.23.i13, i64 %.33.i20
+  store i8 0, ptr %.36.i21, align 1
+  br i1 %.31.i18, label %scan, label %common.ret, !llvm.loop !0
+
+common.ret:                                       ; preds = %grammo_in_fill.exit, %scan_test, %scan_test, %scan_test, %scan_test, %scan_test, %scan_test, %grammo_in_fill.exit28, %grammo_in_fill.exit28.peel
+  %common.ret.op = phi i64 [ %length.ph, %grammo_in_fill.exit28.peel ], [ %length.ph, %grammo_in_fill.exit28 ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ 0, %grammo_in_fill.exit ]
+  ret i64 %common.ret.op
+}
+
+; Function Attrs: nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memcpy.p0.p0.i64(ptr noalias nocapture writeonly, ptr noalias nocapture readonly, i64, i1 immarg) #6
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i64 @llvm.smax.i64(i64, i64) #7
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i32 @llvm.smax.i32(i32, i32) #7
+
+; Function Attrs: nocallback nofree nosync nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.lifetime.start.p0(i64 immarg, ptr nocapture) #8
+
+; Function Attrs: nocallback nofree nosync nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.lifetime.end.p0(i64 immarg, ptr nocapture) #8
 
 attributes #0 = { nofree nounwind }
-attributes #1 = { mustprogress nofree norecurse nosync nounwind willreturn memory(none) }
+attributes #1 = { mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #2 = { nounwind }
+attributes #3 = { mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #4 = { mustprogress nofree nounwind willreturn }
+attributes #5 = { mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+attributes #6 = { nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+attributes #7 = { nocallback nofree nosync nounwind speculatable willreturn memory(none) }
+attributes #8 = { nocallback nofree nosync nounwind willreturn memory(argmem: readwrite) }
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.peeled.count", i32 1}
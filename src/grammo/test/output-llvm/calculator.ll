@@ -1,140 +1,1092 @@
 ; ModuleID = '<string>'
 source_filename = "<string>"
-target triple = "x86_64-pc-windows-msvc"
-
-@str_0 = constant [27 x i8] c"Errore: divisione per zero\00"
-@str_1 = constant [3 x i8] c"%s\00"
-@str_2 = local_unnamed_addr constant [2 x i8] c"\0A\00"
-@str_3 = constant [22 x i8] c"Calcolatrice semplice\00"
-@str_4 = constant [19 x i8] c"1=+  2=-  3=*  4=/\00"
-@str_5 = constant [13 x i8] c"Operazione: \00"
-@str_6 = constant [3 x i8] c"%d\00"
-@str_7 = constant [4 x i8] c"A: \00"
-@str_8 = constant [4 x i8] c"%lf\00"
-@str_9 = constant [4 x i8] c"B: \00"
-@str_10 = constant [11 x i8] c"Risultato=\00"
-@str_11 = constant [5 x i8] c"%.6f\00"
-@str_12 = constant [46 x i8] c"Vuoi fare un'altra operazione? (1=si, 0=no): \00"
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-i128:128-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-unknown-linux-gnu"
+
+@grammo_out_buf = internal unnamed_addr global ptr null
+@grammo_out_cap = internal unnamed_addr global i1 false
+@grammo_out_len = internal unnamed_addr global i64 0
+@grammo_out_tty = internal unnamed_addr global i32 -1
+@str_0 = private unnamed_addr constant [28 x i8] c"Errore: divisione per zero\0A\00"
+@str_1 = private unnamed_addr constant [23 x i8] c"Calcolatrice semplice\0A\00"
+@str_2 = private unnamed_addr constant [20 x i8] c"1=+  2=-  3=*  4=/\0A\00"
+@str_3 = private unnamed_addr constant [13 x i8] c"Operazione: \00"
+@grammo_in_buf = internal unnamed_addr global ptr null
+@grammo_in_cap = internal unnamed_addr global i64 0
+@grammo_in_pos = internal unnamed_addr global i64 0
+@grammo_in_end = internal unnamed_addr global i64 0
+@str_6 = private constant [16 x i8] c"Risultato=%.6f\0A\00"
+@str_7 = private unnamed_addr constant [46 x i8] c"Vuoi fare un'altra operazione? (1=si, 0=no): \00"
 
 ; Function Attrs: nofree nounwind
-declare noundef i32 @printf(ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+declare noundef i32 @snprintf(ptr noalias nocapture noundef writeonly, i64 noundef, ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+
+; Function Attrs: mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite)
+declare noalias noundef ptr @realloc(ptr allocptr nocapture, i64 noundef) local_unnamed_addr #1
 
 ; Function Attrs: nofree nounwind
-declare noundef i32 @scanf(ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+declare noundef i64 @write(i32 noundef, ptr nocapture noundef readonly, i64 noundef) local_unnamed_addr #0
+
+; Function Attrs: nounwind
+declare i32 @isatty(i32) local_unnamed_addr #2
+
+; Function Attrs: mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite)
+declare noalias noundef ptr @malloc(i64 noundef) local_unnamed_addr #3
 
 ; Function Attrs: nofree nounwind
-define double @calc(double %a, double %b, i32 %op) local_unnamed_addr #0 {
+declare noundef i64 @read(i32 noundef, ptr nocapture noundef, i64 noundef) local_unnamed_addr #0
+
+; Function Attrs: mustprogress nofree nounwind willreturn
+declare double @strtod(ptr readonly, ptr nocapture) local_unnamed_addr #4
+
+; Function Attrs: mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memmove.p0.p0.i64(ptr nocapture writeonly, ptr nocapture readonly, i64, i1 immarg) #5
+
+; Function Attrs: nounwind
+define void @main() local_unnamed_addr #2 {
 entry:
-  switch i32 %op, label %elif_1_next [
-    i32 1, label %if_then
-    i32 2, label %elif_0_then
-    i32 3, label %elif_1_then
-  ]
+  %end.i223 = alloca ptr, align 8
+  %end.i = alloca ptr, align 8
+  %.4.i = load i64, ptr @grammo_out_len, align 8
+  %.5.i = add i64 %.4.i, 23
+  %.6.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i = select i1 %.6.b.i, i64 65536, i64 0
+  %.7.not.i = icmp ugt i64 %.5.i, %.6.i
+  %.20.pre1.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i, label %loop.i.i, label %grammo_out_reserve.exit
 
-common.ret:                                       ; preds = %next_branch.1, %if_then.1, %elif_1_then, %elif_0_then, %if_then
-  %common.ret.op = phi double [ %.9, %if_then ], [ %.13, %elif_0_then ], [ %.17, %elif_1_then ], [ 0.000000e+00, %if_then.1 ], [ %.27, %next_branch.1 ]
-  ret double %common.ret.op
+loop.i.i:                                         ; preds = %entry, %body.i.i
+  %written.i.i = phi i64 [ %.10.i.i, %body.i.i ], [ 0, %entry ]
+  %.5.i.i = icmp slt i64 %written.i.i, %.4.i
+  br i1 %.5.i.i, label %body.i.i, label %grammo_out_flush.exit.i
 
-if_then:                                          ; preds = %entry
-  %.9 = fadd double %a, %b
-  br label %common.ret
+body.i.i:                                         ; preds = %loop.i.i
+  %.7.i.i = getelementptr i8, ptr %.20.pre1.i, i64 %written.i.i
+  %.8.i.i = sub i64 %.4.i, %written.i.i
+  %.9.i.i = tail call i64 @write(i32 1, ptr %.7.i.i, i64 %.8.i.i)
+  %.10.i.i = add i64 %.9.i.i, %written.i.i
+  %.11.i.i = icmp sgt i64 %.9.i.i, 0
+  br i1 %.11.i.i, label %loop.i.i, label %grammo_out_flush.exit.i
 
-elif_0_then:                                      ; preds = %entry
-  %.13 = fsub double %a, %b
-  br label %common.ret
+grammo_out_flush.exit.i:                          ; preds = %body.i.i, %loop.i.i
+  %.10.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i, label %grammo_out_reserve.exit, label %grow.i
 
-elif_1_then:                                      ; preds = %entry
-  %.17 = fmul double %a, %b
-  br label %common.ret
+grow.i:                                           ; preds = %grammo_out_flush.exit.i
+  %.16.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i, i64 65536)
+  store ptr %.16.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit
 
-elif_1_next:                                      ; preds = %entry
-  %.19 = fcmp oeq double %b, 0.000000e+00
-  br i1 %.19, label %if_then.1, label %next_branch.1
+grammo_out_reserve.exit:                          ; preds = %entry, %grammo_out_flush.exit.i, %grow.i
+  %.7.i = phi i64 [ 0, %grow.i ], [ 0, %grammo_out_flush.exit.i ], [ %.4.i, %entry ]
+  %.20.i = phi ptr [ %.16.i, %grow.i ], [ %.20.pre.i, %grammo_out_flush.exit.i ], [ %.20.pre1.i, %entry ]
+  %.22.i = getelementptr i8, ptr %.20.i, i64 %.7.i
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(23) %.22.i, ptr noundef nonnull align 16 dereferenceable(23) @str_1, i64 23, i1 false)
+  %.8.i = add nsw i64 %.7.i, 22
+  store i64 %.8.i, ptr @grammo_out_len, align 8
+  %.2.i.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i = icmp slt i32 %.2.i.i, 0
+  br i1 %.3.i.i, label %check.i.i, label %grammo_out_interactive.exit.i
 
-if_then.1:                                        ; preds = %elif_1_next
-  %.22 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_0)
-  %putchar = tail call i32 @putchar(i32 10)
-  br label %common.ret
+check.i.i:                                        ; preds = %grammo_out_reserve.exit
+  %.5.i.i10 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i10, ptr @grammo_out_tty, align 4
+  %.4.i11.pre.pre = load i64, ptr @grammo_out_len, align 8
+  %.20.pre1.i16.pre383.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_interactive.exit.i
 
-next_branch.1:                                    ; preds = %elif_1_next
-  %.27 = fdiv double %a, %b
-  br label %common.ret
-}
+grammo_out_interactive.exit.i:                    ; preds = %check.i.i, %grammo_out_reserve.exit
+  %.20.pre1.i16.pre383 = phi ptr [ %.20.pre1.i16.pre383.pre, %check.i.i ], [ %.20.i, %grammo_out_reserve.exit ]
+  %.4.i11.pre = phi i64 [ %.4.i11.pre.pre, %check.i.i ], [ %.8.i, %grammo_out_reserve.exit ]
+  %.8.i.i1 = phi i32 [ %.5.i.i10, %check.i.i ], [ %.2.i.i, %grammo_out_reserve.exit ]
+  %.9.i.i2 = icmp sgt i32 %.8.i.i1, 0
+  br i1 %.9.i.i2, label %loop.i.i3, label %grammo_out_advance.exit
 
-; Function Attrs: nofree nounwind
-define void @main() local_unnamed_addr #0 {
-entry:
-  %a = alloca double, align 8
-  store double 0.000000e+00, ptr %a, align 8
-  %b = alloca double, align 8
-  store double 0.000000e+00, ptr %b, align 8
-  %op = alloca i32, align 4
-  store i32 0, ptr %op, align 4
-  %cont = alloca i32, align 4
-  %.9 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_3)
-  %putchar = tail call i32 @putchar(i32 10)
-  %.15 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_4)
-  %putchar1 = tail call i32 @putchar(i32 10)
-  store i32 1, ptr %cont, align 4
+loop.i.i3:                                        ; preds = %grammo_out_interactive.exit.i, %body.i.i6
+  %written.i.i4 = phi i64 [ %.10.i.i8, %body.i.i6 ], [ 0, %grammo_out_interactive.exit.i ]
+  %.5.i3.i = icmp slt i64 %written.i.i4, %.4.i11.pre
+  br i1 %.5.i3.i, label %body.i.i6, label %grammo_out_flush.exit.i5
+
+body.i.i6:                                        ; preds = %loop.i.i3
+  %.7.i.i7 = getelementptr i8, ptr %.20.pre1.i16.pre383, i64 %written.i.i4
+  %.8.i4.i = sub i64 %.4.i11.pre, %written.i.i4
+  %.9.i5.i = tail call i64 @write(i32 1, ptr %.7.i.i7, i64 %.8.i4.i)
+  %.10.i.i8 = add i64 %.9.i5.i, %written.i.i4
+  %.11.i.i9 = icmp sgt i64 %.9.i5.i, 0
+  br i1 %.11.i.i9, label %loop.i.i3, label %grammo_out_flush.exit.i5
+
+grammo_out_flush.exit.i5:                         ; preds = %body.i.i6, %loop.i.i3
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i16.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit
+
+grammo_out_advance.exit:                          ; preds = %grammo_out_interactive.exit.i, %grammo_out_flush.exit.i5
+  %.20.pre1.i16 = phi ptr [ %.20.pre1.i16.pre383, %grammo_out_interactive.exit.i ], [ %.20.pre1.i16.pre, %grammo_out_flush.exit.i5 ]
+  %.4.i11 = phi i64 [ %.4.i11.pre, %grammo_out_interactive.exit.i ], [ 0, %grammo_out_flush.exit.i5 ]
+  %.5.i12 = add i64 %.4.i11, 20
+  %.6.b.i13 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i14 = select i1 %.6.b.i13, i64 65536, i64 0
+  %.7.not.i15 = icmp ugt i64 %.5.i12, %.6.i14
+  br i1 %.7.not.i15, label %loop.i.i20, label %grammo_out_reserve.exit34
+
+loop.i.i20:                                       ; preds = %grammo_out_advance.exit, %body.i.i28
+  %written.i.i21 = phi i64 [ %.10.i.i32, %body.i.i28 ], [ 0, %grammo_out_advance.exit ]
+  %.5.i.i22 = icmp slt i64 %written.i.i21, %.4.i11
+  br i1 %.5.i.i22, label %body.i.i28, label %grammo_out_flush.exit.i23
+
+body.i.i28:                                       ; preds = %loop.i.i20
+  %.7.i.i29 = getelementptr i8, ptr %.20.pre1.i16, i64 %written.i.i21
+  %.8.i.i30 = sub i64 %.4.i11, %written.i.i21
+  %.9.i.i31 = tail call i64 @write(i32 1, ptr %.7.i.i29, i64 %.8.i.i30)
+  %.10.i.i32 = add i64 %.9.i.i31, %written.i.i21
+  %.11.i.i33 = icmp sgt i64 %.9.i.i31, 0
+  br i1 %.11.i.i33, label %loop.i.i20, label %grammo_out_flush.exit.i23
+
+grammo_out_flush.exit.i23:                        ; preds = %body.i.i28, %loop.i.i20
+  %.10.b.i24 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i25 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i24, label %grammo_out_reserve.exit34, label %grow.i26
+
+grow.i26:                                         ; preds = %grammo_out_flush.exit.i23
+  %.16.i27 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i25, i64 65536)
+  store ptr %.16.i27, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit34
+
+grammo_out_reserve.exit34:                        ; preds = %grammo_out_advance.exit, %grammo_out_flush.exit.i23, %grow.i26
+  %.7.i35 = phi i64 [ 0, %grow.i26 ], [ 0, %grammo_out_flush.exit.i23 ], [ %.4.i11, %grammo_out_advance.exit ]
+  %.20.i18 = phi ptr [ %.16.i27, %grow.i26 ], [ %.20.pre.i25, %grammo_out_flush.exit.i23 ], [ %.20.pre1.i16, %grammo_out_advance.exit ]
+  %.22.i19 = getelementptr i8, ptr %.20.i18, i64 %.7.i35
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(20) %.22.i19, ptr noundef nonnull align 16 dereferenceable(20) @str_2, i64 20, i1 false)
+  %.8.i36 = add nsw i64 %.7.i35, 19
+  store i64 %.8.i36, ptr @grammo_out_len, align 8
+  %.2.i.i37 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i38 = icmp slt i32 %.2.i.i37, 0
+  br i1 %.3.i.i38, label %check.i.i55, label %grammo_out_interactive.exit.i39
+
+check.i.i55:                                      ; preds = %grammo_out_reserve.exit34
+  %.5.i.i56 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i56, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i39
+
+grammo_out_interactive.exit.i39:                  ; preds = %check.i.i55, %grammo_out_reserve.exit34
+  %.8.i.i40 = phi i32 [ %.5.i.i56, %check.i.i55 ], [ %.2.i.i37, %grammo_out_reserve.exit34 ]
+  %.9.i.i41 = icmp sgt i32 %.8.i.i40, 0
+  br i1 %.9.i.i41, label %flush.i42, label %while_body.preheader
+
+flush.i42:                                        ; preds = %grammo_out_interactive.exit.i39
+  %.2.i1.i43 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i44 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i45
+
+loop.i.i45:                                       ; preds = %body.i.i49, %flush.i42
+  %written.i.i46 = phi i64 [ 0, %flush.i42 ], [ %.10.i.i53, %body.i.i49 ]
+  %.5.i3.i47 = icmp slt i64 %written.i.i46, %.3.i2.i44
+  br i1 %.5.i3.i47, label %body.i.i49, label %grammo_out_flush.exit.i48
+
+body.i.i49:                                       ; preds = %loop.i.i45
+  %.7.i.i50 = getelementptr i8, ptr %.2.i1.i43, i64 %written.i.i46
+  %.8.i4.i51 = sub i64 %.3.i2.i44, %written.i.i46
+  %.9.i5.i52 = tail call i64 @write(i32 1, ptr %.7.i.i50, i64 %.8.i4.i51)
+  %.10.i.i53 = add i64 %.9.i5.i52, %written.i.i46
+  %.11.i.i54 = icmp sgt i64 %.9.i5.i52, 0
+  br i1 %.11.i.i54, label %loop.i.i45, label %grammo_out_flush.exit.i48
+
+grammo_out_flush.exit.i48:                        ; preds = %body.i.i49, %loop.i.i45
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %while_body.preheader
+
+while_body.preheader:                             ; preds = %grammo_out_interactive.exit.i39, %grammo_out_flush.exit.i48
   br label %while_body
 
-while_body:                                       ; preds = %entry, %calc.exit
-  %.25 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_5)
-  %.27 = call i32 (ptr, ...) @scanf(ptr nonnull @str_6, ptr nonnull %op)
-  %.30 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_7)
-  %.32 = call i32 (ptr, ...) @scanf(ptr nonnull @str_8, ptr nonnull %a)
-  %.35 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_9)
-  %.37 = call i32 (ptr, ...) @scanf(ptr nonnull @str_8, ptr nonnull %b)
-  %load_a = load double, ptr %a, align 8
-  %load_b = load double, ptr %b, align 8
-  %load_op = load i32, ptr %op, align 4
-  switch i32 %load_op, label %elif_1_next.i [
+while_body:                                       ; preds = %while_body.backedge, %while_body.preheader
+  %op.0380 = phi i32 [ 0, %while_body.preheader ], [ %op.1, %while_body.backedge ]
+  %b.0379 = phi double [ 0.000000e+00, %while_body.preheader ], [ %b.1, %while_body.backedge ]
+  %a.0378 = phi double [ 0.000000e+00, %while_body.preheader ], [ %a.1, %while_body.backedge ]
+  %.4.i58 = load i64, ptr @grammo_out_len, align 8
+  %.5.i59 = add i64 %.4.i58, 13
+  %.6.b.i60 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i61 = select i1 %.6.b.i60, i64 65536, i64 0
+  %.7.not.i62 = icmp ugt i64 %.5.i59, %.6.i61
+  %.20.pre1.i63 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i62, label %loop.i.i67, label %grammo_out_reserve.exit81
+
+loop.i.i67:                                       ; preds = %while_body, %body.i.i75
+  %written.i.i68 = phi i64 [ %.10.i.i79, %body.i.i75 ], [ 0, %while_body ]
+  %.5.i.i69 = icmp slt i64 %written.i.i68, %.4.i58
+  br i1 %.5.i.i69, label %body.i.i75, label %grammo_out_flush.exit.i70
+
+body.i.i75:                                       ; preds = %loop.i.i67
+  %.7.i.i76 = getelementptr i8, ptr %.20.pre1.i63, i64 %written.i.i68
+  %.8.i.i77 = sub i64 %.4.i58, %written.i.i68
+  %.9.i.i78 = tail call i64 @write(i32 1, ptr %.7.i.i76, i64 %.8.i.i77)
+  %.10.i.i79 = add i64 %.9.i.i78, %written.i.i68
+  %.11.i.i80 = icmp sgt i64 %.9.i.i78, 0
+  br i1 %.11.i.i80, label %loop.i.i67, label %grammo_out_flush.exit.i70
+
+grammo_out_flush.exit.i70:                        ; preds = %body.i.i75, %loop.i.i67
+  %.10.b.i71 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i72 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i71, label %grammo_out_reserve.exit81, label %grow.i73
+
+grow.i73:                                         ; preds = %grammo_out_flush.exit.i70
+  %.16.i74 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i72, i64 65536)
+  store ptr %.16.i74, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit81
+
+grammo_out_reserve.exit81:                        ; preds = %while_body, %grammo_out_flush.exit.i70, %grow.i73
+  %.7.i82 = phi i64 [ 0, %grow.i73 ], [ 0, %grammo_out_flush.exit.i70 ], [ %.4.i58, %while_body ]
+  %.20.i65 = phi ptr [ %.16.i74, %grow.i73 ], [ %.20.pre.i72, %grammo_out_flush.exit.i70 ], [ %.20.pre1.i63, %while_body ]
+  %.22.i66 = getelementptr i8, ptr %.20.i65, i64 %.7.i82
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(13) %.22.i66, ptr noundef nonnull align 1 dereferenceable(13) @str_3, i64 13, i1 false)
+  %.8.i83 = add nsw i64 %.7.i82, 12
+  store i64 %.8.i83, ptr @grammo_out_len, align 8
+  %.2.i.i84 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i85 = icmp slt i32 %.2.i.i84, 0
+  br i1 %.3.i.i85, label %check.i.i102, label %grammo_out_interactive.exit.i86
+
+check.i.i102:                                     ; preds = %grammo_out_reserve.exit81
+  %.5.i.i103 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i103, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i86
+
+grammo_out_interactive.exit.i86:                  ; preds = %check.i.i102, %grammo_out_reserve.exit81
+  %.8.i.i87 = phi i32 [ %.5.i.i103, %check.i.i102 ], [ %.2.i.i84, %grammo_out_reserve.exit81 ]
+  %.9.i.i88 = icmp sgt i32 %.8.i.i87, 0
+  br i1 %.9.i.i88, label %flush.i89, label %grammo_out_sync.exit
+
+flush.i89:                                        ; preds = %grammo_out_interactive.exit.i86
+  %.2.i1.i90 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i91 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i92
+
+loop.i.i92:                                       ; preds = %body.i.i96, %flush.i89
+  %written.i.i93 = phi i64 [ 0, %flush.i89 ], [ %.10.i.i100, %body.i.i96 ]
+  %.5.i3.i94 = icmp slt i64 %written.i.i93, %.3.i2.i91
+  br i1 %.5.i3.i94, label %body.i.i96, label %grammo_out_flush.exit.i95
+
+body.i.i96:                                       ; preds = %loop.i.i92
+  %.7.i.i97 = getelementptr i8, ptr %.2.i1.i90, i64 %written.i.i93
+  %.8.i4.i98 = sub i64 %.3.i2.i91, %written.i.i93
+  %.9.i5.i99 = tail call i64 @write(i32 1, ptr %.7.i.i97, i64 %.8.i4.i98)
+  %.10.i.i100 = add i64 %.9.i5.i99, %written.i.i93
+  %.11.i.i101 = icmp sgt i64 %.9.i5.i99, 0
+  br i1 %.11.i.i101, label %loop.i.i92, label %grammo_out_flush.exit.i95
+
+grammo_out_flush.exit.i95:                        ; preds = %body.i.i96, %loop.i.i92
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit
+
+grammo_out_sync.exit:                             ; preds = %grammo_out_interactive.exit.i86, %grammo_out_flush.exit.i95
+  %.3.i = tail call fastcc i64 @grammo_in_token()
+  %.4.i104 = load ptr, ptr @grammo_in_buf, align 8
+  %.5.i105 = load i64, ptr @grammo_in_pos, align 8
+  %.6.i106 = getelementptr i8, ptr %.4.i104, i64 %.5.i105
+  %.7.i107 = load i8, ptr %.6.i106, align 1
+  %.8.i108 = icmp eq i8 %.7.i107, 45
+  %.9.i = icmp eq i8 %.7.i107, 43
+  %.10.i = or i1 %.8.i108, %.9.i
+  %.11.i = zext i1 %.10.i to i64
+  %.131.i = icmp ugt i64 %.3.i, %.11.i
+  %.142.i = getelementptr i8, ptr %.6.i106, i64 %.11.i
+  %.153.i = load i8, ptr %.142.i, align 1
+  %.164.i = add i8 %.153.i, -48
+  %.175.i = icmp ult i8 %.164.i, 10
+  %.186.i = and i1 %.175.i, %.131.i
+  br i1 %.186.i, label %digit.i, label %grammo_in_read_int.exit
+
+digit.i:                                          ; preds = %grammo_out_sync.exit, %digit.i
+  %.169.i = phi i8 [ %.16.i112, %digit.i ], [ %.164.i, %grammo_out_sync.exit ]
+  %value8.i = phi i32 [ %.23.i, %digit.i ], [ 0, %grammo_out_sync.exit ]
+  %i7.i = phi i64 [ %.20.i109, %digit.i ], [ %.11.i, %grammo_out_sync.exit ]
+  %.20.i109 = add nuw i64 %i7.i, 1
+  %.21.i110 = mul i32 %value8.i, 10
+  %.22.i111 = zext nneg i8 %.169.i to i32
+  %.23.i = add i32 %.21.i110, %.22.i111
+  %.13.i = icmp ult i64 %.20.i109, %.3.i
+  %.14.i = getelementptr i8, ptr %.6.i106, i64 %.20.i109
+  %.15.i = load i8, ptr %.14.i, align 1
+  %.16.i112 = add i8 %.15.i, -48
+  %.17.i = icmp ult i8 %.16.i112, 10
+  %.18.i = and i1 %.13.i, %.17.i
+  br i1 %.18.i, label %digit.i, label %end_digits.i
+
+end_digits.i:                                     ; preds = %digit.i
+  %.25.not.i = icmp ult i64 %i7.i, %.11.i
+  br i1 %.25.not.i, label %grammo_in_read_int.exit, label %store.i
+
+store.i:                                          ; preds = %end_digits.i
+  %.27.i = sub i32 0, %.23.i
+  %.28.i = select i1 %.8.i108, i32 %.27.i, i32 %.23.i
+  %.31.i = add i64 %.20.i109, %.5.i105
+  store i64 %.31.i, ptr @grammo_in_pos, align 8
+  br label %grammo_in_read_int.exit
+
+grammo_in_read_int.exit:                          ; preds = %grammo_out_sync.exit, %end_digits.i, %store.i
+  %op.1 = phi i32 [ %op.0380, %end_digits.i ], [ %.28.i, %store.i ], [ %op.0380, %grammo_out_sync.exit ]
+  %.4.i113 = load i64, ptr @grammo_out_len, align 8
+  %.5.i114 = add i64 %.4.i113, 4
+  %.6.b.i115 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i116 = select i1 %.6.b.i115, i64 65536, i64 0
+  %.7.not.i117 = icmp ugt i64 %.5.i114, %.6.i116
+  %.20.pre1.i118 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i117, label %loop.i.i122, label %grammo_out_reserve.exit136
+
+loop.i.i122:                                      ; preds = %grammo_in_read_int.exit, %body.i.i130
+  %written.i.i123 = phi i64 [ %.10.i.i134, %body.i.i130 ], [ 0, %grammo_in_read_int.exit ]
+  %.5.i.i124 = icmp slt i64 %written.i.i123, %.4.i113
+  br i1 %.5.i.i124, label %body.i.i130, label %grammo_out_flush.exit.i125
+
+body.i.i130:                                      ; preds = %loop.i.i122
+  %.7.i.i131 = getelementptr i8, ptr %.20.pre1.i118, i64 %written.i.i123
+  %.8.i.i132 = sub i64 %.4.i113, %written.i.i123
+  %.9.i.i133 = tail call i64 @write(i32 1, ptr %.7.i.i131, i64 %.8.i.i132)
+  %.10.i.i134 = add i64 %.9.i.i133, %written.i.i123
+  %.11.i.i135 = icmp sgt i64 %.9.i.i133, 0
+  br i1 %.11.i.i135, label %loop.i.i122, label %grammo_out_flush.exit.i125
+
+grammo_out_flush.exit.i125:                       ; preds = %body.i.i130, %loop.i.i122
+  %.10.b.i126 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i127 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i126, label %grammo_out_reserve.exit136, label %grow.i128
+
+grow.i128:                                        ; preds = %grammo_out_flush.exit.i125
+  %.16.i129 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i127, i64 65536)
+  store ptr %.16.i129, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit136
+
+grammo_out_reserve.exit136:                       ; preds = %grammo_in_read_int.exit, %grammo_out_flush.exit.i125, %grow.i128
+  %.7.i137 = phi i64 [ 0, %grow.i128 ], [ 0, %grammo_out_flush.exit.i125 ], [ %.4.i113, %grammo_in_read_int.exit ]
+  %.20.i120 = phi ptr [ %.16.i129, %grow.i128 ], [ %.20.pre.i127, %grammo_out_flush.exit.i125 ], [ %.20.pre1.i118, %grammo_in_read_int.exit ]
+  %.22.i121 = getelementptr i8, ptr %.20.i120, i64 %.7.i137
+  store i32 2112065, ptr %.22.i121, align 1
+  %.8.i138 = add nsw i64 %.7.i137, 3
+  store i64 %.8.i138, ptr @grammo_out_len, align 8
+  %.2.i.i139 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i140 = icmp slt i32 %.2.i.i139, 0
+  br i1 %.3.i.i140, label %check.i.i157, label %grammo_out_interactive.exit.i141
+
+check.i.i157:                                     ; preds = %grammo_out_reserve.exit136
+  %.5.i.i158 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i158, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i141
+
+grammo_out_interactive.exit.i141:                 ; preds = %check.i.i157, %grammo_out_reserve.exit136
+  %.8.i.i142 = phi i32 [ %.5.i.i158, %check.i.i157 ], [ %.2.i.i139, %grammo_out_reserve.exit136 ]
+  %.9.i.i143 = icmp sgt i32 %.8.i.i142, 0
+  br i1 %.9.i.i143, label %flush.i144, label %grammo_out_sync.exit159
+
+flush.i144:                                       ; preds = %grammo_out_interactive.exit.i141
+  %.2.i1.i145 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i146 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i147
+
+loop.i.i147:                                      ; preds = %body.i.i151, %flush.i144
+  %written.i.i148 = phi i64 [ 0, %flush.i144 ], [ %.10.i.i155, %body.i.i151 ]
+  %.5.i3.i149 = icmp slt i64 %written.i.i148, %.3.i2.i146
+  br i1 %.5.i3.i149, label %body.i.i151, label %grammo_out_flush.exit.i150
+
+body.i.i151:                                      ; preds = %loop.i.i147
+  %.7.i.i152 = getelementptr i8, ptr %.2.i1.i145, i64 %written.i.i148
+  %.8.i4.i153 = sub i64 %.3.i2.i146, %written.i.i148
+  %.9.i5.i154 = tail call i64 @write(i32 1, ptr %.7.i.i152, i64 %.8.i4.i153)
+  %.10.i.i155 = add i64 %.9.i5.i154, %written.i.i148
+  %.11.i.i156 = icmp sgt i64 %.9.i5.i154, 0
+  br i1 %.11.i.i156, label %loop.i.i147, label %grammo_out_flush.exit.i150
+
+grammo_out_flush.exit.i150:                       ; preds = %body.i.i151, %loop.i.i147
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit159
+
+grammo_out_sync.exit159:                          ; preds = %grammo_out_interactive.exit.i141, %grammo_out_flush.exit.i150
+  call void @llvm.lifetime.start.p0(i64 8, ptr nonnull %end.i)
+  %.3.i160 = tail call fastcc i64 @grammo_in_token()
+  %.4.i161 = load ptr, ptr @grammo_in_buf, align 8
+  %.5.i162 = load i64, ptr @grammo_in_pos, align 8
+  %.6.i163 = getelementptr i8, ptr %.4.i161, i64 %.5.i162
+  %.7.i164 = call double @strtod(ptr %.6.i163, ptr nonnull %end.i)
+  %.8.i165 = load ptr, ptr %end.i, align 8
+  %.9.i166 = ptrtoint ptr %.8.i165 to i64
+  %.10.i167 = ptrtoint ptr %.6.i163 to i64
+  %.11.i168 = sub i64 %.9.i166, %.10.i167
+  %.12.i = icmp sgt i64 %.11.i168, 0
+  br i1 %.12.i, label %store.i169, label %grammo_in_read_real.exit
+
+store.i169:                                       ; preds = %grammo_out_sync.exit159
+  %.15.i170 = load i64, ptr @grammo_in_pos, align 8
+  %.16.i171 = add i64 %.15.i170, %.11.i168
+  store i64 %.16.i171, ptr @grammo_in_pos, align 8
+  br label %grammo_in_read_real.exit
+
+grammo_in_read_real.exit:                         ; preds = %grammo_out_sync.exit159, %store.i169
+  %a.1 = phi double [ %.7.i164, %store.i169 ], [ %a.0378, %grammo_out_sync.exit159 ]
+  call void @llvm.lifetime.end.p0(i64 8, ptr nonnull %end.i)
+  %.4.i172 = load i64, ptr @grammo_out_len, align 8
+  %.5.i173 = add i64 %.4.i172, 4
+  %.6.b.i174 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i175 = select i1 %.6.b.i174, i64 65536, i64 0
+  %.7.not.i176 = icmp ugt i64 %.5.i173, %.6.i175
+  %.20.pre1.i177 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i176, label %loop.i.i181, label %grammo_out_reserve.exit195
+
+loop.i.i181:                                      ; preds = %grammo_in_read_real.exit, %body.i.i189
+  %written.i.i182 = phi i64 [ %.10.i.i193, %body.i.i189 ], [ 0, %grammo_in_read_real.exit ]
+  %.5.i.i183 = icmp slt i64 %written.i.i182, %.4.i172
+  br i1 %.5.i.i183, label %body.i.i189, label %grammo_out_flush.exit.i184
+
+body.i.i189:                                      ; preds = %loop.i.i181
+  %.7.i.i190 = getelementptr i8, ptr %.20.pre1.i177, i64 %written.i.i182
+  %.8.i.i191 = sub i64 %.4.i172, %written.i.i182
+  %.9.i.i192 = tail call i64 @write(i32 1, ptr %.7.i.i190, i64 %.8.i.i191)
+  %.10.i.i193 = add i64 %.9.i.i192, %written.i.i182
+  %.11.i.i194 = icmp sgt i64 %.9.i.i192, 0
+  br i1 %.11.i.i194, label %loop.i.i181, label %grammo_out_flush.exit.i184
+
+grammo_out_flush.exit.i184:                       ; preds = %body.i.i189, %loop.i.i181
+  %.10.b.i185 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i186 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i185, label %grammo_out_reserve.exit195, label %grow.i187
+
+grow.i187:                                        ; preds = %grammo_out_flush.exit.i184
+  %.16.i188 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i186, i64 65536)
+  store ptr %.16.i188, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit195
+
+grammo_out_reserve.exit195:                       ; preds = %grammo_in_read_real.exit, %grammo_out_flush.exit.i184, %grow.i187
+  %.7.i196 = phi i64 [ 0, %grow.i187 ], [ 0, %grammo_out_flush.exit.i184 ], [ %.4.i172, %grammo_in_read_real.exit ]
+  %.20.i179 = phi ptr [ %.16.i188, %grow.i187 ], [ %.20.pre.i186, %grammo_out_flush.exit.i184 ], [ %.20.pre1.i177, %grammo_in_read_real.exit ]
+  %.22.i180 = getelementptr i8, ptr %.20.i179, i64 %.7.i196
+  store i32 2112066, ptr %.22.i180, align 1
+  %.8.i197 = add nsw i64 %.7.i196, 3
+  store i64 %.8.i197, ptr @grammo_out_len, align 8
+  %.2.i.i198 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i199 = icmp slt i32 %.2.i.i198, 0
+  br i1 %.3.i.i199, label %check.i.i216, label %grammo_out_interactive.exit.i200
+
+check.i.i216:                                     ; preds = %grammo_out_reserve.exit195
+  %.5.i.i217 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i217, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i200
+
+grammo_out_interactive.exit.i200:                 ; preds = %check.i.i216, %grammo_out_reserve.exit195
+  %.8.i.i201 = phi i32 [ %.5.i.i217, %check.i.i216 ], [ %.2.i.i198, %grammo_out_reserve.exit195 ]
+  %.9.i.i202 = icmp sgt i32 %.8.i.i201, 0
+  br i1 %.9.i.i202, label %flush.i203, label %grammo_out_sync.exit218
+
+flush.i203:                                       ; preds = %grammo_out_interactive.exit.i200
+  %.2.i1.i204 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i205 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i206
+
+loop.i.i206:                                      ; preds = %body.i.i210, %flush.i203
+  %written.i.i207 = phi i64 [ 0, %flush.i203 ], [ %.10.i.i214, %body.i.i210 ]
+  %.5.i3.i208 = icmp slt i64 %written.i.i207, %.3.i2.i205
+  br i1 %.5.i3.i208, label %body.i.i210, label %grammo_out_flush.exit.i209
+
+body.i.i210:                                      ; preds = %loop.i.i206
+  %.7.i.i211 = getelementptr i8, ptr %.2.i1.i204, i64 %written.i.i207
+  %.8.i4.i212 = sub i64 %.3.i2.i205, %written.i.i207
+  %.9.i5.i213 = tail call i64 @write(i32 1, ptr %.7.i.i211, i64 %.8.i4.i212)
+  %.10.i.i214 = add i64 %.9.i5.i213, %written.i.i207
+  %.11.i.i215 = icmp sgt i64 %.9.i5.i213, 0
+  br i1 %.11.i.i215, label %loop.i.i206, label %grammo_out_flush.exit.i209
+
+grammo_out_flush.exit.i209:                       ; preds = %body.i.i210, %loop.i.i206
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit218
+
+grammo_out_sync.exit218:                          ; preds = %grammo_out_interactive.exit.i200, %grammo_out_flush.exit.i209
+  call void @llvm.lifetime.start.p0(i64 8, ptr nonnull %end.i223)
+  %.3.i219 = tail call fastcc i64 @grammo_in_token()
+  %.4.i220 = load ptr, ptr @grammo_in_buf, align 8
+  %.5.i221 = load i64, ptr @grammo_in_pos, align 8
+  %.6.i222 = getelementptr i8, ptr %.4.i220, i64 %.5.i221
+  %.7.i224 = call double @strtod(ptr %.6.i222, ptr nonnull %end.i223)
+  %.8.i225 = load ptr, ptr %end.i223, align 8
+  %.9.i226 = ptrtoint ptr %.8.i225 to i64
+  %.10.i227 = ptrtoint ptr %.6.i222 to i64
+  %.11.i228 = sub i64 %.9.i226, %.10.i227
+  %.12.i229 = icmp sgt i64 %.11.i228, 0
+  br i1 %.12.i229, label %store.i230, label %grammo_in_read_real.exit233
+
+store.i230:                                       ; preds = %grammo_out_sync.exit218
+  %.15.i231 = load i64, ptr @grammo_in_pos, align 8
+  %.16.i232 = add i64 %.15.i231, %.11.i228
+  store i64 %.16.i232, ptr @grammo_in_pos, align 8
+  br label %grammo_in_read_real.exit233
+
+grammo_in_read_real.exit233:                      ; preds = %grammo_out_sync.exit218, %store.i230
+  %b.1 = phi double [ %.7.i224, %store.i230 ], [ %b.0379, %grammo_out_sync.exit218 ]
+  call void @llvm.lifetime.end.p0(i64 8, ptr nonnull %end.i223)
+  switch i32 %op.1, label %elif_1_next.i [
     i32 1, label %if_then.i
     i32 2, label %elif_0_then.i
     i32 3, label %elif_1_then.i
   ]
 
-if_then.i:                                        ; preds = %while_body
-  %.9.i = fadd double %load_a, %load_b
-  br label %calc.exit
+if_then.i:                                        ; preds = %grammo_in_read_real.exit233
+  %.9.i236 = fadd double %a.1, %b.1
+  br label %g.calc.exit
 
-elif_0_then.i:                                    ; preds = %while_body
-  %.13.i = fsub double %load_a, %load_b
-  br label %calc.exit
+elif_0_then.i:                                    ; preds = %grammo_in_read_real.exit233
+  %.13.i235 = fsub double %a.1, %b.1
+  br label %g.calc.exit
 
-elif_1_then.i:                                    ; preds = %while_body
-  %.17.i = fmul double %load_a, %load_b
-  br label %calc.exit
+elif_1_then.i:                                    ; preds = %grammo_in_read_real.exit233
+  %.17.i234 = fmul double %a.1, %b.1
+  br label %g.calc.exit
 
-elif_1_next.i:                                    ; preds = %while_body
-  %.19.i = fcmp oeq double %load_b, 0.000000e+00
+elif_1_next.i:                                    ; preds = %grammo_in_read_real.exit233
+  %.19.i = fcmp oeq double %b.1, 0.000000e+00
   br i1 %.19.i, label %if_then.1.i, label %next_branch.1.i
 
 if_then.1.i:                                      ; preds = %elif_1_next.i
-  %.22.i = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_0)
-  %putchar.i = call i32 @putchar(i32 10)
-  br label %calc.exit
+  %.4.i.i = load i64, ptr @grammo_out_len, align 8
+  %.5.i.i237 = add i64 %.4.i.i, 28
+  %.6.b.i.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i.i = select i1 %.6.b.i.i, i64 65536, i64 0
+  %.7.not.i.i = icmp ugt i64 %.5.i.i237, %.6.i.i
+  %.20.pre1.i.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i.i, label %loop.i.i.i, label %grammo_out_reserve.exit.i
+
+loop.i.i.i:                                       ; preds = %if_then.1.i, %body.i.i.i
+  %written.i.i.i = phi i64 [ %.10.i.i.i, %body.i.i.i ], [ 0, %if_then.1.i ]
+  %.5.i.i.i = icmp slt i64 %written.i.i.i, %.4.i.i
+  br i1 %.5.i.i.i, label %body.i.i.i, label %grammo_out_flush.exit.i.i
+
+body.i.i.i:                                       ; preds = %loop.i.i.i
+  %.7.i.i.i = getelementptr i8, ptr %.20.pre1.i.i, i64 %written.i.i.i
+  %.8.i.i.i = sub i64 %.4.i.i, %written.i.i.i
+  %.9.i.i.i = tail call i64 @write(i32 1, ptr %.7.i.i.i, i64 %.8.i.i.i)
+  %.10.i.i.i = add i64 %.9.i.i.i, %written.i.i.i
+  %.11.i.i.i = icmp sgt i64 %.9.i.i.i, 0
+  br i1 %.11.i.i.i, label %loop.i.i.i, label %grammo_out_flush.exit.i.i
+
+grammo_out_flush.exit.i.i:                        ; preds = %body.i.i.i, %loop.i.i.i
+  %.10.b.i.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i.i, label %grammo_out_reserve.exit.i, label %grow.i.i
+
+grow.i.i:                                         ; preds = %grammo_out_flush.exit.i.i
+  %.16.i.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i.i, i64 65536)
+  store ptr %.16.i.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit.i
+
+grammo_out_reserve.exit.i:                        ; preds = %grow.i.i, %grammo_out_flush.exit.i.i, %if_then.1.i
+  %.7.i.i238 = phi i64 [ 0, %grow.i.i ], [ 0, %grammo_out_flush.exit.i.i ], [ %.4.i.i, %if_then.1.i ]
+  %.20.i.i = phi ptr [ %.16.i.i, %grow.i.i ], [ %.20.pre.i.i, %grammo_out_flush.exit.i.i ], [ %.20.pre1.i.i, %if_then.1.i ]
+  %.22.i.i = getelementptr i8, ptr %.20.i.i, i64 %.7.i.i238
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(28) %.22.i.i, ptr noundef nonnull align 16 dereferenceable(28) @str_0, i64 28, i1 false)
+  %.8.i.i239 = add nsw i64 %.7.i.i238, 27
+  store i64 %.8.i.i239, ptr @grammo_out_len, align 8
+  %.2.i.i.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i.i = icmp slt i32 %.2.i.i.i, 0
+  br i1 %.3.i.i.i, label %check.i.i.i, label %grammo_out_interactive.exit.i.i
+
+check.i.i.i:                                      ; preds = %grammo_out_reserve.exit.i
+  %.5.i.i12.i = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i12.i, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i.i
+
+grammo_out_interactive.exit.i.i:                  ; preds = %check.i.i.i, %grammo_out_reserve.exit.i
+  %.8.i.i3.i = phi i32 [ %.5.i.i12.i, %check.i.i.i ], [ %.2.i.i.i, %grammo_out_reserve.exit.i ]
+  %.9.i.i4.i = icmp sgt i32 %.8.i.i3.i, 0
+  br i1 %.9.i.i4.i, label %flush.i.i, label %g.calc.exit
+
+flush.i.i:                                        ; preds = %grammo_out_interactive.exit.i.i
+  %.2.i1.i.i = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i.i = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i5.i
+
+loop.i.i5.i:                                      ; preds = %body.i.i8.i, %flush.i.i
+  %written.i.i6.i = phi i64 [ 0, %flush.i.i ], [ %.10.i.i10.i, %body.i.i8.i ]
+  %.5.i3.i.i = icmp slt i64 %written.i.i6.i, %.3.i2.i.i
+  br i1 %.5.i3.i.i, label %body.i.i8.i, label %grammo_out_flush.exit.i7.i
+
+body.i.i8.i:                                      ; preds = %loop.i.i5.i
+  %.7.i.i9.i = getelementptr i8, ptr %.2.i1.i.i, i64 %written.i.i6.i
+  %.8.i4.i.i = sub i64 %.3.i2.i.i, %written.i.i6.i
+  %.9.i5.i.i = tail call i64 @write(i32 1, ptr %.7.i.i9.i, i64 %.8.i4.i.i)
+  %.10.i.i10.i = add i64 %.9.i5.i.i, %written.i.i6.i
+  %.11.i.i11.i = icmp sgt i64 %.9.i5.i.i, 0
+  br i1 %.11.i.i11.i, label %loop.i.i5.i, label %grammo_out_flush.exit.i7.i
+
+grammo_out_flush.exit.i7.i:                       ; preds = %body.i.i8.i, %loop.i.i5.i
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %g.calc.exit
 
 next_branch.1.i:                                  ; preds = %elif_1_next.i
-  %.27.i = fdiv double %load_a, %load_b
-  br label %calc.exit
-
-calc.exit:                                        ; preds = %if_then.i, %elif_0_then.i, %elif_1_then.i, %if_then.1.i, %next_branch.1.i
-  %common.ret.op.i = phi double [ %.9.i, %if_then.i ], [ %.13.i, %elif_0_then.i ], [ %.17.i, %elif_1_then.i ], [ 0.000000e+00, %if_then.1.i ], [ %.27.i, %next_branch.1.i ]
-  %.42 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_10)
-  %.44 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_11, double %common.ret.op.i)
-  %putchar2 = call i32 @putchar(i32 10)
-  %.50 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_12)
-  %.52 = call i32 (ptr, ...) @scanf(ptr nonnull @str_6, ptr nonnull %cont)
-  %load_cont.pr = load i32, ptr %cont, align 4
-  %.21 = icmp eq i32 %load_cont.pr, 1
-  br i1 %.21, label %while_body, label %while_end
-
-while_end:                                        ; preds = %calc.exit
+  %.26.i = fdiv double %a.1, %b.1
+  br label %g.calc.exit
+
+g.calc.exit:                                      ; preds = %if_then.i, %elif_0_then.i, %elif_1_then.i, %grammo_out_interactive.exit.i.i, %grammo_out_flush.exit.i7.i, %next_branch.1.i
+  %common.ret.op.i = phi double [ %.9.i236, %if_then.i ], [ %.13.i235, %elif_0_then.i ], [ %.17.i234, %elif_1_then.i ], [ %.26.i, %next_branch.1.i ], [ 0.000000e+00, %grammo_out_interactive.exit.i.i ], [ 0.000000e+00, %grammo_out_flush.exit.i7.i ]
+  %.4.i240 = load i64, ptr @grammo_out_len, align 8
+  %.5.i241 = add i64 %.4.i240, 332
+  %.6.b.i242 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i243 = select i1 %.6.b.i242, i64 65536, i64 0
+  %.7.not.i244 = icmp ugt i64 %.5.i241, %.6.i243
+  %.20.pre1.i245 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i244, label %loop.i.i249, label %grammo_out_reserve.exit263
+
+loop.i.i249:                                      ; preds = %g.calc.exit, %body.i.i257
+  %written.i.i250 = phi i64 [ %.10.i.i261, %body.i.i257 ], [ 0, %g.calc.exit ]
+  %.5.i.i251 = icmp slt i64 %written.i.i250, %.4.i240
+  br i1 %.5.i.i251, label %body.i.i257, label %grammo_out_flush.exit.i252
+
+body.i.i257:                                      ; preds = %loop.i.i249
+  %.7.i.i258 = getelementptr i8, ptr %.20.pre1.i245, i64 %written.i.i250
+  %.8.i.i259 = sub i64 %.4.i240, %written.i.i250
+  %.9.i.i260 = tail call i64 @write(i32 1, ptr %.7.i.i258, i64 %.8.i.i259)
+  %.10.i.i261 = add i64 %.9.i.i260, %written.i.i250
+  %.11.i.i262 = icmp sgt i64 %.9.i.i260, 0
+  br i1 %.11.i.i262, label %loop.i.i249, label %grammo_out_flush.exit.i252
+
+grammo_out_flush.exit.i252:                       ; preds = %body.i.i257, %loop.i.i249
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i253 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i254 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i253, label %grammo_out_reserve.exit263, label %grow.i255
+
+grow.i255:                                        ; preds = %grammo_out_flush.exit.i252
+  %.16.i256 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i254, i64 65536)
+  store ptr %.16.i256, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit263
+
+grammo_out_reserve.exit263:                       ; preds = %g.calc.exit, %grammo_out_flush.exit.i252, %grow.i255
+  %.21.i246 = phi i64 [ 0, %grow.i255 ], [ 0, %grammo_out_flush.exit.i252 ], [ %.4.i240, %g.calc.exit ]
+  %.20.i247 = phi ptr [ %.16.i256, %grow.i255 ], [ %.20.pre.i254, %grammo_out_flush.exit.i252 ], [ %.20.pre1.i245, %g.calc.exit ]
+  %.22.i248 = getelementptr i8, ptr %.20.i247, i64 %.21.i246
+  %.47 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i248, i64 332, ptr nonnull @str_6, double %common.ret.op.i)
+  %0 = tail call i32 @llvm.smax.i32(i32 %.47, i32 0)
+  %.6.i264 = zext nneg i32 %0 to i64
+  %.7.i265 = load i64, ptr @grammo_out_len, align 8
+  %.8.i266 = add i64 %.7.i265, %.6.i264
+  store i64 %.8.i266, ptr @grammo_out_len, align 8
+  %.2.i.i267 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i268 = icmp slt i32 %.2.i.i267, 0
+  br i1 %.3.i.i268, label %check.i.i285, label %grammo_out_interactive.exit.i269
+
+check.i.i285:                                     ; preds = %grammo_out_reserve.exit263
+  %.5.i.i286 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i286, ptr @grammo_out_tty, align 4
+  %.4.i288.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i269
+
+grammo_out_interactive.exit.i269:                 ; preds = %check.i.i285, %grammo_out_reserve.exit263
+  %.4.i288.pre = phi i64 [ %.4.i288.pre.pre, %check.i.i285 ], [ %.8.i266, %grammo_out_reserve.exit263 ]
+  %.8.i.i270 = phi i32 [ %.5.i.i286, %check.i.i285 ], [ %.2.i.i267, %grammo_out_reserve.exit263 ]
+  %.9.i.i271 = icmp sgt i32 %.8.i.i270, 0
+  %.20.pre1.i293.pre386 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i271, label %loop.i.i275, label %grammo_out_advance.exit287
+
+loop.i.i275:                                      ; preds = %grammo_out_interactive.exit.i269, %body.i.i279
+  %written.i.i276 = phi i64 [ %.10.i.i283, %body.i.i279 ], [ 0, %grammo_out_interactive.exit.i269 ]
+  %.5.i3.i277 = icmp slt i64 %written.i.i276, %.4.i288.pre
+  br i1 %.5.i3.i277, label %body.i.i279, label %grammo_out_flush.exit.i278
+
+body.i.i279:                                      ; preds = %loop.i.i275
+  %.7.i.i280 = getelementptr i8, ptr %.20.pre1.i293.pre386, i64 %written.i.i276
+  %.8.i4.i281 = sub i64 %.4.i288.pre, %written.i.i276
+  %.9.i5.i282 = tail call i64 @write(i32 1, ptr %.7.i.i280, i64 %.8.i4.i281)
+  %.10.i.i283 = add i64 %.9.i5.i282, %written.i.i276
+  %.11.i.i284 = icmp sgt i64 %.9.i5.i282, 0
+  br i1 %.11.i.i284, label %loop.i.i275, label %grammo_out_flush.exit.i278
+
+grammo_out_flush.exit.i278:                       ; preds = %body.i.i279, %loop.i.i275
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i293.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit287
+
+grammo_out_advance.exit287:                       ; preds = %grammo_out_interactive.exit.i269, %grammo_out_flush.exit.i278
+  %.20.pre1.i293 = phi ptr [ %.20.pre1.i293.pre386, %grammo_out_interactive.exit.i269 ], [ %.20.pre1.i293.pre, %grammo_out_flush.exit.i278 ]
+  %.4.i288 = phi i64 [ %.4.i288.pre, %grammo_out_interactive.exit.i269 ], [ 0, %grammo_out_flush.exit.i278 ]
+  %.5.i289 = add i64 %.4.i288, 46
+  %.6.b.i290 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i291 = select i1 %.6.b.i290, i64 65536, i64 0
+  %.7.not.i292 = icmp ugt i64 %.5.i289, %.6.i291
+  br i1 %.7.not.i292, label %loop.i.i297, label %grammo_out_reserve.exit311
+
+loop.i.i297:                                      ; preds = %grammo_out_advance.exit287, %body.i.i305
+  %written.i.i298 = phi i64 [ %.10.i.i309, %body.i.i305 ], [ 0, %grammo_out_advance.exit287 ]
+  %.5.i.i299 = icmp slt i64 %written.i.i298, %.4.i288
+  br i1 %.5.i.i299, label %body.i.i305, label %grammo_out_flush.exit.i300
+
+body.i.i305:                                      ; preds = %loop.i.i297
+  %.7.i.i306 = getelementptr i8, ptr %.20.pre1.i293, i64 %written.i.i298
+  %.8.i.i307 = sub i64 %.4.i288, %written.i.i298
+  %.9.i.i308 = tail call i64 @write(i32 1, ptr %.7.i.i306, i64 %.8.i.i307)
+  %.10.i.i309 = add i64 %.9.i.i308, %written.i.i298
+  %.11.i.i310 = icmp sgt i64 %.9.i.i308, 0
+  br i1 %.11.i.i310, label %loop.i.i297, label %grammo_out_flush.exit.i300
+
+grammo_out_flush.exit.i300:                       ; preds = %body.i.i305, %loop.i.i297
+  %.10.b.i301 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i302 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i301, label %grammo_out_reserve.exit311, label %grow.i303
+
+grow.i303:                                        ; preds = %grammo_out_flush.exit.i300
+  %.16.i304 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i302, i64 65536)
+  store ptr %.16.i304, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit311
+
+grammo_out_reserve.exit311:                       ; preds = %grammo_out_advance.exit287, %grammo_out_flush.exit.i300, %grow.i303
+  %.7.i312 = phi i64 [ 0, %grow.i303 ], [ 0, %grammo_out_flush.exit.i300 ], [ %.4.i288, %grammo_out_advance.exit287 ]
+  %.20.i295 = phi ptr [ %.16.i304, %grow.i303 ], [ %.20.pre.i302, %grammo_out_flush.exit.i300 ], [ %.20.pre1.i293, %grammo_out_advance.exit287 ]
+  %.22.i296 = getelementptr i8, ptr %.20.i295, i64 %.7.i312
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(46) %.22.i296, ptr noundef nonnull align 16 dereferenceable(46) @str_7, i64 46, i1 false)
+  %.8.i313 = add nsw i64 %.7.i312, 45
+  store i64 %.8.i313, ptr @grammo_out_len, align 8
+  %.2.i.i314 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i315 = icmp slt i32 %.2.i.i314, 0
+  br i1 %.3.i.i315, label %check.i.i332, label %grammo_out_interactive.exit.i316
+
+check.i.i332:                                     ; preds = %grammo_out_reserve.exit311
+  %.5.i.i333 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i333, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i316
+
+grammo_out_interactive.exit.i316:                 ; preds = %check.i.i332, %grammo_out_reserve.exit311
+  %.8.i.i317 = phi i32 [ %.5.i.i333, %check.i.i332 ], [ %.2.i.i314, %grammo_out_reserve.exit311 ]
+  %.9.i.i318 = icmp sgt i32 %.8.i.i317, 0
+  br i1 %.9.i.i318, label %flush.i319, label %grammo_out_sync.exit334
+
+flush.i319:                                       ; preds = %grammo_out_interactive.exit.i316
+  %.2.i1.i320 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i321 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i322
+
+loop.i.i322:                                      ; preds = %body.i.i326, %flush.i319
+  %written.i.i323 = phi i64 [ 0, %flush.i319 ], [ %.10.i.i330, %body.i.i326 ]
+  %.5.i3.i324 = icmp slt i64 %written.i.i323, %.3.i2.i321
+  br i1 %.5.i3.i324, label %body.i.i326, label %grammo_out_flush.exit.i325
+
+body.i.i326:                                      ; preds = %loop.i.i322
+  %.7.i.i327 = getelementptr i8, ptr %.2.i1.i320, i64 %written.i.i323
+  %.8.i4.i328 = sub i64 %.3.i2.i321, %written.i.i323
+  %.9.i5.i329 = tail call i64 @write(i32 1, ptr %.7.i.i327, i64 %.8.i4.i328)
+  %.10.i.i330 = add i64 %.9.i5.i329, %written.i.i323
+  %.11.i.i331 = icmp sgt i64 %.9.i5.i329, 0
+  br i1 %.11.i.i331, label %loop.i.i322, label %grammo_out_flush.exit.i325
+
+grammo_out_flush.exit.i325:                       ; preds = %body.i.i326, %loop.i.i322
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit334
+
+grammo_out_sync.exit334:                          ; preds = %grammo_out_interactive.exit.i316, %grammo_out_flush.exit.i325
+  %.3.i335 = tail call fastcc i64 @grammo_in_token()
+  %.4.i336 = load ptr, ptr @grammo_in_buf, align 8
+  %.5.i337 = load i64, ptr @grammo_in_pos, align 8
+  %.6.i338 = getelementptr i8, ptr %.4.i336, i64 %.5.i337
+  %.7.i339 = load i8, ptr %.6.i338, align 1
+  %.8.i340 = icmp eq i8 %.7.i339, 45
+  %.9.i341 = icmp eq i8 %.7.i339, 43
+  %.10.i342 = or i1 %.8.i340, %.9.i341
+  %.11.i343 = zext i1 %.10.i342 to i64
+  %.131.i344 = icmp ugt i64 %.3.i335, %.11.i343
+  %.142.i345 = getelementptr i8, ptr %.6.i338, i64 %.11.i343
+  %.153.i346 = load i8, ptr %.142.i345, align 1
+  %.164.i347 = add i8 %.153.i346, -48
+  %.175.i348 = icmp ult i8 %.164.i347, 10
+  %.186.i349 = and i1 %.175.i348, %.131.i344
+  br i1 %.186.i349, label %digit.i350, label %while_body.backedge
+
+digit.i350:                                       ; preds = %grammo_out_sync.exit334, %digit.i350
+  %.169.i351 = phi i8 [ %.16.i361, %digit.i350 ], [ %.164.i347, %grammo_out_sync.exit334 ]
+  %value8.i352 = phi i32 [ %.23.i357, %digit.i350 ], [ 0, %grammo_out_sync.exit334 ]
+  %i7.i353 = phi i64 [ %.20.i354, %digit.i350 ], [ %.11.i343, %grammo_out_sync.exit334 ]
+  %.20.i354 = add nuw i64 %i7.i353, 1
+  %.21.i355 = mul i32 %value8.i352, 10
+  %.22.i356 = zext nneg i8 %.169.i351 to i32
+  %.23.i357 = add i32 %.21.i355, %.22.i356
+  %.13.i358 = icmp ult i64 %.20.i354, %.3.i335
+  %.14.i359 = getelementptr i8, ptr %.6.i338, i64 %.20.i354
+  %.15.i360 = load i8, ptr %.14.i359, align 1
+  %.16.i361 = add i8 %.15.i360, -48
+  %.17.i362 = icmp ult i8 %.16.i361, 10
+  %.18.i363 = and i1 %.13.i358, %.17.i362
+  br i1 %.18.i363, label %digit.i350, label %end_digits.i364
+
+end_digits.i364:                                  ; preds = %digit.i350
+  %.25.not.i365 = icmp ult i64 %i7.i353, %.11.i343
+  br i1 %.25.not.i365, label %while_body.backedge, label %store.i366
+
+while_body.backedge:                              ; preds = %end_digits.i364, %grammo_out_sync.exit334, %store.i366
+  br label %while_body
+
+store.i366:                                       ; preds = %end_digits.i364
+  %.27.i367 = sub i32 0, %.23.i357
+  %.28.i368 = select i1 %.8.i340, i32 %.27.i367, i32 %.23.i357
+  %.31.i369 = add i64 %.20.i354, %.5.i337
+  store i64 %.31.i369, ptr @grammo_in_pos, align 8
+  %1 = icmp eq i32 %.28.i368, 1
+  br i1 %1, label %while_body.backedge, label %while_end
+
+while_end:                                        ; preds = %store.i366
+  %.2.i = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i371 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i
+
+loop.i:                                           ; preds = %body.i, %while_end
+  %written.i = phi i64 [ 0, %while_end ], [ %.10.i376, %body.i ]
+  %.5.i372 = icmp slt i64 %written.i, %.3.i371
+  br i1 %.5.i372, label %body.i, label %grammo_out_flush.exit
+
+body.i:                                           ; preds = %loop.i
+  %.7.i373 = getelementptr i8, ptr %.2.i, i64 %written.i
+  %.8.i374 = sub i64 %.3.i371, %written.i
+  %.9.i375 = tail call i64 @write(i32 1, ptr %.7.i373, i64 %.8.i374)
+  %.10.i376 = add i64 %.9.i375, %written.i
+  %.11.i377 = icmp sgt i64 %.9.i375, 0
+  br i1 %.11.i377, label %loop.i, label %grammo_out_flush.exit
+
+grammo_out_flush.exit:                            ; preds = %loop.i, %body.i
+  store i64 0, ptr @grammo_out_len, align 8
   ret void
 }
 
-; Function Attrs: nofree nounwind
-declare noundef i32 @putchar(i32 noundef) local_unnamed_addr #0
+; Function Attrs: nounwind
+define internal fastcc i64 @grammo_in_token() unnamed_addr #2 {
+entry:
+  %.3.pre = load i64, ptr @grammo_in_pos, align 8
+  %.4.pre = load i64, ptr @grammo_in_end, align 8
+  br label %skip.outer
+
+skip.outer:                                       ; preds = %grammo_in_fill.exit, %entry
+  %.4.ph = phi i64 [ %.33.i, %grammo_in_fill.exit ], [ %.4.pre, %entry ]
+  %.3.ph = phi i64 [ 0, %grammo_in_fill.exit ], [ %.3.pre, %entry ]
+  %.9 = load ptr, ptr @grammo_in_buf, align 8
+  br label %skip
+
+skip:                                             ; preds = %skip.outer, %skip_next
+  %.3 = phi i64 [ %.19, %skip_next ], [ %.3.ph, %skip.outer ]
+  %.5 = icmp ult i64 %.3, %.4.ph
+  br i1 %.5, label %skip_test, label %skip_fill
+
+skip_fill:                                        ; preds = %skip
+  %.3.i = icmp eq ptr %.9, null
+  br i1 %.3.i, label %alloc.i, label %entry.check_full_crit_edge.i
+
+entry.check_full_crit_edge.i:                     ; preds = %skip_fill
+  %.12.pre.i = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i
+
+alloc.i:                                          ; preds = %skip_fill
+  %.5.i = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i
+
+check_full.i:                                     ; preds = %alloc.i, %entry.check_full_crit_edge.i
+  %.17.i = phi ptr [ %.9, %entry.check_full_crit_edge.i ], [ %.5.i, %alloc.i ]
+  %.12.i = phi i64 [ %.12.pre.i, %entry.check_full_crit_edge.i ], [ 65536, %alloc.i ]
+  %.11.i = sub i64 %.4.ph, %.3
+  %.13.i = icmp eq i64 %.11.i, %.12.i
+  br i1 %.13.i, label %grow.i, label %grammo_in_fill.exit
+
+grow.i:                                           ; preds = %check_full.i
+  %.16.i = shl i64 %.12.i, 1
+  %.18.i = or disjoint i64 %.16.i, 1
+  %.19.i = tail call ptr @realloc(ptr %.17.i, i64 %.18.i)
+  store ptr %.19.i, ptr @grammo_in_buf, align 8
+  store i64 %.16.i, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit
+
+grammo_in_fill.exit:                              ; preds = %check_full.i, %grow.i
+  %.28.i = phi i64 [ %.16.i, %grow.i ], [ %.12.i, %check_full.i ]
+  %.23.i = phi ptr [ %.19.i, %grow.i ], [ %.17.i, %check_full.i ]
+  %.25.i = getelementptr i8, ptr %.23.i, i64 %.3
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i, ptr align 1 %.25.i, i64 %.11.i, i1 false)
+  %.27.i = getelementptr i8, ptr %.23.i, i64 %.11.i
+  %.29.i = sub i64 %.28.i, %.11.i
+  %.30.i = tail call i64 @read(i32 0, ptr %.27.i, i64 %.29.i)
+  %.31.i = icmp sgt i64 %.30.i, 0
+  %.32.i = tail call i64 @llvm.smax.i64(i64 %.30.i, i64 0)
+  %.33.i = add i64 %.32.i, %.11.i
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i, ptr @grammo_in_end, align 8
+  %.36.i = getelementptr i8, ptr %.23.i, i64 %.33.i
+  store i8 0, ptr %.36.i, align 1
+  br i1 %.31.i, label %skip.outer, label %common.ret
+
+skip_test:                                        ; preds = %skip
+  %.11 = getelementptr i8, ptr %.9, i64 %.3
+  %.12 = load i8, ptr %.11, align 1
+  switch i8 %.12, label %scan.outer [
+    i8 32, label %skip_next
+    i8 13, label %skip_next
+    i8 12, label %skip_next
+    i8 11, label %skip_next
+    i8 10, label %skip_next
+    i8 9, label %skip_next
+  ]
+
+skip_next:                                        ; preds = %skip_test, %skip_test, %skip_test, %skip_test, %skip_test, %skip_test
+  %.19 = add nuw i64 %.3, 1
+  store i64 %.19, ptr @grammo_in_pos, align 8
+  br label %skip
+
+scan:                                             ; preds = %grammo_in_fill.exit28.peel, %grammo_in_fill.exit28
+  %.24 = phi i64 [ %.33.i20, %grammo_in_fill.exit28 ], [ %.33.i20.peel, %grammo_in_fill.exit28.peel ]
+  %.25 = icmp ult i64 %length.ph, %.24
+  %.27 = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.25, label %scan_test, label %scan_fill
+
+scan_test:                                        ; preds = %scan, %scan.outer
+  %.24.lcssa = phi i64 [ %.2444, %scan.outer ], [ %.24, %scan ]
+  %.22.lcssa = phi i64 [ %.2242, %scan.outer ], [ 0, %scan ]
+  %.23.lcssa = phi i64 [ %.23.peel, %scan.outer ], [ %length.ph, %scan ]
+  %.27.lcssa = phi ptr [ %.27.peel, %scan.outer ], [ %.27, %scan ]
+  %.28 = getelementptr i8, ptr %.27.lcssa, i64 %.23.lcssa
+  %.29 = load i8, ptr %.28, align 1
+  switch i8 %.29, label %scan_next [
+    i8 32, label %common.ret
+    i8 13, label %common.ret
+    i8 12, label %common.ret
+    i8 11, label %common.ret
+    i8 10, label %common.ret
+    i8 9, label %common.ret
+  ]
+
+scan_next:                                        ; preds = %scan_test
+  %.35 = add i64 %length.ph, 1
+  br label %scan.outer
+
+scan.outer:                                       ; preds = %skip_test, %scan_next
+  %.2444 = phi i64 [ %.24.lcssa, %scan_next ], [ %.4.ph, %skip_test ]
+  %.2242 = phi i64 [ %.22.lcssa, %scan_next ], [ %.3, %skip_test ]
+  %length.ph = phi i64 [ %.35, %scan_next ], [ 1, %skip_test ]
+  %.23.peel = add i64 %.2242, %length.ph
+  %.25.peel = icmp ult i64 %.23.peel, %.2444
+  %.27.peel = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.25.peel, label %scan_test, label %scan_fill.peel
+
+scan_fill.peel:                                   ; preds = %scan.outer
+  %.3.i2.peel = icmp eq ptr %.27.peel, null
+  br i1 %.3.i2.peel, label %alloc.i26.peel, label %entry.check_full_crit_edge.i3.peel
+
+entry.check_full_crit_edge.i3.peel:               ; preds = %scan_fill.peel
+  %.12.pre.i4.peel = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.peel
+
+alloc.i26.peel:                                   ; preds = %scan_fill.peel
+  %.5.i27.peel = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i27.peel, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.peel
+
+check_full.i5.peel:                               ; preds = %alloc.i26.peel, %entry.check_full_crit_edge.i3.peel
+  %.17.i6.peel = phi ptr [ %.27.peel, %entry.check_full_crit_edge.i3.peel ], [ %.5.i27.peel, %alloc.i26.peel ]
+  %.12.i7.peel = phi i64 [ %.12.pre.i4.peel, %entry.check_full_crit_edge.i3.peel ], [ 65536, %alloc.i26.peel ]
+  %.11.i10.peel = sub i64 %.2444, %.2242
+  %.13.i11.peel = icmp eq i64 %.11.i10.peel, %.12.i7.peel
+  br i1 %.13.i11.peel, label %grow.i22.peel, label %grammo_in_fill.exit28.peel
+
+grow.i22.peel:                                    ; preds = %check_full.i5.peel
+  %.16.i23.peel = shl i64 %.12.i7.peel, 1
+  %.18.i24.peel = or disjoint i64 %.16.i23.peel, 1
+  %.19.i25.peel = tail call ptr @realloc(ptr %.17.i6.peel, i64 %.18.i24.peel)
+  store ptr %.19.i25.peel, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23.peel, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28.peel
+
+grammo_in_fill.exit28.peel:                       ; preds = %grow.i22.peel, %check_full.i5.peel
+  %.28.i12.peel = phi i64 [ %.16.i23.peel, %grow.i22.peel ], [ %.12.i7.peel, %check_full.i5.peel ]
+  %.23.i13.peel = phi ptr [ %.19.i25.peel, %grow.i22.peel ], [ %.17.i6.peel, %check_full.i5.peel ]
+  %.25.i14.peel = getelementptr i8, ptr %.23.i13.peel, i64 %.2242
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i13.peel, ptr align 1 %.25.i14.peel, i64 %.11.i10.peel, i1 false)
+  %.27.i15.peel = getelementptr i8, ptr %.23.i13.peel, i64 %.11.i10.peel
+  %.29.i16.peel = sub i64 %.28.i12.peel, %.11.i10.peel
+  %.30.i17.peel = tail call i64 @read(i32 0, ptr %.27.i15.peel, i64 %.29.i16.peel)
+  %.31.i18.peel = icmp sgt i64 %.30.i17.peel, 0
+  %.32.i19.peel = tail call i64 @llvm.smax.i64(i64 %.30.i17.peel, i64 0)
+  %.33.i20.peel = add i64 %.32.i19.peel, %.11.i10.peel
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20.peel, ptr @grammo_in_end, align 8
+  %.36.i21.peel = getelementptr i8, ptr %.23.i13.peel, i64 %.33.i20.peel
+  store i8 0, ptr %.36.i21.peel, align 1
+  br i1 %.31.i18.peel, label %scan, label %common.ret
+
+scan_fill:                                        ; preds = %scan
+  %.3.i2 = icmp eq ptr %.27, null
+  br i1 %.3.i2, label %alloc.i26, label %entry.check_full_crit_edge.i3
+
+entry.check_full_crit_edge.i3:                    ; preds = %scan_fill
+  %.12.pre.i4 = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i5
+
+alloc.i26:                                        ; preds = %scan_fill
+  %.5.i27 = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i27, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i5
+
+check_full.i5:                                    ; preds = %alloc.i26, %entry.check_full_crit_edge.i3
+  %.17.i6 = phi ptr [ %.27, %entry.check_full_crit_edge.i3 ], [ %.5.i27, %alloc.i26 ]
+  %.12.i7 = phi i64 [ %.12.pre.i4, %entry.check_full_crit_edge.i3 ], [ 65536, %alloc.i26 ]
+  %.13.i11 = icmp eq i64 %.24, %.12.i7
+  br i1 %.13.i11, label %grow.i22, label %grammo_in_fill.exit28
+
+grow.i22:                                         ; preds = %check_full.i5
+  %.16.i23 = shl i64 %.12.i7, 1
+  %.18.i24 = or disjoint i64 %.16.i23, 1
+  %.19.i25 = tail call ptr @realloc(ptr %.17.i6, i64 %.18.i24)
+  store ptr %.19.i25, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28
+
+grammo_in_fill.exit28:                            ; preds = %check_full.i5, %grow.i22
+  %.28.i12 = phi i64 [ %.16.i23, %grow.i22 ], [ %.12.i7, %check_full.i5 ]
+  %.23.i13 = phi ptr [ %.19.i25, %grow.i22 ], [ %.17.i6, %check_full.i5 ]
+  %.27.i15 = getelementptr i8, ptr %.23.i13, i64 %.24
+  %.29.i16 = sub i64 %.28.i12, %.24
+  %.30.i17 = tail call i64 @read(i32 0, ptr %.27.i15, i64 %.29.i16)
+  %.31.i18 = icmp sgt i64 %.30.i17, 0
+  %.32.i19 = tail call i64 @llvm.smax.i64(i64 %.30.i17, i64 0)
+  %.33.i20 = add i64 %.32.i19, %.24
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20, ptr @grammo_in_end, align 8
+  %.36.i21 = getelementptr i8, ptr %.23.i13, i64 %.33.i20
+  store i8 0, ptr %.36.i21, align 1
+  br i1 %.31.i18, label %scan, label %common.ret, !llvm.loop !0
+
+common.ret:                                       ; preds = %grammo_in_fill.exit, %scan_test, %scan_test, %scan_test, %scan_test, %scan_test, %scan_test, %grammo_in_fill.exit28, %grammo_in_fill.exit28.peel
+  %common.ret.op = phi i64 [ %length.ph, %grammo_in_fill.exit28.peel ], [ %length.ph, %grammo_in_fill.exit28 ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ 0, %grammo_in_fill.exit ]
+  ret i64 %common.ret.op
+}
+
+; Function Attrs: nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memcpy.p0.p0.i64(ptr noalias nocapture writeonly, ptr noalias nocapture readonly, i64, i1 immarg) #6
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i64 @llvm.smax.i64(i64, i64) #7
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i32 @llvm.smax.i32(i32, i32) #7
+
+; Function Attrs: nocallback nofree nosync nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.lifetime.start.p0(i64 immarg, ptr nocapture) #8
+
+; Function Attrs: nocallback nofree nosync nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.lifetime.end.p0(i64 immarg, ptr nocapture) #8
 
 attributes #0 = { nofree nounwind }
+attributes #1 = { mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #2 = { nounwind }
+attributes #3 = { mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #4 = { mustprogress nofree nounwind willreturn }
+attributes #5 = { mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+attributes #6 = { nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+attributes #7 = { nocallback nofree nosync nounwind speculatable willreturn memory(none) }
+attributes #8 = { nocallback nofree nosync nounwind willreturn memory(argmem: readwrite) }
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.peeled.count", i32 1}
@@ -1,111 +1,1064 @@
 ; ModuleID = '<string>'
 source_filename = "<string>"
-target triple = "x86_64-pc-windows-msvc"
-
-@str_0 = constant [19 x i8] c"Interessi composti\00"
-@G_TITLE = local_unnamed_addr global ptr @str_0
-@str_1 = constant [3 x i8] c"%s\00"
-@str_2 = local_unnamed_addr constant [2 x i8] c"\0A\00"
-@str_3 = constant [27 x i8] c"Capitale iniziale (real): \00"
-@str_4 = constant [4 x i8] c"%lf\00"
-@str_5 = constant [23 x i8] c"Tasso annuo % (real): \00"
-@str_6 = constant [18 x i8] c"Anni (int >= 0): \00"
-@str_7 = constant [3 x i8] c"%d\00"
-@str_8 = constant [30 x i8] c"Errore: anni deve essere >= 0\00"
-@str_9 = constant [29 x i8] c"Tasso nullo: saldo costante.\00"
-@str_10 = constant [6 x i8] c"Anno \00"
-@str_11 = constant [8 x i8] c" saldo=\00"
-@str_12 = constant [5 x i8] c"%.6f\00"
-@str_13 = constant [14 x i8] c"Saldo finale=\00"
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-i128:128-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-unknown-linux-gnu"
+
+@grammo_out_buf = internal unnamed_addr global ptr null
+@grammo_out_cap = internal unnamed_addr global i1 false
+@grammo_out_len = internal unnamed_addr global i64 0
+@grammo_out_tty = internal unnamed_addr global i32 -1
+@str_0 = private unnamed_addr constant [20 x i8] c"Interessi composti\0A\00"
+@str_1 = private unnamed_addr constant [27 x i8] c"Capitale iniziale (real): \00"
+@grammo_in_buf = internal unnamed_addr global ptr null
+@grammo_in_cap = internal unnamed_addr global i64 0
+@grammo_in_pos = internal unnamed_addr global i64 0
+@grammo_in_end = internal unnamed_addr global i64 0
+@str_2 = private constant [24 x i8] c"Tasso annuo %% (real): \00"
+@str_3 = private unnamed_addr constant [18 x i8] c"Anni (int >= 0): \00"
+@str_4 = private unnamed_addr constant [31 x i8] c"Errore: anni deve essere >= 0\0A\00"
+@str_5 = private unnamed_addr constant [30 x i8] c"Tasso nullo: saldo costante.\0A\00"
+@str_6 = private constant [20 x i8] c"Anno %d saldo=%.6f\0A\00"
+@str_7 = private constant [19 x i8] c"Saldo finale=%.6f\0A\00"
 
 ; Function Attrs: nofree nounwind
-declare noundef i32 @printf(ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+declare noundef i32 @snprintf(ptr noalias nocapture noundef writeonly, i64 noundef, ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+
+; Function Attrs: mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite)
+declare noalias noundef ptr @realloc(ptr allocptr nocapture, i64 noundef) local_unnamed_addr #1
 
 ; Function Attrs: nofree nounwind
-declare noundef i32 @scanf(ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+declare noundef i64 @write(i32 noundef, ptr nocapture noundef readonly, i64 noundef) local_unnamed_addr #0
 
-; Function Attrs: mustprogress nofree norecurse nosync nounwind willreturn memory(none)
-define double @apply_interest(double %ai_balance, double %ai_rate_percent) local_unnamed_addr #1 {
-entry:
-  %.6 = fdiv double %ai_rate_percent, 1.000000e+02
-  %.7 = fadd double %.6, 1.000000e+00
-  %.8 = fmul double %ai_balance, %.7
-  ret double %.8
-}
+; Function Attrs: nounwind
+declare i32 @isatty(i32) local_unnamed_addr #2
+
+; Function Attrs: mustprogress nofree nounwind willreturn
+declare double @strtod(ptr readonly, ptr nocapture) local_unnamed_addr #3
+
+; Function Attrs: mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite)
+declare noalias noundef ptr @malloc(i64 noundef) local_unnamed_addr #4
 
 ; Function Attrs: nofree nounwind
-define void @main() local_unnamed_addr #0 {
+declare noundef i64 @read(i32 noundef, ptr nocapture noundef, i64 noundef) local_unnamed_addr #0
+
+; Function Attrs: mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memmove.p0.p0.i64(ptr nocapture writeonly, ptr nocapture readonly, i64, i1 immarg) #5
+
+; Function Attrs: nounwind
+define void @main() local_unnamed_addr #2 {
 entry:
-  %m_principal = alloca double, align 8
-  store double 0.000000e+00, ptr %m_principal, align 8
-  %m_rate = alloca double, align 8
-  store double 0.000000e+00, ptr %m_rate, align 8
-  %m_years = alloca i32, align 4
-  store i32 0, ptr %m_years, align 4
-  %load_G_TITLE = load ptr, ptr @G_TITLE, align 8
-  %.8 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr %load_G_TITLE)
-  %putchar = tail call i32 @putchar(i32 10)
-  %.14 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_3)
-  %.16 = call i32 (ptr, ...) @scanf(ptr nonnull @str_4, ptr nonnull %m_principal)
-  %.19 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_5)
-  %.21 = call i32 (ptr, ...) @scanf(ptr nonnull @str_4, ptr nonnull %m_rate)
-  %.24 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_6)
-  %.26 = call i32 (ptr, ...) @scanf(ptr nonnull @str_7, ptr nonnull %m_years)
-  %load_m_years = load i32, ptr %m_years, align 4
-  %.27 = icmp slt i32 %load_m_years, 0
-  br i1 %.27, label %if_then, label %next_branch
-
-common.ret:                                       ; preds = %for_end, %if_then
-  %putchar4 = call i32 @putchar(i32 10)
+  %end.i117 = alloca ptr, align 8
+  %end.i = alloca ptr, align 8
+  %.4.i = load i64, ptr @grammo_out_len, align 8
+  %.5.i = add i64 %.4.i, 20
+  %.6.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i = select i1 %.6.b.i, i64 65536, i64 0
+  %.7.not.i = icmp ugt i64 %.5.i, %.6.i
+  %.20.pre1.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i, label %loop.i.i, label %grammo_out_reserve.exit
+
+loop.i.i:                                         ; preds = %entry, %body.i.i
+  %written.i.i = phi i64 [ %.10.i.i, %body.i.i ], [ 0, %entry ]
+  %.5.i.i = icmp slt i64 %written.i.i, %.4.i
+  br i1 %.5.i.i, label %body.i.i, label %grammo_out_flush.exit.i
+
+body.i.i:                                         ; preds = %loop.i.i
+  %.7.i.i = getelementptr i8, ptr %.20.pre1.i, i64 %written.i.i
+  %.8.i.i = sub i64 %.4.i, %written.i.i
+  %.9.i.i = tail call i64 @write(i32 1, ptr %.7.i.i, i64 %.8.i.i)
+  %.10.i.i = add i64 %.9.i.i, %written.i.i
+  %.11.i.i = icmp sgt i64 %.9.i.i, 0
+  br i1 %.11.i.i, label %loop.i.i, label %grammo_out_flush.exit.i
+
+grammo_out_flush.exit.i:                          ; preds = %body.i.i, %loop.i.i
+  %.10.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i, label %grammo_out_reserve.exit, label %grow.i
+
+grow.i:                                           ; preds = %grammo_out_flush.exit.i
+  %.16.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i, i64 65536)
+  store ptr %.16.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit
+
+grammo_out_reserve.exit:                          ; preds = %entry, %grammo_out_flush.exit.i, %grow.i
+  %.7.i = phi i64 [ 0, %grow.i ], [ 0, %grammo_out_flush.exit.i ], [ %.4.i, %entry ]
+  %.20.i = phi ptr [ %.16.i, %grow.i ], [ %.20.pre.i, %grammo_out_flush.exit.i ], [ %.20.pre1.i, %entry ]
+  %.22.i = getelementptr i8, ptr %.20.i, i64 %.7.i
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(20) %.22.i, ptr noundef nonnull align 16 dereferenceable(20) @str_0, i64 20, i1 false)
+  %.8.i = add nsw i64 %.7.i, 19
+  store i64 %.8.i, ptr @grammo_out_len, align 8
+  %.2.i.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i = icmp slt i32 %.2.i.i, 0
+  br i1 %.3.i.i, label %check.i.i, label %grammo_out_interactive.exit.i
+
+check.i.i:                                        ; preds = %grammo_out_reserve.exit
+  %.5.i.i12 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i12, ptr @grammo_out_tty, align 4
+  %.4.i13.pre.pre = load i64, ptr @grammo_out_len, align 8
+  %.20.pre1.i18.pre412.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_interactive.exit.i
+
+grammo_out_interactive.exit.i:                    ; preds = %check.i.i, %grammo_out_reserve.exit
+  %.20.pre1.i18.pre412 = phi ptr [ %.20.pre1.i18.pre412.pre, %check.i.i ], [ %.20.i, %grammo_out_reserve.exit ]
+  %.4.i13.pre = phi i64 [ %.4.i13.pre.pre, %check.i.i ], [ %.8.i, %grammo_out_reserve.exit ]
+  %.8.i.i3 = phi i32 [ %.5.i.i12, %check.i.i ], [ %.2.i.i, %grammo_out_reserve.exit ]
+  %.9.i.i4 = icmp sgt i32 %.8.i.i3, 0
+  br i1 %.9.i.i4, label %loop.i.i5, label %grammo_out_advance.exit
+
+loop.i.i5:                                        ; preds = %grammo_out_interactive.exit.i, %body.i.i8
+  %written.i.i6 = phi i64 [ %.10.i.i10, %body.i.i8 ], [ 0, %grammo_out_interactive.exit.i ]
+  %.5.i3.i = icmp slt i64 %written.i.i6, %.4.i13.pre
+  br i1 %.5.i3.i, label %body.i.i8, label %grammo_out_flush.exit.i7
+
+body.i.i8:                                        ; preds = %loop.i.i5
+  %.7.i.i9 = getelementptr i8, ptr %.20.pre1.i18.pre412, i64 %written.i.i6
+  %.8.i4.i = sub i64 %.4.i13.pre, %written.i.i6
+  %.9.i5.i = tail call i64 @write(i32 1, ptr %.7.i.i9, i64 %.8.i4.i)
+  %.10.i.i10 = add i64 %.9.i5.i, %written.i.i6
+  %.11.i.i11 = icmp sgt i64 %.9.i5.i, 0
+  br i1 %.11.i.i11, label %loop.i.i5, label %grammo_out_flush.exit.i7
+
+grammo_out_flush.exit.i7:                         ; preds = %body.i.i8, %loop.i.i5
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i18.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit
+
+grammo_out_advance.exit:                          ; preds = %grammo_out_interactive.exit.i, %grammo_out_flush.exit.i7
+  %.20.pre1.i18 = phi ptr [ %.20.pre1.i18.pre412, %grammo_out_interactive.exit.i ], [ %.20.pre1.i18.pre, %grammo_out_flush.exit.i7 ]
+  %.4.i13 = phi i64 [ %.4.i13.pre, %grammo_out_interactive.exit.i ], [ 0, %grammo_out_flush.exit.i7 ]
+  %.5.i14 = add i64 %.4.i13, 27
+  %.6.b.i15 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i16 = select i1 %.6.b.i15, i64 65536, i64 0
+  %.7.not.i17 = icmp ugt i64 %.5.i14, %.6.i16
+  br i1 %.7.not.i17, label %loop.i.i22, label %grammo_out_reserve.exit36
+
+loop.i.i22:                                       ; preds = %grammo_out_advance.exit, %body.i.i30
+  %written.i.i23 = phi i64 [ %.10.i.i34, %body.i.i30 ], [ 0, %grammo_out_advance.exit ]
+  %.5.i.i24 = icmp slt i64 %written.i.i23, %.4.i13
+  br i1 %.5.i.i24, label %body.i.i30, label %grammo_out_flush.exit.i25
+
+body.i.i30:                                       ; preds = %loop.i.i22
+  %.7.i.i31 = getelementptr i8, ptr %.20.pre1.i18, i64 %written.i.i23
+  %.8.i.i32 = sub i64 %.4.i13, %written.i.i23
+  %.9.i.i33 = tail call i64 @write(i32 1, ptr %.7.i.i31, i64 %.8.i.i32)
+  %.10.i.i34 = add i64 %.9.i.i33, %written.i.i23
+  %.11.i.i35 = icmp sgt i64 %.9.i.i33, 0
+  br i1 %.11.i.i35, label %loop.i.i22, label %grammo_out_flush.exit.i25
+
+grammo_out_flush.exit.i25:                        ; preds = %body.i.i30, %loop.i.i22
+  %.10.b.i26 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i27 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i26, label %grammo_out_reserve.exit36, label %grow.i28
+
+grow.i28:                                         ; preds = %grammo_out_flush.exit.i25
+  %.16.i29 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i27, i64 65536)
+  store ptr %.16.i29, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit36
+
+grammo_out_reserve.exit36:                        ; preds = %grammo_out_advance.exit, %grammo_out_flush.exit.i25, %grow.i28
+  %.7.i37 = phi i64 [ 0, %grow.i28 ], [ 0, %grammo_out_flush.exit.i25 ], [ %.4.i13, %grammo_out_advance.exit ]
+  %.20.i20 = phi ptr [ %.16.i29, %grow.i28 ], [ %.20.pre.i27, %grammo_out_flush.exit.i25 ], [ %.20.pre1.i18, %grammo_out_advance.exit ]
+  %.22.i21 = getelementptr i8, ptr %.20.i20, i64 %.7.i37
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(27) %.22.i21, ptr noundef nonnull align 16 dereferenceable(27) @str_1, i64 27, i1 false)
+  %.8.i38 = add nsw i64 %.7.i37, 26
+  store i64 %.8.i38, ptr @grammo_out_len, align 8
+  %.2.i.i39 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i40 = icmp slt i32 %.2.i.i39, 0
+  br i1 %.3.i.i40, label %check.i.i57, label %grammo_out_interactive.exit.i41
+
+check.i.i57:                                      ; preds = %grammo_out_reserve.exit36
+  %.5.i.i58 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i58, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i41
+
+grammo_out_interactive.exit.i41:                  ; preds = %check.i.i57, %grammo_out_reserve.exit36
+  %.8.i.i42 = phi i32 [ %.5.i.i58, %check.i.i57 ], [ %.2.i.i39, %grammo_out_reserve.exit36 ]
+  %.9.i.i43 = icmp sgt i32 %.8.i.i42, 0
+  br i1 %.9.i.i43, label %flush.i44, label %grammo_out_sync.exit
+
+flush.i44:                                        ; preds = %grammo_out_interactive.exit.i41
+  %.2.i1.i45 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i46 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i47
+
+loop.i.i47:                                       ; preds = %body.i.i51, %flush.i44
+  %written.i.i48 = phi i64 [ 0, %flush.i44 ], [ %.10.i.i55, %body.i.i51 ]
+  %.5.i3.i49 = icmp slt i64 %written.i.i48, %.3.i2.i46
+  br i1 %.5.i3.i49, label %body.i.i51, label %grammo_out_flush.exit.i50
+
+body.i.i51:                                       ; preds = %loop.i.i47
+  %.7.i.i52 = getelementptr i8, ptr %.2.i1.i45, i64 %written.i.i48
+  %.8.i4.i53 = sub i64 %.3.i2.i46, %written.i.i48
+  %.9.i5.i54 = tail call i64 @write(i32 1, ptr %.7.i.i52, i64 %.8.i4.i53)
+  %.10.i.i55 = add i64 %.9.i5.i54, %written.i.i48
+  %.11.i.i56 = icmp sgt i64 %.9.i5.i54, 0
+  br i1 %.11.i.i56, label %loop.i.i47, label %grammo_out_flush.exit.i50
+
+grammo_out_flush.exit.i50:                        ; preds = %body.i.i51, %loop.i.i47
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit
+
+grammo_out_sync.exit:                             ; preds = %grammo_out_interactive.exit.i41, %grammo_out_flush.exit.i50
+  call void @llvm.lifetime.start.p0(i64 8, ptr nonnull %end.i)
+  %.3.i = tail call fastcc i64 @grammo_in_token()
+  %.4.i59 = load ptr, ptr @grammo_in_buf, align 8
+  %.5.i60 = load i64, ptr @grammo_in_pos, align 8
+  %.6.i61 = getelementptr i8, ptr %.4.i59, i64 %.5.i60
+  %.7.i62 = call double @strtod(ptr %.6.i61, ptr nonnull %end.i)
+  %.8.i63 = load ptr, ptr %end.i, align 8
+  %.9.i = ptrtoint ptr %.8.i63 to i64
+  %.10.i = ptrtoint ptr %.6.i61 to i64
+  %.11.i = sub i64 %.9.i, %.10.i
+  %.12.i = icmp sgt i64 %.11.i, 0
+  br i1 %.12.i, label %store.i, label %grammo_in_read_real.exit
+
+store.i:                                          ; preds = %grammo_out_sync.exit
+  %.15.i = load i64, ptr @grammo_in_pos, align 8
+  %.16.i64 = add i64 %.15.i, %.11.i
+  store i64 %.16.i64, ptr @grammo_in_pos, align 8
+  br label %grammo_in_read_real.exit
+
+grammo_in_read_real.exit:                         ; preds = %grammo_out_sync.exit, %store.i
+  %m_principal.0 = phi double [ %.7.i62, %store.i ], [ 0.000000e+00, %grammo_out_sync.exit ]
+  call void @llvm.lifetime.end.p0(i64 8, ptr nonnull %end.i)
+  %.4.i65 = load i64, ptr @grammo_out_len, align 8
+  %.5.i66 = add i64 %.4.i65, 23
+  %.6.b.i67 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i68 = select i1 %.6.b.i67, i64 65536, i64 0
+  %.7.not.i69 = icmp ugt i64 %.5.i66, %.6.i68
+  %.20.pre1.i70 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i69, label %loop.i.i74, label %grammo_out_reserve.exit88
+
+loop.i.i74:                                       ; preds = %grammo_in_read_real.exit, %body.i.i82
+  %written.i.i75 = phi i64 [ %.10.i.i86, %body.i.i82 ], [ 0, %grammo_in_read_real.exit ]
+  %.5.i.i76 = icmp slt i64 %written.i.i75, %.4.i65
+  br i1 %.5.i.i76, label %body.i.i82, label %grammo_out_flush.exit.i77
+
+body.i.i82:                                       ; preds = %loop.i.i74
+  %.7.i.i83 = getelementptr i8, ptr %.20.pre1.i70, i64 %written.i.i75
+  %.8.i.i84 = sub i64 %.4.i65, %written.i.i75
+  %.9.i.i85 = tail call i64 @write(i32 1, ptr %.7.i.i83, i64 %.8.i.i84)
+  %.10.i.i86 = add i64 %.9.i.i85, %written.i.i75
+  %.11.i.i87 = icmp sgt i64 %.9.i.i85, 0
+  br i1 %.11.i.i87, label %loop.i.i74, label %grammo_out_flush.exit.i77
+
+grammo_out_flush.exit.i77:                        ; preds = %body.i.i82, %loop.i.i74
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i78 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i79 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i78, label %grammo_out_reserve.exit88, label %grow.i80
+
+grow.i80:                                         ; preds = %grammo_out_flush.exit.i77
+  %.16.i81 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i79, i64 65536)
+  store ptr %.16.i81, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit88
+
+grammo_out_reserve.exit88:                        ; preds = %grammo_in_read_real.exit, %grammo_out_flush.exit.i77, %grow.i80
+  %.21.i71 = phi i64 [ 0, %grow.i80 ], [ 0, %grammo_out_flush.exit.i77 ], [ %.4.i65, %grammo_in_read_real.exit ]
+  %.20.i72 = phi ptr [ %.16.i81, %grow.i80 ], [ %.20.pre.i79, %grammo_out_flush.exit.i77 ], [ %.20.pre1.i70, %grammo_in_read_real.exit ]
+  %.22.i73 = getelementptr i8, ptr %.20.i72, i64 %.21.i71
+  %.22 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i73, i64 23, ptr nonnull @str_2)
+  %0 = tail call i32 @llvm.smax.i32(i32 %.22, i32 0)
+  %.6.i89 = zext nneg i32 %0 to i64
+  %.7.i90 = load i64, ptr @grammo_out_len, align 8
+  %.8.i91 = add i64 %.7.i90, %.6.i89
+  store i64 %.8.i91, ptr @grammo_out_len, align 8
+  %.2.i.i92 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i93 = icmp slt i32 %.2.i.i92, 0
+  br i1 %.3.i.i93, label %check.i.i110, label %grammo_out_interactive.exit.i94
+
+check.i.i110:                                     ; preds = %grammo_out_reserve.exit88
+  %.5.i.i111 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i111, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i94
+
+grammo_out_interactive.exit.i94:                  ; preds = %check.i.i110, %grammo_out_reserve.exit88
+  %.8.i.i95 = phi i32 [ %.5.i.i111, %check.i.i110 ], [ %.2.i.i92, %grammo_out_reserve.exit88 ]
+  %.9.i.i96 = icmp sgt i32 %.8.i.i95, 0
+  br i1 %.9.i.i96, label %flush.i97, label %grammo_out_sync.exit112
+
+flush.i97:                                        ; preds = %grammo_out_interactive.exit.i94
+  %.2.i1.i98 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i99 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i100
+
+loop.i.i100:                                      ; preds = %body.i.i104, %flush.i97
+  %written.i.i101 = phi i64 [ 0, %flush.i97 ], [ %.10.i.i108, %body.i.i104 ]
+  %.5.i3.i102 = icmp slt i64 %written.i.i101, %.3.i2.i99
+  br i1 %.5.i3.i102, label %body.i.i104, label %grammo_out_flush.exit.i103
+
+body.i.i104:                                      ; preds = %loop.i.i100
+  %.7.i.i105 = getelementptr i8, ptr %.2.i1.i98, i64 %written.i.i101
+  %.8.i4.i106 = sub i64 %.3.i2.i99, %written.i.i101
+  %.9.i5.i107 = tail call i64 @write(i32 1, ptr %.7.i.i105, i64 %.8.i4.i106)
+  %.10.i.i108 = add i64 %.9.i5.i107, %written.i.i101
+  %.11.i.i109 = icmp sgt i64 %.9.i5.i107, 0
+  br i1 %.11.i.i109, label %loop.i.i100, label %grammo_out_flush.exit.i103
+
+grammo_out_flush.exit.i103:                       ; preds = %body.i.i104, %loop.i.i100
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit112
+
+grammo_out_sync.exit112:                          ; preds = %grammo_out_interactive.exit.i94, %grammo_out_flush.exit.i103
+  call void @llvm.lifetime.start.p0(i64 8, ptr nonnull %end.i117)
+  %.3.i113 = tail call fastcc i64 @grammo_in_token()
+  %.4.i114 = load ptr, ptr @grammo_in_buf, align 8
+  %.5.i115 = load i64, ptr @grammo_in_pos, align 8
+  %.6.i116 = getelementptr i8, ptr %.4.i114, i64 %.5.i115
+  %.7.i118 = call double @strtod(ptr %.6.i116, ptr nonnull %end.i117)
+  %.8.i119 = load ptr, ptr %end.i117, align 8
+  %.9.i120 = ptrtoint ptr %.8.i119 to i64
+  %.10.i121 = ptrtoint ptr %.6.i116 to i64
+  %.11.i122 = sub i64 %.9.i120, %.10.i121
+  %.12.i123 = icmp sgt i64 %.11.i122, 0
+  br i1 %.12.i123, label %store.i124, label %grammo_in_read_real.exit127
+
+store.i124:                                       ; preds = %grammo_out_sync.exit112
+  %.15.i125 = load i64, ptr @grammo_in_pos, align 8
+  %.16.i126 = add i64 %.15.i125, %.11.i122
+  store i64 %.16.i126, ptr @grammo_in_pos, align 8
+  br label %grammo_in_read_real.exit127
+
+grammo_in_read_real.exit127:                      ; preds = %grammo_out_sync.exit112, %store.i124
+  %m_rate.0 = phi double [ %.7.i118, %store.i124 ], [ 0.000000e+00, %grammo_out_sync.exit112 ]
+  call void @llvm.lifetime.end.p0(i64 8, ptr nonnull %end.i117)
+  %.4.i128 = load i64, ptr @grammo_out_len, align 8
+  %.5.i129 = add i64 %.4.i128, 18
+  %.6.b.i130 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i131 = select i1 %.6.b.i130, i64 65536, i64 0
+  %.7.not.i132 = icmp ugt i64 %.5.i129, %.6.i131
+  %.20.pre1.i133 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i132, label %loop.i.i137, label %grammo_out_reserve.exit151
+
+loop.i.i137:                                      ; preds = %grammo_in_read_real.exit127, %body.i.i145
+  %written.i.i138 = phi i64 [ %.10.i.i149, %body.i.i145 ], [ 0, %grammo_in_read_real.exit127 ]
+  %.5.i.i139 = icmp slt i64 %written.i.i138, %.4.i128
+  br i1 %.5.i.i139, label %body.i.i145, label %grammo_out_flush.exit.i140
+
+body.i.i145:                                      ; preds = %loop.i.i137
+  %.7.i.i146 = getelementptr i8, ptr %.20.pre1.i133, i64 %written.i.i138
+  %.8.i.i147 = sub i64 %.4.i128, %written.i.i138
+  %.9.i.i148 = tail call i64 @write(i32 1, ptr %.7.i.i146, i64 %.8.i.i147)
+  %.10.i.i149 = add i64 %.9.i.i148, %written.i.i138
+  %.11.i.i150 = icmp sgt i64 %.9.i.i148, 0
+  br i1 %.11.i.i150, label %loop.i.i137, label %grammo_out_flush.exit.i140
+
+grammo_out_flush.exit.i140:                       ; preds = %body.i.i145, %loop.i.i137
+  %.10.b.i141 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i142 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i141, label %grammo_out_reserve.exit151, label %grow.i143
+
+grow.i143:                                        ; preds = %grammo_out_flush.exit.i140
+  %.16.i144 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i142, i64 65536)
+  store ptr %.16.i144, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit151
+
+grammo_out_reserve.exit151:                       ; preds = %grammo_in_read_real.exit127, %grammo_out_flush.exit.i140, %grow.i143
+  %.7.i152 = phi i64 [ 0, %grow.i143 ], [ 0, %grammo_out_flush.exit.i140 ], [ %.4.i128, %grammo_in_read_real.exit127 ]
+  %.20.i135 = phi ptr [ %.16.i144, %grow.i143 ], [ %.20.pre.i142, %grammo_out_flush.exit.i140 ], [ %.20.pre1.i133, %grammo_in_read_real.exit127 ]
+  %.22.i136 = getelementptr i8, ptr %.20.i135, i64 %.7.i152
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(18) %.22.i136, ptr noundef nonnull align 16 dereferenceable(18) @str_3, i64 18, i1 false)
+  %.8.i153 = add nsw i64 %.7.i152, 17
+  store i64 %.8.i153, ptr @grammo_out_len, align 8
+  %.2.i.i154 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i155 = icmp slt i32 %.2.i.i154, 0
+  br i1 %.3.i.i155, label %check.i.i172, label %grammo_out_interactive.exit.i156
+
+check.i.i172:                                     ; preds = %grammo_out_reserve.exit151
+  %.5.i.i173 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i173, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i156
+
+grammo_out_interactive.exit.i156:                 ; preds = %check.i.i172, %grammo_out_reserve.exit151
+  %.8.i.i157 = phi i32 [ %.5.i.i173, %check.i.i172 ], [ %.2.i.i154, %grammo_out_reserve.exit151 ]
+  %.9.i.i158 = icmp sgt i32 %.8.i.i157, 0
+  br i1 %.9.i.i158, label %flush.i159, label %grammo_out_sync.exit174
+
+flush.i159:                                       ; preds = %grammo_out_interactive.exit.i156
+  %.2.i1.i160 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i161 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i162
+
+loop.i.i162:                                      ; preds = %body.i.i166, %flush.i159
+  %written.i.i163 = phi i64 [ 0, %flush.i159 ], [ %.10.i.i170, %body.i.i166 ]
+  %.5.i3.i164 = icmp slt i64 %written.i.i163, %.3.i2.i161
+  br i1 %.5.i3.i164, label %body.i.i166, label %grammo_out_flush.exit.i165
+
+body.i.i166:                                      ; preds = %loop.i.i162
+  %.7.i.i167 = getelementptr i8, ptr %.2.i1.i160, i64 %written.i.i163
+  %.8.i4.i168 = sub i64 %.3.i2.i161, %written.i.i163
+  %.9.i5.i169 = tail call i64 @write(i32 1, ptr %.7.i.i167, i64 %.8.i4.i168)
+  %.10.i.i170 = add i64 %.9.i5.i169, %written.i.i163
+  %.11.i.i171 = icmp sgt i64 %.9.i5.i169, 0
+  br i1 %.11.i.i171, label %loop.i.i162, label %grammo_out_flush.exit.i165
+
+grammo_out_flush.exit.i165:                       ; preds = %body.i.i166, %loop.i.i162
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit174
+
+grammo_out_sync.exit174:                          ; preds = %grammo_out_interactive.exit.i156, %grammo_out_flush.exit.i165
+  %.3.i175 = tail call fastcc i64 @grammo_in_token()
+  %.4.i176 = load ptr, ptr @grammo_in_buf, align 8
+  %.5.i177 = load i64, ptr @grammo_in_pos, align 8
+  %.6.i178 = getelementptr i8, ptr %.4.i176, i64 %.5.i177
+  %.7.i179 = load i8, ptr %.6.i178, align 1
+  %.8.i180 = icmp eq i8 %.7.i179, 45
+  %.9.i181 = icmp eq i8 %.7.i179, 43
+  %.10.i182 = or i1 %.8.i180, %.9.i181
+  %.11.i183 = zext i1 %.10.i182 to i64
+  %.131.i = icmp ugt i64 %.3.i175, %.11.i183
+  %.142.i = getelementptr i8, ptr %.6.i178, i64 %.11.i183
+  %.153.i = load i8, ptr %.142.i, align 1
+  %.164.i = add i8 %.153.i, -48
+  %.175.i = icmp ult i8 %.164.i, 10
+  %.186.i = and i1 %.175.i, %.131.i
+  br i1 %.186.i, label %digit.i, label %next_branch
+
+digit.i:                                          ; preds = %grammo_out_sync.exit174, %digit.i
+  %.169.i = phi i8 [ %.16.i188, %digit.i ], [ %.164.i, %grammo_out_sync.exit174 ]
+  %value8.i = phi i32 [ %.23.i, %digit.i ], [ 0, %grammo_out_sync.exit174 ]
+  %i7.i = phi i64 [ %.20.i184, %digit.i ], [ %.11.i183, %grammo_out_sync.exit174 ]
+  %.20.i184 = add nuw i64 %i7.i, 1
+  %.21.i185 = mul i32 %value8.i, 10
+  %.22.i186 = zext nneg i8 %.169.i to i32
+  %.23.i = add i32 %.21.i185, %.22.i186
+  %.13.i = icmp ult i64 %.20.i184, %.3.i175
+  %.14.i = getelementptr i8, ptr %.6.i178, i64 %.20.i184
+  %.15.i187 = load i8, ptr %.14.i, align 1
+  %.16.i188 = add i8 %.15.i187, -48
+  %.17.i = icmp ult i8 %.16.i188, 10
+  %.18.i = and i1 %.13.i, %.17.i
+  br i1 %.18.i, label %digit.i, label %end_digits.i
+
+end_digits.i:                                     ; preds = %digit.i
+  %.25.not.i = icmp ult i64 %i7.i, %.11.i183
+  br i1 %.25.not.i, label %next_branch, label %grammo_in_read_int.exit
+
+grammo_in_read_int.exit:                          ; preds = %end_digits.i
+  %.27.i = sub i32 0, %.23.i
+  %.28.i = select i1 %.8.i180, i32 %.27.i, i32 %.23.i
+  %.31.i = add i64 %.20.i184, %.5.i177
+  store i64 %.31.i, ptr @grammo_in_pos, align 8
+  %.33 = icmp slt i32 %.28.i, 0
+  br i1 %.33, label %if_then, label %next_branch
+
+common.ret:                                       ; preds = %body.i, %loop.i, %body.i395, %loop.i392
+  store i64 0, ptr @grammo_out_len, align 8
   ret void
 
-if_then:                                          ; preds = %entry
-  %.30 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_8)
-  br label %common.ret
+if_then:                                          ; preds = %grammo_in_read_int.exit
+  %.4.i190 = load i64, ptr @grammo_out_len, align 8
+  %.5.i191 = add i64 %.4.i190, 31
+  %.6.b.i192 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i193 = select i1 %.6.b.i192, i64 65536, i64 0
+  %.7.not.i194 = icmp ugt i64 %.5.i191, %.6.i193
+  %.20.pre1.i195 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i194, label %loop.i.i199, label %grammo_out_reserve.exit213
+
+loop.i.i199:                                      ; preds = %if_then, %body.i.i207
+  %written.i.i200 = phi i64 [ %.10.i.i211, %body.i.i207 ], [ 0, %if_then ]
+  %.5.i.i201 = icmp slt i64 %written.i.i200, %.4.i190
+  br i1 %.5.i.i201, label %body.i.i207, label %grammo_out_flush.exit.i202
+
+body.i.i207:                                      ; preds = %loop.i.i199
+  %.7.i.i208 = getelementptr i8, ptr %.20.pre1.i195, i64 %written.i.i200
+  %.8.i.i209 = sub i64 %.4.i190, %written.i.i200
+  %.9.i.i210 = tail call i64 @write(i32 1, ptr %.7.i.i208, i64 %.8.i.i209)
+  %.10.i.i211 = add i64 %.9.i.i210, %written.i.i200
+  %.11.i.i212 = icmp sgt i64 %.9.i.i210, 0
+  br i1 %.11.i.i212, label %loop.i.i199, label %grammo_out_flush.exit.i202
+
+grammo_out_flush.exit.i202:                       ; preds = %body.i.i207, %loop.i.i199
+  %.10.b.i203 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i204 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i203, label %grammo_out_reserve.exit213, label %grow.i205
+
+grow.i205:                                        ; preds = %grammo_out_flush.exit.i202
+  %.16.i206 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i204, i64 65536)
+  store ptr %.16.i206, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit213
+
+grammo_out_reserve.exit213:                       ; preds = %if_then, %grammo_out_flush.exit.i202, %grow.i205
+  %.7.i214 = phi i64 [ 0, %grow.i205 ], [ 0, %grammo_out_flush.exit.i202 ], [ %.4.i190, %if_then ]
+  %.20.i197 = phi ptr [ %.16.i206, %grow.i205 ], [ %.20.pre.i204, %grammo_out_flush.exit.i202 ], [ %.20.pre1.i195, %if_then ]
+  %.22.i198 = getelementptr i8, ptr %.20.i197, i64 %.7.i214
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(31) %.22.i198, ptr noundef nonnull align 16 dereferenceable(31) @str_4, i64 31, i1 false)
+  %.8.i215 = add nsw i64 %.7.i214, 30
+  store i64 %.8.i215, ptr @grammo_out_len, align 8
+  %.2.i.i216 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i217 = icmp slt i32 %.2.i.i216, 0
+  br i1 %.3.i.i217, label %check.i.i234, label %grammo_out_interactive.exit.i218
+
+check.i.i234:                                     ; preds = %grammo_out_reserve.exit213
+  %.5.i.i235 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i235, ptr @grammo_out_tty, align 4
+  %.2.i.pre414.pre = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i237.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i218
+
+grammo_out_interactive.exit.i218:                 ; preds = %check.i.i234, %grammo_out_reserve.exit213
+  %.3.i237.pre = phi i64 [ %.3.i237.pre.pre, %check.i.i234 ], [ %.8.i215, %grammo_out_reserve.exit213 ]
+  %.2.i.pre414 = phi ptr [ %.2.i.pre414.pre, %check.i.i234 ], [ %.20.i197, %grammo_out_reserve.exit213 ]
+  %.8.i.i219 = phi i32 [ %.5.i.i235, %check.i.i234 ], [ %.2.i.i216, %grammo_out_reserve.exit213 ]
+  %.9.i.i220 = icmp sgt i32 %.8.i.i219, 0
+  br i1 %.9.i.i220, label %loop.i.i224, label %grammo_out_advance.exit236
+
+loop.i.i224:                                      ; preds = %grammo_out_interactive.exit.i218, %body.i.i228
+  %written.i.i225 = phi i64 [ %.10.i.i232, %body.i.i228 ], [ 0, %grammo_out_interactive.exit.i218 ]
+  %.5.i3.i226 = icmp slt i64 %written.i.i225, %.3.i237.pre
+  br i1 %.5.i3.i226, label %body.i.i228, label %grammo_out_flush.exit.i227
+
+body.i.i228:                                      ; preds = %loop.i.i224
+  %.7.i.i229 = getelementptr i8, ptr %.2.i.pre414, i64 %written.i.i225
+  %.8.i4.i230 = sub i64 %.3.i237.pre, %written.i.i225
+  %.9.i5.i231 = tail call i64 @write(i32 1, ptr %.7.i.i229, i64 %.8.i4.i230)
+  %.10.i.i232 = add i64 %.9.i5.i231, %written.i.i225
+  %.11.i.i233 = icmp sgt i64 %.9.i5.i231, 0
+  br i1 %.11.i.i233, label %loop.i.i224, label %grammo_out_flush.exit.i227
+
+grammo_out_flush.exit.i227:                       ; preds = %body.i.i228, %loop.i.i224
+  store i64 0, ptr @grammo_out_len, align 8
+  %.2.i.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit236
+
+grammo_out_advance.exit236:                       ; preds = %grammo_out_interactive.exit.i218, %grammo_out_flush.exit.i227
+  %.3.i237 = phi i64 [ %.3.i237.pre, %grammo_out_interactive.exit.i218 ], [ 0, %grammo_out_flush.exit.i227 ]
+  %.2.i = phi ptr [ %.2.i.pre414, %grammo_out_interactive.exit.i218 ], [ %.2.i.pre, %grammo_out_flush.exit.i227 ]
+  br label %loop.i
+
+loop.i:                                           ; preds = %body.i, %grammo_out_advance.exit236
+  %written.i = phi i64 [ 0, %grammo_out_advance.exit236 ], [ %.10.i242, %body.i ]
+  %.5.i238 = icmp slt i64 %written.i, %.3.i237
+  br i1 %.5.i238, label %body.i, label %common.ret
+
+body.i:                                           ; preds = %loop.i
+  %.7.i239 = getelementptr i8, ptr %.2.i, i64 %written.i
+  %.8.i240 = sub i64 %.3.i237, %written.i
+  %.9.i241 = tail call i64 @write(i32 1, ptr %.7.i239, i64 %.8.i240)
+  %.10.i242 = add i64 %.9.i241, %written.i
+  %.11.i243 = icmp sgt i64 %.9.i241, 0
+  br i1 %.11.i243, label %loop.i, label %common.ret
 
-next_branch:                                      ; preds = %entry
-  %load_m_principal = load double, ptr %m_principal, align 8
-  %load_m_rate = load double, ptr %m_rate, align 8
-  %.36 = fcmp oeq double %load_m_rate, 0.000000e+00
-  br i1 %.36, label %if_then.1, label %if_merge
+next_branch:                                      ; preds = %grammo_out_sync.exit174, %end_digits.i, %grammo_in_read_int.exit
+  %m_years.0405 = phi i32 [ %.28.i, %grammo_in_read_int.exit ], [ 0, %end_digits.i ], [ 0, %grammo_out_sync.exit174 ]
+  %.42 = fcmp oeq double %m_rate.0, 0.000000e+00
+  %.4.i342.pre.pre429 = load i64, ptr @grammo_out_len, align 8
+  br i1 %.42, label %if_then.1, label %if_merge
 
 if_then.1:                                        ; preds = %next_branch
-  %.39 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_9)
-  %putchar3 = call i32 @putchar(i32 10)
-  %load_m_years.17.pre = load i32, ptr %m_years, align 4
+  %.5.i245 = add i64 %.4.i342.pre.pre429, 30
+  %.6.b.i246 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i247 = select i1 %.6.b.i246, i64 65536, i64 0
+  %.7.not.i248 = icmp ugt i64 %.5.i245, %.6.i247
+  %.20.pre1.i249 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i248, label %loop.i.i253, label %grammo_out_reserve.exit267
+
+loop.i.i253:                                      ; preds = %if_then.1, %body.i.i261
+  %written.i.i254 = phi i64 [ %.10.i.i265, %body.i.i261 ], [ 0, %if_then.1 ]
+  %.5.i.i255 = icmp slt i64 %written.i.i254, %.4.i342.pre.pre429
+  br i1 %.5.i.i255, label %body.i.i261, label %grammo_out_flush.exit.i256
+
+body.i.i261:                                      ; preds = %loop.i.i253
+  %.7.i.i262 = getelementptr i8, ptr %.20.pre1.i249, i64 %written.i.i254
+  %.8.i.i263 = sub i64 %.4.i342.pre.pre429, %written.i.i254
+  %.9.i.i264 = tail call i64 @write(i32 1, ptr %.7.i.i262, i64 %.8.i.i263)
+  %.10.i.i265 = add i64 %.9.i.i264, %written.i.i254
+  %.11.i.i266 = icmp sgt i64 %.9.i.i264, 0
+  br i1 %.11.i.i266, label %loop.i.i253, label %grammo_out_flush.exit.i256
+
+grammo_out_flush.exit.i256:                       ; preds = %body.i.i261, %loop.i.i253
+  %.10.b.i257 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i258 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i257, label %grammo_out_reserve.exit267, label %grow.i259
+
+grow.i259:                                        ; preds = %grammo_out_flush.exit.i256
+  %.16.i260 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i258, i64 65536)
+  store ptr %.16.i260, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit267
+
+grammo_out_reserve.exit267:                       ; preds = %if_then.1, %grammo_out_flush.exit.i256, %grow.i259
+  %.7.i268 = phi i64 [ 0, %grow.i259 ], [ 0, %grammo_out_flush.exit.i256 ], [ %.4.i342.pre.pre429, %if_then.1 ]
+  %.20.i251 = phi ptr [ %.16.i260, %grow.i259 ], [ %.20.pre.i258, %grammo_out_flush.exit.i256 ], [ %.20.pre1.i249, %if_then.1 ]
+  %.22.i252 = getelementptr i8, ptr %.20.i251, i64 %.7.i268
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(30) %.22.i252, ptr noundef nonnull align 16 dereferenceable(30) @str_5, i64 30, i1 false)
+  %.8.i269 = add nsw i64 %.7.i268, 29
+  store i64 %.8.i269, ptr @grammo_out_len, align 8
+  %.2.i.i270 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i271 = icmp slt i32 %.2.i.i270, 0
+  br i1 %.3.i.i271, label %check.i.i288, label %grammo_out_interactive.exit.i272
+
+check.i.i288:                                     ; preds = %grammo_out_reserve.exit267
+  %.5.i.i289 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i289, ptr @grammo_out_tty, align 4
+  %.4.i342.pre.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i272
+
+grammo_out_interactive.exit.i272:                 ; preds = %check.i.i288, %grammo_out_reserve.exit267
+  %.4.i342.pre.pre = phi i64 [ %.4.i342.pre.pre.pre, %check.i.i288 ], [ %.8.i269, %grammo_out_reserve.exit267 ]
+  %.8.i.i273 = phi i32 [ %.5.i.i289, %check.i.i288 ], [ %.2.i.i270, %grammo_out_reserve.exit267 ]
+  %.9.i.i274 = icmp sgt i32 %.8.i.i273, 0
+  br i1 %.9.i.i274, label %flush.i275, label %if_merge
+
+flush.i275:                                       ; preds = %grammo_out_interactive.exit.i272
+  %.2.i1.i276 = load ptr, ptr @grammo_out_buf, align 8
+  br label %loop.i.i278
+
+loop.i.i278:                                      ; preds = %body.i.i282, %flush.i275
+  %written.i.i279 = phi i64 [ 0, %flush.i275 ], [ %.10.i.i286, %body.i.i282 ]
+  %.5.i3.i280 = icmp slt i64 %written.i.i279, %.4.i342.pre.pre
+  br i1 %.5.i3.i280, label %body.i.i282, label %grammo_out_flush.exit.i281
+
+body.i.i282:                                      ; preds = %loop.i.i278
+  %.7.i.i283 = getelementptr i8, ptr %.2.i1.i276, i64 %written.i.i279
+  %.8.i4.i284 = sub i64 %.4.i342.pre.pre, %written.i.i279
+  %.9.i5.i285 = tail call i64 @write(i32 1, ptr %.7.i.i283, i64 %.8.i4.i284)
+  %.10.i.i286 = add i64 %.9.i5.i285, %written.i.i279
+  %.11.i.i287 = icmp sgt i64 %.9.i5.i285, 0
+  br i1 %.11.i.i287, label %loop.i.i278, label %grammo_out_flush.exit.i281
+
+grammo_out_flush.exit.i281:                       ; preds = %body.i.i282, %loop.i.i278
+  store i64 0, ptr @grammo_out_len, align 8
   br label %if_merge
 
-if_merge:                                         ; preds = %if_then.1, %next_branch
-  %load_m_years.17 = phi i32 [ %load_m_years.17.pre, %if_then.1 ], [ %load_m_years, %next_branch ]
-  %.47.not8 = icmp slt i32 %load_m_years.17, 1
-  br i1 %.47.not8, label %for_end, label %for_body
-
-for_body:                                         ; preds = %if_merge, %for_body
-  %m_y.010 = phi i32 [ %.64, %for_body ], [ 1, %if_merge ]
-  %m_balance.09 = phi double [ %.8.i, %for_body ], [ %load_m_principal, %if_merge ]
-  %load_m_rate.1 = load double, ptr %m_rate, align 8
-  %.6.i = fdiv double %load_m_rate.1, 1.000000e+02
-  %.7.i = fadd double %.6.i, 1.000000e+00
-  %.8.i = fmul double %m_balance.09, %.7.i
-  %.53 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_10)
-  %.55 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_7, i32 %m_y.010)
-  %.58 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_11)
-  %.60 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_12, double %.8.i)
-  %putchar5 = call i32 @putchar(i32 10)
-  %.64 = add i32 %m_y.010, 1
-  %load_m_years.1 = load i32, ptr %m_years, align 4
-  %.47.not = icmp sgt i32 %.64, %load_m_years.1
-  br i1 %.47.not, label %for_end, label %for_body
-
-for_end:                                          ; preds = %for_body, %if_merge
-  %m_balance.0.lcssa = phi double [ %load_m_principal, %if_merge ], [ %.8.i, %for_body ]
-  %.69 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_13)
-  %.71 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_12, double %m_balance.0.lcssa)
-  br label %common.ret
+if_merge:                                         ; preds = %grammo_out_flush.exit.i281, %grammo_out_interactive.exit.i272, %next_branch
+  %.4.i342.pre = phi i64 [ 0, %grammo_out_flush.exit.i281 ], [ %.4.i342.pre.pre, %grammo_out_interactive.exit.i272 ], [ %.4.i342.pre.pre429, %next_branch ]
+  %.52.not407 = icmp eq i32 %m_years.0405, 0
+  br i1 %.52.not407, label %for_end, label %for_body.lr.ph
+
+for_body.lr.ph:                                   ; preds = %if_merge
+  %.6.i291 = fdiv double %m_rate.0, 1.000000e+02
+  %.7.i292 = fadd double %.6.i291, 1.000000e+00
+  br label %for_body
+
+for_body:                                         ; preds = %for_body.lr.ph, %grammo_out_advance.exit341
+  %.4.i294 = phi i64 [ %.4.i342.pre, %for_body.lr.ph ], [ %.4.i294419, %grammo_out_advance.exit341 ]
+  %m_y.0409 = phi i32 [ 1, %for_body.lr.ph ], [ %.61, %grammo_out_advance.exit341 ]
+  %m_balance.0408 = phi double [ %m_principal.0, %for_body.lr.ph ], [ %.8.i293, %grammo_out_advance.exit341 ]
+  %.8.i293 = fmul double %.7.i292, %m_balance.0408
+  %.5.i295 = add i64 %.4.i294, 345
+  %.6.b.i296 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i297 = select i1 %.6.b.i296, i64 65536, i64 0
+  %.7.not.i298 = icmp ugt i64 %.5.i295, %.6.i297
+  %.20.pre1.i299 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i298, label %loop.i.i303, label %grammo_out_reserve.exit317
+
+loop.i.i303:                                      ; preds = %for_body, %body.i.i311
+  %written.i.i304 = phi i64 [ %.10.i.i315, %body.i.i311 ], [ 0, %for_body ]
+  %.5.i.i305 = icmp slt i64 %written.i.i304, %.4.i294
+  br i1 %.5.i.i305, label %body.i.i311, label %grammo_out_flush.exit.i306
+
+body.i.i311:                                      ; preds = %loop.i.i303
+  %.7.i.i312 = getelementptr i8, ptr %.20.pre1.i299, i64 %written.i.i304
+  %.8.i.i313 = sub i64 %.4.i294, %written.i.i304
+  %.9.i.i314 = tail call i64 @write(i32 1, ptr %.7.i.i312, i64 %.8.i.i313)
+  %.10.i.i315 = add i64 %.9.i.i314, %written.i.i304
+  %.11.i.i316 = icmp sgt i64 %.9.i.i314, 0
+  br i1 %.11.i.i316, label %loop.i.i303, label %grammo_out_flush.exit.i306
+
+grammo_out_flush.exit.i306:                       ; preds = %body.i.i311, %loop.i.i303
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i307 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i308 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i307, label %grammo_out_reserve.exit317, label %grow.i309
+
+grow.i309:                                        ; preds = %grammo_out_flush.exit.i306
+  %.16.i310 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i308, i64 65536)
+  store ptr %.16.i310, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit317
+
+grammo_out_reserve.exit317:                       ; preds = %for_body, %grammo_out_flush.exit.i306, %grow.i309
+  %.21.i300 = phi i64 [ 0, %grow.i309 ], [ 0, %grammo_out_flush.exit.i306 ], [ %.4.i294, %for_body ]
+  %.20.i301 = phi ptr [ %.16.i310, %grow.i309 ], [ %.20.pre.i308, %grammo_out_flush.exit.i306 ], [ %.20.pre1.i299, %for_body ]
+  %.22.i302 = getelementptr i8, ptr %.20.i301, i64 %.21.i300
+  %.59 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i302, i64 345, ptr nonnull @str_6, i32 %m_y.0409, double %.8.i293)
+  %1 = tail call i32 @llvm.smax.i32(i32 %.59, i32 0)
+  %.6.i318 = zext nneg i32 %1 to i64
+  %.7.i319 = load i64, ptr @grammo_out_len, align 8
+  %.8.i320 = add i64 %.7.i319, %.6.i318
+  store i64 %.8.i320, ptr @grammo_out_len, align 8
+  %.2.i.i321 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i322 = icmp slt i32 %.2.i.i321, 0
+  br i1 %.3.i.i322, label %check.i.i339, label %grammo_out_interactive.exit.i323
+
+check.i.i339:                                     ; preds = %grammo_out_reserve.exit317
+  %.5.i.i340 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i340, ptr @grammo_out_tty, align 4
+  %.4.i294.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i323
+
+grammo_out_interactive.exit.i323:                 ; preds = %check.i.i339, %grammo_out_reserve.exit317
+  %.3.i2.i328 = phi i64 [ %.4.i294.pre, %check.i.i339 ], [ %.8.i320, %grammo_out_reserve.exit317 ]
+  %.8.i.i324 = phi i32 [ %.5.i.i340, %check.i.i339 ], [ %.2.i.i321, %grammo_out_reserve.exit317 ]
+  %.9.i.i325 = icmp sgt i32 %.8.i.i324, 0
+  br i1 %.9.i.i325, label %flush.i326, label %grammo_out_advance.exit341
+
+flush.i326:                                       ; preds = %grammo_out_interactive.exit.i323
+  %.2.i1.i327 = load ptr, ptr @grammo_out_buf, align 8
+  br label %loop.i.i329
+
+loop.i.i329:                                      ; preds = %body.i.i333, %flush.i326
+  %written.i.i330 = phi i64 [ 0, %flush.i326 ], [ %.10.i.i337, %body.i.i333 ]
+  %.5.i3.i331 = icmp slt i64 %written.i.i330, %.3.i2.i328
+  br i1 %.5.i3.i331, label %body.i.i333, label %grammo_out_flush.exit.i332
+
+body.i.i333:                                      ; preds = %loop.i.i329
+  %.7.i.i334 = getelementptr i8, ptr %.2.i1.i327, i64 %written.i.i330
+  %.8.i4.i335 = sub i64 %.3.i2.i328, %written.i.i330
+  %.9.i5.i336 = tail call i64 @write(i32 1, ptr %.7.i.i334, i64 %.8.i4.i335)
+  %.10.i.i337 = add i64 %.9.i5.i336, %written.i.i330
+  %.11.i.i338 = icmp sgt i64 %.9.i5.i336, 0
+  br i1 %.11.i.i338, label %loop.i.i329, label %grammo_out_flush.exit.i332
+
+grammo_out_flush.exit.i332:                       ; preds = %body.i.i333, %loop.i.i329
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_advance.exit341
+
+grammo_out_advance.exit341:                       ; preds = %grammo_out_interactive.exit.i323, %grammo_out_flush.exit.i332
+  %.4.i294419 = phi i64 [ %.3.i2.i328, %grammo_out_interactive.exit.i323 ], [ 0, %grammo_out_flush.exit.i332 ]
+  %.61 = add i32 %m_y.0409, 1
+  %.52.not = icmp sgt i32 %.61, %m_years.0405
+  br i1 %.52.not, label %for_end, label %for_body
+
+for_end:                                          ; preds = %grammo_out_advance.exit341, %if_merge
+  %.4.i342 = phi i64 [ %.4.i342.pre, %if_merge ], [ %.4.i294419, %grammo_out_advance.exit341 ]
+  %m_balance.0.lcssa = phi double [ %m_principal.0, %if_merge ], [ %.8.i293, %grammo_out_advance.exit341 ]
+  %.5.i343 = add i64 %.4.i342, 335
+  %.6.b.i344 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i345 = select i1 %.6.b.i344, i64 65536, i64 0
+  %.7.not.i346 = icmp ugt i64 %.5.i343, %.6.i345
+  %.20.pre1.i347 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i346, label %loop.i.i351, label %grammo_out_reserve.exit365
+
+loop.i.i351:                                      ; preds = %for_end, %body.i.i359
+  %written.i.i352 = phi i64 [ %.10.i.i363, %body.i.i359 ], [ 0, %for_end ]
+  %.5.i.i353 = icmp slt i64 %written.i.i352, %.4.i342
+  br i1 %.5.i.i353, label %body.i.i359, label %grammo_out_flush.exit.i354
+
+body.i.i359:                                      ; preds = %loop.i.i351
+  %.7.i.i360 = getelementptr i8, ptr %.20.pre1.i347, i64 %written.i.i352
+  %.8.i.i361 = sub i64 %.4.i342, %written.i.i352
+  %.9.i.i362 = tail call i64 @write(i32 1, ptr %.7.i.i360, i64 %.8.i.i361)
+  %.10.i.i363 = add i64 %.9.i.i362, %written.i.i352
+  %.11.i.i364 = icmp sgt i64 %.9.i.i362, 0
+  br i1 %.11.i.i364, label %loop.i.i351, label %grammo_out_flush.exit.i354
+
+grammo_out_flush.exit.i354:                       ; preds = %body.i.i359, %loop.i.i351
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i355 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i356 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i355, label %grammo_out_reserve.exit365, label %grow.i357
+
+grow.i357:                                        ; preds = %grammo_out_flush.exit.i354
+  %.16.i358 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i356, i64 65536)
+  store ptr %.16.i358, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit365
+
+grammo_out_reserve.exit365:                       ; preds = %for_end, %grammo_out_flush.exit.i354, %grow.i357
+  %.21.i348 = phi i64 [ 0, %grow.i357 ], [ 0, %grammo_out_flush.exit.i354 ], [ %.4.i342, %for_end ]
+  %.20.i349 = phi ptr [ %.16.i358, %grow.i357 ], [ %.20.pre.i356, %grammo_out_flush.exit.i354 ], [ %.20.pre1.i347, %for_end ]
+  %.22.i350 = getelementptr i8, ptr %.20.i349, i64 %.21.i348
+  %.67 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i350, i64 335, ptr nonnull @str_7, double %m_balance.0.lcssa)
+  %2 = tail call i32 @llvm.smax.i32(i32 %.67, i32 0)
+  %.6.i366 = zext nneg i32 %2 to i64
+  %.7.i367 = load i64, ptr @grammo_out_len, align 8
+  %.8.i368 = add i64 %.7.i367, %.6.i366
+  store i64 %.8.i368, ptr @grammo_out_len, align 8
+  %.2.i.i369 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i370 = icmp slt i32 %.2.i.i369, 0
+  br i1 %.3.i.i370, label %check.i.i387, label %grammo_out_interactive.exit.i371
+
+check.i.i387:                                     ; preds = %grammo_out_reserve.exit365
+  %.5.i.i388 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i388, ptr @grammo_out_tty, align 4
+  %.3.i391.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i371
+
+grammo_out_interactive.exit.i371:                 ; preds = %check.i.i387, %grammo_out_reserve.exit365
+  %.3.i391.pre = phi i64 [ %.3.i391.pre.pre, %check.i.i387 ], [ %.8.i368, %grammo_out_reserve.exit365 ]
+  %.8.i.i372 = phi i32 [ %.5.i.i388, %check.i.i387 ], [ %.2.i.i369, %grammo_out_reserve.exit365 ]
+  %.9.i.i373 = icmp sgt i32 %.8.i.i372, 0
+  %.2.i390.pre422 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i373, label %loop.i.i377, label %grammo_out_advance.exit389
+
+loop.i.i377:                                      ; preds = %grammo_out_interactive.exit.i371, %body.i.i381
+  %written.i.i378 = phi i64 [ %.10.i.i385, %body.i.i381 ], [ 0, %grammo_out_interactive.exit.i371 ]
+  %.5.i3.i379 = icmp slt i64 %written.i.i378, %.3.i391.pre
+  br i1 %.5.i3.i379, label %body.i.i381, label %grammo_out_flush.exit.i380
+
+body.i.i381:                                      ; preds = %loop.i.i377
+  %.7.i.i382 = getelementptr i8, ptr %.2.i390.pre422, i64 %written.i.i378
+  %.8.i4.i383 = sub i64 %.3.i391.pre, %written.i.i378
+  %.9.i5.i384 = tail call i64 @write(i32 1, ptr %.7.i.i382, i64 %.8.i4.i383)
+  %.10.i.i385 = add i64 %.9.i5.i384, %written.i.i378
+  %.11.i.i386 = icmp sgt i64 %.9.i5.i384, 0
+  br i1 %.11.i.i386, label %loop.i.i377, label %grammo_out_flush.exit.i380
+
+grammo_out_flush.exit.i380:                       ; preds = %body.i.i381, %loop.i.i377
+  store i64 0, ptr @grammo_out_len, align 8
+  %.2.i390.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit389
+
+grammo_out_advance.exit389:                       ; preds = %grammo_out_interactive.exit.i371, %grammo_out_flush.exit.i380
+  %.3.i391 = phi i64 [ %.3.i391.pre, %grammo_out_interactive.exit.i371 ], [ 0, %grammo_out_flush.exit.i380 ]
+  %.2.i390 = phi ptr [ %.2.i390.pre422, %grammo_out_interactive.exit.i371 ], [ %.2.i390.pre, %grammo_out_flush.exit.i380 ]
+  br label %loop.i392
+
+loop.i392:                                        ; preds = %body.i395, %grammo_out_advance.exit389
+  %written.i393 = phi i64 [ 0, %grammo_out_advance.exit389 ], [ %.10.i399, %body.i395 ]
+  %.5.i394 = icmp slt i64 %written.i393, %.3.i391
+  br i1 %.5.i394, label %body.i395, label %common.ret
+
+body.i395:                                        ; preds = %loop.i392
+  %.7.i396 = getelementptr i8, ptr %.2.i390, i64 %written.i393
+  %.8.i397 = sub i64 %.3.i391, %written.i393
+  %.9.i398 = tail call i64 @write(i32 1, ptr %.7.i396, i64 %.8.i397)
+  %.10.i399 = add i64 %.9.i398, %written.i393
+  %.11.i400 = icmp sgt i64 %.9.i398, 0
+  br i1 %.11.i400, label %loop.i392, label %common.ret
 }
 
-; Function Attrs: nofree nounwind
-declare noundef i32 @putchar(i32 noundef) local_unnamed_addr #0
+; Function Attrs: nounwind
+define internal fastcc i64 @grammo_in_token() unnamed_addr #2 {
+entry:
+  %.3.pre = load i64, ptr @grammo_in_pos, align 8
+  %.4.pre = load i64, ptr @grammo_in_end, align 8
+  br label %skip.outer
+
+skip.outer:                                       ; preds = %grammo_in_fill.exit, %entry
+  %.4.ph = phi i64 [ %.33.i, %grammo_in_fill.exit ], [ %.4.pre, %entry ]
+  %.3.ph = phi i64 [ 0, %grammo_in_fill.exit ], [ %.3.pre, %entry ]
+  %.9 = load ptr, ptr @grammo_in_buf, align 8
+  br label %skip
+
+skip:                                             ; preds = %skip.outer, %skip_next
+  %.3 = phi i64 [ %.19, %skip_next ], [ %.3.ph, %skip.outer ]
+  %.5 = icmp ult i64 %.3, %.4.ph
+  br i1 %.5, label %skip_test, label %skip_fill
+
+skip_fill:                                        ; preds = %skip
+  %.3.i = icmp eq ptr %.9, null
+  br i1 %.3.i, label %alloc.i, label %entry.check_full_crit_edge.i
+
+entry.check_full_crit_edge.i:                     ; preds = %skip_fill
+  %.12.pre.i = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i
+
+alloc.i:                                          ; preds = %skip_fill
+  %.5.i = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i
+
+check_full.i:                                     ; preds = %alloc.i, %entry.check_full_crit_edge.i
+  %.17.i = phi ptr [ %.9, %entry.check_full_crit_edge.i ], [ %.5.i, %alloc.i ]
+  %.12.i = phi i64 [ %.12.pre.i, %entry.check_full_crit_edge.i ], [ 65536, %alloc.i ]
+  %.11.i = sub i64 %.4.ph, %.3
+  %.13.i = icmp eq i64 %.11.i, %.12.i
+  br i1 %.13.i, label %grow.i, label %grammo_in_fill.exit
+
+grow.i:                                           ; preds = %check_full.i
+  %.16.i = shl i64 %.12.i, 1
+  %.18.i = or disjoint i64 %.16.i, 1
+  %.19.i = tail call ptr @realloc(ptr %.17.i, i64 %.18.i)
+  store ptr %.19.i, ptr @grammo_in_buf, align 8
+  store i64 %.16.i, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit
+
+grammo_in_fill.exit:                              ; preds = %check_full.i, %grow.i
+  %.28.i = phi i64 [ %.16.i, %grow.i ], [ %.12.i, %check_full.i ]
+  %.23.i = phi ptr [ %.19.i, %grow.i ], [ %.17.i, %check_full.i ]
+  %.25.i = getelementptr i8, ptr %.23.i, i64 %.3
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i, ptr align 1 %.25.i, i64 %.11.i, i1 false)
+  %.27.i = getelementptr i8, ptr %.23.i, i64 %.11.i
+  %.29.i = sub i64 %.28.i, %.11.i
+  %.30.i = tail call i64 @read(i32 0, ptr %.27.i, i64 %.29.i)
+  %.31.i = icmp sgt i64 %.30.i, 0
+  %.32.i = tail call i64 @llvm.smax.i64(i64 %.30.i, i64 0)
+  %.33.i = add i64 %.32.i, %.11.i
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i, ptr @grammo_in_end, align 8
+  %.36.i = getelementptr i8, ptr %.23.i, i64 %.33.i
+  store i8 0, ptr %.36.i, align 1
+  br i1 %.31.i, label %skip.outer, label %common.ret
+
+skip_test:                                        ; preds = %skip
+  %.11 = getelementptr i8, ptr %.9, i64 %.3
+  %.12 = load i8, ptr %.11, align 1
+  switch i8 %.12, label %scan.outer [
+    i8 32, label %skip_next
+    i8 13, label %skip_next
+    i8 12, label %skip_next
+    i8 11, label %skip_next
+    i8 10, label %skip_next
+    i8 9, label %skip_next
+  ]
+
+skip_next:                                        ; preds = %skip_test, %skip_test, %skip_test, %skip_test, %skip_test, %skip_test
+  %.19 = add nuw i64 %.3, 1
+  store i64 %.19, ptr @grammo_in_pos, align 8
+  br label %skip
+
+scan:                                             ; preds = %grammo_in_fill.exit28.peel, %grammo_in_fill.exit28
+  %.24 = phi i64 [ %.33.i20, %grammo_in_fill.exit28 ], [ %.33.i20.peel, %grammo_in_fill.exit28.peel ]
+  %.25 = icmp ult i64 %length.ph, %.24
+  %.27 = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.25, label %scan_test, label %scan_fill
+
+scan_test:                                        ; preds = %scan, %scan.outer
+  %.24.lcssa = phi i64 [ %.2444, %scan.outer ], [ %.24, %scan ]
+  %.22.lcssa = phi i64 [ %.2242, %scan.outer ], [ 0, %scan ]
+  %.23.lcssa = phi i64 [ %.23.peel, %scan.outer ], [ %length.ph, %scan ]
+  %.27.lcssa = phi ptr [ %.27.peel, %scan.outer ], [ %.27, %scan ]
+  %.28 = getelementptr i8, ptr %.27.lcssa, i64 %.23.lcssa
+  %.29 = load i8, ptr %.28, align 1
+  switch i8 %.29, label %scan_next [
+    i8 32, label %common.ret
+    i8 13, label %common.ret
+    i8 12, label %common.ret
+    i8 11, label %common.ret
+    i8 10, label %common.ret
+    i8 9, label %common.ret
+  ]
+
+scan_next:                                        ; preds = %scan_test
+  %.35 = add i64 %length.ph, 1
+  br label %scan.outer
+
+scan.outer:                                       ; preds = %skip_test, %scan_next
+  %.2444 = phi i64 [ %.24.lcssa, %scan_next ], [ %.4.ph, %skip_test ]
+  %.2242 = phi i64 [ %.22.lcssa, %scan_next ], [ %.3, %skip_test ]
+  %length.ph = phi i64 [ %.35, %scan_next ], [ 1, %skip_test ]
+  %.23.peel = add i64 %.2242, %length.ph
+  %.25.peel = icmp ult i64 %.23.peel, %.2444
+  %.27.peel = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.25.peel, label %scan_test, label %scan_fill.peel
+
+scan_fill.peel:                                   ; preds = %scan.outer
+  %.3.i2.peel = icmp eq ptr %.27.peel, null
+  br i1 %.3.i2.peel, label %alloc.i26.peel, label %entry.check_full_crit_edge.i3.peel
+
+entry.check_full_crit_edge.i3.peel:               ; preds = %scan_fill.peel
+  %.12.pre.i4.peel = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.peel
+
+alloc.i26.peel:                                   ; preds = %scan_fill.peel
+  %.5.i27.peel = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i27.peel, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.peel
+
+check_full.i5.peel:                               ; preds = %alloc.i26.peel, %entry.check_full_crit_edge.i3.peel
+  %.17.i6.peel = phi ptr [ %.27.peel, %entry.check_full_crit_edge.i3.peel ], [ %.5.i27.peel, %alloc.i26.peel ]
+  %.12.i7.peel = phi i64 [ %.12.pre.i4.peel, %entry.check_full_crit_edge.i3.peel ], [ 65536, %alloc.i26.peel ]
+  %.11.i10.peel = sub i64 %.2444, %.2242
+  %.13.i11.peel = icmp eq i64 %.11.i10.peel, %.12.i7.peel
+  br i1 %.13.i11.peel, label %grow.i22.peel, label %grammo_in_fill.exit28.peel
+
+grow.i22.peel:                                    ; preds = %check_full.i5.peel
+  %.16.i23.peel = shl i64 %.12.i7.peel, 1
+  %.18.i24.peel = or disjoint i64 %.16.i23.peel, 1
+  %.19.i25.peel = tail call ptr @realloc(ptr %.17.i6.peel, i64 %.18.i24.peel)
+  store ptr %.19.i25.peel, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23.peel, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28.peel
+
+grammo_in_fill.exit28.peel:                       ; preds = %grow.i22.peel, %check_full.i5.peel
+  %.28.i12.peel = phi i64 [ %.16.i23.peel, %grow.i22.peel ], [ %.12.i7.peel, %check_full.i5.peel ]
+  %.23.i13.peel = phi ptr [ %.19.i25.peel, %grow.i22.peel ], [ %.17.i6.peel, %check_full.i5.peel ]
+  %.25.i14.peel = getelementptr i8, ptr %.23.i13.peel, i64 %.2242
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i13.peel, ptr align 1 %.25.i14.peel, i64 %.11.i10.peel, i1 false)
+  %.27.i15.peel = getelementptr i8, ptr %.23.i13.peel, i64 %.11.i10.peel
+  %.29.i16.peel = sub i64 %.28.i12.peel, %.11.i10.peel
+  %.30.i17.peel = tail call i64 @read(i32 0, ptr %.27.i15.peel, i64 %.29.i16.peel)
+  %.31.i18.peel = icmp sgt i64 %.30.i17.peel, 0
+  %.32.i19.peel = tail call i64 @llvm.smax.i64(i64 %.30.i17.peel, i64 0)
+  %.33.i20.peel = add i64 %.32.i19.peel, %.11.i10.peel
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20.peel, ptr @grammo_in_end, align 8
+  %.36.i21.peel = getelementptr i8, ptr %.23.i13.peel, i64 %.33.i20.peel
+  store i8 0, ptr %.36.i21.peel, align 1
+  br i1 %.31.i18.peel, label %scan, label %common.ret
+
+scan_fill:                                        ; preds = %scan
+  %.3.i2 = icmp eq ptr %.27, null
+  br i1 %.3.i2, label %alloc.i26, label %entry.check_full_crit_edge.i3
+
+entry.check_full_crit_edge.i3:                    ; preds = %scan_fill
+  %.12.pre.i4 = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i5
+
+alloc.i26:                                        ; preds = %scan_fill
+  %.5.i27 = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i27, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i5
+
+check_full.i5:                                    ; preds = %alloc.i26, %entry.check_full_crit_edge.i3
+  %.17.i6 = phi ptr [ %.27, %entry.check_full_crit_edge.i3 ], [ %.5.i27, %alloc.i26 ]
+  %.12.i7 = phi i64 [ %.12.pre.i4, %entry.check_full_crit_edge.i3 ], [ 65536, %alloc.i26 ]
+  %.13.i11 = icmp eq i64 %.24, %.12.i7
+  br i1 %.13.i11, label %grow.i22, label %grammo_in_fill.exit28
+
+grow.i22:                                         ; preds = %check_full.i5
+  %.16.i23 = shl i64 %.12.i7, 1
+  %.18.i24 = or disjoint i64 %.16.i23, 1
+  %.19.i25 = tail call ptr @realloc(ptr %.17.i6, i64 %.18.i24)
+  store ptr %.19.i25, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28
+
+grammo_in_fill.exit28:                            ; preds = %check_full.i5, %grow.i22
+  %.28.i12 = phi i64 [ %.16.i23, %grow.i22 ], [ %.12.i7, %check_full.i5 ]
+  %.23.i13 = phi ptr [ %.19.i25, %grow.i22 ], [ %.17.i6, %check_full.i5 ]
+  %.27.i15 = getelementptr i8, ptr %.23.i13, i64 %.24
+  %.29.i16 = sub i64 %.28.i12, %.24
+  %.30.i17 = tail call i64 @read(i32 0, ptr %.27.i15, i64 %.29.i16)
+  %.31.i18 = icmp sgt i64 %.30.i17, 0
+  %.32.i19 = tail call i64 @llvm.smax.i64(i64 %.30.i17, i64 0)
+  %.33.i20 = add i64 %.32.i19, %.24
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20, ptr @grammo_in_end, align 8
+  %.36.i21 = getelementptr i8, ptr %.23.i13, i64 %.33.i20
+  store i8 0, ptr %.36.i21, align 1
+  br i1 %.31.i18, label %scan, label %common.ret, !llvm.loop !0
+
+common.ret:                                       ; preds = %grammo_in_fill.exit, %scan_test, %scan_test, %scan_test, %scan_test, %scan_test, %scan_test, %grammo_in_fill.exit28, %grammo_in_fill.exit28.peel
+  %common.ret.op = phi i64 [ %length.ph, %grammo_in_fill.exit28.peel ], [ %length.ph, %grammo_in_fill.exit28 ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ 0, %grammo_in_fill.exit ]
+  ret i64 %common.ret.op
+}
+
+; Function Attrs: nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memcpy.p0.p0.i64(ptr noalias nocapture writeonly, ptr noalias nocapture readonly, i64, i1 immarg) #6
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i64 @llvm.smax.i64(i64, i64) #7
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i32 @llvm.smax.i32(i32, i32) #7
+
+; Function Attrs: nocallback nofree nosync nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.lifetime.start.p0(i64 immarg, ptr nocapture) #8
+
+; Function Attrs: nocallback nofree nosync nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.lifetime.end.p0(i64 immarg, ptr nocapture) #8
 
 attributes #0 = { nofree nounwind }
-attributes #1 = { mustprogress nofree norecurse nosync nounwind willreturn memory(none) }
+attributes #1 = { mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #2 = { nounwind }
+attributes #3 = { mustprogress nofree nounwind willreturn }
+attributes #4 = { mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #5 = { mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+attributes #6 = { nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+attributes #7 = { nocallback nofree nosync nounwind speculatable willreturn memory(none) }
+attributes #8 = { nocallback nofree nosync nounwind willreturn memory(argmem: readwrite) }
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.peeled.count", i32 1}
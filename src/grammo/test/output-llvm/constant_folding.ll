@@ -0,0 +1,866 @@
+; ModuleID = '<string>'
+source_filename = "<string>"
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-i128:128-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-unknown-linux-gnu"
+
+@g.CALLS = internal unnamed_addr global i32 0
+@grammo_out_buf = internal unnamed_addr global ptr null
+@grammo_out_cap = internal unnamed_addr global i1 false
+@grammo_out_len = internal unnamed_addr global i64 0
+@grammo_out_tty = internal unnamed_addr global i32 -1
+@str_0 = private constant [13 x i8] c"  trace(%d)\0A\00"
+@str_1 = private constant [13 x i8] c"overflow=%d\0A\00"
+@str_2 = private constant [20 x i8] c"divisioni=%d %d %d\0A\00"
+@str_3 = private constant [22 x i8] c"reali=%.6f %.6f %.6f\0A\00"
+@str_4 = private constant [15 x i8] c"bool=%d %d %d\0A\00"
+@str_5 = private constant [23 x i8] c"chiamata mantenuta=%d\0A\00"
+@str_6 = private unnamed_addr constant [13 x i8] c"grammo-lang\0A\00"
+@str_7 = private constant [20 x i8] c"for init=%d bucket=\00"
+@str_8 = private constant [4 x i8] c"%d \00"
+@str_9 = private constant [4 x i8] c"%d\0A\00"
+@str_10 = private constant [21 x i8] c"chiamate a trace=%d\0A\00"
+
+; Function Attrs: nofree nounwind
+declare noundef i32 @snprintf(ptr noalias nocapture noundef writeonly, i64 noundef, ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+
+; Function Attrs: mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite)
+declare noalias noundef ptr @realloc(ptr allocptr nocapture, i64 noundef) local_unnamed_addr #1
+
+; Function Attrs: nofree nounwind
+declare noundef i64 @write(i32 noundef, ptr nocapture noundef readonly, i64 noundef) local_unnamed_addr #0
+
+; Function Attrs: nounwind
+declare i32 @isatty(i32) local_unnamed_addr #2
+
+; Function Attrs: nounwind
+define void @main() local_unnamed_addr #2 {
+entry:
+  %.4.i = load i64, ptr @grammo_out_len, align 8
+  %.5.i = add i64 %.4.i, 22
+  %.6.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i = select i1 %.6.b.i, i64 65536, i64 0
+  %.7.not.i = icmp ugt i64 %.5.i, %.6.i
+  %.20.pre1.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i, label %loop.i.i, label %grammo_out_reserve.exit
+
+loop.i.i:                                         ; preds = %entry, %body.i.i
+  %written.i.i = phi i64 [ %.10.i.i, %body.i.i ], [ 0, %entry ]
+  %.5.i.i = icmp slt i64 %written.i.i, %.4.i
+  br i1 %.5.i.i, label %body.i.i, label %grammo_out_flush.exit.i
+
+body.i.i:                                         ; preds = %loop.i.i
+  %.7.i.i = getelementptr i8, ptr %.20.pre1.i, i64 %written.i.i
+  %.8.i.i = sub i64 %.4.i, %written.i.i
+  %.9.i.i = tail call i64 @write(i32 1, ptr %.7.i.i, i64 %.8.i.i)
+  %.10.i.i = add i64 %.9.i.i, %written.i.i
+  %.11.i.i = icmp sgt i64 %.9.i.i, 0
+  br i1 %.11.i.i, label %loop.i.i, label %grammo_out_flush.exit.i
+
+grammo_out_flush.exit.i:                          ; preds = %body.i.i, %loop.i.i
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i, label %grammo_out_reserve.exit, label %grow.i
+
+grow.i:                                           ; preds = %grammo_out_flush.exit.i
+  %.16.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i, i64 65536)
+  store ptr %.16.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit
+
+grammo_out_reserve.exit:                          ; preds = %entry, %grammo_out_flush.exit.i, %grow.i
+  %.21.i = phi i64 [ 0, %grow.i ], [ 0, %grammo_out_flush.exit.i ], [ %.4.i, %entry ]
+  %.20.i = phi ptr [ %.16.i, %grow.i ], [ %.20.pre.i, %grammo_out_flush.exit.i ], [ %.20.pre1.i, %entry ]
+  %.22.i = getelementptr i8, ptr %.20.i, i64 %.21.i
+  %.9 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i, i64 22, ptr nonnull @str_1, i32 -2147483648)
+  %0 = tail call i32 @llvm.smax.i32(i32 %.9, i32 0)
+  %.6.i2 = zext nneg i32 %0 to i64
+  %.7.i = load i64, ptr @grammo_out_len, align 8
+  %.8.i = add i64 %.7.i, %.6.i2
+  store i64 %.8.i, ptr @grammo_out_len, align 8
+  %.2.i.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i = icmp slt i32 %.2.i.i, 0
+  br i1 %.3.i.i, label %check.i.i, label %grammo_out_interactive.exit.i
+
+check.i.i:                                        ; preds = %grammo_out_reserve.exit
+  %.5.i.i12 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i12, ptr @grammo_out_tty, align 4
+  %.4.i13.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i
+
+grammo_out_interactive.exit.i:                    ; preds = %check.i.i, %grammo_out_reserve.exit
+  %.4.i13.pre = phi i64 [ %.4.i13.pre.pre, %check.i.i ], [ %.8.i, %grammo_out_reserve.exit ]
+  %.8.i.i3 = phi i32 [ %.5.i.i12, %check.i.i ], [ %.2.i.i, %grammo_out_reserve.exit ]
+  %.9.i.i4 = icmp sgt i32 %.8.i.i3, 0
+  %.20.pre1.i18.pre411 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i4, label %loop.i.i5, label %grammo_out_advance.exit
+
+loop.i.i5:                                        ; preds = %grammo_out_interactive.exit.i, %body.i.i8
+  %written.i.i6 = phi i64 [ %.10.i.i10, %body.i.i8 ], [ 0, %grammo_out_interactive.exit.i ]
+  %.5.i3.i = icmp slt i64 %written.i.i6, %.4.i13.pre
+  br i1 %.5.i3.i, label %body.i.i8, label %grammo_out_flush.exit.i7
+
+body.i.i8:                                        ; preds = %loop.i.i5
+  %.7.i.i9 = getelementptr i8, ptr %.20.pre1.i18.pre411, i64 %written.i.i6
+  %.8.i4.i = sub i64 %.4.i13.pre, %written.i.i6
+  %.9.i5.i = tail call i64 @write(i32 1, ptr %.7.i.i9, i64 %.8.i4.i)
+  %.10.i.i10 = add i64 %.9.i5.i, %written.i.i6
+  %.11.i.i11 = icmp sgt i64 %.9.i5.i, 0
+  br i1 %.11.i.i11, label %loop.i.i5, label %grammo_out_flush.exit.i7
+
+grammo_out_flush.exit.i7:                         ; preds = %body.i.i8, %loop.i.i5
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i18.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit
+
+grammo_out_advance.exit:                          ; preds = %grammo_out_interactive.exit.i, %grammo_out_flush.exit.i7
+  %.20.pre1.i18 = phi ptr [ %.20.pre1.i18.pre411, %grammo_out_interactive.exit.i ], [ %.20.pre1.i18.pre, %grammo_out_flush.exit.i7 ]
+  %.4.i13 = phi i64 [ %.4.i13.pre, %grammo_out_interactive.exit.i ], [ 0, %grammo_out_flush.exit.i7 ]
+  %.5.i14 = add i64 %.4.i13, 47
+  %.6.b.i15 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i16 = select i1 %.6.b.i15, i64 65536, i64 0
+  %.7.not.i17 = icmp ugt i64 %.5.i14, %.6.i16
+  br i1 %.7.not.i17, label %loop.i.i22, label %grammo_out_reserve.exit36
+
+loop.i.i22:                                       ; preds = %grammo_out_advance.exit, %body.i.i30
+  %written.i.i23 = phi i64 [ %.10.i.i34, %body.i.i30 ], [ 0, %grammo_out_advance.exit ]
+  %.5.i.i24 = icmp slt i64 %written.i.i23, %.4.i13
+  br i1 %.5.i.i24, label %body.i.i30, label %grammo_out_flush.exit.i25
+
+body.i.i30:                                       ; preds = %loop.i.i22
+  %.7.i.i31 = getelementptr i8, ptr %.20.pre1.i18, i64 %written.i.i23
+  %.8.i.i32 = sub i64 %.4.i13, %written.i.i23
+  %.9.i.i33 = tail call i64 @write(i32 1, ptr %.7.i.i31, i64 %.8.i.i32)
+  %.10.i.i34 = add i64 %.9.i.i33, %written.i.i23
+  %.11.i.i35 = icmp sgt i64 %.9.i.i33, 0
+  br i1 %.11.i.i35, label %loop.i.i22, label %grammo_out_flush.exit.i25
+
+grammo_out_flush.exit.i25:                        ; preds = %body.i.i30, %loop.i.i22
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i26 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i27 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i26, label %grammo_out_reserve.exit36, label %grow.i28
+
+grow.i28:                                         ; preds = %grammo_out_flush.exit.i25
+  %.16.i29 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i27, i64 65536)
+  store ptr %.16.i29, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit36
+
+grammo_out_reserve.exit36:                        ; preds = %grammo_out_advance.exit, %grammo_out_flush.exit.i25, %grow.i28
+  %.21.i19 = phi i64 [ 0, %grow.i28 ], [ 0, %grammo_out_flush.exit.i25 ], [ %.4.i13, %grammo_out_advance.exit ]
+  %.20.i20 = phi ptr [ %.16.i29, %grow.i28 ], [ %.20.pre.i27, %grammo_out_flush.exit.i25 ], [ %.20.pre1.i18, %grammo_out_advance.exit ]
+  %.22.i21 = getelementptr i8, ptr %.20.i20, i64 %.21.i19
+  %.14 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i21, i64 47, ptr nonnull @str_2, i32 -3, i32 -3, i32 26)
+  %1 = tail call i32 @llvm.smax.i32(i32 %.14, i32 0)
+  %.6.i37 = zext nneg i32 %1 to i64
+  %.7.i38 = load i64, ptr @grammo_out_len, align 8
+  %.8.i39 = add i64 %.7.i38, %.6.i37
+  store i64 %.8.i39, ptr @grammo_out_len, align 8
+  %.2.i.i40 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i41 = icmp slt i32 %.2.i.i40, 0
+  br i1 %.3.i.i41, label %check.i.i58, label %grammo_out_interactive.exit.i42
+
+check.i.i58:                                      ; preds = %grammo_out_reserve.exit36
+  %.5.i.i59 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i59, ptr @grammo_out_tty, align 4
+  %.4.i61.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i42
+
+grammo_out_interactive.exit.i42:                  ; preds = %check.i.i58, %grammo_out_reserve.exit36
+  %.4.i61.pre = phi i64 [ %.4.i61.pre.pre, %check.i.i58 ], [ %.8.i39, %grammo_out_reserve.exit36 ]
+  %.8.i.i43 = phi i32 [ %.5.i.i59, %check.i.i58 ], [ %.2.i.i40, %grammo_out_reserve.exit36 ]
+  %.9.i.i44 = icmp sgt i32 %.8.i.i43, 0
+  %.20.pre1.i66.pre414 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i44, label %loop.i.i48, label %grammo_out_advance.exit60
+
+loop.i.i48:                                       ; preds = %grammo_out_interactive.exit.i42, %body.i.i52
+  %written.i.i49 = phi i64 [ %.10.i.i56, %body.i.i52 ], [ 0, %grammo_out_interactive.exit.i42 ]
+  %.5.i3.i50 = icmp slt i64 %written.i.i49, %.4.i61.pre
+  br i1 %.5.i3.i50, label %body.i.i52, label %grammo_out_flush.exit.i51
+
+body.i.i52:                                       ; preds = %loop.i.i48
+  %.7.i.i53 = getelementptr i8, ptr %.20.pre1.i66.pre414, i64 %written.i.i49
+  %.8.i4.i54 = sub i64 %.4.i61.pre, %written.i.i49
+  %.9.i5.i55 = tail call i64 @write(i32 1, ptr %.7.i.i53, i64 %.8.i4.i54)
+  %.10.i.i56 = add i64 %.9.i5.i55, %written.i.i49
+  %.11.i.i57 = icmp sgt i64 %.9.i5.i55, 0
+  br i1 %.11.i.i57, label %loop.i.i48, label %grammo_out_flush.exit.i51
+
+grammo_out_flush.exit.i51:                        ; preds = %body.i.i52, %loop.i.i48
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i66.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit60
+
+grammo_out_advance.exit60:                        ; preds = %grammo_out_interactive.exit.i42, %grammo_out_flush.exit.i51
+  %.20.pre1.i66 = phi ptr [ %.20.pre1.i66.pre414, %grammo_out_interactive.exit.i42 ], [ %.20.pre1.i66.pre, %grammo_out_flush.exit.i51 ]
+  %.4.i61 = phi i64 [ %.4.i61.pre, %grammo_out_interactive.exit.i42 ], [ 0, %grammo_out_flush.exit.i51 ]
+  %.5.i62 = add i64 %.4.i61, 970
+  %.6.b.i63 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i64 = select i1 %.6.b.i63, i64 65536, i64 0
+  %.7.not.i65 = icmp ugt i64 %.5.i62, %.6.i64
+  br i1 %.7.not.i65, label %loop.i.i70, label %grammo_out_reserve.exit84
+
+loop.i.i70:                                       ; preds = %grammo_out_advance.exit60, %body.i.i78
+  %written.i.i71 = phi i64 [ %.10.i.i82, %body.i.i78 ], [ 0, %grammo_out_advance.exit60 ]
+  %.5.i.i72 = icmp slt i64 %written.i.i71, %.4.i61
+  br i1 %.5.i.i72, label %body.i.i78, label %grammo_out_flush.exit.i73
+
+body.i.i78:                                       ; preds = %loop.i.i70
+  %.7.i.i79 = getelementptr i8, ptr %.20.pre1.i66, i64 %written.i.i71
+  %.8.i.i80 = sub i64 %.4.i61, %written.i.i71
+  %.9.i.i81 = tail call i64 @write(i32 1, ptr %.7.i.i79, i64 %.8.i.i80)
+  %.10.i.i82 = add i64 %.9.i.i81, %written.i.i71
+  %.11.i.i83 = icmp sgt i64 %.9.i.i81, 0
+  br i1 %.11.i.i83, label %loop.i.i70, label %grammo_out_flush.exit.i73
+
+grammo_out_flush.exit.i73:                        ; preds = %body.i.i78, %loop.i.i70
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i74 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i75 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i74, label %grammo_out_reserve.exit84, label %grow.i76
+
+grow.i76:                                         ; preds = %grammo_out_flush.exit.i73
+  %.16.i77 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i75, i64 65536)
+  store ptr %.16.i77, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit84
+
+grammo_out_reserve.exit84:                        ; preds = %grammo_out_advance.exit60, %grammo_out_flush.exit.i73, %grow.i76
+  %.21.i67 = phi i64 [ 0, %grow.i76 ], [ 0, %grammo_out_flush.exit.i73 ], [ %.4.i61, %grammo_out_advance.exit60 ]
+  %.20.i68 = phi ptr [ %.16.i77, %grow.i76 ], [ %.20.pre.i75, %grammo_out_flush.exit.i73 ], [ %.20.pre1.i66, %grammo_out_advance.exit60 ]
+  %.22.i69 = getelementptr i8, ptr %.20.i68, i64 %.21.i67
+  %.20 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i69, i64 970, ptr nonnull @str_3, double 5.250000e+00, double -2.500000e+00, double 1.050000e+01)
+  %2 = tail call i32 @llvm.smax.i32(i32 %.20, i32 0)
+  %.6.i85 = zext nneg i32 %2 to i64
+  %.7.i86 = load i64, ptr @grammo_out_len, align 8
+  %.8.i87 = add i64 %.7.i86, %.6.i85
+  store i64 %.8.i87, ptr @grammo_out_len, align 8
+  %.2.i.i88 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i89 = icmp slt i32 %.2.i.i88, 0
+  br i1 %.3.i.i89, label %check.i.i106, label %grammo_out_interactive.exit.i90
+
+check.i.i106:                                     ; preds = %grammo_out_reserve.exit84
+  %.5.i.i107 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i107, ptr @grammo_out_tty, align 4
+  %.4.i109.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i90
+
+grammo_out_interactive.exit.i90:                  ; preds = %check.i.i106, %grammo_out_reserve.exit84
+  %.4.i109.pre = phi i64 [ %.4.i109.pre.pre, %check.i.i106 ], [ %.8.i87, %grammo_out_reserve.exit84 ]
+  %.8.i.i91 = phi i32 [ %.5.i.i107, %check.i.i106 ], [ %.2.i.i88, %grammo_out_reserve.exit84 ]
+  %.9.i.i92 = icmp sgt i32 %.8.i.i91, 0
+  %.20.pre1.i114.pre417 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i92, label %loop.i.i96, label %grammo_out_advance.exit108
+
+loop.i.i96:                                       ; preds = %grammo_out_interactive.exit.i90, %body.i.i100
+  %written.i.i97 = phi i64 [ %.10.i.i104, %body.i.i100 ], [ 0, %grammo_out_interactive.exit.i90 ]
+  %.5.i3.i98 = icmp slt i64 %written.i.i97, %.4.i109.pre
+  br i1 %.5.i3.i98, label %body.i.i100, label %grammo_out_flush.exit.i99
+
+body.i.i100:                                      ; preds = %loop.i.i96
+  %.7.i.i101 = getelementptr i8, ptr %.20.pre1.i114.pre417, i64 %written.i.i97
+  %.8.i4.i102 = sub i64 %.4.i109.pre, %written.i.i97
+  %.9.i5.i103 = tail call i64 @write(i32 1, ptr %.7.i.i101, i64 %.8.i4.i102)
+  %.10.i.i104 = add i64 %.9.i5.i103, %written.i.i97
+  %.11.i.i105 = icmp sgt i64 %.9.i5.i103, 0
+  br i1 %.11.i.i105, label %loop.i.i96, label %grammo_out_flush.exit.i99
+
+grammo_out_flush.exit.i99:                        ; preds = %body.i.i100, %loop.i.i96
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i114.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit108
+
+grammo_out_advance.exit108:                       ; preds = %grammo_out_interactive.exit.i90, %grammo_out_flush.exit.i99
+  %.20.pre1.i114 = phi ptr [ %.20.pre1.i114.pre417, %grammo_out_interactive.exit.i90 ], [ %.20.pre1.i114.pre, %grammo_out_flush.exit.i99 ]
+  %.4.i109 = phi i64 [ %.4.i109.pre, %grammo_out_interactive.exit.i90 ], [ 0, %grammo_out_flush.exit.i99 ]
+  %.5.i110 = add i64 %.4.i109, 12
+  %.6.b.i111 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i112 = select i1 %.6.b.i111, i64 65536, i64 0
+  %.7.not.i113 = icmp ugt i64 %.5.i110, %.6.i112
+  br i1 %.7.not.i113, label %loop.i.i118, label %grammo_out_reserve.exit132
+
+loop.i.i118:                                      ; preds = %grammo_out_advance.exit108, %body.i.i126
+  %written.i.i119 = phi i64 [ %.10.i.i130, %body.i.i126 ], [ 0, %grammo_out_advance.exit108 ]
+  %.5.i.i120 = icmp slt i64 %written.i.i119, %.4.i109
+  br i1 %.5.i.i120, label %body.i.i126, label %grammo_out_flush.exit.i121
+
+body.i.i126:                                      ; preds = %loop.i.i118
+  %.7.i.i127 = getelementptr i8, ptr %.20.pre1.i114, i64 %written.i.i119
+  %.8.i.i128 = sub i64 %.4.i109, %written.i.i119
+  %.9.i.i129 = tail call i64 @write(i32 1, ptr %.7.i.i127, i64 %.8.i.i128)
+  %.10.i.i130 = add i64 %.9.i.i129, %written.i.i119
+  %.11.i.i131 = icmp sgt i64 %.9.i.i129, 0
+  br i1 %.11.i.i131, label %loop.i.i118, label %grammo_out_flush.exit.i121
+
+grammo_out_flush.exit.i121:                       ; preds = %body.i.i126, %loop.i.i118
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i122 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i123 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i122, label %grammo_out_reserve.exit132, label %grow.i124
+
+grow.i124:                                        ; preds = %grammo_out_flush.exit.i121
+  %.16.i125 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i123, i64 65536)
+  store ptr %.16.i125, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit132
+
+grammo_out_reserve.exit132:                       ; preds = %grammo_out_advance.exit108, %grammo_out_flush.exit.i121, %grow.i124
+  %.21.i115 = phi i64 [ 0, %grow.i124 ], [ 0, %grammo_out_flush.exit.i121 ], [ %.4.i109, %grammo_out_advance.exit108 ]
+  %.20.i116 = phi ptr [ %.16.i125, %grow.i124 ], [ %.20.pre.i123, %grammo_out_flush.exit.i121 ], [ %.20.pre1.i114, %grammo_out_advance.exit108 ]
+  %.22.i117 = getelementptr i8, ptr %.20.i116, i64 %.21.i115
+  %.29 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i117, i64 12, ptr nonnull @str_4, i32 1, i32 1, i32 1)
+  %3 = tail call i32 @llvm.smax.i32(i32 %.29, i32 0)
+  %.6.i133 = zext nneg i32 %3 to i64
+  %.7.i134 = load i64, ptr @grammo_out_len, align 8
+  %.8.i135 = add i64 %.7.i134, %.6.i133
+  store i64 %.8.i135, ptr @grammo_out_len, align 8
+  %.2.i.i136 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i137 = icmp slt i32 %.2.i.i136, 0
+  br i1 %.3.i.i137, label %check.i.i154, label %grammo_out_interactive.exit.i138
+
+check.i.i154:                                     ; preds = %grammo_out_reserve.exit132
+  %.5.i.i155 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i155, ptr @grammo_out_tty, align 4
+  %.4.i.i.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i138
+
+grammo_out_interactive.exit.i138:                 ; preds = %check.i.i154, %grammo_out_reserve.exit132
+  %.4.i.i.pre = phi i64 [ %.4.i.i.pre.pre, %check.i.i154 ], [ %.8.i135, %grammo_out_reserve.exit132 ]
+  %.8.i.i139 = phi i32 [ %.5.i.i155, %check.i.i154 ], [ %.2.i.i136, %grammo_out_reserve.exit132 ]
+  %.9.i.i140 = icmp sgt i32 %.8.i.i139, 0
+  %.20.pre1.i.i.pre420 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i140, label %loop.i.i144, label %grammo_out_advance.exit156
+
+loop.i.i144:                                      ; preds = %grammo_out_interactive.exit.i138, %body.i.i148
+  %written.i.i145 = phi i64 [ %.10.i.i152, %body.i.i148 ], [ 0, %grammo_out_interactive.exit.i138 ]
+  %.5.i3.i146 = icmp slt i64 %written.i.i145, %.4.i.i.pre
+  br i1 %.5.i3.i146, label %body.i.i148, label %grammo_out_flush.exit.i147
+
+body.i.i148:                                      ; preds = %loop.i.i144
+  %.7.i.i149 = getelementptr i8, ptr %.20.pre1.i.i.pre420, i64 %written.i.i145
+  %.8.i4.i150 = sub i64 %.4.i.i.pre, %written.i.i145
+  %.9.i5.i151 = tail call i64 @write(i32 1, ptr %.7.i.i149, i64 %.8.i4.i150)
+  %.10.i.i152 = add i64 %.9.i5.i151, %written.i.i145
+  %.11.i.i153 = icmp sgt i64 %.9.i5.i151, 0
+  br i1 %.11.i.i153, label %loop.i.i144, label %grammo_out_flush.exit.i147
+
+grammo_out_flush.exit.i147:                       ; preds = %body.i.i148, %loop.i.i144
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i.i.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit156
+
+grammo_out_advance.exit156:                       ; preds = %grammo_out_interactive.exit.i138, %grammo_out_flush.exit.i147
+  %.20.pre1.i.i = phi ptr [ %.20.pre1.i.i.pre420, %grammo_out_interactive.exit.i138 ], [ %.20.pre1.i.i.pre, %grammo_out_flush.exit.i147 ]
+  %.4.i.i = phi i64 [ %.4.i.i.pre, %grammo_out_interactive.exit.i138 ], [ 0, %grammo_out_flush.exit.i147 ]
+  %.5.i.i157 = add i64 %.4.i.i, 22
+  %.6.b.i.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i.i = select i1 %.6.b.i.i, i64 65536, i64 0
+  %.7.not.i.i = icmp ugt i64 %.5.i.i157, %.6.i.i
+  br i1 %.7.not.i.i, label %loop.i.i.i, label %grammo_out_reserve.exit.i
+
+loop.i.i.i:                                       ; preds = %grammo_out_advance.exit156, %body.i.i.i
+  %written.i.i.i = phi i64 [ %.10.i.i.i, %body.i.i.i ], [ 0, %grammo_out_advance.exit156 ]
+  %.5.i.i.i = icmp slt i64 %written.i.i.i, %.4.i.i
+  br i1 %.5.i.i.i, label %body.i.i.i, label %grammo_out_flush.exit.i.i
+
+body.i.i.i:                                       ; preds = %loop.i.i.i
+  %.7.i.i.i = getelementptr i8, ptr %.20.pre1.i.i, i64 %written.i.i.i
+  %.8.i.i.i = sub i64 %.4.i.i, %written.i.i.i
+  %.9.i.i.i = tail call i64 @write(i32 1, ptr %.7.i.i.i, i64 %.8.i.i.i)
+  %.10.i.i.i = add i64 %.9.i.i.i, %written.i.i.i
+  %.11.i.i.i = icmp sgt i64 %.9.i.i.i, 0
+  br i1 %.11.i.i.i, label %loop.i.i.i, label %grammo_out_flush.exit.i.i
+
+grammo_out_flush.exit.i.i:                        ; preds = %body.i.i.i, %loop.i.i.i
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i.i, label %grammo_out_reserve.exit.i, label %grow.i.i
+
+grow.i.i:                                         ; preds = %grammo_out_flush.exit.i.i
+  %.16.i.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i.i, i64 65536)
+  store ptr %.16.i.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit.i
+
+grammo_out_reserve.exit.i:                        ; preds = %grow.i.i, %grammo_out_flush.exit.i.i, %grammo_out_advance.exit156
+  %.21.i.i = phi i64 [ 0, %grow.i.i ], [ 0, %grammo_out_flush.exit.i.i ], [ %.4.i.i, %grammo_out_advance.exit156 ]
+  %.20.i.i = phi ptr [ %.16.i.i, %grow.i.i ], [ %.20.pre.i.i, %grammo_out_flush.exit.i.i ], [ %.20.pre1.i.i, %grammo_out_advance.exit156 ]
+  %.22.i.i = getelementptr i8, ptr %.20.i.i, i64 %.21.i.i
+  %.7.i158 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i.i, i64 22, ptr nonnull @str_0, i32 1)
+  %4 = tail call i32 @llvm.smax.i32(i32 %.7.i158, i32 0)
+  %.6.i2.i = zext nneg i32 %4 to i64
+  %.7.i.i159 = load i64, ptr @grammo_out_len, align 8
+  %.8.i.i160 = add i64 %.7.i.i159, %.6.i2.i
+  store i64 %.8.i.i160, ptr @grammo_out_len, align 8
+  %.2.i.i.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i.i = icmp slt i32 %.2.i.i.i, 0
+  br i1 %.3.i.i.i, label %check.i.i.i, label %grammo_out_interactive.exit.i.i
+
+check.i.i.i:                                      ; preds = %grammo_out_reserve.exit.i
+  %.5.i.i12.i = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i12.i, ptr @grammo_out_tty, align 4
+  %.4.i161.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i.i
+
+grammo_out_interactive.exit.i.i:                  ; preds = %check.i.i.i, %grammo_out_reserve.exit.i
+  %.4.i161.pre = phi i64 [ %.4.i161.pre.pre, %check.i.i.i ], [ %.8.i.i160, %grammo_out_reserve.exit.i ]
+  %.8.i.i3.i = phi i32 [ %.5.i.i12.i, %check.i.i.i ], [ %.2.i.i.i, %grammo_out_reserve.exit.i ]
+  %.9.i.i4.i = icmp sgt i32 %.8.i.i3.i, 0
+  %.20.pre1.i166.pre423 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i4.i, label %loop.i.i5.i, label %g.trace.exit
+
+loop.i.i5.i:                                      ; preds = %grammo_out_interactive.exit.i.i, %body.i.i8.i
+  %written.i.i6.i = phi i64 [ %.10.i.i10.i, %body.i.i8.i ], [ 0, %grammo_out_interactive.exit.i.i ]
+  %.5.i3.i.i = icmp slt i64 %written.i.i6.i, %.4.i161.pre
+  br i1 %.5.i3.i.i, label %body.i.i8.i, label %grammo_out_flush.exit.i7.i
+
+body.i.i8.i:                                      ; preds = %loop.i.i5.i
+  %.7.i.i9.i = getelementptr i8, ptr %.20.pre1.i166.pre423, i64 %written.i.i6.i
+  %.8.i4.i.i = sub i64 %.4.i161.pre, %written.i.i6.i
+  %.9.i5.i.i = tail call i64 @write(i32 1, ptr %.7.i.i9.i, i64 %.8.i4.i.i)
+  %.10.i.i10.i = add i64 %.9.i5.i.i, %written.i.i6.i
+  %.11.i.i11.i = icmp sgt i64 %.9.i5.i.i, 0
+  br i1 %.11.i.i11.i, label %loop.i.i5.i, label %grammo_out_flush.exit.i7.i
+
+grammo_out_flush.exit.i7.i:                       ; preds = %body.i.i8.i, %loop.i.i5.i
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i166.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %g.trace.exit
+
+g.trace.exit:                                     ; preds = %grammo_out_interactive.exit.i.i, %grammo_out_flush.exit.i7.i
+  %.20.pre1.i166 = phi ptr [ %.20.pre1.i166.pre423, %grammo_out_interactive.exit.i.i ], [ %.20.pre1.i166.pre, %grammo_out_flush.exit.i7.i ]
+  %.4.i161 = phi i64 [ %.4.i161.pre, %grammo_out_interactive.exit.i.i ], [ 0, %grammo_out_flush.exit.i7.i ]
+  %load_CALLS.i = load i32, ptr @g.CALLS, align 4
+  %.9.i = add i32 %load_CALLS.i, 1
+  store i32 %.9.i, ptr @g.CALLS, align 4
+  %.5.i162 = add i64 %.4.i161, 22
+  %.6.b.i163 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i164 = select i1 %.6.b.i163, i64 65536, i64 0
+  %.7.not.i165 = icmp ugt i64 %.5.i162, %.6.i164
+  br i1 %.7.not.i165, label %loop.i.i170, label %grammo_out_reserve.exit184
+
+loop.i.i170:                                      ; preds = %g.trace.exit, %body.i.i178
+  %written.i.i171 = phi i64 [ %.10.i.i182, %body.i.i178 ], [ 0, %g.trace.exit ]
+  %.5.i.i172 = icmp slt i64 %written.i.i171, %.4.i161
+  br i1 %.5.i.i172, label %body.i.i178, label %grammo_out_flush.exit.i173
+
+body.i.i178:                                      ; preds = %loop.i.i170
+  %.7.i.i179 = getelementptr i8, ptr %.20.pre1.i166, i64 %written.i.i171
+  %.8.i.i180 = sub i64 %.4.i161, %written.i.i171
+  %.9.i.i181 = tail call i64 @write(i32 1, ptr %.7.i.i179, i64 %.8.i.i180)
+  %.10.i.i182 = add i64 %.9.i.i181, %written.i.i171
+  %.11.i.i183 = icmp sgt i64 %.9.i.i181, 0
+  br i1 %.11.i.i183, label %loop.i.i170, label %grammo_out_flush.exit.i173
+
+grammo_out_flush.exit.i173:                       ; preds = %body.i.i178, %loop.i.i170
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i174 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i175 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i174, label %grammo_out_reserve.exit184, label %grow.i176
+
+grow.i176:                                        ; preds = %grammo_out_flush.exit.i173
+  %.16.i177 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i175, i64 65536)
+  store ptr %.16.i177, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit184
+
+grammo_out_reserve.exit184:                       ; preds = %g.trace.exit, %grammo_out_flush.exit.i173, %grow.i176
+  %.21.i167 = phi i64 [ 0, %grow.i176 ], [ 0, %grammo_out_flush.exit.i173 ], [ %.4.i161, %g.trace.exit ]
+  %.20.i168 = phi ptr [ %.16.i177, %grow.i176 ], [ %.20.pre.i175, %grammo_out_flush.exit.i173 ], [ %.20.pre1.i166, %g.trace.exit ]
+  %.22.i169 = getelementptr i8, ptr %.20.i168, i64 %.21.i167
+  %.41 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i169, i64 22, ptr nonnull @str_5, i32 0)
+  %5 = tail call i32 @llvm.smax.i32(i32 %.41, i32 0)
+  %.6.i185 = zext nneg i32 %5 to i64
+  %.7.i186 = load i64, ptr @grammo_out_len, align 8
+  %.8.i187 = add i64 %.7.i186, %.6.i185
+  store i64 %.8.i187, ptr @grammo_out_len, align 8
+  %.2.i.i188 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i189 = icmp slt i32 %.2.i.i188, 0
+  br i1 %.3.i.i189, label %check.i.i206, label %grammo_out_interactive.exit.i190
+
+check.i.i206:                                     ; preds = %grammo_out_reserve.exit184
+  %.5.i.i207 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i207, ptr @grammo_out_tty, align 4
+  %.4.i209.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i190
+
+grammo_out_interactive.exit.i190:                 ; preds = %check.i.i206, %grammo_out_reserve.exit184
+  %.4.i209.pre = phi i64 [ %.4.i209.pre.pre, %check.i.i206 ], [ %.8.i187, %grammo_out_reserve.exit184 ]
+  %.8.i.i191 = phi i32 [ %.5.i.i207, %check.i.i206 ], [ %.2.i.i188, %grammo_out_reserve.exit184 ]
+  %.9.i.i192 = icmp sgt i32 %.8.i.i191, 0
+  %.20.pre1.i214.pre426 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i192, label %loop.i.i196, label %grammo_out_advance.exit208
+
+loop.i.i196:                                      ; preds = %grammo_out_interactive.exit.i190, %body.i.i200
+  %written.i.i197 = phi i64 [ %.10.i.i204, %body.i.i200 ], [ 0, %grammo_out_interactive.exit.i190 ]
+  %.5.i3.i198 = icmp slt i64 %written.i.i197, %.4.i209.pre
+  br i1 %.5.i3.i198, label %body.i.i200, label %grammo_out_flush.exit.i199
+
+body.i.i200:                                      ; preds = %loop.i.i196
+  %.7.i.i201 = getelementptr i8, ptr %.20.pre1.i214.pre426, i64 %written.i.i197
+  %.8.i4.i202 = sub i64 %.4.i209.pre, %written.i.i197
+  %.9.i5.i203 = tail call i64 @write(i32 1, ptr %.7.i.i201, i64 %.8.i4.i202)
+  %.10.i.i204 = add i64 %.9.i5.i203, %written.i.i197
+  %.11.i.i205 = icmp sgt i64 %.9.i5.i203, 0
+  br i1 %.11.i.i205, label %loop.i.i196, label %grammo_out_flush.exit.i199
+
+grammo_out_flush.exit.i199:                       ; preds = %body.i.i200, %loop.i.i196
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i214.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit208
+
+grammo_out_advance.exit208:                       ; preds = %grammo_out_interactive.exit.i190, %grammo_out_flush.exit.i199
+  %.20.pre1.i214 = phi ptr [ %.20.pre1.i214.pre426, %grammo_out_interactive.exit.i190 ], [ %.20.pre1.i214.pre, %grammo_out_flush.exit.i199 ]
+  %.4.i209 = phi i64 [ %.4.i209.pre, %grammo_out_interactive.exit.i190 ], [ 0, %grammo_out_flush.exit.i199 ]
+  %.5.i210 = add i64 %.4.i209, 13
+  %.6.b.i211 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i212 = select i1 %.6.b.i211, i64 65536, i64 0
+  %.7.not.i213 = icmp ugt i64 %.5.i210, %.6.i212
+  br i1 %.7.not.i213, label %loop.i.i218, label %grammo_out_reserve.exit232
+
+loop.i.i218:                                      ; preds = %grammo_out_advance.exit208, %body.i.i226
+  %written.i.i219 = phi i64 [ %.10.i.i230, %body.i.i226 ], [ 0, %grammo_out_advance.exit208 ]
+  %.5.i.i220 = icmp slt i64 %written.i.i219, %.4.i209
+  br i1 %.5.i.i220, label %body.i.i226, label %grammo_out_flush.exit.i221
+
+body.i.i226:                                      ; preds = %loop.i.i218
+  %.7.i.i227 = getelementptr i8, ptr %.20.pre1.i214, i64 %written.i.i219
+  %.8.i.i228 = sub i64 %.4.i209, %written.i.i219
+  %.9.i.i229 = tail call i64 @write(i32 1, ptr %.7.i.i227, i64 %.8.i.i228)
+  %.10.i.i230 = add i64 %.9.i.i229, %written.i.i219
+  %.11.i.i231 = icmp sgt i64 %.9.i.i229, 0
+  br i1 %.11.i.i231, label %loop.i.i218, label %grammo_out_flush.exit.i221
+
+grammo_out_flush.exit.i221:                       ; preds = %body.i.i226, %loop.i.i218
+  %.10.b.i222 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i223 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i222, label %grammo_out_reserve.exit232, label %grow.i224
+
+grow.i224:                                        ; preds = %grammo_out_flush.exit.i221
+  %.16.i225 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i223, i64 65536)
+  store ptr %.16.i225, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit232
+
+grammo_out_reserve.exit232:                       ; preds = %grammo_out_advance.exit208, %grammo_out_flush.exit.i221, %grow.i224
+  %.7.i233 = phi i64 [ 0, %grow.i224 ], [ 0, %grammo_out_flush.exit.i221 ], [ %.4.i209, %grammo_out_advance.exit208 ]
+  %.20.i216 = phi ptr [ %.16.i225, %grow.i224 ], [ %.20.pre.i223, %grammo_out_flush.exit.i221 ], [ %.20.pre1.i214, %grammo_out_advance.exit208 ]
+  %.22.i217 = getelementptr i8, ptr %.20.i216, i64 %.7.i233
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(13) %.22.i217, ptr noundef nonnull align 1 dereferenceable(13) @str_6, i64 13, i1 false)
+  %.8.i234 = add nsw i64 %.7.i233, 12
+  store i64 %.8.i234, ptr @grammo_out_len, align 8
+  %.2.i.i235 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i236 = icmp slt i32 %.2.i.i235, 0
+  br i1 %.3.i.i236, label %check.i.i253, label %grammo_out_interactive.exit.i237
+
+check.i.i253:                                     ; preds = %grammo_out_reserve.exit232
+  %.5.i.i254 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i254, ptr @grammo_out_tty, align 4
+  %.4.i256.pre.pre = load i64, ptr @grammo_out_len, align 8
+  %.20.pre1.i261.pre429.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_interactive.exit.i237
+
+grammo_out_interactive.exit.i237:                 ; preds = %check.i.i253, %grammo_out_reserve.exit232
+  %.20.pre1.i261.pre429 = phi ptr [ %.20.pre1.i261.pre429.pre, %check.i.i253 ], [ %.20.i216, %grammo_out_reserve.exit232 ]
+  %.4.i256.pre = phi i64 [ %.4.i256.pre.pre, %check.i.i253 ], [ %.8.i234, %grammo_out_reserve.exit232 ]
+  %.8.i.i238 = phi i32 [ %.5.i.i254, %check.i.i253 ], [ %.2.i.i235, %grammo_out_reserve.exit232 ]
+  %.9.i.i239 = icmp sgt i32 %.8.i.i238, 0
+  br i1 %.9.i.i239, label %loop.i.i243, label %grammo_out_advance.exit255
+
+loop.i.i243:                                      ; preds = %grammo_out_interactive.exit.i237, %body.i.i247
+  %written.i.i244 = phi i64 [ %.10.i.i251, %body.i.i247 ], [ 0, %grammo_out_interactive.exit.i237 ]
+  %.5.i3.i245 = icmp slt i64 %written.i.i244, %.4.i256.pre
+  br i1 %.5.i3.i245, label %body.i.i247, label %grammo_out_flush.exit.i246
+
+body.i.i247:                                      ; preds = %loop.i.i243
+  %.7.i.i248 = getelementptr i8, ptr %.20.pre1.i261.pre429, i64 %written.i.i244
+  %.8.i4.i249 = sub i64 %.4.i256.pre, %written.i.i244
+  %.9.i5.i250 = tail call i64 @write(i32 1, ptr %.7.i.i248, i64 %.8.i4.i249)
+  %.10.i.i251 = add i64 %.9.i5.i250, %written.i.i244
+  %.11.i.i252 = icmp sgt i64 %.9.i5.i250, 0
+  br i1 %.11.i.i252, label %loop.i.i243, label %grammo_out_flush.exit.i246
+
+grammo_out_flush.exit.i246:                       ; preds = %body.i.i247, %loop.i.i243
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i261.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit255
+
+grammo_out_advance.exit255:                       ; preds = %grammo_out_interactive.exit.i237, %grammo_out_flush.exit.i246
+  %.20.pre1.i261 = phi ptr [ %.20.pre1.i261.pre429, %grammo_out_interactive.exit.i237 ], [ %.20.pre1.i261.pre, %grammo_out_flush.exit.i246 ]
+  %.4.i256 = phi i64 [ %.4.i256.pre, %grammo_out_interactive.exit.i237 ], [ 0, %grammo_out_flush.exit.i246 ]
+  %.5.i257 = add i64 %.4.i256, 29
+  %.6.b.i258 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i259 = select i1 %.6.b.i258, i64 65536, i64 0
+  %.7.not.i260 = icmp ugt i64 %.5.i257, %.6.i259
+  br i1 %.7.not.i260, label %loop.i.i265, label %grammo_out_reserve.exit279
+
+loop.i.i265:                                      ; preds = %grammo_out_advance.exit255, %body.i.i273
+  %written.i.i266 = phi i64 [ %.10.i.i277, %body.i.i273 ], [ 0, %grammo_out_advance.exit255 ]
+  %.5.i.i267 = icmp slt i64 %written.i.i266, %.4.i256
+  br i1 %.5.i.i267, label %body.i.i273, label %grammo_out_flush.exit.i268
+
+body.i.i273:                                      ; preds = %loop.i.i265
+  %.7.i.i274 = getelementptr i8, ptr %.20.pre1.i261, i64 %written.i.i266
+  %.8.i.i275 = sub i64 %.4.i256, %written.i.i266
+  %.9.i.i276 = tail call i64 @write(i32 1, ptr %.7.i.i274, i64 %.8.i.i275)
+  %.10.i.i277 = add i64 %.9.i.i276, %written.i.i266
+  %.11.i.i278 = icmp sgt i64 %.9.i.i276, 0
+  br i1 %.11.i.i278, label %loop.i.i265, label %grammo_out_flush.exit.i268
+
+grammo_out_flush.exit.i268:                       ; preds = %body.i.i273, %loop.i.i265
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i269 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i270 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i269, label %grammo_out_reserve.exit279, label %grow.i271
+
+grow.i271:                                        ; preds = %grammo_out_flush.exit.i268
+  %.16.i272 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i270, i64 65536)
+  store ptr %.16.i272, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit279
+
+grammo_out_reserve.exit279:                       ; preds = %grammo_out_advance.exit255, %grammo_out_flush.exit.i268, %grow.i271
+  %.21.i262 = phi i64 [ 0, %grow.i271 ], [ 0, %grammo_out_flush.exit.i268 ], [ %.4.i256, %grammo_out_advance.exit255 ]
+  %.20.i263 = phi ptr [ %.16.i272, %grow.i271 ], [ %.20.pre.i270, %grammo_out_flush.exit.i268 ], [ %.20.pre1.i261, %grammo_out_advance.exit255 ]
+  %.22.i264 = getelementptr i8, ptr %.20.i263, i64 %.21.i262
+  %.52 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i264, i64 29, ptr nonnull @str_7, i32 0)
+  %6 = tail call i32 @llvm.smax.i32(i32 %.52, i32 0)
+  %.6.i280 = zext nneg i32 %6 to i64
+  %.7.i281 = load i64, ptr @grammo_out_len, align 8
+  %.8.i282 = add i64 %.7.i281, %.6.i280
+  store i64 %.8.i282, ptr @grammo_out_len, align 8
+  %.5.i284 = add i64 %.8.i282, 13
+  %.6.b.i285 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i286 = select i1 %.6.b.i285, i64 65536, i64 0
+  %.7.not.i287 = icmp ugt i64 %.5.i284, %.6.i286
+  %.20.pre1.i288 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i287, label %loop.i.i292, label %grammo_out_reserve.exit306
+
+loop.i.i292:                                      ; preds = %grammo_out_reserve.exit279, %body.i.i300
+  %written.i.i293 = phi i64 [ %.10.i.i304, %body.i.i300 ], [ 0, %grammo_out_reserve.exit279 ]
+  %.5.i.i294 = icmp slt i64 %written.i.i293, %.8.i282
+  br i1 %.5.i.i294, label %body.i.i300, label %grammo_out_flush.exit.i295
+
+body.i.i300:                                      ; preds = %loop.i.i292
+  %.7.i.i301 = getelementptr i8, ptr %.20.pre1.i288, i64 %written.i.i293
+  %.8.i.i302 = sub i64 %.8.i282, %written.i.i293
+  %.9.i.i303 = tail call i64 @write(i32 1, ptr %.7.i.i301, i64 %.8.i.i302)
+  %.10.i.i304 = add i64 %.9.i.i303, %written.i.i293
+  %.11.i.i305 = icmp sgt i64 %.9.i.i303, 0
+  br i1 %.11.i.i305, label %loop.i.i292, label %grammo_out_flush.exit.i295
+
+grammo_out_flush.exit.i295:                       ; preds = %body.i.i300, %loop.i.i292
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i296 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i297 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i296, label %grammo_out_reserve.exit306, label %grow.i298
+
+grow.i298:                                        ; preds = %grammo_out_flush.exit.i295
+  %.16.i299 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i297, i64 65536)
+  store ptr %.16.i299, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit306
+
+grammo_out_reserve.exit306:                       ; preds = %grammo_out_reserve.exit279, %grammo_out_flush.exit.i295, %grow.i298
+  %.21.i289 = phi i64 [ 0, %grow.i298 ], [ 0, %grammo_out_flush.exit.i295 ], [ %.8.i282, %grammo_out_reserve.exit279 ]
+  %.20.i290 = phi ptr [ %.16.i299, %grow.i298 ], [ %.20.pre.i297, %grammo_out_flush.exit.i295 ], [ %.20.pre1.i288, %grammo_out_reserve.exit279 ]
+  %.22.i291 = getelementptr i8, ptr %.20.i290, i64 %.21.i289
+  %.58 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i291, i64 13, ptr nonnull @str_8, i32 1)
+  %7 = tail call i32 @llvm.smax.i32(i32 %.58, i32 0)
+  %.6.i307 = zext nneg i32 %7 to i64
+  %.7.i308 = load i64, ptr @grammo_out_len, align 8
+  %.8.i309 = add i64 %.7.i308, %.6.i307
+  store i64 %.8.i309, ptr @grammo_out_len, align 8
+  %.5.i311 = add i64 %.8.i309, 13
+  %.6.b.i312 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i313 = select i1 %.6.b.i312, i64 65536, i64 0
+  %.7.not.i314 = icmp ugt i64 %.5.i311, %.6.i313
+  %.20.pre1.i315 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i314, label %loop.i.i319, label %grammo_out_reserve.exit333
+
+loop.i.i319:                                      ; preds = %grammo_out_reserve.exit306, %body.i.i327
+  %written.i.i320 = phi i64 [ %.10.i.i331, %body.i.i327 ], [ 0, %grammo_out_reserve.exit306 ]
+  %.5.i.i321 = icmp slt i64 %written.i.i320, %.8.i309
+  br i1 %.5.i.i321, label %body.i.i327, label %grammo_out_flush.exit.i322
+
+body.i.i327:                                      ; preds = %loop.i.i319
+  %.7.i.i328 = getelementptr i8, ptr %.20.pre1.i315, i64 %written.i.i320
+  %.8.i.i329 = sub i64 %.8.i309, %written.i.i320
+  %.9.i.i330 = tail call i64 @write(i32 1, ptr %.7.i.i328, i64 %.8.i.i329)
+  %.10.i.i331 = add i64 %.9.i.i330, %written.i.i320
+  %.11.i.i332 = icmp sgt i64 %.9.i.i330, 0
+  br i1 %.11.i.i332, label %loop.i.i319, label %grammo_out_flush.exit.i322
+
+grammo_out_flush.exit.i322:                       ; preds = %body.i.i327, %loop.i.i319
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i323 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i324 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i323, label %grammo_out_reserve.exit333, label %grow.i325
+
+grow.i325:                                        ; preds = %grammo_out_flush.exit.i322
+  %.16.i326 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i324, i64 65536)
+  store ptr %.16.i326, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit333
+
+grammo_out_reserve.exit333:                       ; preds = %grammo_out_reserve.exit306, %grammo_out_flush.exit.i322, %grow.i325
+  %.21.i316 = phi i64 [ 0, %grow.i325 ], [ 0, %grammo_out_flush.exit.i322 ], [ %.8.i309, %grammo_out_reserve.exit306 ]
+  %.20.i317 = phi ptr [ %.16.i326, %grow.i325 ], [ %.20.pre.i324, %grammo_out_flush.exit.i322 ], [ %.20.pre1.i315, %grammo_out_reserve.exit306 ]
+  %.22.i318 = getelementptr i8, ptr %.20.i317, i64 %.21.i316
+  %.64 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i318, i64 13, ptr nonnull @str_9, i32 2)
+  %8 = tail call i32 @llvm.smax.i32(i32 %.64, i32 0)
+  %.6.i334 = zext nneg i32 %8 to i64
+  %.7.i335 = load i64, ptr @grammo_out_len, align 8
+  %.8.i336 = add i64 %.7.i335, %.6.i334
+  store i64 %.8.i336, ptr @grammo_out_len, align 8
+  %.2.i.i337 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i338 = icmp slt i32 %.2.i.i337, 0
+  br i1 %.3.i.i338, label %check.i.i355, label %grammo_out_interactive.exit.i339
+
+check.i.i355:                                     ; preds = %grammo_out_reserve.exit333
+  %.5.i.i356 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i356, ptr @grammo_out_tty, align 4
+  %.4.i358.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i339
+
+grammo_out_interactive.exit.i339:                 ; preds = %check.i.i355, %grammo_out_reserve.exit333
+  %.4.i358.pre = phi i64 [ %.4.i358.pre.pre, %check.i.i355 ], [ %.8.i336, %grammo_out_reserve.exit333 ]
+  %.8.i.i340 = phi i32 [ %.5.i.i356, %check.i.i355 ], [ %.2.i.i337, %grammo_out_reserve.exit333 ]
+  %.9.i.i341 = icmp sgt i32 %.8.i.i340, 0
+  %.20.pre1.i363.pre432 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i341, label %loop.i.i345, label %grammo_out_advance.exit357
+
+loop.i.i345:                                      ; preds = %grammo_out_interactive.exit.i339, %body.i.i349
+  %written.i.i346 = phi i64 [ %.10.i.i353, %body.i.i349 ], [ 0, %grammo_out_interactive.exit.i339 ]
+  %.5.i3.i347 = icmp slt i64 %written.i.i346, %.4.i358.pre
+  br i1 %.5.i3.i347, label %body.i.i349, label %grammo_out_flush.exit.i348
+
+body.i.i349:                                      ; preds = %loop.i.i345
+  %.7.i.i350 = getelementptr i8, ptr %.20.pre1.i363.pre432, i64 %written.i.i346
+  %.8.i4.i351 = sub i64 %.4.i358.pre, %written.i.i346
+  %.9.i5.i352 = tail call i64 @write(i32 1, ptr %.7.i.i350, i64 %.8.i4.i351)
+  %.10.i.i353 = add i64 %.9.i5.i352, %written.i.i346
+  %.11.i.i354 = icmp sgt i64 %.9.i5.i352, 0
+  br i1 %.11.i.i354, label %loop.i.i345, label %grammo_out_flush.exit.i348
+
+grammo_out_flush.exit.i348:                       ; preds = %body.i.i349, %loop.i.i345
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i363.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit357
+
+grammo_out_advance.exit357:                       ; preds = %grammo_out_interactive.exit.i339, %grammo_out_flush.exit.i348
+  %.20.pre1.i363 = phi ptr [ %.20.pre1.i363.pre432, %grammo_out_interactive.exit.i339 ], [ %.20.pre1.i363.pre, %grammo_out_flush.exit.i348 ]
+  %.4.i358 = phi i64 [ %.4.i358.pre, %grammo_out_interactive.exit.i339 ], [ 0, %grammo_out_flush.exit.i348 ]
+  %load_CALLS = load i32, ptr @g.CALLS, align 4
+  %.5.i359 = add i64 %.4.i358, 30
+  %.6.b.i360 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i361 = select i1 %.6.b.i360, i64 65536, i64 0
+  %.7.not.i362 = icmp ugt i64 %.5.i359, %.6.i361
+  br i1 %.7.not.i362, label %loop.i.i367, label %grammo_out_reserve.exit381
+
+loop.i.i367:                                      ; preds = %grammo_out_advance.exit357, %body.i.i375
+  %written.i.i368 = phi i64 [ %.10.i.i379, %body.i.i375 ], [ 0, %grammo_out_advance.exit357 ]
+  %.5.i.i369 = icmp slt i64 %written.i.i368, %.4.i358
+  br i1 %.5.i.i369, label %body.i.i375, label %grammo_out_flush.exit.i370
+
+body.i.i375:                                      ; preds = %loop.i.i367
+  %.7.i.i376 = getelementptr i8, ptr %.20.pre1.i363, i64 %written.i.i368
+  %.8.i.i377 = sub i64 %.4.i358, %written.i.i368
+  %.9.i.i378 = tail call i64 @write(i32 1, ptr %.7.i.i376, i64 %.8.i.i377)
+  %.10.i.i379 = add i64 %.9.i.i378, %written.i.i368
+  %.11.i.i380 = icmp sgt i64 %.9.i.i378, 0
+  br i1 %.11.i.i380, label %loop.i.i367, label %grammo_out_flush.exit.i370
+
+grammo_out_flush.exit.i370:                       ; preds = %body.i.i375, %loop.i.i367
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i371 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i372 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i371, label %grammo_out_reserve.exit381, label %grow.i373
+
+grow.i373:                                        ; preds = %grammo_out_flush.exit.i370
+  %.16.i374 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i372, i64 65536)
+  store ptr %.16.i374, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit381
+
+grammo_out_reserve.exit381:                       ; preds = %grammo_out_advance.exit357, %grammo_out_flush.exit.i370, %grow.i373
+  %.21.i364 = phi i64 [ 0, %grow.i373 ], [ 0, %grammo_out_flush.exit.i370 ], [ %.4.i358, %grammo_out_advance.exit357 ]
+  %.20.i365 = phi ptr [ %.16.i374, %grow.i373 ], [ %.20.pre.i372, %grammo_out_flush.exit.i370 ], [ %.20.pre1.i363, %grammo_out_advance.exit357 ]
+  %.22.i366 = getelementptr i8, ptr %.20.i365, i64 %.21.i364
+  %.69 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i366, i64 30, ptr nonnull @str_10, i32 %load_CALLS)
+  %9 = tail call i32 @llvm.smax.i32(i32 %.69, i32 0)
+  %.6.i382 = zext nneg i32 %9 to i64
+  %.7.i383 = load i64, ptr @grammo_out_len, align 8
+  %.8.i384 = add i64 %.7.i383, %.6.i382
+  store i64 %.8.i384, ptr @grammo_out_len, align 8
+  %.2.i.i385 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i386 = icmp slt i32 %.2.i.i385, 0
+  br i1 %.3.i.i386, label %check.i.i403, label %grammo_out_interactive.exit.i387
+
+check.i.i403:                                     ; preds = %grammo_out_reserve.exit381
+  %.5.i.i404 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i404, ptr @grammo_out_tty, align 4
+  %.3.i.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i387
+
+grammo_out_interactive.exit.i387:                 ; preds = %check.i.i403, %grammo_out_reserve.exit381
+  %.3.i.pre = phi i64 [ %.3.i.pre.pre, %check.i.i403 ], [ %.8.i384, %grammo_out_reserve.exit381 ]
+  %.8.i.i388 = phi i32 [ %.5.i.i404, %check.i.i403 ], [ %.2.i.i385, %grammo_out_reserve.exit381 ]
+  %.9.i.i389 = icmp sgt i32 %.8.i.i388, 0
+  %.2.i.pre434 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i389, label %loop.i.i393, label %grammo_out_advance.exit405
+
+loop.i.i393:                                      ; preds = %grammo_out_interactive.exit.i387, %body.i.i397
+  %written.i.i394 = phi i64 [ %.10.i.i401, %body.i.i397 ], [ 0, %grammo_out_interactive.exit.i387 ]
+  %.5.i3.i395 = icmp slt i64 %written.i.i394, %.3.i.pre
+  br i1 %.5.i3.i395, label %body.i.i397, label %grammo_out_flush.exit.i396
+
+body.i.i397:                                      ; preds = %loop.i.i393
+  %.7.i.i398 = getelementptr i8, ptr %.2.i.pre434, i64 %written.i.i394
+  %.8.i4.i399 = sub i64 %.3.i.pre, %written.i.i394
+  %.9.i5.i400 = tail call i64 @write(i32 1, ptr %.7.i.i398, i64 %.8.i4.i399)
+  %.10.i.i401 = add i64 %.9.i5.i400, %written.i.i394
+  %.11.i.i402 = icmp sgt i64 %.9.i5.i400, 0
+  br i1 %.11.i.i402, label %loop.i.i393, label %grammo_out_flush.exit.i396
+
+grammo_out_flush.exit.i396:                       ; preds = %body.i.i397, %loop.i.i393
+  store i64 0, ptr @grammo_out_len, align 8
+  %.2.i.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit405
+
+grammo_out_advance.exit405:                       ; preds = %grammo_out_interactive.exit.i387, %grammo_out_flush.exit.i396
+  %.3.i = phi i64 [ %.3.i.pre, %grammo_out_interactive.exit.i387 ], [ 0, %grammo_out_flush.exit.i396 ]
+  %.2.i = phi ptr [ %.2.i.pre434, %grammo_out_interactive.exit.i387 ], [ %.2.i.pre, %grammo_out_flush.exit.i396 ]
+  br label %loop.i
+
+loop.i:                                           ; preds = %body.i, %grammo_out_advance.exit405
+  %written.i = phi i64 [ 0, %grammo_out_advance.exit405 ], [ %.10.i, %body.i ]
+  %.5.i406 = icmp slt i64 %written.i, %.3.i
+  br i1 %.5.i406, label %body.i, label %grammo_out_flush.exit
+
+body.i:                                           ; preds = %loop.i
+  %.7.i407 = getelementptr i8, ptr %.2.i, i64 %written.i
+  %.8.i408 = sub i64 %.3.i, %written.i
+  %.9.i409 = tail call i64 @write(i32 1, ptr %.7.i407, i64 %.8.i408)
+  %.10.i = add i64 %.9.i409, %written.i
+  %.11.i = icmp sgt i64 %.9.i409, 0
+  br i1 %.11.i, label %loop.i, label %grammo_out_flush.exit
+
+grammo_out_flush.exit:                            ; preds = %loop.i, %body.i
+  store i64 0, ptr @grammo_out_len, align 8
+  ret void
+}
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i32 @llvm.smax.i32(i32, i32) #3
+
+; Function Attrs: nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memcpy.p0.p0.i64(ptr noalias nocapture writeonly, ptr noalias nocapture readonly, i64, i1 immarg) #4
+
+attributes #0 = { nofree nounwind }
+attributes #1 = { mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #2 = { nounwind }
+attributes #3 = { nocallback nofree nosync nounwind speculatable willreturn memory(none) }
+attributes #4 = { nocallback nofree nounwind willreturn memory(argmem: readwrite) }
@@ -1,170 +1,533 @@
 ; ModuleID = '<string>'
 source_filename = "<string>"
-target triple = "x86_64-pc-windows-msvc"
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-i128:128-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-unknown-linux-gnu"
 
-@str_0 = constant [14 x i8] c"Inserisci n: \00"
-@str_1 = constant [3 x i8] c"%s\00"
-@str_2 = constant [3 x i8] c"%d\00"
-@str_3 = constant [9 x i8] c"fact(n)=\00"
-@str_4 = local_unnamed_addr constant [2 x i8] c"\0A\00"
+@grammo_out_buf = internal unnamed_addr global ptr null
+@grammo_out_cap = internal unnamed_addr global i1 false
+@grammo_out_len = internal unnamed_addr global i64 0
+@grammo_out_tty = internal unnamed_addr global i32 -1
+@str_0 = private unnamed_addr constant [14 x i8] c"Inserisci n: \00"
+@grammo_in_buf = internal unnamed_addr global ptr null
+@grammo_in_cap = internal unnamed_addr global i64 0
+@grammo_in_pos = internal unnamed_addr global i64 0
+@grammo_in_end = internal unnamed_addr global i64 0
+@str_1 = private constant [12 x i8] c"fact(n)=%d\0A\00"
 
 ; Function Attrs: nofree nounwind
-declare noundef i32 @printf(ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+declare noundef i32 @snprintf(ptr noalias nocapture noundef writeonly, i64 noundef, ptr nocapture noundef readonly, ...) local_unnamed_addr #0
 
-; Function Attrs: nofree nounwind
-declare noundef i32 @scanf(ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+; Function Attrs: mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite)
+declare noalias noundef ptr @realloc(ptr allocptr nocapture, i64 noundef) local_unnamed_addr #1
 
-; Function Attrs: nofree norecurse nosync nounwind memory(none)
-define i32 @fact(i32 %n) local_unnamed_addr #1 {
-entry:
-  %.6 = icmp slt i32 %n, 0
-  br i1 %.6, label %common.ret, label %for_cond.preheader
-
-for_cond.preheader:                               ; preds = %entry
-  %.11.not5 = icmp eq i32 %n, 0
-  br i1 %.11.not5, label %common.ret, label %for_body.preheader
-
-for_body.preheader:                               ; preds = %for_cond.preheader
-  %min.iters.check = icmp ult i32 %n, 20
-  br i1 %min.iters.check, label %for_body.preheader9, label %vector.scevcheck
-
-vector.scevcheck:                                 ; preds = %for_body.preheader
-  %0 = zext nneg i32 %n to i64
-  %1 = add nsw i64 %0, -1
-  %2 = trunc nsw i64 %1 to i32
-  %3 = icmp ugt i32 %2, 2147483645
-  %4 = icmp ugt i64 %1, 4294967295
-  %5 = or i1 %3, %4
-  br i1 %5, label %for_body.preheader9, label %vector.ph
-
-vector.ph:                                        ; preds = %vector.scevcheck
-  %n.vec = and i32 %n, 2147483640
-  %6 = or disjoint i32 %n.vec, 1
-  br label %vector.body
+; Function Attrs: nofree nounwind
+declare noundef i64 @write(i32 noundef, ptr nocapture noundef readonly, i64 noundef) local_unnamed_addr #0
 
-vector.body:                                      ; preds = %vector.body, %vector.ph
-  %index = phi i32 [ 0, %vector.ph ], [ %index.next, %vector.body ]
-  %vec.phi = phi <4 x i32> [ splat (i32 1), %vector.ph ], [ %7, %vector.body ]
-  %vec.phi8 = phi <4 x i32> [ splat (i32 1), %vector.ph ], [ %8, %vector.body ]
-  %vec.ind = phi <4 x i32> [ <i32 1, i32 2, i32 3, i32 4>, %vector.ph ], [ %vec.ind.next, %vector.body ]
-  %step.add = add <4 x i32> %vec.ind, splat (i32 4)
-  %7 = mul <4 x i32> %vec.phi, %vec.ind
-  %8 = mul <4 x i32> %vec.phi8, %step.add
-  %index.next = add nuw i32 %index, 8
-  %vec.ind.next = add <4 x i32> %vec.ind, splat (i32 8)
-  %9 = icmp eq i32 %index.next, %n.vec
-  br i1 %9, label %middle.block, label %vector.body, !llvm.loop !0
+; Function Attrs: nounwind
+declare i32 @isatty(i32) local_unnamed_addr #2
 
-middle.block:                                     ; preds = %vector.body
-  %bin.rdx = mul <4 x i32> %8, %7
-  %10 = tail call i32 @llvm.vector.reduce.mul.v4i32(<4 x i32> %bin.rdx)
-  %cmp.n = icmp eq i32 %n, %n.vec
-  br i1 %cmp.n, label %common.ret, label %for_body.preheader9
-
-for_body.preheader9:                              ; preds = %vector.scevcheck, %for_body.preheader, %middle.block
-  %r.07.ph = phi i32 [ 1, %for_body.preheader ], [ 1, %vector.scevcheck ], [ %10, %middle.block ]
-  %i.06.ph = phi i32 [ 1, %for_body.preheader ], [ 1, %vector.scevcheck ], [ %6, %middle.block ]
-  br label %for_body
-
-common.ret:                                       ; preds = %for_body, %middle.block, %for_cond.preheader, %entry
-  %common.ret.op = phi i32 [ 0, %entry ], [ 1, %for_cond.preheader ], [ %10, %middle.block ], [ %.13, %for_body ]
-  ret i32 %common.ret.op
-
-for_body:                                         ; preds = %for_body.preheader9, %for_body
-  %r.07 = phi i32 [ %.13, %for_body ], [ %r.07.ph, %for_body.preheader9 ]
-  %i.06 = phi i32 [ %.15, %for_body ], [ %i.06.ph, %for_body.preheader9 ]
-  %.13 = mul i32 %r.07, %i.06
-  %.15 = add i32 %i.06, 1
-  %.11.not = icmp sgt i32 %.15, %n
-  br i1 %.11.not, label %common.ret, label %for_body, !llvm.loop !3
-}
+; Function Attrs: mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite)
+declare noalias noundef ptr @malloc(i64 noundef) local_unnamed_addr #3
 
 ; Function Attrs: nofree nounwind
-define void @main() local_unnamed_addr #0 {
+declare noundef i64 @read(i32 noundef, ptr nocapture noundef, i64 noundef) local_unnamed_addr #0
+
+; Function Attrs: mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memmove.p0.p0.i64(ptr nocapture writeonly, ptr nocapture readonly, i64, i1 immarg) #4
+
+; Function Attrs: nounwind
+define void @main() local_unnamed_addr #2 {
 entry:
-  %n = alloca i32, align 4
-  store i32 0, ptr %n, align 4
-  %.6 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_0)
-  %.8 = call i32 (ptr, ...) @scanf(ptr nonnull @str_2, ptr nonnull %n)
-  %load_n = load i32, ptr %n, align 4
-  %.6.i = icmp slt i32 %load_n, 0
-  br i1 %.6.i, label %fact.exit, label %for_cond.preheader.i
-
-for_cond.preheader.i:                             ; preds = %entry
-  %.11.not5.i = icmp eq i32 %load_n, 0
-  br i1 %.11.not5.i, label %fact.exit, label %for_body.i.preheader
+  %.4.i = load i64, ptr @grammo_out_len, align 8
+  %.5.i = add i64 %.4.i, 14
+  %.6.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i = select i1 %.6.b.i, i64 65536, i64 0
+  %.7.not.i = icmp ugt i64 %.5.i, %.6.i
+  %.20.pre1.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i, label %loop.i.i, label %grammo_out_reserve.exit
+
+loop.i.i:                                         ; preds = %entry, %body.i.i
+  %written.i.i = phi i64 [ %.10.i.i, %body.i.i ], [ 0, %entry ]
+  %.5.i.i = icmp slt i64 %written.i.i, %.4.i
+  br i1 %.5.i.i, label %body.i.i, label %grammo_out_flush.exit.i
+
+body.i.i:                                         ; preds = %loop.i.i
+  %.7.i.i = getelementptr i8, ptr %.20.pre1.i, i64 %written.i.i
+  %.8.i.i = sub i64 %.4.i, %written.i.i
+  %.9.i.i = tail call i64 @write(i32 1, ptr %.7.i.i, i64 %.8.i.i)
+  %.10.i.i = add i64 %.9.i.i, %written.i.i
+  %.11.i.i = icmp sgt i64 %.9.i.i, 0
+  br i1 %.11.i.i, label %loop.i.i, label %grammo_out_flush.exit.i
+
+grammo_out_flush.exit.i:                          ; preds = %body.i.i, %loop.i.i
+  %.10.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i, label %grammo_out_reserve.exit, label %grow.i
+
+grow.i:                                           ; preds = %grammo_out_flush.exit.i
+  %.16.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i, i64 65536)
+  store ptr %.16.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit
+
+grammo_out_reserve.exit:                          ; preds = %entry, %grammo_out_flush.exit.i, %grow.i
+  %.7.i = phi i64 [ 0, %grow.i ], [ 0, %grammo_out_flush.exit.i ], [ %.4.i, %entry ]
+  %.20.i = phi ptr [ %.16.i, %grow.i ], [ %.20.pre.i, %grammo_out_flush.exit.i ], [ %.20.pre1.i, %entry ]
+  %.22.i = getelementptr i8, ptr %.20.i, i64 %.7.i
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(14) %.22.i, ptr noundef nonnull align 1 dereferenceable(14) @str_0, i64 14, i1 false)
+  %.8.i = add nsw i64 %.7.i, 13
+  store i64 %.8.i, ptr @grammo_out_len, align 8
+  %.2.i.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i = icmp slt i32 %.2.i.i, 0
+  br i1 %.3.i.i, label %check.i.i, label %grammo_out_interactive.exit.i
+
+check.i.i:                                        ; preds = %grammo_out_reserve.exit
+  %.5.i.i10 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i10, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i
+
+grammo_out_interactive.exit.i:                    ; preds = %check.i.i, %grammo_out_reserve.exit
+  %.8.i.i1 = phi i32 [ %.5.i.i10, %check.i.i ], [ %.2.i.i, %grammo_out_reserve.exit ]
+  %.9.i.i2 = icmp sgt i32 %.8.i.i1, 0
+  br i1 %.9.i.i2, label %flush.i, label %grammo_out_sync.exit
+
+flush.i:                                          ; preds = %grammo_out_interactive.exit.i
+  %.2.i1.i = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i3
+
+loop.i.i3:                                        ; preds = %body.i.i6, %flush.i
+  %written.i.i4 = phi i64 [ 0, %flush.i ], [ %.10.i.i8, %body.i.i6 ]
+  %.5.i3.i = icmp slt i64 %written.i.i4, %.3.i2.i
+  br i1 %.5.i3.i, label %body.i.i6, label %grammo_out_flush.exit.i5
+
+body.i.i6:                                        ; preds = %loop.i.i3
+  %.7.i.i7 = getelementptr i8, ptr %.2.i1.i, i64 %written.i.i4
+  %.8.i4.i = sub i64 %.3.i2.i, %written.i.i4
+  %.9.i5.i = tail call i64 @write(i32 1, ptr %.7.i.i7, i64 %.8.i4.i)
+  %.10.i.i8 = add i64 %.9.i5.i, %written.i.i4
+  %.11.i.i9 = icmp sgt i64 %.9.i5.i, 0
+  br i1 %.11.i.i9, label %loop.i.i3, label %grammo_out_flush.exit.i5
+
+grammo_out_flush.exit.i5:                         ; preds = %body.i.i6, %loop.i.i3
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit
+
+grammo_out_sync.exit:                             ; preds = %grammo_out_interactive.exit.i, %grammo_out_flush.exit.i5
+  %.3.pre.i.i = load i64, ptr @grammo_in_pos, align 8
+  %.4.pre.i.i = load i64, ptr @grammo_in_end, align 8
+  %.9.i.pre30.i = load ptr, ptr @grammo_in_buf, align 8
+  br label %skip.i.i.outer
+
+skip.i.i.outer:                                   ; preds = %grammo_in_fill.exit.i.i, %grammo_out_sync.exit
+  %.9.i.i11.ph = phi ptr [ %.9.i.pre.i, %grammo_in_fill.exit.i.i ], [ %.9.i.pre30.i, %grammo_out_sync.exit ]
+  %.4.i.i.ph = phi i64 [ %.33.i.i.i, %grammo_in_fill.exit.i.i ], [ %.4.pre.i.i, %grammo_out_sync.exit ]
+  %.3.i.i12.ph = phi i64 [ 0, %grammo_in_fill.exit.i.i ], [ %.3.pre.i.i, %grammo_out_sync.exit ]
+  br label %skip.i.i
+
+skip.i.i:                                         ; preds = %skip.i.i.outer, %skip_next.i.i
+  %.3.i.i12 = phi i64 [ %.19.i.i, %skip_next.i.i ], [ %.3.i.i12.ph, %skip.i.i.outer ]
+  %.5.i.i13 = icmp ult i64 %.3.i.i12, %.4.i.i.ph
+  br i1 %.5.i.i13, label %skip_test.i.i, label %skip_fill.i.i
+
+skip_fill.i.i:                                    ; preds = %skip.i.i
+  %.3.i.i.i = icmp eq ptr %.9.i.i11.ph, null
+  br i1 %.3.i.i.i, label %alloc.i.i.i, label %entry.check_full_crit_edge.i.i.i
+
+entry.check_full_crit_edge.i.i.i:                 ; preds = %skip_fill.i.i
+  %.12.pre.i.i.i = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i.i.i
+
+alloc.i.i.i:                                      ; preds = %skip_fill.i.i
+  %.5.i.i.i = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i.i.i, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i.i.i
+
+check_full.i.i.i:                                 ; preds = %alloc.i.i.i, %entry.check_full_crit_edge.i.i.i
+  %.17.i.i.i = phi ptr [ %.9.i.i11.ph, %entry.check_full_crit_edge.i.i.i ], [ %.5.i.i.i, %alloc.i.i.i ]
+  %.12.i.i.i = phi i64 [ %.12.pre.i.i.i, %entry.check_full_crit_edge.i.i.i ], [ 65536, %alloc.i.i.i ]
+  %.11.i.i.i = sub i64 %.4.i.i.ph, %.3.i.i12
+  %.13.i.i.i = icmp eq i64 %.11.i.i.i, %.12.i.i.i
+  br i1 %.13.i.i.i, label %grow.i.i.i, label %grammo_in_fill.exit.i.i
+
+grow.i.i.i:                                       ; preds = %check_full.i.i.i
+  %.16.i.i.i = shl i64 %.12.i.i.i, 1
+  %.18.i.i.i = or disjoint i64 %.16.i.i.i, 1
+  %.19.i.i.i = tail call ptr @realloc(ptr %.17.i.i.i, i64 %.18.i.i.i)
+  store ptr %.19.i.i.i, ptr @grammo_in_buf, align 8
+  store i64 %.16.i.i.i, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit.i.i
+
+grammo_in_fill.exit.i.i:                          ; preds = %grow.i.i.i, %check_full.i.i.i
+  %.28.i.i.i = phi i64 [ %.16.i.i.i, %grow.i.i.i ], [ %.12.i.i.i, %check_full.i.i.i ]
+  %.23.i.i.i = phi ptr [ %.19.i.i.i, %grow.i.i.i ], [ %.17.i.i.i, %check_full.i.i.i ]
+  %.25.i.i.i = getelementptr i8, ptr %.23.i.i.i, i64 %.3.i.i12
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i.i.i, ptr align 1 %.25.i.i.i, i64 %.11.i.i.i, i1 false)
+  %.27.i.i.i = getelementptr i8, ptr %.23.i.i.i, i64 %.11.i.i.i
+  %.29.i.i.i = sub i64 %.28.i.i.i, %.11.i.i.i
+  %.30.i.i.i = tail call i64 @read(i32 0, ptr %.27.i.i.i, i64 %.29.i.i.i)
+  %.31.i.i.i = icmp sgt i64 %.30.i.i.i, 0
+  %.32.i.i.i = tail call i64 @llvm.smax.i64(i64 %.30.i.i.i, i64 0)
+  %.33.i.i.i = add i64 %.32.i.i.i, %.11.i.i.i
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i.i.i, ptr @grammo_in_end, align 8
+  %.36.i.i.i = getelementptr i8, ptr %.23.i.i.i, i64 %.33.i.i.i
+  store i8 0, ptr %.36.i.i.i, align 1
+  %.9.i.pre.i = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.31.i.i.i, label %skip.i.i.outer, label %grammo_in_token.exit.i
+
+skip_test.i.i:                                    ; preds = %skip.i.i
+  %.11.i.i23 = getelementptr i8, ptr %.9.i.i11.ph, i64 %.3.i.i12
+  %.12.i.i = load i8, ptr %.11.i.i23, align 1
+  switch i8 %.12.i.i, label %scan.outer.i.i [
+    i8 32, label %skip_next.i.i
+    i8 13, label %skip_next.i.i
+    i8 12, label %skip_next.i.i
+    i8 11, label %skip_next.i.i
+    i8 10, label %skip_next.i.i
+    i8 9, label %skip_next.i.i
+  ]
+
+skip_next.i.i:                                    ; preds = %skip_test.i.i, %skip_test.i.i, %skip_test.i.i, %skip_test.i.i, %skip_test.i.i, %skip_test.i.i
+  %.19.i.i = add nuw i64 %.3.i.i12, 1
+  store i64 %.19.i.i, ptr @grammo_in_pos, align 8
+  br label %skip.i.i
+
+scan.i.i:                                         ; preds = %grammo_in_fill.exit28.i.peel.i, %grammo_in_fill.exit28.i.i
+  %.24.i.i = phi i64 [ %.33.i20.i.i, %grammo_in_fill.exit28.i.i ], [ %.33.i20.i.peel.i, %grammo_in_fill.exit28.i.peel.i ]
+  %.25.i.i = icmp ult i64 %length.ph.i.i, %.24.i.i
+  %.27.i.pre.i = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.25.i.i, label %scan_test.i.i, label %scan_fill.i.i
+
+scan_test.i.i:                                    ; preds = %scan.i.i, %scan.outer.i.i
+  %.27.i.i = phi ptr [ %.27.i34.i, %scan.outer.i.i ], [ %.27.i.pre.i, %scan.i.i ]
+  %.24.i.lcssa.i = phi i64 [ %.2444.i.i, %scan.outer.i.i ], [ %.24.i.i, %scan.i.i ]
+  %.22.i.lcssa.i = phi i64 [ %.2242.i.i, %scan.outer.i.i ], [ 0, %scan.i.i ]
+  %.23.i.lcssa.i = phi i64 [ %.23.i.peel.i, %scan.outer.i.i ], [ %length.ph.i.i, %scan.i.i ]
+  %.28.i.i = getelementptr i8, ptr %.27.i.i, i64 %.23.i.lcssa.i
+  %.29.i.i = load i8, ptr %.28.i.i, align 1
+  switch i8 %.29.i.i, label %scan_next.i.i [
+    i8 32, label %grammo_in_token.exit.i
+    i8 13, label %grammo_in_token.exit.i
+    i8 12, label %grammo_in_token.exit.i
+    i8 11, label %grammo_in_token.exit.i
+    i8 10, label %grammo_in_token.exit.i
+    i8 9, label %grammo_in_token.exit.i
+  ]
+
+scan_next.i.i:                                    ; preds = %scan_test.i.i
+  %.35.i.i = add i64 %length.ph.i.i, 1
+  br label %scan.outer.i.i
+
+scan.outer.i.i:                                   ; preds = %skip_test.i.i, %scan_next.i.i
+  %.27.i34.i = phi ptr [ %.27.i.i, %scan_next.i.i ], [ %.9.i.i11.ph, %skip_test.i.i ]
+  %.2444.i.i = phi i64 [ %.24.i.lcssa.i, %scan_next.i.i ], [ %.4.i.i.ph, %skip_test.i.i ]
+  %.2242.i.i = phi i64 [ %.22.i.lcssa.i, %scan_next.i.i ], [ %.3.i.i12, %skip_test.i.i ]
+  %length.ph.i.i = phi i64 [ %.35.i.i, %scan_next.i.i ], [ 1, %skip_test.i.i ]
+  %.23.i.peel.i = add i64 %length.ph.i.i, %.2242.i.i
+  %.25.i.peel.i = icmp ult i64 %.23.i.peel.i, %.2444.i.i
+  br i1 %.25.i.peel.i, label %scan_test.i.i, label %check_full.i5.i.peel.i
+
+check_full.i5.i.peel.i:                           ; preds = %scan.outer.i.i
+  %.12.pre.i4.i.peel.i = load i64, ptr @grammo_in_cap, align 8
+  %.11.i10.i.peel.i = sub i64 %.2444.i.i, %.2242.i.i
+  %.13.i11.i.peel.i = icmp eq i64 %.11.i10.i.peel.i, %.12.pre.i4.i.peel.i
+  br i1 %.13.i11.i.peel.i, label %grow.i22.i.peel.i, label %grammo_in_fill.exit28.i.peel.i
+
+grow.i22.i.peel.i:                                ; preds = %check_full.i5.i.peel.i
+  %.16.i23.i.peel.i = shl i64 %.12.pre.i4.i.peel.i, 1
+  %.18.i24.i.peel.i = or disjoint i64 %.16.i23.i.peel.i, 1
+  %.19.i25.i.peel.i = tail call ptr @realloc(ptr nonnull %.27.i34.i, i64 %.18.i24.i.peel.i)
+  store ptr %.19.i25.i.peel.i, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23.i.peel.i, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28.i.peel.i
+
+grammo_in_fill.exit28.i.peel.i:                   ; preds = %grow.i22.i.peel.i, %check_full.i5.i.peel.i
+  %.28.i12.i.peel.i = phi i64 [ %.16.i23.i.peel.i, %grow.i22.i.peel.i ], [ %.12.pre.i4.i.peel.i, %check_full.i5.i.peel.i ]
+  %.23.i13.i.peel.i = phi ptr [ %.19.i25.i.peel.i, %grow.i22.i.peel.i ], [ %.27.i34.i, %check_full.i5.i.peel.i ]
+  %.25.i14.i.peel.i = getelementptr i8, ptr %.23.i13.i.peel.i, i64 %.2242.i.i
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i13.i.peel.i, ptr align 1 %.25.i14.i.peel.i, i64 %.11.i10.i.peel.i, i1 false)
+  %.27.i15.i.peel.i = getelementptr i8, ptr %.23.i13.i.peel.i, i64 %.11.i10.i.peel.i
+  %.29.i16.i.peel.i = sub i64 %.28.i12.i.peel.i, %.11.i10.i.peel.i
+  %.30.i17.i.peel.i = tail call i64 @read(i32 0, ptr %.27.i15.i.peel.i, i64 %.29.i16.i.peel.i)
+  %.31.i18.i.peel.i = icmp sgt i64 %.30.i17.i.peel.i, 0
+  %.32.i19.i.peel.i = tail call i64 @llvm.smax.i64(i64 %.30.i17.i.peel.i, i64 0)
+  %.33.i20.i.peel.i = add i64 %.32.i19.i.peel.i, %.11.i10.i.peel.i
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20.i.peel.i, ptr @grammo_in_end, align 8
+  %.36.i21.i.peel.i = getelementptr i8, ptr %.23.i13.i.peel.i, i64 %.33.i20.i.peel.i
+  store i8 0, ptr %.36.i21.i.peel.i, align 1
+  br i1 %.31.i18.i.peel.i, label %scan.i.i, label %grammo_in_token.exit.loopexit.i
+
+scan_fill.i.i:                                    ; preds = %scan.i.i
+  %.3.i2.i.i = icmp eq ptr %.27.i.pre.i, null
+  br i1 %.3.i2.i.i, label %alloc.i26.i.i, label %entry.check_full_crit_edge.i3.i.i
+
+entry.check_full_crit_edge.i3.i.i:                ; preds = %scan_fill.i.i
+  %.12.pre.i4.i.i = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.i.i
+
+alloc.i26.i.i:                                    ; preds = %scan_fill.i.i
+  %.5.i27.i.i = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i27.i.i, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.i.i
+
+check_full.i5.i.i:                                ; preds = %alloc.i26.i.i, %entry.check_full_crit_edge.i3.i.i
+  %.17.i6.i.i = phi ptr [ %.27.i.pre.i, %entry.check_full_crit_edge.i3.i.i ], [ %.5.i27.i.i, %alloc.i26.i.i ]
+  %.12.i7.i.i = phi i64 [ %.12.pre.i4.i.i, %entry.check_full_crit_edge.i3.i.i ], [ 65536, %alloc.i26.i.i ]
+  %.13.i11.i.i = icmp eq i64 %.24.i.i, %.12.i7.i.i
+  br i1 %.13.i11.i.i, label %grow.i22.i.i, label %grammo_in_fill.exit28.i.i
+
+grow.i22.i.i:                                     ; preds = %check_full.i5.i.i
+  %.16.i23.i.i = shl i64 %.24.i.i, 1
+  %.18.i24.i.i = or disjoint i64 %.16.i23.i.i, 1
+  %.19.i25.i.i = tail call ptr @realloc(ptr %.17.i6.i.i, i64 %.18.i24.i.i)
+  store ptr %.19.i25.i.i, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23.i.i, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28.i.i
+
+grammo_in_fill.exit28.i.i:                        ; preds = %grow.i22.i.i, %check_full.i5.i.i
+  %.28.i12.i.i = phi i64 [ %.16.i23.i.i, %grow.i22.i.i ], [ %.12.i7.i.i, %check_full.i5.i.i ]
+  %.23.i13.i.i = phi ptr [ %.19.i25.i.i, %grow.i22.i.i ], [ %.17.i6.i.i, %check_full.i5.i.i ]
+  %.27.i15.i.i = getelementptr i8, ptr %.23.i13.i.i, i64 %.24.i.i
+  %.29.i16.i.i = sub i64 %.28.i12.i.i, %.24.i.i
+  %.30.i17.i.i = tail call i64 @read(i32 0, ptr %.27.i15.i.i, i64 %.29.i16.i.i)
+  %.31.i18.i.i = icmp sgt i64 %.30.i17.i.i, 0
+  %.32.i19.i.i = tail call i64 @llvm.smax.i64(i64 %.30.i17.i.i, i64 0)
+  %.33.i20.i.i = add i64 %.32.i19.i.i, %.24.i.i
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20.i.i, ptr @grammo_in_end, align 8
+  %.36.i21.i.i = getelementptr i8, ptr %.23.i13.i.i, i64 %.33.i20.i.i
+  store i8 0, ptr %.36.i21.i.i, align 1
+  br i1 %.31.i18.i.i, label %scan.i.i, label %grammo_in_token.exit.loopexit.i, !llvm.loop !0
+
+grammo_in_token.exit.loopexit.i:                  ; preds = %grammo_in_fill.exit28.i.peel.i, %grammo_in_fill.exit28.i.i
+  %.4.pre.i = load ptr, ptr @grammo_in_buf, align 8
+  br label %grammo_in_token.exit.i
+
+grammo_in_token.exit.i:                           ; preds = %grammo_in_fill.exit.i.i, %scan_test.i.i, %scan_test.i.i, %scan_test.i.i, %scan_test.i.i, %scan_test.i.i, %scan_test.i.i, %grammo_in_token.exit.loopexit.i
+  %.4.i14 = phi ptr [ %.4.pre.i, %grammo_in_token.exit.loopexit.i ], [ %.27.i.i, %scan_test.i.i ], [ %.27.i.i, %scan_test.i.i ], [ %.27.i.i, %scan_test.i.i ], [ %.27.i.i, %scan_test.i.i ], [ %.27.i.i, %scan_test.i.i ], [ %.27.i.i, %scan_test.i.i ], [ %.9.i.pre.i, %grammo_in_fill.exit.i.i ]
+  %common.ret.op.i.i = phi i64 [ %length.ph.i.i, %grammo_in_token.exit.loopexit.i ], [ %length.ph.i.i, %scan_test.i.i ], [ %length.ph.i.i, %scan_test.i.i ], [ %length.ph.i.i, %scan_test.i.i ], [ %length.ph.i.i, %scan_test.i.i ], [ %length.ph.i.i, %scan_test.i.i ], [ %length.ph.i.i, %scan_test.i.i ], [ 0, %grammo_in_fill.exit.i.i ]
+  %.5.i15 = load i64, ptr @grammo_in_pos, align 8
+  %.6.i16 = getelementptr i8, ptr %.4.i14, i64 %.5.i15
+  %.7.i17 = load i8, ptr %.6.i16, align 1
+  %.8.i18 = icmp eq i8 %.7.i17, 45
+  %.9.i = icmp eq i8 %.7.i17, 43
+  %.10.i = or i1 %.8.i18, %.9.i
+  %.11.i = zext i1 %.10.i to i64
+  %.139.i = icmp ugt i64 %common.ret.op.i.i, %.11.i
+  %.1410.i = getelementptr i8, ptr %.6.i16, i64 %.11.i
+  %.1511.i = load i8, ptr %.1410.i, align 1
+  %.1612.i = add i8 %.1511.i, -48
+  %.1713.i = icmp ult i8 %.1612.i, 10
+  %.1814.i = and i1 %.1713.i, %.139.i
+  br i1 %.1814.i, label %digit.i, label %g.fact.exit
+
+digit.i:                                          ; preds = %grammo_in_token.exit.i, %digit.i
+  %.1617.i = phi i8 [ %.16.i22, %digit.i ], [ %.1612.i, %grammo_in_token.exit.i ]
+  %value16.i = phi i32 [ %.23.i, %digit.i ], [ 0, %grammo_in_token.exit.i ]
+  %i15.i = phi i64 [ %.20.i19, %digit.i ], [ %.11.i, %grammo_in_token.exit.i ]
+  %.20.i19 = add nuw i64 %i15.i, 1
+  %.21.i20 = mul i32 %value16.i, 10
+  %.22.i21 = zext nneg i8 %.1617.i to i32
+  %.23.i = add i32 %.21.i20, %.22.i21
+  %.13.i = icmp ult i64 %.20.i19, %common.ret.op.i.i
+  %.14.i = getelementptr i8, ptr %.6.i16, i64 %.20.i19
+  %.15.i = load i8, ptr %.14.i, align 1
+  %.16.i22 = add i8 %.15.i, -48
+  %.17.i = icmp ult i8 %.16.i22, 10
+  %.18.i = and i1 %.13.i, %.17.i
+  br i1 %.18.i, label %digit.i, label %end_digits.i
+
+end_digits.i:                                     ; preds = %digit.i
+  %.25.not.i = icmp ult i64 %i15.i, %.11.i
+  br i1 %.25.not.i, label %g.fact.exit, label %grammo_in_read_int.exit
+
+grammo_in_read_int.exit:                          ; preds = %end_digits.i
+  %.27.i = sub i32 0, %.23.i
+  %.28.i = select i1 %.8.i18, i32 %.27.i, i32 %.23.i
+  %.31.i = add i64 %.20.i19, %.5.i15
+  store i64 %.31.i, ptr @grammo_in_pos, align 8
+  %.6.i24 = icmp slt i32 %.28.i, 0
+  br i1 %.6.i24, label %g.fact.exit, label %for_cond.preheader.i
+
+for_cond.preheader.i:                             ; preds = %grammo_in_read_int.exit
+  %.11.not5.i = icmp eq i32 %.28.i, 0
+  br i1 %.11.not5.i, label %g.fact.exit, label %for_body.i.preheader
 
 for_body.i.preheader:                             ; preds = %for_cond.preheader.i
-  %min.iters.check = icmp ult i32 %load_n, 20
-  br i1 %min.iters.check, label %for_body.i.preheader2, label %vector.scevcheck
-
-vector.scevcheck:                                 ; preds = %for_body.i.preheader
-  %0 = zext nneg i32 %load_n to i64
-  %1 = add nsw i64 %0, -1
-  %2 = trunc nsw i64 %1 to i32
-  %3 = icmp ugt i32 %2, 2147483645
-  %4 = icmp ugt i64 %1, 4294967295
-  %5 = or i1 %3, %4
-  br i1 %5, label %for_body.i.preheader2, label %vector.ph
-
-vector.ph:                                        ; preds = %vector.scevcheck
-  %n.vec = and i32 %load_n, 2147483640
-  %6 = or disjoint i32 %n.vec, 1
+  %min.iters.check = icmp ult i32 %.28.i, 20
+  %0 = zext nneg i32 %.28.i to i64
+  %1 = add nsw i64 %0, -2147483647
+  %2 = icmp ult i64 %1, -2147483646
+  %or.cond = select i1 %min.iters.check, i1 true, i1 %2
+  br i1 %or.cond, label %for_body.i.preheader128, label %vector.ph
+
+vector.ph:                                        ; preds = %for_body.i.preheader
+  %n.vec = and i32 %.28.i, 2147483640
+  %3 = or disjoint i32 %n.vec, 1
   br label %vector.body
 
 vector.body:                                      ; preds = %vector.body, %vector.ph
   %index = phi i32 [ 0, %vector.ph ], [ %index.next, %vector.body ]
-  %vec.phi = phi <4 x i32> [ splat (i32 1), %vector.ph ], [ %7, %vector.body ]
-  %vec.phi1 = phi <4 x i32> [ splat (i32 1), %vector.ph ], [ %8, %vector.body ]
+  %vec.phi = phi <4 x i32> [ splat (i32 1), %vector.ph ], [ %4, %vector.body ]
+  %vec.phi125 = phi <4 x i32> [ splat (i32 1), %vector.ph ], [ %5, %vector.body ]
   %vec.ind = phi <4 x i32> [ <i32 1, i32 2, i32 3, i32 4>, %vector.ph ], [ %vec.ind.next, %vector.body ]
   %step.add = add <4 x i32> %vec.ind, splat (i32 4)
-  %7 = mul <4 x i32> %vec.ind, %vec.phi
-  %8 = mul <4 x i32> %step.add, %vec.phi1
+  %4 = mul <4 x i32> %vec.ind, %vec.phi
+  %5 = mul <4 x i32> %step.add, %vec.phi125
   %index.next = add nuw i32 %index, 8
   %vec.ind.next = add <4 x i32> %vec.ind, splat (i32 8)
-  %9 = icmp eq i32 %index.next, %n.vec
-  br i1 %9, label %middle.block, label %vector.body, !llvm.loop !4
+  %6 = icmp eq i32 %index.next, %n.vec
+  br i1 %6, label %middle.block, label %vector.body, !llvm.loop !2
 
 middle.block:                                     ; preds = %vector.body
-  %bin.rdx = mul <4 x i32> %8, %7
-  %10 = call i32 @llvm.vector.reduce.mul.v4i32(<4 x i32> %bin.rdx)
-  %cmp.n = icmp eq i32 %load_n, %n.vec
-  br i1 %cmp.n, label %fact.exit, label %for_body.i.preheader2
-
-for_body.i.preheader2:                            ; preds = %vector.scevcheck, %for_body.i.preheader, %middle.block
-  %r.07.i.ph = phi i32 [ 1, %for_body.i.preheader ], [ 1, %vector.scevcheck ], [ %10, %middle.block ]
-  %i.06.i.ph = phi i32 [ 1, %for_body.i.preheader ], [ 1, %vector.scevcheck ], [ %6, %middle.block ]
+  %bin.rdx = mul <4 x i32> %5, %4
+  %7 = tail call i32 @llvm.vector.reduce.mul.v4i32(<4 x i32> %bin.rdx)
+  %cmp.n = icmp eq i32 %.28.i, %n.vec
+  br i1 %cmp.n, label %g.fact.exit, label %for_body.i.preheader128
+
+for_body.i.preheader128:                          ; preds = %for_body.i.preheader, %middle.block
+  %r.07.i.ph = phi i32 [ 1, %for_body.i.preheader ], [ %7, %middle.block ]
+  %i.06.i.ph = phi i32 [ 1, %for_body.i.preheader ], [ %3, %middle.block ]
   br label %for_body.i
 
-for_body.i:                                       ; preds = %for_body.i.preheader2, %for_body.i
-  %r.07.i = phi i32 [ %.13.i, %for_body.i ], [ %r.07.i.ph, %for_body.i.preheader2 ]
-  %i.06.i = phi i32 [ %.15.i, %for_body.i ], [ %i.06.i.ph, %for_body.i.preheader2 ]
-  %.13.i = mul i32 %i.06.i, %r.07.i
-  %.15.i = add i32 %i.06.i, 1
-  %.11.not.i = icmp sgt i32 %.15.i, %load_n
-  br i1 %.11.not.i, label %fact.exit, label %for_body.i, !llvm.loop !5
-
-fact.exit:                                        ; preds = %for_body.i, %middle.block, %entry, %for_cond.preheader.i
-  %common.ret.op.i = phi i32 [ 0, %entry ], [ 1, %for_cond.preheader.i ], [ %10, %middle.block ], [ %.13.i, %for_body.i ]
-  %.13 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_3)
-  %.15 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, i32 %common.ret.op.i)
-  %putchar = call i32 @putchar(i32 10)
+for_body.i:                                       ; preds = %for_body.i.preheader128, %for_body.i
+  %r.07.i = phi i32 [ %.13.i25, %for_body.i ], [ %r.07.i.ph, %for_body.i.preheader128 ]
+  %i.06.i = phi i32 [ %.15.i26, %for_body.i ], [ %i.06.i.ph, %for_body.i.preheader128 ]
+  %.13.i25 = mul i32 %i.06.i, %r.07.i
+  %.15.i26 = add i32 %i.06.i, 1
+  %.11.not.i = icmp sgt i32 %.15.i26, %.28.i
+  br i1 %.11.not.i, label %g.fact.exit, label %for_body.i, !llvm.loop !5
+
+g.fact.exit:                                      ; preds = %for_body.i, %middle.block, %end_digits.i, %grammo_in_token.exit.i, %grammo_in_read_int.exit, %for_cond.preheader.i
+  %common.ret.op.i = phi i32 [ 0, %grammo_in_read_int.exit ], [ 1, %for_cond.preheader.i ], [ 1, %grammo_in_token.exit.i ], [ 1, %end_digits.i ], [ %7, %middle.block ], [ %.13.i25, %for_body.i ]
+  %.4.i27 = load i64, ptr @grammo_out_len, align 8
+  %.5.i28 = add i64 %.4.i27, 21
+  %.6.b.i29 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i30 = select i1 %.6.b.i29, i64 65536, i64 0
+  %.7.not.i31 = icmp ugt i64 %.5.i28, %.6.i30
+  %.20.pre1.i32 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i31, label %loop.i.i36, label %grammo_out_reserve.exit50
+
+loop.i.i36:                                       ; preds = %g.fact.exit, %body.i.i44
+  %written.i.i37 = phi i64 [ %.10.i.i48, %body.i.i44 ], [ 0, %g.fact.exit ]
+  %.5.i.i38 = icmp slt i64 %written.i.i37, %.4.i27
+  br i1 %.5.i.i38, label %body.i.i44, label %grammo_out_flush.exit.i39
+
+body.i.i44:                                       ; preds = %loop.i.i36
+  %.7.i.i45 = getelementptr i8, ptr %.20.pre1.i32, i64 %written.i.i37
+  %.8.i.i46 = sub i64 %.4.i27, %written.i.i37
+  %.9.i.i47 = tail call i64 @write(i32 1, ptr %.7.i.i45, i64 %.8.i.i46)
+  %.10.i.i48 = add i64 %.9.i.i47, %written.i.i37
+  %.11.i.i49 = icmp sgt i64 %.9.i.i47, 0
+  br i1 %.11.i.i49, label %loop.i.i36, label %grammo_out_flush.exit.i39
+
+grammo_out_flush.exit.i39:                        ; preds = %body.i.i44, %loop.i.i36
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i40 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i41 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i40, label %grammo_out_reserve.exit50, label %grow.i42
+
+grow.i42:                                         ; preds = %grammo_out_flush.exit.i39
+  %.16.i43 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i41, i64 65536)
+  store ptr %.16.i43, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit50
+
+grammo_out_reserve.exit50:                        ; preds = %g.fact.exit, %grammo_out_flush.exit.i39, %grow.i42
+  %.21.i33 = phi i64 [ 0, %grow.i42 ], [ 0, %grammo_out_flush.exit.i39 ], [ %.4.i27, %g.fact.exit ]
+  %.20.i34 = phi ptr [ %.16.i43, %grow.i42 ], [ %.20.pre.i41, %grammo_out_flush.exit.i39 ], [ %.20.pre1.i32, %g.fact.exit ]
+  %.22.i35 = getelementptr i8, ptr %.20.i34, i64 %.21.i33
+  %.16 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i35, i64 21, ptr nonnull @str_1, i32 %common.ret.op.i)
+  %8 = tail call i32 @llvm.smax.i32(i32 %.16, i32 0)
+  %.6.i51 = zext nneg i32 %8 to i64
+  %.7.i52 = load i64, ptr @grammo_out_len, align 8
+  %.8.i53 = add i64 %.7.i52, %.6.i51
+  store i64 %.8.i53, ptr @grammo_out_len, align 8
+  %.2.i.i54 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i55 = icmp slt i32 %.2.i.i54, 0
+  br i1 %.3.i.i55, label %check.i.i72, label %grammo_out_interactive.exit.i56
+
+check.i.i72:                                      ; preds = %grammo_out_reserve.exit50
+  %.5.i.i73 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i73, ptr @grammo_out_tty, align 4
+  %.3.i.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i56
+
+grammo_out_interactive.exit.i56:                  ; preds = %check.i.i72, %grammo_out_reserve.exit50
+  %.3.i.pre = phi i64 [ %.3.i.pre.pre, %check.i.i72 ], [ %.8.i53, %grammo_out_reserve.exit50 ]
+  %.8.i.i57 = phi i32 [ %.5.i.i73, %check.i.i72 ], [ %.2.i.i54, %grammo_out_reserve.exit50 ]
+  %.9.i.i58 = icmp sgt i32 %.8.i.i57, 0
+  %.2.i.pre103 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i58, label %loop.i.i62, label %grammo_out_advance.exit
+
+loop.i.i62:                                       ; preds = %grammo_out_interactive.exit.i56, %body.i.i66
+  %written.i.i63 = phi i64 [ %.10.i.i70, %body.i.i66 ], [ 0, %grammo_out_interactive.exit.i56 ]
+  %.5.i3.i64 = icmp slt i64 %written.i.i63, %.3.i.pre
+  br i1 %.5.i3.i64, label %body.i.i66, label %grammo_out_flush.exit.i65
+
+body.i.i66:                                       ; preds = %loop.i.i62
+  %.7.i.i67 = getelementptr i8, ptr %.2.i.pre103, i64 %written.i.i63
+  %.8.i4.i68 = sub i64 %.3.i.pre, %written.i.i63
+  %.9.i5.i69 = tail call i64 @write(i32 1, ptr %.7.i.i67, i64 %.8.i4.i68)
+  %.10.i.i70 = add i64 %.9.i5.i69, %written.i.i63
+  %.11.i.i71 = icmp sgt i64 %.9.i5.i69, 0
+  br i1 %.11.i.i71, label %loop.i.i62, label %grammo_out_flush.exit.i65
+
+grammo_out_flush.exit.i65:                        ; preds = %body.i.i66, %loop.i.i62
+  store i64 0, ptr @grammo_out_len, align 8
+  %.2.i.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit
+
+grammo_out_advance.exit:                          ; preds = %grammo_out_interactive.exit.i56, %grammo_out_flush.exit.i65
+  %.3.i = phi i64 [ %.3.i.pre, %grammo_out_interactive.exit.i56 ], [ 0, %grammo_out_flush.exit.i65 ]
+  %.2.i = phi ptr [ %.2.i.pre103, %grammo_out_interactive.exit.i56 ], [ %.2.i.pre, %grammo_out_flush.exit.i65 ]
+  br label %loop.i
+
+loop.i:                                           ; preds = %body.i, %grammo_out_advance.exit
+  %written.i = phi i64 [ 0, %grammo_out_advance.exit ], [ %.10.i78, %body.i ]
+  %.5.i74 = icmp slt i64 %written.i, %.3.i
+  br i1 %.5.i74, label %body.i, label %grammo_out_flush.exit
+
+body.i:                                           ; preds = %loop.i
+  %.7.i75 = getelementptr i8, ptr %.2.i, i64 %written.i
+  %.8.i76 = sub i64 %.3.i, %written.i
+  %.9.i77 = tail call i64 @write(i32 1, ptr %.7.i75, i64 %.8.i76)
+  %.10.i78 = add i64 %.9.i77, %written.i
+  %.11.i79 = icmp sgt i64 %.9.i77, 0
+  br i1 %.11.i79, label %loop.i, label %grammo_out_flush.exit
+
+grammo_out_flush.exit:                            ; preds = %loop.i, %body.i
+  store i64 0, ptr @grammo_out_len, align 8
   ret void
 }
 
-; Function Attrs: nofree nounwind
-declare noundef i32 @putchar(i32 noundef) local_unnamed_addr #0
+; Function Attrs: nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memcpy.p0.p0.i64(ptr noalias nocapture writeonly, ptr noalias nocapture readonly, i64, i1 immarg) #5
 
 ; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
-declare i32 @llvm.vector.reduce.mul.v4i32(<4 x i32>) #2
+declare i64 @llvm.smax.i64(i64, i64) #6
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i32 @llvm.smax.i32(i32, i32) #6
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i32 @llvm.vector.reduce.mul.v4i32(<4 x i32>) #6
 
 attributes #0 = { nofree nounwind }
-attributes #1 = { nofree norecurse nosync nounwind memory(none) }
-attributes #2 = { nocallback nofree nosync nounwind speculatable willreturn memory(none) }
-
-!0 = distinct !{!0, !1, !2}
-!1 = !{!"llvm.loop.isvectorized", i32 1}
-!2 = !{!"llvm.loop.unroll.runtime.disable"}
-!3 = distinct !{!3, !1}
-!4 = distinct !{!4, !1, !2}
-!5 = distinct !{!5, !1}
+attributes #1 = { mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #2 = { nounwind }
+attributes #3 = { mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #4 = { mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+attributes #5 = { nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+attributes #6 = { nocallback nofree nosync nounwind speculatable willreturn memory(none) }
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.peeled.count", i32 1}
+!2 = distinct !{!2, !3, !4}
+!3 = !{!"llvm.loop.isvectorized", i32 1}
+!4 = !{!"llvm.loop.unroll.runtime.disable"}
+!5 = distinct !{!5, !3}
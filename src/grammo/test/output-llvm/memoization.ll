@@ -0,0 +1,1610 @@
+; ModuleID = '<string>'
+source_filename = "<string>"
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-i128:128-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-unknown-linux-gnu"
+
+@g.fib.memo = internal unnamed_addr global [4096 x { [1 x i64], i32, i1 }] zeroinitializer
+@g.binomial.memo = internal unnamed_addr global [4096 x { [2 x i64], i32, i1 }] zeroinitializer
+@g.power.memo = internal unnamed_addr global [4096 x { [2 x i64], double, i1 }] zeroinitializer
+@g.is_even.memo = internal unnamed_addr global [4096 x { [1 x i64], i1, i1 }] zeroinitializer
+@g.is_odd.memo = internal unnamed_addr global [4096 x { [1 x i64], i1, i1 }] zeroinitializer
+@grammo_out_buf = internal unnamed_addr global ptr null
+@grammo_out_cap = internal unnamed_addr global i1 false
+@grammo_out_len = internal unnamed_addr global i64 0
+@grammo_out_tty = internal unnamed_addr global i32 -1
+@str_0 = private constant [16 x i8] c"  countdown %d\0A\00"
+@str_1 = private unnamed_addr constant [14 x i8] c"Inserisci n: \00"
+@grammo_in_buf = internal unnamed_addr global ptr null
+@grammo_in_cap = internal unnamed_addr global i64 0
+@grammo_in_pos = internal unnamed_addr global i64 0
+@grammo_in_end = internal unnamed_addr global i64 0
+@str_3 = private constant [4 x i8] c"%d\0A\00"
+@str_4 = private unnamed_addr constant [17 x i8] c"binomial(2n, n)=\00"
+@str_5 = private unnamed_addr constant [15 x i8] c"power(1.5, n)=\00"
+@str_6 = private constant [21 x i8] c"%.6f power(-2.0, 3)=\00"
+@str_7 = private constant [6 x i8] c"%.6f\0A\00"
+@str_8 = private unnamed_addr constant [12 x i8] c"is_even(n)=\00"
+@str_9 = private constant [14 x i8] c"%d is_odd(n)=\00"
+@str_10 = private unnamed_addr constant [14 x i8] c"countdown(3)=\00"
+
+; Function Attrs: nofree nounwind
+declare noundef i32 @snprintf(ptr noalias nocapture noundef writeonly, i64 noundef, ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+
+; Function Attrs: mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite)
+declare noalias noundef ptr @realloc(ptr allocptr nocapture, i64 noundef) local_unnamed_addr #1
+
+; Function Attrs: nofree nounwind
+declare noundef i64 @write(i32 noundef, ptr nocapture noundef readonly, i64 noundef) local_unnamed_addr #0
+
+; Function Attrs: nounwind
+declare i32 @isatty(i32) local_unnamed_addr #2
+
+; Function Attrs: mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite)
+declare noalias noundef ptr @malloc(i64 noundef) local_unnamed_addr #3
+
+; Function Attrs: nofree nounwind
+declare noundef i64 @read(i32 noundef, ptr nocapture noundef, i64 noundef) local_unnamed_addr #0
+
+; Function Attrs: mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memmove.p0.p0.i64(ptr nocapture writeonly, ptr nocapture readonly, i64, i1 immarg) #4
+
+; Function Attrs: nofree nosync nounwind memory(readwrite, argmem: none, inaccessiblemem: none)
+define internal fastcc i32 @g.fib(i32 %.1) unnamed_addr #5 {
+entry:
+  %.3 = sext i32 %.1 to i64
+  %.4 = xor i64 %.3, -7046029254386353131
+  %.5 = mul i64 %.4, -7046029254386353131
+  %.6 = lshr i64 %.5, 52
+  %entry.1 = getelementptr inbounds nuw [4096 x { [1 x i64], i32, i1 }], ptr @g.fib.memo, i64 0, i64 %.6
+  %.7 = getelementptr inbounds nuw i8, ptr %entry.1, i64 12
+  %.8 = load i1, ptr %.7, align 4
+  br i1 %.8, label %check, label %miss
+
+check:                                            ; preds = %entry
+  %.11 = load i64, ptr %entry.1, align 16
+  %.12 = icmp eq i64 %.11, %.3
+  br i1 %.12, label %hit, label %miss
+
+common.ret:                                       ; preds = %g.fib.body.exit, %hit
+  %common.ret.op = phi i32 [ %.16, %hit ], [ %common.ret.op.i, %g.fib.body.exit ]
+  ret i32 %common.ret.op
+
+hit:                                              ; preds = %check
+  %.15 = getelementptr inbounds nuw i8, ptr %entry.1, i64 8
+  %.16 = load i32, ptr %.15, align 8
+  br label %common.ret
+
+miss:                                             ; preds = %check, %entry
+  %.4.i = icmp slt i32 %.1, 2
+  br i1 %.4.i, label %g.fib.body.exit, label %if_merge.i
+
+if_merge.i:                                       ; preds = %miss
+  %.7.i = add nsw i32 %.1, -1
+  %.8.i = tail call fastcc i32 @g.fib(i32 %.7.i)
+  %.9.i = add nsw i32 %.1, -2
+  %.10.i = tail call fastcc i32 @g.fib(i32 %.9.i)
+  %.11.i = add i32 %.10.i, %.8.i
+  br label %g.fib.body.exit
+
+g.fib.body.exit:                                  ; preds = %miss, %if_merge.i
+  %common.ret.op.i = phi i32 [ %.11.i, %if_merge.i ], [ %.1, %miss ]
+  store i64 %.3, ptr %entry.1, align 16
+  %.21 = getelementptr inbounds nuw i8, ptr %entry.1, i64 8
+  store i32 %common.ret.op.i, ptr %.21, align 8
+  store i1 true, ptr %.7, align 4
+  br label %common.ret
+}
+
+; Function Attrs: nofree nosync nounwind memory(readwrite, argmem: none, inaccessiblemem: none)
+define internal fastcc i32 @g.binomial(i32 %.1, i32 %.2) unnamed_addr #5 {
+entry:
+  %.4 = sext i32 %.1 to i64
+  %.5 = sext i32 %.2 to i64
+  %.6 = xor i64 %.4, -7046029254386353131
+  %.7 = mul i64 %.6, -7046029254386353131
+  %.8 = xor i64 %.7, %.5
+  %.9 = mul i64 %.8, -7046029254386353131
+  %.10 = lshr i64 %.9, 52
+  %entry.1 = getelementptr inbounds nuw [4096 x { [2 x i64], i32, i1 }], ptr @g.binomial.memo, i64 0, i64 %.10
+  %.11 = getelementptr inbounds nuw i8, ptr %entry.1, i64 20
+  %.12 = load i1, ptr %.11, align 4
+  br i1 %.12, label %check, label %miss
+
+check:                                            ; preds = %entry
+  %.15 = load i64, ptr %entry.1, align 8
+  %.16 = icmp eq i64 %.15, %.4
+  %.18 = getelementptr inbounds nuw i8, ptr %entry.1, i64 8
+  %.19 = load i64, ptr %.18, align 8
+  %.20 = icmp eq i64 %.19, %.5
+  %.21 = and i1 %.16, %.20
+  br i1 %.21, label %hit, label %miss
+
+common.ret:                                       ; preds = %g.binomial.body.exit, %hit
+  %common.ret.op = phi i32 [ %.24, %hit ], [ %common.ret.op.i, %g.binomial.body.exit ]
+  ret i32 %common.ret.op
+
+hit:                                              ; preds = %check
+  %.23 = getelementptr inbounds nuw i8, ptr %entry.1, i64 16
+  %.24 = load i32, ptr %.23, align 8
+  br label %common.ret
+
+miss:                                             ; preds = %check, %entry
+  %.6.i = icmp eq i32 %.2, 0
+  %.8.i = icmp eq i32 %.2, %.1
+  %.10.i = or i1 %.6.i, %.8.i
+  br i1 %.10.i, label %g.binomial.body.exit, label %if_merge.i
+
+if_merge.i:                                       ; preds = %miss
+  %.13.i = add i32 %.1, -1
+  %.14.i = add i32 %.2, -1
+  %.15.i = tail call fastcc i32 @g.binomial(i32 %.13.i, i32 %.14.i)
+  %.17.i = tail call fastcc i32 @g.binomial(i32 %.13.i, i32 %.2)
+  %.18.i = add i32 %.17.i, %.15.i
+  br label %g.binomial.body.exit
+
+g.binomial.body.exit:                             ; preds = %miss, %if_merge.i
+  %common.ret.op.i = phi i32 [ %.18.i, %if_merge.i ], [ 1, %miss ]
+  store i64 %.4, ptr %entry.1, align 8
+  %.29 = getelementptr inbounds nuw i8, ptr %entry.1, i64 8
+  store i64 %.5, ptr %.29, align 8
+  %.31 = getelementptr inbounds nuw i8, ptr %entry.1, i64 16
+  store i32 %common.ret.op.i, ptr %.31, align 8
+  store i1 true, ptr %.11, align 4
+  br label %common.ret
+}
+
+; Function Attrs: nofree nosync nounwind memory(readwrite, argmem: none, inaccessiblemem: none)
+define internal fastcc double @g.power(double %.1, i32 %.2) unnamed_addr #5 {
+entry:
+  %.4 = bitcast double %.1 to i64
+  %.5 = sext i32 %.2 to i64
+  %.6 = xor i64 %.4, -7046029254386353131
+  %.7 = mul i64 %.6, -7046029254386353131
+  %.8 = xor i64 %.7, %.5
+  %.9 = mul i64 %.8, -7046029254386353131
+  %.10 = lshr i64 %.9, 52
+  %entry.1 = getelementptr inbounds nuw [4096 x { [2 x i64], double, i1 }], ptr @g.power.memo, i64 0, i64 %.10
+  %.11 = getelementptr inbounds nuw i8, ptr %entry.1, i64 24
+  %.12 = load i1, ptr %.11, align 8
+  br i1 %.12, label %check, label %miss
+
+check:                                            ; preds = %entry
+  %.15 = load i64, ptr %entry.1, align 16
+  %.16 = icmp eq i64 %.15, %.4
+  %.18 = getelementptr inbounds nuw i8, ptr %entry.1, i64 8
+  %.19 = load i64, ptr %.18, align 8
+  %.20 = icmp eq i64 %.19, %.5
+  %.21 = and i1 %.16, %.20
+  br i1 %.21, label %hit, label %miss
+
+common.ret:                                       ; preds = %g.power.body.exit, %hit
+  %common.ret.op = phi double [ %.24, %hit ], [ %common.ret.op.i, %g.power.body.exit ]
+  ret double %common.ret.op
+
+hit:                                              ; preds = %check
+  %.23 = getelementptr inbounds nuw i8, ptr %entry.1, i64 16
+  %.24 = load double, ptr %.23, align 16
+  br label %common.ret
+
+miss:                                             ; preds = %check, %entry
+  %.6.i = icmp eq i32 %.2, 0
+  br i1 %.6.i, label %g.power.body.exit, label %if_merge.i
+
+if_merge.i:                                       ; preds = %miss
+  %.9.i = add i32 %.2, -1
+  %.10.i = tail call fastcc double @g.power(double %.1, i32 %.9.i)
+  %.11.i = fmul double %.1, %.10.i
+  br label %g.power.body.exit
+
+g.power.body.exit:                                ; preds = %miss, %if_merge.i
+  %common.ret.op.i = phi double [ %.11.i, %if_merge.i ], [ 1.000000e+00, %miss ]
+  store double %.1, ptr %entry.1, align 16
+  %.29 = getelementptr inbounds nuw i8, ptr %entry.1, i64 8
+  store i64 %.5, ptr %.29, align 8
+  %.31 = getelementptr inbounds nuw i8, ptr %entry.1, i64 16
+  store double %common.ret.op.i, ptr %.31, align 16
+  store i1 true, ptr %.11, align 8
+  br label %common.ret
+}
+
+; Function Attrs: nofree nosync nounwind memory(readwrite, argmem: none, inaccessiblemem: none)
+define internal fastcc i1 @g.is_even(i32 %.1) unnamed_addr #5 {
+entry:
+  %.3 = sext i32 %.1 to i64
+  %.4 = xor i64 %.3, -7046029254386353131
+  %.5 = mul i64 %.4, -7046029254386353131
+  %.6 = lshr i64 %.5, 52
+  %entry.1 = getelementptr inbounds nuw [4096 x { [1 x i64], i1, i1 }], ptr @g.is_even.memo, i64 0, i64 %.6
+  %.7 = getelementptr inbounds nuw i8, ptr %entry.1, i64 9
+  %.8 = load i1, ptr %.7, align 1
+  br i1 %.8, label %check, label %miss
+
+check:                                            ; preds = %entry
+  %.11 = load i64, ptr %entry.1, align 16
+  %.12 = icmp eq i64 %.11, %.3
+  br i1 %.12, label %hit, label %miss
+
+common.ret:                                       ; preds = %g.is_even.body.exit, %hit
+  %common.ret.op = phi i1 [ %.16, %hit ], [ %common.ret.op.i, %g.is_even.body.exit ]
+  ret i1 %common.ret.op
+
+hit:                                              ; preds = %check
+  %.15 = getelementptr inbounds nuw i8, ptr %entry.1, i64 8
+  %.16 = load i1, ptr %.15, align 8
+  br label %common.ret
+
+miss:                                             ; preds = %check, %entry
+  %.4.i = icmp eq i32 %.1, 0
+  br i1 %.4.i, label %g.is_even.body.exit, label %if_merge.i
+
+if_merge.i:                                       ; preds = %miss
+  %.7.i = add i32 %.1, -1
+  %.3.i = sext i32 %.7.i to i64
+  %.4.i1 = xor i64 %.3.i, -7046029254386353131
+  %.5.i = mul i64 %.4.i1, -7046029254386353131
+  %.6.i = lshr i64 %.5.i, 52
+  %entry.1.i = getelementptr inbounds nuw [4096 x { [1 x i64], i1, i1 }], ptr @g.is_odd.memo, i64 0, i64 %.6.i
+  %.7.i2 = getelementptr inbounds nuw i8, ptr %entry.1.i, i64 9
+  %.8.i3 = load i1, ptr %.7.i2, align 1
+  br i1 %.8.i3, label %check.i, label %miss.i
+
+check.i:                                          ; preds = %if_merge.i
+  %.11.i = load i64, ptr %entry.1.i, align 16
+  %.12.i = icmp eq i64 %.11.i, %.3.i
+  br i1 %.12.i, label %hit.i, label %miss.i
+
+hit.i:                                            ; preds = %check.i
+  %.15.i = getelementptr inbounds nuw i8, ptr %entry.1.i, i64 8
+  %.16.i = load i1, ptr %.15.i, align 8
+  br label %g.is_even.body.exit
+
+miss.i:                                           ; preds = %check.i, %if_merge.i
+  %.4.i.i = icmp eq i32 %.7.i, 0
+  br i1 %.4.i.i, label %g.is_odd.body.exit.i, label %if_merge.i.i
+
+if_merge.i.i:                                     ; preds = %miss.i
+  %.7.i.i = add i32 %.1, -2
+  %.8.i.i = tail call fastcc i1 @g.is_even(i32 %.7.i.i)
+  br label %g.is_odd.body.exit.i
+
+g.is_odd.body.exit.i:                             ; preds = %if_merge.i.i, %miss.i
+  %common.ret.op.i.i = phi i1 [ %.8.i.i, %if_merge.i.i ], [ false, %miss.i ]
+  store i64 %.3.i, ptr %entry.1.i, align 16
+  %.21.i = getelementptr inbounds nuw i8, ptr %entry.1.i, i64 8
+  store i1 %common.ret.op.i.i, ptr %.21.i, align 8
+  store i1 true, ptr %.7.i2, align 1
+  br label %g.is_even.body.exit
+
+g.is_even.body.exit:                              ; preds = %g.is_odd.body.exit.i, %hit.i, %miss
+  %common.ret.op.i = phi i1 [ true, %miss ], [ %.16.i, %hit.i ], [ %common.ret.op.i.i, %g.is_odd.body.exit.i ]
+  store i64 %.3, ptr %entry.1, align 16
+  %.21 = getelementptr inbounds nuw i8, ptr %entry.1, i64 8
+  store i1 %common.ret.op.i, ptr %.21, align 8
+  store i1 true, ptr %.7, align 1
+  br label %common.ret
+}
+
+; Function Attrs: nounwind
+define void @main() local_unnamed_addr #2 {
+entry:
+  %.4.i = load i64, ptr @grammo_out_len, align 8
+  %.5.i = add i64 %.4.i, 14
+  %.6.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i = select i1 %.6.b.i, i64 65536, i64 0
+  %.7.not.i = icmp ugt i64 %.5.i, %.6.i
+  %.20.pre1.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i, label %loop.i.i, label %grammo_out_reserve.exit
+
+loop.i.i:                                         ; preds = %entry, %body.i.i
+  %written.i.i = phi i64 [ %.10.i.i, %body.i.i ], [ 0, %entry ]
+  %.5.i.i = icmp slt i64 %written.i.i, %.4.i
+  br i1 %.5.i.i, label %body.i.i, label %grammo_out_flush.exit.i
+
+body.i.i:                                         ; preds = %loop.i.i
+  %.7.i.i = getelementptr i8, ptr %.20.pre1.i, i64 %written.i.i
+  %.8.i.i = sub i64 %.4.i, %written.i.i
+  %.9.i.i = tail call i64 @write(i32 1, ptr %.7.i.i, i64 %.8.i.i)
+  %.10.i.i = add i64 %.9.i.i, %written.i.i
+  %.11.i.i = icmp sgt i64 %.9.i.i, 0
+  br i1 %.11.i.i, label %loop.i.i, label %grammo_out_flush.exit.i
+
+grammo_out_flush.exit.i:                          ; preds = %body.i.i, %loop.i.i
+  %.10.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i, label %grammo_out_reserve.exit, label %grow.i
+
+grow.i:                                           ; preds = %grammo_out_flush.exit.i
+  %.16.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i, i64 65536)
+  store ptr %.16.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit
+
+grammo_out_reserve.exit:                          ; preds = %entry, %grammo_out_flush.exit.i, %grow.i
+  %.7.i = phi i64 [ 0, %grow.i ], [ 0, %grammo_out_flush.exit.i ], [ %.4.i, %entry ]
+  %.20.i = phi ptr [ %.16.i, %grow.i ], [ %.20.pre.i, %grammo_out_flush.exit.i ], [ %.20.pre1.i, %entry ]
+  %.22.i = getelementptr i8, ptr %.20.i, i64 %.7.i
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(14) %.22.i, ptr noundef nonnull align 1 dereferenceable(14) @str_1, i64 14, i1 false)
+  %.8.i = add nsw i64 %.7.i, 13
+  store i64 %.8.i, ptr @grammo_out_len, align 8
+  %.2.i.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i = icmp slt i32 %.2.i.i, 0
+  br i1 %.3.i.i, label %check.i.i, label %grammo_out_interactive.exit.i
+
+check.i.i:                                        ; preds = %grammo_out_reserve.exit
+  %.5.i.i10 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i10, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i
+
+grammo_out_interactive.exit.i:                    ; preds = %check.i.i, %grammo_out_reserve.exit
+  %.8.i.i1 = phi i32 [ %.5.i.i10, %check.i.i ], [ %.2.i.i, %grammo_out_reserve.exit ]
+  %.9.i.i2 = icmp sgt i32 %.8.i.i1, 0
+  br i1 %.9.i.i2, label %flush.i, label %grammo_out_sync.exit
+
+flush.i:                                          ; preds = %grammo_out_interactive.exit.i
+  %.2.i1.i = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i3
+
+loop.i.i3:                                        ; preds = %body.i.i6, %flush.i
+  %written.i.i4 = phi i64 [ 0, %flush.i ], [ %.10.i.i8, %body.i.i6 ]
+  %.5.i3.i = icmp slt i64 %written.i.i4, %.3.i2.i
+  br i1 %.5.i3.i, label %body.i.i6, label %grammo_out_flush.exit.i5
+
+body.i.i6:                                        ; preds = %loop.i.i3
+  %.7.i.i7 = getelementptr i8, ptr %.2.i1.i, i64 %written.i.i4
+  %.8.i4.i = sub i64 %.3.i2.i, %written.i.i4
+  %.9.i5.i = tail call i64 @write(i32 1, ptr %.7.i.i7, i64 %.8.i4.i)
+  %.10.i.i8 = add i64 %.9.i5.i, %written.i.i4
+  %.11.i.i9 = icmp sgt i64 %.9.i5.i, 0
+  br i1 %.11.i.i9, label %loop.i.i3, label %grammo_out_flush.exit.i5
+
+grammo_out_flush.exit.i5:                         ; preds = %body.i.i6, %loop.i.i3
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit
+
+grammo_out_sync.exit:                             ; preds = %grammo_out_interactive.exit.i, %grammo_out_flush.exit.i5
+  %.3.pre.i.i = load i64, ptr @grammo_in_pos, align 8
+  %.4.pre.i.i = load i64, ptr @grammo_in_end, align 8
+  %.9.i.pre30.i = load ptr, ptr @grammo_in_buf, align 8
+  br label %skip.i.i.outer
+
+skip.i.i.outer:                                   ; preds = %grammo_in_fill.exit.i.i, %grammo_out_sync.exit
+  %.9.i.i11.ph = phi ptr [ %.9.i.pre.i, %grammo_in_fill.exit.i.i ], [ %.9.i.pre30.i, %grammo_out_sync.exit ]
+  %.4.i.i.ph = phi i64 [ %.33.i.i.i, %grammo_in_fill.exit.i.i ], [ %.4.pre.i.i, %grammo_out_sync.exit ]
+  %.3.i.i12.ph = phi i64 [ 0, %grammo_in_fill.exit.i.i ], [ %.3.pre.i.i, %grammo_out_sync.exit ]
+  br label %skip.i.i
+
+skip.i.i:                                         ; preds = %skip.i.i.outer, %skip_next.i.i
+  %.3.i.i12 = phi i64 [ %.19.i.i, %skip_next.i.i ], [ %.3.i.i12.ph, %skip.i.i.outer ]
+  %.5.i.i13 = icmp ult i64 %.3.i.i12, %.4.i.i.ph
+  br i1 %.5.i.i13, label %skip_test.i.i, label %skip_fill.i.i
+
+skip_fill.i.i:                                    ; preds = %skip.i.i
+  %.3.i.i.i = icmp eq ptr %.9.i.i11.ph, null
+  br i1 %.3.i.i.i, label %alloc.i.i.i, label %entry.check_full_crit_edge.i.i.i
+
+entry.check_full_crit_edge.i.i.i:                 ; preds = %skip_fill.i.i
+  %.12.pre.i.i.i = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i.i.i
+
+alloc.i.i.i:                                      ; preds = %skip_fill.i.i
+  %.5.i.i.i = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i.i.i, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i.i.i
+
+check_full.i.i.i:                                 ; preds = %alloc.i.i.i, %entry.check_full_crit_edge.i.i.i
+  %.17.i.i.i = phi ptr [ %.9.i.i11.ph, %entry.check_full_crit_edge.i.i.i ], [ %.5.i.i.i, %alloc.i.i.i ]
+  %.12.i.i.i = phi i64 [ %.12.pre.i.i.i, %entry.check_full_crit_edge.i.i.i ], [ 65536, %alloc.i.i.i ]
+  %.11.i.i.i = sub i64 %.4.i.i.ph, %.3.i.i12
+  %.13.i.i.i = icmp eq i64 %.11.i.i.i, %.12.i.i.i
+  br i1 %.13.i.i.i, label %grow.i.i.i, label %grammo_in_fill.exit.i.i
+
+grow.i.i.i:                                       ; preds = %check_full.i.i.i
+  %.16.i.i.i = shl i64 %.12.i.i.i, 1
+  %.18.i.i.i = or disjoint i64 %.16.i.i.i, 1
+  %.19.i.i.i = tail call ptr @realloc(ptr %.17.i.i.i, i64 %.18.i.i.i)
+  store ptr %.19.i.i.i, ptr @grammo_in_buf, align 8
+  store i64 %.16.i.i.i, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit.i.i
+
+grammo_in_fill.exit.i.i:                          ; preds = %grow.i.i.i, %check_full.i.i.i
+  %.28.i.i.i = phi i64 [ %.16.i.i.i, %grow.i.i.i ], [ %.12.i.i.i, %check_full.i.i.i ]
+  %.23.i.i.i = phi ptr [ %.19.i.i.i, %grow.i.i.i ], [ %.17.i.i.i, %check_full.i.i.i ]
+  %.25.i.i.i = getelementptr i8, ptr %.23.i.i.i, i64 %.3.i.i12
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i.i.i, ptr align 1 %.25.i.i.i, i64 %.11.i.i.i, i1 false)
+  %.27.i.i.i = getelementptr i8, ptr %.23.i.i.i, i64 %.11.i.i.i
+  %.29.i.i.i = sub i64 %.28.i.i.i, %.11.i.i.i
+  %.30.i.i.i = tail call i64 @read(i32 0, ptr %.27.i.i.i, i64 %.29.i.i.i)
+  %.31.i.i.i = icmp sgt i64 %.30.i.i.i, 0
+  %.32.i.i.i = tail call i64 @llvm.smax.i64(i64 %.30.i.i.i, i64 0)
+  %.33.i.i.i = add i64 %.32.i.i.i, %.11.i.i.i
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i.i.i, ptr @grammo_in_end, align 8
+  %.36.i.i.i = getelementptr i8, ptr %.23.i.i.i, i64 %.33.i.i.i
+  store i8 0, ptr %.36.i.i.i, align 1
+  %.9.i.pre.i = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.31.i.i.i, label %skip.i.i.outer, label %grammo_in_token.exit.i
+
+skip_test.i.i:                                    ; preds = %skip.i.i
+  %.11.i.i23 = getelementptr i8, ptr %.9.i.i11.ph, i64 %.3.i.i12
+  %.12.i.i = load i8, ptr %.11.i.i23, align 1
+  switch i8 %.12.i.i, label %scan.outer.i.i [
+    i8 32, label %skip_next.i.i
+    i8 13, label %skip_next.i.i
+    i8 12, label %skip_next.i.i
+    i8 11, label %skip_next.i.i
+    i8 10, label %skip_next.i.i
+    i8 9, label %skip_next.i.i
+  ]
+
+skip_next.i.i:                                    ; preds = %skip_test.i.i, %skip_test.i.i, %skip_test.i.i, %skip_test.i.i, %skip_test.i.i, %skip_test.i.i
+  %.19.i.i = add nuw i64 %.3.i.i12, 1
+  store i64 %.19.i.i, ptr @grammo_in_pos, align 8
+  br label %skip.i.i
+
+scan.i.i:                                         ; preds = %grammo_in_fill.exit28.i.peel.i, %grammo_in_fill.exit28.i.i
+  %.24.i.i = phi i64 [ %.33.i20.i.i, %grammo_in_fill.exit28.i.i ], [ %.33.i20.i.peel.i, %grammo_in_fill.exit28.i.peel.i ]
+  %.25.i.i = icmp ult i64 %length.ph.i.i, %.24.i.i
+  %.27.i.pre.i = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.25.i.i, label %scan_test.i.i, label %scan_fill.i.i
+
+scan_test.i.i:                                    ; preds = %scan.i.i, %scan.outer.i.i
+  %.27.i.i = phi ptr [ %.27.i34.i, %scan.outer.i.i ], [ %.27.i.pre.i, %scan.i.i ]
+  %.24.i.lcssa.i = phi i64 [ %.2444.i.i, %scan.outer.i.i ], [ %.24.i.i, %scan.i.i ]
+  %.22.i.lcssa.i = phi i64 [ %.2242.i.i, %scan.outer.i.i ], [ 0, %scan.i.i ]
+  %.23.i.lcssa.i = phi i64 [ %.23.i.peel.i, %scan.outer.i.i ], [ %length.ph.i.i, %scan.i.i ]
+  %.28.i.i = getelementptr i8, ptr %.27.i.i, i64 %.23.i.lcssa.i
+  %.29.i.i = load i8, ptr %.28.i.i, align 1
+  switch i8 %.29.i.i, label %scan_next.i.i [
+    i8 32, label %grammo_in_token.exit.i
+    i8 13, label %grammo_in_token.exit.i
+    i8 12, label %grammo_in_token.exit.i
+    i8 11, label %grammo_in_token.exit.i
+    i8 10, label %grammo_in_token.exit.i
+    i8 9, label %grammo_in_token.exit.i
+  ]
+
+scan_next.i.i:                                    ; preds = %scan_test.i.i
+  %.35.i.i = add i64 %length.ph.i.i, 1
+  br label %scan.outer.i.i
+
+scan.outer.i.i:                                   ; preds = %skip_test.i.i, %scan_next.i.i
+  %.27.i34.i = phi ptr [ %.27.i.i, %scan_next.i.i ], [ %.9.i.i11.ph, %skip_test.i.i ]
+  %.2444.i.i = phi i64 [ %.24.i.lcssa.i, %scan_next.i.i ], [ %.4.i.i.ph, %skip_test.i.i ]
+  %.2242.i.i = phi i64 [ %.22.i.lcssa.i, %scan_next.i.i ], [ %.3.i.i12, %skip_test.i.i ]
+  %length.ph.i.i = phi i64 [ %.35.i.i, %scan_next.i.i ], [ 1, %skip_test.i.i ]
+  %.23.i.peel.i = add i64 %length.ph.i.i, %.2242.i.i
+  %.25.i.peel.i = icmp ult i64 %.23.i.peel.i, %.2444.i.i
+  br i1 %.25.i.peel.i, label %scan_test.i.i, label %check_full.i5.i.peel.i
+
+check_full.i5.i.peel.i:                           ; preds = %scan.outer.i.i
+  %.12.pre.i4.i.peel.i = load i64, ptr @grammo_in_cap, align 8
+  %.11.i10.i.peel.i = sub i64 %.2444.i.i, %.2242.i.i
+  %.13.i11.i.peel.i = icmp eq i64 %.11.i10.i.peel.i, %.12.pre.i4.i.peel.i
+  br i1 %.13.i11.i.peel.i, label %grow.i22.i.peel.i, label %grammo_in_fill.exit28.i.peel.i
+
+grow.i22.i.peel.i:                                ; preds = %check_full.i5.i.peel.i
+  %.16.i23.i.peel.i = shl i64 %.12.pre.i4.i.peel.i, 1
+  %.18.i24.i.peel.i = or disjoint i64 %.16.i23.i.peel.i, 1
+  %.19.i25.i.peel.i = tail call ptr @realloc(ptr nonnull %.27.i34.i, i64 %.18.i24.i.peel.i)
+  store ptr %.19.i25.i.peel.i, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23.i.peel.i, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28.i.peel.i
+
+grammo_in_fill.exit28.i.peel.i:                   ; preds = %grow.i22.i.peel.i, %check_full.i5.i.peel.i
+  %.28.i12.i.peel.i = phi i64 [ %.16.i23.i.peel.i, %grow.i22.i.peel.i ], [ %.12.pre.i4.i.peel.i, %check_full.i5.i.peel.i ]
+  %.23.i13.i.peel.i = phi ptr [ %.19.i25.i.peel.i, %grow.i22.i.peel.i ], [ %.27.i34.i, %check_full.i5.i.peel.i ]
+  %.25.i14.i.peel.i = getelementptr i8, ptr %.23.i13.i.peel.i, i64 %.2242.i.i
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i13.i.peel.i, ptr align 1 %.25.i14.i.peel.i, i64 %.11.i10.i.peel.i, i1 false)
+  %.27.i15.i.peel.i = getelementptr i8, ptr %.23.i13.i.peel.i, i64 %.11.i10.i.peel.i
+  %.29.i16.i.peel.i = sub i64 %.28.i12.i.peel.i, %.11.i10.i.peel.i
+  %.30.i17.i.peel.i = tail call i64 @read(i32 0, ptr %.27.i15.i.peel.i, i64 %.29.i16.i.peel.i)
+  %.31.i18.i.peel.i = icmp sgt i64 %.30.i17.i.peel.i, 0
+  %.32.i19.i.peel.i = tail call i64 @llvm.smax.i64(i64 %.30.i17.i.peel.i, i64 0)
+  %.33.i20.i.peel.i = add i64 %.32.i19.i.peel.i, %.11.i10.i.peel.i
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20.i.peel.i, ptr @grammo_in_end, align 8
+  %.36.i21.i.peel.i = getelementptr i8, ptr %.23.i13.i.peel.i, i64 %.33.i20.i.peel.i
+  store i8 0, ptr %.36.i21.i.peel.i, align 1
+  br i1 %.31.i18.i.peel.i, label %scan.i.i, label %grammo_in_token.exit.loopexit.i
+
+scan_fill.i.i:                                    ; preds = %scan.i.i
+  %.3.i2.i.i = icmp eq ptr %.27.i.pre.i, null
+  br i1 %.3.i2.i.i, label %alloc.i26.i.i, label %entry.check_full_crit_edge.i3.i.i
+
+entry.check_full_crit_edge.i3.i.i:                ; preds = %scan_fill.i.i
+  %.12.pre.i4.i.i = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.i.i
+
+alloc.i26.i.i:                                    ; preds = %scan_fill.i.i
+  %.5.i27.i.i = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i27.i.i, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.i.i
+
+check_full.i5.i.i:                                ; preds = %alloc.i26.i.i, %entry.check_full_crit_edge.i3.i.i
+  %.17.i6.i.i = phi ptr [ %.27.i.pre.i, %entry.check_full_crit_edge.i3.i.i ], [ %.5.i27.i.i, %alloc.i26.i.i ]
+  %.12.i7.i.i = phi i64 [ %.12.pre.i4.i.i, %entry.check_full_crit_edge.i3.i.i ], [ 65536, %alloc.i26.i.i ]
+  %.13.i11.i.i = icmp eq i64 %.24.i.i, %.12.i7.i.i
+  br i1 %.13.i11.i.i, label %grow.i22.i.i, label %grammo_in_fill.exit28.i.i
+
+grow.i22.i.i:                                     ; preds = %check_full.i5.i.i
+  %.16.i23.i.i = shl i64 %.24.i.i, 1
+  %.18.i24.i.i = or disjoint i64 %.16.i23.i.i, 1
+  %.19.i25.i.i = tail call ptr @realloc(ptr %.17.i6.i.i, i64 %.18.i24.i.i)
+  store ptr %.19.i25.i.i, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23.i.i, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28.i.i
+
+grammo_in_fill.exit28.i.i:                        ; preds = %grow.i22.i.i, %check_full.i5.i.i
+  %.28.i12.i.i = phi i64 [ %.16.i23.i.i, %grow.i22.i.i ], [ %.12.i7.i.i, %check_full.i5.i.i ]
+  %.23.i13.i.i = phi ptr [ %.19.i25.i.i, %grow.i22.i.i ], [ %.17.i6.i.i, %check_full.i5.i.i ]
+  %.27.i15.i.i = getelementptr i8, ptr %.23.i13.i.i, i64 %.24.i.i
+  %.29.i16.i.i = sub i64 %.28.i12.i.i, %.24.i.i
+  %.30.i17.i.i = tail call i64 @read(i32 0, ptr %.27.i15.i.i, i64 %.29.i16.i.i)
+  %.31.i18.i.i = icmp sgt i64 %.30.i17.i.i, 0
+  %.32.i19.i.i = tail call i64 @llvm.smax.i64(i64 %.30.i17.i.i, i64 0)
+  %.33.i20.i.i = add i64 %.32.i19.i.i, %.24.i.i
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20.i.i, ptr @grammo_in_end, align 8
+  %.36.i21.i.i = getelementptr i8, ptr %.23.i13.i.i, i64 %.33.i20.i.i
+  store i8 0, ptr %.36.i21.i.i, align 1
+  br i1 %.31.i18.i.i, label %scan.i.i, label %grammo_in_token.exit.loopexit.i, !llvm.loop !0
+
+grammo_in_token.exit.loopexit.i:                  ; preds = %grammo_in_fill.exit28.i.peel.i, %grammo_in_fill.exit28.i.i
+  %.4.pre.i = load ptr, ptr @grammo_in_buf, align 8
+  br label %grammo_in_token.exit.i
+
+grammo_in_token.exit.i:                           ; preds = %grammo_in_fill.exit.i.i, %scan_test.i.i, %scan_test.i.i, %scan_test.i.i, %scan_test.i.i, %scan_test.i.i, %scan_test.i.i, %grammo_in_token.exit.loopexit.i
+  %.4.i14 = phi ptr [ %.4.pre.i, %grammo_in_token.exit.loopexit.i ], [ %.27.i.i, %scan_test.i.i ], [ %.27.i.i, %scan_test.i.i ], [ %.27.i.i, %scan_test.i.i ], [ %.27.i.i, %scan_test.i.i ], [ %.27.i.i, %scan_test.i.i ], [ %.27.i.i, %scan_test.i.i ], [ %.9.i.pre.i, %grammo_in_fill.exit.i.i ]
+  %common.ret.op.i.i = phi i64 [ %length.ph.i.i, %grammo_in_token.exit.loopexit.i ], [ %length.ph.i.i, %scan_test.i.i ], [ %length.ph.i.i, %scan_test.i.i ], [ %length.ph.i.i, %scan_test.i.i ], [ %length.ph.i.i, %scan_test.i.i ], [ %length.ph.i.i, %scan_test.i.i ], [ %length.ph.i.i, %scan_test.i.i ], [ 0, %grammo_in_fill.exit.i.i ]
+  %.5.i15 = load i64, ptr @grammo_in_pos, align 8
+  %.6.i16 = getelementptr i8, ptr %.4.i14, i64 %.5.i15
+  %.7.i17 = load i8, ptr %.6.i16, align 1
+  %.8.i18 = icmp eq i8 %.7.i17, 45
+  %.9.i = icmp eq i8 %.7.i17, 43
+  %.10.i = or i1 %.8.i18, %.9.i
+  %.11.i = zext i1 %.10.i to i64
+  %.139.i = icmp ugt i64 %common.ret.op.i.i, %.11.i
+  %.1410.i = getelementptr i8, ptr %.6.i16, i64 %.11.i
+  %.1511.i = load i8, ptr %.1410.i, align 1
+  %.1612.i = add i8 %.1511.i, -48
+  %.1713.i = icmp ult i8 %.1612.i, 10
+  %.1814.i = and i1 %.1713.i, %.139.i
+  br i1 %.1814.i, label %digit.i, label %grammo_in_read_int.exit
+
+digit.i:                                          ; preds = %grammo_in_token.exit.i, %digit.i
+  %.1617.i = phi i8 [ %.16.i22, %digit.i ], [ %.1612.i, %grammo_in_token.exit.i ]
+  %value16.i = phi i32 [ %.23.i, %digit.i ], [ 0, %grammo_in_token.exit.i ]
+  %i15.i = phi i64 [ %.20.i19, %digit.i ], [ %.11.i, %grammo_in_token.exit.i ]
+  %.20.i19 = add nuw i64 %i15.i, 1
+  %.21.i20 = mul i32 %value16.i, 10
+  %.22.i21 = zext nneg i8 %.1617.i to i32
+  %.23.i = add i32 %.21.i20, %.22.i21
+  %.13.i = icmp ult i64 %.20.i19, %common.ret.op.i.i
+  %.14.i = getelementptr i8, ptr %.6.i16, i64 %.20.i19
+  %.15.i = load i8, ptr %.14.i, align 1
+  %.16.i22 = add i8 %.15.i, -48
+  %.17.i = icmp ult i8 %.16.i22, 10
+  %.18.i = and i1 %.13.i, %.17.i
+  br i1 %.18.i, label %digit.i, label %end_digits.i
+
+end_digits.i:                                     ; preds = %digit.i
+  %.25.not.i = icmp ult i64 %i15.i, %.11.i
+  br i1 %.25.not.i, label %grammo_in_read_int.exit, label %store.i
+
+store.i:                                          ; preds = %end_digits.i
+  %.27.i = sub i32 0, %.23.i
+  %.28.i = select i1 %.8.i18, i32 %.27.i, i32 %.23.i
+  %.31.i = add i64 %.20.i19, %.5.i15
+  store i64 %.31.i, ptr @grammo_in_pos, align 8
+  br label %grammo_in_read_int.exit
+
+grammo_in_read_int.exit:                          ; preds = %grammo_in_token.exit.i, %end_digits.i, %store.i
+  %m_n.0 = phi i32 [ 0, %end_digits.i ], [ %.28.i, %store.i ], [ 0, %grammo_in_token.exit.i ]
+  %.4.i24 = load i64, ptr @grammo_out_len, align 8
+  %.5.i25 = add i64 %.4.i24, 8
+  %.6.b.i26 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i27 = select i1 %.6.b.i26, i64 65536, i64 0
+  %.7.not.i28 = icmp ugt i64 %.5.i25, %.6.i27
+  %.20.pre1.i29 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i28, label %loop.i.i33, label %grammo_out_reserve.exit47
+
+loop.i.i33:                                       ; preds = %grammo_in_read_int.exit, %body.i.i41
+  %written.i.i34 = phi i64 [ %.10.i.i45, %body.i.i41 ], [ 0, %grammo_in_read_int.exit ]
+  %.5.i.i35 = icmp slt i64 %written.i.i34, %.4.i24
+  br i1 %.5.i.i35, label %body.i.i41, label %grammo_out_flush.exit.i36
+
+body.i.i41:                                       ; preds = %loop.i.i33
+  %.7.i.i42 = getelementptr i8, ptr %.20.pre1.i29, i64 %written.i.i34
+  %.8.i.i43 = sub i64 %.4.i24, %written.i.i34
+  %.9.i.i44 = tail call i64 @write(i32 1, ptr %.7.i.i42, i64 %.8.i.i43)
+  %.10.i.i45 = add i64 %.9.i.i44, %written.i.i34
+  %.11.i.i46 = icmp sgt i64 %.9.i.i44, 0
+  br i1 %.11.i.i46, label %loop.i.i33, label %grammo_out_flush.exit.i36
+
+grammo_out_flush.exit.i36:                        ; preds = %body.i.i41, %loop.i.i33
+  %.10.b.i37 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i38 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i37, label %grammo_out_reserve.exit47, label %grow.i39
+
+grow.i39:                                         ; preds = %grammo_out_flush.exit.i36
+  %.16.i40 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i38, i64 65536)
+  store ptr %.16.i40, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit47
+
+grammo_out_reserve.exit47:                        ; preds = %grammo_in_read_int.exit, %grammo_out_flush.exit.i36, %grow.i39
+  %.7.i48 = phi i64 [ 0, %grow.i39 ], [ 0, %grammo_out_flush.exit.i36 ], [ %.4.i24, %grammo_in_read_int.exit ]
+  %.20.i31 = phi ptr [ %.16.i40, %grow.i39 ], [ %.20.pre.i38, %grammo_out_flush.exit.i36 ], [ %.20.pre1.i29, %grammo_in_read_int.exit ]
+  %.22.i32 = getelementptr i8, ptr %.20.i31, i64 %.7.i48
+  store i64 17215526680029542, ptr %.22.i32, align 1
+  %.8.i49 = add nsw i64 %.7.i48, 7
+  store i64 %.8.i49, ptr @grammo_out_len, align 8
+  %.15 = tail call fastcc i32 @g.fib(i32 %m_n.0)
+  %.4.i50 = load i64, ptr @grammo_out_len, align 8
+  %.5.i51 = add i64 %.4.i50, 13
+  %.6.b.i52 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i53 = select i1 %.6.b.i52, i64 65536, i64 0
+  %.7.not.i54 = icmp ugt i64 %.5.i51, %.6.i53
+  %.20.pre1.i55 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i54, label %loop.i.i59, label %grammo_out_reserve.exit73
+
+loop.i.i59:                                       ; preds = %grammo_out_reserve.exit47, %body.i.i67
+  %written.i.i60 = phi i64 [ %.10.i.i71, %body.i.i67 ], [ 0, %grammo_out_reserve.exit47 ]
+  %.5.i.i61 = icmp slt i64 %written.i.i60, %.4.i50
+  br i1 %.5.i.i61, label %body.i.i67, label %grammo_out_flush.exit.i62
+
+body.i.i67:                                       ; preds = %loop.i.i59
+  %.7.i.i68 = getelementptr i8, ptr %.20.pre1.i55, i64 %written.i.i60
+  %.8.i.i69 = sub i64 %.4.i50, %written.i.i60
+  %.9.i.i70 = tail call i64 @write(i32 1, ptr %.7.i.i68, i64 %.8.i.i69)
+  %.10.i.i71 = add i64 %.9.i.i70, %written.i.i60
+  %.11.i.i72 = icmp sgt i64 %.9.i.i70, 0
+  br i1 %.11.i.i72, label %loop.i.i59, label %grammo_out_flush.exit.i62
+
+grammo_out_flush.exit.i62:                        ; preds = %body.i.i67, %loop.i.i59
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i63 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i64 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i63, label %grammo_out_reserve.exit73, label %grow.i65
+
+grow.i65:                                         ; preds = %grammo_out_flush.exit.i62
+  %.16.i66 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i64, i64 65536)
+  store ptr %.16.i66, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit73
+
+grammo_out_reserve.exit73:                        ; preds = %grammo_out_reserve.exit47, %grammo_out_flush.exit.i62, %grow.i65
+  %.21.i56 = phi i64 [ 0, %grow.i65 ], [ 0, %grammo_out_flush.exit.i62 ], [ %.4.i50, %grammo_out_reserve.exit47 ]
+  %.20.i57 = phi ptr [ %.16.i66, %grow.i65 ], [ %.20.pre.i64, %grammo_out_flush.exit.i62 ], [ %.20.pre1.i55, %grammo_out_reserve.exit47 ]
+  %.22.i58 = getelementptr i8, ptr %.20.i57, i64 %.21.i56
+  %.19 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i58, i64 13, ptr nonnull @str_3, i32 %.15)
+  %0 = tail call i32 @llvm.smax.i32(i32 %.19, i32 0)
+  %.6.i74 = zext nneg i32 %0 to i64
+  %.7.i75 = load i64, ptr @grammo_out_len, align 8
+  %.8.i76 = add i64 %.7.i75, %.6.i74
+  store i64 %.8.i76, ptr @grammo_out_len, align 8
+  %.2.i.i77 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i78 = icmp slt i32 %.2.i.i77, 0
+  br i1 %.3.i.i78, label %check.i.i95, label %grammo_out_interactive.exit.i79
+
+check.i.i95:                                      ; preds = %grammo_out_reserve.exit73
+  %.5.i.i96 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i96, ptr @grammo_out_tty, align 4
+  %.4.i97.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i79
+
+grammo_out_interactive.exit.i79:                  ; preds = %check.i.i95, %grammo_out_reserve.exit73
+  %.4.i97.pre = phi i64 [ %.4.i97.pre.pre, %check.i.i95 ], [ %.8.i76, %grammo_out_reserve.exit73 ]
+  %.8.i.i80 = phi i32 [ %.5.i.i96, %check.i.i95 ], [ %.2.i.i77, %grammo_out_reserve.exit73 ]
+  %.9.i.i81 = icmp sgt i32 %.8.i.i80, 0
+  %.20.pre1.i102.pre502 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i81, label %loop.i.i85, label %grammo_out_advance.exit
+
+loop.i.i85:                                       ; preds = %grammo_out_interactive.exit.i79, %body.i.i89
+  %written.i.i86 = phi i64 [ %.10.i.i93, %body.i.i89 ], [ 0, %grammo_out_interactive.exit.i79 ]
+  %.5.i3.i87 = icmp slt i64 %written.i.i86, %.4.i97.pre
+  br i1 %.5.i3.i87, label %body.i.i89, label %grammo_out_flush.exit.i88
+
+body.i.i89:                                       ; preds = %loop.i.i85
+  %.7.i.i90 = getelementptr i8, ptr %.20.pre1.i102.pre502, i64 %written.i.i86
+  %.8.i4.i91 = sub i64 %.4.i97.pre, %written.i.i86
+  %.9.i5.i92 = tail call i64 @write(i32 1, ptr %.7.i.i90, i64 %.8.i4.i91)
+  %.10.i.i93 = add i64 %.9.i5.i92, %written.i.i86
+  %.11.i.i94 = icmp sgt i64 %.9.i5.i92, 0
+  br i1 %.11.i.i94, label %loop.i.i85, label %grammo_out_flush.exit.i88
+
+grammo_out_flush.exit.i88:                        ; preds = %body.i.i89, %loop.i.i85
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i102.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit
+
+grammo_out_advance.exit:                          ; preds = %grammo_out_interactive.exit.i79, %grammo_out_flush.exit.i88
+  %.20.pre1.i102 = phi ptr [ %.20.pre1.i102.pre502, %grammo_out_interactive.exit.i79 ], [ %.20.pre1.i102.pre, %grammo_out_flush.exit.i88 ]
+  %.4.i97 = phi i64 [ %.4.i97.pre, %grammo_out_interactive.exit.i79 ], [ 0, %grammo_out_flush.exit.i88 ]
+  %.5.i98 = add i64 %.4.i97, 17
+  %.6.b.i99 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i100 = select i1 %.6.b.i99, i64 65536, i64 0
+  %.7.not.i101 = icmp ugt i64 %.5.i98, %.6.i100
+  br i1 %.7.not.i101, label %loop.i.i106, label %grammo_out_reserve.exit120
+
+loop.i.i106:                                      ; preds = %grammo_out_advance.exit, %body.i.i114
+  %written.i.i107 = phi i64 [ %.10.i.i118, %body.i.i114 ], [ 0, %grammo_out_advance.exit ]
+  %.5.i.i108 = icmp slt i64 %written.i.i107, %.4.i97
+  br i1 %.5.i.i108, label %body.i.i114, label %grammo_out_flush.exit.i109
+
+body.i.i114:                                      ; preds = %loop.i.i106
+  %.7.i.i115 = getelementptr i8, ptr %.20.pre1.i102, i64 %written.i.i107
+  %.8.i.i116 = sub i64 %.4.i97, %written.i.i107
+  %.9.i.i117 = tail call i64 @write(i32 1, ptr %.7.i.i115, i64 %.8.i.i116)
+  %.10.i.i118 = add i64 %.9.i.i117, %written.i.i107
+  %.11.i.i119 = icmp sgt i64 %.9.i.i117, 0
+  br i1 %.11.i.i119, label %loop.i.i106, label %grammo_out_flush.exit.i109
+
+grammo_out_flush.exit.i109:                       ; preds = %body.i.i114, %loop.i.i106
+  %.10.b.i110 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i111 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i110, label %grammo_out_reserve.exit120, label %grow.i112
+
+grow.i112:                                        ; preds = %grammo_out_flush.exit.i109
+  %.16.i113 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i111, i64 65536)
+  store ptr %.16.i113, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit120
+
+grammo_out_reserve.exit120:                       ; preds = %grammo_out_advance.exit, %grammo_out_flush.exit.i109, %grow.i112
+  %.7.i121 = phi i64 [ 0, %grow.i112 ], [ 0, %grammo_out_flush.exit.i109 ], [ %.4.i97, %grammo_out_advance.exit ]
+  %.20.i104 = phi ptr [ %.16.i113, %grow.i112 ], [ %.20.pre.i111, %grammo_out_flush.exit.i109 ], [ %.20.pre1.i102, %grammo_out_advance.exit ]
+  %.22.i105 = getelementptr i8, ptr %.20.i104, i64 %.7.i121
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(17) %.22.i105, ptr noundef nonnull align 16 dereferenceable(17) @str_4, i64 17, i1 false)
+  %.8.i122 = add nsw i64 %.7.i121, 16
+  store i64 %.8.i122, ptr @grammo_out_len, align 8
+  %.26 = shl i32 %m_n.0, 1
+  %.27 = tail call fastcc i32 @g.binomial(i32 %.26, i32 %m_n.0)
+  %.4.i123 = load i64, ptr @grammo_out_len, align 8
+  %.5.i124 = add i64 %.4.i123, 13
+  %.6.b.i125 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i126 = select i1 %.6.b.i125, i64 65536, i64 0
+  %.7.not.i127 = icmp ugt i64 %.5.i124, %.6.i126
+  %.20.pre1.i128 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i127, label %loop.i.i132, label %grammo_out_reserve.exit146
+
+loop.i.i132:                                      ; preds = %grammo_out_reserve.exit120, %body.i.i140
+  %written.i.i133 = phi i64 [ %.10.i.i144, %body.i.i140 ], [ 0, %grammo_out_reserve.exit120 ]
+  %.5.i.i134 = icmp slt i64 %written.i.i133, %.4.i123
+  br i1 %.5.i.i134, label %body.i.i140, label %grammo_out_flush.exit.i135
+
+body.i.i140:                                      ; preds = %loop.i.i132
+  %.7.i.i141 = getelementptr i8, ptr %.20.pre1.i128, i64 %written.i.i133
+  %.8.i.i142 = sub i64 %.4.i123, %written.i.i133
+  %.9.i.i143 = tail call i64 @write(i32 1, ptr %.7.i.i141, i64 %.8.i.i142)
+  %.10.i.i144 = add i64 %.9.i.i143, %written.i.i133
+  %.11.i.i145 = icmp sgt i64 %.9.i.i143, 0
+  br i1 %.11.i.i145, label %loop.i.i132, label %grammo_out_flush.exit.i135
+
+grammo_out_flush.exit.i135:                       ; preds = %body.i.i140, %loop.i.i132
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i136 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i137 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i136, label %grammo_out_reserve.exit146, label %grow.i138
+
+grow.i138:                                        ; preds = %grammo_out_flush.exit.i135
+  %.16.i139 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i137, i64 65536)
+  store ptr %.16.i139, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit146
+
+grammo_out_reserve.exit146:                       ; preds = %grammo_out_reserve.exit120, %grammo_out_flush.exit.i135, %grow.i138
+  %.21.i129 = phi i64 [ 0, %grow.i138 ], [ 0, %grammo_out_flush.exit.i135 ], [ %.4.i123, %grammo_out_reserve.exit120 ]
+  %.20.i130 = phi ptr [ %.16.i139, %grow.i138 ], [ %.20.pre.i137, %grammo_out_flush.exit.i135 ], [ %.20.pre1.i128, %grammo_out_reserve.exit120 ]
+  %.22.i131 = getelementptr i8, ptr %.20.i130, i64 %.21.i129
+  %.31 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i131, i64 13, ptr nonnull @str_3, i32 %.27)
+  %1 = tail call i32 @llvm.smax.i32(i32 %.31, i32 0)
+  %.6.i147 = zext nneg i32 %1 to i64
+  %.7.i148 = load i64, ptr @grammo_out_len, align 8
+  %.8.i149 = add i64 %.7.i148, %.6.i147
+  store i64 %.8.i149, ptr @grammo_out_len, align 8
+  %.2.i.i150 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i151 = icmp slt i32 %.2.i.i150, 0
+  br i1 %.3.i.i151, label %check.i.i168, label %grammo_out_interactive.exit.i152
+
+check.i.i168:                                     ; preds = %grammo_out_reserve.exit146
+  %.5.i.i169 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i169, ptr @grammo_out_tty, align 4
+  %.4.i171.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i152
+
+grammo_out_interactive.exit.i152:                 ; preds = %check.i.i168, %grammo_out_reserve.exit146
+  %.4.i171.pre = phi i64 [ %.4.i171.pre.pre, %check.i.i168 ], [ %.8.i149, %grammo_out_reserve.exit146 ]
+  %.8.i.i153 = phi i32 [ %.5.i.i169, %check.i.i168 ], [ %.2.i.i150, %grammo_out_reserve.exit146 ]
+  %.9.i.i154 = icmp sgt i32 %.8.i.i153, 0
+  %.20.pre1.i176.pre505 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i154, label %loop.i.i158, label %grammo_out_advance.exit170
+
+loop.i.i158:                                      ; preds = %grammo_out_interactive.exit.i152, %body.i.i162
+  %written.i.i159 = phi i64 [ %.10.i.i166, %body.i.i162 ], [ 0, %grammo_out_interactive.exit.i152 ]
+  %.5.i3.i160 = icmp slt i64 %written.i.i159, %.4.i171.pre
+  br i1 %.5.i3.i160, label %body.i.i162, label %grammo_out_flush.exit.i161
+
+body.i.i162:                                      ; preds = %loop.i.i158
+  %.7.i.i163 = getelementptr i8, ptr %.20.pre1.i176.pre505, i64 %written.i.i159
+  %.8.i4.i164 = sub i64 %.4.i171.pre, %written.i.i159
+  %.9.i5.i165 = tail call i64 @write(i32 1, ptr %.7.i.i163, i64 %.8.i4.i164)
+  %.10.i.i166 = add i64 %.9.i5.i165, %written.i.i159
+  %.11.i.i167 = icmp sgt i64 %.9.i5.i165, 0
+  br i1 %.11.i.i167, label %loop.i.i158, label %grammo_out_flush.exit.i161
+
+grammo_out_flush.exit.i161:                       ; preds = %body.i.i162, %loop.i.i158
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i176.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit170
+
+grammo_out_advance.exit170:                       ; preds = %grammo_out_interactive.exit.i152, %grammo_out_flush.exit.i161
+  %.20.pre1.i176 = phi ptr [ %.20.pre1.i176.pre505, %grammo_out_interactive.exit.i152 ], [ %.20.pre1.i176.pre, %grammo_out_flush.exit.i161 ]
+  %.4.i171 = phi i64 [ %.4.i171.pre, %grammo_out_interactive.exit.i152 ], [ 0, %grammo_out_flush.exit.i161 ]
+  %.5.i172 = add i64 %.4.i171, 15
+  %.6.b.i173 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i174 = select i1 %.6.b.i173, i64 65536, i64 0
+  %.7.not.i175 = icmp ugt i64 %.5.i172, %.6.i174
+  br i1 %.7.not.i175, label %loop.i.i180, label %grammo_out_reserve.exit194
+
+loop.i.i180:                                      ; preds = %grammo_out_advance.exit170, %body.i.i188
+  %written.i.i181 = phi i64 [ %.10.i.i192, %body.i.i188 ], [ 0, %grammo_out_advance.exit170 ]
+  %.5.i.i182 = icmp slt i64 %written.i.i181, %.4.i171
+  br i1 %.5.i.i182, label %body.i.i188, label %grammo_out_flush.exit.i183
+
+body.i.i188:                                      ; preds = %loop.i.i180
+  %.7.i.i189 = getelementptr i8, ptr %.20.pre1.i176, i64 %written.i.i181
+  %.8.i.i190 = sub i64 %.4.i171, %written.i.i181
+  %.9.i.i191 = tail call i64 @write(i32 1, ptr %.7.i.i189, i64 %.8.i.i190)
+  %.10.i.i192 = add i64 %.9.i.i191, %written.i.i181
+  %.11.i.i193 = icmp sgt i64 %.9.i.i191, 0
+  br i1 %.11.i.i193, label %loop.i.i180, label %grammo_out_flush.exit.i183
+
+grammo_out_flush.exit.i183:                       ; preds = %body.i.i188, %loop.i.i180
+  %.10.b.i184 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i185 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i184, label %grammo_out_reserve.exit194, label %grow.i186
+
+grow.i186:                                        ; preds = %grammo_out_flush.exit.i183
+  %.16.i187 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i185, i64 65536)
+  store ptr %.16.i187, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit194
+
+grammo_out_reserve.exit194:                       ; preds = %grammo_out_advance.exit170, %grammo_out_flush.exit.i183, %grow.i186
+  %.7.i195 = phi i64 [ 0, %grow.i186 ], [ 0, %grammo_out_flush.exit.i183 ], [ %.4.i171, %grammo_out_advance.exit170 ]
+  %.20.i178 = phi ptr [ %.16.i187, %grow.i186 ], [ %.20.pre.i185, %grammo_out_flush.exit.i183 ], [ %.20.pre1.i176, %grammo_out_advance.exit170 ]
+  %.22.i179 = getelementptr i8, ptr %.20.i178, i64 %.7.i195
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(15) %.22.i179, ptr noundef nonnull align 1 dereferenceable(15) @str_5, i64 15, i1 false)
+  %.8.i196 = add nsw i64 %.7.i195, 14
+  store i64 %.8.i196, ptr @grammo_out_len, align 8
+  %.38 = tail call fastcc double @g.power(double 1.500000e+00, i32 %m_n.0)
+  %.4.i197 = load i64, ptr @grammo_out_len, align 8
+  %.5.i198 = add i64 %.4.i197, 337
+  %.6.b.i199 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i200 = select i1 %.6.b.i199, i64 65536, i64 0
+  %.7.not.i201 = icmp ugt i64 %.5.i198, %.6.i200
+  %.20.pre1.i202 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i201, label %loop.i.i206, label %grammo_out_reserve.exit220
+
+loop.i.i206:                                      ; preds = %grammo_out_reserve.exit194, %body.i.i214
+  %written.i.i207 = phi i64 [ %.10.i.i218, %body.i.i214 ], [ 0, %grammo_out_reserve.exit194 ]
+  %.5.i.i208 = icmp slt i64 %written.i.i207, %.4.i197
+  br i1 %.5.i.i208, label %body.i.i214, label %grammo_out_flush.exit.i209
+
+body.i.i214:                                      ; preds = %loop.i.i206
+  %.7.i.i215 = getelementptr i8, ptr %.20.pre1.i202, i64 %written.i.i207
+  %.8.i.i216 = sub i64 %.4.i197, %written.i.i207
+  %.9.i.i217 = tail call i64 @write(i32 1, ptr %.7.i.i215, i64 %.8.i.i216)
+  %.10.i.i218 = add i64 %.9.i.i217, %written.i.i207
+  %.11.i.i219 = icmp sgt i64 %.9.i.i217, 0
+  br i1 %.11.i.i219, label %loop.i.i206, label %grammo_out_flush.exit.i209
+
+grammo_out_flush.exit.i209:                       ; preds = %body.i.i214, %loop.i.i206
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i210 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i211 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i210, label %grammo_out_reserve.exit220, label %grow.i212
+
+grow.i212:                                        ; preds = %grammo_out_flush.exit.i209
+  %.16.i213 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i211, i64 65536)
+  store ptr %.16.i213, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit220
+
+grammo_out_reserve.exit220:                       ; preds = %grammo_out_reserve.exit194, %grammo_out_flush.exit.i209, %grow.i212
+  %.21.i203 = phi i64 [ 0, %grow.i212 ], [ 0, %grammo_out_flush.exit.i209 ], [ %.4.i197, %grammo_out_reserve.exit194 ]
+  %.20.i204 = phi ptr [ %.16.i213, %grow.i212 ], [ %.20.pre.i211, %grammo_out_flush.exit.i209 ], [ %.20.pre1.i202, %grammo_out_reserve.exit194 ]
+  %.22.i205 = getelementptr i8, ptr %.20.i204, i64 %.21.i203
+  %.42 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i205, i64 337, ptr nonnull @str_6, double %.38)
+  %2 = tail call i32 @llvm.smax.i32(i32 %.42, i32 0)
+  %.6.i221 = zext nneg i32 %2 to i64
+  %.7.i222 = load i64, ptr @grammo_out_len, align 8
+  %.8.i223 = add i64 %.7.i222, %.6.i221
+  store i64 %.8.i223, ptr @grammo_out_len, align 8
+  %.44 = tail call fastcc double @g.power(double -2.000000e+00, i32 3)
+  %.4.i224 = load i64, ptr @grammo_out_len, align 8
+  %.5.i225 = add i64 %.4.i224, 322
+  %.6.b.i226 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i227 = select i1 %.6.b.i226, i64 65536, i64 0
+  %.7.not.i228 = icmp ugt i64 %.5.i225, %.6.i227
+  %.20.pre1.i229 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i228, label %loop.i.i233, label %grammo_out_reserve.exit247
+
+loop.i.i233:                                      ; preds = %grammo_out_reserve.exit220, %body.i.i241
+  %written.i.i234 = phi i64 [ %.10.i.i245, %body.i.i241 ], [ 0, %grammo_out_reserve.exit220 ]
+  %.5.i.i235 = icmp slt i64 %written.i.i234, %.4.i224
+  br i1 %.5.i.i235, label %body.i.i241, label %grammo_out_flush.exit.i236
+
+body.i.i241:                                      ; preds = %loop.i.i233
+  %.7.i.i242 = getelementptr i8, ptr %.20.pre1.i229, i64 %written.i.i234
+  %.8.i.i243 = sub i64 %.4.i224, %written.i.i234
+  %.9.i.i244 = tail call i64 @write(i32 1, ptr %.7.i.i242, i64 %.8.i.i243)
+  %.10.i.i245 = add i64 %.9.i.i244, %written.i.i234
+  %.11.i.i246 = icmp sgt i64 %.9.i.i244, 0
+  br i1 %.11.i.i246, label %loop.i.i233, label %grammo_out_flush.exit.i236
+
+grammo_out_flush.exit.i236:                       ; preds = %body.i.i241, %loop.i.i233
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i237 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i238 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i237, label %grammo_out_reserve.exit247, label %grow.i239
+
+grow.i239:                                        ; preds = %grammo_out_flush.exit.i236
+  %.16.i240 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i238, i64 65536)
+  store ptr %.16.i240, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit247
+
+grammo_out_reserve.exit247:                       ; preds = %grammo_out_reserve.exit220, %grammo_out_flush.exit.i236, %grow.i239
+  %.21.i230 = phi i64 [ 0, %grow.i239 ], [ 0, %grammo_out_flush.exit.i236 ], [ %.4.i224, %grammo_out_reserve.exit220 ]
+  %.20.i231 = phi ptr [ %.16.i240, %grow.i239 ], [ %.20.pre.i238, %grammo_out_flush.exit.i236 ], [ %.20.pre1.i229, %grammo_out_reserve.exit220 ]
+  %.22.i232 = getelementptr i8, ptr %.20.i231, i64 %.21.i230
+  %.48 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i232, i64 322, ptr nonnull @str_7, double %.44)
+  %3 = tail call i32 @llvm.smax.i32(i32 %.48, i32 0)
+  %.6.i248 = zext nneg i32 %3 to i64
+  %.7.i249 = load i64, ptr @grammo_out_len, align 8
+  %.8.i250 = add i64 %.7.i249, %.6.i248
+  store i64 %.8.i250, ptr @grammo_out_len, align 8
+  %.2.i.i251 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i252 = icmp slt i32 %.2.i.i251, 0
+  br i1 %.3.i.i252, label %check.i.i269, label %grammo_out_interactive.exit.i253
+
+check.i.i269:                                     ; preds = %grammo_out_reserve.exit247
+  %.5.i.i270 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i270, ptr @grammo_out_tty, align 4
+  %.4.i272.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i253
+
+grammo_out_interactive.exit.i253:                 ; preds = %check.i.i269, %grammo_out_reserve.exit247
+  %.4.i272.pre = phi i64 [ %.4.i272.pre.pre, %check.i.i269 ], [ %.8.i250, %grammo_out_reserve.exit247 ]
+  %.8.i.i254 = phi i32 [ %.5.i.i270, %check.i.i269 ], [ %.2.i.i251, %grammo_out_reserve.exit247 ]
+  %.9.i.i255 = icmp sgt i32 %.8.i.i254, 0
+  %.20.pre1.i277.pre508 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i255, label %loop.i.i259, label %grammo_out_advance.exit271
+
+loop.i.i259:                                      ; preds = %grammo_out_interactive.exit.i253, %body.i.i263
+  %written.i.i260 = phi i64 [ %.10.i.i267, %body.i.i263 ], [ 0, %grammo_out_interactive.exit.i253 ]
+  %.5.i3.i261 = icmp slt i64 %written.i.i260, %.4.i272.pre
+  br i1 %.5.i3.i261, label %body.i.i263, label %grammo_out_flush.exit.i262
+
+body.i.i263:                                      ; preds = %loop.i.i259
+  %.7.i.i264 = getelementptr i8, ptr %.20.pre1.i277.pre508, i64 %written.i.i260
+  %.8.i4.i265 = sub i64 %.4.i272.pre, %written.i.i260
+  %.9.i5.i266 = tail call i64 @write(i32 1, ptr %.7.i.i264, i64 %.8.i4.i265)
+  %.10.i.i267 = add i64 %.9.i5.i266, %written.i.i260
+  %.11.i.i268 = icmp sgt i64 %.9.i5.i266, 0
+  br i1 %.11.i.i268, label %loop.i.i259, label %grammo_out_flush.exit.i262
+
+grammo_out_flush.exit.i262:                       ; preds = %body.i.i263, %loop.i.i259
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i277.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit271
+
+grammo_out_advance.exit271:                       ; preds = %grammo_out_interactive.exit.i253, %grammo_out_flush.exit.i262
+  %.20.pre1.i277 = phi ptr [ %.20.pre1.i277.pre508, %grammo_out_interactive.exit.i253 ], [ %.20.pre1.i277.pre, %grammo_out_flush.exit.i262 ]
+  %.4.i272 = phi i64 [ %.4.i272.pre, %grammo_out_interactive.exit.i253 ], [ 0, %grammo_out_flush.exit.i262 ]
+  %.5.i273 = add i64 %.4.i272, 12
+  %.6.b.i274 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i275 = select i1 %.6.b.i274, i64 65536, i64 0
+  %.7.not.i276 = icmp ugt i64 %.5.i273, %.6.i275
+  br i1 %.7.not.i276, label %loop.i.i281, label %grammo_out_reserve.exit295
+
+loop.i.i281:                                      ; preds = %grammo_out_advance.exit271, %body.i.i289
+  %written.i.i282 = phi i64 [ %.10.i.i293, %body.i.i289 ], [ 0, %grammo_out_advance.exit271 ]
+  %.5.i.i283 = icmp slt i64 %written.i.i282, %.4.i272
+  br i1 %.5.i.i283, label %body.i.i289, label %grammo_out_flush.exit.i284
+
+body.i.i289:                                      ; preds = %loop.i.i281
+  %.7.i.i290 = getelementptr i8, ptr %.20.pre1.i277, i64 %written.i.i282
+  %.8.i.i291 = sub i64 %.4.i272, %written.i.i282
+  %.9.i.i292 = tail call i64 @write(i32 1, ptr %.7.i.i290, i64 %.8.i.i291)
+  %.10.i.i293 = add i64 %.9.i.i292, %written.i.i282
+  %.11.i.i294 = icmp sgt i64 %.9.i.i292, 0
+  br i1 %.11.i.i294, label %loop.i.i281, label %grammo_out_flush.exit.i284
+
+grammo_out_flush.exit.i284:                       ; preds = %body.i.i289, %loop.i.i281
+  %.10.b.i285 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i286 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i285, label %grammo_out_reserve.exit295, label %grow.i287
+
+grow.i287:                                        ; preds = %grammo_out_flush.exit.i284
+  %.16.i288 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i286, i64 65536)
+  store ptr %.16.i288, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit295
+
+grammo_out_reserve.exit295:                       ; preds = %grammo_out_advance.exit271, %grammo_out_flush.exit.i284, %grow.i287
+  %.7.i296 = phi i64 [ 0, %grow.i287 ], [ 0, %grammo_out_flush.exit.i284 ], [ %.4.i272, %grammo_out_advance.exit271 ]
+  %.20.i279 = phi ptr [ %.16.i288, %grow.i287 ], [ %.20.pre.i286, %grammo_out_flush.exit.i284 ], [ %.20.pre1.i277, %grammo_out_advance.exit271 ]
+  %.22.i280 = getelementptr i8, ptr %.20.i279, i64 %.7.i296
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(12) %.22.i280, ptr noundef nonnull align 1 dereferenceable(12) @str_8, i64 12, i1 false)
+  %.8.i297 = add nsw i64 %.7.i296, 11
+  store i64 %.8.i297, ptr @grammo_out_len, align 8
+  %.55 = tail call fastcc i1 @g.is_even(i32 %m_n.0)
+  %.56 = zext i1 %.55 to i32
+  %.4.i298 = load i64, ptr @grammo_out_len, align 8
+  %.5.i299 = add i64 %.4.i298, 13
+  %.6.b.i300 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i301 = select i1 %.6.b.i300, i64 65536, i64 0
+  %.7.not.i302 = icmp ugt i64 %.5.i299, %.6.i301
+  %.20.pre1.i303 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i302, label %loop.i.i307, label %grammo_out_reserve.exit321
+
+loop.i.i307:                                      ; preds = %grammo_out_reserve.exit295, %body.i.i315
+  %written.i.i308 = phi i64 [ %.10.i.i319, %body.i.i315 ], [ 0, %grammo_out_reserve.exit295 ]
+  %.5.i.i309 = icmp slt i64 %written.i.i308, %.4.i298
+  br i1 %.5.i.i309, label %body.i.i315, label %grammo_out_flush.exit.i310
+
+body.i.i315:                                      ; preds = %loop.i.i307
+  %.7.i.i316 = getelementptr i8, ptr %.20.pre1.i303, i64 %written.i.i308
+  %.8.i.i317 = sub i64 %.4.i298, %written.i.i308
+  %.9.i.i318 = tail call i64 @write(i32 1, ptr %.7.i.i316, i64 %.8.i.i317)
+  %.10.i.i319 = add i64 %.9.i.i318, %written.i.i308
+  %.11.i.i320 = icmp sgt i64 %.9.i.i318, 0
+  br i1 %.11.i.i320, label %loop.i.i307, label %grammo_out_flush.exit.i310
+
+grammo_out_flush.exit.i310:                       ; preds = %body.i.i315, %loop.i.i307
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i311 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i312 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i311, label %grammo_out_reserve.exit321, label %grow.i313
+
+grow.i313:                                        ; preds = %grammo_out_flush.exit.i310
+  %.16.i314 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i312, i64 65536)
+  store ptr %.16.i314, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit321
+
+grammo_out_reserve.exit321:                       ; preds = %grammo_out_reserve.exit295, %grammo_out_flush.exit.i310, %grow.i313
+  %.21.i304 = phi i64 [ 0, %grow.i313 ], [ 0, %grammo_out_flush.exit.i310 ], [ %.4.i298, %grammo_out_reserve.exit295 ]
+  %.20.i305 = phi ptr [ %.16.i314, %grow.i313 ], [ %.20.pre.i312, %grammo_out_flush.exit.i310 ], [ %.20.pre1.i303, %grammo_out_reserve.exit295 ]
+  %.22.i306 = getelementptr i8, ptr %.20.i305, i64 %.21.i304
+  %.60 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i306, i64 13, ptr nonnull @str_9, i32 %.56)
+  %4 = tail call i32 @llvm.smax.i32(i32 %.60, i32 0)
+  %.6.i322 = zext nneg i32 %4 to i64
+  %.7.i323 = load i64, ptr @grammo_out_len, align 8
+  %.8.i324 = add i64 %.7.i323, %.6.i322
+  store i64 %.8.i324, ptr @grammo_out_len, align 8
+  %.3.i = sext i32 %m_n.0 to i64
+  %.4.i325 = xor i64 %.3.i, -7046029254386353131
+  %.5.i326 = mul i64 %.4.i325, -7046029254386353131
+  %.6.i327 = lshr i64 %.5.i326, 52
+  %entry.1.i = getelementptr inbounds nuw [4096 x { [1 x i64], i1, i1 }], ptr @g.is_odd.memo, i64 0, i64 %.6.i327
+  %.7.i328 = getelementptr inbounds nuw i8, ptr %entry.1.i, i64 9
+  %.8.i329 = load i1, ptr %.7.i328, align 1
+  br i1 %.8.i329, label %check.i, label %miss.i
+
+check.i:                                          ; preds = %grammo_out_reserve.exit321
+  %.11.i335 = load i64, ptr %entry.1.i, align 16
+  %.12.i = icmp eq i64 %.11.i335, %.3.i
+  br i1 %.12.i, label %hit.i, label %miss.i
+
+hit.i:                                            ; preds = %check.i
+  %.15.i336 = getelementptr inbounds nuw i8, ptr %entry.1.i, i64 8
+  %.16.i337 = load i1, ptr %.15.i336, align 8
+  br label %g.is_odd.exit
+
+miss.i:                                           ; preds = %check.i, %grammo_out_reserve.exit321
+  %.4.i.i330 = icmp eq i32 %m_n.0, 0
+  br i1 %.4.i.i330, label %g.is_odd.body.exit.i, label %if_merge.i.i
+
+if_merge.i.i:                                     ; preds = %miss.i
+  %.7.i.i331 = add i32 %m_n.0, -1
+  %.8.i.i332 = tail call fastcc i1 @g.is_even(i32 %.7.i.i331)
+  %.4.i338.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %g.is_odd.body.exit.i
+
+g.is_odd.body.exit.i:                             ; preds = %if_merge.i.i, %miss.i
+  %.4.i338.pre = phi i64 [ %.4.i338.pre.pre, %if_merge.i.i ], [ %.8.i324, %miss.i ]
+  %common.ret.op.i.i333 = phi i1 [ %.8.i.i332, %if_merge.i.i ], [ false, %miss.i ]
+  store i64 %.3.i, ptr %entry.1.i, align 16
+  %.21.i334 = getelementptr inbounds nuw i8, ptr %entry.1.i, i64 8
+  store i1 %common.ret.op.i.i333, ptr %.21.i334, align 8
+  store i1 true, ptr %.7.i328, align 1
+  br label %g.is_odd.exit
+
+g.is_odd.exit:                                    ; preds = %hit.i, %g.is_odd.body.exit.i
+  %.4.i338 = phi i64 [ %.8.i324, %hit.i ], [ %.4.i338.pre, %g.is_odd.body.exit.i ]
+  %common.ret.op.i = phi i1 [ %.16.i337, %hit.i ], [ %common.ret.op.i.i333, %g.is_odd.body.exit.i ]
+  %.63 = zext i1 %common.ret.op.i to i32
+  %.5.i339 = add i64 %.4.i338, 3
+  %.6.b.i340 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i341 = select i1 %.6.b.i340, i64 65536, i64 0
+  %.7.not.i342 = icmp ugt i64 %.5.i339, %.6.i341
+  %.20.pre1.i343 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i342, label %loop.i.i347, label %grammo_out_reserve.exit361
+
+loop.i.i347:                                      ; preds = %g.is_odd.exit, %body.i.i355
+  %written.i.i348 = phi i64 [ %.10.i.i359, %body.i.i355 ], [ 0, %g.is_odd.exit ]
+  %.5.i.i349 = icmp slt i64 %written.i.i348, %.4.i338
+  br i1 %.5.i.i349, label %body.i.i355, label %grammo_out_flush.exit.i350
+
+body.i.i355:                                      ; preds = %loop.i.i347
+  %.7.i.i356 = getelementptr i8, ptr %.20.pre1.i343, i64 %written.i.i348
+  %.8.i.i357 = sub i64 %.4.i338, %written.i.i348
+  %.9.i.i358 = tail call i64 @write(i32 1, ptr %.7.i.i356, i64 %.8.i.i357)
+  %.10.i.i359 = add i64 %.9.i.i358, %written.i.i348
+  %.11.i.i360 = icmp sgt i64 %.9.i.i358, 0
+  br i1 %.11.i.i360, label %loop.i.i347, label %grammo_out_flush.exit.i350
+
+grammo_out_flush.exit.i350:                       ; preds = %body.i.i355, %loop.i.i347
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i351 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i352 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i351, label %grammo_out_reserve.exit361, label %grow.i353
+
+grow.i353:                                        ; preds = %grammo_out_flush.exit.i350
+  %.16.i354 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i352, i64 65536)
+  store ptr %.16.i354, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit361
+
+grammo_out_reserve.exit361:                       ; preds = %g.is_odd.exit, %grammo_out_flush.exit.i350, %grow.i353
+  %.21.i344 = phi i64 [ 0, %grow.i353 ], [ 0, %grammo_out_flush.exit.i350 ], [ %.4.i338, %g.is_odd.exit ]
+  %.20.i345 = phi ptr [ %.16.i354, %grow.i353 ], [ %.20.pre.i352, %grammo_out_flush.exit.i350 ], [ %.20.pre1.i343, %g.is_odd.exit ]
+  %.22.i346 = getelementptr i8, ptr %.20.i345, i64 %.21.i344
+  %.67 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i346, i64 3, ptr nonnull @str_3, i32 %.63)
+  %5 = tail call i32 @llvm.smax.i32(i32 %.67, i32 0)
+  %.6.i362 = zext nneg i32 %5 to i64
+  %.7.i363 = load i64, ptr @grammo_out_len, align 8
+  %.8.i364 = add i64 %.7.i363, %.6.i362
+  store i64 %.8.i364, ptr @grammo_out_len, align 8
+  %.2.i.i365 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i366 = icmp slt i32 %.2.i.i365, 0
+  br i1 %.3.i.i366, label %check.i.i383, label %grammo_out_interactive.exit.i367
+
+check.i.i383:                                     ; preds = %grammo_out_reserve.exit361
+  %.5.i.i384 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i384, ptr @grammo_out_tty, align 4
+  %.4.i386.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i367
+
+grammo_out_interactive.exit.i367:                 ; preds = %check.i.i383, %grammo_out_reserve.exit361
+  %.4.i386.pre = phi i64 [ %.4.i386.pre.pre, %check.i.i383 ], [ %.8.i364, %grammo_out_reserve.exit361 ]
+  %.8.i.i368 = phi i32 [ %.5.i.i384, %check.i.i383 ], [ %.2.i.i365, %grammo_out_reserve.exit361 ]
+  %.9.i.i369 = icmp sgt i32 %.8.i.i368, 0
+  %.20.pre1.i391.pre512 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i369, label %loop.i.i373, label %grammo_out_advance.exit385
+
+loop.i.i373:                                      ; preds = %grammo_out_interactive.exit.i367, %body.i.i377
+  %written.i.i374 = phi i64 [ %.10.i.i381, %body.i.i377 ], [ 0, %grammo_out_interactive.exit.i367 ]
+  %.5.i3.i375 = icmp slt i64 %written.i.i374, %.4.i386.pre
+  br i1 %.5.i3.i375, label %body.i.i377, label %grammo_out_flush.exit.i376
+
+body.i.i377:                                      ; preds = %loop.i.i373
+  %.7.i.i378 = getelementptr i8, ptr %.20.pre1.i391.pre512, i64 %written.i.i374
+  %.8.i4.i379 = sub i64 %.4.i386.pre, %written.i.i374
+  %.9.i5.i380 = tail call i64 @write(i32 1, ptr %.7.i.i378, i64 %.8.i4.i379)
+  %.10.i.i381 = add i64 %.9.i5.i380, %written.i.i374
+  %.11.i.i382 = icmp sgt i64 %.9.i5.i380, 0
+  br i1 %.11.i.i382, label %loop.i.i373, label %grammo_out_flush.exit.i376
+
+grammo_out_flush.exit.i376:                       ; preds = %body.i.i377, %loop.i.i373
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i391.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit385
+
+grammo_out_advance.exit385:                       ; preds = %grammo_out_interactive.exit.i367, %grammo_out_flush.exit.i376
+  %.20.pre1.i391 = phi ptr [ %.20.pre1.i391.pre512, %grammo_out_interactive.exit.i367 ], [ %.20.pre1.i391.pre, %grammo_out_flush.exit.i376 ]
+  %.4.i386 = phi i64 [ %.4.i386.pre, %grammo_out_interactive.exit.i367 ], [ 0, %grammo_out_flush.exit.i376 ]
+  %.5.i387 = add i64 %.4.i386, 14
+  %.6.b.i388 = load i1, ptr @grammo_out_cap, align 1
+  %cond.fr = freeze i1 %.6.b.i388
+  %.6.i389 = select i1 %cond.fr, i64 65536, i64 0
+  %.7.not.i390 = icmp ugt i64 %.5.i387, %.6.i389
+  br i1 %.7.not.i390, label %loop.i.i395, label %grammo_out_reserve.exit409
+
+loop.i.i395:                                      ; preds = %grammo_out_advance.exit385, %body.i.i403
+  %written.i.i396 = phi i64 [ %.10.i.i407, %body.i.i403 ], [ 0, %grammo_out_advance.exit385 ]
+  %.5.i.i397 = icmp slt i64 %written.i.i396, %.4.i386
+  br i1 %.5.i.i397, label %body.i.i403, label %grammo_out_flush.exit.i398
+
+body.i.i403:                                      ; preds = %loop.i.i395
+  %.7.i.i404 = getelementptr i8, ptr %.20.pre1.i391, i64 %written.i.i396
+  %.8.i.i405 = sub i64 %.4.i386, %written.i.i396
+  %.9.i.i406 = tail call i64 @write(i32 1, ptr %.7.i.i404, i64 %.8.i.i405)
+  %.10.i.i407 = add i64 %.9.i.i406, %written.i.i396
+  %.11.i.i408 = icmp sgt i64 %.9.i.i406, 0
+  br i1 %.11.i.i408, label %loop.i.i395, label %grammo_out_flush.exit.i398
+
+grammo_out_flush.exit.i398:                       ; preds = %body.i.i403, %loop.i.i395
+  %.10.b.i399 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i400 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i399, label %.thread550, label %grow.i401
+
+grow.i401:                                        ; preds = %grammo_out_flush.exit.i398
+  %.16.i402 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i400, i64 65536)
+  store ptr %.16.i402, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %.thread550
+
+.thread550:                                       ; preds = %grammo_out_flush.exit.i398, %grow.i401
+  %.20.pre1.i.i.ph = phi ptr [ %.20.pre.i400, %grammo_out_flush.exit.i398 ], [ %.16.i402, %grow.i401 ]
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(14) %.20.pre1.i.i.ph, ptr noundef nonnull align 1 dereferenceable(14) @str_10, i64 14, i1 false)
+  store i64 13, ptr @grammo_out_len, align 8
+  br label %grammo_out_reserve.exit.i
+
+grammo_out_reserve.exit409:                       ; preds = %grammo_out_advance.exit385
+  %.22.i394 = getelementptr i8, ptr %.20.pre1.i391, i64 %.4.i386
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(14) %.22.i394, ptr noundef nonnull align 1 dereferenceable(14) @str_10, i64 14, i1 false)
+  %.8.i411 = add nsw i64 %.4.i386, 13
+  store i64 %.8.i411, ptr @grammo_out_len, align 8
+  %6 = add i64 %.4.i386, 38
+  %.7.not.i.i = icmp ult i64 %6, 65537
+  %or.cond.not = and i1 %.7.not.i.i, %cond.fr
+  br i1 %or.cond.not, label %grammo_out_reserve.exit.i, label %loop.i.i.i
+
+loop.i.i.i:                                       ; preds = %grammo_out_reserve.exit409, %body.i.i.i
+  %written.i.i.i = phi i64 [ %.10.i.i.i, %body.i.i.i ], [ 0, %grammo_out_reserve.exit409 ]
+  %.5.i.i.i422 = icmp slt i64 %written.i.i.i, %.8.i411
+  br i1 %.5.i.i.i422, label %body.i.i.i, label %grammo_out_flush.exit.i.i
+
+body.i.i.i:                                       ; preds = %loop.i.i.i
+  %.7.i.i.i = getelementptr i8, ptr %.20.pre1.i391, i64 %written.i.i.i
+  %.8.i.i.i = sub i64 %.8.i411, %written.i.i.i
+  %.9.i.i.i = tail call i64 @write(i32 1, ptr %.7.i.i.i, i64 %.8.i.i.i)
+  %.10.i.i.i = add i64 %.9.i.i.i, %written.i.i.i
+  %.11.i.i.i423 = icmp sgt i64 %.9.i.i.i, 0
+  br i1 %.11.i.i.i423, label %loop.i.i.i, label %grammo_out_flush.exit.i.i
+
+grammo_out_flush.exit.i.i:                        ; preds = %body.i.i.i, %loop.i.i.i
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i.i, label %grammo_out_reserve.exit.i, label %grow.i.i
+
+grow.i.i:                                         ; preds = %grammo_out_flush.exit.i.i
+  %.16.i.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i.i, i64 65536)
+  store ptr %.16.i.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit.i
+
+grammo_out_reserve.exit.i:                        ; preds = %grammo_out_reserve.exit409, %.thread550, %grow.i.i, %grammo_out_flush.exit.i.i
+  %.21.i.i = phi i64 [ 0, %grow.i.i ], [ 0, %grammo_out_flush.exit.i.i ], [ 13, %.thread550 ], [ %.8.i411, %grammo_out_reserve.exit409 ]
+  %.20.i.i = phi ptr [ %.16.i.i, %grow.i.i ], [ %.20.pre.i.i, %grammo_out_flush.exit.i.i ], [ %.20.pre1.i.i.ph, %.thread550 ], [ %.20.pre1.i391, %grammo_out_reserve.exit409 ]
+  %.22.i.i = getelementptr i8, ptr %.20.i.i, i64 %.21.i.i
+  %.10.i414 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i.i, i64 25, ptr nonnull @str_0, i32 3)
+  %7 = tail call i32 @llvm.smax.i32(i32 %.10.i414, i32 0)
+  %.6.i3.i = zext nneg i32 %7 to i64
+  %.7.i.i415 = load i64, ptr @grammo_out_len, align 8
+  %.8.i.i416 = add i64 %.7.i.i415, %.6.i3.i
+  store i64 %.8.i.i416, ptr @grammo_out_len, align 8
+  %.2.i.i.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i.i417 = icmp slt i32 %.2.i.i.i, 0
+  br i1 %.3.i.i.i417, label %check.i.i.i, label %grammo_out_interactive.exit.i.i
+
+check.i.i.i:                                      ; preds = %grammo_out_reserve.exit.i
+  %.5.i.i13.i = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i13.i, ptr @grammo_out_tty, align 4
+  %.4.i.pre.i = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i.i
+
+grammo_out_interactive.exit.i.i:                  ; preds = %check.i.i.i, %grammo_out_reserve.exit.i
+  %.3.i2.i.i418 = phi i64 [ %.4.i.pre.i, %check.i.i.i ], [ %.8.i.i416, %grammo_out_reserve.exit.i ]
+  %.8.i.i4.i = phi i32 [ %.5.i.i13.i, %check.i.i.i ], [ %.2.i.i.i, %grammo_out_reserve.exit.i ]
+  %.9.i.i5.i = icmp sgt i32 %.8.i.i4.i, 0
+  %.20.pre1.i.i.1.pre515 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i5.i, label %loop.i.i6.i, label %grammo_out_advance.exit.i
+
+loop.i.i6.i:                                      ; preds = %grammo_out_interactive.exit.i.i, %body.i.i9.i
+  %written.i.i7.i = phi i64 [ %.10.i.i11.i, %body.i.i9.i ], [ 0, %grammo_out_interactive.exit.i.i ]
+  %.5.i3.i.i = icmp slt i64 %written.i.i7.i, %.3.i2.i.i418
+  br i1 %.5.i3.i.i, label %body.i.i9.i, label %grammo_out_flush.exit.i8.i
+
+body.i.i9.i:                                      ; preds = %loop.i.i6.i
+  %.7.i.i10.i = getelementptr i8, ptr %.20.pre1.i.i.1.pre515, i64 %written.i.i7.i
+  %.8.i4.i.i = sub i64 %.3.i2.i.i418, %written.i.i7.i
+  %.9.i5.i.i = tail call i64 @write(i32 1, ptr %.7.i.i10.i, i64 %.8.i4.i.i)
+  %.10.i.i11.i = add i64 %.9.i5.i.i, %written.i.i7.i
+  %.11.i.i12.i = icmp sgt i64 %.9.i5.i.i, 0
+  br i1 %.11.i.i12.i, label %loop.i.i6.i, label %grammo_out_flush.exit.i8.i
+
+grammo_out_flush.exit.i8.i:                       ; preds = %body.i.i9.i, %loop.i.i6.i
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i.i.1.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit.i
+
+grammo_out_advance.exit.i:                        ; preds = %grammo_out_flush.exit.i8.i, %grammo_out_interactive.exit.i.i
+  %.20.pre1.i.i.1 = phi ptr [ %.20.pre1.i.i.1.pre515, %grammo_out_interactive.exit.i.i ], [ %.20.pre1.i.i.1.pre, %grammo_out_flush.exit.i8.i ]
+  %.4.i19.i = phi i64 [ %.3.i2.i.i418, %grammo_out_interactive.exit.i.i ], [ 0, %grammo_out_flush.exit.i8.i ]
+  %.5.i.i413.1 = add i64 %.4.i19.i, 25
+  %.6.b.i.i.1 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i.i.1 = select i1 %.6.b.i.i.1, i64 65536, i64 0
+  %.7.not.i.i.1 = icmp ugt i64 %.5.i.i413.1, %.6.i.i.1
+  br i1 %.7.not.i.i.1, label %loop.i.i.i.1, label %grammo_out_reserve.exit.i.1
+
+loop.i.i.i.1:                                     ; preds = %grammo_out_advance.exit.i, %body.i.i.i.1
+  %written.i.i.i.1 = phi i64 [ %.10.i.i.i.1, %body.i.i.i.1 ], [ 0, %grammo_out_advance.exit.i ]
+  %.5.i.i.i422.1 = icmp slt i64 %written.i.i.i.1, %.4.i19.i
+  br i1 %.5.i.i.i422.1, label %body.i.i.i.1, label %grammo_out_flush.exit.i.i.1
+
+body.i.i.i.1:                                     ; preds = %loop.i.i.i.1
+  %.7.i.i.i.1 = getelementptr i8, ptr %.20.pre1.i.i.1, i64 %written.i.i.i.1
+  %.8.i.i.i.1 = sub i64 %.4.i19.i, %written.i.i.i.1
+  %.9.i.i.i.1 = tail call i64 @write(i32 1, ptr %.7.i.i.i.1, i64 %.8.i.i.i.1)
+  %.10.i.i.i.1 = add i64 %.9.i.i.i.1, %written.i.i.i.1
+  %.11.i.i.i423.1 = icmp sgt i64 %.9.i.i.i.1, 0
+  br i1 %.11.i.i.i423.1, label %loop.i.i.i.1, label %grammo_out_flush.exit.i.i.1
+
+grammo_out_flush.exit.i.i.1:                      ; preds = %body.i.i.i.1, %loop.i.i.i.1
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i.i.1 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i.i.1 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i.i.1, label %grammo_out_reserve.exit.i.1, label %grow.i.i.1
+
+grow.i.i.1:                                       ; preds = %grammo_out_flush.exit.i.i.1
+  %.16.i.i.1 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i.i.1, i64 65536)
+  store ptr %.16.i.i.1, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit.i.1
+
+grammo_out_reserve.exit.i.1:                      ; preds = %grow.i.i.1, %grammo_out_flush.exit.i.i.1, %grammo_out_advance.exit.i
+  %.21.i.i.1 = phi i64 [ 0, %grow.i.i.1 ], [ 0, %grammo_out_flush.exit.i.i.1 ], [ %.4.i19.i, %grammo_out_advance.exit.i ]
+  %.20.i.i.1 = phi ptr [ %.16.i.i.1, %grow.i.i.1 ], [ %.20.pre.i.i.1, %grammo_out_flush.exit.i.i.1 ], [ %.20.pre1.i.i.1, %grammo_out_advance.exit.i ]
+  %.22.i.i.1 = getelementptr i8, ptr %.20.i.i.1, i64 %.21.i.i.1
+  %.10.i414.1 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i.i.1, i64 25, ptr nonnull @str_0, i32 2)
+  %8 = tail call i32 @llvm.smax.i32(i32 %.10.i414.1, i32 0)
+  %.6.i3.i.1 = zext nneg i32 %8 to i64
+  %.7.i.i415.1 = load i64, ptr @grammo_out_len, align 8
+  %.8.i.i416.1 = add i64 %.7.i.i415.1, %.6.i3.i.1
+  store i64 %.8.i.i416.1, ptr @grammo_out_len, align 8
+  %.2.i.i.i.1 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i.i417.1 = icmp slt i32 %.2.i.i.i.1, 0
+  br i1 %.3.i.i.i417.1, label %check.i.i.i.1, label %grammo_out_interactive.exit.i.i.1
+
+check.i.i.i.1:                                    ; preds = %grammo_out_reserve.exit.i.1
+  %.5.i.i13.i.1 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i13.i.1, ptr @grammo_out_tty, align 4
+  %.4.i.pre.i.1 = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i.i.1
+
+grammo_out_interactive.exit.i.i.1:                ; preds = %check.i.i.i.1, %grammo_out_reserve.exit.i.1
+  %.3.i2.i.i418.1 = phi i64 [ %.4.i.pre.i.1, %check.i.i.i.1 ], [ %.8.i.i416.1, %grammo_out_reserve.exit.i.1 ]
+  %.8.i.i4.i.1 = phi i32 [ %.5.i.i13.i.1, %check.i.i.i.1 ], [ %.2.i.i.i.1, %grammo_out_reserve.exit.i.1 ]
+  %.9.i.i5.i.1 = icmp sgt i32 %.8.i.i4.i.1, 0
+  %.20.pre1.i.i.2.pre517 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i5.i.1, label %loop.i.i6.i.1, label %grammo_out_advance.exit.i.1
+
+loop.i.i6.i.1:                                    ; preds = %grammo_out_interactive.exit.i.i.1, %body.i.i9.i.1
+  %written.i.i7.i.1 = phi i64 [ %.10.i.i11.i.1, %body.i.i9.i.1 ], [ 0, %grammo_out_interactive.exit.i.i.1 ]
+  %.5.i3.i.i.1 = icmp slt i64 %written.i.i7.i.1, %.3.i2.i.i418.1
+  br i1 %.5.i3.i.i.1, label %body.i.i9.i.1, label %grammo_out_flush.exit.i8.i.1
+
+body.i.i9.i.1:                                    ; preds = %loop.i.i6.i.1
+  %.7.i.i10.i.1 = getelementptr i8, ptr %.20.pre1.i.i.2.pre517, i64 %written.i.i7.i.1
+  %.8.i4.i.i.1 = sub i64 %.3.i2.i.i418.1, %written.i.i7.i.1
+  %.9.i5.i.i.1 = tail call i64 @write(i32 1, ptr %.7.i.i10.i.1, i64 %.8.i4.i.i.1)
+  %.10.i.i11.i.1 = add i64 %.9.i5.i.i.1, %written.i.i7.i.1
+  %.11.i.i12.i.1 = icmp sgt i64 %.9.i5.i.i.1, 0
+  br i1 %.11.i.i12.i.1, label %loop.i.i6.i.1, label %grammo_out_flush.exit.i8.i.1
+
+grammo_out_flush.exit.i8.i.1:                     ; preds = %body.i.i9.i.1, %loop.i.i6.i.1
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i.i.2.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit.i.1
+
+grammo_out_advance.exit.i.1:                      ; preds = %grammo_out_flush.exit.i8.i.1, %grammo_out_interactive.exit.i.i.1
+  %.20.pre1.i.i.2 = phi ptr [ %.20.pre1.i.i.2.pre517, %grammo_out_interactive.exit.i.i.1 ], [ %.20.pre1.i.i.2.pre, %grammo_out_flush.exit.i8.i.1 ]
+  %.4.i19.i.1 = phi i64 [ %.3.i2.i.i418.1, %grammo_out_interactive.exit.i.i.1 ], [ 0, %grammo_out_flush.exit.i8.i.1 ]
+  %.5.i.i413.2 = add i64 %.4.i19.i.1, 25
+  %.6.b.i.i.2 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i.i.2 = select i1 %.6.b.i.i.2, i64 65536, i64 0
+  %.7.not.i.i.2 = icmp ugt i64 %.5.i.i413.2, %.6.i.i.2
+  br i1 %.7.not.i.i.2, label %loop.i.i.i.2, label %grammo_out_reserve.exit.i.2
+
+loop.i.i.i.2:                                     ; preds = %grammo_out_advance.exit.i.1, %body.i.i.i.2
+  %written.i.i.i.2 = phi i64 [ %.10.i.i.i.2, %body.i.i.i.2 ], [ 0, %grammo_out_advance.exit.i.1 ]
+  %.5.i.i.i422.2 = icmp slt i64 %written.i.i.i.2, %.4.i19.i.1
+  br i1 %.5.i.i.i422.2, label %body.i.i.i.2, label %grammo_out_flush.exit.i.i.2
+
+body.i.i.i.2:                                     ; preds = %loop.i.i.i.2
+  %.7.i.i.i.2 = getelementptr i8, ptr %.20.pre1.i.i.2, i64 %written.i.i.i.2
+  %.8.i.i.i.2 = sub i64 %.4.i19.i.1, %written.i.i.i.2
+  %.9.i.i.i.2 = tail call i64 @write(i32 1, ptr %.7.i.i.i.2, i64 %.8.i.i.i.2)
+  %.10.i.i.i.2 = add i64 %.9.i.i.i.2, %written.i.i.i.2
+  %.11.i.i.i423.2 = icmp sgt i64 %.9.i.i.i.2, 0
+  br i1 %.11.i.i.i423.2, label %loop.i.i.i.2, label %grammo_out_flush.exit.i.i.2
+
+grammo_out_flush.exit.i.i.2:                      ; preds = %body.i.i.i.2, %loop.i.i.i.2
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i.i.2 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i.i.2 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i.i.2, label %grammo_out_reserve.exit.i.2, label %grow.i.i.2
+
+grow.i.i.2:                                       ; preds = %grammo_out_flush.exit.i.i.2
+  %.16.i.i.2 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i.i.2, i64 65536)
+  store ptr %.16.i.i.2, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit.i.2
+
+grammo_out_reserve.exit.i.2:                      ; preds = %grow.i.i.2, %grammo_out_flush.exit.i.i.2, %grammo_out_advance.exit.i.1
+  %.21.i.i.2 = phi i64 [ 0, %grow.i.i.2 ], [ 0, %grammo_out_flush.exit.i.i.2 ], [ %.4.i19.i.1, %grammo_out_advance.exit.i.1 ]
+  %.20.i.i.2 = phi ptr [ %.16.i.i.2, %grow.i.i.2 ], [ %.20.pre.i.i.2, %grammo_out_flush.exit.i.i.2 ], [ %.20.pre1.i.i.2, %grammo_out_advance.exit.i.1 ]
+  %.22.i.i.2 = getelementptr i8, ptr %.20.i.i.2, i64 %.21.i.i.2
+  %.10.i414.2 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i.i.2, i64 25, ptr nonnull @str_0, i32 1)
+  %9 = tail call i32 @llvm.smax.i32(i32 %.10.i414.2, i32 0)
+  %.6.i3.i.2 = zext nneg i32 %9 to i64
+  %.7.i.i415.2 = load i64, ptr @grammo_out_len, align 8
+  %.8.i.i416.2 = add i64 %.7.i.i415.2, %.6.i3.i.2
+  store i64 %.8.i.i416.2, ptr @grammo_out_len, align 8
+  %.2.i.i.i.2 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i.i417.2 = icmp slt i32 %.2.i.i.i.2, 0
+  br i1 %.3.i.i.i417.2, label %check.i.i.i.2, label %grammo_out_interactive.exit.i.i.2
+
+check.i.i.i.2:                                    ; preds = %grammo_out_reserve.exit.i.2
+  %.5.i.i13.i.2 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i13.i.2, ptr @grammo_out_tty, align 4
+  %.4.i.pre.i.2 = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i.i.2
+
+grammo_out_interactive.exit.i.i.2:                ; preds = %check.i.i.i.2, %grammo_out_reserve.exit.i.2
+  %.3.i2.i.i418.2 = phi i64 [ %.4.i.pre.i.2, %check.i.i.i.2 ], [ %.8.i.i416.2, %grammo_out_reserve.exit.i.2 ]
+  %.8.i.i4.i.2 = phi i32 [ %.5.i.i13.i.2, %check.i.i.i.2 ], [ %.2.i.i.i.2, %grammo_out_reserve.exit.i.2 ]
+  %.9.i.i5.i.2 = icmp sgt i32 %.8.i.i4.i.2, 0
+  %.20.pre1.i429.pre520 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i5.i.2, label %loop.i.i6.i.2, label %grammo_out_advance.exit.i.2
+
+loop.i.i6.i.2:                                    ; preds = %grammo_out_interactive.exit.i.i.2, %body.i.i9.i.2
+  %written.i.i7.i.2 = phi i64 [ %.10.i.i11.i.2, %body.i.i9.i.2 ], [ 0, %grammo_out_interactive.exit.i.i.2 ]
+  %.5.i3.i.i.2 = icmp slt i64 %written.i.i7.i.2, %.3.i2.i.i418.2
+  br i1 %.5.i3.i.i.2, label %body.i.i9.i.2, label %grammo_out_flush.exit.i8.i.2
+
+body.i.i9.i.2:                                    ; preds = %loop.i.i6.i.2
+  %.7.i.i10.i.2 = getelementptr i8, ptr %.20.pre1.i429.pre520, i64 %written.i.i7.i.2
+  %.8.i4.i.i.2 = sub i64 %.3.i2.i.i418.2, %written.i.i7.i.2
+  %.9.i5.i.i.2 = tail call i64 @write(i32 1, ptr %.7.i.i10.i.2, i64 %.8.i4.i.i.2)
+  %.10.i.i11.i.2 = add i64 %.9.i5.i.i.2, %written.i.i7.i.2
+  %.11.i.i12.i.2 = icmp sgt i64 %.9.i5.i.i.2, 0
+  br i1 %.11.i.i12.i.2, label %loop.i.i6.i.2, label %grammo_out_flush.exit.i8.i.2
+
+grammo_out_flush.exit.i8.i.2:                     ; preds = %body.i.i9.i.2, %loop.i.i6.i.2
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i429.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit.i.2
+
+grammo_out_advance.exit.i.2:                      ; preds = %grammo_out_flush.exit.i8.i.2, %grammo_out_interactive.exit.i.i.2
+  %.20.pre1.i429 = phi ptr [ %.20.pre1.i429.pre, %grammo_out_flush.exit.i8.i.2 ], [ %.20.pre1.i429.pre520, %grammo_out_interactive.exit.i.i.2 ]
+  %.4.i424 = phi i64 [ 0, %grammo_out_flush.exit.i8.i.2 ], [ %.3.i2.i.i418.2, %grammo_out_interactive.exit.i.i.2 ]
+  %.5.i425 = add i64 %.4.i424, 13
+  %.6.b.i426 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i427 = select i1 %.6.b.i426, i64 65536, i64 0
+  %.7.not.i428 = icmp ugt i64 %.5.i425, %.6.i427
+  br i1 %.7.not.i428, label %loop.i.i433, label %grammo_out_reserve.exit447
+
+loop.i.i433:                                      ; preds = %grammo_out_advance.exit.i.2, %body.i.i441
+  %written.i.i434 = phi i64 [ %.10.i.i445, %body.i.i441 ], [ 0, %grammo_out_advance.exit.i.2 ]
+  %.5.i.i435 = icmp slt i64 %written.i.i434, %.4.i424
+  br i1 %.5.i.i435, label %body.i.i441, label %grammo_out_flush.exit.i436
+
+body.i.i441:                                      ; preds = %loop.i.i433
+  %.7.i.i442 = getelementptr i8, ptr %.20.pre1.i429, i64 %written.i.i434
+  %.8.i.i443 = sub i64 %.4.i424, %written.i.i434
+  %.9.i.i444 = tail call i64 @write(i32 1, ptr %.7.i.i442, i64 %.8.i.i443)
+  %.10.i.i445 = add i64 %.9.i.i444, %written.i.i434
+  %.11.i.i446 = icmp sgt i64 %.9.i.i444, 0
+  br i1 %.11.i.i446, label %loop.i.i433, label %grammo_out_flush.exit.i436
+
+grammo_out_flush.exit.i436:                       ; preds = %body.i.i441, %loop.i.i433
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i437 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i438 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i437, label %grammo_out_reserve.exit447, label %grow.i439
+
+grow.i439:                                        ; preds = %grammo_out_flush.exit.i436
+  %.16.i440 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i438, i64 65536)
+  store ptr %.16.i440, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit447
+
+grammo_out_reserve.exit447:                       ; preds = %grammo_out_advance.exit.i.2, %grammo_out_flush.exit.i436, %grow.i439
+  %.21.i430 = phi i64 [ 0, %grow.i439 ], [ 0, %grammo_out_flush.exit.i436 ], [ %.4.i424, %grammo_out_advance.exit.i.2 ]
+  %.20.i431 = phi ptr [ %.16.i440, %grow.i439 ], [ %.20.pre.i438, %grammo_out_flush.exit.i436 ], [ %.20.pre1.i429, %grammo_out_advance.exit.i.2 ]
+  %.22.i432 = getelementptr i8, ptr %.20.i431, i64 %.21.i430
+  %.78 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i432, i64 13, ptr nonnull @str_3, i32 3)
+  %10 = tail call i32 @llvm.smax.i32(i32 %.78, i32 0)
+  %.6.i448 = zext nneg i32 %10 to i64
+  %.7.i449 = load i64, ptr @grammo_out_len, align 8
+  %.8.i450 = add i64 %.7.i449, %.6.i448
+  store i64 %.8.i450, ptr @grammo_out_len, align 8
+  %.2.i.i451 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i452 = icmp slt i32 %.2.i.i451, 0
+  br i1 %.3.i.i452, label %check.i.i469, label %grammo_out_interactive.exit.i453
+
+check.i.i469:                                     ; preds = %grammo_out_reserve.exit447
+  %.5.i.i470 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i470, ptr @grammo_out_tty, align 4
+  %.3.i472.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i453
+
+grammo_out_interactive.exit.i453:                 ; preds = %check.i.i469, %grammo_out_reserve.exit447
+  %.3.i472.pre = phi i64 [ %.3.i472.pre.pre, %check.i.i469 ], [ %.8.i450, %grammo_out_reserve.exit447 ]
+  %.8.i.i454 = phi i32 [ %.5.i.i470, %check.i.i469 ], [ %.2.i.i451, %grammo_out_reserve.exit447 ]
+  %.9.i.i455 = icmp sgt i32 %.8.i.i454, 0
+  %.2.i.pre522 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i455, label %loop.i.i459, label %grammo_out_advance.exit471
+
+loop.i.i459:                                      ; preds = %grammo_out_interactive.exit.i453, %body.i.i463
+  %written.i.i460 = phi i64 [ %.10.i.i467, %body.i.i463 ], [ 0, %grammo_out_interactive.exit.i453 ]
+  %.5.i3.i461 = icmp slt i64 %written.i.i460, %.3.i472.pre
+  br i1 %.5.i3.i461, label %body.i.i463, label %grammo_out_flush.exit.i462
+
+body.i.i463:                                      ; preds = %loop.i.i459
+  %.7.i.i464 = getelementptr i8, ptr %.2.i.pre522, i64 %written.i.i460
+  %.8.i4.i465 = sub i64 %.3.i472.pre, %written.i.i460
+  %.9.i5.i466 = tail call i64 @write(i32 1, ptr %.7.i.i464, i64 %.8.i4.i465)
+  %.10.i.i467 = add i64 %.9.i5.i466, %written.i.i460
+  %.11.i.i468 = icmp sgt i64 %.9.i5.i466, 0
+  br i1 %.11.i.i468, label %loop.i.i459, label %grammo_out_flush.exit.i462
+
+grammo_out_flush.exit.i462:                       ; preds = %body.i.i463, %loop.i.i459
+  store i64 0, ptr @grammo_out_len, align 8
+  %.2.i.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit471
+
+grammo_out_advance.exit471:                       ; preds = %grammo_out_interactive.exit.i453, %grammo_out_flush.exit.i462
+  %.3.i472 = phi i64 [ %.3.i472.pre, %grammo_out_interactive.exit.i453 ], [ 0, %grammo_out_flush.exit.i462 ]
+  %.2.i = phi ptr [ %.2.i.pre522, %grammo_out_interactive.exit.i453 ], [ %.2.i.pre, %grammo_out_flush.exit.i462 ]
+  br label %loop.i
+
+loop.i:                                           ; preds = %body.i, %grammo_out_advance.exit471
+  %written.i = phi i64 [ 0, %grammo_out_advance.exit471 ], [ %.10.i477, %body.i ]
+  %.5.i473 = icmp slt i64 %written.i, %.3.i472
+  br i1 %.5.i473, label %body.i, label %grammo_out_flush.exit
+
+body.i:                                           ; preds = %loop.i
+  %.7.i474 = getelementptr i8, ptr %.2.i, i64 %written.i
+  %.8.i475 = sub i64 %.3.i472, %written.i
+  %.9.i476 = tail call i64 @write(i32 1, ptr %.7.i474, i64 %.8.i475)
+  %.10.i477 = add i64 %.9.i476, %written.i
+  %.11.i478 = icmp sgt i64 %.9.i476, 0
+  br i1 %.11.i478, label %loop.i, label %grammo_out_flush.exit
+
+grammo_out_flush.exit:                            ; preds = %loop.i, %body.i
+  store i64 0, ptr @grammo_out_len, align 8
+  ret void
+}
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i64 @llvm.smax.i64(i64, i64) #6
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i32 @llvm.smax.i32(i32, i32) #6
+
+; Function Attrs: nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memcpy.p0.p0.i64(ptr noalias nocapture writeonly, ptr noalias nocapture readonly, i64, i1 immarg) #7
+
+attributes #0 = { nofree nounwind }
+attributes #1 = { mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #2 = { nounwind }
+attributes #3 = { mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #4 = { mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+attributes #5 = { nofree nosync nounwind memory(readwrite, argmem: none, inaccessiblemem: none) }
+attributes #6 = { nocallback nofree nosync nounwind speculatable willreturn memory(none) }
+attributes #7 = { nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.peeled.count", i32 1}
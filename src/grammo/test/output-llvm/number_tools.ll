@@ -1,117 +1,47 @@
 ; ModuleID = '<string>'
 source_filename = "<string>"
-target triple = "x86_64-pc-windows-msvc"
-
-@str_0 = constant [36 x i8] c"Demo numeri: primalita' e MCD (gcd)\00"
-@str_1 = constant [3 x i8] c"%s\00"
-@str_2 = local_unnamed_addr constant [2 x i8] c"\0A\00"
-@str_3 = constant [44 x i8] c"Numero per primalita' (int >= 0, piccolo): \00"
-@str_4 = constant [3 x i8] c"%d\00"
-@str_5 = constant [20 x i8] c"Il numero e' primo.\00"
-@str_6 = constant [24 x i8] c"Il numero NON e' primo.\00"
-@str_7 = constant [10 x i8] c"A (int): \00"
-@str_8 = constant [10 x i8] c"B (int): \00"
-@str_9 = constant [10 x i8] c"gcd(A,B)=\00"
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-i128:128-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-unknown-linux-gnu"
+
+@grammo_out_buf = internal unnamed_addr global ptr null
+@grammo_out_cap = internal unnamed_addr global i1 false
+@grammo_out_len = internal unnamed_addr global i64 0
+@grammo_out_tty = internal unnamed_addr global i32 -1
+@str_0 = private unnamed_addr constant [37 x i8] c"Demo numeri: primalita' e MCD (gcd)\0A\00"
+@str_1 = private unnamed_addr constant [44 x i8] c"Numero per primalita' (int >= 0, piccolo): \00"
+@grammo_in_buf = internal unnamed_addr global ptr null
+@grammo_in_cap = internal unnamed_addr global i64 0
+@grammo_in_pos = internal unnamed_addr global i64 0
+@grammo_in_end = internal unnamed_addr global i64 0
+@str_2 = private unnamed_addr constant [21 x i8] c"Il numero e' primo.\0A\00"
+@str_3 = private unnamed_addr constant [25 x i8] c"Il numero NON e' primo.\0A\00"
+@str_4 = private unnamed_addr constant [10 x i8] c"A (int): \00"
+@str_5 = private unnamed_addr constant [10 x i8] c"B (int): \00"
+@str_6 = private constant [13 x i8] c"gcd(A,B)=%d\0A\00"
 
 ; Function Attrs: nofree nounwind
-declare noundef i32 @printf(ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+declare noundef i32 @snprintf(ptr noalias nocapture noundef writeonly, i64 noundef, ptr nocapture noundef readonly, ...) local_unnamed_addr #0
 
-; Function Attrs: nofree nounwind
-declare noundef i32 @scanf(ptr nocapture noundef readonly, ...) local_unnamed_addr #0
-
-; Function Attrs: nofree norecurse nosync nounwind memory(none)
-define i1 @divisible(i32 %dv_n, i32 %dv_d) local_unnamed_addr #1 {
-entry:
-  %.7 = icmp slt i32 %dv_d, 1
-  br i1 %.7, label %common.ret, label %if_merge
+; Function Attrs: mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite)
+declare noalias noundef ptr @realloc(ptr allocptr nocapture, i64 noundef) local_unnamed_addr #1
 
-common.ret:                                       ; preds = %while_end, %entry
-  %common.ret.op = phi i1 [ false, %entry ], [ %.22, %while_end ]
-  ret i1 %common.ret.op
+; Function Attrs: nofree nounwind
+declare noundef i64 @write(i32 noundef, ptr nocapture noundef readonly, i64 noundef) local_unnamed_addr #0
 
-if_merge:                                         ; preds = %entry
-  %spec.select = tail call i32 @llvm.abs.i32(i32 %dv_n, i1 false)
-  br label %while_cond
+; Function Attrs: nounwind
+declare i32 @isatty(i32) local_unnamed_addr #2
 
-while_cond:                                       ; preds = %while_cond, %if_merge
-  %dv_t.1 = phi i32 [ %spec.select, %if_merge ], [ %.19, %while_cond ]
-  %.17 = icmp sgt i32 %dv_t.1, 0
-  %.19 = sub nsw i32 %dv_t.1, %dv_d
-  br i1 %.17, label %while_cond, label %while_end
+; Function Attrs: mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite)
+declare noalias noundef ptr @malloc(i64 noundef) local_unnamed_addr #3
 
-while_end:                                        ; preds = %while_cond
-  %.22 = icmp eq i32 %dv_t.1, 0
-  br label %common.ret
-}
+; Function Attrs: nofree nounwind
+declare noundef i64 @read(i32 noundef, ptr nocapture noundef, i64 noundef) local_unnamed_addr #0
 
-; Function Attrs: nofree norecurse nosync nounwind memory(none)
-define noundef i1 @is_prime(i32 %pr_n) local_unnamed_addr #1 {
-entry:
-  %.5 = icmp slt i32 %pr_n, 2
-  br i1 %.5, label %common.ret, label %while_cond.preheader
-
-while_cond.preheader:                             ; preds = %entry
-  %.11.not7 = icmp samesign ult i32 %pr_n, 4
-  br i1 %.11.not7, label %common.ret, label %while_body
-
-common.ret:                                       ; preds = %if_merge.1, %divisible.exit, %while_cond.preheader, %entry
-  %common.ret.op = phi i1 [ false, %entry ], [ true, %while_cond.preheader ], [ true, %if_merge.1 ], [ false, %divisible.exit ]
-  ret i1 %common.ret.op
-
-while_body:                                       ; preds = %while_cond.preheader, %if_merge.1
-  %pr_d.08 = phi i32 [ %.16, %if_merge.1 ], [ 2, %while_cond.preheader ]
-  %.7.i = icmp slt i32 %pr_d.08, 1
-  br i1 %.7.i, label %if_merge.1, label %while_cond.i
-
-while_cond.i:                                     ; preds = %while_body, %while_cond.i
-  %dv_t.1.i = phi i32 [ %.19.i, %while_cond.i ], [ %pr_n, %while_body ]
-  %.17.i = icmp sgt i32 %dv_t.1.i, 0
-  %.19.i = sub nsw i32 %dv_t.1.i, %pr_d.08
-  br i1 %.17.i, label %while_cond.i, label %divisible.exit
-
-divisible.exit:                                   ; preds = %while_cond.i
-  %.22.i = icmp eq i32 %dv_t.1.i, 0
-  br i1 %.22.i, label %common.ret, label %if_merge.1
-
-if_merge.1:                                       ; preds = %while_body, %divisible.exit
-  %.16 = add i32 %pr_d.08, 1
-  %.10 = mul i32 %.16, %.16
-  %.11.not = icmp sgt i32 %.10, %pr_n
-  br i1 %.11.not, label %common.ret, label %while_body
-}
+; Function Attrs: mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memmove.p0.p0.i64(ptr nocapture writeonly, ptr nocapture readonly, i64, i1 immarg) #4
 
-; Function Attrs: nofree norecurse nosync nounwind memory(none)
-define i32 @gcd(i32 %gd_a, i32 %gd_b) local_unnamed_addr #1 {
-entry:
-  %gd_y.0 = tail call i32 @llvm.abs.i32(i32 %gd_b, i1 false)
-  %.20 = icmp eq i32 %gd_a, 0
-  br i1 %.20, label %common.ret, label %next_branch
-
-common.ret:                                       ; preds = %while_body, %next_branch, %entry
-  %common.ret.op = phi i32 [ %gd_y.0, %entry ], [ %spec.select, %next_branch ], [ %gd_x.2, %while_body ]
-  ret i32 %common.ret.op
-
-next_branch:                                      ; preds = %entry
-  %spec.select = tail call i32 @llvm.abs.i32(i32 %gd_a, i1 false)
-  %.22 = icmp eq i32 %gd_b, 0
-  %.26.not16 = icmp eq i32 %spec.select, %gd_y.0
-  %or.cond = or i1 %.22, %.26.not16
-  br i1 %or.cond, label %common.ret, label %while_body
-
-while_body:                                       ; preds = %next_branch, %while_body
-  %gd_y.118 = phi i32 [ %gd_y.2, %while_body ], [ %gd_y.0, %next_branch ]
-  %gd_x.117 = phi i32 [ %gd_x.2, %while_body ], [ %spec.select, %next_branch ]
-  %.28 = icmp sgt i32 %gd_x.117, %gd_y.118
-  %.29 = select i1 %.28, i32 %gd_y.118, i32 0
-  %gd_x.2 = sub i32 %gd_x.117, %.29
-  %.31 = select i1 %.28, i32 0, i32 %gd_x.117
-  %gd_y.2 = sub i32 %gd_y.118, %.31
-  %.26.not = icmp eq i32 %gd_x.2, %gd_y.2
-  br i1 %.26.not, label %common.ret, label %while_body
-}
-
-; Function Attrs: nofree nounwind
-define void @main() local_unnamed_addr #0 {
+; Function Attrs: nounwind
+define void @main() local_unnamed_addr #2 {
 entry:
   %m_n = alloca i32, align 4
   store i32 0, ptr %m_n, align 4
@@ -119,85 +49,885 @@ entry:
   store i32 0, ptr %m_a, align 4
   %m_b = alloca i32, align 4
   store i32 0, ptr %m_b, align 4
-  %.9 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_0)
-  %putchar = tail call i32 @putchar(i32 10)
-  %.15 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_3)
-  %.17 = call i32 (ptr, ...) @scanf(ptr nonnull @str_4, ptr nonnull %m_n)
+  %.4.i = load i64, ptr @grammo_out_len, align 8
+  %.5.i = add i64 %.4.i, 37
+  %.6.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i = select i1 %.6.b.i, i64 65536, i64 0
+  %.7.not.i = icmp ugt i64 %.5.i, %.6.i
+  %.20.pre1.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i, label %loop.i.i, label %grammo_out_reserve.exit
+
+loop.i.i:                                         ; preds = %entry, %body.i.i
+  %written.i.i = phi i64 [ %.10.i.i, %body.i.i ], [ 0, %entry ]
+  %.5.i.i = icmp slt i64 %written.i.i, %.4.i
+  br i1 %.5.i.i, label %body.i.i, label %grammo_out_flush.exit.i
+
+body.i.i:                                         ; preds = %loop.i.i
+  %.7.i.i = getelementptr i8, ptr %.20.pre1.i, i64 %written.i.i
+  %.8.i.i = sub i64 %.4.i, %written.i.i
+  %.9.i.i = tail call i64 @write(i32 1, ptr %.7.i.i, i64 %.8.i.i)
+  %.10.i.i = add i64 %.9.i.i, %written.i.i
+  %.11.i.i = icmp sgt i64 %.9.i.i, 0
+  br i1 %.11.i.i, label %loop.i.i, label %grammo_out_flush.exit.i
+
+grammo_out_flush.exit.i:                          ; preds = %body.i.i, %loop.i.i
+  %.10.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i, label %grammo_out_reserve.exit, label %grow.i
+
+grow.i:                                           ; preds = %grammo_out_flush.exit.i
+  %.16.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i, i64 65536)
+  store ptr %.16.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit
+
+grammo_out_reserve.exit:                          ; preds = %entry, %grammo_out_flush.exit.i, %grow.i
+  %.7.i = phi i64 [ 0, %grow.i ], [ 0, %grammo_out_flush.exit.i ], [ %.4.i, %entry ]
+  %.20.i = phi ptr [ %.16.i, %grow.i ], [ %.20.pre.i, %grammo_out_flush.exit.i ], [ %.20.pre1.i, %entry ]
+  %.22.i = getelementptr i8, ptr %.20.i, i64 %.7.i
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(37) %.22.i, ptr noundef nonnull align 16 dereferenceable(37) @str_0, i64 37, i1 false)
+  %.8.i = add nsw i64 %.7.i, 36
+  store i64 %.8.i, ptr @grammo_out_len, align 8
+  %.2.i.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i = icmp slt i32 %.2.i.i, 0
+  br i1 %.3.i.i, label %check.i.i, label %grammo_out_interactive.exit.i
+
+check.i.i:                                        ; preds = %grammo_out_reserve.exit
+  %.5.i.i10 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i10, ptr @grammo_out_tty, align 4
+  %.4.i11.pre.pre = load i64, ptr @grammo_out_len, align 8
+  %.20.pre1.i16.pre306.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_interactive.exit.i
+
+grammo_out_interactive.exit.i:                    ; preds = %check.i.i, %grammo_out_reserve.exit
+  %.20.pre1.i16.pre306 = phi ptr [ %.20.pre1.i16.pre306.pre, %check.i.i ], [ %.20.i, %grammo_out_reserve.exit ]
+  %.4.i11.pre = phi i64 [ %.4.i11.pre.pre, %check.i.i ], [ %.8.i, %grammo_out_reserve.exit ]
+  %.8.i.i1 = phi i32 [ %.5.i.i10, %check.i.i ], [ %.2.i.i, %grammo_out_reserve.exit ]
+  %.9.i.i2 = icmp sgt i32 %.8.i.i1, 0
+  br i1 %.9.i.i2, label %loop.i.i3, label %grammo_out_advance.exit
+
+loop.i.i3:                                        ; preds = %grammo_out_interactive.exit.i, %body.i.i6
+  %written.i.i4 = phi i64 [ %.10.i.i8, %body.i.i6 ], [ 0, %grammo_out_interactive.exit.i ]
+  %.5.i3.i = icmp slt i64 %written.i.i4, %.4.i11.pre
+  br i1 %.5.i3.i, label %body.i.i6, label %grammo_out_flush.exit.i5
+
+body.i.i6:                                        ; preds = %loop.i.i3
+  %.7.i.i7 = getelementptr i8, ptr %.20.pre1.i16.pre306, i64 %written.i.i4
+  %.8.i4.i = sub i64 %.4.i11.pre, %written.i.i4
+  %.9.i5.i = tail call i64 @write(i32 1, ptr %.7.i.i7, i64 %.8.i4.i)
+  %.10.i.i8 = add i64 %.9.i5.i, %written.i.i4
+  %.11.i.i9 = icmp sgt i64 %.9.i5.i, 0
+  br i1 %.11.i.i9, label %loop.i.i3, label %grammo_out_flush.exit.i5
+
+grammo_out_flush.exit.i5:                         ; preds = %body.i.i6, %loop.i.i3
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i16.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit
+
+grammo_out_advance.exit:                          ; preds = %grammo_out_interactive.exit.i, %grammo_out_flush.exit.i5
+  %.20.pre1.i16 = phi ptr [ %.20.pre1.i16.pre306, %grammo_out_interactive.exit.i ], [ %.20.pre1.i16.pre, %grammo_out_flush.exit.i5 ]
+  %.4.i11 = phi i64 [ %.4.i11.pre, %grammo_out_interactive.exit.i ], [ 0, %grammo_out_flush.exit.i5 ]
+  %.5.i12 = add i64 %.4.i11, 44
+  %.6.b.i13 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i14 = select i1 %.6.b.i13, i64 65536, i64 0
+  %.7.not.i15 = icmp ugt i64 %.5.i12, %.6.i14
+  br i1 %.7.not.i15, label %loop.i.i20, label %grammo_out_reserve.exit34
+
+loop.i.i20:                                       ; preds = %grammo_out_advance.exit, %body.i.i28
+  %written.i.i21 = phi i64 [ %.10.i.i32, %body.i.i28 ], [ 0, %grammo_out_advance.exit ]
+  %.5.i.i22 = icmp slt i64 %written.i.i21, %.4.i11
+  br i1 %.5.i.i22, label %body.i.i28, label %grammo_out_flush.exit.i23
+
+body.i.i28:                                       ; preds = %loop.i.i20
+  %.7.i.i29 = getelementptr i8, ptr %.20.pre1.i16, i64 %written.i.i21
+  %.8.i.i30 = sub i64 %.4.i11, %written.i.i21
+  %.9.i.i31 = tail call i64 @write(i32 1, ptr %.7.i.i29, i64 %.8.i.i30)
+  %.10.i.i32 = add i64 %.9.i.i31, %written.i.i21
+  %.11.i.i33 = icmp sgt i64 %.9.i.i31, 0
+  br i1 %.11.i.i33, label %loop.i.i20, label %grammo_out_flush.exit.i23
+
+grammo_out_flush.exit.i23:                        ; preds = %body.i.i28, %loop.i.i20
+  %.10.b.i24 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i25 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i24, label %grammo_out_reserve.exit34, label %grow.i26
+
+grow.i26:                                         ; preds = %grammo_out_flush.exit.i23
+  %.16.i27 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i25, i64 65536)
+  store ptr %.16.i27, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit34
+
+grammo_out_reserve.exit34:                        ; preds = %grammo_out_advance.exit, %grammo_out_flush.exit.i23, %grow.i26
+  %.7.i35 = phi i64 [ 0, %grow.i26 ], [ 0, %grammo_out_flush.exit.i23 ], [ %.4.i11, %grammo_out_advance.exit ]
+  %.20.i18 = phi ptr [ %.16.i27, %grow.i26 ], [ %.20.pre.i25, %grammo_out_flush.exit.i23 ], [ %.20.pre1.i16, %grammo_out_advance.exit ]
+  %.22.i19 = getelementptr i8, ptr %.20.i18, i64 %.7.i35
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(44) %.22.i19, ptr noundef nonnull align 16 dereferenceable(44) @str_1, i64 44, i1 false)
+  %.8.i36 = add nsw i64 %.7.i35, 43
+  store i64 %.8.i36, ptr @grammo_out_len, align 8
+  %.2.i.i37 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i38 = icmp slt i32 %.2.i.i37, 0
+  br i1 %.3.i.i38, label %check.i.i55, label %grammo_out_interactive.exit.i39
+
+check.i.i55:                                      ; preds = %grammo_out_reserve.exit34
+  %.5.i.i56 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i56, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i39
+
+grammo_out_interactive.exit.i39:                  ; preds = %check.i.i55, %grammo_out_reserve.exit34
+  %.8.i.i40 = phi i32 [ %.5.i.i56, %check.i.i55 ], [ %.2.i.i37, %grammo_out_reserve.exit34 ]
+  %.9.i.i41 = icmp sgt i32 %.8.i.i40, 0
+  br i1 %.9.i.i41, label %flush.i42, label %grammo_out_sync.exit
+
+flush.i42:                                        ; preds = %grammo_out_interactive.exit.i39
+  %.2.i1.i43 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i44 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i45
+
+loop.i.i45:                                       ; preds = %body.i.i49, %flush.i42
+  %written.i.i46 = phi i64 [ 0, %flush.i42 ], [ %.10.i.i53, %body.i.i49 ]
+  %.5.i3.i47 = icmp slt i64 %written.i.i46, %.3.i2.i44
+  br i1 %.5.i3.i47, label %body.i.i49, label %grammo_out_flush.exit.i48
+
+body.i.i49:                                       ; preds = %loop.i.i45
+  %.7.i.i50 = getelementptr i8, ptr %.2.i1.i43, i64 %written.i.i46
+  %.8.i4.i51 = sub i64 %.3.i2.i44, %written.i.i46
+  %.9.i5.i52 = tail call i64 @write(i32 1, ptr %.7.i.i50, i64 %.8.i4.i51)
+  %.10.i.i53 = add i64 %.9.i5.i52, %written.i.i46
+  %.11.i.i54 = icmp sgt i64 %.9.i5.i52, 0
+  br i1 %.11.i.i54, label %loop.i.i45, label %grammo_out_flush.exit.i48
+
+grammo_out_flush.exit.i48:                        ; preds = %body.i.i49, %loop.i.i45
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit
+
+grammo_out_sync.exit:                             ; preds = %grammo_out_interactive.exit.i39, %grammo_out_flush.exit.i48
+  call fastcc void @grammo_in_read_int(ptr %m_n)
   %load_m_n = load i32, ptr %m_n, align 4
-  %.5.i = icmp slt i32 %load_m_n, 2
-  br i1 %.5.i, label %if_merge, label %while_cond.preheader.i
+  %.5.i57 = icmp slt i32 %load_m_n, 2
+  br i1 %.5.i57, label %next_branch, label %while_cond.preheader.i
 
-while_cond.preheader.i:                           ; preds = %entry
+while_cond.preheader.i:                           ; preds = %grammo_out_sync.exit
   %.11.not7.i = icmp samesign ult i32 %load_m_n, 4
-  br i1 %.11.not7.i, label %if_merge, label %while_body.i
+  br i1 %.11.not7.i, label %if_then, label %while_body.i
 
 while_body.i:                                     ; preds = %while_cond.preheader.i, %if_merge.1.i
-  %pr_d.08.i = phi i32 [ %.16.i, %if_merge.1.i ], [ 2, %while_cond.preheader.i ]
-  %.7.i.i = icmp slt i32 %pr_d.08.i, 1
-  br i1 %.7.i.i, label %if_merge.1.i, label %while_cond.i.i
+  %pr_d.08.i = phi i32 [ %.16.i59, %if_merge.1.i ], [ 2, %while_cond.preheader.i ]
+  %.7.i.i58 = icmp slt i32 %pr_d.08.i, 1
+  br i1 %.7.i.i58, label %if_merge.1.i, label %while_cond.i.i
 
 while_cond.i.i:                                   ; preds = %while_body.i, %while_cond.i.i
   %dv_t.1.i.i = phi i32 [ %.19.i.i, %while_cond.i.i ], [ %load_m_n, %while_body.i ]
   %.17.i.i = icmp sgt i32 %dv_t.1.i.i, 0
   %.19.i.i = sub nsw i32 %dv_t.1.i.i, %pr_d.08.i
-  br i1 %.17.i.i, label %while_cond.i.i, label %divisible.exit.i
+  br i1 %.17.i.i, label %while_cond.i.i, label %g.divisible.exit.i
 
-divisible.exit.i:                                 ; preds = %while_cond.i.i
+g.divisible.exit.i:                               ; preds = %while_cond.i.i
   %.22.i.i = icmp eq i32 %dv_t.1.i.i, 0
-  br i1 %.22.i.i, label %if_merge, label %if_merge.1.i
+  br i1 %.22.i.i, label %next_branch, label %if_merge.1.i
 
-if_merge.1.i:                                     ; preds = %divisible.exit.i, %while_body.i
-  %.16.i = add i32 %pr_d.08.i, 1
-  %.10.i = mul i32 %.16.i, %.16.i
+if_merge.1.i:                                     ; preds = %g.divisible.exit.i, %while_body.i
+  %.16.i59 = add i32 %pr_d.08.i, 1
+  %.10.i = mul i32 %.16.i59, %.16.i59
   %.11.not.i = icmp sgt i32 %.10.i, %load_m_n
-  br i1 %.11.not.i, label %if_merge, label %while_body.i
-
-if_merge:                                         ; preds = %divisible.exit.i, %if_merge.1.i, %entry, %while_cond.preheader.i
-  %str_6.sink = phi ptr [ @str_5, %while_cond.preheader.i ], [ @str_6, %entry ], [ @str_5, %if_merge.1.i ], [ @str_6, %divisible.exit.i ]
-  %.28 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull %str_6.sink)
-  %putchar1 = call i32 @putchar(i32 10)
-  %.37 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_7)
-  %.39 = call i32 (ptr, ...) @scanf(ptr nonnull @str_4, ptr nonnull %m_a)
-  %.42 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_8)
-  %.44 = call i32 (ptr, ...) @scanf(ptr nonnull @str_4, ptr nonnull %m_b)
+  br i1 %.11.not.i, label %if_then, label %while_body.i
+
+if_then:                                          ; preds = %if_merge.1.i, %while_cond.preheader.i
+  %.4.i60 = load i64, ptr @grammo_out_len, align 8
+  %.5.i61 = add i64 %.4.i60, 21
+  %.6.b.i62 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i63 = select i1 %.6.b.i62, i64 65536, i64 0
+  %.7.not.i64 = icmp ugt i64 %.5.i61, %.6.i63
+  %.20.pre1.i65 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i64, label %loop.i.i69, label %grammo_out_reserve.exit83
+
+loop.i.i69:                                       ; preds = %if_then, %body.i.i77
+  %written.i.i70 = phi i64 [ %.10.i.i81, %body.i.i77 ], [ 0, %if_then ]
+  %.5.i.i71 = icmp slt i64 %written.i.i70, %.4.i60
+  br i1 %.5.i.i71, label %body.i.i77, label %grammo_out_flush.exit.i72
+
+body.i.i77:                                       ; preds = %loop.i.i69
+  %.7.i.i78 = getelementptr i8, ptr %.20.pre1.i65, i64 %written.i.i70
+  %.8.i.i79 = sub i64 %.4.i60, %written.i.i70
+  %.9.i.i80 = tail call i64 @write(i32 1, ptr %.7.i.i78, i64 %.8.i.i79)
+  %.10.i.i81 = add i64 %.9.i.i80, %written.i.i70
+  %.11.i.i82 = icmp sgt i64 %.9.i.i80, 0
+  br i1 %.11.i.i82, label %loop.i.i69, label %grammo_out_flush.exit.i72
+
+grammo_out_flush.exit.i72:                        ; preds = %body.i.i77, %loop.i.i69
+  %.10.b.i73 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i74 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i73, label %grammo_out_reserve.exit83, label %grow.i75
+
+grow.i75:                                         ; preds = %grammo_out_flush.exit.i72
+  %.16.i76 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i74, i64 65536)
+  store ptr %.16.i76, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit83
+
+grammo_out_reserve.exit83:                        ; preds = %if_then, %grammo_out_flush.exit.i72, %grow.i75
+  %.7.i84 = phi i64 [ 0, %grow.i75 ], [ 0, %grammo_out_flush.exit.i72 ], [ %.4.i60, %if_then ]
+  %.20.i67 = phi ptr [ %.16.i76, %grow.i75 ], [ %.20.pre.i74, %grammo_out_flush.exit.i72 ], [ %.20.pre1.i65, %if_then ]
+  %.22.i68 = getelementptr i8, ptr %.20.i67, i64 %.7.i84
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(21) %.22.i68, ptr noundef nonnull align 16 dereferenceable(21) @str_2, i64 21, i1 false)
+  %.8.i85 = add nsw i64 %.7.i84, 20
+  store i64 %.8.i85, ptr @grammo_out_len, align 8
+  %.2.i.i86 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i87 = icmp slt i32 %.2.i.i86, 0
+  br i1 %.3.i.i87, label %check.i.i104, label %grammo_out_interactive.exit.i88
+
+check.i.i104:                                     ; preds = %grammo_out_reserve.exit83
+  %.5.i.i105 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i105, ptr @grammo_out_tty, align 4
+  %.4.i154.pre308.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i88
+
+grammo_out_interactive.exit.i88:                  ; preds = %check.i.i104, %grammo_out_reserve.exit83
+  %.4.i154.pre308 = phi i64 [ %.4.i154.pre308.pre, %check.i.i104 ], [ %.8.i85, %grammo_out_reserve.exit83 ]
+  %.8.i.i89 = phi i32 [ %.5.i.i105, %check.i.i104 ], [ %.2.i.i86, %grammo_out_reserve.exit83 ]
+  %.9.i.i90 = icmp sgt i32 %.8.i.i89, 0
+  br i1 %.9.i.i90, label %flush.i91, label %if_merge
+
+flush.i91:                                        ; preds = %grammo_out_interactive.exit.i88
+  %.2.i1.i92 = load ptr, ptr @grammo_out_buf, align 8
+  br label %loop.i.i94
+
+loop.i.i94:                                       ; preds = %body.i.i98, %flush.i91
+  %written.i.i95 = phi i64 [ 0, %flush.i91 ], [ %.10.i.i102, %body.i.i98 ]
+  %.5.i3.i96 = icmp slt i64 %written.i.i95, %.4.i154.pre308
+  br i1 %.5.i3.i96, label %body.i.i98, label %if_merge.sink.split
+
+body.i.i98:                                       ; preds = %loop.i.i94
+  %.7.i.i99 = getelementptr i8, ptr %.2.i1.i92, i64 %written.i.i95
+  %.8.i4.i100 = sub i64 %.4.i154.pre308, %written.i.i95
+  %.9.i5.i101 = tail call i64 @write(i32 1, ptr %.7.i.i99, i64 %.8.i4.i100)
+  %.10.i.i102 = add i64 %.9.i5.i101, %written.i.i95
+  %.11.i.i103 = icmp sgt i64 %.9.i5.i101, 0
+  br i1 %.11.i.i103, label %loop.i.i94, label %if_merge.sink.split
+
+next_branch:                                      ; preds = %g.divisible.exit.i, %grammo_out_sync.exit
+  %.4.i107 = load i64, ptr @grammo_out_len, align 8
+  %.5.i108 = add i64 %.4.i107, 25
+  %.6.b.i109 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i110 = select i1 %.6.b.i109, i64 65536, i64 0
+  %.7.not.i111 = icmp ugt i64 %.5.i108, %.6.i110
+  %.20.pre1.i112 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i111, label %loop.i.i116, label %grammo_out_reserve.exit130
+
+loop.i.i116:                                      ; preds = %next_branch, %body.i.i124
+  %written.i.i117 = phi i64 [ %.10.i.i128, %body.i.i124 ], [ 0, %next_branch ]
+  %.5.i.i118 = icmp slt i64 %written.i.i117, %.4.i107
+  br i1 %.5.i.i118, label %body.i.i124, label %grammo_out_flush.exit.i119
+
+body.i.i124:                                      ; preds = %loop.i.i116
+  %.7.i.i125 = getelementptr i8, ptr %.20.pre1.i112, i64 %written.i.i117
+  %.8.i.i126 = sub i64 %.4.i107, %written.i.i117
+  %.9.i.i127 = tail call i64 @write(i32 1, ptr %.7.i.i125, i64 %.8.i.i126)
+  %.10.i.i128 = add i64 %.9.i.i127, %written.i.i117
+  %.11.i.i129 = icmp sgt i64 %.9.i.i127, 0
+  br i1 %.11.i.i129, label %loop.i.i116, label %grammo_out_flush.exit.i119
+
+grammo_out_flush.exit.i119:                       ; preds = %body.i.i124, %loop.i.i116
+  %.10.b.i120 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i121 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i120, label %grammo_out_reserve.exit130, label %grow.i122
+
+grow.i122:                                        ; preds = %grammo_out_flush.exit.i119
+  %.16.i123 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i121, i64 65536)
+  store ptr %.16.i123, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit130
+
+grammo_out_reserve.exit130:                       ; preds = %next_branch, %grammo_out_flush.exit.i119, %grow.i122
+  %.7.i131 = phi i64 [ 0, %grow.i122 ], [ 0, %grammo_out_flush.exit.i119 ], [ %.4.i107, %next_branch ]
+  %.20.i114 = phi ptr [ %.16.i123, %grow.i122 ], [ %.20.pre.i121, %grammo_out_flush.exit.i119 ], [ %.20.pre1.i112, %next_branch ]
+  %.22.i115 = getelementptr i8, ptr %.20.i114, i64 %.7.i131
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(25) %.22.i115, ptr noundef nonnull align 16 dereferenceable(25) @str_3, i64 25, i1 false)
+  %.8.i132 = add nsw i64 %.7.i131, 24
+  store i64 %.8.i132, ptr @grammo_out_len, align 8
+  %.2.i.i133 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i134 = icmp slt i32 %.2.i.i133, 0
+  br i1 %.3.i.i134, label %check.i.i151, label %grammo_out_interactive.exit.i135
+
+check.i.i151:                                     ; preds = %grammo_out_reserve.exit130
+  %.5.i.i152 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i152, ptr @grammo_out_tty, align 4
+  %.4.i154.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i135
+
+grammo_out_interactive.exit.i135:                 ; preds = %check.i.i151, %grammo_out_reserve.exit130
+  %.4.i154.pre = phi i64 [ %.4.i154.pre.pre, %check.i.i151 ], [ %.8.i132, %grammo_out_reserve.exit130 ]
+  %.8.i.i136 = phi i32 [ %.5.i.i152, %check.i.i151 ], [ %.2.i.i133, %grammo_out_reserve.exit130 ]
+  %.9.i.i137 = icmp sgt i32 %.8.i.i136, 0
+  br i1 %.9.i.i137, label %flush.i138, label %if_merge
+
+flush.i138:                                       ; preds = %grammo_out_interactive.exit.i135
+  %.2.i1.i139 = load ptr, ptr @grammo_out_buf, align 8
+  br label %loop.i.i141
+
+loop.i.i141:                                      ; preds = %body.i.i145, %flush.i138
+  %written.i.i142 = phi i64 [ 0, %flush.i138 ], [ %.10.i.i149, %body.i.i145 ]
+  %.5.i3.i143 = icmp slt i64 %written.i.i142, %.4.i154.pre
+  br i1 %.5.i3.i143, label %body.i.i145, label %if_merge.sink.split
+
+body.i.i145:                                      ; preds = %loop.i.i141
+  %.7.i.i146 = getelementptr i8, ptr %.2.i1.i139, i64 %written.i.i142
+  %.8.i4.i147 = sub i64 %.4.i154.pre, %written.i.i142
+  %.9.i5.i148 = tail call i64 @write(i32 1, ptr %.7.i.i146, i64 %.8.i4.i147)
+  %.10.i.i149 = add i64 %.9.i5.i148, %written.i.i142
+  %.11.i.i150 = icmp sgt i64 %.9.i5.i148, 0
+  br i1 %.11.i.i150, label %loop.i.i141, label %if_merge.sink.split
+
+if_merge.sink.split:                              ; preds = %loop.i.i94, %body.i.i98, %loop.i.i141, %body.i.i145
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %if_merge
+
+if_merge:                                         ; preds = %if_merge.sink.split, %grammo_out_interactive.exit.i135, %grammo_out_interactive.exit.i88
+  %.4.i154 = phi i64 [ %.4.i154.pre, %grammo_out_interactive.exit.i135 ], [ %.4.i154.pre308, %grammo_out_interactive.exit.i88 ], [ 0, %if_merge.sink.split ]
+  %.5.i155 = add i64 %.4.i154, 10
+  %.6.b.i156 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i157 = select i1 %.6.b.i156, i64 65536, i64 0
+  %.7.not.i158 = icmp ugt i64 %.5.i155, %.6.i157
+  %.20.pre1.i159 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i158, label %loop.i.i163, label %grammo_out_reserve.exit177
+
+loop.i.i163:                                      ; preds = %if_merge, %body.i.i171
+  %written.i.i164 = phi i64 [ %.10.i.i175, %body.i.i171 ], [ 0, %if_merge ]
+  %.5.i.i165 = icmp slt i64 %written.i.i164, %.4.i154
+  br i1 %.5.i.i165, label %body.i.i171, label %grammo_out_flush.exit.i166
+
+body.i.i171:                                      ; preds = %loop.i.i163
+  %.7.i.i172 = getelementptr i8, ptr %.20.pre1.i159, i64 %written.i.i164
+  %.8.i.i173 = sub i64 %.4.i154, %written.i.i164
+  %.9.i.i174 = tail call i64 @write(i32 1, ptr %.7.i.i172, i64 %.8.i.i173)
+  %.10.i.i175 = add i64 %.9.i.i174, %written.i.i164
+  %.11.i.i176 = icmp sgt i64 %.9.i.i174, 0
+  br i1 %.11.i.i176, label %loop.i.i163, label %grammo_out_flush.exit.i166
+
+grammo_out_flush.exit.i166:                       ; preds = %body.i.i171, %loop.i.i163
+  %.10.b.i167 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i168 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i167, label %grammo_out_reserve.exit177, label %grow.i169
+
+grow.i169:                                        ; preds = %grammo_out_flush.exit.i166
+  %.16.i170 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i168, i64 65536)
+  store ptr %.16.i170, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit177
+
+grammo_out_reserve.exit177:                       ; preds = %if_merge, %grammo_out_flush.exit.i166, %grow.i169
+  %.7.i178 = phi i64 [ 0, %grow.i169 ], [ 0, %grammo_out_flush.exit.i166 ], [ %.4.i154, %if_merge ]
+  %.20.i161 = phi ptr [ %.16.i170, %grow.i169 ], [ %.20.pre.i168, %grammo_out_flush.exit.i166 ], [ %.20.pre1.i159, %if_merge ]
+  %.22.i162 = getelementptr i8, ptr %.20.i161, i64 %.7.i178
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(10) %.22.i162, ptr noundef nonnull align 1 dereferenceable(10) @str_4, i64 10, i1 false)
+  %.8.i179 = add nsw i64 %.7.i178, 9
+  store i64 %.8.i179, ptr @grammo_out_len, align 8
+  %.2.i.i180 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i181 = icmp slt i32 %.2.i.i180, 0
+  br i1 %.3.i.i181, label %check.i.i198, label %grammo_out_interactive.exit.i182
+
+check.i.i198:                                     ; preds = %grammo_out_reserve.exit177
+  %.5.i.i199 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i199, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i182
+
+grammo_out_interactive.exit.i182:                 ; preds = %check.i.i198, %grammo_out_reserve.exit177
+  %.8.i.i183 = phi i32 [ %.5.i.i199, %check.i.i198 ], [ %.2.i.i180, %grammo_out_reserve.exit177 ]
+  %.9.i.i184 = icmp sgt i32 %.8.i.i183, 0
+  br i1 %.9.i.i184, label %flush.i185, label %grammo_out_sync.exit200
+
+flush.i185:                                       ; preds = %grammo_out_interactive.exit.i182
+  %.2.i1.i186 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i187 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i188
+
+loop.i.i188:                                      ; preds = %body.i.i192, %flush.i185
+  %written.i.i189 = phi i64 [ 0, %flush.i185 ], [ %.10.i.i196, %body.i.i192 ]
+  %.5.i3.i190 = icmp slt i64 %written.i.i189, %.3.i2.i187
+  br i1 %.5.i3.i190, label %body.i.i192, label %grammo_out_flush.exit.i191
+
+body.i.i192:                                      ; preds = %loop.i.i188
+  %.7.i.i193 = getelementptr i8, ptr %.2.i1.i186, i64 %written.i.i189
+  %.8.i4.i194 = sub i64 %.3.i2.i187, %written.i.i189
+  %.9.i5.i195 = tail call i64 @write(i32 1, ptr %.7.i.i193, i64 %.8.i4.i194)
+  %.10.i.i196 = add i64 %.9.i5.i195, %written.i.i189
+  %.11.i.i197 = icmp sgt i64 %.9.i5.i195, 0
+  br i1 %.11.i.i197, label %loop.i.i188, label %grammo_out_flush.exit.i191
+
+grammo_out_flush.exit.i191:                       ; preds = %body.i.i192, %loop.i.i188
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit200
+
+grammo_out_sync.exit200:                          ; preds = %grammo_out_interactive.exit.i182, %grammo_out_flush.exit.i191
+  call fastcc void @grammo_in_read_int(ptr %m_a)
+  %.4.i201 = load i64, ptr @grammo_out_len, align 8
+  %.5.i202 = add i64 %.4.i201, 10
+  %.6.b.i203 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i204 = select i1 %.6.b.i203, i64 65536, i64 0
+  %.7.not.i205 = icmp ugt i64 %.5.i202, %.6.i204
+  %.20.pre1.i206 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i205, label %loop.i.i210, label %grammo_out_reserve.exit224
+
+loop.i.i210:                                      ; preds = %grammo_out_sync.exit200, %body.i.i218
+  %written.i.i211 = phi i64 [ %.10.i.i222, %body.i.i218 ], [ 0, %grammo_out_sync.exit200 ]
+  %.5.i.i212 = icmp slt i64 %written.i.i211, %.4.i201
+  br i1 %.5.i.i212, label %body.i.i218, label %grammo_out_flush.exit.i213
+
+body.i.i218:                                      ; preds = %loop.i.i210
+  %.7.i.i219 = getelementptr i8, ptr %.20.pre1.i206, i64 %written.i.i211
+  %.8.i.i220 = sub i64 %.4.i201, %written.i.i211
+  %.9.i.i221 = tail call i64 @write(i32 1, ptr %.7.i.i219, i64 %.8.i.i220)
+  %.10.i.i222 = add i64 %.9.i.i221, %written.i.i211
+  %.11.i.i223 = icmp sgt i64 %.9.i.i221, 0
+  br i1 %.11.i.i223, label %loop.i.i210, label %grammo_out_flush.exit.i213
+
+grammo_out_flush.exit.i213:                       ; preds = %body.i.i218, %loop.i.i210
+  %.10.b.i214 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i215 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i214, label %grammo_out_reserve.exit224, label %grow.i216
+
+grow.i216:                                        ; preds = %grammo_out_flush.exit.i213
+  %.16.i217 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i215, i64 65536)
+  store ptr %.16.i217, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit224
+
+grammo_out_reserve.exit224:                       ; preds = %grammo_out_sync.exit200, %grammo_out_flush.exit.i213, %grow.i216
+  %.7.i225 = phi i64 [ 0, %grow.i216 ], [ 0, %grammo_out_flush.exit.i213 ], [ %.4.i201, %grammo_out_sync.exit200 ]
+  %.20.i208 = phi ptr [ %.16.i217, %grow.i216 ], [ %.20.pre.i215, %grammo_out_flush.exit.i213 ], [ %.20.pre1.i206, %grammo_out_sync.exit200 ]
+  %.22.i209 = getelementptr i8, ptr %.20.i208, i64 %.7.i225
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(10) %.22.i209, ptr noundef nonnull align 1 dereferenceable(10) @str_5, i64 10, i1 false)
+  %.8.i226 = add nsw i64 %.7.i225, 9
+  store i64 %.8.i226, ptr @grammo_out_len, align 8
+  %.2.i.i227 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i228 = icmp slt i32 %.2.i.i227, 0
+  br i1 %.3.i.i228, label %check.i.i245, label %grammo_out_interactive.exit.i229
+
+check.i.i245:                                     ; preds = %grammo_out_reserve.exit224
+  %.5.i.i246 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i246, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i229
+
+grammo_out_interactive.exit.i229:                 ; preds = %check.i.i245, %grammo_out_reserve.exit224
+  %.8.i.i230 = phi i32 [ %.5.i.i246, %check.i.i245 ], [ %.2.i.i227, %grammo_out_reserve.exit224 ]
+  %.9.i.i231 = icmp sgt i32 %.8.i.i230, 0
+  br i1 %.9.i.i231, label %flush.i232, label %grammo_out_sync.exit247
+
+flush.i232:                                       ; preds = %grammo_out_interactive.exit.i229
+  %.2.i1.i233 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i234 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i235
+
+loop.i.i235:                                      ; preds = %body.i.i239, %flush.i232
+  %written.i.i236 = phi i64 [ 0, %flush.i232 ], [ %.10.i.i243, %body.i.i239 ]
+  %.5.i3.i237 = icmp slt i64 %written.i.i236, %.3.i2.i234
+  br i1 %.5.i3.i237, label %body.i.i239, label %grammo_out_flush.exit.i238
+
+body.i.i239:                                      ; preds = %loop.i.i235
+  %.7.i.i240 = getelementptr i8, ptr %.2.i1.i233, i64 %written.i.i236
+  %.8.i4.i241 = sub i64 %.3.i2.i234, %written.i.i236
+  %.9.i5.i242 = tail call i64 @write(i32 1, ptr %.7.i.i240, i64 %.8.i4.i241)
+  %.10.i.i243 = add i64 %.9.i5.i242, %written.i.i236
+  %.11.i.i244 = icmp sgt i64 %.9.i5.i242, 0
+  br i1 %.11.i.i244, label %loop.i.i235, label %grammo_out_flush.exit.i238
+
+grammo_out_flush.exit.i238:                       ; preds = %body.i.i239, %loop.i.i235
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit247
+
+grammo_out_sync.exit247:                          ; preds = %grammo_out_interactive.exit.i229, %grammo_out_flush.exit.i238
+  call fastcc void @grammo_in_read_int(ptr %m_b)
   %load_m_a = load i32, ptr %m_a, align 4
   %load_m_b = load i32, ptr %m_b, align 4
-  %gd_y.0.i = call i32 @llvm.abs.i32(i32 %load_m_b, i1 false)
-  %.20.i = icmp eq i32 %load_m_a, 0
-  br i1 %.20.i, label %gcd.exit, label %next_branch.i
+  %gd_y.0.i = tail call i32 @llvm.abs.i32(i32 %load_m_b, i1 false)
+  %.20.i248 = icmp eq i32 %load_m_a, 0
+  br i1 %.20.i248, label %g.gcd.exit, label %next_branch.i
 
-next_branch.i:                                    ; preds = %if_merge
-  %spec.select.i = call i32 @llvm.abs.i32(i32 %load_m_a, i1 false)
-  %.22.i = icmp eq i32 %load_m_b, 0
+next_branch.i:                                    ; preds = %grammo_out_sync.exit247
+  %spec.select.i = tail call i32 @llvm.abs.i32(i32 %load_m_a, i1 false)
+  %.22.i249 = icmp eq i32 %load_m_b, 0
   %.26.not16.i = icmp eq i32 %spec.select.i, %gd_y.0.i
-  %or.cond.i = or i1 %.22.i, %.26.not16.i
-  br i1 %or.cond.i, label %gcd.exit, label %while_body.i4
+  %or.cond.i = or i1 %.22.i249, %.26.not16.i
+  br i1 %or.cond.i, label %g.gcd.exit, label %while_body.i250
 
-while_body.i4:                                    ; preds = %next_branch.i, %while_body.i4
-  %gd_y.118.i = phi i32 [ %gd_y.2.i, %while_body.i4 ], [ %gd_y.0.i, %next_branch.i ]
-  %gd_x.117.i = phi i32 [ %gd_x.2.i, %while_body.i4 ], [ %spec.select.i, %next_branch.i ]
+while_body.i250:                                  ; preds = %next_branch.i, %while_body.i250
+  %gd_y.118.i = phi i32 [ %gd_y.2.i, %while_body.i250 ], [ %gd_y.0.i, %next_branch.i ]
+  %gd_x.117.i = phi i32 [ %gd_x.2.i, %while_body.i250 ], [ %spec.select.i, %next_branch.i ]
   %.28.i = icmp sgt i32 %gd_x.117.i, %gd_y.118.i
   %.29.i = select i1 %.28.i, i32 %gd_y.118.i, i32 0
   %gd_x.2.i = sub i32 %gd_x.117.i, %.29.i
   %.31.i = select i1 %.28.i, i32 0, i32 %gd_x.117.i
   %gd_y.2.i = sub i32 %gd_y.118.i, %.31.i
   %.26.not.i = icmp eq i32 %gd_x.2.i, %gd_y.2.i
-  br i1 %.26.not.i, label %gcd.exit, label %while_body.i4
+  br i1 %.26.not.i, label %g.gcd.exit, label %while_body.i250
+
+g.gcd.exit:                                       ; preds = %while_body.i250, %grammo_out_sync.exit247, %next_branch.i
+  %common.ret.op.i251 = phi i32 [ %gd_y.0.i, %grammo_out_sync.exit247 ], [ %spec.select.i, %next_branch.i ], [ %gd_x.2.i, %while_body.i250 ]
+  %.4.i252 = load i64, ptr @grammo_out_len, align 8
+  %.5.i253 = add i64 %.4.i252, 22
+  %.6.b.i254 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i255 = select i1 %.6.b.i254, i64 65536, i64 0
+  %.7.not.i256 = icmp ugt i64 %.5.i253, %.6.i255
+  %.20.pre1.i257 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i256, label %loop.i.i261, label %grammo_out_reserve.exit275
+
+loop.i.i261:                                      ; preds = %g.gcd.exit, %body.i.i269
+  %written.i.i262 = phi i64 [ %.10.i.i273, %body.i.i269 ], [ 0, %g.gcd.exit ]
+  %.5.i.i263 = icmp slt i64 %written.i.i262, %.4.i252
+  br i1 %.5.i.i263, label %body.i.i269, label %grammo_out_flush.exit.i264
+
+body.i.i269:                                      ; preds = %loop.i.i261
+  %.7.i.i270 = getelementptr i8, ptr %.20.pre1.i257, i64 %written.i.i262
+  %.8.i.i271 = sub i64 %.4.i252, %written.i.i262
+  %.9.i.i272 = tail call i64 @write(i32 1, ptr %.7.i.i270, i64 %.8.i.i271)
+  %.10.i.i273 = add i64 %.9.i.i272, %written.i.i262
+  %.11.i.i274 = icmp sgt i64 %.9.i.i272, 0
+  br i1 %.11.i.i274, label %loop.i.i261, label %grammo_out_flush.exit.i264
+
+grammo_out_flush.exit.i264:                       ; preds = %body.i.i269, %loop.i.i261
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i265 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i266 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i265, label %grammo_out_reserve.exit275, label %grow.i267
+
+grow.i267:                                        ; preds = %grammo_out_flush.exit.i264
+  %.16.i268 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i266, i64 65536)
+  store ptr %.16.i268, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit275
+
+grammo_out_reserve.exit275:                       ; preds = %g.gcd.exit, %grammo_out_flush.exit.i264, %grow.i267
+  %.21.i258 = phi i64 [ 0, %grow.i267 ], [ 0, %grammo_out_flush.exit.i264 ], [ %.4.i252, %g.gcd.exit ]
+  %.20.i259 = phi ptr [ %.16.i268, %grow.i267 ], [ %.20.pre.i266, %grammo_out_flush.exit.i264 ], [ %.20.pre1.i257, %g.gcd.exit ]
+  %.22.i260 = getelementptr i8, ptr %.20.i259, i64 %.21.i258
+  %.53 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i260, i64 22, ptr nonnull @str_6, i32 %common.ret.op.i251)
+  %0 = tail call i32 @llvm.smax.i32(i32 %.53, i32 0)
+  %.6.i276 = zext nneg i32 %0 to i64
+  %.7.i277 = load i64, ptr @grammo_out_len, align 8
+  %.8.i278 = add i64 %.7.i277, %.6.i276
+  store i64 %.8.i278, ptr @grammo_out_len, align 8
+  %.2.i.i279 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i280 = icmp slt i32 %.2.i.i279, 0
+  br i1 %.3.i.i280, label %check.i.i297, label %grammo_out_interactive.exit.i281
+
+check.i.i297:                                     ; preds = %grammo_out_reserve.exit275
+  %.5.i.i298 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i298, ptr @grammo_out_tty, align 4
+  %.3.i.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i281
+
+grammo_out_interactive.exit.i281:                 ; preds = %check.i.i297, %grammo_out_reserve.exit275
+  %.3.i.pre = phi i64 [ %.3.i.pre.pre, %check.i.i297 ], [ %.8.i278, %grammo_out_reserve.exit275 ]
+  %.8.i.i282 = phi i32 [ %.5.i.i298, %check.i.i297 ], [ %.2.i.i279, %grammo_out_reserve.exit275 ]
+  %.9.i.i283 = icmp sgt i32 %.8.i.i282, 0
+  %.2.i.pre310 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i283, label %loop.i.i287, label %grammo_out_advance.exit299
+
+loop.i.i287:                                      ; preds = %grammo_out_interactive.exit.i281, %body.i.i291
+  %written.i.i288 = phi i64 [ %.10.i.i295, %body.i.i291 ], [ 0, %grammo_out_interactive.exit.i281 ]
+  %.5.i3.i289 = icmp slt i64 %written.i.i288, %.3.i.pre
+  br i1 %.5.i3.i289, label %body.i.i291, label %grammo_out_flush.exit.i290
+
+body.i.i291:                                      ; preds = %loop.i.i287
+  %.7.i.i292 = getelementptr i8, ptr %.2.i.pre310, i64 %written.i.i288
+  %.8.i4.i293 = sub i64 %.3.i.pre, %written.i.i288
+  %.9.i5.i294 = tail call i64 @write(i32 1, ptr %.7.i.i292, i64 %.8.i4.i293)
+  %.10.i.i295 = add i64 %.9.i5.i294, %written.i.i288
+  %.11.i.i296 = icmp sgt i64 %.9.i5.i294, 0
+  br i1 %.11.i.i296, label %loop.i.i287, label %grammo_out_flush.exit.i290
+
+grammo_out_flush.exit.i290:                       ; preds = %body.i.i291, %loop.i.i287
+  store i64 0, ptr @grammo_out_len, align 8
+  %.2.i.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit299
+
+grammo_out_advance.exit299:                       ; preds = %grammo_out_interactive.exit.i281, %grammo_out_flush.exit.i290
+  %.3.i = phi i64 [ %.3.i.pre, %grammo_out_interactive.exit.i281 ], [ 0, %grammo_out_flush.exit.i290 ]
+  %.2.i = phi ptr [ %.2.i.pre310, %grammo_out_interactive.exit.i281 ], [ %.2.i.pre, %grammo_out_flush.exit.i290 ]
+  br label %loop.i
+
+loop.i:                                           ; preds = %body.i, %grammo_out_advance.exit299
+  %written.i = phi i64 [ 0, %grammo_out_advance.exit299 ], [ %.10.i303, %body.i ]
+  %.5.i300 = icmp slt i64 %written.i, %.3.i
+  br i1 %.5.i300, label %body.i, label %grammo_out_flush.exit
+
+body.i:                                           ; preds = %loop.i
+  %.7.i301 = getelementptr i8, ptr %.2.i, i64 %written.i
+  %.8.i302 = sub i64 %.3.i, %written.i
+  %.9.i = tail call i64 @write(i32 1, ptr %.7.i301, i64 %.8.i302)
+  %.10.i303 = add i64 %.9.i, %written.i
+  %.11.i = icmp sgt i64 %.9.i, 0
+  br i1 %.11.i, label %loop.i, label %grammo_out_flush.exit
+
+grammo_out_flush.exit:                            ; preds = %loop.i, %body.i
+  store i64 0, ptr @grammo_out_len, align 8
+  ret void
+}
 
-gcd.exit:                                         ; preds = %while_body.i4, %if_merge, %next_branch.i
-  %common.ret.op.i5 = phi i32 [ %gd_y.0.i, %if_merge ], [ %spec.select.i, %next_branch.i ], [ %gd_x.2.i, %while_body.i4 ]
-  %.49 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_9)
-  %.51 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_4, i32 %common.ret.op.i5)
-  %putchar3 = call i32 @putchar(i32 10)
+; Function Attrs: nounwind
+define internal fastcc void @grammo_in_read_int(ptr nocapture nonnull writeonly %target) unnamed_addr #2 {
+entry:
+  %.3.pre.i = load i64, ptr @grammo_in_pos, align 8
+  %.4.pre.i = load i64, ptr @grammo_in_end, align 8
+  %.9.i.pre30 = load ptr, ptr @grammo_in_buf, align 8
+  br label %skip.i.outer
+
+skip.i.outer:                                     ; preds = %grammo_in_fill.exit.i, %entry
+  %.9.i.ph = phi ptr [ %.9.i.pre, %grammo_in_fill.exit.i ], [ %.9.i.pre30, %entry ]
+  %.4.i.ph = phi i64 [ %.33.i.i, %grammo_in_fill.exit.i ], [ %.4.pre.i, %entry ]
+  %.3.i.ph = phi i64 [ 0, %grammo_in_fill.exit.i ], [ %.3.pre.i, %entry ]
+  br label %skip.i
+
+skip.i:                                           ; preds = %skip.i.outer, %skip_next.i
+  %.3.i = phi i64 [ %.19.i, %skip_next.i ], [ %.3.i.ph, %skip.i.outer ]
+  %.5.i = icmp ult i64 %.3.i, %.4.i.ph
+  br i1 %.5.i, label %skip_test.i, label %skip_fill.i
+
+skip_fill.i:                                      ; preds = %skip.i
+  %.3.i.i = icmp eq ptr %.9.i.ph, null
+  br i1 %.3.i.i, label %alloc.i.i, label %entry.check_full_crit_edge.i.i
+
+entry.check_full_crit_edge.i.i:                   ; preds = %skip_fill.i
+  %.12.pre.i.i = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i.i
+
+alloc.i.i:                                        ; preds = %skip_fill.i
+  %.5.i.i = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i.i, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i.i
+
+check_full.i.i:                                   ; preds = %alloc.i.i, %entry.check_full_crit_edge.i.i
+  %.17.i.i = phi ptr [ %.9.i.ph, %entry.check_full_crit_edge.i.i ], [ %.5.i.i, %alloc.i.i ]
+  %.12.i.i = phi i64 [ %.12.pre.i.i, %entry.check_full_crit_edge.i.i ], [ 65536, %alloc.i.i ]
+  %.11.i.i = sub i64 %.4.i.ph, %.3.i
+  %.13.i.i = icmp eq i64 %.11.i.i, %.12.i.i
+  br i1 %.13.i.i, label %grow.i.i, label %grammo_in_fill.exit.i
+
+grow.i.i:                                         ; preds = %check_full.i.i
+  %.16.i.i = shl i64 %.12.i.i, 1
+  %.18.i.i = or disjoint i64 %.16.i.i, 1
+  %.19.i.i = tail call ptr @realloc(ptr %.17.i.i, i64 %.18.i.i)
+  store ptr %.19.i.i, ptr @grammo_in_buf, align 8
+  store i64 %.16.i.i, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit.i
+
+grammo_in_fill.exit.i:                            ; preds = %grow.i.i, %check_full.i.i
+  %.28.i.i = phi i64 [ %.16.i.i, %grow.i.i ], [ %.12.i.i, %check_full.i.i ]
+  %.23.i.i = phi ptr [ %.19.i.i, %grow.i.i ], [ %.17.i.i, %check_full.i.i ]
+  %.25.i.i = getelementptr i8, ptr %.23.i.i, i64 %.3.i
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i.i, ptr align 1 %.25.i.i, i64 %.11.i.i, i1 false)
+  %.27.i.i = getelementptr i8, ptr %.23.i.i, i64 %.11.i.i
+  %.29.i.i = sub i64 %.28.i.i, %.11.i.i
+  %.30.i.i = tail call i64 @read(i32 0, ptr %.27.i.i, i64 %.29.i.i)
+  %.31.i.i = icmp sgt i64 %.30.i.i, 0
+  %.32.i.i = tail call i64 @llvm.smax.i64(i64 %.30.i.i, i64 0)
+  %.33.i.i = add i64 %.32.i.i, %.11.i.i
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i.i, ptr @grammo_in_end, align 8
+  %.36.i.i = getelementptr i8, ptr %.23.i.i, i64 %.33.i.i
+  store i8 0, ptr %.36.i.i, align 1
+  %.9.i.pre = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.31.i.i, label %skip.i.outer, label %grammo_in_token.exit
+
+skip_test.i:                                      ; preds = %skip.i
+  %.11.i = getelementptr i8, ptr %.9.i.ph, i64 %.3.i
+  %.12.i = load i8, ptr %.11.i, align 1
+  switch i8 %.12.i, label %scan.outer.i [
+    i8 32, label %skip_next.i
+    i8 13, label %skip_next.i
+    i8 12, label %skip_next.i
+    i8 11, label %skip_next.i
+    i8 10, label %skip_next.i
+    i8 9, label %skip_next.i
+  ]
+
+skip_next.i:                                      ; preds = %skip_test.i, %skip_test.i, %skip_test.i, %skip_test.i, %skip_test.i, %skip_test.i
+  %.19.i = add nuw i64 %.3.i, 1
+  store i64 %.19.i, ptr @grammo_in_pos, align 8
+  br label %skip.i
+
+scan.i:                                           ; preds = %grammo_in_fill.exit28.i.peel, %grammo_in_fill.exit28.i
+  %.24.i = phi i64 [ %.33.i20.i, %grammo_in_fill.exit28.i ], [ %.33.i20.i.peel, %grammo_in_fill.exit28.i.peel ]
+  %.25.i = icmp ult i64 %length.ph.i, %.24.i
+  %.27.i.pre = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.25.i, label %scan_test.i, label %scan_fill.i
+
+scan_test.i:                                      ; preds = %scan.i, %scan.outer.i
+  %.27.i = phi ptr [ %.27.i34, %scan.outer.i ], [ %.27.i.pre, %scan.i ]
+  %.24.i.lcssa = phi i64 [ %.2444.i, %scan.outer.i ], [ %.24.i, %scan.i ]
+  %.22.i.lcssa = phi i64 [ %.2242.i, %scan.outer.i ], [ 0, %scan.i ]
+  %.23.i.lcssa = phi i64 [ %.23.i.peel, %scan.outer.i ], [ %length.ph.i, %scan.i ]
+  %.28.i = getelementptr i8, ptr %.27.i, i64 %.23.i.lcssa
+  %.29.i = load i8, ptr %.28.i, align 1
+  switch i8 %.29.i, label %scan_next.i [
+    i8 32, label %grammo_in_token.exit
+    i8 13, label %grammo_in_token.exit
+    i8 12, label %grammo_in_token.exit
+    i8 11, label %grammo_in_token.exit
+    i8 10, label %grammo_in_token.exit
+    i8 9, label %grammo_in_token.exit
+  ]
+
+scan_next.i:                                      ; preds = %scan_test.i
+  %.35.i = add i64 %length.ph.i, 1
+  br label %scan.outer.i
+
+scan.outer.i:                                     ; preds = %skip_test.i, %scan_next.i
+  %.27.i34 = phi ptr [ %.27.i, %scan_next.i ], [ %.9.i.ph, %skip_test.i ]
+  %.2444.i = phi i64 [ %.24.i.lcssa, %scan_next.i ], [ %.4.i.ph, %skip_test.i ]
+  %.2242.i = phi i64 [ %.22.i.lcssa, %scan_next.i ], [ %.3.i, %skip_test.i ]
+  %length.ph.i = phi i64 [ %.35.i, %scan_next.i ], [ 1, %skip_test.i ]
+  %.23.i.peel = add i64 %.2242.i, %length.ph.i
+  %.25.i.peel = icmp ult i64 %.23.i.peel, %.2444.i
+  br i1 %.25.i.peel, label %scan_test.i, label %check_full.i5.i.peel
+
+check_full.i5.i.peel:                             ; preds = %scan.outer.i
+  %.12.pre.i4.i.peel = load i64, ptr @grammo_in_cap, align 8
+  %.11.i10.i.peel = sub i64 %.2444.i, %.2242.i
+  %.13.i11.i.peel = icmp eq i64 %.11.i10.i.peel, %.12.pre.i4.i.peel
+  br i1 %.13.i11.i.peel, label %grow.i22.i.peel, label %grammo_in_fill.exit28.i.peel
+
+grow.i22.i.peel:                                  ; preds = %check_full.i5.i.peel
+  %.16.i23.i.peel = shl i64 %.12.pre.i4.i.peel, 1
+  %.18.i24.i.peel = or disjoint i64 %.16.i23.i.peel, 1
+  %.19.i25.i.peel = tail call ptr @realloc(ptr nonnull %.27.i34, i64 %.18.i24.i.peel)
+  store ptr %.19.i25.i.peel, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23.i.peel, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28.i.peel
+
+grammo_in_fill.exit28.i.peel:                     ; preds = %grow.i22.i.peel, %check_full.i5.i.peel
+  %.28.i12.i.peel = phi i64 [ %.16.i23.i.peel, %grow.i22.i.peel ], [ %.12.pre.i4.i.peel, %check_full.i5.i.peel ]
+  %.23.i13.i.peel = phi ptr [ %.19.i25.i.peel, %grow.i22.i.peel ], [ %.27.i34, %check_full.i5.i.peel ]
+  %.25.i14.i.peel = getelementptr i8, ptr %.23.i13.i.peel, i64 %.2242.i
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i13.i.peel, ptr align 1 %.25.i14.i.peel, i64 %.11.i10.i.peel, i1 false)
+  %.27.i15.i.peel = getelementptr i8, ptr %.23.i13.i.peel, i64 %.11.i10.i.peel
+  %.29.i16.i.peel = sub i64 %.28.i12.i.peel, %.11.i10.i.peel
+  %.30.i17.i.peel = tail call i64 @read(i32 0, ptr %.27.i15.i.peel, i64 %.29.i16.i.peel)
+  %.31.i18.i.peel = icmp sgt i64 %.30.i17.i.peel, 0
+  %.32.i19.i.peel = tail call i64 @llvm.smax.i64(i64 %.30.i17.i.peel, i64 0)
+  %.33.i20.i.peel = add i64 %.32.i19.i.peel, %.11.i10.i.peel
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20.i.peel, ptr @grammo_in_end, align 8
+  %.36.i21.i.peel = getelementptr i8, ptr %.23.i13.i.peel, i64 %.33.i20.i.peel
+  store i8 0, ptr %.36.i21.i.peel, align 1
+  br i1 %.31.i18.i.peel, label %scan.i, label %grammo_in_token.exit.loopexit
+
+scan_fill.i:                                      ; preds = %scan.i
+  %.3.i2.i = icmp eq ptr %.27.i.pre, null
+  br i1 %.3.i2.i, label %alloc.i26.i, label %entry.check_full_crit_edge.i3.i
+
+entry.check_full_crit_edge.i3.i:                  ; preds = %scan_fill.i
+  %.12.pre.i4.i = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.i
+
+alloc.i26.i:                                      ; preds = %scan_fill.i
+  %.5.i27.i = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i27.i, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.i
+
+check_full.i5.i:                                  ; preds = %alloc.i26.i, %entry.check_full_crit_edge.i3.i
+  %.17.i6.i = phi ptr [ %.27.i.pre, %entry.check_full_crit_edge.i3.i ], [ %.5.i27.i, %alloc.i26.i ]
+  %.12.i7.i = phi i64 [ %.12.pre.i4.i, %entry.check_full_crit_edge.i3.i ], [ 65536, %alloc.i26.i ]
+  %.13.i11.i = icmp eq i64 %.24.i, %.12.i7.i
+  br i1 %.13.i11.i, label %grow.i22.i, label %grammo_in_fill.exit28.i
+
+grow.i22.i:                                       ; preds = %check_full.i5.i
+  %.16.i23.i = shl i64 %.24.i, 1
+  %.18.i24.i = or disjoint i64 %.16.i23.i, 1
+  %.19.i25.i = tail call ptr @realloc(ptr %.17.i6.i, i64 %.18.i24.i)
+  store ptr %.19.i25.i, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23.i, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28.i
+
+grammo_in_fill.exit28.i:                          ; preds = %grow.i22.i, %check_full.i5.i
+  %.28.i12.i = phi i64 [ %.16.i23.i, %grow.i22.i ], [ %.12.i7.i, %check_full.i5.i ]
+  %.23.i13.i = phi ptr [ %.19.i25.i, %grow.i22.i ], [ %.17.i6.i, %check_full.i5.i ]
+  %.27.i15.i = getelementptr i8, ptr %.23.i13.i, i64 %.24.i
+  %.29.i16.i = sub i64 %.28.i12.i, %.24.i
+  %.30.i17.i = tail call i64 @read(i32 0, ptr %.27.i15.i, i64 %.29.i16.i)
+  %.31.i18.i = icmp sgt i64 %.30.i17.i, 0
+  %.32.i19.i = tail call i64 @llvm.smax.i64(i64 %.30.i17.i, i64 0)
+  %.33.i20.i = add i64 %.32.i19.i, %.24.i
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20.i, ptr @grammo_in_end, align 8
+  %.36.i21.i = getelementptr i8, ptr %.23.i13.i, i64 %.33.i20.i
+  store i8 0, ptr %.36.i21.i, align 1
+  br i1 %.31.i18.i, label %scan.i, label %grammo_in_token.exit.loopexit, !llvm.loop !0
+
+grammo_in_token.exit.loopexit:                    ; preds = %grammo_in_fill.exit28.i.peel, %grammo_in_fill.exit28.i
+  %.4.pre = load ptr, ptr @grammo_in_buf, align 8
+  br label %grammo_in_token.exit
+
+grammo_in_token.exit:                             ; preds = %grammo_in_fill.exit.i, %scan_test.i, %scan_test.i, %scan_test.i, %scan_test.i, %scan_test.i, %scan_test.i, %grammo_in_token.exit.loopexit
+  %.4 = phi ptr [ %.4.pre, %grammo_in_token.exit.loopexit ], [ %.27.i, %scan_test.i ], [ %.27.i, %scan_test.i ], [ %.27.i, %scan_test.i ], [ %.27.i, %scan_test.i ], [ %.27.i, %scan_test.i ], [ %.27.i, %scan_test.i ], [ %.9.i.pre, %grammo_in_fill.exit.i ]
+  %common.ret.op.i = phi i64 [ %length.ph.i, %grammo_in_token.exit.loopexit ], [ %length.ph.i, %scan_test.i ], [ %length.ph.i, %scan_test.i ], [ %length.ph.i, %scan_test.i ], [ %length.ph.i, %scan_test.i ], [ %length.ph.i, %scan_test.i ], [ %length.ph.i, %scan_test.i ], [ 0, %grammo_in_fill.exit.i ]
+  %.5 = load i64, ptr @grammo_in_pos, align 8
+  %.6 = getelementptr i8, ptr %.4, i64 %.5
+  %.7 = load i8, ptr %.6, align 1
+  %.8 = icmp eq i8 %.7, 45
+  %.9 = icmp eq i8 %.7, 43
+  %.10 = or i1 %.8, %.9
+  %.11 = zext i1 %.10 to i64
+  %.139 = icmp ugt i64 %common.ret.op.i, %.11
+  %.1410 = getelementptr i8, ptr %.6, i64 %.11
+  %.1511 = load i8, ptr %.1410, align 1
+  %.1612 = add i8 %.1511, -48
+  %.1713 = icmp ult i8 %.1612, 10
+  %.1814 = and i1 %.139, %.1713
+  br i1 %.1814, label %digit, label %common.ret
+
+digit:                                            ; preds = %grammo_in_token.exit, %digit
+  %.1617 = phi i8 [ %.16, %digit ], [ %.1612, %grammo_in_token.exit ]
+  %value16 = phi i32 [ %.23, %digit ], [ 0, %grammo_in_token.exit ]
+  %i15 = phi i64 [ %.20, %digit ], [ %.11, %grammo_in_token.exit ]
+  %.20 = add nuw i64 %i15, 1
+  %.21 = mul i32 %value16, 10
+  %.22 = zext nneg i8 %.1617 to i32
+  %.23 = add i32 %.21, %.22
+  %.13 = icmp ult i64 %.20, %common.ret.op.i
+  %.14 = getelementptr i8, ptr %.6, i64 %.20
+  %.15 = load i8, ptr %.14, align 1
+  %.16 = add i8 %.15, -48
+  %.17 = icmp ult i8 %.16, 10
+  %.18 = and i1 %.13, %.17
+  br i1 %.18, label %digit, label %end_digits
+
+end_digits:                                       ; preds = %digit
+  %.25.not = icmp ult i64 %i15, %.11
+  br i1 %.25.not, label %common.ret, label %store
+
+common.ret:                                       ; preds = %grammo_in_token.exit, %end_digits, %store
   ret void
+
+store:                                            ; preds = %end_digits
+  %.27 = sub i32 0, %.23
+  %.28 = select i1 %.8, i32 %.27, i32 %.23
+  store i32 %.28, ptr %target, align 4
+  %.31 = add i64 %.20, %.5
+  store i64 %.31, ptr @grammo_in_pos, align 8
+  br label %common.ret
 }
 
-; Function Attrs: nofree nounwind
-declare noundef i32 @putchar(i32 noundef) local_unnamed_addr #0
+; Function Attrs: nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memcpy.p0.p0.i64(ptr noalias nocapture writeonly, ptr noalias nocapture readonly, i64, i1 immarg) #5
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i64 @llvm.smax.i64(i64, i64) #6
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i32 @llvm.smax.i32(i32, i32) #6
 
 ; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
-declare i32 @llvm.abs.i32(i32, i1 immarg) #2
+declare i32 @llvm.abs.i32(i32, i1 immarg) #6
 
 attributes #0 = { nofree nounwind }
-attributes #1 = { nofree norecurse nosync nounwind memory(none) }
-attributes #2 = { nocallback nofree nosync nounwind speculatable willreturn memory(none) }
+attributes #1 = { mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #2 = { nounwind }
+attributes #3 = { mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #4 = { mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+attributes #5 = { nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+attributes #6 = { nocallback nofree nosync nounwind speculatable willreturn memory(none) }
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.peeled.count", i32 1}
@@ -0,0 +1,1305 @@
+; ModuleID = '<string>'
+source_filename = "<string>"
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-i128:128-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-unknown-linux-gnu"
+
+@g.G_CALLS = internal unnamed_addr global i32 0
+@grammo_out_buf = internal unnamed_addr global ptr null
+@grammo_out_cap = internal unnamed_addr global i1 false
+@grammo_out_len = internal unnamed_addr global i64 0
+@grammo_out_tty = internal unnamed_addr global i32 -1
+@str_0 = private constant [13 x i8] c"  check(%d)\0A\00"
+@str_1 = private unnamed_addr constant [23 x i8] c"false && check(true):\0A\00"
+@str_2 = private constant [16 x i8] c"  risultato=%d\0A\00"
+@str_3 = private unnamed_addr constant [23 x i8] c"true || check(false):\0A\00"
+@str_4 = private unnamed_addr constant [45 x i8] c"check(true) && check(false) || check(true):\0A\00"
+@str_5 = private unnamed_addr constant [19 x i8] c"Numeratore (int): \00"
+@grammo_in_buf = internal unnamed_addr global ptr null
+@grammo_in_cap = internal unnamed_addr global i64 0
+@grammo_in_pos = internal unnamed_addr global i64 0
+@grammo_in_end = internal unnamed_addr global i64 0
+@str_6 = private unnamed_addr constant [30 x i8] c"Denominatore (int, anche 0): \00"
+@str_7 = private unnamed_addr constant [31 x i8] c"Il rapporto e' maggiore di 2.\0A\00"
+@str_8 = private unnamed_addr constant [37 x i8] c"Denominatore nullo o rapporto <= 2.\0A\00"
+@str_9 = private constant [22 x i8] c"Chiamate a check: %d\0A\00"
+
+; Function Attrs: nofree nounwind
+declare noundef i32 @snprintf(ptr noalias nocapture noundef writeonly, i64 noundef, ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+
+; Function Attrs: mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite)
+declare noalias noundef ptr @realloc(ptr allocptr nocapture, i64 noundef) local_unnamed_addr #1
+
+; Function Attrs: nofree nounwind
+declare noundef i64 @write(i32 noundef, ptr nocapture noundef readonly, i64 noundef) local_unnamed_addr #0
+
+; Function Attrs: nounwind
+declare i32 @isatty(i32) local_unnamed_addr #2
+
+; Function Attrs: mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite)
+declare noalias noundef ptr @malloc(i64 noundef) local_unnamed_addr #3
+
+; Function Attrs: nofree nounwind
+declare noundef i64 @read(i32 noundef, ptr nocapture noundef, i64 noundef) local_unnamed_addr #0
+
+; Function Attrs: mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memmove.p0.p0.i64(ptr nocapture writeonly, ptr nocapture readonly, i64, i1 immarg) #4
+
+; Function Attrs: nounwind
+define internal fastcc i1 @g.check(i1 returned %ck_val) unnamed_addr #2 {
+entry:
+  %.4 = zext i1 %ck_val to i32
+  %.4.i = load i64, ptr @grammo_out_len, align 8
+  %.5.i = add i64 %.4.i, 12
+  %.6.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i = select i1 %.6.b.i, i64 65536, i64 0
+  %.7.not.i = icmp ugt i64 %.5.i, %.6.i
+  %.20.pre1.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i, label %loop.i.i, label %grammo_out_reserve.exit
+
+loop.i.i:                                         ; preds = %entry, %body.i.i
+  %written.i.i = phi i64 [ %.10.i.i, %body.i.i ], [ 0, %entry ]
+  %.5.i.i = icmp slt i64 %written.i.i, %.4.i
+  br i1 %.5.i.i, label %body.i.i, label %grammo_out_flush.exit.i
+
+body.i.i:                                         ; preds = %loop.i.i
+  %.7.i.i = getelementptr i8, ptr %.20.pre1.i, i64 %written.i.i
+  %.8.i.i = sub i64 %.4.i, %written.i.i
+  %.9.i.i = tail call i64 @write(i32 1, ptr %.7.i.i, i64 %.8.i.i)
+  %.10.i.i = add i64 %.9.i.i, %written.i.i
+  %.11.i.i = icmp sgt i64 %.9.i.i, 0
+  br i1 %.11.i.i, label %loop.i.i, label %grammo_out_flush.exit.i
+
+grammo_out_flush.exit.i:                          ; preds = %body.i.i, %loop.i.i
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i, label %grammo_out_reserve.exit, label %grow.i
+
+grow.i:                                           ; preds = %grammo_out_flush.exit.i
+  %.16.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i, i64 65536)
+  store ptr %.16.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit
+
+grammo_out_reserve.exit:                          ; preds = %entry, %grammo_out_flush.exit.i, %grow.i
+  %.21.i = phi i64 [ 0, %grow.i ], [ 0, %grammo_out_flush.exit.i ], [ %.4.i, %entry ]
+  %.20.i = phi ptr [ %.16.i, %grow.i ], [ %.20.pre.i, %grammo_out_flush.exit.i ], [ %.20.pre1.i, %entry ]
+  %.22.i = getelementptr i8, ptr %.20.i, i64 %.21.i
+  %.8 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i, i64 12, ptr nonnull @str_0, i32 %.4)
+  %0 = tail call i32 @llvm.smax.i32(i32 %.8, i32 0)
+  %.6.i1 = zext nneg i32 %0 to i64
+  %.7.i = load i64, ptr @grammo_out_len, align 8
+  %.8.i = add i64 %.7.i, %.6.i1
+  store i64 %.8.i, ptr @grammo_out_len, align 8
+  %.2.i.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i = icmp slt i32 %.2.i.i, 0
+  br i1 %.3.i.i, label %check.i.i, label %grammo_out_interactive.exit.i
+
+check.i.i:                                        ; preds = %grammo_out_reserve.exit
+  %.5.i.i11 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i11, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i
+
+grammo_out_interactive.exit.i:                    ; preds = %check.i.i, %grammo_out_reserve.exit
+  %.8.i.i2 = phi i32 [ %.5.i.i11, %check.i.i ], [ %.2.i.i, %grammo_out_reserve.exit ]
+  %.9.i.i3 = icmp sgt i32 %.8.i.i2, 0
+  br i1 %.9.i.i3, label %flush.i, label %grammo_out_advance.exit
+
+flush.i:                                          ; preds = %grammo_out_interactive.exit.i
+  %.2.i1.i = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i4
+
+loop.i.i4:                                        ; preds = %body.i.i7, %flush.i
+  %written.i.i5 = phi i64 [ 0, %flush.i ], [ %.10.i.i9, %body.i.i7 ]
+  %.5.i3.i = icmp slt i64 %written.i.i5, %.3.i2.i
+  br i1 %.5.i3.i, label %body.i.i7, label %grammo_out_flush.exit.i6
+
+body.i.i7:                                        ; preds = %loop.i.i4
+  %.7.i.i8 = getelementptr i8, ptr %.2.i1.i, i64 %written.i.i5
+  %.8.i4.i = sub i64 %.3.i2.i, %written.i.i5
+  %.9.i5.i = tail call i64 @write(i32 1, ptr %.7.i.i8, i64 %.8.i4.i)
+  %.10.i.i9 = add i64 %.9.i5.i, %written.i.i5
+  %.11.i.i10 = icmp sgt i64 %.9.i5.i, 0
+  br i1 %.11.i.i10, label %loop.i.i4, label %grammo_out_flush.exit.i6
+
+grammo_out_flush.exit.i6:                         ; preds = %body.i.i7, %loop.i.i4
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_advance.exit
+
+grammo_out_advance.exit:                          ; preds = %grammo_out_interactive.exit.i, %grammo_out_flush.exit.i6
+  %load_G_CALLS = load i32, ptr @g.G_CALLS, align 4
+  %.10 = add i32 %load_G_CALLS, 1
+  store i32 %.10, ptr @g.G_CALLS, align 4
+  ret i1 %ck_val
+}
+
+; Function Attrs: nounwind
+define void @main() local_unnamed_addr #2 {
+entry:
+  %m_n = alloca i32, align 4
+  store i32 0, ptr %m_n, align 4
+  %m_d = alloca i32, align 4
+  store i32 0, ptr %m_d, align 4
+  %.4.i = load i64, ptr @grammo_out_len, align 8
+  %.5.i = add i64 %.4.i, 23
+  %.6.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i = select i1 %.6.b.i, i64 65536, i64 0
+  %.7.not.i = icmp ugt i64 %.5.i, %.6.i
+  %.20.pre1.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i, label %loop.i.i, label %grammo_out_reserve.exit
+
+loop.i.i:                                         ; preds = %entry, %body.i.i
+  %written.i.i = phi i64 [ %.10.i.i, %body.i.i ], [ 0, %entry ]
+  %.5.i.i = icmp slt i64 %written.i.i, %.4.i
+  br i1 %.5.i.i, label %body.i.i, label %grammo_out_flush.exit.i
+
+body.i.i:                                         ; preds = %loop.i.i
+  %.7.i.i = getelementptr i8, ptr %.20.pre1.i, i64 %written.i.i
+  %.8.i.i = sub i64 %.4.i, %written.i.i
+  %.9.i.i = tail call i64 @write(i32 1, ptr %.7.i.i, i64 %.8.i.i)
+  %.10.i.i = add i64 %.9.i.i, %written.i.i
+  %.11.i.i = icmp sgt i64 %.9.i.i, 0
+  br i1 %.11.i.i, label %loop.i.i, label %grammo_out_flush.exit.i
+
+grammo_out_flush.exit.i:                          ; preds = %body.i.i, %loop.i.i
+  %.10.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i, label %grammo_out_reserve.exit, label %grow.i
+
+grow.i:                                           ; preds = %grammo_out_flush.exit.i
+  %.16.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i, i64 65536)
+  store ptr %.16.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit
+
+grammo_out_reserve.exit:                          ; preds = %entry, %grammo_out_flush.exit.i, %grow.i
+  %.7.i = phi i64 [ 0, %grow.i ], [ 0, %grammo_out_flush.exit.i ], [ %.4.i, %entry ]
+  %.20.i = phi ptr [ %.16.i, %grow.i ], [ %.20.pre.i, %grammo_out_flush.exit.i ], [ %.20.pre1.i, %entry ]
+  %.22.i = getelementptr i8, ptr %.20.i, i64 %.7.i
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(23) %.22.i, ptr noundef nonnull align 16 dereferenceable(23) @str_1, i64 23, i1 false)
+  %.8.i = add nsw i64 %.7.i, 22
+  store i64 %.8.i, ptr @grammo_out_len, align 8
+  %.2.i.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i = icmp slt i32 %.2.i.i, 0
+  br i1 %.3.i.i, label %check.i.i, label %grammo_out_interactive.exit.i
+
+check.i.i:                                        ; preds = %grammo_out_reserve.exit
+  %.5.i.i10 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i10, ptr @grammo_out_tty, align 4
+  %.4.i11.pre.pre = load i64, ptr @grammo_out_len, align 8
+  %.20.pre1.i16.pre496.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_interactive.exit.i
+
+grammo_out_interactive.exit.i:                    ; preds = %check.i.i, %grammo_out_reserve.exit
+  %.20.pre1.i16.pre496 = phi ptr [ %.20.pre1.i16.pre496.pre, %check.i.i ], [ %.20.i, %grammo_out_reserve.exit ]
+  %.4.i11.pre = phi i64 [ %.4.i11.pre.pre, %check.i.i ], [ %.8.i, %grammo_out_reserve.exit ]
+  %.8.i.i1 = phi i32 [ %.5.i.i10, %check.i.i ], [ %.2.i.i, %grammo_out_reserve.exit ]
+  %.9.i.i2 = icmp sgt i32 %.8.i.i1, 0
+  br i1 %.9.i.i2, label %loop.i.i3, label %grammo_out_advance.exit
+
+loop.i.i3:                                        ; preds = %grammo_out_interactive.exit.i, %body.i.i6
+  %written.i.i4 = phi i64 [ %.10.i.i8, %body.i.i6 ], [ 0, %grammo_out_interactive.exit.i ]
+  %.5.i3.i = icmp slt i64 %written.i.i4, %.4.i11.pre
+  br i1 %.5.i3.i, label %body.i.i6, label %grammo_out_flush.exit.i5
+
+body.i.i6:                                        ; preds = %loop.i.i3
+  %.7.i.i7 = getelementptr i8, ptr %.20.pre1.i16.pre496, i64 %written.i.i4
+  %.8.i4.i = sub i64 %.4.i11.pre, %written.i.i4
+  %.9.i5.i = tail call i64 @write(i32 1, ptr %.7.i.i7, i64 %.8.i4.i)
+  %.10.i.i8 = add i64 %.9.i5.i, %written.i.i4
+  %.11.i.i9 = icmp sgt i64 %.9.i5.i, 0
+  br i1 %.11.i.i9, label %loop.i.i3, label %grammo_out_flush.exit.i5
+
+grammo_out_flush.exit.i5:                         ; preds = %body.i.i6, %loop.i.i3
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i16.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit
+
+grammo_out_advance.exit:                          ; preds = %grammo_out_interactive.exit.i, %grammo_out_flush.exit.i5
+  %.20.pre1.i16 = phi ptr [ %.20.pre1.i16.pre496, %grammo_out_interactive.exit.i ], [ %.20.pre1.i16.pre, %grammo_out_flush.exit.i5 ]
+  %.4.i11 = phi i64 [ %.4.i11.pre, %grammo_out_interactive.exit.i ], [ 0, %grammo_out_flush.exit.i5 ]
+  %.5.i12 = add i64 %.4.i11, 15
+  %.6.b.i13 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i14 = select i1 %.6.b.i13, i64 65536, i64 0
+  %.7.not.i15 = icmp ugt i64 %.5.i12, %.6.i14
+  br i1 %.7.not.i15, label %loop.i.i20, label %grammo_out_reserve.exit34
+
+loop.i.i20:                                       ; preds = %grammo_out_advance.exit, %body.i.i28
+  %written.i.i21 = phi i64 [ %.10.i.i32, %body.i.i28 ], [ 0, %grammo_out_advance.exit ]
+  %.5.i.i22 = icmp slt i64 %written.i.i21, %.4.i11
+  br i1 %.5.i.i22, label %body.i.i28, label %grammo_out_flush.exit.i23
+
+body.i.i28:                                       ; preds = %loop.i.i20
+  %.7.i.i29 = getelementptr i8, ptr %.20.pre1.i16, i64 %written.i.i21
+  %.8.i.i30 = sub i64 %.4.i11, %written.i.i21
+  %.9.i.i31 = tail call i64 @write(i32 1, ptr %.7.i.i29, i64 %.8.i.i30)
+  %.10.i.i32 = add i64 %.9.i.i31, %written.i.i21
+  %.11.i.i33 = icmp sgt i64 %.9.i.i31, 0
+  br i1 %.11.i.i33, label %loop.i.i20, label %grammo_out_flush.exit.i23
+
+grammo_out_flush.exit.i23:                        ; preds = %body.i.i28, %loop.i.i20
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i24 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i25 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i24, label %grammo_out_reserve.exit34, label %grow.i26
+
+grow.i26:                                         ; preds = %grammo_out_flush.exit.i23
+  %.16.i27 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i25, i64 65536)
+  store ptr %.16.i27, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit34
+
+grammo_out_reserve.exit34:                        ; preds = %grammo_out_advance.exit, %grammo_out_flush.exit.i23, %grow.i26
+  %.21.i17 = phi i64 [ 0, %grow.i26 ], [ 0, %grammo_out_flush.exit.i23 ], [ %.4.i11, %grammo_out_advance.exit ]
+  %.20.i18 = phi ptr [ %.16.i27, %grow.i26 ], [ %.20.pre.i25, %grammo_out_flush.exit.i23 ], [ %.20.pre1.i16, %grammo_out_advance.exit ]
+  %.22.i19 = getelementptr i8, ptr %.20.i18, i64 %.21.i17
+  %.15 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i19, i64 15, ptr nonnull @str_2, i32 0)
+  %0 = tail call i32 @llvm.smax.i32(i32 %.15, i32 0)
+  %.6.i35 = zext nneg i32 %0 to i64
+  %.7.i36 = load i64, ptr @grammo_out_len, align 8
+  %.8.i37 = add i64 %.7.i36, %.6.i35
+  store i64 %.8.i37, ptr @grammo_out_len, align 8
+  %.2.i.i38 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i39 = icmp slt i32 %.2.i.i38, 0
+  br i1 %.3.i.i39, label %check.i.i56, label %grammo_out_interactive.exit.i40
+
+check.i.i56:                                      ; preds = %grammo_out_reserve.exit34
+  %.5.i.i57 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i57, ptr @grammo_out_tty, align 4
+  %.4.i59.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i40
+
+grammo_out_interactive.exit.i40:                  ; preds = %check.i.i56, %grammo_out_reserve.exit34
+  %.4.i59.pre = phi i64 [ %.4.i59.pre.pre, %check.i.i56 ], [ %.8.i37, %grammo_out_reserve.exit34 ]
+  %.8.i.i41 = phi i32 [ %.5.i.i57, %check.i.i56 ], [ %.2.i.i38, %grammo_out_reserve.exit34 ]
+  %.9.i.i42 = icmp sgt i32 %.8.i.i41, 0
+  %.20.pre1.i64.pre499 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i42, label %loop.i.i46, label %grammo_out_advance.exit58
+
+loop.i.i46:                                       ; preds = %grammo_out_interactive.exit.i40, %body.i.i50
+  %written.i.i47 = phi i64 [ %.10.i.i54, %body.i.i50 ], [ 0, %grammo_out_interactive.exit.i40 ]
+  %.5.i3.i48 = icmp slt i64 %written.i.i47, %.4.i59.pre
+  br i1 %.5.i3.i48, label %body.i.i50, label %grammo_out_flush.exit.i49
+
+body.i.i50:                                       ; preds = %loop.i.i46
+  %.7.i.i51 = getelementptr i8, ptr %.20.pre1.i64.pre499, i64 %written.i.i47
+  %.8.i4.i52 = sub i64 %.4.i59.pre, %written.i.i47
+  %.9.i5.i53 = tail call i64 @write(i32 1, ptr %.7.i.i51, i64 %.8.i4.i52)
+  %.10.i.i54 = add i64 %.9.i5.i53, %written.i.i47
+  %.11.i.i55 = icmp sgt i64 %.9.i5.i53, 0
+  br i1 %.11.i.i55, label %loop.i.i46, label %grammo_out_flush.exit.i49
+
+grammo_out_flush.exit.i49:                        ; preds = %body.i.i50, %loop.i.i46
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i64.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit58
+
+grammo_out_advance.exit58:                        ; preds = %grammo_out_interactive.exit.i40, %grammo_out_flush.exit.i49
+  %.20.pre1.i64 = phi ptr [ %.20.pre1.i64.pre499, %grammo_out_interactive.exit.i40 ], [ %.20.pre1.i64.pre, %grammo_out_flush.exit.i49 ]
+  %.4.i59 = phi i64 [ %.4.i59.pre, %grammo_out_interactive.exit.i40 ], [ 0, %grammo_out_flush.exit.i49 ]
+  %.5.i60 = add i64 %.4.i59, 23
+  %.6.b.i61 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i62 = select i1 %.6.b.i61, i64 65536, i64 0
+  %.7.not.i63 = icmp ugt i64 %.5.i60, %.6.i62
+  br i1 %.7.not.i63, label %loop.i.i68, label %grammo_out_reserve.exit82
+
+loop.i.i68:                                       ; preds = %grammo_out_advance.exit58, %body.i.i76
+  %written.i.i69 = phi i64 [ %.10.i.i80, %body.i.i76 ], [ 0, %grammo_out_advance.exit58 ]
+  %.5.i.i70 = icmp slt i64 %written.i.i69, %.4.i59
+  br i1 %.5.i.i70, label %body.i.i76, label %grammo_out_flush.exit.i71
+
+body.i.i76:                                       ; preds = %loop.i.i68
+  %.7.i.i77 = getelementptr i8, ptr %.20.pre1.i64, i64 %written.i.i69
+  %.8.i.i78 = sub i64 %.4.i59, %written.i.i69
+  %.9.i.i79 = tail call i64 @write(i32 1, ptr %.7.i.i77, i64 %.8.i.i78)
+  %.10.i.i80 = add i64 %.9.i.i79, %written.i.i69
+  %.11.i.i81 = icmp sgt i64 %.9.i.i79, 0
+  br i1 %.11.i.i81, label %loop.i.i68, label %grammo_out_flush.exit.i71
+
+grammo_out_flush.exit.i71:                        ; preds = %body.i.i76, %loop.i.i68
+  %.10.b.i72 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i73 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i72, label %grammo_out_reserve.exit82, label %grow.i74
+
+grow.i74:                                         ; preds = %grammo_out_flush.exit.i71
+  %.16.i75 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i73, i64 65536)
+  store ptr %.16.i75, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit82
+
+grammo_out_reserve.exit82:                        ; preds = %grammo_out_advance.exit58, %grammo_out_flush.exit.i71, %grow.i74
+  %.7.i83 = phi i64 [ 0, %grow.i74 ], [ 0, %grammo_out_flush.exit.i71 ], [ %.4.i59, %grammo_out_advance.exit58 ]
+  %.20.i66 = phi ptr [ %.16.i75, %grow.i74 ], [ %.20.pre.i73, %grammo_out_flush.exit.i71 ], [ %.20.pre1.i64, %grammo_out_advance.exit58 ]
+  %.22.i67 = getelementptr i8, ptr %.20.i66, i64 %.7.i83
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(23) %.22.i67, ptr noundef nonnull align 16 dereferenceable(23) @str_3, i64 23, i1 false)
+  %.8.i84 = add nsw i64 %.7.i83, 22
+  store i64 %.8.i84, ptr @grammo_out_len, align 8
+  %.2.i.i85 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i86 = icmp slt i32 %.2.i.i85, 0
+  br i1 %.3.i.i86, label %check.i.i103, label %grammo_out_interactive.exit.i87
+
+check.i.i103:                                     ; preds = %grammo_out_reserve.exit82
+  %.5.i.i104 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i104, ptr @grammo_out_tty, align 4
+  %.4.i106.pre.pre = load i64, ptr @grammo_out_len, align 8
+  %.20.pre1.i111.pre502.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_interactive.exit.i87
+
+grammo_out_interactive.exit.i87:                  ; preds = %check.i.i103, %grammo_out_reserve.exit82
+  %.20.pre1.i111.pre502 = phi ptr [ %.20.pre1.i111.pre502.pre, %check.i.i103 ], [ %.20.i66, %grammo_out_reserve.exit82 ]
+  %.4.i106.pre = phi i64 [ %.4.i106.pre.pre, %check.i.i103 ], [ %.8.i84, %grammo_out_reserve.exit82 ]
+  %.8.i.i88 = phi i32 [ %.5.i.i104, %check.i.i103 ], [ %.2.i.i85, %grammo_out_reserve.exit82 ]
+  %.9.i.i89 = icmp sgt i32 %.8.i.i88, 0
+  br i1 %.9.i.i89, label %loop.i.i93, label %grammo_out_advance.exit105
+
+loop.i.i93:                                       ; preds = %grammo_out_interactive.exit.i87, %body.i.i97
+  %written.i.i94 = phi i64 [ %.10.i.i101, %body.i.i97 ], [ 0, %grammo_out_interactive.exit.i87 ]
+  %.5.i3.i95 = icmp slt i64 %written.i.i94, %.4.i106.pre
+  br i1 %.5.i3.i95, label %body.i.i97, label %grammo_out_flush.exit.i96
+
+body.i.i97:                                       ; preds = %loop.i.i93
+  %.7.i.i98 = getelementptr i8, ptr %.20.pre1.i111.pre502, i64 %written.i.i94
+  %.8.i4.i99 = sub i64 %.4.i106.pre, %written.i.i94
+  %.9.i5.i100 = tail call i64 @write(i32 1, ptr %.7.i.i98, i64 %.8.i4.i99)
+  %.10.i.i101 = add i64 %.9.i5.i100, %written.i.i94
+  %.11.i.i102 = icmp sgt i64 %.9.i5.i100, 0
+  br i1 %.11.i.i102, label %loop.i.i93, label %grammo_out_flush.exit.i96
+
+grammo_out_flush.exit.i96:                        ; preds = %body.i.i97, %loop.i.i93
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i111.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit105
+
+grammo_out_advance.exit105:                       ; preds = %grammo_out_interactive.exit.i87, %grammo_out_flush.exit.i96
+  %.20.pre1.i111 = phi ptr [ %.20.pre1.i111.pre502, %grammo_out_interactive.exit.i87 ], [ %.20.pre1.i111.pre, %grammo_out_flush.exit.i96 ]
+  %.4.i106 = phi i64 [ %.4.i106.pre, %grammo_out_interactive.exit.i87 ], [ 0, %grammo_out_flush.exit.i96 ]
+  %.5.i107 = add i64 %.4.i106, 15
+  %.6.b.i108 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i109 = select i1 %.6.b.i108, i64 65536, i64 0
+  %.7.not.i110 = icmp ugt i64 %.5.i107, %.6.i109
+  br i1 %.7.not.i110, label %loop.i.i115, label %grammo_out_reserve.exit129
+
+loop.i.i115:                                      ; preds = %grammo_out_advance.exit105, %body.i.i123
+  %written.i.i116 = phi i64 [ %.10.i.i127, %body.i.i123 ], [ 0, %grammo_out_advance.exit105 ]
+  %.5.i.i117 = icmp slt i64 %written.i.i116, %.4.i106
+  br i1 %.5.i.i117, label %body.i.i123, label %grammo_out_flush.exit.i118
+
+body.i.i123:                                      ; preds = %loop.i.i115
+  %.7.i.i124 = getelementptr i8, ptr %.20.pre1.i111, i64 %written.i.i116
+  %.8.i.i125 = sub i64 %.4.i106, %written.i.i116
+  %.9.i.i126 = tail call i64 @write(i32 1, ptr %.7.i.i124, i64 %.8.i.i125)
+  %.10.i.i127 = add i64 %.9.i.i126, %written.i.i116
+  %.11.i.i128 = icmp sgt i64 %.9.i.i126, 0
+  br i1 %.11.i.i128, label %loop.i.i115, label %grammo_out_flush.exit.i118
+
+grammo_out_flush.exit.i118:                       ; preds = %body.i.i123, %loop.i.i115
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i119 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i120 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i119, label %grammo_out_reserve.exit129, label %grow.i121
+
+grow.i121:                                        ; preds = %grammo_out_flush.exit.i118
+  %.16.i122 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i120, i64 65536)
+  store ptr %.16.i122, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit129
+
+grammo_out_reserve.exit129:                       ; preds = %grammo_out_advance.exit105, %grammo_out_flush.exit.i118, %grow.i121
+  %.21.i112 = phi i64 [ 0, %grow.i121 ], [ 0, %grammo_out_flush.exit.i118 ], [ %.4.i106, %grammo_out_advance.exit105 ]
+  %.20.i113 = phi ptr [ %.16.i122, %grow.i121 ], [ %.20.pre.i120, %grammo_out_flush.exit.i118 ], [ %.20.pre1.i111, %grammo_out_advance.exit105 ]
+  %.22.i114 = getelementptr i8, ptr %.20.i113, i64 %.21.i112
+  %.27 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i114, i64 15, ptr nonnull @str_2, i32 1)
+  %1 = tail call i32 @llvm.smax.i32(i32 %.27, i32 0)
+  %.6.i130 = zext nneg i32 %1 to i64
+  %.7.i131 = load i64, ptr @grammo_out_len, align 8
+  %.8.i132 = add i64 %.7.i131, %.6.i130
+  store i64 %.8.i132, ptr @grammo_out_len, align 8
+  %.2.i.i133 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i134 = icmp slt i32 %.2.i.i133, 0
+  br i1 %.3.i.i134, label %check.i.i151, label %grammo_out_interactive.exit.i135
+
+check.i.i151:                                     ; preds = %grammo_out_reserve.exit129
+  %.5.i.i152 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i152, ptr @grammo_out_tty, align 4
+  %.4.i154.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i135
+
+grammo_out_interactive.exit.i135:                 ; preds = %check.i.i151, %grammo_out_reserve.exit129
+  %.4.i154.pre = phi i64 [ %.4.i154.pre.pre, %check.i.i151 ], [ %.8.i132, %grammo_out_reserve.exit129 ]
+  %.8.i.i136 = phi i32 [ %.5.i.i152, %check.i.i151 ], [ %.2.i.i133, %grammo_out_reserve.exit129 ]
+  %.9.i.i137 = icmp sgt i32 %.8.i.i136, 0
+  %.20.pre1.i159.pre505 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i137, label %loop.i.i141, label %grammo_out_advance.exit153
+
+loop.i.i141:                                      ; preds = %grammo_out_interactive.exit.i135, %body.i.i145
+  %written.i.i142 = phi i64 [ %.10.i.i149, %body.i.i145 ], [ 0, %grammo_out_interactive.exit.i135 ]
+  %.5.i3.i143 = icmp slt i64 %written.i.i142, %.4.i154.pre
+  br i1 %.5.i3.i143, label %body.i.i145, label %grammo_out_flush.exit.i144
+
+body.i.i145:                                      ; preds = %loop.i.i141
+  %.7.i.i146 = getelementptr i8, ptr %.20.pre1.i159.pre505, i64 %written.i.i142
+  %.8.i4.i147 = sub i64 %.4.i154.pre, %written.i.i142
+  %.9.i5.i148 = tail call i64 @write(i32 1, ptr %.7.i.i146, i64 %.8.i4.i147)
+  %.10.i.i149 = add i64 %.9.i5.i148, %written.i.i142
+  %.11.i.i150 = icmp sgt i64 %.9.i5.i148, 0
+  br i1 %.11.i.i150, label %loop.i.i141, label %grammo_out_flush.exit.i144
+
+grammo_out_flush.exit.i144:                       ; preds = %body.i.i145, %loop.i.i141
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i159.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit153
+
+grammo_out_advance.exit153:                       ; preds = %grammo_out_interactive.exit.i135, %grammo_out_flush.exit.i144
+  %.20.pre1.i159 = phi ptr [ %.20.pre1.i159.pre505, %grammo_out_interactive.exit.i135 ], [ %.20.pre1.i159.pre, %grammo_out_flush.exit.i144 ]
+  %.4.i154 = phi i64 [ %.4.i154.pre, %grammo_out_interactive.exit.i135 ], [ 0, %grammo_out_flush.exit.i144 ]
+  %.5.i155 = add i64 %.4.i154, 45
+  %.6.b.i156 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i157 = select i1 %.6.b.i156, i64 65536, i64 0
+  %.7.not.i158 = icmp ugt i64 %.5.i155, %.6.i157
+  br i1 %.7.not.i158, label %loop.i.i163, label %grammo_out_reserve.exit177
+
+loop.i.i163:                                      ; preds = %grammo_out_advance.exit153, %body.i.i171
+  %written.i.i164 = phi i64 [ %.10.i.i175, %body.i.i171 ], [ 0, %grammo_out_advance.exit153 ]
+  %.5.i.i165 = icmp slt i64 %written.i.i164, %.4.i154
+  br i1 %.5.i.i165, label %body.i.i171, label %grammo_out_flush.exit.i166
+
+body.i.i171:                                      ; preds = %loop.i.i163
+  %.7.i.i172 = getelementptr i8, ptr %.20.pre1.i159, i64 %written.i.i164
+  %.8.i.i173 = sub i64 %.4.i154, %written.i.i164
+  %.9.i.i174 = tail call i64 @write(i32 1, ptr %.7.i.i172, i64 %.8.i.i173)
+  %.10.i.i175 = add i64 %.9.i.i174, %written.i.i164
+  %.11.i.i176 = icmp sgt i64 %.9.i.i174, 0
+  br i1 %.11.i.i176, label %loop.i.i163, label %grammo_out_flush.exit.i166
+
+grammo_out_flush.exit.i166:                       ; preds = %body.i.i171, %loop.i.i163
+  %.10.b.i167 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i168 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i167, label %grammo_out_reserve.exit177, label %grow.i169
+
+grow.i169:                                        ; preds = %grammo_out_flush.exit.i166
+  %.16.i170 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i168, i64 65536)
+  store ptr %.16.i170, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit177
+
+grammo_out_reserve.exit177:                       ; preds = %grammo_out_advance.exit153, %grammo_out_flush.exit.i166, %grow.i169
+  %.7.i178 = phi i64 [ 0, %grow.i169 ], [ 0, %grammo_out_flush.exit.i166 ], [ %.4.i154, %grammo_out_advance.exit153 ]
+  %.20.i161 = phi ptr [ %.16.i170, %grow.i169 ], [ %.20.pre.i168, %grammo_out_flush.exit.i166 ], [ %.20.pre1.i159, %grammo_out_advance.exit153 ]
+  %.22.i162 = getelementptr i8, ptr %.20.i161, i64 %.7.i178
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(45) %.22.i162, ptr noundef nonnull align 16 dereferenceable(45) @str_4, i64 45, i1 false)
+  %.8.i179 = add nsw i64 %.7.i178, 44
+  store i64 %.8.i179, ptr @grammo_out_len, align 8
+  %.2.i.i180 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i181 = icmp slt i32 %.2.i.i180, 0
+  br i1 %.3.i.i181, label %check.i.i198, label %grammo_out_interactive.exit.i182
+
+check.i.i198:                                     ; preds = %grammo_out_reserve.exit177
+  %.5.i.i199 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i199, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i182
+
+grammo_out_interactive.exit.i182:                 ; preds = %check.i.i198, %grammo_out_reserve.exit177
+  %.8.i.i183 = phi i32 [ %.5.i.i199, %check.i.i198 ], [ %.2.i.i180, %grammo_out_reserve.exit177 ]
+  %.9.i.i184 = icmp sgt i32 %.8.i.i183, 0
+  br i1 %.9.i.i184, label %flush.i185, label %grammo_out_advance.exit200
+
+flush.i185:                                       ; preds = %grammo_out_interactive.exit.i182
+  %.2.i1.i186 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i187 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i188
+
+loop.i.i188:                                      ; preds = %body.i.i192, %flush.i185
+  %written.i.i189 = phi i64 [ 0, %flush.i185 ], [ %.10.i.i196, %body.i.i192 ]
+  %.5.i3.i190 = icmp slt i64 %written.i.i189, %.3.i2.i187
+  br i1 %.5.i3.i190, label %body.i.i192, label %grammo_out_flush.exit.i191
+
+body.i.i192:                                      ; preds = %loop.i.i188
+  %.7.i.i193 = getelementptr i8, ptr %.2.i1.i186, i64 %written.i.i189
+  %.8.i4.i194 = sub i64 %.3.i2.i187, %written.i.i189
+  %.9.i5.i195 = tail call i64 @write(i32 1, ptr %.7.i.i193, i64 %.8.i4.i194)
+  %.10.i.i196 = add i64 %.9.i5.i195, %written.i.i189
+  %.11.i.i197 = icmp sgt i64 %.9.i5.i195, 0
+  br i1 %.11.i.i197, label %loop.i.i188, label %grammo_out_flush.exit.i191
+
+grammo_out_flush.exit.i191:                       ; preds = %body.i.i192, %loop.i.i188
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_advance.exit200
+
+grammo_out_advance.exit200:                       ; preds = %grammo_out_interactive.exit.i182, %grammo_out_flush.exit.i191
+  %.34 = tail call fastcc i1 @g.check(i1 true)
+  %.36 = tail call fastcc i1 @g.check(i1 false)
+  %.40 = tail call fastcc i1 @g.check(i1 true)
+  %.4.i201 = load i64, ptr @grammo_out_len, align 8
+  %.5.i202 = add i64 %.4.i201, 15
+  %.6.b.i203 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i204 = select i1 %.6.b.i203, i64 65536, i64 0
+  %.7.not.i205 = icmp ugt i64 %.5.i202, %.6.i204
+  %.20.pre1.i206 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i205, label %loop.i.i210, label %grammo_out_reserve.exit224
+
+loop.i.i210:                                      ; preds = %grammo_out_advance.exit200, %body.i.i218
+  %written.i.i211 = phi i64 [ %.10.i.i222, %body.i.i218 ], [ 0, %grammo_out_advance.exit200 ]
+  %.5.i.i212 = icmp slt i64 %written.i.i211, %.4.i201
+  br i1 %.5.i.i212, label %body.i.i218, label %grammo_out_flush.exit.i213
+
+body.i.i218:                                      ; preds = %loop.i.i210
+  %.7.i.i219 = getelementptr i8, ptr %.20.pre1.i206, i64 %written.i.i211
+  %.8.i.i220 = sub i64 %.4.i201, %written.i.i211
+  %.9.i.i221 = tail call i64 @write(i32 1, ptr %.7.i.i219, i64 %.8.i.i220)
+  %.10.i.i222 = add i64 %.9.i.i221, %written.i.i211
+  %.11.i.i223 = icmp sgt i64 %.9.i.i221, 0
+  br i1 %.11.i.i223, label %loop.i.i210, label %grammo_out_flush.exit.i213
+
+grammo_out_flush.exit.i213:                       ; preds = %body.i.i218, %loop.i.i210
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i214 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i215 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i214, label %grammo_out_reserve.exit224, label %grow.i216
+
+grow.i216:                                        ; preds = %grammo_out_flush.exit.i213
+  %.16.i217 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i215, i64 65536)
+  store ptr %.16.i217, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit224
+
+grammo_out_reserve.exit224:                       ; preds = %grammo_out_advance.exit200, %grammo_out_flush.exit.i213, %grow.i216
+  %.21.i207 = phi i64 [ 0, %grow.i216 ], [ 0, %grammo_out_flush.exit.i213 ], [ %.4.i201, %grammo_out_advance.exit200 ]
+  %.20.i208 = phi ptr [ %.16.i217, %grow.i216 ], [ %.20.pre.i215, %grammo_out_flush.exit.i213 ], [ %.20.pre1.i206, %grammo_out_advance.exit200 ]
+  %.22.i209 = getelementptr i8, ptr %.20.i208, i64 %.21.i207
+  %.48 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i209, i64 15, ptr nonnull @str_2, i32 1)
+  %2 = tail call i32 @llvm.smax.i32(i32 %.48, i32 0)
+  %.6.i225 = zext nneg i32 %2 to i64
+  %.7.i226 = load i64, ptr @grammo_out_len, align 8
+  %.8.i227 = add i64 %.7.i226, %.6.i225
+  store i64 %.8.i227, ptr @grammo_out_len, align 8
+  %.2.i.i228 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i229 = icmp slt i32 %.2.i.i228, 0
+  br i1 %.3.i.i229, label %check.i.i246, label %grammo_out_interactive.exit.i230
+
+check.i.i246:                                     ; preds = %grammo_out_reserve.exit224
+  %.5.i.i247 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i247, ptr @grammo_out_tty, align 4
+  %.4.i249.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i230
+
+grammo_out_interactive.exit.i230:                 ; preds = %check.i.i246, %grammo_out_reserve.exit224
+  %.4.i249.pre = phi i64 [ %.4.i249.pre.pre, %check.i.i246 ], [ %.8.i227, %grammo_out_reserve.exit224 ]
+  %.8.i.i231 = phi i32 [ %.5.i.i247, %check.i.i246 ], [ %.2.i.i228, %grammo_out_reserve.exit224 ]
+  %.9.i.i232 = icmp sgt i32 %.8.i.i231, 0
+  %.20.pre1.i254.pre508 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i232, label %loop.i.i236, label %grammo_out_advance.exit248
+
+loop.i.i236:                                      ; preds = %grammo_out_interactive.exit.i230, %body.i.i240
+  %written.i.i237 = phi i64 [ %.10.i.i244, %body.i.i240 ], [ 0, %grammo_out_interactive.exit.i230 ]
+  %.5.i3.i238 = icmp slt i64 %written.i.i237, %.4.i249.pre
+  br i1 %.5.i3.i238, label %body.i.i240, label %grammo_out_flush.exit.i239
+
+body.i.i240:                                      ; preds = %loop.i.i236
+  %.7.i.i241 = getelementptr i8, ptr %.20.pre1.i254.pre508, i64 %written.i.i237
+  %.8.i4.i242 = sub i64 %.4.i249.pre, %written.i.i237
+  %.9.i5.i243 = tail call i64 @write(i32 1, ptr %.7.i.i241, i64 %.8.i4.i242)
+  %.10.i.i244 = add i64 %.9.i5.i243, %written.i.i237
+  %.11.i.i245 = icmp sgt i64 %.9.i5.i243, 0
+  br i1 %.11.i.i245, label %loop.i.i236, label %grammo_out_flush.exit.i239
+
+grammo_out_flush.exit.i239:                       ; preds = %body.i.i240, %loop.i.i236
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i254.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit248
+
+grammo_out_advance.exit248:                       ; preds = %grammo_out_interactive.exit.i230, %grammo_out_flush.exit.i239
+  %.20.pre1.i254 = phi ptr [ %.20.pre1.i254.pre508, %grammo_out_interactive.exit.i230 ], [ %.20.pre1.i254.pre, %grammo_out_flush.exit.i239 ]
+  %.4.i249 = phi i64 [ %.4.i249.pre, %grammo_out_interactive.exit.i230 ], [ 0, %grammo_out_flush.exit.i239 ]
+  %.5.i250 = add i64 %.4.i249, 19
+  %.6.b.i251 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i252 = select i1 %.6.b.i251, i64 65536, i64 0
+  %.7.not.i253 = icmp ugt i64 %.5.i250, %.6.i252
+  br i1 %.7.not.i253, label %loop.i.i258, label %grammo_out_reserve.exit272
+
+loop.i.i258:                                      ; preds = %grammo_out_advance.exit248, %body.i.i266
+  %written.i.i259 = phi i64 [ %.10.i.i270, %body.i.i266 ], [ 0, %grammo_out_advance.exit248 ]
+  %.5.i.i260 = icmp slt i64 %written.i.i259, %.4.i249
+  br i1 %.5.i.i260, label %body.i.i266, label %grammo_out_flush.exit.i261
+
+body.i.i266:                                      ; preds = %loop.i.i258
+  %.7.i.i267 = getelementptr i8, ptr %.20.pre1.i254, i64 %written.i.i259
+  %.8.i.i268 = sub i64 %.4.i249, %written.i.i259
+  %.9.i.i269 = tail call i64 @write(i32 1, ptr %.7.i.i267, i64 %.8.i.i268)
+  %.10.i.i270 = add i64 %.9.i.i269, %written.i.i259
+  %.11.i.i271 = icmp sgt i64 %.9.i.i269, 0
+  br i1 %.11.i.i271, label %loop.i.i258, label %grammo_out_flush.exit.i261
+
+grammo_out_flush.exit.i261:                       ; preds = %body.i.i266, %loop.i.i258
+  %.10.b.i262 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i263 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i262, label %grammo_out_reserve.exit272, label %grow.i264
+
+grow.i264:                                        ; preds = %grammo_out_flush.exit.i261
+  %.16.i265 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i263, i64 65536)
+  store ptr %.16.i265, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit272
+
+grammo_out_reserve.exit272:                       ; preds = %grammo_out_advance.exit248, %grammo_out_flush.exit.i261, %grow.i264
+  %.7.i273 = phi i64 [ 0, %grow.i264 ], [ 0, %grammo_out_flush.exit.i261 ], [ %.4.i249, %grammo_out_advance.exit248 ]
+  %.20.i256 = phi ptr [ %.16.i265, %grow.i264 ], [ %.20.pre.i263, %grammo_out_flush.exit.i261 ], [ %.20.pre1.i254, %grammo_out_advance.exit248 ]
+  %.22.i257 = getelementptr i8, ptr %.20.i256, i64 %.7.i273
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(19) %.22.i257, ptr noundef nonnull align 16 dereferenceable(19) @str_5, i64 19, i1 false)
+  %.8.i274 = add nsw i64 %.7.i273, 18
+  store i64 %.8.i274, ptr @grammo_out_len, align 8
+  %.2.i.i275 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i276 = icmp slt i32 %.2.i.i275, 0
+  br i1 %.3.i.i276, label %check.i.i293, label %grammo_out_interactive.exit.i277
+
+check.i.i293:                                     ; preds = %grammo_out_reserve.exit272
+  %.5.i.i294 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i294, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i277
+
+grammo_out_interactive.exit.i277:                 ; preds = %check.i.i293, %grammo_out_reserve.exit272
+  %.8.i.i278 = phi i32 [ %.5.i.i294, %check.i.i293 ], [ %.2.i.i275, %grammo_out_reserve.exit272 ]
+  %.9.i.i279 = icmp sgt i32 %.8.i.i278, 0
+  br i1 %.9.i.i279, label %flush.i280, label %grammo_out_sync.exit
+
+flush.i280:                                       ; preds = %grammo_out_interactive.exit.i277
+  %.2.i1.i281 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i282 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i283
+
+loop.i.i283:                                      ; preds = %body.i.i287, %flush.i280
+  %written.i.i284 = phi i64 [ 0, %flush.i280 ], [ %.10.i.i291, %body.i.i287 ]
+  %.5.i3.i285 = icmp slt i64 %written.i.i284, %.3.i2.i282
+  br i1 %.5.i3.i285, label %body.i.i287, label %grammo_out_flush.exit.i286
+
+body.i.i287:                                      ; preds = %loop.i.i283
+  %.7.i.i288 = getelementptr i8, ptr %.2.i1.i281, i64 %written.i.i284
+  %.8.i4.i289 = sub i64 %.3.i2.i282, %written.i.i284
+  %.9.i5.i290 = tail call i64 @write(i32 1, ptr %.7.i.i288, i64 %.8.i4.i289)
+  %.10.i.i291 = add i64 %.9.i5.i290, %written.i.i284
+  %.11.i.i292 = icmp sgt i64 %.9.i5.i290, 0
+  br i1 %.11.i.i292, label %loop.i.i283, label %grammo_out_flush.exit.i286
+
+grammo_out_flush.exit.i286:                       ; preds = %body.i.i287, %loop.i.i283
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit
+
+grammo_out_sync.exit:                             ; preds = %grammo_out_interactive.exit.i277, %grammo_out_flush.exit.i286
+  call fastcc void @grammo_in_read_int(ptr %m_n)
+  %.4.i295 = load i64, ptr @grammo_out_len, align 8
+  %.5.i296 = add i64 %.4.i295, 30
+  %.6.b.i297 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i298 = select i1 %.6.b.i297, i64 65536, i64 0
+  %.7.not.i299 = icmp ugt i64 %.5.i296, %.6.i298
+  %.20.pre1.i300 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i299, label %loop.i.i304, label %grammo_out_reserve.exit318
+
+loop.i.i304:                                      ; preds = %grammo_out_sync.exit, %body.i.i312
+  %written.i.i305 = phi i64 [ %.10.i.i316, %body.i.i312 ], [ 0, %grammo_out_sync.exit ]
+  %.5.i.i306 = icmp slt i64 %written.i.i305, %.4.i295
+  br i1 %.5.i.i306, label %body.i.i312, label %grammo_out_flush.exit.i307
+
+body.i.i312:                                      ; preds = %loop.i.i304
+  %.7.i.i313 = getelementptr i8, ptr %.20.pre1.i300, i64 %written.i.i305
+  %.8.i.i314 = sub i64 %.4.i295, %written.i.i305
+  %.9.i.i315 = tail call i64 @write(i32 1, ptr %.7.i.i313, i64 %.8.i.i314)
+  %.10.i.i316 = add i64 %.9.i.i315, %written.i.i305
+  %.11.i.i317 = icmp sgt i64 %.9.i.i315, 0
+  br i1 %.11.i.i317, label %loop.i.i304, label %grammo_out_flush.exit.i307
+
+grammo_out_flush.exit.i307:                       ; preds = %body.i.i312, %loop.i.i304
+  %.10.b.i308 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i309 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i308, label %grammo_out_reserve.exit318, label %grow.i310
+
+grow.i310:                                        ; preds = %grammo_out_flush.exit.i307
+  %.16.i311 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i309, i64 65536)
+  store ptr %.16.i311, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit318
+
+grammo_out_reserve.exit318:                       ; preds = %grammo_out_sync.exit, %grammo_out_flush.exit.i307, %grow.i310
+  %.7.i319 = phi i64 [ 0, %grow.i310 ], [ 0, %grammo_out_flush.exit.i307 ], [ %.4.i295, %grammo_out_sync.exit ]
+  %.20.i302 = phi ptr [ %.16.i311, %grow.i310 ], [ %.20.pre.i309, %grammo_out_flush.exit.i307 ], [ %.20.pre1.i300, %grammo_out_sync.exit ]
+  %.22.i303 = getelementptr i8, ptr %.20.i302, i64 %.7.i319
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(30) %.22.i303, ptr noundef nonnull align 16 dereferenceable(30) @str_6, i64 30, i1 false)
+  %.8.i320 = add nsw i64 %.7.i319, 29
+  store i64 %.8.i320, ptr @grammo_out_len, align 8
+  %.2.i.i321 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i322 = icmp slt i32 %.2.i.i321, 0
+  br i1 %.3.i.i322, label %check.i.i339, label %grammo_out_interactive.exit.i323
+
+check.i.i339:                                     ; preds = %grammo_out_reserve.exit318
+  %.5.i.i340 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i340, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i323
+
+grammo_out_interactive.exit.i323:                 ; preds = %check.i.i339, %grammo_out_reserve.exit318
+  %.8.i.i324 = phi i32 [ %.5.i.i340, %check.i.i339 ], [ %.2.i.i321, %grammo_out_reserve.exit318 ]
+  %.9.i.i325 = icmp sgt i32 %.8.i.i324, 0
+  br i1 %.9.i.i325, label %flush.i326, label %grammo_out_sync.exit341
+
+flush.i326:                                       ; preds = %grammo_out_interactive.exit.i323
+  %.2.i1.i327 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i328 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i329
+
+loop.i.i329:                                      ; preds = %body.i.i333, %flush.i326
+  %written.i.i330 = phi i64 [ 0, %flush.i326 ], [ %.10.i.i337, %body.i.i333 ]
+  %.5.i3.i331 = icmp slt i64 %written.i.i330, %.3.i2.i328
+  br i1 %.5.i3.i331, label %body.i.i333, label %grammo_out_flush.exit.i332
+
+body.i.i333:                                      ; preds = %loop.i.i329
+  %.7.i.i334 = getelementptr i8, ptr %.2.i1.i327, i64 %written.i.i330
+  %.8.i4.i335 = sub i64 %.3.i2.i328, %written.i.i330
+  %.9.i5.i336 = tail call i64 @write(i32 1, ptr %.7.i.i334, i64 %.8.i4.i335)
+  %.10.i.i337 = add i64 %.9.i5.i336, %written.i.i330
+  %.11.i.i338 = icmp sgt i64 %.9.i5.i336, 0
+  br i1 %.11.i.i338, label %loop.i.i329, label %grammo_out_flush.exit.i332
+
+grammo_out_flush.exit.i332:                       ; preds = %body.i.i333, %loop.i.i329
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit341
+
+grammo_out_sync.exit341:                          ; preds = %grammo_out_interactive.exit.i323, %grammo_out_flush.exit.i332
+  call fastcc void @grammo_in_read_int(ptr %m_d)
+  %load_m_d = load i32, ptr %m_d, align 4
+  %.8.not.i = icmp eq i32 %load_m_d, 0
+  br i1 %.8.not.i, label %next_branch, label %g.safe_ratio_gt.exit
+
+g.safe_ratio_gt.exit:                             ; preds = %grammo_out_sync.exit341
+  %load_m_n = load i32, ptr %m_n, align 4
+  %.10.i = sdiv i32 %load_m_n, %load_m_d
+  %.11.i = icmp sgt i32 %.10.i, 2
+  br i1 %.11.i, label %if_then, label %next_branch
+
+if_then:                                          ; preds = %g.safe_ratio_gt.exit
+  %.4.i342 = load i64, ptr @grammo_out_len, align 8
+  %.5.i343 = add i64 %.4.i342, 31
+  %.6.b.i344 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i345 = select i1 %.6.b.i344, i64 65536, i64 0
+  %.7.not.i346 = icmp ugt i64 %.5.i343, %.6.i345
+  %.20.pre1.i347 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i346, label %loop.i.i351, label %grammo_out_reserve.exit365
+
+loop.i.i351:                                      ; preds = %if_then, %body.i.i359
+  %written.i.i352 = phi i64 [ %.10.i.i363, %body.i.i359 ], [ 0, %if_then ]
+  %.5.i.i353 = icmp slt i64 %written.i.i352, %.4.i342
+  br i1 %.5.i.i353, label %body.i.i359, label %grammo_out_flush.exit.i354
+
+body.i.i359:                                      ; preds = %loop.i.i351
+  %.7.i.i360 = getelementptr i8, ptr %.20.pre1.i347, i64 %written.i.i352
+  %.8.i.i361 = sub i64 %.4.i342, %written.i.i352
+  %.9.i.i362 = tail call i64 @write(i32 1, ptr %.7.i.i360, i64 %.8.i.i361)
+  %.10.i.i363 = add i64 %.9.i.i362, %written.i.i352
+  %.11.i.i364 = icmp sgt i64 %.9.i.i362, 0
+  br i1 %.11.i.i364, label %loop.i.i351, label %grammo_out_flush.exit.i354
+
+grammo_out_flush.exit.i354:                       ; preds = %body.i.i359, %loop.i.i351
+  %.10.b.i355 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i356 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i355, label %grammo_out_reserve.exit365, label %grow.i357
+
+grow.i357:                                        ; preds = %grammo_out_flush.exit.i354
+  %.16.i358 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i356, i64 65536)
+  store ptr %.16.i358, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit365
+
+grammo_out_reserve.exit365:                       ; preds = %if_then, %grammo_out_flush.exit.i354, %grow.i357
+  %.7.i366 = phi i64 [ 0, %grow.i357 ], [ 0, %grammo_out_flush.exit.i354 ], [ %.4.i342, %if_then ]
+  %.20.i349 = phi ptr [ %.16.i358, %grow.i357 ], [ %.20.pre.i356, %grammo_out_flush.exit.i354 ], [ %.20.pre1.i347, %if_then ]
+  %.22.i350 = getelementptr i8, ptr %.20.i349, i64 %.7.i366
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(31) %.22.i350, ptr noundef nonnull align 16 dereferenceable(31) @str_7, i64 31, i1 false)
+  %.8.i367 = add nsw i64 %.7.i366, 30
+  store i64 %.8.i367, ptr @grammo_out_len, align 8
+  %.2.i.i368 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i369 = icmp slt i32 %.2.i.i368, 0
+  br i1 %.3.i.i369, label %check.i.i386, label %grammo_out_interactive.exit.i370
+
+check.i.i386:                                     ; preds = %grammo_out_reserve.exit365
+  %.5.i.i387 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i387, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i370
+
+grammo_out_interactive.exit.i370:                 ; preds = %check.i.i386, %grammo_out_reserve.exit365
+  %.8.i.i371 = phi i32 [ %.5.i.i387, %check.i.i386 ], [ %.2.i.i368, %grammo_out_reserve.exit365 ]
+  %.9.i.i372 = icmp sgt i32 %.8.i.i371, 0
+  br i1 %.9.i.i372, label %flush.i373, label %if_merge
+
+flush.i373:                                       ; preds = %grammo_out_interactive.exit.i370
+  %.2.i1.i374 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i375 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i376
+
+loop.i.i376:                                      ; preds = %body.i.i380, %flush.i373
+  %written.i.i377 = phi i64 [ 0, %flush.i373 ], [ %.10.i.i384, %body.i.i380 ]
+  %.5.i3.i378 = icmp slt i64 %written.i.i377, %.3.i2.i375
+  br i1 %.5.i3.i378, label %body.i.i380, label %if_merge.sink.split
+
+body.i.i380:                                      ; preds = %loop.i.i376
+  %.7.i.i381 = getelementptr i8, ptr %.2.i1.i374, i64 %written.i.i377
+  %.8.i4.i382 = sub i64 %.3.i2.i375, %written.i.i377
+  %.9.i5.i383 = tail call i64 @write(i32 1, ptr %.7.i.i381, i64 %.8.i4.i382)
+  %.10.i.i384 = add i64 %.9.i5.i383, %written.i.i377
+  %.11.i.i385 = icmp sgt i64 %.9.i5.i383, 0
+  br i1 %.11.i.i385, label %loop.i.i376, label %if_merge.sink.split
+
+next_branch:                                      ; preds = %grammo_out_sync.exit341, %g.safe_ratio_gt.exit
+  %.4.i389 = load i64, ptr @grammo_out_len, align 8
+  %.5.i390 = add i64 %.4.i389, 37
+  %.6.b.i391 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i392 = select i1 %.6.b.i391, i64 65536, i64 0
+  %.7.not.i393 = icmp ugt i64 %.5.i390, %.6.i392
+  %.20.pre1.i394 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i393, label %loop.i.i398, label %grammo_out_reserve.exit412
+
+loop.i.i398:                                      ; preds = %next_branch, %body.i.i406
+  %written.i.i399 = phi i64 [ %.10.i.i410, %body.i.i406 ], [ 0, %next_branch ]
+  %.5.i.i400 = icmp slt i64 %written.i.i399, %.4.i389
+  br i1 %.5.i.i400, label %body.i.i406, label %grammo_out_flush.exit.i401
+
+body.i.i406:                                      ; preds = %loop.i.i398
+  %.7.i.i407 = getelementptr i8, ptr %.20.pre1.i394, i64 %written.i.i399
+  %.8.i.i408 = sub i64 %.4.i389, %written.i.i399
+  %.9.i.i409 = tail call i64 @write(i32 1, ptr %.7.i.i407, i64 %.8.i.i408)
+  %.10.i.i410 = add i64 %.9.i.i409, %written.i.i399
+  %.11.i.i411 = icmp sgt i64 %.9.i.i409, 0
+  br i1 %.11.i.i411, label %loop.i.i398, label %grammo_out_flush.exit.i401
+
+grammo_out_flush.exit.i401:                       ; preds = %body.i.i406, %loop.i.i398
+  %.10.b.i402 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i403 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i402, label %grammo_out_reserve.exit412, label %grow.i404
+
+grow.i404:                                        ; preds = %grammo_out_flush.exit.i401
+  %.16.i405 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i403, i64 65536)
+  store ptr %.16.i405, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit412
+
+grammo_out_reserve.exit412:                       ; preds = %next_branch, %grammo_out_flush.exit.i401, %grow.i404
+  %.7.i413 = phi i64 [ 0, %grow.i404 ], [ 0, %grammo_out_flush.exit.i401 ], [ %.4.i389, %next_branch ]
+  %.20.i396 = phi ptr [ %.16.i405, %grow.i404 ], [ %.20.pre.i403, %grammo_out_flush.exit.i401 ], [ %.20.pre1.i394, %next_branch ]
+  %.22.i397 = getelementptr i8, ptr %.20.i396, i64 %.7.i413
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(37) %.22.i397, ptr noundef nonnull align 16 dereferenceable(37) @str_8, i64 37, i1 false)
+  %.8.i414 = add nsw i64 %.7.i413, 36
+  store i64 %.8.i414, ptr @grammo_out_len, align 8
+  %.2.i.i415 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i416 = icmp slt i32 %.2.i.i415, 0
+  br i1 %.3.i.i416, label %check.i.i433, label %grammo_out_interactive.exit.i417
+
+check.i.i433:                                     ; preds = %grammo_out_reserve.exit412
+  %.5.i.i434 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i434, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i417
+
+grammo_out_interactive.exit.i417:                 ; preds = %check.i.i433, %grammo_out_reserve.exit412
+  %.8.i.i418 = phi i32 [ %.5.i.i434, %check.i.i433 ], [ %.2.i.i415, %grammo_out_reserve.exit412 ]
+  %.9.i.i419 = icmp sgt i32 %.8.i.i418, 0
+  br i1 %.9.i.i419, label %flush.i420, label %if_merge
+
+flush.i420:                                       ; preds = %grammo_out_interactive.exit.i417
+  %.2.i1.i421 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i422 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i423
+
+loop.i.i423:                                      ; preds = %body.i.i427, %flush.i420
+  %written.i.i424 = phi i64 [ 0, %flush.i420 ], [ %.10.i.i431, %body.i.i427 ]
+  %.5.i3.i425 = icmp slt i64 %written.i.i424, %.3.i2.i422
+  br i1 %.5.i3.i425, label %body.i.i427, label %if_merge.sink.split
+
+body.i.i427:                                      ; preds = %loop.i.i423
+  %.7.i.i428 = getelementptr i8, ptr %.2.i1.i421, i64 %written.i.i424
+  %.8.i4.i429 = sub i64 %.3.i2.i422, %written.i.i424
+  %.9.i5.i430 = tail call i64 @write(i32 1, ptr %.7.i.i428, i64 %.8.i4.i429)
+  %.10.i.i431 = add i64 %.9.i5.i430, %written.i.i424
+  %.11.i.i432 = icmp sgt i64 %.9.i5.i430, 0
+  br i1 %.11.i.i432, label %loop.i.i423, label %if_merge.sink.split
+
+if_merge.sink.split:                              ; preds = %loop.i.i376, %body.i.i380, %loop.i.i423, %body.i.i427
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %if_merge
+
+if_merge:                                         ; preds = %if_merge.sink.split, %grammo_out_interactive.exit.i417, %grammo_out_interactive.exit.i370
+  %.79491 = icmp sgt i32 %load_m_d, 0
+  br i1 %.79491, label %and_rhs.1.peel, label %while_end
+
+and_rhs.1.peel:                                   ; preds = %if_merge
+  %.81.peel = icmp samesign ult i32 %load_m_d, 3
+  %.82.peel = tail call fastcc i1 @g.check(i1 %.81.peel)
+  %.79.peel = icmp eq i32 %load_m_d, 2
+  br i1 %.79.peel, label %and_rhs.1, label %while_end
+
+while_end:                                        ; preds = %and_rhs.1.peel, %and_rhs.1, %if_merge
+  %load_G_CALLS = load i32, ptr @g.G_CALLS, align 4
+  %.4.i436 = load i64, ptr @grammo_out_len, align 8
+  %.5.i437 = add i64 %.4.i436, 31
+  %.6.b.i438 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i439 = select i1 %.6.b.i438, i64 65536, i64 0
+  %.7.not.i440 = icmp ugt i64 %.5.i437, %.6.i439
+  %.20.pre1.i441 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i440, label %loop.i.i445, label %grammo_out_reserve.exit459
+
+loop.i.i445:                                      ; preds = %while_end, %body.i.i453
+  %written.i.i446 = phi i64 [ %.10.i.i457, %body.i.i453 ], [ 0, %while_end ]
+  %.5.i.i447 = icmp slt i64 %written.i.i446, %.4.i436
+  br i1 %.5.i.i447, label %body.i.i453, label %grammo_out_flush.exit.i448
+
+body.i.i453:                                      ; preds = %loop.i.i445
+  %.7.i.i454 = getelementptr i8, ptr %.20.pre1.i441, i64 %written.i.i446
+  %.8.i.i455 = sub i64 %.4.i436, %written.i.i446
+  %.9.i.i456 = tail call i64 @write(i32 1, ptr %.7.i.i454, i64 %.8.i.i455)
+  %.10.i.i457 = add i64 %.9.i.i456, %written.i.i446
+  %.11.i.i458 = icmp sgt i64 %.9.i.i456, 0
+  br i1 %.11.i.i458, label %loop.i.i445, label %grammo_out_flush.exit.i448
+
+grammo_out_flush.exit.i448:                       ; preds = %body.i.i453, %loop.i.i445
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i449 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i450 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i449, label %grammo_out_reserve.exit459, label %grow.i451
+
+grow.i451:                                        ; preds = %grammo_out_flush.exit.i448
+  %.16.i452 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i450, i64 65536)
+  store ptr %.16.i452, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit459
+
+grammo_out_reserve.exit459:                       ; preds = %while_end, %grammo_out_flush.exit.i448, %grow.i451
+  %.21.i442 = phi i64 [ 0, %grow.i451 ], [ 0, %grammo_out_flush.exit.i448 ], [ %.4.i436, %while_end ]
+  %.20.i443 = phi ptr [ %.16.i452, %grow.i451 ], [ %.20.pre.i450, %grammo_out_flush.exit.i448 ], [ %.20.pre1.i441, %while_end ]
+  %.22.i444 = getelementptr i8, ptr %.20.i443, i64 %.21.i442
+  %.92 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i444, i64 31, ptr nonnull @str_9, i32 %load_G_CALLS)
+  %3 = tail call i32 @llvm.smax.i32(i32 %.92, i32 0)
+  %.6.i460 = zext nneg i32 %3 to i64
+  %.7.i461 = load i64, ptr @grammo_out_len, align 8
+  %.8.i462 = add i64 %.7.i461, %.6.i460
+  store i64 %.8.i462, ptr @grammo_out_len, align 8
+  %.2.i.i463 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i464 = icmp slt i32 %.2.i.i463, 0
+  br i1 %.3.i.i464, label %check.i.i481, label %grammo_out_interactive.exit.i465
+
+check.i.i481:                                     ; preds = %grammo_out_reserve.exit459
+  %.5.i.i482 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i482, ptr @grammo_out_tty, align 4
+  %.3.i.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i465
+
+grammo_out_interactive.exit.i465:                 ; preds = %check.i.i481, %grammo_out_reserve.exit459
+  %.3.i.pre = phi i64 [ %.3.i.pre.pre, %check.i.i481 ], [ %.8.i462, %grammo_out_reserve.exit459 ]
+  %.8.i.i466 = phi i32 [ %.5.i.i482, %check.i.i481 ], [ %.2.i.i463, %grammo_out_reserve.exit459 ]
+  %.9.i.i467 = icmp sgt i32 %.8.i.i466, 0
+  %.2.i.pre510 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i467, label %loop.i.i471, label %grammo_out_advance.exit483
+
+loop.i.i471:                                      ; preds = %grammo_out_interactive.exit.i465, %body.i.i475
+  %written.i.i472 = phi i64 [ %.10.i.i479, %body.i.i475 ], [ 0, %grammo_out_interactive.exit.i465 ]
+  %.5.i3.i473 = icmp slt i64 %written.i.i472, %.3.i.pre
+  br i1 %.5.i3.i473, label %body.i.i475, label %grammo_out_flush.exit.i474
+
+body.i.i475:                                      ; preds = %loop.i.i471
+  %.7.i.i476 = getelementptr i8, ptr %.2.i.pre510, i64 %written.i.i472
+  %.8.i4.i477 = sub i64 %.3.i.pre, %written.i.i472
+  %.9.i5.i478 = tail call i64 @write(i32 1, ptr %.7.i.i476, i64 %.8.i4.i477)
+  %.10.i.i479 = add i64 %.9.i5.i478, %written.i.i472
+  %.11.i.i480 = icmp sgt i64 %.9.i5.i478, 0
+  br i1 %.11.i.i480, label %loop.i.i471, label %grammo_out_flush.exit.i474
+
+grammo_out_flush.exit.i474:                       ; preds = %body.i.i475, %loop.i.i471
+  store i64 0, ptr @grammo_out_len, align 8
+  %.2.i.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit483
+
+grammo_out_advance.exit483:                       ; preds = %grammo_out_interactive.exit.i465, %grammo_out_flush.exit.i474
+  %.3.i = phi i64 [ %.3.i.pre, %grammo_out_interactive.exit.i465 ], [ 0, %grammo_out_flush.exit.i474 ]
+  %.2.i = phi ptr [ %.2.i.pre510, %grammo_out_interactive.exit.i465 ], [ %.2.i.pre, %grammo_out_flush.exit.i474 ]
+  br label %loop.i
+
+loop.i:                                           ; preds = %body.i, %grammo_out_advance.exit483
+  %written.i = phi i64 [ 0, %grammo_out_advance.exit483 ], [ %.10.i487, %body.i ]
+  %.5.i484 = icmp slt i64 %written.i, %.3.i
+  br i1 %.5.i484, label %body.i, label %grammo_out_flush.exit
+
+body.i:                                           ; preds = %loop.i
+  %.7.i485 = getelementptr i8, ptr %.2.i, i64 %written.i
+  %.8.i486 = sub i64 %.3.i, %written.i
+  %.9.i = tail call i64 @write(i32 1, ptr %.7.i485, i64 %.8.i486)
+  %.10.i487 = add i64 %.9.i, %written.i
+  %.11.i488 = icmp sgt i64 %.9.i, 0
+  br i1 %.11.i488, label %loop.i, label %grammo_out_flush.exit
+
+grammo_out_flush.exit:                            ; preds = %loop.i, %body.i
+  store i64 0, ptr @grammo_out_len, align 8
+  ret void
+
+and_rhs.1:                                        ; preds = %and_rhs.1.peel
+  %.82 = tail call fastcc i1 @g.check(i1 true)
+  br label %while_end
+}
+
+; Function Attrs: nounwind
+define internal fastcc void @grammo_in_read_int(ptr nocapture nonnull writeonly %target) unnamed_addr #2 {
+entry:
+  %.3.pre.i = load i64, ptr @grammo_in_pos, align 8
+  %.4.pre.i = load i64, ptr @grammo_in_end, align 8
+  %.9.i.pre30 = load ptr, ptr @grammo_in_buf, align 8
+  br label %skip.i.outer
+
+skip.i.outer:                                     ; preds = %grammo_in_fill.exit.i, %entry
+  %.9.i.ph = phi ptr [ %.9.i.pre, %grammo_in_fill.exit.i ], [ %.9.i.pre30, %entry ]
+  %.4.i.ph = phi i64 [ %.33.i.i, %grammo_in_fill.exit.i ], [ %.4.pre.i, %entry ]
+  %.3.i.ph = phi i64 [ 0, %grammo_in_fill.exit.i ], [ %.3.pre.i, %entry ]
+  br label %skip.i
+
+skip.i:                                           ; preds = %skip.i.outer, %skip_next.i
+  %.3.i = phi i64 [ %.19.i, %skip_next.i ], [ %.3.i.ph, %skip.i.outer ]
+  %.5.i = icmp ult i64 %.3.i, %.4.i.ph
+  br i1 %.5.i, label %skip_test.i, label %skip_fill.i
+
+skip_fill.i:                                      ; preds = %skip.i
+  %.3.i.i = icmp eq ptr %.9.i.ph, null
+  br i1 %.3.i.i, label %alloc.i.i, label %entry.check_full_crit_edge.i.i
+
+entry.check_full_crit_edge.i.i:                   ; preds = %skip_fill.i
+  %.12.pre.i.i = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i.i
+
+alloc.i.i:                                        ; preds = %skip_fill.i
+  %.5.i.i = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i.i, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i.i
+
+check_full.i.i:                                   ; preds = %alloc.i.i, %entry.check_full_crit_edge.i.i
+  %.17.i.i = phi ptr [ %.9.i.ph, %entry.check_full_crit_edge.i.i ], [ %.5.i.i, %alloc.i.i ]
+  %.12.i.i = phi i64 [ %.12.pre.i.i, %entry.check_full_crit_edge.i.i ], [ 65536, %alloc.i.i ]
+  %.11.i.i = sub i64 %.4.i.ph, %.3.i
+  %.13.i.i = icmp eq i64 %.11.i.i, %.12.i.i
+  br i1 %.13.i.i, label %grow.i.i, label %grammo_in_fill.exit.i
+
+grow.i.i:                                         ; preds = %check_full.i.i
+  %.16.i.i = shl i64 %.12.i.i, 1
+  %.18.i.i = or disjoint i64 %.16.i.i, 1
+  %.19.i.i = tail call ptr @realloc(ptr %.17.i.i, i64 %.18.i.i)
+  store ptr %.19.i.i, ptr @grammo_in_buf, align 8
+  store i64 %.16.i.i, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit.i
+
+grammo_in_fill.exit.i:                            ; preds = %grow.i.i, %check_full.i.i
+  %.28.i.i = phi i64 [ %.16.i.i, %grow.i.i ], [ %.12.i.i, %check_full.i.i ]
+  %.23.i.i = phi ptr [ %.19.i.i, %grow.i.i ], [ %.17.i.i, %check_full.i.i ]
+  %.25.i.i = getelementptr i8, ptr %.23.i.i, i64 %.3.i
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i.i, ptr align 1 %.25.i.i, i64 %.11.i.i, i1 false)
+  %.27.i.i = getelementptr i8, ptr %.23.i.i, i64 %.11.i.i
+  %.29.i.i = sub i64 %.28.i.i, %.11.i.i
+  %.30.i.i = tail call i64 @read(i32 0, ptr %.27.i.i, i64 %.29.i.i)
+  %.31.i.i = icmp sgt i64 %.30.i.i, 0
+  %.32.i.i = tail call i64 @llvm.smax.i64(i64 %.30.i.i, i64 0)
+  %.33.i.i = add i64 %.32.i.i, %.11.i.i
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i.i, ptr @grammo_in_end, align 8
+  %.36.i.i = getelementptr i8, ptr %.23.i.i, i64 %.33.i.i
+  store i8 0, ptr %.36.i.i, align 1
+  %.9.i.pre = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.31.i.i, label %skip.i.outer, label %grammo_in_token.exit
+
+skip_test.i:                                      ; preds = %skip.i
+  %.11.i = getelementptr i8, ptr %.9.i.ph, i64 %.3.i
+  %.12.i = load i8, ptr %.11.i, align 1
+  switch i8 %.12.i, label %scan.outer.i [
+    i8 32, label %skip_next.i
+    i8 13, label %skip_next.i
+    i8 12, label %skip_next.i
+    i8 11, label %skip_next.i
+    i8 10, label %skip_next.i
+    i8 9, label %skip_next.i
+  ]
+
+skip_next.i:                                      ; preds = %skip_test.i, %skip_test.i, %skip_test.i, %skip_test.i, %skip_test.i, %skip_test.i
+  %.19.i = add nuw i64 %.3.i, 1
+  store i64 %.19.i, ptr @grammo_in_pos, align 8
+  br label %skip.i
+
+scan.i:                                           ; preds = %grammo_in_fill.exit28.i.peel, %grammo_in_fill.exit28.i
+  %.24.i = phi i64 [ %.33.i20.i, %grammo_in_fill.exit28.i ], [ %.33.i20.i.peel, %grammo_in_fill.exit28.i.peel ]
+  %.25.i = icmp ult i64 %length.ph.i, %.24.i
+  %.27.i.pre = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.25.i, label %scan_test.i, label %scan_fill.i
+
+scan_test.i:                                      ; preds = %scan.i, %scan.outer.i
+  %.27.i = phi ptr [ %.27.i34, %scan.outer.i ], [ %.27.i.pre, %scan.i ]
+  %.24.i.lcssa = phi i64 [ %.2444.i, %scan.outer.i ], [ %.24.i, %scan.i ]
+  %.22.i.lcssa = phi i64 [ %.2242.i, %scan.outer.i ], [ 0, %scan.i ]
+  %.23.i.lcssa = phi i64 [ %.23.i.peel, %scan.outer.i ], [ %length.ph.i, %scan.i ]
+  %.28.i = getelementptr i8, ptr %.27.i, i64 %.23.i.lcssa
+  %.29.i = load i8, ptr %.28.i, align 1
+  switch i8 %.29.i, label %scan_next.i [
+    i8 32, label %grammo_in_token.exit
+    i8 13, label %grammo_in_token.exit
+    i8 12, label %grammo_in_token.exit
+    i8 11, label %grammo_in_token.exit
+    i8 10, label %grammo_in_token.exit
+    i8 9, label %grammo_in_token.exit
+  ]
+
+scan_next.i:                                      ; preds = %scan_test.i
+  %.35.i = add i64 %length.ph.i, 1
+  br label %scan.outer.i
+
+scan.outer.i:                                     ; preds = %skip_test.i, %scan_next.i
+  %.27.i34 = phi ptr [ %.27.i, %scan_next.i ], [ %.9.i.ph, %skip_test.i ]
+  %.2444.i = phi i64 [ %.24.i.lcssa, %scan_next.i ], [ %.4.i.ph, %skip_test.i ]
+  %.2242.i = phi i64 [ %.22.i.lcssa, %scan_next.i ], [ %.3.i, %skip_test.i ]
+  %length.ph.i = phi i64 [ %.35.i, %scan_next.i ], [ 1, %skip_test.i ]
+  %.23.i.peel = add i64 %.2242.i, %length.ph.i
+  %.25.i.peel = icmp ult i64 %.23.i.peel, %.2444.i
+  br i1 %.25.i.peel, label %scan_test.i, label %check_full.i5.i.peel
+
+check_full.i5.i.peel:                             ; preds = %scan.outer.i
+  %.12.pre.i4.i.peel = load i64, ptr @grammo_in_cap, align 8
+  %.11.i10.i.peel = sub i64 %.2444.i, %.2242.i
+  %.13.i11.i.peel = icmp eq i64 %.11.i10.i.peel, %.12.pre.i4.i.peel
+  br i1 %.13.i11.i.peel, label %grow.i22.i.peel, label %grammo_in_fill.exit28.i.peel
+
+grow.i22.i.peel:                                  ; preds = %check_full.i5.i.peel
+  %.16.i23.i.peel = shl i64 %.12.pre.i4.i.peel, 1
+  %.18.i24.i.peel = or disjoint i64 %.16.i23.i.peel, 1
+  %.19.i25.i.peel = tail call ptr @realloc(ptr nonnull %.27.i34, i64 %.18.i24.i.peel)
+  store ptr %.19.i25.i.peel, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23.i.peel, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28.i.peel
+
+grammo_in_fill.exit28.i.peel:                     ; preds = %grow.i22.i.peel, %check_full.i5.i.peel
+  %.28.i12.i.peel = phi i64 [ %.16.i23.i.peel, %grow.i22.i.peel ], [ %.12.pre.i4.i.peel, %check_full.i5.i.peel ]
+  %.23.i13.i.peel = phi ptr [ %.19.i25.i.peel, %grow.i22.i.peel ], [ %.27.i34, %check_full.i5.i.peel ]
+  %.25.i14.i.peel = getelementptr i8, ptr %.23.i13.i.peel, i64 %.2242.i
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i13.i.peel, ptr align 1 %.25.i14.i.peel, i64 %.11.i10.i.peel, i1 false)
+  %.27.i15.i.peel = getelementptr i8, ptr %.23.i13.i.peel, i64 %.11.i10.i.peel
+  %.29.i16.i.peel = sub i64 %.28.i12.i.peel, %.11.i10.i.peel
+  %.30.i17.i.peel = tail call i64 @read(i32 0, ptr %.27.i15.i.peel, i64 %.29.i16.i.peel)
+  %.31.i18.i.peel = icmp sgt i64 %.30.i17.i.peel, 0
+  %.32.i19.i.peel = tail call i64 @llvm.smax.i64(i64 %.30.i17.i.peel, i64 0)
+  %.33.i20.i.peel = add i64 %.32.i19.i.peel, %.11.i10.i.peel
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20.i.peel, ptr @grammo_in_end, align 8
+  %.36.i21.i.peel = getelementptr i8, ptr %.23.i13.i.peel, i64 %.33.i20.i.peel
+  store i8 0, ptr %.36.i21.i.peel, align 1
+  br i1 %.31.i18.i.peel, label %scan.i, label %grammo_in_token.exit.loopexit
+
+scan_fill.i:                                      ; preds = %scan.i
+  %.3.i2.i = icmp eq ptr %.27.i.pre, null
+  br i1 %.3.i2.i, label %alloc.i26.i, label %entry.check_full_crit_edge.i3.i
+
+entry.check_full_crit_edge.i3.i:                  ; preds = %scan_fill.i
+  %.12.pre.i4.i = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.i
+
+alloc.i26.i:                                      ; preds = %scan_fill.i
+  %.5.i27.i = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i27.i, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.i
+
+check_full.i5.i:                                  ; preds = %alloc.i26.i, %entry.check_full_crit_edge.i3.i
+  %.17.i6.i = phi ptr [ %.27.i.pre, %entry.check_full_crit_edge.i3.i ], [ %.5.i27.i, %alloc.i26.i ]
+  %.12.i7.i = phi i64 [ %.12.pre.i4.i, %entry.check_full_crit_edge.i3.i ], [ 65536, %alloc.i26.i ]
+  %.13.i11.i = icmp eq i64 %.24.i, %.12.i7.i
+  br i1 %.13.i11.i, label %grow.i22.i, label %grammo_in_fill.exit28.i
+
+grow.i22.i:                                       ; preds = %check_full.i5.i
+  %.16.i23.i = shl i64 %.24.i, 1
+  %.18.i24.i = or disjoint i64 %.16.i23.i, 1
+  %.19.i25.i = tail call ptr @realloc(ptr %.17.i6.i, i64 %.18.i24.i)
+  store ptr %.19.i25.i, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23.i, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28.i
+
+grammo_in_fill.exit28.i:                          ; preds = %grow.i22.i, %check_full.i5.i
+  %.28.i12.i = phi i64 [ %.16.i23.i, %grow.i22.i ], [ %.12.i7.i, %check_full.i5.i ]
+  %.23.i13.i = phi ptr [ %.19.i25.i, %grow.i22.i ], [ %.17.i6.i, %check_full.i5.i ]
+  %.27.i15.i = getelementptr i8, ptr %.23.i13.i, i64 %.24.i
+  %.29.i16.i = sub i64 %.28.i12.i, %.24.i
+  %.30.i17.i = tail call i64 @read(i32 0, ptr %.27.i15.i, i64 %.29.i16.i)
+  %.31.i18.i = icmp sgt i64 %.30.i17.i, 0
+  %.32.i19.i = tail call i64 @llvm.smax.i64(i64 %.30.i17.i, i64 0)
+  %.33.i20.i = add i64 %.32.i19.i, %.24.i
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20.i, ptr @grammo_in_end, align 8
+  %.36.i21.i = getelementptr i8, ptr %.23.i13.i, i64 %.33.i20.i
+  store i8 0, ptr %.36.i21.i, align 1
+  br i1 %.31.i18.i, label %scan.i, label %grammo_in_token.exit.loopexit, !llvm.loop !0
+
+grammo_in_token.exit.loopexit:                    ; preds = %grammo_in_fill.exit28.i.peel, %grammo_in_fill.exit28.i
+  %.4.pre = load ptr, ptr @grammo_in_buf, align 8
+  br label %grammo_in_token.exit
+
+grammo_in_token.exit:                             ; preds = %grammo_in_fill.exit.i, %scan_test.i, %scan_test.i, %scan_test.i, %scan_test.i, %scan_test.i, %scan_test.i, %grammo_in_token.exit.loopexit
+  %.4 = phi ptr [ %.4.pre, %grammo_in_token.exit.loopexit ], [ %.27.i, %scan_test.i ], [ %.27.i, %scan_test.i ], [ %.27.i, %scan_test.i ], [ %.27.i, %scan_test.i ], [ %.27.i, %scan_test.i ], [ %.27.i, %scan_test.i ], [ %.9.i.pre, %grammo_in_fill.exit.i ]
+  %common.ret.op.i = phi i64 [ %length.ph.i, %grammo_in_token.exit.loopexit ], [ %length.ph.i, %scan_test.i ], [ %length.ph.i, %scan_test.i ], [ %length.ph.i, %scan_test.i ], [ %length.ph.i, %scan_test.i ], [ %length.ph.i, %scan_test.i ], [ %length.ph.i, %scan_test.i ], [ 0, %grammo_in_fill.exit.i ]
+  %.5 = load i64, ptr @grammo_in_pos, align 8
+  %.6 = getelementptr i8, ptr %.4, i64 %.5
+  %.7 = load i8, ptr %.6, align 1
+  %.8 = icmp eq i8 %.7, 45
+  %.9 = icmp eq i8 %.7, 43
+  %.10 = or i1 %.8, %.9
+  %.11 = zext i1 %.10 to i64
+  %.139 = icmp ugt i64 %common.ret.op.i, %.11
+  %.1410 = getelementptr i8, ptr %.6, i64 %.11
+  %.1511 = load i8, ptr %.1410, align 1
+  %.1612 = add i8 %.1511, -48
+  %.1713 = icmp ult i8 %.1612, 10
+  %.1814 = and i1 %.139, %.1713
+  br i1 %.1814, label %digit, label %common.ret
+
+digit:                                            ; preds = %grammo_in_token.exit, %digit
+  %.1617 = phi i8 [ %.16, %digit ], [ %.1612, %grammo_in_token.exit ]
+  %value16 = phi i32 [ %.23, %digit ], [ 0, %grammo_in_token.exit ]
+  %i15 = phi i64 [ %.20, %digit ], [ %.11, %grammo_in_token.exit ]
+  %.20 = add nuw i64 %i15, 1
+  %.21 = mul i32 %value16, 10
+  %.22 = zext nneg i8 %.1617 to i32
+  %.23 = add i32 %.21, %.22
+  %.13 = icmp ult i64 %.20, %common.ret.op.i
+  %.14 = getelementptr i8, ptr %.6, i64 %.20
+  %.15 = load i8, ptr %.14, align 1
+  %.16 = add i8 %.15, -48
+  %.17 = icmp ult i8 %.16, 10
+  %.18 = and i1 %.13, %.17
+  br i1 %.18, label %digit, label %end_digits
+
+end_digits:                                       ; preds = %digit
+  %.25.not = icmp ult i64 %i15, %.11
+  br i1 %.25.not, label %common.ret, label %store
+
+common.ret:                                       ; preds = %grammo_in_token.exit, %end_digits, %store
+  ret void
+
+store:                                            ; preds = %end_digits
+  %.27 = sub i32 0, %.23
+  %.28 = select i1 %.8, i32 %.27, i32 %.23
+  store i32 %.28, ptr %target, align 4
+  %.31 = add i64 %.20, %.5
+  store i64 %.31, ptr @grammo_in_pos, align 8
+  br label %common.ret
+}
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i64 @llvm.smax.i64(i64, i64) #5
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i32 @llvm.smax.i32(i32, i32) #5
+
+; Function Attrs: nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memcpy.p0.p0.i64(ptr noalias nocapture writeonly, ptr noalias nocapture readonly, i64, i1 immarg) #6
+
+attributes #0 = { nofree nounwind }
+attributes #1 = { mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #2 = { nounwind }
+attributes #3 = { mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #4 = { mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+attributes #5 = { nocallback nofree nosync nounwind speculatable willreturn memory(none) }
+attributes #6 = { nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.peeled.count", i32 1}
@@ -1,98 +1,1059 @@
 ; ModuleID = '<string>'
 source_filename = "<string>"
-target triple = "x86_64-pc-windows-msvc"
-
-@str_0 = constant [27 x i8] c"Statistiche: media/min/max\00"
-@str_1 = constant [3 x i8] c"%s\00"
-@str_2 = local_unnamed_addr constant [2 x i8] c"\0A\00"
-@str_3 = constant [26 x i8] c"Quanti valori (int > 0)? \00"
-@str_4 = constant [3 x i8] c"%d\00"
-@str_5 = constant [26 x i8] c"Errore: n deve essere > 0\00"
-@str_6 = constant [18 x i8] c"Valore 1 (real): \00"
-@str_7 = constant [4 x i8] c"%lf\00"
-@str_8 = constant [16 x i8] c"Valore (real): \00"
-@str_9 = constant [7 x i8] c"Somma=\00"
-@str_10 = constant [5 x i8] c"%.6f\00"
-@str_11 = constant [7 x i8] c"Media=\00"
-@str_12 = constant [5 x i8] c"Min=\00"
-@str_13 = constant [7 x i8] c"  Max=\00"
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-i128:128-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-unknown-linux-gnu"
+
+@grammo_out_buf = internal unnamed_addr global ptr null
+@grammo_out_cap = internal unnamed_addr global i1 false
+@grammo_out_len = internal unnamed_addr global i64 0
+@grammo_out_tty = internal unnamed_addr global i32 -1
+@str_0 = private unnamed_addr constant [28 x i8] c"Statistiche: media/min/max\0A\00"
+@str_1 = private unnamed_addr constant [26 x i8] c"Quanti valori (int > 0)? \00"
+@grammo_in_buf = internal unnamed_addr global ptr null
+@grammo_in_cap = internal unnamed_addr global i64 0
+@grammo_in_pos = internal unnamed_addr global i64 0
+@grammo_in_end = internal unnamed_addr global i64 0
+@str_2 = private unnamed_addr constant [27 x i8] c"Errore: n deve essere > 0\0A\00"
+@str_3 = private unnamed_addr constant [18 x i8] c"Valore 1 (real): \00"
+@str_4 = private unnamed_addr constant [16 x i8] c"Valore (real): \00"
+@str_5 = private constant [12 x i8] c"Somma=%.6f\0A\00"
+@str_6 = private constant [12 x i8] c"Media=%.6f\0A\00"
+@str_7 = private constant [20 x i8] c"Min=%.6f  Max=%.6f\0A\00"
 
 ; Function Attrs: nofree nounwind
-declare noundef i32 @printf(ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+declare noundef i32 @snprintf(ptr noalias nocapture noundef writeonly, i64 noundef, ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+
+; Function Attrs: mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite)
+declare noalias noundef ptr @realloc(ptr allocptr nocapture, i64 noundef) local_unnamed_addr #1
 
 ; Function Attrs: nofree nounwind
-declare noundef i32 @scanf(ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+declare noundef i64 @write(i32 noundef, ptr nocapture noundef readonly, i64 noundef) local_unnamed_addr #0
+
+; Function Attrs: nounwind
+declare i32 @isatty(i32) local_unnamed_addr #2
+
+; Function Attrs: mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite)
+declare noalias noundef ptr @malloc(i64 noundef) local_unnamed_addr #3
 
 ; Function Attrs: nofree nounwind
-define void @main() local_unnamed_addr #0 {
+declare noundef i64 @read(i32 noundef, ptr nocapture noundef, i64 noundef) local_unnamed_addr #0
+
+; Function Attrs: mustprogress nofree nounwind willreturn
+declare double @strtod(ptr readonly, ptr nocapture) local_unnamed_addr #4
+
+; Function Attrs: mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memmove.p0.p0.i64(ptr nocapture writeonly, ptr nocapture readonly, i64, i1 immarg) #5
+
+; Function Attrs: nounwind
+define void @main() local_unnamed_addr #2 {
 entry:
-  %m_n = alloca i32, align 4
-  store i32 0, ptr %m_n, align 4
-  %m_x = alloca double, align 8
-  store double 0.000000e+00, ptr %m_x, align 8
-  %.11 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_0)
-  %putchar = tail call i32 @putchar(i32 10)
-  %.17 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_3)
-  %.19 = call i32 (ptr, ...) @scanf(ptr nonnull @str_4, ptr nonnull %m_n)
-  %load_m_n = load i32, ptr %m_n, align 4
-  %.20 = icmp slt i32 %load_m_n, 1
-  br i1 %.20, label %if_then, label %next_branch
-
-common.ret:                                       ; preds = %for_end, %if_then
-  %putchar4 = call i32 @putchar(i32 10)
+  %end.i231 = alloca ptr, align 8
+  %end.i = alloca ptr, align 8
+  %.4.i = load i64, ptr @grammo_out_len, align 8
+  %.5.i = add i64 %.4.i, 28
+  %.6.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.6.i = select i1 %.6.b.i, i64 65536, i64 0
+  %.7.not.i = icmp ugt i64 %.5.i, %.6.i
+  %.20.pre1.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i, label %loop.i.i, label %grammo_out_reserve.exit
+
+loop.i.i:                                         ; preds = %entry, %body.i.i
+  %written.i.i = phi i64 [ %.10.i.i, %body.i.i ], [ 0, %entry ]
+  %.5.i.i = icmp slt i64 %written.i.i, %.4.i
+  br i1 %.5.i.i, label %body.i.i, label %grammo_out_flush.exit.i
+
+body.i.i:                                         ; preds = %loop.i.i
+  %.7.i.i = getelementptr i8, ptr %.20.pre1.i, i64 %written.i.i
+  %.8.i.i = sub i64 %.4.i, %written.i.i
+  %.9.i.i = tail call i64 @write(i32 1, ptr %.7.i.i, i64 %.8.i.i)
+  %.10.i.i = add i64 %.9.i.i, %written.i.i
+  %.11.i.i = icmp sgt i64 %.9.i.i, 0
+  br i1 %.11.i.i, label %loop.i.i, label %grammo_out_flush.exit.i
+
+grammo_out_flush.exit.i:                          ; preds = %body.i.i, %loop.i.i
+  %.10.b.i = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i, label %grammo_out_reserve.exit, label %grow.i
+
+grow.i:                                           ; preds = %grammo_out_flush.exit.i
+  %.16.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i, i64 65536)
+  store ptr %.16.i, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit
+
+grammo_out_reserve.exit:                          ; preds = %entry, %grammo_out_flush.exit.i, %grow.i
+  %.7.i = phi i64 [ 0, %grow.i ], [ 0, %grammo_out_flush.exit.i ], [ %.4.i, %entry ]
+  %.20.i = phi ptr [ %.16.i, %grow.i ], [ %.20.pre.i, %grammo_out_flush.exit.i ], [ %.20.pre1.i, %entry ]
+  %.22.i = getelementptr i8, ptr %.20.i, i64 %.7.i
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(28) %.22.i, ptr noundef nonnull align 16 dereferenceable(28) @str_0, i64 28, i1 false)
+  %.8.i = add nsw i64 %.7.i, 27
+  store i64 %.8.i, ptr @grammo_out_len, align 8
+  %.2.i.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i = icmp slt i32 %.2.i.i, 0
+  br i1 %.3.i.i, label %check.i.i, label %grammo_out_interactive.exit.i
+
+check.i.i:                                        ; preds = %grammo_out_reserve.exit
+  %.5.i.i11 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i11, ptr @grammo_out_tty, align 4
+  %.4.i12.pre.pre = load i64, ptr @grammo_out_len, align 8
+  %.20.pre1.i17.pre412.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_interactive.exit.i
+
+grammo_out_interactive.exit.i:                    ; preds = %check.i.i, %grammo_out_reserve.exit
+  %.20.pre1.i17.pre412 = phi ptr [ %.20.pre1.i17.pre412.pre, %check.i.i ], [ %.20.i, %grammo_out_reserve.exit ]
+  %.4.i12.pre = phi i64 [ %.4.i12.pre.pre, %check.i.i ], [ %.8.i, %grammo_out_reserve.exit ]
+  %.8.i.i2 = phi i32 [ %.5.i.i11, %check.i.i ], [ %.2.i.i, %grammo_out_reserve.exit ]
+  %.9.i.i3 = icmp sgt i32 %.8.i.i2, 0
+  br i1 %.9.i.i3, label %loop.i.i4, label %grammo_out_advance.exit
+
+loop.i.i4:                                        ; preds = %grammo_out_interactive.exit.i, %body.i.i7
+  %written.i.i5 = phi i64 [ %.10.i.i9, %body.i.i7 ], [ 0, %grammo_out_interactive.exit.i ]
+  %.5.i3.i = icmp slt i64 %written.i.i5, %.4.i12.pre
+  br i1 %.5.i3.i, label %body.i.i7, label %grammo_out_flush.exit.i6
+
+body.i.i7:                                        ; preds = %loop.i.i4
+  %.7.i.i8 = getelementptr i8, ptr %.20.pre1.i17.pre412, i64 %written.i.i5
+  %.8.i4.i = sub i64 %.4.i12.pre, %written.i.i5
+  %.9.i5.i = tail call i64 @write(i32 1, ptr %.7.i.i8, i64 %.8.i4.i)
+  %.10.i.i9 = add i64 %.9.i5.i, %written.i.i5
+  %.11.i.i10 = icmp sgt i64 %.9.i5.i, 0
+  br i1 %.11.i.i10, label %loop.i.i4, label %grammo_out_flush.exit.i6
+
+grammo_out_flush.exit.i6:                         ; preds = %body.i.i7, %loop.i.i4
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i17.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit
+
+grammo_out_advance.exit:                          ; preds = %grammo_out_interactive.exit.i, %grammo_out_flush.exit.i6
+  %.20.pre1.i17 = phi ptr [ %.20.pre1.i17.pre412, %grammo_out_interactive.exit.i ], [ %.20.pre1.i17.pre, %grammo_out_flush.exit.i6 ]
+  %.4.i12 = phi i64 [ %.4.i12.pre, %grammo_out_interactive.exit.i ], [ 0, %grammo_out_flush.exit.i6 ]
+  %.5.i13 = add i64 %.4.i12, 26
+  %.6.b.i14 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i15 = select i1 %.6.b.i14, i64 65536, i64 0
+  %.7.not.i16 = icmp ugt i64 %.5.i13, %.6.i15
+  br i1 %.7.not.i16, label %loop.i.i21, label %grammo_out_reserve.exit35
+
+loop.i.i21:                                       ; preds = %grammo_out_advance.exit, %body.i.i29
+  %written.i.i22 = phi i64 [ %.10.i.i33, %body.i.i29 ], [ 0, %grammo_out_advance.exit ]
+  %.5.i.i23 = icmp slt i64 %written.i.i22, %.4.i12
+  br i1 %.5.i.i23, label %body.i.i29, label %grammo_out_flush.exit.i24
+
+body.i.i29:                                       ; preds = %loop.i.i21
+  %.7.i.i30 = getelementptr i8, ptr %.20.pre1.i17, i64 %written.i.i22
+  %.8.i.i31 = sub i64 %.4.i12, %written.i.i22
+  %.9.i.i32 = tail call i64 @write(i32 1, ptr %.7.i.i30, i64 %.8.i.i31)
+  %.10.i.i33 = add i64 %.9.i.i32, %written.i.i22
+  %.11.i.i34 = icmp sgt i64 %.9.i.i32, 0
+  br i1 %.11.i.i34, label %loop.i.i21, label %grammo_out_flush.exit.i24
+
+grammo_out_flush.exit.i24:                        ; preds = %body.i.i29, %loop.i.i21
+  %.10.b.i25 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i26 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i25, label %grammo_out_reserve.exit35, label %grow.i27
+
+grow.i27:                                         ; preds = %grammo_out_flush.exit.i24
+  %.16.i28 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i26, i64 65536)
+  store ptr %.16.i28, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit35
+
+grammo_out_reserve.exit35:                        ; preds = %grammo_out_advance.exit, %grammo_out_flush.exit.i24, %grow.i27
+  %.7.i36 = phi i64 [ 0, %grow.i27 ], [ 0, %grammo_out_flush.exit.i24 ], [ %.4.i12, %grammo_out_advance.exit ]
+  %.20.i19 = phi ptr [ %.16.i28, %grow.i27 ], [ %.20.pre.i26, %grammo_out_flush.exit.i24 ], [ %.20.pre1.i17, %grammo_out_advance.exit ]
+  %.22.i20 = getelementptr i8, ptr %.20.i19, i64 %.7.i36
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(26) %.22.i20, ptr noundef nonnull align 16 dereferenceable(26) @str_1, i64 26, i1 false)
+  %.8.i37 = add nsw i64 %.7.i36, 25
+  store i64 %.8.i37, ptr @grammo_out_len, align 8
+  %.2.i.i38 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i39 = icmp slt i32 %.2.i.i38, 0
+  br i1 %.3.i.i39, label %check.i.i56, label %grammo_out_interactive.exit.i40
+
+check.i.i56:                                      ; preds = %grammo_out_reserve.exit35
+  %.5.i.i57 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i57, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i40
+
+grammo_out_interactive.exit.i40:                  ; preds = %check.i.i56, %grammo_out_reserve.exit35
+  %.8.i.i41 = phi i32 [ %.5.i.i57, %check.i.i56 ], [ %.2.i.i38, %grammo_out_reserve.exit35 ]
+  %.9.i.i42 = icmp sgt i32 %.8.i.i41, 0
+  br i1 %.9.i.i42, label %flush.i43, label %grammo_out_sync.exit
+
+flush.i43:                                        ; preds = %grammo_out_interactive.exit.i40
+  %.2.i1.i44 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i45 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i46
+
+loop.i.i46:                                       ; preds = %body.i.i50, %flush.i43
+  %written.i.i47 = phi i64 [ 0, %flush.i43 ], [ %.10.i.i54, %body.i.i50 ]
+  %.5.i3.i48 = icmp slt i64 %written.i.i47, %.3.i2.i45
+  br i1 %.5.i3.i48, label %body.i.i50, label %grammo_out_flush.exit.i49
+
+body.i.i50:                                       ; preds = %loop.i.i46
+  %.7.i.i51 = getelementptr i8, ptr %.2.i1.i44, i64 %written.i.i47
+  %.8.i4.i52 = sub i64 %.3.i2.i45, %written.i.i47
+  %.9.i5.i53 = tail call i64 @write(i32 1, ptr %.7.i.i51, i64 %.8.i4.i52)
+  %.10.i.i54 = add i64 %.9.i5.i53, %written.i.i47
+  %.11.i.i55 = icmp sgt i64 %.9.i5.i53, 0
+  br i1 %.11.i.i55, label %loop.i.i46, label %grammo_out_flush.exit.i49
+
+grammo_out_flush.exit.i49:                        ; preds = %body.i.i50, %loop.i.i46
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit
+
+grammo_out_sync.exit:                             ; preds = %grammo_out_interactive.exit.i40, %grammo_out_flush.exit.i49
+  %.3.i = tail call fastcc i64 @grammo_in_token()
+  %.4.i58 = load ptr, ptr @grammo_in_buf, align 8
+  %.5.i59 = load i64, ptr @grammo_in_pos, align 8
+  %.6.i60 = getelementptr i8, ptr %.4.i58, i64 %.5.i59
+  %.7.i61 = load i8, ptr %.6.i60, align 1
+  %.8.i62 = icmp eq i8 %.7.i61, 45
+  %.9.i = icmp eq i8 %.7.i61, 43
+  %.10.i = or i1 %.8.i62, %.9.i
+  %.11.i = zext i1 %.10.i to i64
+  %.131.i = icmp ugt i64 %.3.i, %.11.i
+  %.142.i = getelementptr i8, ptr %.6.i60, i64 %.11.i
+  %.153.i = load i8, ptr %.142.i, align 1
+  %.164.i = add i8 %.153.i, -48
+  %.175.i = icmp ult i8 %.164.i, 10
+  %.186.i = and i1 %.175.i, %.131.i
+  br i1 %.186.i, label %digit.i, label %if_then
+
+digit.i:                                          ; preds = %grammo_out_sync.exit, %digit.i
+  %.169.i = phi i8 [ %.16.i66, %digit.i ], [ %.164.i, %grammo_out_sync.exit ]
+  %value8.i = phi i32 [ %.23.i, %digit.i ], [ 0, %grammo_out_sync.exit ]
+  %i7.i = phi i64 [ %.20.i63, %digit.i ], [ %.11.i, %grammo_out_sync.exit ]
+  %.20.i63 = add nuw i64 %i7.i, 1
+  %.21.i64 = mul i32 %value8.i, 10
+  %.22.i65 = zext nneg i8 %.169.i to i32
+  %.23.i = add i32 %.21.i64, %.22.i65
+  %.13.i = icmp ult i64 %.20.i63, %.3.i
+  %.14.i = getelementptr i8, ptr %.6.i60, i64 %.20.i63
+  %.15.i = load i8, ptr %.14.i, align 1
+  %.16.i66 = add i8 %.15.i, -48
+  %.17.i = icmp ult i8 %.16.i66, 10
+  %.18.i = and i1 %.13.i, %.17.i
+  br i1 %.18.i, label %digit.i, label %end_digits.i
+
+end_digits.i:                                     ; preds = %digit.i
+  %.25.not.i = icmp ult i64 %i7.i, %.11.i
+  br i1 %.25.not.i, label %if_then, label %grammo_in_read_int.exit
+
+grammo_in_read_int.exit:                          ; preds = %end_digits.i
+  %.27.i = sub i32 0, %.23.i
+  %.28.i = select i1 %.8.i62, i32 %.27.i, i32 %.23.i
+  %.31.i = add i64 %.20.i63, %.5.i59
+  store i64 %.31.i, ptr @grammo_in_pos, align 8
+  %.21 = icmp slt i32 %.28.i, 1
+  br i1 %.21, label %if_then, label %next_branch
+
+common.ret:                                       ; preds = %body.i391, %loop.i388, %body.i, %loop.i
+  store i64 0, ptr @grammo_out_len, align 8
   ret void
 
-if_then:                                          ; preds = %entry
-  %.23 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_5)
-  br label %common.ret
-
-next_branch:                                      ; preds = %entry
-  %.30 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_6)
-  %.32 = call i32 (ptr, ...) @scanf(ptr nonnull @str_7, ptr nonnull %m_x)
-  %load_m_x = load double, ptr %m_x, align 8
-  %load_m_n.16 = load i32, ptr %m_n, align 4
-  %.38.not7 = icmp slt i32 %load_m_n.16, 2
-  br i1 %.38.not7, label %for_end, label %for_body
-
-for_body:                                         ; preds = %next_branch, %for_body
-  %m_maxv.011 = phi double [ %m_maxv.1, %for_body ], [ %load_m_x, %next_branch ]
-  %m_minv.010 = phi double [ %m_minv.1, %for_body ], [ %load_m_x, %next_branch ]
-  %m_sum.09 = phi double [ %.45, %for_body ], [ %load_m_x, %next_branch ]
-  %m_i.08 = phi i32 [ %.55, %for_body ], [ 2, %next_branch ]
-  %.42 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_8)
-  %.44 = call i32 (ptr, ...) @scanf(ptr nonnull @str_7, ptr nonnull %m_x)
-  %load_m_x.3 = load double, ptr %m_x, align 8
-  %.45 = fadd double %m_sum.09, %load_m_x.3
-  %.47 = fcmp olt double %load_m_x.3, %m_minv.010
-  %m_minv.1 = select i1 %.47, double %load_m_x.3, double %m_minv.010
-  %.51 = fcmp ogt double %load_m_x.3, %m_maxv.011
-  %m_maxv.1 = select i1 %.51, double %load_m_x.3, double %m_maxv.011
-  %.55 = add i32 %m_i.08, 1
-  %load_m_n.1 = load i32, ptr %m_n, align 4
-  %.38.not = icmp sgt i32 %.55, %load_m_n.1
-  br i1 %.38.not, label %for_end, label %for_body
-
-for_end:                                          ; preds = %for_body, %next_branch
-  %m_sum.0.lcssa = phi double [ %load_m_x, %next_branch ], [ %.45, %for_body ]
-  %m_minv.0.lcssa = phi double [ %load_m_x, %next_branch ], [ %m_minv.1, %for_body ]
-  %m_maxv.0.lcssa = phi double [ %load_m_x, %next_branch ], [ %m_maxv.1, %for_body ]
-  %load_m_n.1.lcssa = phi i32 [ %load_m_n.16, %next_branch ], [ %load_m_n.1, %for_body ]
-  %.58 = sitofp i32 %load_m_n.1.lcssa to double
-  %.60 = fdiv double %m_sum.0.lcssa, %.58
-  %.64 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_9)
-  %.66 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_10, double %m_sum.0.lcssa)
-  %putchar2 = call i32 @putchar(i32 10)
-  %.72 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_11)
-  %.74 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_10, double %.60)
-  %putchar3 = call i32 @putchar(i32 10)
-  %.80 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_12)
-  %.82 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_10, double %m_minv.0.lcssa)
-  %.85 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_1, ptr nonnull @str_13)
-  %.87 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_10, double %m_maxv.0.lcssa)
-  br label %common.ret
+if_then:                                          ; preds = %grammo_out_sync.exit, %end_digits.i, %grammo_in_read_int.exit
+  %.4.i67 = load i64, ptr @grammo_out_len, align 8
+  %.5.i68 = add i64 %.4.i67, 27
+  %.6.b.i69 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i70 = select i1 %.6.b.i69, i64 65536, i64 0
+  %.7.not.i71 = icmp ugt i64 %.5.i68, %.6.i70
+  %.20.pre1.i72 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i71, label %loop.i.i76, label %grammo_out_reserve.exit90
+
+loop.i.i76:                                       ; preds = %if_then, %body.i.i84
+  %written.i.i77 = phi i64 [ %.10.i.i88, %body.i.i84 ], [ 0, %if_then ]
+  %.5.i.i78 = icmp slt i64 %written.i.i77, %.4.i67
+  br i1 %.5.i.i78, label %body.i.i84, label %grammo_out_flush.exit.i79
+
+body.i.i84:                                       ; preds = %loop.i.i76
+  %.7.i.i85 = getelementptr i8, ptr %.20.pre1.i72, i64 %written.i.i77
+  %.8.i.i86 = sub i64 %.4.i67, %written.i.i77
+  %.9.i.i87 = tail call i64 @write(i32 1, ptr %.7.i.i85, i64 %.8.i.i86)
+  %.10.i.i88 = add i64 %.9.i.i87, %written.i.i77
+  %.11.i.i89 = icmp sgt i64 %.9.i.i87, 0
+  br i1 %.11.i.i89, label %loop.i.i76, label %grammo_out_flush.exit.i79
+
+grammo_out_flush.exit.i79:                        ; preds = %body.i.i84, %loop.i.i76
+  %.10.b.i80 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i81 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i80, label %grammo_out_reserve.exit90, label %grow.i82
+
+grow.i82:                                         ; preds = %grammo_out_flush.exit.i79
+  %.16.i83 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i81, i64 65536)
+  store ptr %.16.i83, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit90
+
+grammo_out_reserve.exit90:                        ; preds = %if_then, %grammo_out_flush.exit.i79, %grow.i82
+  %.7.i91 = phi i64 [ 0, %grow.i82 ], [ 0, %grammo_out_flush.exit.i79 ], [ %.4.i67, %if_then ]
+  %.20.i74 = phi ptr [ %.16.i83, %grow.i82 ], [ %.20.pre.i81, %grammo_out_flush.exit.i79 ], [ %.20.pre1.i72, %if_then ]
+  %.22.i75 = getelementptr i8, ptr %.20.i74, i64 %.7.i91
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(27) %.22.i75, ptr noundef nonnull align 16 dereferenceable(27) @str_2, i64 27, i1 false)
+  %.8.i92 = add nsw i64 %.7.i91, 26
+  store i64 %.8.i92, ptr @grammo_out_len, align 8
+  %.2.i.i93 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i94 = icmp slt i32 %.2.i.i93, 0
+  br i1 %.3.i.i94, label %check.i.i111, label %grammo_out_interactive.exit.i95
+
+check.i.i111:                                     ; preds = %grammo_out_reserve.exit90
+  %.5.i.i112 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i112, ptr @grammo_out_tty, align 4
+  %.2.i.pre423.pre = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i114.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i95
+
+grammo_out_interactive.exit.i95:                  ; preds = %check.i.i111, %grammo_out_reserve.exit90
+  %.3.i114.pre = phi i64 [ %.3.i114.pre.pre, %check.i.i111 ], [ %.8.i92, %grammo_out_reserve.exit90 ]
+  %.2.i.pre423 = phi ptr [ %.2.i.pre423.pre, %check.i.i111 ], [ %.20.i74, %grammo_out_reserve.exit90 ]
+  %.8.i.i96 = phi i32 [ %.5.i.i112, %check.i.i111 ], [ %.2.i.i93, %grammo_out_reserve.exit90 ]
+  %.9.i.i97 = icmp sgt i32 %.8.i.i96, 0
+  br i1 %.9.i.i97, label %loop.i.i101, label %grammo_out_advance.exit113
+
+loop.i.i101:                                      ; preds = %grammo_out_interactive.exit.i95, %body.i.i105
+  %written.i.i102 = phi i64 [ %.10.i.i109, %body.i.i105 ], [ 0, %grammo_out_interactive.exit.i95 ]
+  %.5.i3.i103 = icmp slt i64 %written.i.i102, %.3.i114.pre
+  br i1 %.5.i3.i103, label %body.i.i105, label %grammo_out_flush.exit.i104
+
+body.i.i105:                                      ; preds = %loop.i.i101
+  %.7.i.i106 = getelementptr i8, ptr %.2.i.pre423, i64 %written.i.i102
+  %.8.i4.i107 = sub i64 %.3.i114.pre, %written.i.i102
+  %.9.i5.i108 = tail call i64 @write(i32 1, ptr %.7.i.i106, i64 %.8.i4.i107)
+  %.10.i.i109 = add i64 %.9.i5.i108, %written.i.i102
+  %.11.i.i110 = icmp sgt i64 %.9.i5.i108, 0
+  br i1 %.11.i.i110, label %loop.i.i101, label %grammo_out_flush.exit.i104
+
+grammo_out_flush.exit.i104:                       ; preds = %body.i.i105, %loop.i.i101
+  store i64 0, ptr @grammo_out_len, align 8
+  %.2.i.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit113
+
+grammo_out_advance.exit113:                       ; preds = %grammo_out_interactive.exit.i95, %grammo_out_flush.exit.i104
+  %.3.i114 = phi i64 [ %.3.i114.pre, %grammo_out_interactive.exit.i95 ], [ 0, %grammo_out_flush.exit.i104 ]
+  %.2.i = phi ptr [ %.2.i.pre423, %grammo_out_interactive.exit.i95 ], [ %.2.i.pre, %grammo_out_flush.exit.i104 ]
+  br label %loop.i
+
+loop.i:                                           ; preds = %body.i, %grammo_out_advance.exit113
+  %written.i = phi i64 [ 0, %grammo_out_advance.exit113 ], [ %.10.i119, %body.i ]
+  %.5.i115 = icmp slt i64 %written.i, %.3.i114
+  br i1 %.5.i115, label %body.i, label %common.ret
+
+body.i:                                           ; preds = %loop.i
+  %.7.i116 = getelementptr i8, ptr %.2.i, i64 %written.i
+  %.8.i117 = sub i64 %.3.i114, %written.i
+  %.9.i118 = tail call i64 @write(i32 1, ptr %.7.i116, i64 %.8.i117)
+  %.10.i119 = add i64 %.9.i118, %written.i
+  %.11.i120 = icmp sgt i64 %.9.i118, 0
+  br i1 %.11.i120, label %loop.i, label %common.ret
+
+next_branch:                                      ; preds = %grammo_in_read_int.exit
+  %.4.i121 = load i64, ptr @grammo_out_len, align 8
+  %.5.i122 = add i64 %.4.i121, 18
+  %.6.b.i123 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i124 = select i1 %.6.b.i123, i64 65536, i64 0
+  %.7.not.i125 = icmp ugt i64 %.5.i122, %.6.i124
+  %.20.pre1.i126 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i125, label %loop.i.i130, label %grammo_out_reserve.exit144
+
+loop.i.i130:                                      ; preds = %next_branch, %body.i.i138
+  %written.i.i131 = phi i64 [ %.10.i.i142, %body.i.i138 ], [ 0, %next_branch ]
+  %.5.i.i132 = icmp slt i64 %written.i.i131, %.4.i121
+  br i1 %.5.i.i132, label %body.i.i138, label %grammo_out_flush.exit.i133
+
+body.i.i138:                                      ; preds = %loop.i.i130
+  %.7.i.i139 = getelementptr i8, ptr %.20.pre1.i126, i64 %written.i.i131
+  %.8.i.i140 = sub i64 %.4.i121, %written.i.i131
+  %.9.i.i141 = tail call i64 @write(i32 1, ptr %.7.i.i139, i64 %.8.i.i140)
+  %.10.i.i142 = add i64 %.9.i.i141, %written.i.i131
+  %.11.i.i143 = icmp sgt i64 %.9.i.i141, 0
+  br i1 %.11.i.i143, label %loop.i.i130, label %grammo_out_flush.exit.i133
+
+grammo_out_flush.exit.i133:                       ; preds = %body.i.i138, %loop.i.i130
+  %.10.b.i134 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i135 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i134, label %grammo_out_reserve.exit144, label %grow.i136
+
+grow.i136:                                        ; preds = %grammo_out_flush.exit.i133
+  %.16.i137 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i135, i64 65536)
+  store ptr %.16.i137, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit144
+
+grammo_out_reserve.exit144:                       ; preds = %next_branch, %grammo_out_flush.exit.i133, %grow.i136
+  %.7.i145 = phi i64 [ 0, %grow.i136 ], [ 0, %grammo_out_flush.exit.i133 ], [ %.4.i121, %next_branch ]
+  %.20.i128 = phi ptr [ %.16.i137, %grow.i136 ], [ %.20.pre.i135, %grammo_out_flush.exit.i133 ], [ %.20.pre1.i126, %next_branch ]
+  %.22.i129 = getelementptr i8, ptr %.20.i128, i64 %.7.i145
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(18) %.22.i129, ptr noundef nonnull align 16 dereferenceable(18) @str_3, i64 18, i1 false)
+  %.8.i146 = add nsw i64 %.7.i145, 17
+  store i64 %.8.i146, ptr @grammo_out_len, align 8
+  %.2.i.i147 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i148 = icmp slt i32 %.2.i.i147, 0
+  br i1 %.3.i.i148, label %check.i.i165, label %grammo_out_interactive.exit.i149
+
+check.i.i165:                                     ; preds = %grammo_out_reserve.exit144
+  %.5.i.i166 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i166, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i149
+
+grammo_out_interactive.exit.i149:                 ; preds = %check.i.i165, %grammo_out_reserve.exit144
+  %.8.i.i150 = phi i32 [ %.5.i.i166, %check.i.i165 ], [ %.2.i.i147, %grammo_out_reserve.exit144 ]
+  %.9.i.i151 = icmp sgt i32 %.8.i.i150, 0
+  br i1 %.9.i.i151, label %flush.i152, label %grammo_out_sync.exit167
+
+flush.i152:                                       ; preds = %grammo_out_interactive.exit.i149
+  %.2.i1.i153 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i154 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i155
+
+loop.i.i155:                                      ; preds = %body.i.i159, %flush.i152
+  %written.i.i156 = phi i64 [ 0, %flush.i152 ], [ %.10.i.i163, %body.i.i159 ]
+  %.5.i3.i157 = icmp slt i64 %written.i.i156, %.3.i2.i154
+  br i1 %.5.i3.i157, label %body.i.i159, label %grammo_out_flush.exit.i158
+
+body.i.i159:                                      ; preds = %loop.i.i155
+  %.7.i.i160 = getelementptr i8, ptr %.2.i1.i153, i64 %written.i.i156
+  %.8.i4.i161 = sub i64 %.3.i2.i154, %written.i.i156
+  %.9.i5.i162 = tail call i64 @write(i32 1, ptr %.7.i.i160, i64 %.8.i4.i161)
+  %.10.i.i163 = add i64 %.9.i5.i162, %written.i.i156
+  %.11.i.i164 = icmp sgt i64 %.9.i5.i162, 0
+  br i1 %.11.i.i164, label %loop.i.i155, label %grammo_out_flush.exit.i158
+
+grammo_out_flush.exit.i158:                       ; preds = %body.i.i159, %loop.i.i155
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit167
+
+grammo_out_sync.exit167:                          ; preds = %grammo_out_interactive.exit.i149, %grammo_out_flush.exit.i158
+  call void @llvm.lifetime.start.p0(i64 8, ptr nonnull %end.i)
+  %.3.i168 = tail call fastcc i64 @grammo_in_token()
+  %.4.i169 = load ptr, ptr @grammo_in_buf, align 8
+  %.5.i170 = load i64, ptr @grammo_in_pos, align 8
+  %.6.i171 = getelementptr i8, ptr %.4.i169, i64 %.5.i170
+  %.7.i172 = call double @strtod(ptr %.6.i171, ptr nonnull %end.i)
+  %.8.i173 = load ptr, ptr %end.i, align 8
+  %.9.i174 = ptrtoint ptr %.8.i173 to i64
+  %.10.i175 = ptrtoint ptr %.6.i171 to i64
+  %.11.i176 = sub i64 %.9.i174, %.10.i175
+  %.12.i = icmp sgt i64 %.11.i176, 0
+  br i1 %.12.i, label %store.i177, label %grammo_in_read_real.exit
+
+store.i177:                                       ; preds = %grammo_out_sync.exit167
+  %.15.i178 = load i64, ptr @grammo_in_pos, align 8
+  %.16.i179 = add i64 %.15.i178, %.11.i176
+  store i64 %.16.i179, ptr @grammo_in_pos, align 8
+  br label %grammo_in_read_real.exit
+
+grammo_in_read_real.exit:                         ; preds = %grammo_out_sync.exit167, %store.i177
+  %m_x.1 = phi double [ %.7.i172, %store.i177 ], [ 0.000000e+00, %grammo_out_sync.exit167 ]
+  call void @llvm.lifetime.end.p0(i64 8, ptr nonnull %end.i)
+  %.41.not402 = icmp eq i32 %.28.i, 1
+  br i1 %.41.not402, label %for_end, label %for_body
+
+for_body:                                         ; preds = %grammo_in_read_real.exit, %grammo_in_read_real.exit241
+  %m_maxv.0407 = phi double [ %m_maxv.1, %grammo_in_read_real.exit241 ], [ %m_x.1, %grammo_in_read_real.exit ]
+  %m_minv.0406 = phi double [ %m_minv.1, %grammo_in_read_real.exit241 ], [ %m_x.1, %grammo_in_read_real.exit ]
+  %m_sum.0405 = phi double [ %.50, %grammo_in_read_real.exit241 ], [ %m_x.1, %grammo_in_read_real.exit ]
+  %m_i.0404 = phi i32 [ %.60, %grammo_in_read_real.exit241 ], [ 2, %grammo_in_read_real.exit ]
+  %m_x.0403 = phi double [ %m_x.2, %grammo_in_read_real.exit241 ], [ %m_x.1, %grammo_in_read_real.exit ]
+  %.4.i180 = load i64, ptr @grammo_out_len, align 8
+  %.5.i181 = add i64 %.4.i180, 16
+  %.6.b.i182 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i183 = select i1 %.6.b.i182, i64 65536, i64 0
+  %.7.not.i184 = icmp ugt i64 %.5.i181, %.6.i183
+  %.20.pre1.i185 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i184, label %loop.i.i189, label %grammo_out_reserve.exit203
+
+loop.i.i189:                                      ; preds = %for_body, %body.i.i197
+  %written.i.i190 = phi i64 [ %.10.i.i201, %body.i.i197 ], [ 0, %for_body ]
+  %.5.i.i191 = icmp slt i64 %written.i.i190, %.4.i180
+  br i1 %.5.i.i191, label %body.i.i197, label %grammo_out_flush.exit.i192
+
+body.i.i197:                                      ; preds = %loop.i.i189
+  %.7.i.i198 = getelementptr i8, ptr %.20.pre1.i185, i64 %written.i.i190
+  %.8.i.i199 = sub i64 %.4.i180, %written.i.i190
+  %.9.i.i200 = tail call i64 @write(i32 1, ptr %.7.i.i198, i64 %.8.i.i199)
+  %.10.i.i201 = add i64 %.9.i.i200, %written.i.i190
+  %.11.i.i202 = icmp sgt i64 %.9.i.i200, 0
+  br i1 %.11.i.i202, label %loop.i.i189, label %grammo_out_flush.exit.i192
+
+grammo_out_flush.exit.i192:                       ; preds = %body.i.i197, %loop.i.i189
+  %.10.b.i193 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i194 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i193, label %grammo_out_reserve.exit203, label %grow.i195
+
+grow.i195:                                        ; preds = %grammo_out_flush.exit.i192
+  %.16.i196 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i194, i64 65536)
+  store ptr %.16.i196, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit203
+
+grammo_out_reserve.exit203:                       ; preds = %for_body, %grammo_out_flush.exit.i192, %grow.i195
+  %.7.i204 = phi i64 [ 0, %grow.i195 ], [ 0, %grammo_out_flush.exit.i192 ], [ %.4.i180, %for_body ]
+  %.20.i187 = phi ptr [ %.16.i196, %grow.i195 ], [ %.20.pre.i194, %grammo_out_flush.exit.i192 ], [ %.20.pre1.i185, %for_body ]
+  %.22.i188 = getelementptr i8, ptr %.20.i187, i64 %.7.i204
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(16) %.22.i188, ptr noundef nonnull align 1 dereferenceable(16) @str_4, i64 16, i1 false)
+  %.8.i205 = add nsw i64 %.7.i204, 15
+  store i64 %.8.i205, ptr @grammo_out_len, align 8
+  %.2.i.i206 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i207 = icmp slt i32 %.2.i.i206, 0
+  br i1 %.3.i.i207, label %check.i.i224, label %grammo_out_interactive.exit.i208
+
+check.i.i224:                                     ; preds = %grammo_out_reserve.exit203
+  %.5.i.i225 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i225, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i208
+
+grammo_out_interactive.exit.i208:                 ; preds = %check.i.i224, %grammo_out_reserve.exit203
+  %.8.i.i209 = phi i32 [ %.5.i.i225, %check.i.i224 ], [ %.2.i.i206, %grammo_out_reserve.exit203 ]
+  %.9.i.i210 = icmp sgt i32 %.8.i.i209, 0
+  br i1 %.9.i.i210, label %flush.i211, label %grammo_out_sync.exit226
+
+flush.i211:                                       ; preds = %grammo_out_interactive.exit.i208
+  %.2.i1.i212 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i213 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i214
+
+loop.i.i214:                                      ; preds = %body.i.i218, %flush.i211
+  %written.i.i215 = phi i64 [ 0, %flush.i211 ], [ %.10.i.i222, %body.i.i218 ]
+  %.5.i3.i216 = icmp slt i64 %written.i.i215, %.3.i2.i213
+  br i1 %.5.i3.i216, label %body.i.i218, label %grammo_out_flush.exit.i217
+
+body.i.i218:                                      ; preds = %loop.i.i214
+  %.7.i.i219 = getelementptr i8, ptr %.2.i1.i212, i64 %written.i.i215
+  %.8.i4.i220 = sub i64 %.3.i2.i213, %written.i.i215
+  %.9.i5.i221 = tail call i64 @write(i32 1, ptr %.7.i.i219, i64 %.8.i4.i220)
+  %.10.i.i222 = add i64 %.9.i5.i221, %written.i.i215
+  %.11.i.i223 = icmp sgt i64 %.9.i5.i221, 0
+  br i1 %.11.i.i223, label %loop.i.i214, label %grammo_out_flush.exit.i217
+
+grammo_out_flush.exit.i217:                       ; preds = %body.i.i218, %loop.i.i214
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit226
+
+grammo_out_sync.exit226:                          ; preds = %grammo_out_interactive.exit.i208, %grammo_out_flush.exit.i217
+  call void @llvm.lifetime.start.p0(i64 8, ptr nonnull %end.i231)
+  %.3.i227 = tail call fastcc i64 @grammo_in_token()
+  %.4.i228 = load ptr, ptr @grammo_in_buf, align 8
+  %.5.i229 = load i64, ptr @grammo_in_pos, align 8
+  %.6.i230 = getelementptr i8, ptr %.4.i228, i64 %.5.i229
+  %.7.i232 = call double @strtod(ptr %.6.i230, ptr nonnull %end.i231)
+  %.8.i233 = load ptr, ptr %end.i231, align 8
+  %.9.i234 = ptrtoint ptr %.8.i233 to i64
+  %.10.i235 = ptrtoint ptr %.6.i230 to i64
+  %.11.i236 = sub i64 %.9.i234, %.10.i235
+  %.12.i237 = icmp sgt i64 %.11.i236, 0
+  br i1 %.12.i237, label %store.i238, label %grammo_in_read_real.exit241
+
+store.i238:                                       ; preds = %grammo_out_sync.exit226
+  %.15.i239 = load i64, ptr @grammo_in_pos, align 8
+  %.16.i240 = add i64 %.15.i239, %.11.i236
+  store i64 %.16.i240, ptr @grammo_in_pos, align 8
+  br label %grammo_in_read_real.exit241
+
+grammo_in_read_real.exit241:                      ; preds = %grammo_out_sync.exit226, %store.i238
+  %m_x.2 = phi double [ %.7.i232, %store.i238 ], [ %m_x.0403, %grammo_out_sync.exit226 ]
+  call void @llvm.lifetime.end.p0(i64 8, ptr nonnull %end.i231)
+  %.50 = fadd double %m_sum.0405, %m_x.2
+  %.52 = fcmp olt double %m_x.2, %m_minv.0406
+  %m_minv.1 = select i1 %.52, double %m_x.2, double %m_minv.0406
+  %.56 = fcmp ogt double %m_x.2, %m_maxv.0407
+  %m_maxv.1 = select i1 %.56, double %m_x.2, double %m_maxv.0407
+  %.60 = add i32 %m_i.0404, 1
+  %.41.not = icmp sgt i32 %.60, %.28.i
+  br i1 %.41.not, label %for_end, label %for_body
+
+for_end:                                          ; preds = %grammo_in_read_real.exit241, %grammo_in_read_real.exit
+  %m_sum.0.lcssa = phi double [ %m_x.1, %grammo_in_read_real.exit ], [ %.50, %grammo_in_read_real.exit241 ]
+  %m_minv.0.lcssa = phi double [ %m_x.1, %grammo_in_read_real.exit ], [ %m_minv.1, %grammo_in_read_real.exit241 ]
+  %m_maxv.0.lcssa = phi double [ %m_x.1, %grammo_in_read_real.exit ], [ %m_maxv.1, %grammo_in_read_real.exit241 ]
+  %.63 = sitofp i32 %.28.i to double
+  %.65 = fdiv double %m_sum.0.lcssa, %.63
+  %.4.i242 = load i64, ptr @grammo_out_len, align 8
+  %.5.i243 = add i64 %.4.i242, 328
+  %.6.b.i244 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i245 = select i1 %.6.b.i244, i64 65536, i64 0
+  %.7.not.i246 = icmp ugt i64 %.5.i243, %.6.i245
+  %.20.pre1.i247 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i246, label %loop.i.i251, label %grammo_out_reserve.exit265
+
+loop.i.i251:                                      ; preds = %for_end, %body.i.i259
+  %written.i.i252 = phi i64 [ %.10.i.i263, %body.i.i259 ], [ 0, %for_end ]
+  %.5.i.i253 = icmp slt i64 %written.i.i252, %.4.i242
+  br i1 %.5.i.i253, label %body.i.i259, label %grammo_out_flush.exit.i254
+
+body.i.i259:                                      ; preds = %loop.i.i251
+  %.7.i.i260 = getelementptr i8, ptr %.20.pre1.i247, i64 %written.i.i252
+  %.8.i.i261 = sub i64 %.4.i242, %written.i.i252
+  %.9.i.i262 = tail call i64 @write(i32 1, ptr %.7.i.i260, i64 %.8.i.i261)
+  %.10.i.i263 = add i64 %.9.i.i262, %written.i.i252
+  %.11.i.i264 = icmp sgt i64 %.9.i.i262, 0
+  br i1 %.11.i.i264, label %loop.i.i251, label %grammo_out_flush.exit.i254
+
+grammo_out_flush.exit.i254:                       ; preds = %body.i.i259, %loop.i.i251
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i255 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i256 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i255, label %grammo_out_reserve.exit265, label %grow.i257
+
+grow.i257:                                        ; preds = %grammo_out_flush.exit.i254
+  %.16.i258 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i256, i64 65536)
+  store ptr %.16.i258, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit265
+
+grammo_out_reserve.exit265:                       ; preds = %for_end, %grammo_out_flush.exit.i254, %grow.i257
+  %.21.i248 = phi i64 [ 0, %grow.i257 ], [ 0, %grammo_out_flush.exit.i254 ], [ %.4.i242, %for_end ]
+  %.20.i249 = phi ptr [ %.16.i258, %grow.i257 ], [ %.20.pre.i256, %grammo_out_flush.exit.i254 ], [ %.20.pre1.i247, %for_end ]
+  %.22.i250 = getelementptr i8, ptr %.20.i249, i64 %.21.i248
+  %.70 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i250, i64 328, ptr nonnull @str_5, double %m_sum.0.lcssa)
+  %0 = tail call i32 @llvm.smax.i32(i32 %.70, i32 0)
+  %.6.i266 = zext nneg i32 %0 to i64
+  %.7.i267 = load i64, ptr @grammo_out_len, align 8
+  %.8.i268 = add i64 %.7.i267, %.6.i266
+  store i64 %.8.i268, ptr @grammo_out_len, align 8
+  %.2.i.i269 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i270 = icmp slt i32 %.2.i.i269, 0
+  br i1 %.3.i.i270, label %check.i.i287, label %grammo_out_interactive.exit.i271
+
+check.i.i287:                                     ; preds = %grammo_out_reserve.exit265
+  %.5.i.i288 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i288, ptr @grammo_out_tty, align 4
+  %.4.i290.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i271
+
+grammo_out_interactive.exit.i271:                 ; preds = %check.i.i287, %grammo_out_reserve.exit265
+  %.4.i290.pre = phi i64 [ %.4.i290.pre.pre, %check.i.i287 ], [ %.8.i268, %grammo_out_reserve.exit265 ]
+  %.8.i.i272 = phi i32 [ %.5.i.i288, %check.i.i287 ], [ %.2.i.i269, %grammo_out_reserve.exit265 ]
+  %.9.i.i273 = icmp sgt i32 %.8.i.i272, 0
+  %.20.pre1.i295.pre415 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i273, label %loop.i.i277, label %grammo_out_advance.exit289
+
+loop.i.i277:                                      ; preds = %grammo_out_interactive.exit.i271, %body.i.i281
+  %written.i.i278 = phi i64 [ %.10.i.i285, %body.i.i281 ], [ 0, %grammo_out_interactive.exit.i271 ]
+  %.5.i3.i279 = icmp slt i64 %written.i.i278, %.4.i290.pre
+  br i1 %.5.i3.i279, label %body.i.i281, label %grammo_out_flush.exit.i280
+
+body.i.i281:                                      ; preds = %loop.i.i277
+  %.7.i.i282 = getelementptr i8, ptr %.20.pre1.i295.pre415, i64 %written.i.i278
+  %.8.i4.i283 = sub i64 %.4.i290.pre, %written.i.i278
+  %.9.i5.i284 = tail call i64 @write(i32 1, ptr %.7.i.i282, i64 %.8.i4.i283)
+  %.10.i.i285 = add i64 %.9.i5.i284, %written.i.i278
+  %.11.i.i286 = icmp sgt i64 %.9.i5.i284, 0
+  br i1 %.11.i.i286, label %loop.i.i277, label %grammo_out_flush.exit.i280
+
+grammo_out_flush.exit.i280:                       ; preds = %body.i.i281, %loop.i.i277
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i295.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit289
+
+grammo_out_advance.exit289:                       ; preds = %grammo_out_interactive.exit.i271, %grammo_out_flush.exit.i280
+  %.20.pre1.i295 = phi ptr [ %.20.pre1.i295.pre415, %grammo_out_interactive.exit.i271 ], [ %.20.pre1.i295.pre, %grammo_out_flush.exit.i280 ]
+  %.4.i290 = phi i64 [ %.4.i290.pre, %grammo_out_interactive.exit.i271 ], [ 0, %grammo_out_flush.exit.i280 ]
+  %.5.i291 = add i64 %.4.i290, 328
+  %.6.b.i292 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i293 = select i1 %.6.b.i292, i64 65536, i64 0
+  %.7.not.i294 = icmp ugt i64 %.5.i291, %.6.i293
+  br i1 %.7.not.i294, label %loop.i.i299, label %grammo_out_reserve.exit313
+
+loop.i.i299:                                      ; preds = %grammo_out_advance.exit289, %body.i.i307
+  %written.i.i300 = phi i64 [ %.10.i.i311, %body.i.i307 ], [ 0, %grammo_out_advance.exit289 ]
+  %.5.i.i301 = icmp slt i64 %written.i.i300, %.4.i290
+  br i1 %.5.i.i301, label %body.i.i307, label %grammo_out_flush.exit.i302
+
+body.i.i307:                                      ; preds = %loop.i.i299
+  %.7.i.i308 = getelementptr i8, ptr %.20.pre1.i295, i64 %written.i.i300
+  %.8.i.i309 = sub i64 %.4.i290, %written.i.i300
+  %.9.i.i310 = tail call i64 @write(i32 1, ptr %.7.i.i308, i64 %.8.i.i309)
+  %.10.i.i311 = add i64 %.9.i.i310, %written.i.i300
+  %.11.i.i312 = icmp sgt i64 %.9.i.i310, 0
+  br i1 %.11.i.i312, label %loop.i.i299, label %grammo_out_flush.exit.i302
+
+grammo_out_flush.exit.i302:                       ; preds = %body.i.i307, %loop.i.i299
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i303 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i304 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i303, label %grammo_out_reserve.exit313, label %grow.i305
+
+grow.i305:                                        ; preds = %grammo_out_flush.exit.i302
+  %.16.i306 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i304, i64 65536)
+  store ptr %.16.i306, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit313
+
+grammo_out_reserve.exit313:                       ; preds = %grammo_out_advance.exit289, %grammo_out_flush.exit.i302, %grow.i305
+  %.21.i296 = phi i64 [ 0, %grow.i305 ], [ 0, %grammo_out_flush.exit.i302 ], [ %.4.i290, %grammo_out_advance.exit289 ]
+  %.20.i297 = phi ptr [ %.16.i306, %grow.i305 ], [ %.20.pre.i304, %grammo_out_flush.exit.i302 ], [ %.20.pre1.i295, %grammo_out_advance.exit289 ]
+  %.22.i298 = getelementptr i8, ptr %.20.i297, i64 %.21.i296
+  %.75 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i298, i64 328, ptr nonnull @str_6, double %.65)
+  %1 = tail call i32 @llvm.smax.i32(i32 %.75, i32 0)
+  %.6.i314 = zext nneg i32 %1 to i64
+  %.7.i315 = load i64, ptr @grammo_out_len, align 8
+  %.8.i316 = add i64 %.7.i315, %.6.i314
+  store i64 %.8.i316, ptr @grammo_out_len, align 8
+  %.2.i.i317 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i318 = icmp slt i32 %.2.i.i317, 0
+  br i1 %.3.i.i318, label %check.i.i335, label %grammo_out_interactive.exit.i319
+
+check.i.i335:                                     ; preds = %grammo_out_reserve.exit313
+  %.5.i.i336 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i336, ptr @grammo_out_tty, align 4
+  %.4.i338.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i319
+
+grammo_out_interactive.exit.i319:                 ; preds = %check.i.i335, %grammo_out_reserve.exit313
+  %.4.i338.pre = phi i64 [ %.4.i338.pre.pre, %check.i.i335 ], [ %.8.i316, %grammo_out_reserve.exit313 ]
+  %.8.i.i320 = phi i32 [ %.5.i.i336, %check.i.i335 ], [ %.2.i.i317, %grammo_out_reserve.exit313 ]
+  %.9.i.i321 = icmp sgt i32 %.8.i.i320, 0
+  %.20.pre1.i343.pre418 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i321, label %loop.i.i325, label %grammo_out_advance.exit337
+
+loop.i.i325:                                      ; preds = %grammo_out_interactive.exit.i319, %body.i.i329
+  %written.i.i326 = phi i64 [ %.10.i.i333, %body.i.i329 ], [ 0, %grammo_out_interactive.exit.i319 ]
+  %.5.i3.i327 = icmp slt i64 %written.i.i326, %.4.i338.pre
+  br i1 %.5.i3.i327, label %body.i.i329, label %grammo_out_flush.exit.i328
+
+body.i.i329:                                      ; preds = %loop.i.i325
+  %.7.i.i330 = getelementptr i8, ptr %.20.pre1.i343.pre418, i64 %written.i.i326
+  %.8.i4.i331 = sub i64 %.4.i338.pre, %written.i.i326
+  %.9.i5.i332 = tail call i64 @write(i32 1, ptr %.7.i.i330, i64 %.8.i4.i331)
+  %.10.i.i333 = add i64 %.9.i5.i332, %written.i.i326
+  %.11.i.i334 = icmp sgt i64 %.9.i5.i332, 0
+  br i1 %.11.i.i334, label %loop.i.i325, label %grammo_out_flush.exit.i328
+
+grammo_out_flush.exit.i328:                       ; preds = %body.i.i329, %loop.i.i325
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i343.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit337
+
+grammo_out_advance.exit337:                       ; preds = %grammo_out_interactive.exit.i319, %grammo_out_flush.exit.i328
+  %.20.pre1.i343 = phi ptr [ %.20.pre1.i343.pre418, %grammo_out_interactive.exit.i319 ], [ %.20.pre1.i343.pre, %grammo_out_flush.exit.i328 ]
+  %.4.i338 = phi i64 [ %.4.i338.pre, %grammo_out_interactive.exit.i319 ], [ 0, %grammo_out_flush.exit.i328 ]
+  %.5.i339 = add i64 %.4.i338, 652
+  %.6.b.i340 = load i1, ptr @grammo_out_cap, align 1
+  %.6.i341 = select i1 %.6.b.i340, i64 65536, i64 0
+  %.7.not.i342 = icmp ugt i64 %.5.i339, %.6.i341
+  br i1 %.7.not.i342, label %loop.i.i347, label %grammo_out_reserve.exit361
+
+loop.i.i347:                                      ; preds = %grammo_out_advance.exit337, %body.i.i355
+  %written.i.i348 = phi i64 [ %.10.i.i359, %body.i.i355 ], [ 0, %grammo_out_advance.exit337 ]
+  %.5.i.i349 = icmp slt i64 %written.i.i348, %.4.i338
+  br i1 %.5.i.i349, label %body.i.i355, label %grammo_out_flush.exit.i350
+
+body.i.i355:                                      ; preds = %loop.i.i347
+  %.7.i.i356 = getelementptr i8, ptr %.20.pre1.i343, i64 %written.i.i348
+  %.8.i.i357 = sub i64 %.4.i338, %written.i.i348
+  %.9.i.i358 = tail call i64 @write(i32 1, ptr %.7.i.i356, i64 %.8.i.i357)
+  %.10.i.i359 = add i64 %.9.i.i358, %written.i.i348
+  %.11.i.i360 = icmp sgt i64 %.9.i.i358, 0
+  br i1 %.11.i.i360, label %loop.i.i347, label %grammo_out_flush.exit.i350
+
+grammo_out_flush.exit.i350:                       ; preds = %body.i.i355, %loop.i.i347
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.b.i351 = load i1, ptr @grammo_out_cap, align 1
+  %.20.pre.i352 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.10.b.i351, label %grammo_out_reserve.exit361, label %grow.i353
+
+grow.i353:                                        ; preds = %grammo_out_flush.exit.i350
+  %.16.i354 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i352, i64 65536)
+  store ptr %.16.i354, ptr @grammo_out_buf, align 8
+  store i1 true, ptr @grammo_out_cap, align 1
+  br label %grammo_out_reserve.exit361
+
+grammo_out_reserve.exit361:                       ; preds = %grammo_out_advance.exit337, %grammo_out_flush.exit.i350, %grow.i353
+  %.21.i344 = phi i64 [ 0, %grow.i353 ], [ 0, %grammo_out_flush.exit.i350 ], [ %.4.i338, %grammo_out_advance.exit337 ]
+  %.20.i345 = phi ptr [ %.16.i354, %grow.i353 ], [ %.20.pre.i352, %grammo_out_flush.exit.i350 ], [ %.20.pre1.i343, %grammo_out_advance.exit337 ]
+  %.22.i346 = getelementptr i8, ptr %.20.i345, i64 %.21.i344
+  %.80 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr nonnull dereferenceable(1) %.22.i346, i64 652, ptr nonnull @str_7, double %m_minv.0.lcssa, double %m_maxv.0.lcssa)
+  %2 = tail call i32 @llvm.smax.i32(i32 %.80, i32 0)
+  %.6.i362 = zext nneg i32 %2 to i64
+  %.7.i363 = load i64, ptr @grammo_out_len, align 8
+  %.8.i364 = add i64 %.7.i363, %.6.i362
+  store i64 %.8.i364, ptr @grammo_out_len, align 8
+  %.2.i.i365 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i366 = icmp slt i32 %.2.i.i365, 0
+  br i1 %.3.i.i366, label %check.i.i383, label %grammo_out_interactive.exit.i367
+
+check.i.i383:                                     ; preds = %grammo_out_reserve.exit361
+  %.5.i.i384 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i384, ptr @grammo_out_tty, align 4
+  %.3.i387.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i367
+
+grammo_out_interactive.exit.i367:                 ; preds = %check.i.i383, %grammo_out_reserve.exit361
+  %.3.i387.pre = phi i64 [ %.3.i387.pre.pre, %check.i.i383 ], [ %.8.i364, %grammo_out_reserve.exit361 ]
+  %.8.i.i368 = phi i32 [ %.5.i.i384, %check.i.i383 ], [ %.2.i.i365, %grammo_out_reserve.exit361 ]
+  %.9.i.i369 = icmp sgt i32 %.8.i.i368, 0
+  %.2.i386.pre420 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i369, label %loop.i.i373, label %grammo_out_advance.exit385
+
+loop.i.i373:                                      ; preds = %grammo_out_interactive.exit.i367, %body.i.i377
+  %written.i.i374 = phi i64 [ %.10.i.i381, %body.i.i377 ], [ 0, %grammo_out_interactive.exit.i367 ]
+  %.5.i3.i375 = icmp slt i64 %written.i.i374, %.3.i387.pre
+  br i1 %.5.i3.i375, label %body.i.i377, label %grammo_out_flush.exit.i376
+
+body.i.i377:                                      ; preds = %loop.i.i373
+  %.7.i.i378 = getelementptr i8, ptr %.2.i386.pre420, i64 %written.i.i374
+  %.8.i4.i379 = sub i64 %.3.i387.pre, %written.i.i374
+  %.9.i5.i380 = tail call i64 @write(i32 1, ptr %.7.i.i378, i64 %.8.i4.i379)
+  %.10.i.i381 = add i64 %.9.i5.i380, %written.i.i374
+  %.11.i.i382 = icmp sgt i64 %.9.i5.i380, 0
+  br i1 %.11.i.i382, label %loop.i.i373, label %grammo_out_flush.exit.i376
+
+grammo_out_flush.exit.i376:                       ; preds = %body.i.i377, %loop.i.i373
+  store i64 0, ptr @grammo_out_len, align 8
+  %.2.i386.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit385
+
+grammo_out_advance.exit385:                       ; preds = %grammo_out_interactive.exit.i367, %grammo_out_flush.exit.i376
+  %.3.i387 = phi i64 [ %.3.i387.pre, %grammo_out_interactive.exit.i367 ], [ 0, %grammo_out_flush.exit.i376 ]
+  %.2.i386 = phi ptr [ %.2.i386.pre420, %grammo_out_interactive.exit.i367 ], [ %.2.i386.pre, %grammo_out_flush.exit.i376 ]
+  br label %loop.i388
+
+loop.i388:                                        ; preds = %body.i391, %grammo_out_advance.exit385
+  %written.i389 = phi i64 [ 0, %grammo_out_advance.exit385 ], [ %.10.i395, %body.i391 ]
+  %.5.i390 = icmp slt i64 %written.i389, %.3.i387
+  br i1 %.5.i390, label %body.i391, label %common.ret
+
+body.i391:                                        ; preds = %loop.i388
+  %.7.i392 = getelementptr i8, ptr %.2.i386, i64 %written.i389
+  %.8.i393 = sub i64 %.3.i387, %written.i389
+  %.9.i394 = tail call i64 @write(i32 1, ptr %.7.i392, i64 %.8.i393)
+  %.10.i395 = add i64 %.9.i394, %written.i389
+  %.11.i396 = icmp sgt i64 %.9.i394, 0
+  br i1 %.11.i396, label %loop.i388, label %common.ret
 }
 
-; Function Attrs: nofree nounwind
-declare noundef i32 @putchar(i32 noundef) local_unnamed_addr #0
+; Function Attrs: nounwind
+define internal fastcc i64 @grammo_in_token() unnamed_addr #2 {
+entry:
+  %.3.pre = load i64, ptr @grammo_in_pos, align 8
+  %.4.pre = load i64, ptr @grammo_in_end, align 8
+  br label %skip.outer
+
+skip.outer:                                       ; preds = %grammo_in_fill.exit, %entry
+  %.4.ph = phi i64 [ %.33.i, %grammo_in_fill.exit ], [ %.4.pre, %entry ]
+  %.3.ph = phi i64 [ 0, %grammo_in_fill.exit ], [ %.3.pre, %entry ]
+  %.9 = load ptr, ptr @grammo_in_buf, align 8
+  br label %skip
+
+skip:                                             ; preds = %skip.outer, %skip_next
+  %.3 = phi i64 [ %.19, %skip_next ], [ %.3.ph, %skip.outer ]
+  %.5 = icmp ult i64 %.3, %.4.ph
+  br i1 %.5, label %skip_test, label %skip_fill
+
+skip_fill:                                        ; preds = %skip
+  %.3.i = icmp eq ptr %.9, null
+  br i1 %.3.i, label %alloc.i, label %entry.check_full_crit_edge.i
+
+entry.check_full_crit_edge.i:                     ; preds = %skip_fill
+  %.12.pre.i = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i
+
+alloc.i:                                          ; preds = %skip_fill
+  %.5.i = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i
+
+check_full.i:                                     ; preds = %alloc.i, %entry.check_full_crit_edge.i
+  %.17.i = phi ptr [ %.9, %entry.check_full_crit_edge.i ], [ %.5.i, %alloc.i ]
+  %.12.i = phi i64 [ %.12.pre.i, %entry.check_full_crit_edge.i ], [ 65536, %alloc.i ]
+  %.11.i = sub i64 %.4.ph, %.3
+  %.13.i = icmp eq i64 %.11.i, %.12.i
+  br i1 %.13.i, label %grow.i, label %grammo_in_fill.exit
+
+grow.i:                                           ; preds = %check_full.i
+  %.16.i = shl i64 %.12.i, 1
+  %.18.i = or disjoint i64 %.16.i, 1
+  %.19.i = tail call ptr @realloc(ptr %.17.i, i64 %.18.i)
+  store ptr %.19.i, ptr @grammo_in_buf, align 8
+  store i64 %.16.i, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit
+
+grammo_in_fill.exit:                              ; preds = %check_full.i, %grow.i
+  %.28.i = phi i64 [ %.16.i, %grow.i ], [ %.12.i, %check_full.i ]
+  %.23.i = phi ptr [ %.19.i, %grow.i ], [ %.17.i, %check_full.i ]
+  %.25.i = getelementptr i8, ptr %.23.i, i64 %.3
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i, ptr align 1 %.25.i, i64 %.11.i, i1 false)
+  %.27.i = getelementptr i8, ptr %.23.i, i64 %.11.i
+  %.29.i = sub i64 %.28.i, %.11.i
+  %.30.i = tail call i64 @read(i32 0, ptr %.27.i, i64 %.29.i)
+  %.31.i = icmp sgt i64 %.30.i, 0
+  %.32.i = tail call i64 @llvm.smax.i64(i64 %.30.i, i64 0)
+  %.33.i = add i64 %.32.i, %.11.i
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i, ptr @grammo_in_end, align 8
+  %.36.i = getelementptr i8, ptr %.23.i, i64 %.33.i
+  store i8 0, ptr %.36.i, align 1
+  br i1 %.31.i, label %skip.outer, label %common.ret
+
+skip_test:                                        ; preds = %skip
+  %.11 = getelementptr i8, ptr %.9, i64 %.3
+  %.12 = load i8, ptr %.11, align 1
+  switch i8 %.12, label %scan.outer [
+    i8 32, label %skip_next
+    i8 13, label %skip_next
+    i8 12, label %skip_next
+    i8 11, label %skip_next
+    i8 10, label %skip_next
+    i8 9, label %skip_next
+  ]
+
+skip_next:                                        ; preds = %skip_test, %skip_test, %skip_test, %skip_test, %skip_test, %skip_test
+  %.19 = add nuw i64 %.3, 1
+  store i64 %.19, ptr @grammo_in_pos, align 8
+  br label %skip
+
+scan:                                             ; preds = %grammo_in_fill.exit28.peel, %grammo_in_fill.exit28
+  %.24 = phi i64 [ %.33.i20, %grammo_in_fill.exit28 ], [ %.33.i20.peel, %grammo_in_fill.exit28.peel ]
+  %.25 = icmp ult i64 %length.ph, %.24
+  %.27 = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.25, label %scan_test, label %scan_fill
+
+scan_test:                                        ; preds = %scan, %scan.outer
+  %.24.lcssa = phi i64 [ %.2444, %scan.outer ], [ %.24, %scan ]
+  %.22.lcssa = phi i64 [ %.2242, %scan.outer ], [ 0, %scan ]
+  %.23.lcssa = phi i64 [ %.23.peel, %scan.outer ], [ %length.ph, %scan ]
+  %.27.lcssa = phi ptr [ %.27.peel, %scan.outer ], [ %.27, %scan ]
+  %.28 = getelementptr i8, ptr %.27.lcssa, i64 %.23.lcssa
+  %.29 = load i8, ptr %.28, align 1
+  switch i8 %.29, label %scan_next [
+    i8 32, label %common.ret
+    i8 13, label %common.ret
+    i8 12, label %common.ret
+    i8 11, label %common.ret
+    i8 10, label %common.ret
+    i8 9, label %common.ret
+  ]
+
+scan_next:                                        ; preds = %scan_test
+  %.35 = add i64 %length.ph, 1
+  br label %scan.outer
+
+scan.outer:                                       ; preds = %skip_test, %scan_next
+  %.2444 = phi i64 [ %.24.lcssa, %scan_next ], [ %.4.ph, %skip_test ]
+  %.2242 = phi i64 [ %.22.lcssa, %scan_next ], [ %.3, %skip_test ]
+  %length.ph = phi i64 [ %.35, %scan_next ], [ 1, %skip_test ]
+  %.23.peel = add i64 %.2242, %length.ph
+  %.25.peel = icmp ult i64 %.23.peel, %.2444
+  %.27.peel = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.25.peel, label %scan_test, label %scan_fill.peel
+
+scan_fill.peel:                                   ; preds = %scan.outer
+  %.3.i2.peel = icmp eq ptr %.27.peel, null
+  br i1 %.3.i2.peel, label %alloc.i26.peel, label %entry.check_full_crit_edge.i3.peel
+
+entry.check_full_crit_edge.i3.peel:               ; preds = %scan_fill.peel
+  %.12.pre.i4.peel = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.peel
+
+alloc.i26.peel:                                   ; preds = %scan_fill.peel
+  %.5.i27.peel = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i27.peel, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.peel
+
+check_full.i5.peel:                               ; preds = %alloc.i26.peel, %entry.check_full_crit_edge.i3.peel
+  %.17.i6.peel = phi ptr [ %.27.peel, %entry.check_full_crit_edge.i3.peel ], [ %.5.i27.peel, %alloc.i26.peel ]
+  %.12.i7.peel = phi i64 [ %.12.pre.i4.peel, %entry.check_full_crit_edge.i3.peel ], [ 65536, %alloc.i26.peel ]
+  %.11.i10.peel = sub i64 %.2444, %.2242
+  %.13.i11.peel = icmp eq i64 %.11.i10.peel, %.12.i7.peel
+  br i1 %.13.i11.peel, label %grow.i22.peel, label %grammo_in_fill.exit28.peel
+
+grow.i22.peel:                                    ; preds = %check_full.i5.peel
+  %.16.i23.peel = shl i64 %.12.i7.peel, 1
+  %.18.i24.peel = or disjoint i64 %.16.i23.peel, 1
+  %.19.i25.peel = tail call ptr @realloc(ptr %.17.i6.peel, i64 %.18.i24.peel)
+  store ptr %.19.i25.peel, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23.peel, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28.peel
+
+grammo_in_fill.exit28.peel:                       ; preds = %grow.i22.peel, %check_full.i5.peel
+  %.28.i12.peel = phi i64 [ %.16.i23.peel, %grow.i22.peel ], [ %.12.i7.peel, %check_full.i5.peel ]
+  %.23.i13.peel = phi ptr [ %.19.i25.peel, %grow.i22.peel ], [ %.17.i6.peel, %check_full.i5.peel ]
+  %.25.i14.peel = getelementptr i8, ptr %.23.i13.peel, i64 %.2242
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i13.peel, ptr align 1 %.25.i14.peel, i64 %.11.i10.peel, i1 false)
+  %.27.i15.peel = getelementptr i8, ptr %.23.i13.peel, i64 %.11.i10.peel
+  %.29.i16.peel = sub i64 %.28.i12.peel, %.11.i10.peel
+  %.30.i17.peel = tail call i64 @read(i32 0, ptr %.27.i15.peel, i64 %.29.i16.peel)
+  %.31.i18.peel = icmp sgt i64 %.30.i17.peel, 0
+  %.32.i19.peel = tail call i64 @llvm.smax.i64(i64 %.30.i17.peel, i64 0)
+  %.33.i20.peel = add i64 %.32.i19.peel, %.11.i10.peel
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20.peel, ptr @grammo_in_end, align 8
+  %.36.i21.peel = getelementptr i8, ptr %.23.i13.peel, i64 %.33.i20.peel
+  store i8 0, ptr %.36.i21.peel, align 1
+  br i1 %.31.i18.peel, label %scan, label %common.ret
+
+scan_fill:                                        ; preds = %scan
+  %.3.i2 = icmp eq ptr %.27, null
+  br i1 %.3.i2, label %alloc.i26, label %entry.check_full_crit_edge.i3
+
+entry.check_full_crit_edge.i3:                    ; preds = %scan_fill
+  %.12.pre.i4 = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i5
+
+alloc.i26:                                        ; preds = %scan_fill
+  %.5.i27 = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i27, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i5
+
+check_full.i5:                                    ; preds = %alloc.i26, %entry.check_full_crit_edge.i3
+  %.17.i6 = phi ptr [ %.27, %entry.check_full_crit_edge.i3 ], [ %.5.i27, %alloc.i26 ]
+  %.12.i7 = phi i64 [ %.12.pre.i4, %entry.check_full_crit_edge.i3 ], [ 65536, %alloc.i26 ]
+  %.13.i11 = icmp eq i64 %.24, %.12.i7
+  br i1 %.13.i11, label %grow.i22, label %grammo_in_fill.exit28
+
+grow.i22:                                         ; preds = %check_full.i5
+  %.16.i23 = shl i64 %.12.i7, 1
+  %.18.i24 = or disjoint i64 %.16.i23, 1
+  %.19.i25 = tail call ptr @realloc(ptr %.17.i6, i64 %.18.i24)
+  store ptr %.19.i25, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28
+
+grammo_in_fill.exit28:                            ; preds = %check_full.i5, %grow.i22
+  %.28.i12 = phi i64 [ %.16.i23, %grow.i22 ], [ %.12.i7, %check_full.i5 ]
+  %.23.i13 = phi ptr [ %.19.i25, %grow.i22 ], [ %.17.i6, %check_full.i5 ]
+  %.27.i15 = getelementptr i8, ptr %.23.i13, i64 %.24
+  %.29.i16 = sub i64 %.28.i12, %.24
+  %.30.i17 = tail call i64 @read(i32 0, ptr %.27.i15, i64 %.29.i16)
+  %.31.i18 = icmp sgt i64 %.30.i17, 0
+  %.32.i19 = tail call i64 @llvm.smax.i64(i64 %.30.i17, i64 0)
+  %.33.i20 = add i64 %.32.i19, %.24
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20, ptr @grammo_in_end, align 8
+  %.36.i21 = getelementptr i8, ptr %.23.i13, i64 %.33.i20
+  store i8 0, ptr %.36.i21, align 1
+  br i1 %.31.i18, label %scan, label %common.ret, !llvm.loop !0
+
+common.ret:                                       ; preds = %grammo_in_fill.exit, %scan_test, %scan_test, %scan_test, %scan_test, %scan_test, %scan_test, %grammo_in_fill.exit28, %grammo_in_fill.exit28.peel
+  %common.ret.op = phi i64 [ %length.ph, %grammo_in_fill.exit28.peel ], [ %length.ph, %grammo_in_fill.exit28 ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ 0, %grammo_in_fill.exit ]
+  ret i64 %common.ret.op
+}
+
+; Function Attrs: nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memcpy.p0.p0.i64(ptr noalias nocapture writeonly, ptr noalias nocapture readonly, i64, i1 immarg) #6
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i64 @llvm.smax.i64(i64, i64) #7
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i32 @llvm.smax.i32(i32, i32) #7
+
+; Function Attrs: nocallback nofree nosync nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.lifetime.start.p0(i64 immarg, ptr nocapture) #8
+
+; Function Attrs: nocallback nofree nosync nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.lifetime.end.p0(i64 immarg, ptr nocapture) #8
 
 attributes #0 = { nofree nounwind }
+attributes #1 = { mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #2 = { nounwind }
+attributes #3 = { mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #4 = { mustprogress nofree nounwind willreturn }
+attributes #5 = { mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+attributes #6 = { nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+attributes #7 = { nocallback nofree nosync nounwind speculatable willreturn memory(none) }
+attributes #8 = { nocallback nofree nosync nounwind willreturn memory(argmem: readwrite) }
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.peeled.count", i32 1}
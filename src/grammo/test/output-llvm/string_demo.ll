@@ -1,172 +1,1385 @@
 ; ModuleID = '<string>'
 source_filename = "<string>"
-target triple = "x86_64-pc-windows-msvc"
-
-@str_0 = constant [1 x i8] zeroinitializer
-@str_1 = constant [14 x i8] c"Demo stringhe\00"
-@str_2 = constant [3 x i8] c"%s\00"
-@str_3 = local_unnamed_addr constant [2 x i8] c"\0A\00"
-@str_4 = constant [7 x i8] c"Nome: \00"
-@str_5 = constant [6 x i8] c"%255s\00"
-@str_6 = constant [24 x i8] c"Larghezza linea (int): \00"
-@str_7 = constant [3 x i8] c"%d\00"
-@str_8 = local_unnamed_addr constant [2 x i8] c"-\00"
-@str_9 = local_unnamed_addr constant [2 x i8] c"[\00"
-@str_10 = local_unnamed_addr constant [2 x i8] c"]\00"
-@str_11 = local_unnamed_addr constant [6 x i8] c"Ciao \00"
-@str_12 = local_unnamed_addr constant [2 x i8] c"!\00"
-@str_13 = constant [7 x i8] c"Echo: \00"
+target datalayout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-i128:128-f80:128-n8:16:32:64-S128"
+target triple = "x86_64-unknown-linux-gnu"
 
-; Function Attrs: nofree nounwind
-declare noundef i32 @printf(ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+@gstr_0 = private constant { i64, i64, i64, [1 x i8] } zeroinitializer
+@grammo_out_buf = internal unnamed_addr global ptr null
+@grammo_out_cap = internal unnamed_addr global i64 0
+@grammo_out_len = internal unnamed_addr global i64 0
+@grammo_out_tty = internal unnamed_addr global i32 -1
+@str_0 = private unnamed_addr constant [15 x i8] c"Demo stringhe\0A\00"
+@str_1 = private unnamed_addr constant [7 x i8] c"Nome: \00"
+@grammo_in_buf = internal unnamed_addr global ptr null
+@grammo_in_cap = internal unnamed_addr global i64 0
+@grammo_in_pos = internal unnamed_addr global i64 0
+@grammo_in_end = internal unnamed_addr global i64 0
+@str_2 = private unnamed_addr constant [24 x i8] c"Larghezza linea (int): \00"
+@gstr_1 = private constant { i64, i64, i64, [2 x i8] } { i64 1, i64 0, i64 0, [2 x i8] c"-\00" }
+@gstr_4 = private unnamed_addr constant { i64, i64, i64, [6 x i8] } { i64 5, i64 0, i64 0, [6 x i8] c"Ciao \00" }
+@str_3 = private constant [6 x i8] c"%.*s\0A\00"
+@str_4 = private unnamed_addr constant [7 x i8] c"Echo: \00"
 
 ; Function Attrs: nofree nounwind
-declare noundef i32 @scanf(ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+declare noundef i32 @snprintf(ptr noalias nocapture noundef writeonly, i64 noundef, ptr nocapture noundef readonly, ...) local_unnamed_addr #0
+
+; Function Attrs: mustprogress nounwind willreturn allockind("free") memory(argmem: readwrite, inaccessiblemem: readwrite)
+declare void @free(ptr allocptr nocapture noundef) local_unnamed_addr #1
 
-; Function Attrs: mustprogress nofree nounwind willreturn memory(argmem: read)
-declare i64 @strlen(ptr nocapture) local_unnamed_addr #1
+; Function Attrs: mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite)
+declare noalias noundef ptr @realloc(ptr allocptr nocapture, i64 noundef) local_unnamed_addr #2
 
 ; Function Attrs: mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite)
-declare noalias noundef ptr @malloc(i64 noundef) local_unnamed_addr #2
+declare noalias noundef ptr @malloc(i64 noundef) local_unnamed_addr #3
 
-; Function Attrs: mustprogress nofree nounwind willreturn memory(argmem: readwrite)
-declare ptr @strcpy(ptr noalias returned writeonly, ptr noalias nocapture readonly) local_unnamed_addr #3
+; Function Attrs: nofree nounwind
+declare noundef i64 @write(i32 noundef, ptr nocapture noundef readonly, i64 noundef) local_unnamed_addr #0
 
-; Function Attrs: mustprogress nofree nounwind willreturn memory(argmem: readwrite)
-declare ptr @strcat(ptr noalias returned, ptr noalias nocapture readonly) local_unnamed_addr #3
+; Function Attrs: nounwind
+declare i32 @isatty(i32) local_unnamed_addr #4
 
 ; Function Attrs: nofree nounwind
-define noundef ptr @repeat(ptr nocapture readonly %rp_s, i32 %rp_n) local_unnamed_addr #0 {
+declare noundef i64 @read(i32 noundef, ptr nocapture noundef, i64 noundef) local_unnamed_addr #0
+
+; Function Attrs: mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memcpy.p0.p0.i64(ptr noalias nocapture writeonly, ptr noalias nocapture readonly, i64, i1 immarg) #5
+
+; Function Attrs: mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite)
+declare void @llvm.memmove.p0.p0.i64(ptr nocapture writeonly, ptr nocapture readonly, i64, i1 immarg) #5
+
+; Function Attrs: nounwind
+define internal fastcc ptr @g.repeat(ptr %rp_s, i32 %rp_n) unnamed_addr #4 {
 entry:
-  %.122 = icmp sgt i32 %rp_n, 0
-  br i1 %.122, label %for_body, label %for_end
-
-for_body:                                         ; preds = %entry, %for_body
-  %rp_i.04 = phi i32 [ %.22, %for_body ], [ 0, %entry ]
-  %rp_out.03 = phi ptr [ %.18, %for_body ], [ @str_0, %entry ]
-  %.14 = tail call i64 @strlen(ptr noundef nonnull dereferenceable(1) %rp_out.03)
-  %.15 = tail call i64 @strlen(ptr noundef nonnull dereferenceable(1) %rp_s)
-  %.16 = add i64 %.14, 1
-  %.17 = add i64 %.16, %.15
-  %.18 = tail call ptr @malloc(i64 %.17)
-  %.19 = tail call ptr @strcpy(ptr noundef nonnull dereferenceable(1) %.18, ptr noundef nonnull dereferenceable(1) %rp_out.03)
-  %.20 = tail call ptr @strcat(ptr noundef nonnull dereferenceable(1) %.18, ptr noundef nonnull dereferenceable(1) %rp_s)
-  %.22 = add nuw nsw i32 %rp_i.04, 1
-  %.12 = icmp slt i32 %.22, %rp_n
-  br i1 %.12, label %for_body, label %for_end
-
-for_end:                                          ; preds = %for_body, %entry
-  %rp_out.0.lcssa = phi ptr [ @str_0, %entry ], [ %.18, %for_body ]
+  %.1623 = icmp sgt i32 %rp_n, 0
+  br i1 %.1623, label %for_body.lr.ph, label %for_end
+
+for_body.lr.ph:                                   ; preds = %entry
+  %.7.i = getelementptr i8, ptr %rp_s, i64 -24
+  br label %for_body
+
+for_body:                                         ; preds = %for_body.lr.ph, %grammo_str_append.exit
+  %rp_i.025 = phi i32 [ 0, %for_body.lr.ph ], [ %.20, %grammo_str_append.exit ]
+  %rp_out.024 = phi ptr [ getelementptr inbounds nuw (i8, ptr @gstr_0, i64 24), %for_body.lr.ph ], [ %dst.i, %grammo_str_append.exit ]
+  %.5.i = getelementptr i8, ptr %rp_out.024, i64 -24
+  %len.i = load i64, ptr %.5.i, align 8
+  %len.1.i = load i64, ptr %.7.i, align 8
+  %.9.i = getelementptr i8, ptr %rp_out.024, i64 -16
+  %cap.i = load i64, ptr %.9.i, align 8
+  %.11.i = getelementptr i8, ptr %rp_out.024, i64 -8
+  %rc.i = load i64, ptr %.11.i, align 8
+  %.12.i = add i64 %len.1.i, %len.i
+  %.13.i = icmp ne i64 %cap.i, 0
+  %.14.i = icmp eq i64 %rc.i, 1
+  %.15.i = and i1 %.13.i, %.14.i
+  br i1 %.15.i, label %check_cap.i, label %copy.i
+
+grow.i:                                           ; preds = %check_cap.i
+  %.19.i = shl i64 %cap.i, 1
+  %.21.i = tail call i64 @llvm.umax.i64(i64 %.12.i, i64 %.19.i)
+  %.23.i = add i64 %.21.i, 25
+  %.24.i = tail call ptr @realloc(ptr nonnull %.5.i, i64 %.23.i)
+  %.25.i = getelementptr i8, ptr %.24.i, i64 24
+  %.27.i = getelementptr i8, ptr %.24.i, i64 8
+  store i64 %.21.i, ptr %.27.i, align 8
+  %.29.i = icmp eq ptr %rp_s, %rp_out.024
+  %.30.i = select i1 %.29.i, ptr %.25.i, ptr %rp_s
+  br label %grammo_str_append.exit
+
+check_cap.i:                                      ; preds = %for_body
+  %.17.not.i = icmp ugt i64 %.12.i, %cap.i
+  br i1 %.17.not.i, label %grow.i, label %grammo_str_append.exit
+
+copy.i:                                           ; preds = %for_body
+  %.32.i = shl i64 %.12.i, 1
+  %.34.i = tail call i64 @llvm.umax.i64(i64 %.32.i, i64 16)
+  %.6.i.i = add i64 %.34.i, 25
+  %.7.i.i = tail call ptr @malloc(i64 %.6.i.i)
+  store i64 %len.i, ptr %.7.i.i, align 8
+  %.11.i.i = getelementptr i8, ptr %.7.i.i, i64 8
+  store i64 %.34.i, ptr %.11.i.i, align 8
+  %.13.i.i = getelementptr i8, ptr %.7.i.i, i64 16
+  store i64 1, ptr %.13.i.i, align 8
+  %.15.i.i = getelementptr i8, ptr %.7.i.i, i64 24
+  %.16.i.i = getelementptr i8, ptr %.15.i.i, i64 %len.i
+  store i8 0, ptr %.16.i.i, align 1
+  tail call void @llvm.memcpy.p0.p0.i64(ptr align 1 %.15.i.i, ptr nonnull align 1 %rp_out.024, i64 %len.i, i1 false)
+  %.5.not.i.i = icmp eq i64 %cap.i, 0
+  br i1 %.5.not.i.i, label %grammo_str_append.exit, label %dec.i.i
+
+dec.i.i:                                          ; preds = %copy.i
+  %.10.i.i = add i64 %rc.i, -1
+  store i64 %.10.i.i, ptr %.11.i, align 8
+  %.12.i.i = icmp eq i64 %.10.i.i, 0
+  br i1 %.12.i.i, label %free.i.i, label %grammo_str_append.exit
+
+free.i.i:                                         ; preds = %dec.i.i
+  tail call void @free(ptr %.5.i)
+  br label %grammo_str_append.exit
+
+grammo_str_append.exit:                           ; preds = %grow.i, %check_cap.i, %copy.i, %dec.i.i, %free.i.i
+  %dst.i = phi ptr [ %rp_out.024, %check_cap.i ], [ %.25.i, %grow.i ], [ %.15.i.i, %copy.i ], [ %.15.i.i, %dec.i.i ], [ %.15.i.i, %free.i.i ]
+  %src.i = phi ptr [ %rp_s, %check_cap.i ], [ %.30.i, %grow.i ], [ %rp_s, %copy.i ], [ %rp_s, %dec.i.i ], [ %rp_s, %free.i.i ]
+  %.39.i = getelementptr i8, ptr %dst.i, i64 %len.i
+  tail call void @llvm.memcpy.p0.p0.i64(ptr align 1 %.39.i, ptr align 1 %src.i, i64 %len.1.i, i1 false)
+  %.42.i = getelementptr i8, ptr %dst.i, i64 -24
+  store i64 %.12.i, ptr %.42.i, align 8
+  %.44.i = getelementptr i8, ptr %dst.i, i64 %.12.i
+  store i8 0, ptr %.44.i, align 1
+  %.20 = add nuw nsw i32 %rp_i.025, 1
+  %exitcond.not = icmp eq i32 %.20, %rp_n
+  br i1 %exitcond.not, label %for_end, label %for_body
+
+for_end:                                          ; preds = %grammo_str_append.exit, %entry
+  %rp_out.0.lcssa = phi ptr [ getelementptr inbounds nuw (i8, ptr @gstr_0, i64 24), %entry ], [ %dst.i, %grammo_str_append.exit ]
+  %.4.i = getelementptr i8, ptr %rp_out.0.lcssa, i64 -16
+  %cap.i2 = load i64, ptr %.4.i, align 8
+  %.5.not.i = icmp eq i64 %cap.i2, 0
+  br i1 %.5.not.i, label %grammo_str_retain.exit, label %inc.i
+
+inc.i:                                            ; preds = %for_end
+  %.8.i = getelementptr i8, ptr %rp_out.0.lcssa, i64 -8
+  %.9.i3 = load i64, ptr %.8.i, align 8
+  %.10.i = add i64 %.9.i3, 1
+  store i64 %.10.i, ptr %.8.i, align 8
+  br label %grammo_str_retain.exit
+
+grammo_str_retain.exit:                           ; preds = %for_end, %inc.i
+  %.4.i4 = getelementptr i8, ptr %rp_s, i64 -16
+  %cap.i5 = load i64, ptr %.4.i4, align 8
+  %.5.not.i6 = icmp eq i64 %cap.i5, 0
+  br i1 %.5.not.i6, label %grammo_str_release.exit, label %dec.i
+
+dec.i:                                            ; preds = %grammo_str_retain.exit
+  %.8.i7 = getelementptr i8, ptr %rp_s, i64 -8
+  %.9.i8 = load i64, ptr %.8.i7, align 8
+  %.10.i9 = add i64 %.9.i8, -1
+  store i64 %.10.i9, ptr %.8.i7, align 8
+  %.12.i10 = icmp eq i64 %.10.i9, 0
+  br i1 %.12.i10, label %free.i, label %grammo_str_release.exit
+
+free.i:                                           ; preds = %dec.i
+  %.14.i11 = getelementptr i8, ptr %rp_s, i64 -24
+  tail call void @free(ptr %.14.i11)
+  br label %grammo_str_release.exit
+
+grammo_str_release.exit:                          ; preds = %grammo_str_retain.exit, %dec.i, %free.i
+  %cap.i13 = load i64, ptr %.4.i, align 8
+  %.5.not.i14 = icmp eq i64 %cap.i13, 0
+  br i1 %.5.not.i14, label %grammo_str_release.exit22, label %dec.i15
+
+dec.i15:                                          ; preds = %grammo_str_release.exit
+  %.8.i16 = getelementptr i8, ptr %rp_out.0.lcssa, i64 -8
+  %.9.i17 = load i64, ptr %.8.i16, align 8
+  %.10.i18 = add i64 %.9.i17, -1
+  store i64 %.10.i18, ptr %.8.i16, align 8
+  %.12.i19 = icmp eq i64 %.10.i18, 0
+  br i1 %.12.i19, label %free.i20, label %grammo_str_release.exit22
+
+free.i20:                                         ; preds = %dec.i15
+  %.14.i21 = getelementptr i8, ptr %rp_out.0.lcssa, i64 -24
+  tail call void @free(ptr %.14.i21)
+  br label %grammo_str_release.exit22
+
+grammo_str_release.exit22:                        ; preds = %grammo_str_release.exit, %dec.i15, %free.i20
   ret ptr %rp_out.0.lcssa
 }
 
-; Function Attrs: mustprogress nofree nounwind willreturn
-define noundef ptr @surround(ptr nocapture readonly %sd_core, ptr nocapture readonly %sd_left, ptr nocapture readonly %sd_right) local_unnamed_addr #4 {
+; Function Attrs: nounwind
+define void @main() local_unnamed_addr #4 {
 entry:
-  %.8 = tail call i64 @strlen(ptr noundef nonnull dereferenceable(1) %sd_left)
-  %.9 = tail call i64 @strlen(ptr noundef nonnull dereferenceable(1) %sd_core)
-  %.10 = add i64 %.8, 1
-  %.11 = add i64 %.10, %.9
-  %.12 = tail call ptr @malloc(i64 %.11)
-  %.13 = tail call ptr @strcpy(ptr noundef nonnull dereferenceable(1) %.12, ptr noundef nonnull dereferenceable(1) %sd_left)
-  %.14 = tail call ptr @strcat(ptr noundef nonnull dereferenceable(1) %.12, ptr noundef nonnull dereferenceable(1) %sd_core)
-  %.15 = tail call i64 @strlen(ptr noundef nonnull dereferenceable(1) %.12)
-  %.16 = tail call i64 @strlen(ptr noundef nonnull dereferenceable(1) %sd_right)
-  %.17 = add i64 %.15, 1
-  %.18 = add i64 %.17, %.16
-  %.19 = tail call ptr @malloc(i64 %.18)
-  %.20 = tail call ptr @strcpy(ptr noundef nonnull dereferenceable(1) %.19, ptr noundef nonnull dereferenceable(1) %.12)
-  %.21 = tail call ptr @strcat(ptr noundef nonnull dereferenceable(1) %.19, ptr noundef nonnull dereferenceable(1) %sd_right)
-  ret ptr %.19
+  %.4.i = load i64, ptr @grammo_out_len, align 8
+  %.5.i = add i64 %.4.i, 15
+  %.6.i = load i64, ptr @grammo_out_cap, align 8
+  %.7.not.i = icmp ugt i64 %.5.i, %.6.i
+  %.20.pre1.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i, label %loop.i.i, label %grammo_out_reserve.exit
+
+loop.i.i:                                         ; preds = %entry, %body.i.i
+  %written.i.i = phi i64 [ %.10.i.i, %body.i.i ], [ 0, %entry ]
+  %.5.i.i = icmp slt i64 %written.i.i, %.4.i
+  br i1 %.5.i.i, label %body.i.i, label %grammo_out_flush.exit.i
+
+body.i.i:                                         ; preds = %loop.i.i
+  %.7.i.i = getelementptr i8, ptr %.20.pre1.i, i64 %written.i.i
+  %.8.i.i = sub i64 %.4.i, %written.i.i
+  %.9.i.i = tail call i64 @write(i32 1, ptr %.7.i.i, i64 %.8.i.i)
+  %.10.i.i = add i64 %.9.i.i, %written.i.i
+  %.11.i.i = icmp sgt i64 %.9.i.i, 0
+  br i1 %.11.i.i, label %loop.i.i, label %grammo_out_flush.exit.i
+
+grammo_out_flush.exit.i:                          ; preds = %body.i.i, %loop.i.i
+  %.10.i = load i64, ptr @grammo_out_cap, align 8
+  %.11.not.i = icmp ult i64 %.10.i, 15
+  %.20.pre.i = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.11.not.i, label %grow.i, label %grammo_out_reserve.exit
+
+grow.i:                                           ; preds = %grammo_out_flush.exit.i
+  %.16.i = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i, i64 65536)
+  store ptr %.16.i, ptr @grammo_out_buf, align 8
+  store i64 65536, ptr @grammo_out_cap, align 8
+  br label %grammo_out_reserve.exit
+
+grammo_out_reserve.exit:                          ; preds = %entry, %grammo_out_flush.exit.i, %grow.i
+  %.7.i = phi i64 [ 0, %grow.i ], [ 0, %grammo_out_flush.exit.i ], [ %.4.i, %entry ]
+  %.20.i = phi ptr [ %.16.i, %grow.i ], [ %.20.pre.i, %grammo_out_flush.exit.i ], [ %.20.pre1.i, %entry ]
+  %.22.i = getelementptr i8, ptr %.20.i, i64 %.7.i
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(15) %.22.i, ptr noundef nonnull align 1 dereferenceable(15) @str_0, i64 15, i1 false)
+  %.8.i = add i64 %.7.i, 14
+  store i64 %.8.i, ptr @grammo_out_len, align 8
+  %.2.i.i = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i = icmp slt i32 %.2.i.i, 0
+  br i1 %.3.i.i, label %check.i.i, label %grammo_out_interactive.exit.i
+
+check.i.i:                                        ; preds = %grammo_out_reserve.exit
+  %.5.i.i10 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i10, ptr @grammo_out_tty, align 4
+  %.4.i11.pre.pre = load i64, ptr @grammo_out_len, align 8
+  %.20.pre1.i15.pre458.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_interactive.exit.i
+
+grammo_out_interactive.exit.i:                    ; preds = %check.i.i, %grammo_out_reserve.exit
+  %.20.pre1.i15.pre458 = phi ptr [ %.20.pre1.i15.pre458.pre, %check.i.i ], [ %.20.i, %grammo_out_reserve.exit ]
+  %.4.i11.pre = phi i64 [ %.4.i11.pre.pre, %check.i.i ], [ %.8.i, %grammo_out_reserve.exit ]
+  %.8.i.i1 = phi i32 [ %.5.i.i10, %check.i.i ], [ %.2.i.i, %grammo_out_reserve.exit ]
+  %.9.i.i2 = icmp sgt i32 %.8.i.i1, 0
+  br i1 %.9.i.i2, label %loop.i.i3, label %grammo_out_advance.exit
+
+loop.i.i3:                                        ; preds = %grammo_out_interactive.exit.i, %body.i.i6
+  %written.i.i4 = phi i64 [ %.10.i.i8, %body.i.i6 ], [ 0, %grammo_out_interactive.exit.i ]
+  %.5.i3.i = icmp slt i64 %written.i.i4, %.4.i11.pre
+  br i1 %.5.i3.i, label %body.i.i6, label %grammo_out_flush.exit.i5
+
+body.i.i6:                                        ; preds = %loop.i.i3
+  %.7.i.i7 = getelementptr i8, ptr %.20.pre1.i15.pre458, i64 %written.i.i4
+  %.8.i4.i = sub i64 %.4.i11.pre, %written.i.i4
+  %.9.i5.i = tail call i64 @write(i32 1, ptr %.7.i.i7, i64 %.8.i4.i)
+  %.10.i.i8 = add i64 %.9.i5.i, %written.i.i4
+  %.11.i.i9 = icmp sgt i64 %.9.i5.i, 0
+  br i1 %.11.i.i9, label %loop.i.i3, label %grammo_out_flush.exit.i5
+
+grammo_out_flush.exit.i5:                         ; preds = %body.i.i6, %loop.i.i3
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i15.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit
+
+grammo_out_advance.exit:                          ; preds = %grammo_out_interactive.exit.i, %grammo_out_flush.exit.i5
+  %.20.pre1.i15 = phi ptr [ %.20.pre1.i15.pre458, %grammo_out_interactive.exit.i ], [ %.20.pre1.i15.pre, %grammo_out_flush.exit.i5 ]
+  %.4.i11 = phi i64 [ %.4.i11.pre, %grammo_out_interactive.exit.i ], [ 0, %grammo_out_flush.exit.i5 ]
+  %.5.i12 = add i64 %.4.i11, 7
+  %.6.i13 = load i64, ptr @grammo_out_cap, align 8
+  %.7.not.i14 = icmp ugt i64 %.5.i12, %.6.i13
+  br i1 %.7.not.i14, label %loop.i.i19, label %grammo_out_reserve.exit34
+
+loop.i.i19:                                       ; preds = %grammo_out_advance.exit, %body.i.i28
+  %written.i.i20 = phi i64 [ %.10.i.i32, %body.i.i28 ], [ 0, %grammo_out_advance.exit ]
+  %.5.i.i21 = icmp slt i64 %written.i.i20, %.4.i11
+  br i1 %.5.i.i21, label %body.i.i28, label %grammo_out_flush.exit.i22
+
+body.i.i28:                                       ; preds = %loop.i.i19
+  %.7.i.i29 = getelementptr i8, ptr %.20.pre1.i15, i64 %written.i.i20
+  %.8.i.i30 = sub i64 %.4.i11, %written.i.i20
+  %.9.i.i31 = tail call i64 @write(i32 1, ptr %.7.i.i29, i64 %.8.i.i30)
+  %.10.i.i32 = add i64 %.9.i.i31, %written.i.i20
+  %.11.i.i33 = icmp sgt i64 %.9.i.i31, 0
+  br i1 %.11.i.i33, label %loop.i.i19, label %grammo_out_flush.exit.i22
+
+grammo_out_flush.exit.i22:                        ; preds = %body.i.i28, %loop.i.i19
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.i23 = load i64, ptr @grammo_out_cap, align 8
+  %.11.not.i24 = icmp ult i64 %.10.i23, 7
+  %.20.pre.i25 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.11.not.i24, label %grow.i26, label %grammo_out_reserve.exit34
+
+grow.i26:                                         ; preds = %grammo_out_flush.exit.i22
+  %.16.i27 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i25, i64 65536)
+  store ptr %.16.i27, ptr @grammo_out_buf, align 8
+  store i64 65536, ptr @grammo_out_cap, align 8
+  br label %grammo_out_reserve.exit34
+
+grammo_out_reserve.exit34:                        ; preds = %grammo_out_advance.exit, %grammo_out_flush.exit.i22, %grow.i26
+  %.21.i16 = phi i64 [ 0, %grow.i26 ], [ 0, %grammo_out_flush.exit.i22 ], [ %.4.i11, %grammo_out_advance.exit ]
+  %.20.i17 = phi ptr [ %.16.i27, %grow.i26 ], [ %.20.pre.i25, %grammo_out_flush.exit.i22 ], [ %.20.pre1.i15, %grammo_out_advance.exit ]
+  %.22.i18 = getelementptr i8, ptr %.20.i17, i64 %.21.i16
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(7) %.22.i18, ptr noundef nonnull align 1 dereferenceable(7) @str_1, i64 7, i1 false)
+  %.7.i35 = load i64, ptr @grammo_out_len, align 8
+  %.8.i36 = add i64 %.7.i35, 6
+  store i64 %.8.i36, ptr @grammo_out_len, align 8
+  %.2.i.i37 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i38 = icmp slt i32 %.2.i.i37, 0
+  br i1 %.3.i.i38, label %check.i.i55, label %grammo_out_interactive.exit.i39
+
+check.i.i55:                                      ; preds = %grammo_out_reserve.exit34
+  %.5.i.i56 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i56, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i39
+
+grammo_out_interactive.exit.i39:                  ; preds = %check.i.i55, %grammo_out_reserve.exit34
+  %.8.i.i40 = phi i32 [ %.5.i.i56, %check.i.i55 ], [ %.2.i.i37, %grammo_out_reserve.exit34 ]
+  %.9.i.i41 = icmp sgt i32 %.8.i.i40, 0
+  br i1 %.9.i.i41, label %flush.i42, label %grammo_out_sync.exit
+
+flush.i42:                                        ; preds = %grammo_out_interactive.exit.i39
+  %.2.i1.i43 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i44 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i45
+
+loop.i.i45:                                       ; preds = %body.i.i49, %flush.i42
+  %written.i.i46 = phi i64 [ 0, %flush.i42 ], [ %.10.i.i53, %body.i.i49 ]
+  %.5.i3.i47 = icmp slt i64 %written.i.i46, %.3.i2.i44
+  br i1 %.5.i3.i47, label %body.i.i49, label %grammo_out_flush.exit.i48
+
+body.i.i49:                                       ; preds = %loop.i.i45
+  %.7.i.i50 = getelementptr i8, ptr %.2.i1.i43, i64 %written.i.i46
+  %.8.i4.i51 = sub i64 %.3.i2.i44, %written.i.i46
+  %.9.i5.i52 = tail call i64 @write(i32 1, ptr %.7.i.i50, i64 %.8.i4.i51)
+  %.10.i.i53 = add i64 %.9.i5.i52, %written.i.i46
+  %.11.i.i54 = icmp sgt i64 %.9.i5.i52, 0
+  br i1 %.11.i.i54, label %loop.i.i45, label %grammo_out_flush.exit.i48
+
+grammo_out_flush.exit.i48:                        ; preds = %body.i.i49, %loop.i.i45
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit
+
+grammo_out_sync.exit:                             ; preds = %grammo_out_interactive.exit.i39, %grammo_out_flush.exit.i48
+  %.3.i = tail call fastcc i64 @grammo_in_token()
+  %.5.i.i57 = tail call i64 @llvm.umax.i64(i64 %.3.i, i64 1)
+  %.6.i.i = add i64 %.5.i.i57, 25
+  %.7.i.i58 = tail call ptr @malloc(i64 %.6.i.i)
+  %.11.i.i59 = getelementptr i8, ptr %.7.i.i58, i64 8
+  store i64 %.5.i.i57, ptr %.11.i.i59, align 8
+  %.13.i.i = getelementptr i8, ptr %.7.i.i58, i64 16
+  store i64 1, ptr %.13.i.i, align 8
+  %.15.i.i = getelementptr i8, ptr %.7.i.i58, i64 24
+  %.16.i.i = getelementptr i8, ptr %.15.i.i, i64 %.3.i
+  %.17.i = load ptr, ptr @grammo_in_buf, align 8
+  %.18.i = load i64, ptr @grammo_in_pos, align 8
+  %.19.i = getelementptr i8, ptr %.17.i, i64 %.18.i
+  tail call void @llvm.memcpy.p0.p0.i64(ptr align 1 %.15.i.i, ptr align 1 %.19.i, i64 %.3.i, i1 false)
+  store i64 %.3.i, ptr %.7.i.i58, align 8
+  store i8 0, ptr %.16.i.i, align 1
+  %.27.i = add i64 %.18.i, %.3.i
+  store i64 %.27.i, ptr @grammo_in_pos, align 8
+  %.4.i60 = load i64, ptr @grammo_out_len, align 8
+  %.5.i61 = add i64 %.4.i60, 24
+  %.6.i62 = load i64, ptr @grammo_out_cap, align 8
+  %.7.not.i63 = icmp ugt i64 %.5.i61, %.6.i62
+  %.20.pre1.i64 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i63, label %loop.i.i68, label %grammo_out_reserve.exit83
+
+loop.i.i68:                                       ; preds = %grammo_out_sync.exit, %body.i.i77
+  %written.i.i69 = phi i64 [ %.10.i.i81, %body.i.i77 ], [ 0, %grammo_out_sync.exit ]
+  %.5.i.i70 = icmp slt i64 %written.i.i69, %.4.i60
+  br i1 %.5.i.i70, label %body.i.i77, label %grammo_out_flush.exit.i71
+
+body.i.i77:                                       ; preds = %loop.i.i68
+  %.7.i.i78 = getelementptr i8, ptr %.20.pre1.i64, i64 %written.i.i69
+  %.8.i.i79 = sub i64 %.4.i60, %written.i.i69
+  %.9.i.i80 = tail call i64 @write(i32 1, ptr %.7.i.i78, i64 %.8.i.i79)
+  %.10.i.i81 = add i64 %.9.i.i80, %written.i.i69
+  %.11.i.i82 = icmp sgt i64 %.9.i.i80, 0
+  br i1 %.11.i.i82, label %loop.i.i68, label %grammo_out_flush.exit.i71
+
+grammo_out_flush.exit.i71:                        ; preds = %body.i.i77, %loop.i.i68
+  %.10.i72 = load i64, ptr @grammo_out_cap, align 8
+  %.11.not.i73 = icmp ult i64 %.10.i72, 24
+  %.20.pre.i74 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.11.not.i73, label %grow.i75, label %grammo_out_reserve.exit83
+
+grow.i75:                                         ; preds = %grammo_out_flush.exit.i71
+  %.16.i76 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i74, i64 65536)
+  store ptr %.16.i76, ptr @grammo_out_buf, align 8
+  store i64 65536, ptr @grammo_out_cap, align 8
+  br label %grammo_out_reserve.exit83
+
+grammo_out_reserve.exit83:                        ; preds = %grammo_out_sync.exit, %grammo_out_flush.exit.i71, %grow.i75
+  %.7.i84 = phi i64 [ 0, %grow.i75 ], [ 0, %grammo_out_flush.exit.i71 ], [ %.4.i60, %grammo_out_sync.exit ]
+  %.20.i66 = phi ptr [ %.16.i76, %grow.i75 ], [ %.20.pre.i74, %grammo_out_flush.exit.i71 ], [ %.20.pre1.i64, %grammo_out_sync.exit ]
+  %.22.i67 = getelementptr i8, ptr %.20.i66, i64 %.7.i84
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(24) %.22.i67, ptr noundef nonnull align 16 dereferenceable(24) @str_2, i64 24, i1 false)
+  %.8.i85 = add i64 %.7.i84, 23
+  store i64 %.8.i85, ptr @grammo_out_len, align 8
+  %.2.i.i86 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i87 = icmp slt i32 %.2.i.i86, 0
+  br i1 %.3.i.i87, label %check.i.i104, label %grammo_out_interactive.exit.i88
+
+check.i.i104:                                     ; preds = %grammo_out_reserve.exit83
+  %.5.i.i105 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i105, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i88
+
+grammo_out_interactive.exit.i88:                  ; preds = %check.i.i104, %grammo_out_reserve.exit83
+  %.8.i.i89 = phi i32 [ %.5.i.i105, %check.i.i104 ], [ %.2.i.i86, %grammo_out_reserve.exit83 ]
+  %.9.i.i90 = icmp sgt i32 %.8.i.i89, 0
+  br i1 %.9.i.i90, label %flush.i91, label %grammo_out_sync.exit106
+
+flush.i91:                                        ; preds = %grammo_out_interactive.exit.i88
+  %.2.i1.i92 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i93 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i94
+
+loop.i.i94:                                       ; preds = %body.i.i98, %flush.i91
+  %written.i.i95 = phi i64 [ 0, %flush.i91 ], [ %.10.i.i102, %body.i.i98 ]
+  %.5.i3.i96 = icmp slt i64 %written.i.i95, %.3.i2.i93
+  br i1 %.5.i3.i96, label %body.i.i98, label %grammo_out_flush.exit.i97
+
+body.i.i98:                                       ; preds = %loop.i.i94
+  %.7.i.i99 = getelementptr i8, ptr %.2.i1.i92, i64 %written.i.i95
+  %.8.i4.i100 = sub i64 %.3.i2.i93, %written.i.i95
+  %.9.i5.i101 = tail call i64 @write(i32 1, ptr %.7.i.i99, i64 %.8.i4.i100)
+  %.10.i.i102 = add i64 %.9.i5.i101, %written.i.i95
+  %.11.i.i103 = icmp sgt i64 %.9.i5.i101, 0
+  br i1 %.11.i.i103, label %loop.i.i94, label %grammo_out_flush.exit.i97
+
+grammo_out_flush.exit.i97:                        ; preds = %body.i.i98, %loop.i.i94
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_sync.exit106
+
+grammo_out_sync.exit106:                          ; preds = %grammo_out_interactive.exit.i88, %grammo_out_flush.exit.i97
+  %.3.i107 = tail call fastcc i64 @grammo_in_token()
+  %.4.i108 = load ptr, ptr @grammo_in_buf, align 8
+  %.5.i109 = load i64, ptr @grammo_in_pos, align 8
+  %.6.i110 = getelementptr i8, ptr %.4.i108, i64 %.5.i109
+  %.7.i111 = load i8, ptr %.6.i110, align 1
+  %.8.i112 = icmp eq i8 %.7.i111, 45
+  %.9.i = icmp eq i8 %.7.i111, 43
+  %.10.i113 = or i1 %.8.i112, %.9.i
+  %.11.i = zext i1 %.10.i113 to i64
+  %.131.i = icmp ugt i64 %.3.i107, %.11.i
+  %.142.i = getelementptr i8, ptr %.6.i110, i64 %.11.i
+  %.153.i = load i8, ptr %.142.i, align 1
+  %.164.i = add i8 %.153.i, -48
+  %.175.i = icmp ult i8 %.164.i, 10
+  %.186.i = and i1 %.175.i, %.131.i
+  br i1 %.186.i, label %digit.i, label %grammo_in_read_int.exit
+
+digit.i:                                          ; preds = %grammo_out_sync.exit106, %digit.i
+  %.169.i = phi i8 [ %.16.i117, %digit.i ], [ %.164.i, %grammo_out_sync.exit106 ]
+  %value8.i = phi i32 [ %.23.i, %digit.i ], [ 0, %grammo_out_sync.exit106 ]
+  %i7.i = phi i64 [ %.20.i114, %digit.i ], [ %.11.i, %grammo_out_sync.exit106 ]
+  %.20.i114 = add nuw i64 %i7.i, 1
+  %.21.i115 = mul i32 %value8.i, 10
+  %.22.i116 = zext nneg i8 %.169.i to i32
+  %.23.i = add i32 %.21.i115, %.22.i116
+  %.13.i = icmp ult i64 %.20.i114, %.3.i107
+  %.14.i = getelementptr i8, ptr %.6.i110, i64 %.20.i114
+  %.15.i = load i8, ptr %.14.i, align 1
+  %.16.i117 = add i8 %.15.i, -48
+  %.17.i118 = icmp ult i8 %.16.i117, 10
+  %.18.i119 = and i1 %.13.i, %.17.i118
+  br i1 %.18.i119, label %digit.i, label %end_digits.i
+
+end_digits.i:                                     ; preds = %digit.i
+  %.25.not.i = icmp ult i64 %i7.i, %.11.i
+  br i1 %.25.not.i, label %grammo_in_read_int.exit, label %store.i
+
+store.i:                                          ; preds = %end_digits.i
+  %.27.i120 = sub i32 0, %.23.i
+  %.28.i = select i1 %.8.i112, i32 %.27.i120, i32 %.23.i
+  %.31.i = add i64 %.20.i114, %.5.i109
+  store i64 %.31.i, ptr @grammo_in_pos, align 8
+  br label %grammo_in_read_int.exit
+
+grammo_in_read_int.exit:                          ; preds = %grammo_out_sync.exit106, %end_digits.i, %store.i
+  %m_width.0 = phi i32 [ 0, %end_digits.i ], [ %.28.i, %store.i ], [ 0, %grammo_out_sync.exit106 ]
+  %.40 = tail call fastcc ptr @g.repeat(ptr nonnull getelementptr inbounds nuw (i8, ptr @gstr_1, i64 24), i32 %m_width.0)
+  %cap.i = load i64, ptr %.11.i.i59, align 8
+  %.5.not.i = icmp eq i64 %cap.i, 0
+  br i1 %.5.not.i, label %grammo_str_retain.exit, label %inc.i
+
+inc.i:                                            ; preds = %grammo_in_read_int.exit
+  %.9.i123 = load i64, ptr %.13.i.i, align 8
+  %.10.i124 = add i64 %.9.i123, 1
+  store i64 %.10.i124, ptr %.13.i.i, align 8
+  br label %grammo_str_retain.exit
+
+grammo_str_retain.exit:                           ; preds = %grammo_in_read_int.exit, %inc.i
+  %len.1.i.i = load i64, ptr %.7.i.i58, align 8
+  %.8.i.i126 = add i64 %len.1.i.i, 1
+  %.5.i.i.i = tail call i64 @llvm.umax.i64(i64 %.8.i.i126, i64 1)
+  %.6.i.i.i = add i64 %.5.i.i.i, 25
+  %.7.i.i.i = tail call ptr @malloc(i64 %.6.i.i.i)
+  store i64 %.8.i.i126, ptr %.7.i.i.i, align 8
+  %.11.i.i.i = getelementptr i8, ptr %.7.i.i.i, i64 8
+  store i64 %.5.i.i.i, ptr %.11.i.i.i, align 8
+  %.13.i.i.i = getelementptr i8, ptr %.7.i.i.i, i64 16
+  store i64 1, ptr %.13.i.i.i, align 8
+  %.15.i.i.i = getelementptr i8, ptr %.7.i.i.i, i64 24
+  %.16.i.i.i = getelementptr i8, ptr %.15.i.i.i, i64 %.8.i.i126
+  store i8 0, ptr %.16.i.i.i, align 1
+  store i8 91, ptr %.15.i.i.i, align 1
+  %.11.i.i127 = getelementptr i8, ptr %.7.i.i.i, i64 25
+  tail call void @llvm.memcpy.p0.p0.i64(ptr align 1 %.11.i.i127, ptr readonly align 1 %.15.i.i, i64 %len.1.i.i, i1 false)
+  %len.i.i = load i64, ptr %.7.i.i.i, align 8
+  %cap.i.i = load i64, ptr %.11.i.i.i, align 8
+  %rc.i.i = load i64, ptr %.13.i.i.i, align 8
+  %.12.i.i = add i64 %len.i.i, 1
+  %.13.i.i128 = icmp ne i64 %cap.i.i, 0
+  %.14.i.i = icmp eq i64 %rc.i.i, 1
+  %.15.i.i129 = and i1 %.13.i.i128, %.14.i.i
+  br i1 %.15.i.i129, label %check_cap.i.i, label %copy.i.i
+
+grow.i.i:                                         ; preds = %check_cap.i.i
+  %.19.i.i = shl i64 %cap.i.i, 1
+  %.21.i.i = tail call i64 @llvm.umax.i64(i64 %.12.i.i, i64 %.19.i.i)
+  %.23.i.i = add i64 %.21.i.i, 25
+  %.24.i.i = tail call ptr @realloc(ptr nonnull %.7.i.i.i, i64 %.23.i.i)
+  %.25.i.i = getelementptr i8, ptr %.24.i.i, i64 24
+  %.27.i.i = getelementptr i8, ptr %.24.i.i, i64 8
+  store i64 %.21.i.i, ptr %.27.i.i, align 8
+  br label %grammo_str_append.exit.i
+
+check_cap.i.i:                                    ; preds = %grammo_str_retain.exit
+  %.17.not.i.i = icmp ugt i64 %.12.i.i, %cap.i.i
+  br i1 %.17.not.i.i, label %grow.i.i, label %grammo_str_append.exit.i
+
+copy.i.i:                                         ; preds = %grammo_str_retain.exit
+  %.32.i.i = shl i64 %.12.i.i, 1
+  %.34.i.i = tail call i64 @llvm.umax.i64(i64 %.32.i.i, i64 16)
+  %.6.i.i2.i = add i64 %.34.i.i, 25
+  %.7.i.i3.i = tail call ptr @malloc(i64 %.6.i.i2.i)
+  store i64 %len.i.i, ptr %.7.i.i3.i, align 8
+  %.11.i.i4.i = getelementptr i8, ptr %.7.i.i3.i, i64 8
+  store i64 %.34.i.i, ptr %.11.i.i4.i, align 8
+  %.13.i.i5.i = getelementptr i8, ptr %.7.i.i3.i, i64 16
+  store i64 1, ptr %.13.i.i5.i, align 8
+  %.15.i.i6.i = getelementptr i8, ptr %.7.i.i3.i, i64 24
+  %.16.i.i7.i = getelementptr i8, ptr %.15.i.i6.i, i64 %len.i.i
+  store i8 0, ptr %.16.i.i7.i, align 1
+  tail call void @llvm.memcpy.p0.p0.i64(ptr align 1 %.15.i.i6.i, ptr nonnull align 1 %.15.i.i.i, i64 %len.i.i, i1 false)
+  %.5.not.i.i.i = icmp eq i64 %cap.i.i, 0
+  br i1 %.5.not.i.i.i, label %grammo_str_append.exit.i, label %dec.i.i.i
+
+dec.i.i.i:                                        ; preds = %copy.i.i
+  %.10.i.i.i = add i64 %rc.i.i, -1
+  store i64 %.10.i.i.i, ptr %.13.i.i.i, align 8
+  %.12.i.i.i = icmp eq i64 %.10.i.i.i, 0
+  br i1 %.12.i.i.i, label %free.i.i.i, label %grammo_str_append.exit.i
+
+free.i.i.i:                                       ; preds = %dec.i.i.i
+  tail call void @free(ptr nonnull %.7.i.i.i)
+  br label %grammo_str_append.exit.i
+
+grammo_str_append.exit.i:                         ; preds = %free.i.i.i, %dec.i.i.i, %copy.i.i, %check_cap.i.i, %grow.i.i
+  %dst.i.i = phi ptr [ %.15.i.i.i, %check_cap.i.i ], [ %.25.i.i, %grow.i.i ], [ %.15.i.i6.i, %copy.i.i ], [ %.15.i.i6.i, %dec.i.i.i ], [ %.15.i.i6.i, %free.i.i.i ]
+  %.39.i.i = getelementptr i8, ptr %dst.i.i, i64 %len.i.i
+  store i8 93, ptr %.39.i.i, align 1
+  %.42.i.i = getelementptr i8, ptr %dst.i.i, i64 -24
+  store i64 %.12.i.i, ptr %.42.i.i, align 8
+  %.44.i.i = getelementptr i8, ptr %dst.i.i, i64 %.12.i.i
+  store i8 0, ptr %.44.i.i, align 1
+  br i1 %.5.not.i, label %g.surround.exit, label %dec.i.i
+
+dec.i.i:                                          ; preds = %grammo_str_append.exit.i
+  %.9.i10.i = load i64, ptr %.13.i.i, align 8
+  %.10.i.i130 = add i64 %.9.i10.i, -1
+  store i64 %.10.i.i130, ptr %.13.i.i, align 8
+  %.12.i11.i = icmp eq i64 %.10.i.i130, 0
+  br i1 %.12.i11.i, label %free.i.i, label %g.surround.exit
+
+free.i.i:                                         ; preds = %dec.i.i
+  tail call void @free(ptr nonnull %.7.i.i58)
+  br label %g.surround.exit
+
+g.surround.exit:                                  ; preds = %grammo_str_append.exit.i, %dec.i.i, %free.i.i
+  %len.1.i = load i64, ptr %.42.i.i, align 8
+  %.8.i132 = add i64 %len.1.i, 5
+  %.5.i.i133 = tail call i64 @llvm.umax.i64(i64 %.8.i132, i64 1)
+  %.6.i.i134 = add i64 %.5.i.i133, 25
+  %.7.i.i135 = tail call ptr @malloc(i64 %.6.i.i134)
+  store i64 %.8.i132, ptr %.7.i.i135, align 8
+  %.11.i.i136 = getelementptr i8, ptr %.7.i.i135, i64 8
+  store i64 %.5.i.i133, ptr %.11.i.i136, align 8
+  %.13.i.i137 = getelementptr i8, ptr %.7.i.i135, i64 16
+  store i64 1, ptr %.13.i.i137, align 8
+  %.15.i.i138 = getelementptr i8, ptr %.7.i.i135, i64 24
+  %.16.i.i139 = getelementptr i8, ptr %.15.i.i138, i64 %.8.i132
+  store i8 0, ptr %.16.i.i139, align 1
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(5) %.15.i.i138, ptr noundef nonnull readonly align 8 dereferenceable(5) getelementptr inbounds nuw (i8, ptr @gstr_4, i64 24), i64 5, i1 false)
+  %.11.i140 = getelementptr i8, ptr %.7.i.i135, i64 29
+  tail call void @llvm.memcpy.p0.p0.i64(ptr align 1 %.11.i140, ptr nonnull readonly align 1 %dst.i.i, i64 %len.1.i, i1 false)
+  %len.i = load i64, ptr %.7.i.i135, align 8
+  %cap.i143 = load i64, ptr %.11.i.i136, align 8
+  %rc.i = load i64, ptr %.13.i.i137, align 8
+  %.12.i = add i64 %len.i, 1
+  %.13.i145 = icmp ne i64 %cap.i143, 0
+  %.14.i146 = icmp eq i64 %rc.i, 1
+  %.15.i147 = and i1 %.13.i145, %.14.i146
+  br i1 %.15.i147, label %check_cap.i, label %copy.i
+
+grow.i159:                                        ; preds = %check_cap.i
+  %.19.i160 = shl i64 %cap.i143, 1
+  %.21.i161 = tail call i64 @llvm.umax.i64(i64 %.12.i, i64 %.19.i160)
+  %.23.i162 = add i64 %.21.i161, 25
+  %.24.i = tail call ptr @realloc(ptr nonnull %.7.i.i135, i64 %.23.i162)
+  %.25.i = getelementptr i8, ptr %.24.i, i64 24
+  %.27.i163 = getelementptr i8, ptr %.24.i, i64 8
+  store i64 %.21.i161, ptr %.27.i163, align 8
+  br label %grammo_str_append.exit
+
+check_cap.i:                                      ; preds = %g.surround.exit
+  %.17.not.i = icmp ugt i64 %.12.i, %cap.i143
+  br i1 %.17.not.i, label %grow.i159, label %grammo_str_append.exit
+
+copy.i:                                           ; preds = %g.surround.exit
+  %.32.i = shl i64 %.12.i, 1
+  %.34.i = tail call i64 @llvm.umax.i64(i64 %.32.i, i64 16)
+  %.6.i.i148 = add i64 %.34.i, 25
+  %.7.i.i149 = tail call ptr @malloc(i64 %.6.i.i148)
+  store i64 %len.i, ptr %.7.i.i149, align 8
+  %.11.i.i150 = getelementptr i8, ptr %.7.i.i149, i64 8
+  store i64 %.34.i, ptr %.11.i.i150, align 8
+  %.13.i.i151 = getelementptr i8, ptr %.7.i.i149, i64 16
+  store i64 1, ptr %.13.i.i151, align 8
+  %.15.i.i152 = getelementptr i8, ptr %.7.i.i149, i64 24
+  %.16.i.i153 = getelementptr i8, ptr %.15.i.i152, i64 %len.i
+  store i8 0, ptr %.16.i.i153, align 1
+  tail call void @llvm.memcpy.p0.p0.i64(ptr align 1 %.15.i.i152, ptr nonnull align 1 %.15.i.i138, i64 %len.i, i1 false)
+  %.5.not.i.i154 = icmp eq i64 %cap.i143, 0
+  br i1 %.5.not.i.i154, label %grammo_str_append.exit, label %dec.i.i155
+
+dec.i.i155:                                       ; preds = %copy.i
+  %.10.i.i156 = add i64 %rc.i, -1
+  store i64 %.10.i.i156, ptr %.13.i.i137, align 8
+  %.12.i.i157 = icmp eq i64 %.10.i.i156, 0
+  br i1 %.12.i.i157, label %free.i.i158, label %grammo_str_append.exit
+
+free.i.i158:                                      ; preds = %dec.i.i155
+  tail call void @free(ptr nonnull %.7.i.i135)
+  br label %grammo_str_append.exit
+
+grammo_str_append.exit:                           ; preds = %grow.i159, %check_cap.i, %copy.i, %dec.i.i155, %free.i.i158
+  %dst.i = phi ptr [ %.15.i.i138, %check_cap.i ], [ %.25.i, %grow.i159 ], [ %.15.i.i152, %copy.i ], [ %.15.i.i152, %dec.i.i155 ], [ %.15.i.i152, %free.i.i158 ]
+  %.39.i = getelementptr i8, ptr %dst.i, i64 %len.i
+  store i8 33, ptr %.39.i, align 1
+  %.42.i = getelementptr i8, ptr %dst.i, i64 -24
+  store i64 %.12.i, ptr %.42.i, align 8
+  %.44.i = getelementptr i8, ptr %dst.i, i64 %.12.i
+  store i8 0, ptr %.44.i, align 1
+  %.55 = getelementptr i8, ptr %.40, i64 -24
+  %len = load i64, ptr %.55, align 8
+  %.56 = trunc i64 %len to i32
+  %.3.i164 = add i64 %len, 2
+  %.4.i165 = load i64, ptr @grammo_out_len, align 8
+  %.5.i166 = add i64 %.4.i165, %.3.i164
+  %.6.i167 = load i64, ptr @grammo_out_cap, align 8
+  %.7.not.i168 = icmp ugt i64 %.5.i166, %.6.i167
+  %.20.pre1.i169 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i168, label %loop.i.i173, label %grammo_out_reserve.exit189
+
+loop.i.i173:                                      ; preds = %grammo_str_append.exit, %body.i.i183
+  %written.i.i174 = phi i64 [ %.10.i.i187, %body.i.i183 ], [ 0, %grammo_str_append.exit ]
+  %.5.i.i175 = icmp slt i64 %written.i.i174, %.4.i165
+  br i1 %.5.i.i175, label %body.i.i183, label %grammo_out_flush.exit.i176
+
+body.i.i183:                                      ; preds = %loop.i.i173
+  %.7.i.i184 = getelementptr i8, ptr %.20.pre1.i169, i64 %written.i.i174
+  %.8.i.i185 = sub i64 %.4.i165, %written.i.i174
+  %.9.i.i186 = tail call i64 @write(i32 1, ptr %.7.i.i184, i64 %.8.i.i185)
+  %.10.i.i187 = add i64 %.9.i.i186, %written.i.i174
+  %.11.i.i188 = icmp sgt i64 %.9.i.i186, 0
+  br i1 %.11.i.i188, label %loop.i.i173, label %grammo_out_flush.exit.i176
+
+grammo_out_flush.exit.i176:                       ; preds = %body.i.i183, %loop.i.i173
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.i177 = load i64, ptr @grammo_out_cap, align 8
+  %.11.not.i178 = icmp ugt i64 %.3.i164, %.10.i177
+  %.20.pre.i179 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.11.not.i178, label %grow.i180, label %grammo_out_reserve.exit189
+
+grow.i180:                                        ; preds = %grammo_out_flush.exit.i176
+  %.14.i181 = tail call i64 @llvm.umax.i64(i64 %.3.i164, i64 65536)
+  %.16.i182 = tail call ptr @realloc(ptr %.20.pre.i179, i64 %.14.i181)
+  store ptr %.16.i182, ptr @grammo_out_buf, align 8
+  store i64 %.14.i181, ptr @grammo_out_cap, align 8
+  br label %grammo_out_reserve.exit189
+
+grammo_out_reserve.exit189:                       ; preds = %grammo_str_append.exit, %grammo_out_flush.exit.i176, %grow.i180
+  %.21.i170 = phi i64 [ 0, %grow.i180 ], [ 0, %grammo_out_flush.exit.i176 ], [ %.4.i165, %grammo_str_append.exit ]
+  %.20.i171 = phi ptr [ %.16.i182, %grow.i180 ], [ %.20.pre.i179, %grammo_out_flush.exit.i176 ], [ %.20.pre1.i169, %grammo_str_append.exit ]
+  %.22.i172 = getelementptr i8, ptr %.20.i171, i64 %.21.i170
+  %.61 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr %.22.i172, i64 %.3.i164, ptr nonnull @str_3, i32 %.56, ptr %.40)
+  %0 = tail call i32 @llvm.smax.i32(i32 %.61, i32 0)
+  %.6.i190 = zext nneg i32 %0 to i64
+  %.7.i191 = load i64, ptr @grammo_out_len, align 8
+  %.8.i192 = add i64 %.7.i191, %.6.i190
+  store i64 %.8.i192, ptr @grammo_out_len, align 8
+  %.2.i.i193 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i194 = icmp slt i32 %.2.i.i193, 0
+  br i1 %.3.i.i194, label %check.i.i211, label %grammo_out_interactive.exit.i195
+
+check.i.i211:                                     ; preds = %grammo_out_reserve.exit189
+  %.5.i.i212 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i212, ptr @grammo_out_tty, align 4
+  %.4.i215.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i195
+
+grammo_out_interactive.exit.i195:                 ; preds = %check.i.i211, %grammo_out_reserve.exit189
+  %.4.i215.pre = phi i64 [ %.4.i215.pre.pre, %check.i.i211 ], [ %.8.i192, %grammo_out_reserve.exit189 ]
+  %.8.i.i196 = phi i32 [ %.5.i.i212, %check.i.i211 ], [ %.2.i.i193, %grammo_out_reserve.exit189 ]
+  %.9.i.i197 = icmp sgt i32 %.8.i.i196, 0
+  %.20.pre1.i219.pre461 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i197, label %loop.i.i201, label %grammo_out_advance.exit213
+
+loop.i.i201:                                      ; preds = %grammo_out_interactive.exit.i195, %body.i.i205
+  %written.i.i202 = phi i64 [ %.10.i.i209, %body.i.i205 ], [ 0, %grammo_out_interactive.exit.i195 ]
+  %.5.i3.i203 = icmp slt i64 %written.i.i202, %.4.i215.pre
+  br i1 %.5.i3.i203, label %body.i.i205, label %grammo_out_flush.exit.i204
+
+body.i.i205:                                      ; preds = %loop.i.i201
+  %.7.i.i206 = getelementptr i8, ptr %.20.pre1.i219.pre461, i64 %written.i.i202
+  %.8.i4.i207 = sub i64 %.4.i215.pre, %written.i.i202
+  %.9.i5.i208 = tail call i64 @write(i32 1, ptr %.7.i.i206, i64 %.8.i4.i207)
+  %.10.i.i209 = add i64 %.9.i5.i208, %written.i.i202
+  %.11.i.i210 = icmp sgt i64 %.9.i5.i208, 0
+  br i1 %.11.i.i210, label %loop.i.i201, label %grammo_out_flush.exit.i204
+
+grammo_out_flush.exit.i204:                       ; preds = %body.i.i205, %loop.i.i201
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i219.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit213
+
+grammo_out_advance.exit213:                       ; preds = %grammo_out_interactive.exit.i195, %grammo_out_flush.exit.i204
+  %.20.pre1.i219 = phi ptr [ %.20.pre1.i219.pre461, %grammo_out_interactive.exit.i195 ], [ %.20.pre1.i219.pre, %grammo_out_flush.exit.i204 ]
+  %.4.i215 = phi i64 [ %.4.i215.pre, %grammo_out_interactive.exit.i195 ], [ 0, %grammo_out_flush.exit.i204 ]
+  %len.1 = load i64, ptr %.42.i, align 8
+  %.65 = trunc i64 %len.1 to i32
+  %.3.i214 = add i64 %len.1, 2
+  %.5.i216 = add i64 %.4.i215, %.3.i214
+  %.6.i217 = load i64, ptr @grammo_out_cap, align 8
+  %.7.not.i218 = icmp ugt i64 %.5.i216, %.6.i217
+  br i1 %.7.not.i218, label %loop.i.i223, label %grammo_out_reserve.exit239
+
+loop.i.i223:                                      ; preds = %grammo_out_advance.exit213, %body.i.i233
+  %written.i.i224 = phi i64 [ %.10.i.i237, %body.i.i233 ], [ 0, %grammo_out_advance.exit213 ]
+  %.5.i.i225 = icmp slt i64 %written.i.i224, %.4.i215
+  br i1 %.5.i.i225, label %body.i.i233, label %grammo_out_flush.exit.i226
+
+body.i.i233:                                      ; preds = %loop.i.i223
+  %.7.i.i234 = getelementptr i8, ptr %.20.pre1.i219, i64 %written.i.i224
+  %.8.i.i235 = sub i64 %.4.i215, %written.i.i224
+  %.9.i.i236 = tail call i64 @write(i32 1, ptr %.7.i.i234, i64 %.8.i.i235)
+  %.10.i.i237 = add i64 %.9.i.i236, %written.i.i224
+  %.11.i.i238 = icmp sgt i64 %.9.i.i236, 0
+  br i1 %.11.i.i238, label %loop.i.i223, label %grammo_out_flush.exit.i226
+
+grammo_out_flush.exit.i226:                       ; preds = %body.i.i233, %loop.i.i223
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.i227 = load i64, ptr @grammo_out_cap, align 8
+  %.11.not.i228 = icmp ugt i64 %.3.i214, %.10.i227
+  %.20.pre.i229 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.11.not.i228, label %grow.i230, label %grammo_out_reserve.exit239
+
+grow.i230:                                        ; preds = %grammo_out_flush.exit.i226
+  %.14.i231 = tail call i64 @llvm.umax.i64(i64 %.3.i214, i64 65536)
+  %.16.i232 = tail call ptr @realloc(ptr %.20.pre.i229, i64 %.14.i231)
+  store ptr %.16.i232, ptr @grammo_out_buf, align 8
+  store i64 %.14.i231, ptr @grammo_out_cap, align 8
+  br label %grammo_out_reserve.exit239
+
+grammo_out_reserve.exit239:                       ; preds = %grammo_out_advance.exit213, %grammo_out_flush.exit.i226, %grow.i230
+  %.21.i220 = phi i64 [ 0, %grow.i230 ], [ 0, %grammo_out_flush.exit.i226 ], [ %.4.i215, %grammo_out_advance.exit213 ]
+  %.20.i221 = phi ptr [ %.16.i232, %grow.i230 ], [ %.20.pre.i229, %grammo_out_flush.exit.i226 ], [ %.20.pre1.i219, %grammo_out_advance.exit213 ]
+  %.22.i222 = getelementptr i8, ptr %.20.i221, i64 %.21.i220
+  %.70 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr %.22.i222, i64 %.3.i214, ptr nonnull @str_3, i32 %.65, ptr %dst.i)
+  %1 = tail call i32 @llvm.smax.i32(i32 %.70, i32 0)
+  %.6.i240 = zext nneg i32 %1 to i64
+  %.7.i241 = load i64, ptr @grammo_out_len, align 8
+  %.8.i242 = add i64 %.7.i241, %.6.i240
+  store i64 %.8.i242, ptr @grammo_out_len, align 8
+  %.2.i.i243 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i244 = icmp slt i32 %.2.i.i243, 0
+  br i1 %.3.i.i244, label %check.i.i261, label %grammo_out_interactive.exit.i245
+
+check.i.i261:                                     ; preds = %grammo_out_reserve.exit239
+  %.5.i.i262 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i262, ptr @grammo_out_tty, align 4
+  %.4.i264.pre.pre = load i64, ptr @grammo_out_len, align 8
+  br label %grammo_out_interactive.exit.i245
+
+grammo_out_interactive.exit.i245:                 ; preds = %check.i.i261, %grammo_out_reserve.exit239
+  %.4.i264.pre = phi i64 [ %.4.i264.pre.pre, %check.i.i261 ], [ %.8.i242, %grammo_out_reserve.exit239 ]
+  %.8.i.i246 = phi i32 [ %.5.i.i262, %check.i.i261 ], [ %.2.i.i243, %grammo_out_reserve.exit239 ]
+  %.9.i.i247 = icmp sgt i32 %.8.i.i246, 0
+  %.20.pre1.i268.pre464 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.9.i.i247, label %loop.i.i251, label %grammo_out_advance.exit263
+
+loop.i.i251:                                      ; preds = %grammo_out_interactive.exit.i245, %body.i.i255
+  %written.i.i252 = phi i64 [ %.10.i.i259, %body.i.i255 ], [ 0, %grammo_out_interactive.exit.i245 ]
+  %.5.i3.i253 = icmp slt i64 %written.i.i252, %.4.i264.pre
+  br i1 %.5.i3.i253, label %body.i.i255, label %grammo_out_flush.exit.i254
+
+body.i.i255:                                      ; preds = %loop.i.i251
+  %.7.i.i256 = getelementptr i8, ptr %.20.pre1.i268.pre464, i64 %written.i.i252
+  %.8.i4.i257 = sub i64 %.4.i264.pre, %written.i.i252
+  %.9.i5.i258 = tail call i64 @write(i32 1, ptr %.7.i.i256, i64 %.8.i4.i257)
+  %.10.i.i259 = add i64 %.9.i5.i258, %written.i.i252
+  %.11.i.i260 = icmp sgt i64 %.9.i5.i258, 0
+  br i1 %.11.i.i260, label %loop.i.i251, label %grammo_out_flush.exit.i254
+
+grammo_out_flush.exit.i254:                       ; preds = %body.i.i255, %loop.i.i251
+  store i64 0, ptr @grammo_out_len, align 8
+  %.20.pre1.i268.pre = load ptr, ptr @grammo_out_buf, align 8
+  br label %grammo_out_advance.exit263
+
+grammo_out_advance.exit263:                       ; preds = %grammo_out_interactive.exit.i245, %grammo_out_flush.exit.i254
+  %.20.pre1.i268 = phi ptr [ %.20.pre1.i268.pre464, %grammo_out_interactive.exit.i245 ], [ %.20.pre1.i268.pre, %grammo_out_flush.exit.i254 ]
+  %.4.i264 = phi i64 [ %.4.i264.pre, %grammo_out_interactive.exit.i245 ], [ 0, %grammo_out_flush.exit.i254 ]
+  %.5.i265 = add i64 %.4.i264, 7
+  %.6.i266 = load i64, ptr @grammo_out_cap, align 8
+  %.7.not.i267 = icmp ugt i64 %.5.i265, %.6.i266
+  br i1 %.7.not.i267, label %loop.i.i272, label %grammo_out_reserve.exit287
+
+loop.i.i272:                                      ; preds = %grammo_out_advance.exit263, %body.i.i281
+  %written.i.i273 = phi i64 [ %.10.i.i285, %body.i.i281 ], [ 0, %grammo_out_advance.exit263 ]
+  %.5.i.i274 = icmp slt i64 %written.i.i273, %.4.i264
+  br i1 %.5.i.i274, label %body.i.i281, label %grammo_out_flush.exit.i275
+
+body.i.i281:                                      ; preds = %loop.i.i272
+  %.7.i.i282 = getelementptr i8, ptr %.20.pre1.i268, i64 %written.i.i273
+  %.8.i.i283 = sub i64 %.4.i264, %written.i.i273
+  %.9.i.i284 = tail call i64 @write(i32 1, ptr %.7.i.i282, i64 %.8.i.i283)
+  %.10.i.i285 = add i64 %.9.i.i284, %written.i.i273
+  %.11.i.i286 = icmp sgt i64 %.9.i.i284, 0
+  br i1 %.11.i.i286, label %loop.i.i272, label %grammo_out_flush.exit.i275
+
+grammo_out_flush.exit.i275:                       ; preds = %body.i.i281, %loop.i.i272
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.i276 = load i64, ptr @grammo_out_cap, align 8
+  %.11.not.i277 = icmp ult i64 %.10.i276, 7
+  %.20.pre.i278 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.11.not.i277, label %grow.i279, label %grammo_out_reserve.exit287
+
+grow.i279:                                        ; preds = %grammo_out_flush.exit.i275
+  %.16.i280 = tail call dereferenceable_or_null(65536) ptr @realloc(ptr %.20.pre.i278, i64 65536)
+  store ptr %.16.i280, ptr @grammo_out_buf, align 8
+  store i64 65536, ptr @grammo_out_cap, align 8
+  br label %grammo_out_reserve.exit287
+
+grammo_out_reserve.exit287:                       ; preds = %grammo_out_advance.exit263, %grammo_out_flush.exit.i275, %grow.i279
+  %.21.i269 = phi i64 [ 0, %grow.i279 ], [ 0, %grammo_out_flush.exit.i275 ], [ %.4.i264, %grammo_out_advance.exit263 ]
+  %.20.i270 = phi ptr [ %.16.i280, %grow.i279 ], [ %.20.pre.i278, %grammo_out_flush.exit.i275 ], [ %.20.pre1.i268, %grammo_out_advance.exit263 ]
+  %.22.i271 = getelementptr i8, ptr %.20.i270, i64 %.21.i269
+  tail call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(7) %.22.i271, ptr noundef nonnull align 1 dereferenceable(7) @str_4, i64 7, i1 false)
+  %.7.i288 = load i64, ptr @grammo_out_len, align 8
+  %.8.i289 = add i64 %.7.i288, 6
+  store i64 %.8.i289, ptr @grammo_out_len, align 8
+  %cap.i291 = load i64, ptr %.11.i.i59, align 8
+  %.5.not.i292 = icmp eq i64 %cap.i291, 0
+  br i1 %.5.not.i292, label %grammo_str_retain.exit297, label %inc.i293
+
+inc.i293:                                         ; preds = %grammo_out_reserve.exit287
+  %.9.i295 = load i64, ptr %.13.i.i, align 8
+  %.10.i296 = add i64 %.9.i295, 1
+  store i64 %.10.i296, ptr %.13.i.i, align 8
+  br label %grammo_str_retain.exit297
+
+grammo_str_retain.exit297:                        ; preds = %grammo_out_reserve.exit287, %inc.i293
+  %.78 = tail call fastcc ptr @g.repeat(ptr %.15.i.i, i32 2)
+  %.80 = getelementptr i8, ptr %.78, i64 -24
+  %len.2 = load i64, ptr %.80, align 8
+  %.81 = trunc i64 %len.2 to i32
+  %.3.i298 = add i64 %len.2, 2
+  %.4.i299 = load i64, ptr @grammo_out_len, align 8
+  %.5.i300 = add i64 %.4.i299, %.3.i298
+  %.6.i301 = load i64, ptr @grammo_out_cap, align 8
+  %.7.not.i302 = icmp ugt i64 %.5.i300, %.6.i301
+  %.20.pre1.i303 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i302, label %loop.i.i307, label %grammo_out_reserve.exit323
+
+loop.i.i307:                                      ; preds = %grammo_str_retain.exit297, %body.i.i317
+  %written.i.i308 = phi i64 [ %.10.i.i321, %body.i.i317 ], [ 0, %grammo_str_retain.exit297 ]
+  %.5.i.i309 = icmp slt i64 %written.i.i308, %.4.i299
+  br i1 %.5.i.i309, label %body.i.i317, label %grammo_out_flush.exit.i310
+
+body.i.i317:                                      ; preds = %loop.i.i307
+  %.7.i.i318 = getelementptr i8, ptr %.20.pre1.i303, i64 %written.i.i308
+  %.8.i.i319 = sub i64 %.4.i299, %written.i.i308
+  %.9.i.i320 = tail call i64 @write(i32 1, ptr %.7.i.i318, i64 %.8.i.i319)
+  %.10.i.i321 = add i64 %.9.i.i320, %written.i.i308
+  %.11.i.i322 = icmp sgt i64 %.9.i.i320, 0
+  br i1 %.11.i.i322, label %loop.i.i307, label %grammo_out_flush.exit.i310
+
+grammo_out_flush.exit.i310:                       ; preds = %body.i.i317, %loop.i.i307
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.i311 = load i64, ptr @grammo_out_cap, align 8
+  %.11.not.i312 = icmp ugt i64 %.3.i298, %.10.i311
+  %.20.pre.i313 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.11.not.i312, label %grow.i314, label %grammo_out_reserve.exit323
+
+grow.i314:                                        ; preds = %grammo_out_flush.exit.i310
+  %.14.i315 = tail call i64 @llvm.umax.i64(i64 %.3.i298, i64 65536)
+  %.16.i316 = tail call ptr @realloc(ptr %.20.pre.i313, i64 %.14.i315)
+  store ptr %.16.i316, ptr @grammo_out_buf, align 8
+  store i64 %.14.i315, ptr @grammo_out_cap, align 8
+  br label %grammo_out_reserve.exit323
+
+grammo_out_reserve.exit323:                       ; preds = %grammo_str_retain.exit297, %grammo_out_flush.exit.i310, %grow.i314
+  %.21.i304 = phi i64 [ 0, %grow.i314 ], [ 0, %grammo_out_flush.exit.i310 ], [ %.4.i299, %grammo_str_retain.exit297 ]
+  %.20.i305 = phi ptr [ %.16.i316, %grow.i314 ], [ %.20.pre.i313, %grammo_out_flush.exit.i310 ], [ %.20.pre1.i303, %grammo_str_retain.exit297 ]
+  %.22.i306 = getelementptr i8, ptr %.20.i305, i64 %.21.i304
+  %.86 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr %.22.i306, i64 %.3.i298, ptr nonnull @str_3, i32 %.81, ptr %.78)
+  %2 = tail call i32 @llvm.smax.i32(i32 %.86, i32 0)
+  %.6.i324 = zext nneg i32 %2 to i64
+  %.7.i325 = load i64, ptr @grammo_out_len, align 8
+  %.8.i326 = add i64 %.7.i325, %.6.i324
+  store i64 %.8.i326, ptr @grammo_out_len, align 8
+  %.2.i.i327 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i328 = icmp slt i32 %.2.i.i327, 0
+  br i1 %.3.i.i328, label %check.i.i345, label %grammo_out_interactive.exit.i329
+
+check.i.i345:                                     ; preds = %grammo_out_reserve.exit323
+  %.5.i.i346 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i346, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i329
+
+grammo_out_interactive.exit.i329:                 ; preds = %check.i.i345, %grammo_out_reserve.exit323
+  %.8.i.i330 = phi i32 [ %.5.i.i346, %check.i.i345 ], [ %.2.i.i327, %grammo_out_reserve.exit323 ]
+  %.9.i.i331 = icmp sgt i32 %.8.i.i330, 0
+  br i1 %.9.i.i331, label %flush.i332, label %grammo_out_advance.exit347
+
+flush.i332:                                       ; preds = %grammo_out_interactive.exit.i329
+  %.2.i1.i333 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i334 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i335
+
+loop.i.i335:                                      ; preds = %body.i.i339, %flush.i332
+  %written.i.i336 = phi i64 [ 0, %flush.i332 ], [ %.10.i.i343, %body.i.i339 ]
+  %.5.i3.i337 = icmp slt i64 %written.i.i336, %.3.i2.i334
+  br i1 %.5.i3.i337, label %body.i.i339, label %grammo_out_flush.exit.i338
+
+body.i.i339:                                      ; preds = %loop.i.i335
+  %.7.i.i340 = getelementptr i8, ptr %.2.i1.i333, i64 %written.i.i336
+  %.8.i4.i341 = sub i64 %.3.i2.i334, %written.i.i336
+  %.9.i5.i342 = tail call i64 @write(i32 1, ptr %.7.i.i340, i64 %.8.i4.i341)
+  %.10.i.i343 = add i64 %.9.i5.i342, %written.i.i336
+  %.11.i.i344 = icmp sgt i64 %.9.i5.i342, 0
+  br i1 %.11.i.i344, label %loop.i.i335, label %grammo_out_flush.exit.i338
+
+grammo_out_flush.exit.i338:                       ; preds = %body.i.i339, %loop.i.i335
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_advance.exit347
+
+grammo_out_advance.exit347:                       ; preds = %grammo_out_interactive.exit.i329, %grammo_out_flush.exit.i338
+  %.4.i348 = getelementptr i8, ptr %.78, i64 -16
+  %cap.i349 = load i64, ptr %.4.i348, align 8
+  %.5.not.i350 = icmp eq i64 %cap.i349, 0
+  br i1 %.5.not.i350, label %grammo_str_release.exit, label %dec.i
+
+dec.i:                                            ; preds = %grammo_out_advance.exit347
+  %.8.i351 = getelementptr i8, ptr %.78, i64 -8
+  %.9.i352 = load i64, ptr %.8.i351, align 8
+  %.10.i353 = add i64 %.9.i352, -1
+  store i64 %.10.i353, ptr %.8.i351, align 8
+  %.12.i354 = icmp eq i64 %.10.i353, 0
+  br i1 %.12.i354, label %free.i, label %grammo_str_release.exit
+
+free.i:                                           ; preds = %dec.i
+  tail call void @free(ptr %.80)
+  br label %grammo_str_release.exit
+
+grammo_str_release.exit:                          ; preds = %grammo_out_advance.exit347, %dec.i, %free.i
+  %len.3 = load i64, ptr %.55, align 8
+  %.91 = trunc i64 %len.3 to i32
+  %.3.i356 = add i64 %len.3, 2
+  %.4.i357 = load i64, ptr @grammo_out_len, align 8
+  %.5.i358 = add i64 %.4.i357, %.3.i356
+  %.6.i359 = load i64, ptr @grammo_out_cap, align 8
+  %.7.not.i360 = icmp ugt i64 %.5.i358, %.6.i359
+  %.20.pre1.i361 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.7.not.i360, label %loop.i.i365, label %grammo_out_reserve.exit381
+
+loop.i.i365:                                      ; preds = %grammo_str_release.exit, %body.i.i375
+  %written.i.i366 = phi i64 [ %.10.i.i379, %body.i.i375 ], [ 0, %grammo_str_release.exit ]
+  %.5.i.i367 = icmp slt i64 %written.i.i366, %.4.i357
+  br i1 %.5.i.i367, label %body.i.i375, label %grammo_out_flush.exit.i368
+
+body.i.i375:                                      ; preds = %loop.i.i365
+  %.7.i.i376 = getelementptr i8, ptr %.20.pre1.i361, i64 %written.i.i366
+  %.8.i.i377 = sub i64 %.4.i357, %written.i.i366
+  %.9.i.i378 = tail call i64 @write(i32 1, ptr %.7.i.i376, i64 %.8.i.i377)
+  %.10.i.i379 = add i64 %.9.i.i378, %written.i.i366
+  %.11.i.i380 = icmp sgt i64 %.9.i.i378, 0
+  br i1 %.11.i.i380, label %loop.i.i365, label %grammo_out_flush.exit.i368
+
+grammo_out_flush.exit.i368:                       ; preds = %body.i.i375, %loop.i.i365
+  store i64 0, ptr @grammo_out_len, align 8
+  %.10.i369 = load i64, ptr @grammo_out_cap, align 8
+  %.11.not.i370 = icmp ugt i64 %.3.i356, %.10.i369
+  %.20.pre.i371 = load ptr, ptr @grammo_out_buf, align 8
+  br i1 %.11.not.i370, label %grow.i372, label %grammo_out_reserve.exit381
+
+grow.i372:                                        ; preds = %grammo_out_flush.exit.i368
+  %.14.i373 = tail call i64 @llvm.umax.i64(i64 %.3.i356, i64 65536)
+  %.16.i374 = tail call ptr @realloc(ptr %.20.pre.i371, i64 %.14.i373)
+  store ptr %.16.i374, ptr @grammo_out_buf, align 8
+  store i64 %.14.i373, ptr @grammo_out_cap, align 8
+  br label %grammo_out_reserve.exit381
+
+grammo_out_reserve.exit381:                       ; preds = %grammo_str_release.exit, %grammo_out_flush.exit.i368, %grow.i372
+  %.21.i362 = phi i64 [ 0, %grow.i372 ], [ 0, %grammo_out_flush.exit.i368 ], [ %.4.i357, %grammo_str_release.exit ]
+  %.20.i363 = phi ptr [ %.16.i374, %grow.i372 ], [ %.20.pre.i371, %grammo_out_flush.exit.i368 ], [ %.20.pre1.i361, %grammo_str_release.exit ]
+  %.22.i364 = getelementptr i8, ptr %.20.i363, i64 %.21.i362
+  %.96 = tail call i32 (ptr, i64, ptr, ...) @snprintf(ptr %.22.i364, i64 %.3.i356, ptr nonnull @str_3, i32 %.91, ptr %.40)
+  %3 = tail call i32 @llvm.smax.i32(i32 %.96, i32 0)
+  %.6.i382 = zext nneg i32 %3 to i64
+  %.7.i383 = load i64, ptr @grammo_out_len, align 8
+  %.8.i384 = add i64 %.7.i383, %.6.i382
+  store i64 %.8.i384, ptr @grammo_out_len, align 8
+  %.2.i.i385 = load i32, ptr @grammo_out_tty, align 4
+  %.3.i.i386 = icmp slt i32 %.2.i.i385, 0
+  br i1 %.3.i.i386, label %check.i.i403, label %grammo_out_interactive.exit.i387
+
+check.i.i403:                                     ; preds = %grammo_out_reserve.exit381
+  %.5.i.i404 = tail call i32 @isatty(i32 1)
+  store i32 %.5.i.i404, ptr @grammo_out_tty, align 4
+  br label %grammo_out_interactive.exit.i387
+
+grammo_out_interactive.exit.i387:                 ; preds = %check.i.i403, %grammo_out_reserve.exit381
+  %.8.i.i388 = phi i32 [ %.5.i.i404, %check.i.i403 ], [ %.2.i.i385, %grammo_out_reserve.exit381 ]
+  %.9.i.i389 = icmp sgt i32 %.8.i.i388, 0
+  br i1 %.9.i.i389, label %flush.i390, label %grammo_out_advance.exit405
+
+flush.i390:                                       ; preds = %grammo_out_interactive.exit.i387
+  %.2.i1.i391 = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i2.i392 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i.i393
+
+loop.i.i393:                                      ; preds = %body.i.i397, %flush.i390
+  %written.i.i394 = phi i64 [ 0, %flush.i390 ], [ %.10.i.i401, %body.i.i397 ]
+  %.5.i3.i395 = icmp slt i64 %written.i.i394, %.3.i2.i392
+  br i1 %.5.i3.i395, label %body.i.i397, label %grammo_out_flush.exit.i396
+
+body.i.i397:                                      ; preds = %loop.i.i393
+  %.7.i.i398 = getelementptr i8, ptr %.2.i1.i391, i64 %written.i.i394
+  %.8.i4.i399 = sub i64 %.3.i2.i392, %written.i.i394
+  %.9.i5.i400 = tail call i64 @write(i32 1, ptr %.7.i.i398, i64 %.8.i4.i399)
+  %.10.i.i401 = add i64 %.9.i5.i400, %written.i.i394
+  %.11.i.i402 = icmp sgt i64 %.9.i5.i400, 0
+  br i1 %.11.i.i402, label %loop.i.i393, label %grammo_out_flush.exit.i396
+
+grammo_out_flush.exit.i396:                       ; preds = %body.i.i397, %loop.i.i393
+  store i64 0, ptr @grammo_out_len, align 8
+  br label %grammo_out_advance.exit405
+
+grammo_out_advance.exit405:                       ; preds = %grammo_out_interactive.exit.i387, %grammo_out_flush.exit.i396
+  %cap.i407 = load i64, ptr %.11.i.i59, align 8
+  %.5.not.i408 = icmp eq i64 %cap.i407, 0
+  br i1 %.5.not.i408, label %grammo_str_release.exit416, label %dec.i409
+
+dec.i409:                                         ; preds = %grammo_out_advance.exit405
+  %.9.i411 = load i64, ptr %.13.i.i, align 8
+  %.10.i412 = add i64 %.9.i411, -1
+  store i64 %.10.i412, ptr %.13.i.i, align 8
+  %.12.i413 = icmp eq i64 %.10.i412, 0
+  br i1 %.12.i413, label %free.i414, label %grammo_str_release.exit416
+
+free.i414:                                        ; preds = %dec.i409
+  tail call void @free(ptr nonnull %.7.i.i58)
+  br label %grammo_str_release.exit416
+
+grammo_str_release.exit416:                       ; preds = %grammo_out_advance.exit405, %dec.i409, %free.i414
+  %.4.i417 = getelementptr i8, ptr %dst.i.i, i64 -16
+  %cap.i418 = load i64, ptr %.4.i417, align 8
+  %.5.not.i419 = icmp eq i64 %cap.i418, 0
+  br i1 %.5.not.i419, label %grammo_str_release.exit427, label %dec.i420
+
+dec.i420:                                         ; preds = %grammo_str_release.exit416
+  %.8.i421 = getelementptr i8, ptr %dst.i.i, i64 -8
+  %.9.i422 = load i64, ptr %.8.i421, align 8
+  %.10.i423 = add i64 %.9.i422, -1
+  store i64 %.10.i423, ptr %.8.i421, align 8
+  %.12.i424 = icmp eq i64 %.10.i423, 0
+  br i1 %.12.i424, label %free.i425, label %grammo_str_release.exit427
+
+free.i425:                                        ; preds = %dec.i420
+  tail call void @free(ptr %.42.i.i)
+  br label %grammo_str_release.exit427
+
+grammo_str_release.exit427:                       ; preds = %grammo_str_release.exit416, %dec.i420, %free.i425
+  %.4.i428 = getelementptr i8, ptr %.40, i64 -16
+  %cap.i429 = load i64, ptr %.4.i428, align 8
+  %.5.not.i430 = icmp eq i64 %cap.i429, 0
+  br i1 %.5.not.i430, label %grammo_str_release.exit438, label %dec.i431
+
+dec.i431:                                         ; preds = %grammo_str_release.exit427
+  %.8.i432 = getelementptr i8, ptr %.40, i64 -8
+  %.9.i433 = load i64, ptr %.8.i432, align 8
+  %.10.i434 = add i64 %.9.i433, -1
+  store i64 %.10.i434, ptr %.8.i432, align 8
+  %.12.i435 = icmp eq i64 %.10.i434, 0
+  br i1 %.12.i435, label %free.i436, label %grammo_str_release.exit438
+
+free.i436:                                        ; preds = %dec.i431
+  tail call void @free(ptr %.55)
+  br label %grammo_str_release.exit438
+
+grammo_str_release.exit438:                       ; preds = %grammo_str_release.exit427, %dec.i431, %free.i436
+  %.4.i439 = getelementptr i8, ptr %dst.i, i64 -16
+  %cap.i440 = load i64, ptr %.4.i439, align 8
+  %.5.not.i441 = icmp eq i64 %cap.i440, 0
+  br i1 %.5.not.i441, label %grammo_str_release.exit449, label %dec.i442
+
+dec.i442:                                         ; preds = %grammo_str_release.exit438
+  %.8.i443 = getelementptr i8, ptr %dst.i, i64 -8
+  %.9.i444 = load i64, ptr %.8.i443, align 8
+  %.10.i445 = add i64 %.9.i444, -1
+  store i64 %.10.i445, ptr %.8.i443, align 8
+  %.12.i446 = icmp eq i64 %.10.i445, 0
+  br i1 %.12.i446, label %free.i447, label %grammo_str_release.exit449
+
+free.i447:                                        ; preds = %dec.i442
+  tail call void @free(ptr %.42.i)
+  br label %grammo_str_release.exit449
+
+grammo_str_release.exit449:                       ; preds = %grammo_str_release.exit438, %dec.i442, %free.i447
+  %.2.i = load ptr, ptr @grammo_out_buf, align 8
+  %.3.i450 = load i64, ptr @grammo_out_len, align 8
+  br label %loop.i
+
+loop.i:                                           ; preds = %body.i, %grammo_str_release.exit449
+  %written.i = phi i64 [ 0, %grammo_str_release.exit449 ], [ %.10.i455, %body.i ]
+  %.5.i451 = icmp slt i64 %written.i, %.3.i450
+  br i1 %.5.i451, label %body.i, label %grammo_out_flush.exit
+
+body.i:                                           ; preds = %loop.i
+  %.7.i452 = getelementptr i8, ptr %.2.i, i64 %written.i
+  %.8.i453 = sub i64 %.3.i450, %written.i
+  %.9.i454 = tail call i64 @write(i32 1, ptr %.7.i452, i64 %.8.i453)
+  %.10.i455 = add i64 %.9.i454, %written.i
+  %.11.i456 = icmp sgt i64 %.9.i454, 0
+  br i1 %.11.i456, label %loop.i, label %grammo_out_flush.exit
+
+grammo_out_flush.exit:                            ; preds = %loop.i, %body.i
+  store i64 0, ptr @grammo_out_len, align 8
+  ret void
 }
 
-; Function Attrs: nofree nounwind
-define void @main() local_unnamed_addr #0 {
+; Function Attrs: nounwind
+define internal fastcc i64 @grammo_in_token() unnamed_addr #4 {
 entry:
-  %m_width = alloca i32, align 4
-  store i32 0, ptr %m_width, align 4
-  %.9 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_1)
-  %putchar = tail call i32 @putchar(i32 10)
-  %.15 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_4)
-  %.16 = tail call dereferenceable_or_null(256) ptr @malloc(i64 256)
-  %.18 = tail call i32 (ptr, ...) @scanf(ptr nonnull @str_5, ptr %.16)
-  %.22 = tail call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_6)
-  %.24 = call i32 (ptr, ...) @scanf(ptr nonnull @str_7, ptr nonnull %m_width)
-  %load_m_width = load i32, ptr %m_width, align 4
-  %.122.i = icmp sgt i32 %load_m_width, 0
-  br i1 %.122.i, label %for_body.i, label %repeat.exit
-
-for_body.i:                                       ; preds = %entry, %for_body.i
-  %rp_i.04.i = phi i32 [ %.22.i, %for_body.i ], [ 0, %entry ]
-  %rp_out.03.i = phi ptr [ %.18.i, %for_body.i ], [ @str_0, %entry ]
-  %.14.i = call i64 @strlen(ptr noundef nonnull dereferenceable(1) %rp_out.03.i)
-  %.17.i = add i64 %.14.i, 2
-  %.18.i = call ptr @malloc(i64 %.17.i)
-  %.19.i = call ptr @strcpy(ptr noundef nonnull dereferenceable(1) %.18.i, ptr noundef nonnull dereferenceable(1) %rp_out.03.i)
-  %strlen27 = call i64 @strlen(ptr noundef nonnull dereferenceable(1) %.18.i)
-  %endptr28 = getelementptr inbounds i8, ptr %.18.i, i64 %strlen27
-  store i16 45, ptr %endptr28, align 1
-  %.22.i = add nuw nsw i32 %rp_i.04.i, 1
-  %.12.i = icmp slt i32 %.22.i, %load_m_width
-  br i1 %.12.i, label %for_body.i, label %repeat.exit
-
-repeat.exit:                                      ; preds = %for_body.i, %entry
-  %rp_out.0.lcssa.i = phi ptr [ @str_0, %entry ], [ %.18.i, %for_body.i ]
-  %.9.i = call i64 @strlen(ptr noundef nonnull readonly dereferenceable(1) %.16)
-  %.11.i = add i64 %.9.i, 2
-  %.12.i5 = call ptr @malloc(i64 %.11.i)
-  store i16 91, ptr %.12.i5, align 1
-  %.14.i6 = call ptr @strcat(ptr noundef nonnull dereferenceable(1) %.12.i5, ptr noundef nonnull readonly dereferenceable(1) %.16)
-  %.15.i7 = call i64 @strlen(ptr noundef nonnull dereferenceable(1) %.12.i5)
-  %.18.i10 = add i64 %.15.i7, 2
-  %.19.i11 = call noundef ptr @malloc(i64 %.18.i10)
-  %.20.i12 = call ptr @strcpy(ptr noundef nonnull dereferenceable(1) %.19.i11, ptr noundef nonnull dereferenceable(1) %.12.i5)
-  %strlen29 = call i64 @strlen(ptr noundef nonnull dereferenceable(1) %.19.i11)
-  %endptr30 = getelementptr inbounds i8, ptr %.19.i11, i64 %strlen29
-  store i16 93, ptr %endptr30, align 1
-  %.34 = call i64 @strlen(ptr noundef nonnull dereferenceable(1) %.19.i11)
-  %.36 = add i64 %.34, 6
-  %.37 = call ptr @malloc(i64 %.36)
-  call void @llvm.memcpy.p0.p0.i64(ptr noundef nonnull align 1 dereferenceable(6) %.37, ptr noundef nonnull align 1 dereferenceable(6) @str_11, i64 6, i1 false)
-  %.39 = call ptr @strcat(ptr noundef nonnull dereferenceable(1) %.37, ptr noundef nonnull dereferenceable(1) %.19.i11)
-  %.41 = call i64 @strlen(ptr noundef nonnull dereferenceable(1) %.37)
-  %.44 = add i64 %.41, 2
-  %.45 = call ptr @malloc(i64 %.44)
-  %.46 = call ptr @strcpy(ptr noundef nonnull dereferenceable(1) %.45, ptr noundef nonnull dereferenceable(1) %.37)
-  %strlen = call i64 @strlen(ptr noundef nonnull dereferenceable(1) %.45)
-  %endptr = getelementptr inbounds i8, ptr %.45, i64 %strlen
-  store i16 33, ptr %endptr, align 1
-  %.50 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull %rp_out.0.lcssa.i)
-  %putchar1 = call i32 @putchar(i32 10)
-  %.55 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr %.45)
-  %putchar2 = call i32 @putchar(i32 10)
-  %.61 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull @str_13)
-  %.15.i17 = call i64 @strlen(ptr noundef nonnull readonly dereferenceable(1) %.16)
-  %invariant.op = add i64 %.15.i17, 1
-  %.18.i20 = call ptr @malloc(i64 %invariant.op)
-  store i8 0, ptr %.18.i20, align 1
-  %.20.i22 = call ptr @strcat(ptr noundef nonnull dereferenceable(1) %.18.i20, ptr noundef nonnull readonly dereferenceable(1) %.16)
-  %.14.i16.1 = call i64 @strlen(ptr noundef nonnull dereferenceable(1) %.18.i20)
-  %.17.i19.reass.1 = add i64 %.14.i16.1, %invariant.op
-  %.18.i20.1 = call ptr @malloc(i64 %.17.i19.reass.1)
-  %.19.i21.1 = call ptr @strcpy(ptr noundef nonnull dereferenceable(1) %.18.i20.1, ptr noundef nonnull dereferenceable(1) %.18.i20)
-  %.20.i22.1 = call ptr @strcat(ptr noundef nonnull dereferenceable(1) %.18.i20.1, ptr noundef nonnull readonly dereferenceable(1) %.16)
-  %.64 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr %.18.i20.1)
-  %putchar3 = call i32 @putchar(i32 10)
-  %.69 = call i32 (ptr, ...) @printf(ptr nonnull dereferenceable(1) @str_2, ptr nonnull %rp_out.0.lcssa.i)
-  %putchar4 = call i32 @putchar(i32 10)
-  ret void
+  %.3.pre = load i64, ptr @grammo_in_pos, align 8
+  %.4.pre = load i64, ptr @grammo_in_end, align 8
+  br label %skip.outer
+
+skip.outer:                                       ; preds = %grammo_in_fill.exit, %entry
+  %.4.ph = phi i64 [ %.33.i, %grammo_in_fill.exit ], [ %.4.pre, %entry ]
+  %.3.ph = phi i64 [ 0, %grammo_in_fill.exit ], [ %.3.pre, %entry ]
+  %.9 = load ptr, ptr @grammo_in_buf, align 8
+  br label %skip
+
+skip:                                             ; preds = %skip.outer, %skip_next
+  %.3 = phi i64 [ %.19, %skip_next ], [ %.3.ph, %skip.outer ]
+  %.5 = icmp ult i64 %.3, %.4.ph
+  br i1 %.5, label %skip_test, label %skip_fill
+
+skip_fill:                                        ; preds = %skip
+  %.3.i = icmp eq ptr %.9, null
+  br i1 %.3.i, label %alloc.i, label %entry.check_full_crit_edge.i
+
+entry.check_full_crit_edge.i:                     ; preds = %skip_fill
+  %.12.pre.i = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i
+
+alloc.i:                                          ; preds = %skip_fill
+  %.5.i = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i
+
+check_full.i:                                     ; preds = %alloc.i, %entry.check_full_crit_edge.i
+  %.17.i = phi ptr [ %.9, %entry.check_full_crit_edge.i ], [ %.5.i, %alloc.i ]
+  %.12.i = phi i64 [ %.12.pre.i, %entry.check_full_crit_edge.i ], [ 65536, %alloc.i ]
+  %.11.i = sub i64 %.4.ph, %.3
+  %.13.i = icmp eq i64 %.11.i, %.12.i
+  br i1 %.13.i, label %grow.i, label %grammo_in_fill.exit
+
+grow.i:                                           ; preds = %check_full.i
+  %.16.i = shl i64 %.12.i, 1
+  %.18.i = or disjoint i64 %.16.i, 1
+  %.19.i = tail call ptr @realloc(ptr %.17.i, i64 %.18.i)
+  store ptr %.19.i, ptr @grammo_in_buf, align 8
+  store i64 %.16.i, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit
+
+grammo_in_fill.exit:                              ; preds = %check_full.i, %grow.i
+  %.28.i = phi i64 [ %.16.i, %grow.i ], [ %.12.i, %check_full.i ]
+  %.23.i = phi ptr [ %.19.i, %grow.i ], [ %.17.i, %check_full.i ]
+  %.25.i = getelementptr i8, ptr %.23.i, i64 %.3
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i, ptr align 1 %.25.i, i64 %.11.i, i1 false)
+  %.27.i = getelementptr i8, ptr %.23.i, i64 %.11.i
+  %.29.i = sub i64 %.28.i, %.11.i
+  %.30.i = tail call i64 @read(i32 0, ptr %.27.i, i64 %.29.i)
+  %.31.i = icmp sgt i64 %.30.i, 0
+  %.32.i = tail call i64 @llvm.smax.i64(i64 %.30.i, i64 0)
+  %.33.i = add i64 %.32.i, %.11.i
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i, ptr @grammo_in_end, align 8
+  %.36.i = getelementptr i8, ptr %.23.i, i64 %.33.i
+  store i8 0, ptr %.36.i, align 1
+  br i1 %.31.i, label %skip.outer, label %common.ret
+
+skip_test:                                        ; preds = %skip
+  %.11 = getelementptr i8, ptr %.9, i64 %.3
+  %.12 = load i8, ptr %.11, align 1
+  switch i8 %.12, label %scan.outer [
+    i8 32, label %skip_next
+    i8 13, label %skip_next
+    i8 12, label %skip_next
+    i8 11, label %skip_next
+    i8 10, label %skip_next
+    i8 9, label %skip_next
+  ]
+
+skip_next:                                        ; preds = %skip_test, %skip_test, %skip_test, %skip_test, %skip_test, %skip_test
+  %.19 = add nuw i64 %.3, 1
+  store i64 %.19, ptr @grammo_in_pos, align 8
+  br label %skip
+
+scan:                                             ; preds = %grammo_in_fill.exit28.peel, %grammo_in_fill.exit28
+  %.24 = phi i64 [ %.33.i20, %grammo_in_fill.exit28 ], [ %.33.i20.peel, %grammo_in_fill.exit28.peel ]
+  %.25 = icmp ult i64 %length.ph, %.24
+  %.27 = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.25, label %scan_test, label %scan_fill
+
+scan_test:                                        ; preds = %scan, %scan.outer
+  %.24.lcssa = phi i64 [ %.2444, %scan.outer ], [ %.24, %scan ]
+  %.22.lcssa = phi i64 [ %.2242, %scan.outer ], [ 0, %scan ]
+  %.23.lcssa = phi i64 [ %.23.peel, %scan.outer ], [ %length.ph, %scan ]
+  %.27.lcssa = phi ptr [ %.27.peel, %scan.outer ], [ %.27, %scan ]
+  %.28 = getelementptr i8, ptr %.27.lcssa, i64 %.23.lcssa
+  %.29 = load i8, ptr %.28, align 1
+  switch i8 %.29, label %scan_next [
+    i8 32, label %common.ret
+    i8 13, label %common.ret
+    i8 12, label %common.ret
+    i8 11, label %common.ret
+    i8 10, label %common.ret
+    i8 9, label %common.ret
+  ]
+
+scan_next:                                        ; preds = %scan_test
+  %.35 = add i64 %length.ph, 1
+  br label %scan.outer
+
+scan.outer:                                       ; preds = %skip_test, %scan_next
+  %.2444 = phi i64 [ %.24.lcssa, %scan_next ], [ %.4.ph, %skip_test ]
+  %.2242 = phi i64 [ %.22.lcssa, %scan_next ], [ %.3, %skip_test ]
+  %length.ph = phi i64 [ %.35, %scan_next ], [ 1, %skip_test ]
+  %.23.peel = add i64 %.2242, %length.ph
+  %.25.peel = icmp ult i64 %.23.peel, %.2444
+  %.27.peel = load ptr, ptr @grammo_in_buf, align 8
+  br i1 %.25.peel, label %scan_test, label %scan_fill.peel
+
+scan_fill.peel:                                   ; preds = %scan.outer
+  %.3.i2.peel = icmp eq ptr %.27.peel, null
+  br i1 %.3.i2.peel, label %alloc.i26.peel, label %entry.check_full_crit_edge.i3.peel
+
+entry.check_full_crit_edge.i3.peel:               ; preds = %scan_fill.peel
+  %.12.pre.i4.peel = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.peel
+
+alloc.i26.peel:                                   ; preds = %scan_fill.peel
+  %.5.i27.peel = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i27.peel, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i5.peel
+
+check_full.i5.peel:                               ; preds = %alloc.i26.peel, %entry.check_full_crit_edge.i3.peel
+  %.17.i6.peel = phi ptr [ %.27.peel, %entry.check_full_crit_edge.i3.peel ], [ %.5.i27.peel, %alloc.i26.peel ]
+  %.12.i7.peel = phi i64 [ %.12.pre.i4.peel, %entry.check_full_crit_edge.i3.peel ], [ 65536, %alloc.i26.peel ]
+  %.11.i10.peel = sub i64 %.2444, %.2242
+  %.13.i11.peel = icmp eq i64 %.11.i10.peel, %.12.i7.peel
+  br i1 %.13.i11.peel, label %grow.i22.peel, label %grammo_in_fill.exit28.peel
+
+grow.i22.peel:                                    ; preds = %check_full.i5.peel
+  %.16.i23.peel = shl i64 %.12.i7.peel, 1
+  %.18.i24.peel = or disjoint i64 %.16.i23.peel, 1
+  %.19.i25.peel = tail call ptr @realloc(ptr %.17.i6.peel, i64 %.18.i24.peel)
+  store ptr %.19.i25.peel, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23.peel, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28.peel
+
+grammo_in_fill.exit28.peel:                       ; preds = %grow.i22.peel, %check_full.i5.peel
+  %.28.i12.peel = phi i64 [ %.16.i23.peel, %grow.i22.peel ], [ %.12.i7.peel, %check_full.i5.peel ]
+  %.23.i13.peel = phi ptr [ %.19.i25.peel, %grow.i22.peel ], [ %.17.i6.peel, %check_full.i5.peel ]
+  %.25.i14.peel = getelementptr i8, ptr %.23.i13.peel, i64 %.2242
+  tail call void @llvm.memmove.p0.p0.i64(ptr align 1 %.23.i13.peel, ptr align 1 %.25.i14.peel, i64 %.11.i10.peel, i1 false)
+  %.27.i15.peel = getelementptr i8, ptr %.23.i13.peel, i64 %.11.i10.peel
+  %.29.i16.peel = sub i64 %.28.i12.peel, %.11.i10.peel
+  %.30.i17.peel = tail call i64 @read(i32 0, ptr %.27.i15.peel, i64 %.29.i16.peel)
+  %.31.i18.peel = icmp sgt i64 %.30.i17.peel, 0
+  %.32.i19.peel = tail call i64 @llvm.smax.i64(i64 %.30.i17.peel, i64 0)
+  %.33.i20.peel = add i64 %.32.i19.peel, %.11.i10.peel
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20.peel, ptr @grammo_in_end, align 8
+  %.36.i21.peel = getelementptr i8, ptr %.23.i13.peel, i64 %.33.i20.peel
+  store i8 0, ptr %.36.i21.peel, align 1
+  br i1 %.31.i18.peel, label %scan, label %common.ret
+
+scan_fill:                                        ; preds = %scan
+  %.3.i2 = icmp eq ptr %.27, null
+  br i1 %.3.i2, label %alloc.i26, label %entry.check_full_crit_edge.i3
+
+entry.check_full_crit_edge.i3:                    ; preds = %scan_fill
+  %.12.pre.i4 = load i64, ptr @grammo_in_cap, align 8
+  br label %check_full.i5
+
+alloc.i26:                                        ; preds = %scan_fill
+  %.5.i27 = tail call dereferenceable_or_null(65537) ptr @malloc(i64 65537)
+  store ptr %.5.i27, ptr @grammo_in_buf, align 8
+  store i64 65536, ptr @grammo_in_cap, align 8
+  br label %check_full.i5
+
+check_full.i5:                                    ; preds = %alloc.i26, %entry.check_full_crit_edge.i3
+  %.17.i6 = phi ptr [ %.27, %entry.check_full_crit_edge.i3 ], [ %.5.i27, %alloc.i26 ]
+  %.12.i7 = phi i64 [ %.12.pre.i4, %entry.check_full_crit_edge.i3 ], [ 65536, %alloc.i26 ]
+  %.13.i11 = icmp eq i64 %.24, %.12.i7
+  br i1 %.13.i11, label %grow.i22, label %grammo_in_fill.exit28
+
+grow.i22:                                         ; preds = %check_full.i5
+  %.16.i23 = shl i64 %.12.i7, 1
+  %.18.i24 = or disjoint i64 %.16.i23, 1
+  %.19.i25 = tail call ptr @realloc(ptr %.17.i6, i64 %.18.i24)
+  store ptr %.19.i25, ptr @grammo_in_buf, align 8
+  store i64 %.16.i23, ptr @grammo_in_cap, align 8
+  br label %grammo_in_fill.exit28
+
+grammo_in_fill.exit28:                            ; preds = %check_full.i5, %grow.i22
+  %.28.i12 = phi i64 [ %.16.i23, %grow.i22 ], [ %.12.i7, %check_full.i5 ]
+  %.23.i13 = phi ptr [ %.19.i25, %grow.i22 ], [ %.17.i6, %check_full.i5 ]
+  %.27.i15 = getelementptr i8, ptr %.23.i13, i64 %.24
+  %.29.i16 = sub i64 %.28.i12, %.24
+  %.30.i17 = tail call i64 @read(i32 0, ptr %.27.i15, i64 %.29.i16)
+  %.31.i18 = icmp sgt i64 %.30.i17, 0
+  %.32.i19 = tail call i64 @llvm.smax.i64(i64 %.30.i17, i64 0)
+  %.33.i20 = add i64 %.32.i19, %.24
+  store i64 0, ptr @grammo_in_pos, align 8
+  store i64 %.33.i20, ptr @grammo_in_end, align 8
+  %.36.i21 = getelementptr i8, ptr %.23.i13, i64 %.33.i20
+  store i8 0, ptr %.36.i21, align 1
+  br i1 %.31.i18, label %scan, label %common.ret, !llvm.loop !0
+
+common.ret:                                       ; preds = %grammo_in_fill.exit, %scan_test, %scan_test, %scan_test, %scan_test, %scan_test, %scan_test, %grammo_in_fill.exit28, %grammo_in_fill.exit28.peel
+  %common.ret.op = phi i64 [ %length.ph, %grammo_in_fill.exit28.peel ], [ %length.ph, %grammo_in_fill.exit28 ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ %length.ph, %scan_test ], [ 0, %grammo_in_fill.exit ]
+  ret i64 %common.ret.op
 }
 
-; Function Attrs: nofree nounwind
-declare noundef i32 @putchar(i32 noundef) local_unnamed_addr #0
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i64 @llvm.umax.i64(i64, i64) #6
 
-; Function Attrs: nocallback nofree nounwind willreturn memory(argmem: readwrite)
-declare void @llvm.memcpy.p0.p0.i64(ptr noalias nocapture writeonly, ptr noalias nocapture readonly, i64, i1 immarg) #5
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i64 @llvm.smax.i64(i64, i64) #6
+
+; Function Attrs: nocallback nofree nosync nounwind speculatable willreturn memory(none)
+declare i32 @llvm.smax.i32(i32, i32) #6
 
 attributes #0 = { nofree nounwind }
-attributes #1 = { mustprogress nofree nounwind willreturn memory(argmem: read) }
-attributes #2 = { mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite) "alloc-family"="malloc" }
-attributes #3 = { mustprogress nofree nounwind willreturn memory(argmem: readwrite) }
-attributes #4 = { mustprogress nofree nounwind willreturn }
-attributes #5 = { nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+attributes #1 = { mustprogress nounwind willreturn allockind("free") memory(argmem: readwrite, inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #2 = { mustprogress nounwind willreturn allockind("realloc") allocsize(1) memory(argmem: readwrite, inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #3 = { mustprogress nofree nounwind willreturn allockind("alloc,uninitialized") allocsize(0) memory(inaccessiblemem: readwrite) "alloc-family"="malloc" }
+attributes #4 = { nounwind }
+attributes #5 = { mustprogress nocallback nofree nounwind willreturn memory(argmem: readwrite) }
+attributes #6 = { nocallback nofree nosync nounwind speculatable willreturn memory(none) }
+
+!0 = distinct !{!0, !1}
+!1 = !{!"llvm.loop.peeled.count", i32 1}